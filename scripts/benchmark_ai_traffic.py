@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark the AI traffic frame update.
+
+Spreads AI aircraft with random flight plans over a region around ownship
+and times a 60 Hz frame of TrafficArrays.update against stepping each
+AIAircraft object, plus the cost of refreshing the aircraft views for a
+10 Hz traffic broadcast.
+
+Usage:
+    python scripts/benchmark_ai_traffic.py [options]
+
+Options:
+    --aircraft N    Number of AI aircraft (default: 1000)
+    --radius NM     Radius of the traffic region in nautical miles (default: 20)
+    --waypoints N   Waypoints per flight plan (default: 6)
+    --frames N      Number of timed frames (default: 600)
+"""
+
+import argparse
+import copy
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from airborne.physics.vectors import Vector3  # noqa: E402
+from airborne.plugins.traffic.ai_aircraft import AIAircraft, FlightPlan, Waypoint  # noqa: E402
+from airborne.plugins.traffic.traffic_arrays import UNITS_PER_NM, TrafficArrays  # noqa: E402
+
+FRAME_DT = 1.0 / 60.0
+BROADCAST_FRAMES = 6
+
+
+def random_point(rng: random.Random, radius: float) -> Vector3:
+    """Pick a random point in a disc around the origin."""
+    distance = radius * math.sqrt(rng.random())
+    bearing = rng.uniform(0.0, 2 * math.pi)
+    return Vector3(distance * math.sin(bearing), 0.0, distance * math.cos(bearing))
+
+
+def build_traffic(count: int, radius_nm: float, waypoints: int) -> list[AIAircraft]:
+    """Create aircraft with random positions and flight plans."""
+    rng = random.Random(42)
+    radius = radius_nm * UNITS_PER_NM
+    traffic = []
+    for i in range(count):
+        plan = FlightPlan(
+            waypoints=[
+                Waypoint(
+                    random_point(rng, radius),
+                    altitude_ft=rng.uniform(2000, 10000),
+                    speed_kts=rng.uniform(90, 250),
+                )
+                for _ in range(waypoints)
+            ]
+        )
+        aircraft = AIAircraft.create_random(f"AI{i:04d}", random_point(rng, radius))
+        aircraft.flight_plan = plan
+        traffic.append(aircraft)
+    return traffic
+
+
+def main() -> int:
+    """Run the benchmark from command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark AI traffic updates")
+    parser.add_argument("--aircraft", type=int, default=1000, help="Number of AI aircraft")
+    parser.add_argument("--radius", type=float, default=20.0, help="Region radius in NM")
+    parser.add_argument("--waypoints", type=int, default=6, help="Waypoints per flight plan")
+    parser.add_argument("--frames", type=int, default=600, help="Number of timed frames")
+    args = parser.parse_args()
+
+    aircraft = build_traffic(args.aircraft, args.radius, args.waypoints)
+    ownship = Vector3(0.0, 0.0, 0.0)
+
+    objects = copy.deepcopy(aircraft)
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        for target in objects:
+            target.update(FRAME_DT)
+    object_ms = (time.perf_counter() - start) * 1000.0 / args.frames
+
+    traffic = TrafficArrays()
+    for target in aircraft:
+        traffic.add(target)
+    update_s = 0.0
+    sync_s = 0.0
+    for frame in range(args.frames):
+        start = time.perf_counter()
+        traffic.update(FRAME_DT, ownship)
+        update_s += time.perf_counter() - start
+        if frame % BROADCAST_FRAMES == 0:
+            start = time.perf_counter()
+            traffic.sync()
+            sync_s += time.perf_counter() - start
+    update_ms = update_s * 1000.0 / args.frames
+    sync_ms = sync_s * 1000.0 / args.frames
+
+    print(f"{args.aircraft} aircraft within {args.radius:.0f} NM, {args.frames} frames")
+    print(f"AIAircraft.update loop: {object_ms:.3f} ms/frame")
+    print(f"TrafficArrays.update:   {update_ms:.3f} ms/frame")
+    print(f"view sync (10 Hz):      {sync_ms:.3f} ms/frame amortized")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark GroundConflictDetector on a busy synthetic hub.
+
+Builds a grid taxi network the size of a large hub apron, gives every
+aircraft a random shortest-path route part way along, then times conflict
+detection over all of them.
+
+Usage:
+    python scripts/benchmark_ground_conflicts.py [options]
+
+Options:
+    --aircraft N    Number of taxiing aircraft (default: 200)
+    --grid N        Nodes per side of the taxi grid (default: 40)
+    --spacing M     Distance between grid nodes in meters (default: 120)
+    --runs N        Number of timed detections (default: 200)
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from airborne.airports.ground_graph import GroundGraph  # noqa: E402
+from airborne.plugins.traffic.ground_conflicts import (  # noqa: E402
+    GroundConflictDetector,
+    Mover,
+    TaxiRoute,
+)
+
+METERS_PER_DEGREE = 111_195.0
+
+
+def build_grid(size: int, spacing_m: float) -> GroundGraph:
+    """Build a size x size grid of two-way taxiways."""
+    step = spacing_m / METERS_PER_DEGREE
+    latitudes = [row * step for row in range(size) for _ in range(size)]
+    longitudes = [column * step for _ in range(size) for column in range(size)]
+    starts, ends = [], []
+    for row in range(size):
+        for column in range(size):
+            node = row * size + column
+            if column + 1 < size:
+                starts.append(node)
+                ends.append(node + 1)
+            if row + 1 < size:
+                starts.append(node)
+                ends.append(node + size)
+    return GroundGraph(
+        list(range(size * size)),
+        latitudes,
+        longitudes,
+        starts,
+        ends,
+        [spacing_m] * len(starts),
+    )
+
+
+def main() -> int:
+    """Run the benchmark from command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark ground conflict detection")
+    parser.add_argument("--aircraft", type=int, default=200, help="Number of taxiing aircraft")
+    parser.add_argument("--grid", type=int, default=40, help="Nodes per side of the taxi grid")
+    parser.add_argument("--spacing", type=float, default=120.0, help="Grid spacing in meters")
+    parser.add_argument("--runs", type=int, default=200, help="Number of timed detections")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    graph = build_grid(args.grid, args.spacing)
+    costs = graph.routing_costs(avoid_runways=False)
+    nodes = graph.node_count
+
+    movers: list[Mover] = []
+    while len(movers) < args.aircraft:
+        path = graph.shortest_path(rng.randrange(nodes), [rng.randrange(nodes)], costs)
+        if path is None or len(path) < 2:
+            continue
+        route = TaxiRoute.from_path(graph, path)
+        distance = rng.uniform(0.0, route.length_m * 0.8)
+        movers.append((f"AI_{len(movers):03d}", route, distance, rng.uniform(4.0, 10.0)))
+
+    detector = GroundConflictDetector(graph)
+    conflicts = detector.detect(movers)
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        detector.detect(movers)
+    detect_ms = (time.perf_counter() - start) * 1000.0 / args.runs
+
+    print(f"{args.aircraft} aircraft on a {args.grid}x{args.grid} grid ({graph.edge_count} edges)")
+    print(f"detect(): {detect_ms:.3f} ms, {len(conflicts)} conflicts")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
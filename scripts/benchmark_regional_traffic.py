@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark schedule-driven regional traffic against bubble size.
+
+Builds a day-long flight schedule from the OpenFlights routes and flies
+ownship through a busy region, timing RegionalTraffic updates at the 10 Hz
+traffic broadcast rate for several bubble radii. The cost of evaluating
+the whole schedule every update is shown for comparison.
+
+Airports missing from the airport database (or all of them, when
+data/airports/airports.csv is not installed) are given random coordinates
+in a region around ownship so the benchmark always has traffic.
+
+Usage:
+    python scripts/benchmark_regional_traffic.py [options]
+
+Options:
+    --routes PATH       Path to routes.dat (default: data/navigation/routes.dat)
+    --flights N         Daily flights per route (default: 3)
+    --bubbles NM,...    Bubble radii in nautical miles (default: 10,20,40,80,160)
+    --updates N         Number of timed updates per bubble (default: 600)
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from airborne.navigation.routes import OpenFlightsProvider  # noqa: E402
+from airborne.plugins.traffic.regional_traffic import FlightSchedule, RegionalTraffic  # noqa: E402
+
+UPDATE_DT = 0.1
+OWNSHIP_LAT = 50.0
+OWNSHIP_LON = 5.0
+OWNSHIP_SPEED_KTS = 250.0
+START_TIME_S = 9 * 3600.0
+
+
+def build_schedule(routes_file: str, flights_per_route: int) -> FlightSchedule:
+    """Build a schedule, placing unlocated airports randomly around ownship."""
+    provider = OpenFlightsProvider(routes_file)
+    index = provider.index
+    if index is None:
+        raise SystemExit(f"Routes file not found: {routes_file}")
+
+    located = provider.locate_airports()
+    if located < index.airport_count and index.node_lat is not None:
+        rng = random.Random(42)
+        known = {
+            index.airport_code(node): (float(lat), float(lon))
+            for node, (lat, lon) in enumerate(zip(index.node_lat, index.node_lon, strict=True))
+            if not math.isnan(lat)
+        }
+        index.set_coordinates(
+            lambda code: (
+                known.get(code)
+                or (OWNSHIP_LAT + rng.uniform(-15, 15), OWNSHIP_LON + rng.uniform(-20, 20))
+            )
+        )
+        print(f"{index.airport_count - located} airports placed at random around ownship")
+    return FlightSchedule.from_route_index(index, flights_per_route=flights_per_route)
+
+
+def main() -> int:
+    """Run the benchmark from command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark regional traffic")
+    parser.add_argument("--routes", default="data/navigation/routes.dat", help="routes.dat path")
+    parser.add_argument("--flights", type=int, default=3, help="Daily flights per route")
+    parser.add_argument("--bubbles", default="10,20,40,80,160", help="Bubble radii in NM")
+    parser.add_argument("--updates", type=int, default=600, help="Timed updates per bubble")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    schedule = build_schedule(args.routes, args.flights)
+    build_s = time.perf_counter() - start
+    airborne = len(schedule.positions(START_TIME_S).rows)
+    print(f"{len(schedule)} scheduled flights built in {build_s:.2f} s, {airborne} airborne")
+
+    start = time.perf_counter()
+    for _ in range(20):
+        schedule.positions(START_TIME_S)
+    print(f"whole schedule per update: {(time.perf_counter() - start) * 1000.0 / 20:.3f} ms")
+    print()
+    print("bubble NM   active  candidates   update ms")
+
+    step_deg = OWNSHIP_SPEED_KTS * UPDATE_DT / 3600.0 / 60.0
+    for bubble_nm in (float(radius) for radius in args.bubbles.split(",")):
+        regional = RegionalTraffic(schedule, OWNSHIP_LAT, OWNSHIP_LON, bubble_nm=bubble_nm)
+        active = 0
+        start = time.perf_counter()
+        for update in range(args.updates):
+            entries, _ = regional.update(
+                START_TIME_S + update * UPDATE_DT, OWNSHIP_LAT, OWNSHIP_LON + update * step_deg
+            )
+            active += len(entries)
+        update_ms = (time.perf_counter() - start) * 1000.0 / args.updates
+        print(
+            f"{bubble_nm:9.0f} {active / args.updates:8.1f} "
+            f"{regional.candidate_count:11d} {update_ms:11.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark runway proximity queries against runway count.
+
+Builds airports with parallel runways and a taxi network along them, then
+times RunwayGeometry queries and RunwayIncursionDetector updates for a
+taxiing aircraft, with and without the current ground graph edge.
+
+Usage:
+    python scripts/benchmark_runway_geometry.py [options]
+
+Options:
+    --runways N,...     Runway counts (default: 1,4,16,64)
+    --updates N         Number of timed updates per airport (default: 2000)
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from airborne.airports.database import Runway, SurfaceType  # noqa: E402
+from airborne.airports.ground_graph import EDGE_RUNWAY, GroundGraph  # noqa: E402
+from airborne.physics.vectors import Vector3  # noqa: E402
+from airborne.plugins.navigation.runway_incursion import RunwayIncursionDetector  # noqa: E402
+
+LAT = 37.5
+LON = -122.0
+SPACING_DEG = 0.005  # About 550 m between parallel runways
+
+
+def build_airport(count: int) -> tuple[list[Runway], GroundGraph]:
+    """Create parallel east-west runways, each with a runway edge and a taxiway."""
+    runways = []
+    node_ids: list[str] = []
+    lats: list[float] = []
+    lons: list[float] = []
+    names = [""]
+    edge_name = []
+    edge_flags = []
+    for i in range(count):
+        lat = LAT + i * SPACING_DEG
+        ident = f"{i:02d}"
+        runways.append(
+            Runway("TEST", f"{ident}/{ident}R", 8000, 150, SurfaceType.ASPH, True, False,
+                   ident, lat, LON - 0.015, 10, 90, f"{ident}R", lat, LON + 0.015, 10, 270)
+        )  # fmt: skip
+        taxiway_lat = lat + 0.002
+        node_ids += [f"R{i}a", f"R{i}b", f"T{i}a", f"T{i}b"]
+        lats += [lat, lat, taxiway_lat, taxiway_lat]
+        lons += [LON - 0.015, LON + 0.015, LON - 0.015, LON + 0.015]
+        names += [f"{ident}/{ident}R", f"T{i}"]
+        edge_name += [len(names) - 2, len(names) - 1]
+        edge_flags += [EDGE_RUNWAY, 0]
+    edges = 2 * count
+    graph = GroundGraph(
+        node_ids,
+        lats,
+        lons,
+        [2 * e for e in range(edges)],
+        [2 * e + 1 for e in range(edges)],
+        [2600.0] * edges,
+        names=names,
+        edge_name=edge_name,
+        edge_flags=edge_flags,
+    )
+    return runways, graph
+
+
+def main() -> int:
+    """Run the benchmark from command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark runway proximity queries")
+    parser.add_argument("--runways", default="1,4,16,64", help="Runway counts")
+    parser.add_argument("--updates", type=int, default=2000, help="Timed updates per airport")
+    args = parser.parse_args()
+
+    print("runways   query us   update us   update+edge us")
+    for count in (int(value) for value in args.runways.split(",")):
+        runways, graph = build_airport(count)
+        detector = RunwayIncursionDetector(None, runways, ground_graph=graph)
+        geometry = detector.geometry
+        positions = [
+            Vector3(LON - 0.014 + 0.028 * i / args.updates, 10.0, LAT + 0.002)
+            for i in range(args.updates)
+        ]
+
+        start = time.perf_counter()
+        for position in positions:
+            geometry.query(position.z, position.x)
+        query_us = (time.perf_counter() - start) * 1e6 / args.updates
+
+        start = time.perf_counter()
+        for position in positions:
+            detector.update(position, 90.0, 1.0)
+        update_us = (time.perf_counter() - start) * 1e6 / args.updates
+
+        start = time.perf_counter()
+        for position in positions:
+            detector.update(position, 90.0, 1.0, edge=1)
+        edge_us = (time.perf_counter() - start) * 1e6 / args.updates
+
+        print(f"{count:7d} {query_us:10.1f} {update_us:11.1f} {edge_us:16.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark SpatialIndex radius and k-nearest queries.
+
+Inserts random points spread uniformly over the earth, then times radius
+and k-nearest queries at random positions against a per-item haversine
+scan (what the databases did before using the index).
+
+Usage:
+    python scripts/benchmark_spatial_index.py [options]
+
+Options:
+    --points N      Number of indexed points (default: 100000)
+    --queries N     Number of timed queries (default: 1000)
+    --cell-size DEG Cell size in degrees (default: 1.0)
+    --radius NM     Radius for radius queries (default: 50)
+    --k N           Neighbors for k-nearest queries (default: 10)
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from airborne.airports.spatial_index import SpatialIndex  # noqa: E402
+from airborne.physics.vectors import Vector3  # noqa: E402
+
+
+def random_position(rng: random.Random) -> Vector3:
+    """Get a position uniformly distributed over the sphere."""
+    latitude = math.degrees(math.asin(rng.uniform(-1.0, 1.0)))
+    return Vector3(rng.uniform(-180.0, 180.0), 0.0, latitude)
+
+
+def time_per_query(func: Callable[[Vector3], object], positions: list[Vector3]) -> float:
+    """Run a query for every position and return the mean time in milliseconds."""
+    start = time.perf_counter()
+    for position in positions:
+        func(position)
+    return (time.perf_counter() - start) * 1000.0 / len(positions)
+
+
+def main() -> int:
+    """Run the benchmark from command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark SpatialIndex queries")
+    parser.add_argument("--points", type=int, default=100_000, help="Number of indexed points")
+    parser.add_argument("--queries", type=int, default=1000, help="Number of timed queries")
+    parser.add_argument("--cell-size", type=float, default=1.0, help="Cell size in degrees")
+    parser.add_argument("--radius", type=float, default=50.0, help="Radius query size in nm")
+    parser.add_argument("--k", type=int, default=10, help="Neighbors for k-nearest queries")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    points = [random_position(rng) for _ in range(args.points)]
+    queries = [random_position(rng) for _ in range(args.queries)]
+
+    index = SpatialIndex(cell_size_deg=args.cell_size)
+    start = time.perf_counter()
+    for i, position in enumerate(points):
+        index.insert(position, i)
+    build_s = time.perf_counter() - start
+
+    def scan(position: Vector3) -> list[tuple[int, float]]:
+        results = []
+        for i, point in enumerate(points):
+            distance = SpatialIndex._haversine_distance_nm(position, point)
+            if distance <= args.radius:
+                results.append((i, distance))
+        results.sort(key=lambda x: x[1])
+        return results
+
+    radius_ms = time_per_query(lambda p: index.query_radius(p, args.radius), queries)
+    knn_ms = time_per_query(lambda p: index.query_knn(p, args.k), queries)
+    scan_ms = time_per_query(scan, queries[: max(1, args.queries // 100)])
+
+    print(f"{args.points} points in {index.get_cell_count()} cells, built in {build_s:.2f}s")
+    print(f"query_radius({args.radius:g} nm): {radius_ms:.3f} ms/query")
+    print(f"query_knn(k={args.k}):        {knn_ms:.3f} ms/query")
+    print(f"linear scan:             {scan_ms:.3f} ms/query")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
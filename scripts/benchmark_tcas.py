@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark TCAS surveillance in dense traffic.
+
+Scatters intruders around ownship in a traffic state service registered
+as "traffic_state", delivers a traffic delta to TCASPlugin and times the delta handling (pulling nearby
+traffic from the state) and a TCAS cycle.
+
+Usage:
+    python scripts/benchmark_tcas.py [options]
+
+Options:
+    --intruders N   Number of intruders (default: 1000)
+    --radius NM     Radius of the traffic region in nautical miles (default: 20)
+    --runs N        Number of timed runs (default: 200)
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from airborne.core.event_bus import EventBus  # noqa: E402
+from airborne.core.messaging import Message, MessageQueue, MessageTopic  # noqa: E402
+from airborne.core.plugin import PluginContext  # noqa: E402
+from airborne.core.registry import ComponentRegistry  # noqa: E402
+from airborne.physics.vectors import Vector3  # noqa: E402
+from airborne.plugins.avionics.tcas_plugin import TCASPlugin  # noqa: E402
+from airborne.plugins.avionics.tcas_surveillance import UNITS_PER_NM  # noqa: E402
+from airborne.plugins.traffic.ai_aircraft import AIAircraft  # noqa: E402
+from airborne.plugins.traffic.traffic_arrays import TrafficArrays  # noqa: E402
+from airborne.plugins.traffic.traffic_state import TrafficStateService  # noqa: E402
+
+
+def build_traffic(count: int, radius_nm: float) -> TrafficStateService:
+    """Create intruders in a disc around the origin near ownship altitude."""
+    rng = random.Random(42)
+    traffic = TrafficArrays()
+    for i in range(count):
+        distance = radius_nm * UNITS_PER_NM * math.sqrt(rng.random())
+        bearing = rng.uniform(0.0, 2 * math.pi)
+        heading = rng.uniform(0.0, 360.0)
+        speed = rng.uniform(50.0, 130.0)
+        traffic.add(
+            AIAircraft(
+                callsign=f"AI{i:04d}",
+                aircraft_type="C172",
+                position=Vector3(distance * math.sin(bearing), 0.0, distance * math.cos(bearing)),
+                velocity=Vector3(
+                    speed * math.sin(math.radians(heading)),
+                    0.0,
+                    speed * math.cos(math.radians(heading)),
+                ),
+                heading=heading,
+                altitude_ft=rng.uniform(3000, 13000),
+                vertical_speed_fpm=rng.uniform(-1000, 1000),
+            )
+        )
+    state = TrafficStateService()
+    state.put_many(traffic.changed_entries())
+    return state
+
+
+def main() -> int:
+    """Run the benchmark from command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark TCAS surveillance")
+    parser.add_argument("--intruders", type=int, default=1000, help="Number of intruders")
+    parser.add_argument("--radius", type=float, default=20.0, help="Region radius in NM")
+    parser.add_argument("--runs", type=int, default=200, help="Number of timed runs")
+    args = parser.parse_args()
+
+    state = build_traffic(args.intruders, args.radius)
+    message = Message(
+        sender="ai_traffic",
+        recipients=["*"],
+        topic=MessageTopic.TRAFFIC_DELTA,
+        data={"delta": state.flush(), "state": state},
+    )
+
+    registry = ComponentRegistry()
+    registry.register("traffic_state", state)
+    tcas = TCASPlugin()
+    tcas.initialize(
+        PluginContext(
+            event_bus=EventBus(), message_queue=MessageQueue(), config={}, plugin_registry=registry
+        )
+    )
+    tcas._powered = True
+    tcas._own_altitude_ft = 8000.0
+
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        tcas.handle_message(message)
+    receive_ms = (time.perf_counter() - start) * 1000.0 / args.runs
+
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        tcas.update(0.1)
+    cycle_ms = (time.perf_counter() - start) * 1000.0 / args.runs
+
+    print(f"{args.intruders} intruders within {args.radius:.0f} NM")
+    print(f"{len(tcas.get_targets())} tracked, alert: {tcas.get_current_alert_level().value}")
+    print(f"traffic delta:  {receive_ms:.3f} ms")
+    print(f"TCAS cycle:     {cycle_ms:.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
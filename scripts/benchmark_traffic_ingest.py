@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark external traffic ingest.
+
+Sends 10 Hz batches of position reports for many tracks through the
+binary traffic format and times decoding, dead-reckoning ingest and the
+60 Hz frame update, which writes every track into the traffic state at
+the publish interval.
+
+Usage:
+    python scripts/benchmark_traffic_ingest.py [options]
+
+Options:
+    --tracks N      Number of external tracks (default: 500)
+    --seconds S     Simulated seconds (default: 10)
+    --publish S     Publish interval in seconds, 0 for every frame (default: 0.1)
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from airborne.plugins.network.traffic_ingest import (  # noqa: E402
+    REPORT_DTYPE,
+    DeadReckoningTracks,
+    TrafficIngest,
+    decode_traffic_batch,
+    encode_traffic_batch,
+)
+from airborne.plugins.traffic.traffic_state import UNITS_PER_NM, TrafficStateService  # noqa: E402
+
+FRAME_DT = 1.0 / 60.0
+REPORT_INTERVAL = 0.1
+
+
+def build_reports(count: int, time_s: float) -> np.ndarray:
+    """Create reports for tracks circling the origin at 120 knots."""
+    rng = np.random.default_rng(42)
+    radius = rng.uniform(1.0, 20.0, count) * UNITS_PER_NM
+    phase = rng.uniform(0.0, 2 * np.pi, count)
+    speed = 120.0 * UNITS_PER_NM / 3600.0
+    angle = phase + speed / radius * time_s
+
+    reports = np.zeros(count, dtype=REPORT_DTYPE)
+    reports["track_id"] = np.arange(count)
+    reports["x"] = radius * np.sin(angle)
+    reports["z"] = radius * np.cos(angle)
+    reports["altitude_ft"] = 3000.0
+    reports["vx"] = speed * np.cos(angle)
+    reports["vz"] = -speed * np.sin(angle)
+    return reports
+
+
+def main() -> int:
+    """Run the benchmark from command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark external traffic ingest")
+    parser.add_argument("--tracks", type=int, default=500, help="Number of external tracks")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Simulated seconds")
+    parser.add_argument("--publish", type=float, default=0.1, help="Publish interval in seconds")
+    args = parser.parse_args()
+
+    ingest = TrafficIngest(DeadReckoningTracks(), publish_interval_s=args.publish)
+    state = TrafficStateService()
+    frames = int(args.seconds / FRAME_DT)
+    decode_s = 0.0
+    update_s = 0.0
+    batches = 0
+    next_report = 0.0
+
+    for frame in range(frames):
+        now = frame * FRAME_DT
+        if now >= next_report:
+            payload = encode_traffic_batch(now, build_reports(args.tracks, now))
+            start = time.perf_counter()
+            ingest.submit(decode_traffic_batch(payload))
+            decode_s += time.perf_counter() - start
+            batches += 1
+            next_report += REPORT_INTERVAL
+
+        start = time.perf_counter()
+        ingest.update(FRAME_DT, state)
+        update_s += time.perf_counter() - start
+
+    frame_ms = update_s * 1000.0 / frames
+    print(f"{args.tracks} tracks, {batches} batches of {len(payload)} bytes, {frames} frames")
+    print(f"batch decode:  {decode_s * 1000.0 / batches:.3f} ms")
+    print(f"frame update:  {frame_ms:.3f} ms ({frame_ms * 1000.0 / args.tracks:.2f} us/track)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark TTS cache service round trips for cached phrases.
+
+Runs the TTS cache service in process with a temporary cache holding one
+phrase, then times generate requests from the client over WebSocket with
+protocol version 1 (base64 JSON) and version 2 (binary audio frames).
+
+Usage:
+    python scripts/benchmark_tts_cache.py [options]
+
+Options:
+    --size KB           WAV size in kilobytes (default: 200)
+    --requests N        Timed requests per protocol (default: 500)
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from websockets.server import serve
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from airborne.tts_cache_service.client import TTSServiceClient  # noqa: E402
+from airborne.tts_cache_service.protocol import PROTOCOL_VERSION  # noqa: E402
+from airborne.tts_cache_service.service import TTSCacheService  # noqa: E402
+
+TEXT = "runway three one cleared for takeoff"
+
+
+async def run_protocol(service: TTSCacheService, protocol: int, requests: int) -> list[float]:
+    """Time cached generate requests with one protocol version."""
+    async with serve(service.websocket_handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        client = TTSServiceClient(port=port, spawn_service=False, max_protocol=protocol)
+        await client.start()
+        try:
+            await client.generate_view(TEXT, voice_name="Benchmark")
+            latencies = []
+            for _ in range(requests):
+                start = time.perf_counter()
+                audio = await client.generate_view(TEXT, voice_name="Benchmark")
+                latencies.append(time.perf_counter() - start)
+                assert audio is not None
+        finally:
+            await client.stop()
+    return latencies
+
+
+def main() -> int:
+    """Run the benchmark from command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark TTS cache service round trips")
+    parser.add_argument("--size", type=int, default=200, help="WAV size in kilobytes")
+    parser.add_argument("--requests", type=int, default=500, help="Timed requests per protocol")
+    args = parser.parse_args()
+
+    wav = b"RIFF" + bytes(args.size * 1024 - 4)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        service = TTSCacheService({"cache": {"base_dir": cache_dir}})
+        service._get_cache("cockpit", 180, "Benchmark", None).put(TEXT, wav)
+
+        print(f"{args.size} KB WAV, {args.requests} cached requests")
+        print("protocol   mean ms   p50 ms   p99 ms   req/s     MB/s")
+        for protocol in range(1, PROTOCOL_VERSION + 1):
+            latencies = asyncio.run(run_protocol(service, protocol, args.requests))
+            latencies.sort()
+            total = sum(latencies)
+            p99 = latencies[int(len(latencies) * 0.99) - 1]
+            print(
+                f"{protocol:8d} {statistics.mean(latencies) * 1000:9.3f} "
+                f"{statistics.median(latencies) * 1000:8.3f} {p99 * 1000:8.3f} "
+                f"{len(latencies) / total:7.0f} {len(wav) * len(latencies) / total / 1e6:8.1f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
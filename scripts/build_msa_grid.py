@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Build a minimum safe altitude (MSA/MORA) grid from SRTM tiles.
+
+Samples the elevation dataset into a grid of per-cell maximum elevations
+and writes it in the memory-mappable MSAGrid format. Point the terrain
+plugin at the result with the ``terrain.msa_grid_file`` config key.
+
+Only real tile data is used: cells touching a missing tile are written as
+voids (no MSA/MORA), never filled with modelled elevations. Use
+--fail-on-void to refuse writing a grid with voids.
+
+Usage:
+    python scripts/build_msa_grid.py OUTPUT [options]
+
+Options:
+    --tiles DIR             Directory with SRTM .hgt tiles (default: data/terrain/srtm)
+    --cell-size DEG         Cell size in degrees (default: 0.25)
+    --samples N             Samples per cell edge (default: 30)
+    --bounds S N W E        Area to cover in degrees (default: whole world)
+    --obstacle-margin-ft FT Margin added for obstacles (default: 0)
+    --coarse FACTOR OUTPUT  Also write a grid coarsened by FACTOR (e.g. 4 -> 1 deg)
+    --fail-on-void          Exit with an error if any cell lacks tile data
+
+Example:
+    python scripts/build_msa_grid.py data/terrain/msa_025.grid \\
+        --bounds 30 50 -125 -100 --obstacle-margin-ft 200 \\
+        --coarse 4 data/terrain/msa_1deg.grid
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import numpy as np  # noqa: E402
+
+from airborne.terrain import MSAGrid, SRTMProvider  # noqa: E402
+
+
+def main() -> int:
+    """Build the grid from command line arguments."""
+    parser = argparse.ArgumentParser(description="Build an MSA/MORA grid from SRTM tiles")
+    parser.add_argument("output", help="Output grid file")
+    parser.add_argument("--tiles", default="data/terrain/srtm", help="SRTM tile directory")
+    parser.add_argument("--cell-size", type=float, default=0.25, help="Cell size in degrees")
+    parser.add_argument("--samples", type=int, default=30, help="Samples per cell edge")
+    parser.add_argument(
+        "--bounds",
+        type=float,
+        nargs=4,
+        metavar=("SOUTH", "NORTH", "WEST", "EAST"),
+        default=(-90.0, 90.0, -180.0, 180.0),
+        help="Area to cover in degrees",
+    )
+    parser.add_argument("--obstacle-margin-ft", type=float, default=0.0)
+    parser.add_argument(
+        "--coarse",
+        nargs=2,
+        metavar=("FACTOR", "OUTPUT"),
+        help="Also write a grid coarsened by FACTOR",
+    )
+    parser.add_argument(
+        "--fail-on-void", action="store_true", help="Fail if any cell lacks tile data"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    # No fallback: missing tiles must become voids, not synthetic terrain
+    provider = SRTMProvider(cache_dir=args.tiles, use_fallback=False)
+
+    start = time.time()
+    grid = MSAGrid.build(
+        provider,
+        cell_size_deg=args.cell_size,
+        samples_per_cell=args.samples,
+        bounds=tuple(args.bounds),
+        obstacle_margin_m=args.obstacle_margin_ft * 0.3048,
+    )
+
+    voids = int(np.isnan(grid.cells).sum())
+    if voids:
+        print(f"{voids} of {grid.rows * grid.cols} cells have no tile data (void)")
+        if args.fail_on_void:
+            return 1
+
+    grid.save(args.output)
+    print(f"Wrote {grid.rows}x{grid.cols} grid to {args.output} in {time.time() - start:.1f}s")
+
+    if args.coarse:
+        factor, coarse_output = int(args.coarse[0]), args.coarse[1]
+        coarse = grid.coarsen(factor)
+        coarse.save(coarse_output)
+        print(f"Wrote {coarse.rows}x{coarse.cols} grid to {coarse_output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
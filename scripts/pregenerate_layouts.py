@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Pregenerate procedural taxiway and parking layouts for a country.
+
+Looks up every airport of a country in the airport index, then generates
+and caches its taxiway network and parking positions in a process pool,
+so the first load of any of these airports reads the cached layout
+instead of running the generators.
+
+Usage:
+    python scripts/pregenerate_layouts.py COUNTRY [options]
+
+Options:
+    --cache-dir DIR     Gateway data and layout cache directory
+                        (default: data/airports/gateway_cache)
+    --types T,...       Airport types (default: large_airport,medium_airport,small_airport)
+    --workers N         Worker processes (default: CPU count)
+
+Example:
+    python scripts/pregenerate_layouts.py FR --types small_airport --workers 8
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from airborne.airports.airport_index import get_airport_index  # noqa: E402
+from airborne.airports.generated_cache import pregenerate_layouts  # noqa: E402
+
+
+def main() -> int:
+    """Pregenerate layouts from command line arguments."""
+    parser = argparse.ArgumentParser(description="Pregenerate airport layouts for a country")
+    parser.add_argument("country", help="ISO country code (e.g. FR, US)")
+    parser.add_argument("--cache-dir", default=None, help="Cache directory")
+    parser.add_argument(
+        "--types",
+        default="large_airport,medium_airport,small_airport",
+        help="Airport types",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    airports = get_airport_index().get_airports_in_country(args.country, args.types.split(","))
+    if not airports:
+        print(f"No airports found for country {args.country}")
+        return 1
+
+    start = time.time()
+    done = pregenerate_layouts([a.icao for a in airports], args.cache_dir, args.workers)
+    print(f"Cached layouts for {done} of {len(airports)} airports in {time.time() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,18 @@
 This module provides a searchable index of airports from the OurAirports
 database, supporting search by ICAO code, IATA code, name, and city.
 
+The CSV is parsed once and compiled into a columnar index file
+(airports.idx next to the CSV) holding fixed-width code columns,
+coordinate arrays and a string table. Later launches memory-map the index
+instead of parsing the CSV; it is rebuilt automatically when the CSV
+changes. AirportInfo objects are created lazily on access.
+
+Type-ahead search runs off the same file: sorted code and city columns
+act as prefix tries (a prefix is a contiguous range found by binary
+search) and an n-gram inverted index over lowercase names and cities
+answers substring matches. Scores are accumulated with NumPy instead of
+scanning every airport per keystroke.
+
 Typical usage:
     from airborne.airports.airport_index import AirportIndex
 
@@ -20,12 +32,28 @@ Typical usage:
 """
 
 import csv
+import json
 import logging
+import os
+import struct
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
 
 logger = logging.getLogger(__name__)
 
+# Compiled index file format
+INDEX_MAGIC = b"AIDX"
+INDEX_VERSION = 2
+INDEX_HEADER = struct.Struct("<4sII")  # magic, version, metadata length
+INDEX_ALIGNMENT = 16
+
+# Longest n-gram in the substring search index
+MAX_GRAM = 3
+
 
 @dataclass
 class AirportInfo:
@@ -75,6 +103,186 @@ class AirportInfo:
         return f"{self.icao} - {self.name}"
 
 
+def _align(offset: int) -> int:
+    """Round an offset up to the index column alignment."""
+    return -(-offset // INDEX_ALIGNMENT) * INDEX_ALIGNMENT
+
+
+def _fixed_width(values: list[str]) -> npt.NDArray[np.bytes_]:
+    """Encode strings as a fixed-width bytes column.
+
+    Args:
+        values: Strings to encode
+
+    Returns:
+        Array of dtype S<n> where n is the longest encoded value
+    """
+    encoded = [value.encode("utf-8") for value in values]
+    width = max((len(item) for item in encoded), default=1) or 1
+    return np.array(encoded, dtype=f"S{width}")
+
+
+def _string_table(values: list[str]) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64]]:
+    """Encode strings as a UTF-8 blob with offsets.
+
+    Args:
+        values: Strings to encode
+
+    Returns:
+        (blob, offsets) where string i is blob[offsets[i]:offsets[i + 1]]
+    """
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(item) for item in encoded])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _prefix_successor(prefix: bytes) -> bytes:
+    """Get the smallest byte string greater than every string with a prefix.
+
+    UTF-8 never contains 0xFF, so incrementing the last byte cannot overflow.
+
+    Args:
+        prefix: Non-empty UTF-8 prefix
+
+    Returns:
+        Exclusive upper bound for the prefix range
+    """
+    return prefix[:-1] + bytes([prefix[-1] + 1])
+
+
+def _gram_postings(
+    values: list[str],
+) -> tuple[npt.NDArray[np.bytes_], npt.NDArray[np.int64], npt.NDArray[np.int32]]:
+    """Build an n-gram inverted index (n = 1..MAX_GRAM) over strings.
+
+    Each n-gram is packed into an int64 (21 bits per code point, offset by
+    one so shorter grams sort first), which keeps the build vectorized and
+    gives the same order as the grams' UTF-8 bytes.
+
+    Args:
+        values: Lowercase strings, one per row
+
+    Returns:
+        (grams, offsets, rows): sorted UTF-8 grams, and for gram i the
+        ascending rows containing it are rows[offsets[i]:offsets[i + 1]]
+    """
+    # Code points + 1 of all strings, separated by 0
+    joined = "\0".join(values)
+    points = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32).astype(np.int64) + 1
+    points[points == 1] = 0
+    row_of = np.cumsum(points == 0)
+
+    codes = []
+    rows = []
+    for n in range(1, MAX_GRAM + 1):
+        count = len(points) - n + 1
+        if count <= 0:
+            break
+        packed = np.zeros(count, dtype=np.int64)
+        valid = np.ones(count, dtype=bool)
+        for k in range(n):
+            window = points[k : k + count]
+            packed |= window << (21 * (MAX_GRAM - 1 - k))
+            valid &= window != 0
+        codes.append(packed[valid])
+        rows.append(row_of[:count][valid])
+
+    all_codes = np.concatenate(codes) if codes else np.empty(0, dtype=np.int64)
+    all_rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+
+    # Sort by (gram, row) and drop repeats of a gram within a row
+    order = np.lexsort((all_rows, all_codes))
+    all_codes = all_codes[order]
+    all_rows = all_rows[order]
+    keep = np.ones(len(all_codes), dtype=bool)
+    keep[1:] = (all_codes[1:] != all_codes[:-1]) | (all_rows[1:] != all_rows[:-1])
+    all_codes = all_codes[keep]
+    all_rows = all_rows[keep]
+
+    unique_codes, starts = np.unique(all_codes, return_index=True)
+    offsets = np.append(starts, len(all_codes)).astype(np.int64)
+
+    grams = []
+    for code in unique_codes.tolist():
+        chars = [(code >> (21 * (MAX_GRAM - 1 - k))) & 0x1FFFFF for k in range(MAX_GRAM)]
+        grams.append("".join(chr(c - 1) for c in chars if c))
+
+    return _fixed_width(grams), offsets, all_rows.astype(np.int32)
+
+
+def write_index_file(
+    path: Path, columns: dict[str, npt.NDArray[Any]], metadata: dict[str, Any]
+) -> None:
+    """Write columns to a memory-mappable index file.
+
+    Layout: fixed header, JSON metadata (column dtypes, shapes and offsets
+    plus caller metadata), then each column's raw bytes, 16-byte aligned.
+    The file is written to a temporary name and moved into place.
+
+    Args:
+        path: Output path
+        columns: Column arrays
+        metadata: Extra JSON-serializable metadata
+    """
+    specs: dict[str, dict[str, Any]] = {}
+    offset = 0
+    for name, array in columns.items():
+        offset = _align(offset)
+        specs[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset += array.nbytes
+
+    meta_bytes = json.dumps({**metadata, "columns": specs}).encode("utf-8")
+    data_start = _align(INDEX_HEADER.size + len(meta_bytes))
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(meta_bytes)))
+        f.write(meta_bytes)
+        for name, array in columns.items():
+            f.seek(data_start + specs[name]["offset"])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+
+
+def read_index_file(path: Path) -> tuple[dict[str, Any], dict[str, npt.NDArray[Any]]]:
+    """Memory-map an index file written by write_index_file().
+
+    Args:
+        path: Index file path
+
+    Returns:
+        (metadata, columns) where columns are read-only views of the mapping
+
+    Raises:
+        ValueError: If the file is not a supported index file
+    """
+    with open(path, "rb") as f:
+        header = f.read(INDEX_HEADER.size)
+        if len(header) != INDEX_HEADER.size:
+            raise ValueError(f"Truncated index file: {path}")
+        magic, version, meta_length = INDEX_HEADER.unpack(header)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise ValueError(f"Not a supported index file: {path}")
+        metadata = json.loads(f.read(meta_length).decode("utf-8"))
+
+    data_start = _align(INDEX_HEADER.size + meta_length)
+    buffer = np.memmap(path, dtype=np.uint8, mode="r")
+
+    columns = {}
+    for name, spec in metadata.pop("columns").items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"]))
+        start = data_start + spec["offset"]
+        raw = buffer[start : start + count * dtype.itemsize]
+        if len(raw) != count * dtype.itemsize:
+            raise ValueError(f"Truncated index file: {path}")
+        columns[name] = raw.view(dtype).reshape(spec["shape"])
+
+    return metadata, columns
+
+
 class AirportIndex:
     """Searchable airport index with autocomplete support.
 
@@ -85,6 +293,11 @@ class AirportIndex:
     - City name (substring match)
 
     The index prioritizes larger airports in search results.
+
+    Airports are held in columnar arrays sorted by ICAO code (memory-mapped
+    from the compiled index file when possible), so get() and get_by_iata()
+    are binary searches and get_airports_in_country() is a slice of a
+    precomputed ordering.
     """
 
     # Airport type priority (lower = higher priority)
@@ -111,12 +324,23 @@ class AirportIndex:
         else:
             self._data_dir = Path(data_dir)
 
-        self._airports: dict[str, AirportInfo] = {}  # ICAO -> AirportInfo
-        self._iata_index: dict[str, str] = {}  # IATA -> ICAO
+        self._columns: dict[str, npt.NDArray[Any]] = {}
+        self._types: list[str] = []
+        self._count = 0
+        self._cache: dict[int, AirportInfo] = {}  # Row -> AirportInfo (lazy)
         self._loaded = False
 
+        # Type-ahead state: last substring matches per field, last search
+        self._contains_cache: dict[str, tuple[str, npt.NDArray[np.int32]]] = {}
+        self._last_search: tuple[str, tuple[str, ...], int, list[int]] | None = None
+        self._lowercase_cache: dict[str, list[str]] = {}
+
     def load(self, csv_path: Path | str | None = None) -> bool:
-        """Load airports from CSV file.
+        """Load airports, from the compiled index when it is up to date.
+
+        The index file (same name as the CSV with an .idx suffix) is
+        rebuilt from the CSV when it is missing, was built from a CSV with
+        a different size or modification time, or has an older format.
 
         Args:
             csv_path: Path to airports.csv. Defaults to data_dir/airports.csv.
@@ -133,63 +357,241 @@ class AirportIndex:
             logger.error("Airport CSV not found: %s", csv_path)
             return False
 
+        index_path = csv_path.with_suffix(".idx")
+        stat = csv_path.stat()
+        source = {"csv_size": stat.st_size, "csv_mtime_ns": stat.st_mtime_ns}
+
         try:
-            with open(csv_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-
-                for row in reader:
-                    # Skip airports without ICAO code
-                    icao = row.get("icao_code", "").strip()
-                    if not icao:
-                        # Try ident as fallback for some airports
-                        ident = row.get("ident", "").strip()
-                        if ident and len(ident) == 4 and ident.isalnum():
-                            icao = ident.upper()
-                        else:
-                            continue
-
-                    icao = icao.upper()
-
-                    # Parse elevation
-                    try:
-                        elevation = float(row.get("elevation_ft") or 0)
-                    except (ValueError, TypeError):
-                        elevation = 0
-
-                    # Parse coordinates
-                    try:
-                        latitude = float(row.get("latitude_deg") or 0)
-                        longitude = float(row.get("longitude_deg") or 0)
-                    except (ValueError, TypeError):
-                        latitude = 0
-                        longitude = 0
-
-                    airport = AirportInfo(
-                        icao=icao,
-                        iata=row.get("iata_code", "").strip(),
-                        name=row.get("name", "").strip(),
-                        city=row.get("municipality", "").strip(),
-                        country=row.get("iso_country", "").strip(),
-                        latitude=latitude,
-                        longitude=longitude,
-                        elevation_ft=elevation,
-                        airport_type=row.get("type", "").strip(),
-                    )
-
-                    self._airports[icao] = airport
-
-                    # Build IATA index
-                    if airport.iata:
-                        self._iata_index[airport.iata.upper()] = icao
-
-            self._loaded = True
-            logger.info("Loaded %d airports from %s", len(self._airports), csv_path)
+            if index_path.exists():
+                try:
+                    metadata, columns = read_index_file(index_path)
+                    if all(metadata.get(key) == value for key, value in source.items()):
+                        self._set_columns(columns, metadata["types"])
+                        logger.info("Loaded %d airports from index %s", self._count, index_path)
+                        return True
+                    logger.info("Airport CSV changed, rebuilding index")
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning("Ignoring invalid airport index %s: %s", index_path, e)
+
+            columns, types = self._build_columns(csv_path)
+            try:
+                write_index_file(index_path, columns, {**source, "types": types})
+                _, columns = read_index_file(index_path)
+            except OSError as e:
+                logger.warning("Could not write airport index %s: %s", index_path, e)
+
+            self._set_columns(columns, types)
+            logger.info("Loaded %d airports from %s", self._count, csv_path)
             return True
 
         except Exception as e:
             logger.error("Failed to load airports: %s", e)
             return False
 
+    def _build_columns(self, csv_path: Path) -> tuple[dict[str, npt.NDArray[Any]], list[str]]:
+        """Parse the CSV into index columns.
+
+        Args:
+            csv_path: Path to airports.csv
+
+        Returns:
+            (columns, airport type table)
+        """
+        records: dict[str, tuple[str, str, str, str, float, float, float, str]] = {}
+        csv_order: dict[str, int] = {}  # ICAO -> position of its (last) CSV row
+
+        with open(csv_path, encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+
+            for row_number, row in enumerate(reader):
+                # Skip airports without ICAO code
+                icao = row.get("icao_code", "").strip()
+                if not icao:
+                    # Try ident as fallback for some airports
+                    ident = row.get("ident", "").strip()
+                    if ident and len(ident) == 4 and ident.isalnum():
+                        icao = ident.upper()
+                    else:
+                        continue
+
+                icao = icao.upper()
+
+                # Parse elevation
+                try:
+                    elevation = float(row.get("elevation_ft") or 0)
+                except (ValueError, TypeError):
+                    elevation = 0
+
+                # Parse coordinates
+                try:
+                    latitude = float(row.get("latitude_deg") or 0)
+                    longitude = float(row.get("longitude_deg") or 0)
+                except (ValueError, TypeError):
+                    latitude = 0
+                    longitude = 0
+
+                # Later rows replace earlier ones with the same ICAO code
+                csv_order[icao] = row_number
+                records[icao] = (
+                    row.get("iata_code", "").strip(),
+                    row.get("name", "").strip(),
+                    row.get("municipality", "").strip(),
+                    row.get("iso_country", "").strip(),
+                    latitude,
+                    longitude,
+                    elevation,
+                    row.get("type", "").strip(),
+                )
+
+        icaos = sorted(records)
+        rows = [records[icao] for icao in icaos]
+        count = len(rows)
+
+        types = list(self.TYPE_PRIORITY)
+        for record in rows:
+            if record[7] not in types:
+                types.append(record[7])
+        type_codes = {name: code for code, name in enumerate(types)}
+
+        columns: dict[str, npt.NDArray[Any]] = {
+            "icao": _fixed_width(icaos),
+            "iata": _fixed_width([r[0] for r in rows]),
+            "country": _fixed_width([r[3] for r in rows]),
+            "latitude": np.array([r[4] for r in rows], dtype=np.float64),
+            "longitude": np.array([r[5] for r in rows], dtype=np.float64),
+            "elevation_ft": np.array([r[6] for r in rows], dtype=np.float32),
+            "type_code": np.array([type_codes[r[7]] for r in rows], dtype=np.uint8),
+        }
+        columns["name_blob"], columns["name_offsets"] = _string_table([r[1] for r in rows])
+        columns["city_blob"], columns["city_offsets"] = _string_table([r[2] for r in rows])
+
+        # IATA lookup: codes sorted, pointing at rows (the last CSV row
+        # wins for duplicate IATA codes)
+        iata_rows: dict[str, int] = {}
+        for row_index in sorted(range(count), key=lambda i: csv_order[icaos[i]]):
+            if rows[row_index][0]:
+                iata_rows[rows[row_index][0].upper()] = row_index
+        iata_keys = sorted(iata_rows)
+        columns["iata_keys"] = _fixed_width(iata_keys)
+        columns["iata_rows"] = np.array([iata_rows[k] for k in iata_keys], dtype=np.int32)
+
+        # Country lookup: rows ordered by country, type priority, then name
+        country_order = sorted(
+            range(count),
+            key=lambda i: (
+                rows[i][3],
+                self.TYPE_PRIORITY.get(rows[i][7], 10),
+                rows[i][1],
+            ),
+        )
+        columns["country_rows"] = np.array(country_order, dtype=np.int32)
+        columns["country_keys"] = _fixed_width([rows[i][3] for i in country_order])
+
+        # Type-ahead search: IATA prefix ranges (every row with a code)
+        iata_order = sorted((r[0].upper(), i) for i, r in enumerate(rows) if r[0])
+        columns["iata_prefix_keys"] = _fixed_width([k for k, _ in iata_order])
+        columns["iata_prefix_rows"] = np.array([i for _, i in iata_order], dtype=np.int32)
+
+        # City prefix ranges and n-gram indexes over lowercase city and name
+        cities = [r[2].lower() for r in rows]
+        city_order = sorted((city, i) for i, city in enumerate(cities) if city)
+        columns["city_keys"] = _fixed_width([k for k, _ in city_order])
+        columns["city_rows"] = np.array([i for _, i in city_order], dtype=np.int32)
+
+        for field, values in (("city", cities), ("name", [r[1].lower() for r in rows])):
+            grams, offsets, gram_rows = _gram_postings(values)
+            columns[f"{field}_gram_keys"] = grams
+            columns[f"{field}_gram_offsets"] = offsets
+            columns[f"{field}_gram_rows"] = gram_rows
+
+        return columns, types
+
+    def _set_columns(self, columns: dict[str, npt.NDArray[Any]], types: list[str]) -> None:
+        """Install index columns and reset lazily created airports.
+
+        Args:
+            columns: Index columns
+            types: Airport type table
+        """
+        self._columns = columns
+        self._types = types
+        self._count = len(columns["icao"])
+        self._cache = {}
+        self._contains_cache = {}
+        self._lowercase_cache = {}
+        self._last_search = None
+        self._loaded = True
+
+    def _find_row(self, keys: npt.NDArray[np.bytes_], value: str) -> int | None:
+        """Binary search a sorted fixed-width column.
+
+        Args:
+            keys: Sorted fixed-width key column
+            value: Key to find
+
+        Returns:
+            Position of the key, or None if not present
+        """
+        encoded = value.encode("utf-8")
+        if not len(keys) or len(encoded) > keys.dtype.itemsize:
+            return None
+
+        position = int(np.searchsorted(keys, encoded))
+        if position < len(keys) and keys[position] == encoded:
+            return position
+        return None
+
+    def _get_string(self, table: str, row: int) -> str:
+        """Decode one string from a string table.
+
+        Args:
+            table: Table name ("name" or "city")
+            row: Row index
+
+        Returns:
+            Decoded string
+        """
+        offsets = self._columns[f"{table}_offsets"]
+        start, end = int(offsets[row]), int(offsets[row + 1])
+        return bytes(self._columns[f"{table}_blob"][start:end]).decode("utf-8")
+
+    def _airport_at(self, row: int) -> AirportInfo:
+        """Get (or lazily create) the AirportInfo for a row.
+
+        Args:
+            row: Row index
+
+        Returns:
+            AirportInfo for that row
+        """
+        airport = self._cache.get(row)
+        if airport is None:
+            columns = self._columns
+            airport = AirportInfo(
+                icao=columns["icao"][row].decode("utf-8"),
+                iata=columns["iata"][row].decode("utf-8"),
+                name=self._get_string("name", row),
+                city=self._get_string("city", row),
+                country=columns["country"][row].decode("utf-8"),
+                latitude=float(columns["latitude"][row]),
+                longitude=float(columns["longitude"][row]),
+                elevation_ft=float(columns["elevation_ft"][row]),
+                airport_type=self._types[int(columns["type_code"][row])],
+            )
+            self._cache[row] = airport
+        return airport
+
+    def _type_codes(self, airport_types: list[str]) -> list[int]:
+        """Get type codes for a list of airport type names.
+
+        Args:
+            airport_types: Airport type names
+
+        Returns:
+            Codes of the types present in the index
+        """
+        return [code for code, name in enumerate(self._types) if name in airport_types]
+
     def get(self, icao: str) -> AirportInfo | None:
         """Get airport by ICAO code.
 
@@ -199,7 +601,10 @@ class AirportIndex:
         Returns:
             AirportInfo if found, None otherwise.
         """
-        return self._airports.get(icao.upper())
+        if not self._loaded:
+            return None
+        row = self._find_row(self._columns["icao"], icao.upper())
+        return self._airport_at(row) if row is not None else None
 
     def get_by_iata(self, iata: str) -> AirportInfo | None:
         """Get airport by IATA code.
@@ -210,10 +615,12 @@ class AirportIndex:
         Returns:
             AirportInfo if found, None otherwise.
         """
-        icao = self._iata_index.get(iata.upper())
-        if icao:
-            return self._airports.get(icao)
-        return None
+        if not self._loaded:
+            return None
+        position = self._find_row(self._columns["iata_keys"], iata.upper())
+        if position is None:
+            return None
+        return self._airport_at(int(self._columns["iata_rows"][position]))
 
     def search(
         self,
@@ -226,6 +633,11 @@ class AirportIndex:
         Searches ICAO code, IATA code, name, and city.
         Results are sorted by relevance and airport size.
 
+        Scores match _match_score() but are computed from the prefix and
+        n-gram indexes, so only matching airports are touched. When a query
+        extends the previous one (typing another character), substring
+        matching is restricted to the previous matches.
+
         Args:
             query: Search query (case-insensitive).
             limit: Maximum number of results to return.
@@ -235,36 +647,204 @@ class AirportIndex:
         Returns:
             List of matching AirportInfo objects.
         """
-        if not query:
+        if not query or not self._loaded:
             return []
 
-        query_upper = query.upper()
-        query_lower = query.lower()
-
         if airport_types is None:
             # Default to larger airports for better UX
             airport_types = ["large_airport", "medium_airport", "small_airport"]
 
-        results: list[tuple[int, AirportInfo]] = []
+        search_key = (query, tuple(airport_types), limit)
+        if self._last_search and self._last_search[:3] == search_key:
+            ranked = self._last_search[3]
+        else:
+            ranked = self._rank(query.upper(), query.lower(), airport_types, limit)
+            self._last_search = (*search_key, ranked)
+
+        return [self._airport_at(row) for row in ranked]
+
+    def _rank(
+        self, query_upper: str, query_lower: str, airport_types: list[str], limit: int
+    ) -> list[int]:
+        """Get the best matching rows by score, then type priority, then ICAO.
+
+        Args:
+            query_upper: Uppercase query.
+            query_lower: Lowercase query.
+            airport_types: Airport types to include.
+            limit: Maximum number of rows to return.
+
+        Returns:
+            Best matching rows, best first.
+        """
+        scores = self._score_rows(query_upper, query_lower)
+
+        type_ok = np.zeros(len(self._types), dtype=bool)
+        type_ok[self._type_codes(airport_types)] = True
+        type_codes = self._columns["type_code"]
+        rows = np.flatnonzero((scores > 0) & type_ok[type_codes])
+
+        # Unique sort keys: score descending, type priority, then row (ICAO)
+        priority = np.array([self.TYPE_PRIORITY.get(t, 10) for t in self._types], dtype=np.int64)
+        keys = (
+            -scores[rows].astype(np.int64) * 16 + priority[type_codes[rows]]
+        ) * self._count + rows
+
+        if len(keys) > limit:
+            keys = keys[np.argpartition(keys, limit - 1)[:limit]] if limit > 0 else keys[:0]
+        keys.sort()
+        ranked: list[int] = (keys % self._count).tolist()
+        return ranked
+
+    def _score_rows(self, query_upper: str, query_lower: str) -> npt.NDArray[np.int32]:
+        """Compute _match_score() for every airport from the indexes.
+
+        Args:
+            query_upper: Uppercase query.
+            query_lower: Lowercase query.
+
+        Returns:
+            Score per row (0 = no match).
+        """
+        columns = self._columns
+        scores = np.zeros(self._count, dtype=np.int32)
+
+        # ICAO exact (1000) or prefix (100 + 10 - len)
+        icao_prefix = self._prefix_range(columns["icao"], query_upper)
+        scores[icao_prefix] += 100 + (10 - len(query_upper))
+        exact = self._find_row(columns["icao"], query_upper)
+        if exact is not None:
+            scores[exact] += 1000 - (100 + (10 - len(query_upper)))
+
+        # IATA exact (500) or prefix (50)
+        iata_range = self._prefix_range(columns["iata_prefix_keys"], query_upper)
+        iata_keys = columns["iata_prefix_keys"][iata_range]
+        iata_rows = columns["iata_prefix_rows"][iata_range]
+        scores[iata_rows] += np.where(iata_keys == query_upper.encode("utf-8"), 500, 50)
+
+        # City exact (200), prefix (80) or contains (30)
+        scores[self._contains_rows("city", query_lower)] += 30
+        city_range = self._prefix_range(columns["city_keys"], query_lower)
+        city_keys = columns["city_keys"][city_range]
+        city_rows = columns["city_rows"][city_range]
+        scores[city_rows] += np.where(city_keys == query_lower.encode("utf-8"), 170, 50)
+
+        # Name contains (20)
+        scores[self._contains_rows("name", query_lower)] += 20
+
+        # Country match (for short codes like "FR", "US")
+        if len(query_upper) == 2:
+            country = query_upper.encode("utf-8")
+            keys = columns["country_keys"]
+            start = int(np.searchsorted(keys, country, side="left"))
+            end = int(np.searchsorted(keys, country, side="right"))
+            scores[columns["country_rows"][start:end]] += 5
+
+        return scores
+
+    def _prefix_range(self, keys: npt.NDArray[np.bytes_], prefix: str) -> slice:
+        """Find the range of a sorted key column starting with a prefix.
+
+        Args:
+            keys: Sorted fixed-width key column
+            prefix: Non-empty prefix
+
+        Returns:
+            Slice of matching positions (empty if none)
+        """
+        encoded = prefix.encode("utf-8")
+        if not len(keys) or len(encoded) > keys.dtype.itemsize:
+            return slice(0, 0)
+
+        start = int(np.searchsorted(keys, encoded, side="left"))
+        end = int(np.searchsorted(keys, _prefix_successor(encoded), side="left"))
+        return slice(start, end)
+
+    def _gram_rows(self, field: str, gram: str) -> npt.NDArray[np.int32]:
+        """Get the rows whose lowercase field contains an n-gram.
+
+        Args:
+            field: "city" or "name"
+            gram: Lowercase n-gram (1 to MAX_GRAM characters)
+
+        Returns:
+            Ascending rows
+        """
+        position = self._find_row(self._columns[f"{field}_gram_keys"], gram)
+        if position is None:
+            return np.empty(0, dtype=np.int32)
 
-        for airport in self._airports.values():
-            # Filter by type
-            if airport.airport_type not in airport_types:
-                continue
+        offsets = self._columns[f"{field}_gram_offsets"]
+        rows: npt.NDArray[np.int32] = self._columns[f"{field}_gram_rows"][
+            offsets[position] : offsets[position + 1]
+        ]
+        return rows
+
+    def _lowercase_strings(self, field: str) -> list[str]:
+        """Get all values of a string field, lowercased (decoded once).
 
-            score = self._match_score(airport, query_upper, query_lower)
-            if score > 0:
-                results.append((score, airport))
+        Args:
+            field: "city" or "name"
 
-        # Sort by score (higher is better), then by airport type priority
-        results.sort(
-            key=lambda x: (
-                -x[0],  # Higher score first
-                self.TYPE_PRIORITY.get(x[1].airport_type, 10),
+        Returns:
+            Lowercase strings in row order
+        """
+        values = self._lowercase_cache.get(field)
+        if values is None:
+            offsets = self._columns[f"{field}_offsets"].tolist()
+            data = bytes(self._columns[f"{field}_blob"])
+            values = [
+                data[offsets[i] : offsets[i + 1]].decode("utf-8").lower()
+                for i in range(self._count)
+            ]
+            self._lowercase_cache[field] = values
+        return values
+
+    def _contains_rows(self, field: str, query_lower: str) -> npt.NDArray[np.int32]:
+        """Get the rows whose lowercase field contains a query.
+
+        Queries up to MAX_GRAM characters are answered directly by the
+        n-gram index. Longer queries intersect the postings of their
+        n-grams and verify the candidates; when the query extends the
+        previous query for this field, the previous matches are used as
+        the starting candidate set.
+
+        Args:
+            field: "city" or "name"
+            query_lower: Lowercase query
+
+        Returns:
+            Ascending rows
+        """
+        if len(query_lower) <= MAX_GRAM:
+            rows = self._gram_rows(field, query_lower)
+        else:
+            previous = self._contains_cache.get(field)
+            if previous and query_lower.startswith(previous[0]):
+                candidates = previous[1]
+                grams = [query_lower[-MAX_GRAM:]]
+            else:
+                grams = [
+                    query_lower[i : i + MAX_GRAM] for i in range(0, len(query_lower) - MAX_GRAM + 1)
+                ]
+                candidates = self._gram_rows(field, grams.pop())
+
+            for gram in grams:
+                if not len(candidates):
+                    break
+                candidates = np.intersect1d(
+                    candidates, self._gram_rows(field, gram), assume_unique=True
+                )
+
+            # n-grams only prove the pieces are present; verify the substring
+            values = self._lowercase_strings(field)
+            rows = np.array(
+                [row for row in candidates.tolist() if query_lower in values[row]],
+                dtype=np.int32,
             )
-        )
 
-        return [airport for _, airport in results[:limit]]
+        self._contains_cache[field] = (query_lower, rows)
+        return rows
 
     def _match_score(
         self,
@@ -329,7 +909,9 @@ class AirportIndex:
         Returns:
             Sorted list of all ICAO codes.
         """
-        return sorted(self._airports.keys())
+        if not self._loaded:
+            return []
+        return [code.decode("utf-8") for code in self._columns["icao"].tolist()]
 
     def get_airports_in_country(
         self,
@@ -345,26 +927,24 @@ class AirportIndex:
         Returns:
             List of airports sorted by type priority.
         """
-        country_upper = country_code.upper()
+        if not self._loaded:
+            return []
+
+        country = country_code.upper().encode("utf-8")
 
         if airport_types is None:
             airport_types = ["large_airport", "medium_airport", "small_airport"]
 
-        results = [
-            airport
-            for airport in self._airports.values()
-            if airport.country == country_upper and airport.airport_type in airport_types
-        ]
+        # Rows are pre-sorted by country, type priority, then name
+        keys = self._columns["country_keys"]
+        start = int(np.searchsorted(keys, country, side="left"))
+        end = int(np.searchsorted(keys, country, side="right"))
+        rows = self._columns["country_rows"][start:end]
 
-        # Sort by type priority, then by name
-        results.sort(
-            key=lambda x: (
-                self.TYPE_PRIORITY.get(x.airport_type, 10),
-                x.name,
-            )
-        )
+        type_codes = self._columns["type_code"][rows]
+        rows = rows[np.isin(type_codes, self._type_codes(airport_types))]
 
-        return results
+        return [self._airport_at(int(row)) for row in rows.tolist()]
 
     @property
     def is_loaded(self) -> bool:
@@ -374,7 +954,7 @@ class AirportIndex:
     @property
     def airport_count(self) -> int:
         """Get number of loaded airports."""
-        return len(self._airports)
+        return self._count
 
 
 # Global singleton instance
@@ -20,6 +20,7 @@ from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
+from airborne.airports.spatial_index import SpatialIndex
 from airborne.physics.vectors import Vector3
 from airborne.services.atc.gateway_loader import (
     GatewayAirportData,
@@ -241,6 +242,7 @@ class AirportDatabase:
         self.frequencies: dict[str, list[Frequency]] = {}
         self.parking: dict[str, list[ParkingPosition]] = {}
         self._gateway_data: dict[str, GatewayAirportData] = {}
+        self._spatial_index = SpatialIndex(cell_size_deg=1.0)
 
     def load_airport(self, icao: str) -> bool:
         """Load a single airport from Gateway.
@@ -304,6 +306,7 @@ class AirportDatabase:
         )
 
         self.airports[data.icao] = airport
+        self._spatial_index.insert(airport.position, airport)
 
     def _convert_runways(self, data: GatewayAirportData) -> None:
         """Convert Gateway runway data to Runway dataclasses."""
@@ -531,16 +534,40 @@ class AirportDatabase:
             >>> for airport, distance in nearby:
             ...     print(f"{airport.icao}: {distance:.1f} nm")
         """
-        results = []
+        return self._get_spatial_index().query_radius(position, radius_nm)
 
-        for airport in self.airports.values():
-            distance_nm = self._haversine_distance_nm(position, airport.position)
-            if distance_nm <= radius_nm:
-                results.append((airport, distance_nm))
+    def get_nearest_airports(
+        self, position: Vector3, count: int, max_radius_nm: float | None = None
+    ) -> list[tuple[Airport, float]]:
+        """Get the loaded airports nearest to a position.
 
-        # Sort by distance
-        results.sort(key=lambda x: x[1])
-        return results
+        Note: This only searches already-loaded airports.
+
+        Args:
+            position: Center position (x=lon, y=elev, z=lat)
+            count: Maximum number of airports to return
+            max_radius_nm: Optional search radius in nautical miles
+
+        Returns:
+            List of (airport, distance_nm) tuples, sorted by distance
+
+        Examples:
+            >>> for airport, distance in db.get_nearest_airports(position, 3):
+            ...     print(f"{airport.icao}: {distance:.1f} nm")
+        """
+        return self._get_spatial_index().query_knn(position, count, max_radius_nm)
+
+    def _get_spatial_index(self) -> SpatialIndex:
+        """Get the spatial index, rebuilt if airports were added directly.
+
+        Returns:
+            Spatial index over all loaded airports
+        """
+        if self._spatial_index.get_item_count() != len(self.airports):
+            self._spatial_index.clear()
+            for airport in self.airports.values():
+                self._spatial_index.insert(airport.position, airport)
+        return self._spatial_index
 
     @staticmethod
     def _haversine_distance_nm(pos1: Vector3, pos2: Vector3) -> float:
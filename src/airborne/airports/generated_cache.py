@@ -0,0 +1,365 @@
+"""Cache of procedurally generated taxiways and parking.
+
+Airports without a Gateway taxi network get their taxiways and stands
+from TaxiwayGenerator and ParkingGenerator. The generated layout is saved
+per airport next to the Gateway data, in the same sectioned binary format
+(see gateway_cache), and reused while the key still matches. The key
+combines both generator versions, the airport category and the airport
+position and runway set, so a generator change or a runway update
+regenerates the layout.
+
+pregenerate_layouts() fills the cache for many airports in a process pool,
+e.g. every airport of a country (see scripts/pregenerate_layouts.py).
+
+Typical usage:
+    from airborne.airports.generated_cache import GeneratedLayoutCache
+
+    cache = GeneratedLayoutCache()
+    graph, parking_db = cache.get(airport, runways, category)
+"""
+
+import hashlib
+import logging
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from airborne.airports import parking_generator, taxiway_generator
+from airborne.airports.classifier import AirportCategory, AirportClassifier
+from airborne.airports.database import Airport, AirportDatabase, Runway
+from airborne.airports.parking import (
+    AircraftSizeCategory,
+    ParkingAmenities,
+    ParkingDatabase,
+    ParkingPosition,
+    ParkingType,
+)
+from airborne.airports.parking_generator import ParkingGenerator
+from airborne.airports.taxiway import TaxiwayEdge, TaxiwayGraph, TaxiwayNode
+from airborne.airports.taxiway_generator import TaxiwayGenerator
+from airborne.physics.vectors import Vector3
+from airborne.services.atc.gateway_cache import (
+    decode_section,
+    encode_section,
+    read_cache_payloads,
+    write_cache_sections,
+)
+
+logger = logging.getLogger(__name__)
+
+CACHE_SUFFIX = ".gen.gwc"
+LAYOUT_SECTIONS = ("key", "nodes", "edges", "parking")
+
+# Fixed part of each record; "I" fields are string table indices
+_KEY = struct.Struct("<I")
+_NODE = struct.Struct("<IdddII")
+_EDGE = struct.Struct("<IIdII")
+_PARKING = struct.Struct("<IIdddIdB")
+
+# Amenity flags of a parking record, in bit order
+_AMENITIES = (
+    "fuel_available",
+    "gpu_available",
+    "jetway_available",
+    "pushback_required",
+    "hangar_available",
+)
+
+
+def layout_key(airport: Airport, runways: list[Runway], category: AirportCategory) -> str:
+    """Get the cache key of an airport's generated layout.
+
+    Runways are hashed in the given order, since the generators treat the
+    first runway as the primary one.
+
+    Args:
+        airport: Airport the layout is generated for.
+        runways: Runways passed to the generators.
+        category: Airport size category.
+
+    Returns:
+        Key made of the generator versions and a hash of the inputs.
+
+    Examples:
+        >>> layout_key(airport, runways, AirportCategory.SMALL)
+        't1-p1-3f2c9a0b7d41e865'
+    """
+    inputs = [
+        repr(
+            (
+                airport.icao,
+                category.value,
+                airport.position.x,
+                airport.position.y,
+                airport.position.z,
+            )
+        )
+    ]
+    inputs += [
+        repr(
+            (
+                r.runway_id,
+                r.length_ft,
+                r.width_ft,
+                r.surface.value,
+                r.le_ident,
+                r.le_latitude,
+                r.le_longitude,
+                r.le_elevation_ft,
+                r.le_heading_deg,
+                r.he_ident,
+                r.he_latitude,
+                r.he_longitude,
+                r.he_elevation_ft,
+                r.he_heading_deg,
+            )
+        )
+        for r in runways
+    ]
+    digest = hashlib.sha1("\n".join(inputs).encode("utf-8")).hexdigest()[:16]
+    return f"t{taxiway_generator.GENERATOR_VERSION}-p{parking_generator.GENERATOR_VERSION}-{digest}"
+
+
+def write_generated_layout(
+    path: Path, key: str, graph: TaxiwayGraph, parking_db: ParkingDatabase
+) -> None:
+    """Write a generated layout to a binary cache file.
+
+    Args:
+        path: Output path.
+        key: Layout key (see layout_key()).
+        graph: Generated taxiway graph.
+        parking_db: Generated parking positions.
+    """
+    write_cache_sections(
+        path,
+        {
+            "key": encode_section(_KEY, [key], lambda k, s: (s.add(k),)),
+            "nodes": encode_section(
+                _NODE,
+                list(graph.nodes.values()),
+                lambda n, s: (
+                    s.add(n.node_id),
+                    n.position.x,
+                    n.position.y,
+                    n.position.z,
+                    s.add(n.node_type),
+                    s.add(n.name),
+                ),
+            ),
+            "edges": encode_section(
+                _EDGE,
+                [edge for edges in graph.edges.values() for edge in edges],
+                lambda e, s: (
+                    s.add(e.from_node),
+                    s.add(e.to_node),
+                    e.distance_m,
+                    s.add(e.edge_type),
+                    s.add(e.name),
+                ),
+            ),
+            "parking": encode_section(
+                _PARKING,
+                parking_db.get_all_parking(),
+                lambda p, s: (
+                    s.add(p.position_id),
+                    s.add(p.parking_type.value),
+                    p.position.x,
+                    p.position.y,
+                    p.position.z,
+                    s.add(p.size_category.value),
+                    p.heading,
+                    sum(
+                        1 << bit
+                        for bit, name in enumerate(_AMENITIES)
+                        if getattr(p.amenities, name)
+                    ),
+                ),
+            ),
+        },
+    )
+
+
+def read_generated_layout(
+    path: Path, key: str, icao: str
+) -> tuple[TaxiwayGraph, ParkingDatabase] | None:
+    """Read a generated layout from a binary cache file.
+
+    Args:
+        path: Cache file path.
+        key: Expected layout key (see layout_key()).
+        icao: Airport ICAO code, for the parking database.
+
+    Returns:
+        Taxiway graph and parking positions, or None if the file was
+        written for another key.
+
+    Raises:
+        ValueError: If the file is not a supported cache file.
+    """
+    payloads = read_cache_payloads(path, LAYOUT_SECTIONS)
+    rows, strings = decode_section(_KEY, payloads["key"])
+    if strings[rows[0][0]] != key:
+        return None
+
+    graph = TaxiwayGraph()
+    rows, s = decode_section(_NODE, payloads["nodes"])
+    for node_id, x, y, z, node_type, name in rows:
+        graph.nodes[s[node_id]] = TaxiwayNode(s[node_id], Vector3(x, y, z), s[node_type], s[name])
+        graph.edges[s[node_id]] = []
+
+    rows, s = decode_section(_EDGE, payloads["edges"])
+    for from_node, to_node, distance_m, edge_type, name in rows:
+        graph.edges[s[from_node]].append(
+            TaxiwayEdge(s[from_node], s[to_node], distance_m, s[edge_type], s[name])
+        )
+
+    parking_db = ParkingDatabase(icao)
+    rows, s = decode_section(_PARKING, payloads["parking"])
+    for position_id, parking_type, x, y, z, size_category, heading, amenities in rows:
+        parking_db.positions[s[position_id]] = ParkingPosition(
+            position_id=s[position_id],
+            parking_type=ParkingType(s[parking_type]),
+            position=Vector3(x, y, z),
+            size_category=AircraftSizeCategory(s[size_category]),
+            heading=heading,
+            amenities=ParkingAmenities(
+                **{name: bool(amenities >> bit & 1) for bit, name in enumerate(_AMENITIES)}
+            ),
+        )
+    return graph, parking_db
+
+
+class GeneratedLayoutCache:
+    """Generated taxiways and parking, cached per airport.
+
+    Examples:
+        >>> cache = GeneratedLayoutCache("data/airports/gateway_cache")
+        >>> graph, parking_db = cache.get(airport, runways, AirportCategory.SMALL)
+        >>> print(f"{graph.get_node_count()} nodes")
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        taxiway_gen: TaxiwayGenerator | None = None,
+        parking_gen: ParkingGenerator | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory of the cache files.
+                      Defaults to data/airports/gateway_cache
+            taxiway_gen: Taxiway generator (created if None).
+            parking_gen: Parking generator (created if None).
+        """
+        if cache_dir is None:
+            self.cache_dir = Path("data/airports/gateway_cache")
+        else:
+            self.cache_dir = Path(cache_dir)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.taxiway_gen = taxiway_gen or TaxiwayGenerator()
+        self.parking_gen = parking_gen or ParkingGenerator()
+
+    def cache_file(self, icao: str) -> Path:
+        """Get the cache file path of an airport."""
+        return self.cache_dir / f"{icao.upper()}{CACHE_SUFFIX}"
+
+    def get(
+        self, airport: Airport, runways: list[Runway], category: AirportCategory
+    ) -> tuple[TaxiwayGraph, ParkingDatabase]:
+        """Get the layout of an airport, generating and saving it if needed.
+
+        Args:
+            airport: Airport data.
+            runways: Runways of the airport.
+            category: Airport size category.
+
+        Returns:
+            Taxiway graph and parking positions.
+        """
+        key = layout_key(airport, runways, category)
+        cache_file = self.cache_file(airport.icao)
+        if cache_file.exists():
+            try:
+                layout = read_generated_layout(cache_file, key, airport.icao)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("Failed to read generated layout %s: %s", cache_file, e)
+                layout = None
+            if layout is not None:
+                logger.debug("Loaded generated layout for %s", airport.icao)
+                return layout
+
+        graph = self.taxiway_gen.generate(airport, runways, category)
+        parking_db = self.parking_gen.generate(airport, runways, category)
+        try:
+            write_generated_layout(cache_file, key, graph, parking_db)
+        except OSError as e:
+            logger.warning("Failed to save generated layout %s: %s", cache_file, e)
+        return graph, parking_db
+
+
+def _pregenerate_chunk(icaos: list[str], cache_dir: str | Path | None) -> int:
+    """Worker process: generate and save the layouts of some airports.
+
+    Args:
+        icaos: ICAO codes to generate.
+        cache_dir: Directory of the Gateway data and layout cache files.
+
+    Returns:
+        Number of airports with a cached layout.
+    """
+    airport_db = AirportDatabase(cache_dir)
+    cache = GeneratedLayoutCache(airport_db.gateway_loader.cache_dir)
+    classifier = AirportClassifier()
+    done = 0
+    for icao in icaos:
+        try:
+            if not airport_db.load_airport(icao):
+                continue
+            airport = airport_db.get_airport(icao)
+            runways = airport_db.get_runways(icao)
+            if airport is None or not runways:
+                continue
+            cache.get(airport, runways, classifier.classify(airport, runways))
+            done += 1
+        except Exception as e:
+            logger.warning("Failed to pregenerate layout for %s: %s", icao, e)
+    return done
+
+
+def pregenerate_layouts(
+    icaos: list[str], cache_dir: str | Path | None = None, workers: int | None = None
+) -> int:
+    """Generate and save the layouts of many airports in a process pool.
+
+    Airports are loaded from the Gateway cache (or fetched), and layouts
+    that are already cached with a current key are left as they are.
+
+    Args:
+        icaos: ICAO codes of the airports.
+        cache_dir: Directory of the Gateway data and layout cache files.
+                  Defaults to data/airports/gateway_cache
+        workers: Number of worker processes (defaults to the CPU count).
+
+    Returns:
+        Number of airports with a cached layout.
+
+    Examples:
+        >>> icaos = [a.icao for a in get_airport_index().get_airports_in_country("FR")]
+        >>> pregenerate_layouts(icaos, workers=8)
+    """
+    if not icaos:
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+    # Several chunks per worker keep the pool busy when airports differ in size
+    chunk_count = min(len(icaos), workers * 4)
+    chunks = [icaos[i::chunk_count] for i in range(chunk_count)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        done = sum(pool.map(_pregenerate_chunk, chunks, [cache_dir] * chunk_count))
+
+    logger.info("Pregenerated layouts for %d of %d airports", done, len(icaos))
+    return done
@@ -0,0 +1,702 @@
+"""Compressed sparse row graph of an airport's ground network.
+
+One GroundGraph holds an airport's taxi network as NumPy arrays: node
+coordinates and flags, edge endpoints, lengths, name and type IDs into a
+shared string table, and a CSR adjacency of traversable directions. It is
+built once per airport and shared by ATC routing, position tracking,
+ground traffic and runway incursion checks, which can run vectorized
+queries over the arrays instead of walking node and edge objects.
+
+Typical usage:
+    from airborne.airports.ground_graph import get_ground_graph
+
+    graph = get_ground_graph(gateway_airport_data)
+    hold_rows = graph.hold_short_rows("27")
+    path = graph.shortest_path(graph.row(start_id), hold_rows)
+"""
+
+import heapq
+import logging
+import math
+import threading
+import weakref
+from collections.abc import Hashable, Iterable, Sequence
+from typing import TYPE_CHECKING, Generic, Protocol, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from airborne.airports.ground_index import GroundSpatialIndex
+
+if TYPE_CHECKING:
+    from airborne.airports.taxiway import TaxiwayGraph
+    from airborne.services.atc.gateway_loader import GatewayAirportData
+
+logger = logging.getLogger(__name__)
+
+# Node flags
+NODE_HOLD_SHORT = 1
+NODE_RUNWAY = 2
+NODE_PARKING = 4
+
+# Edge flags
+EDGE_RUNWAY = 1
+EDGE_ONE_WAY = 2
+
+# Added to the cost of runway edges when routes avoid runways
+RUNWAY_PENALTY_M = 1000.0
+
+# Parking positions farther than this from every node are not on the network
+PARKING_NODE_MAX_DISTANCE_M = 150.0
+
+EARTH_RADIUS_M = 6_371_000.0
+
+# Per node: (neighbor row, cost) pairs
+AdjacencyLists = list[list[tuple[int, float]]]
+
+
+class _DirectedEdge(Protocol):
+    @property
+    def from_node(self) -> Hashable: ...
+
+    @property
+    def to_node(self) -> Hashable: ...
+
+
+_Directed = TypeVar("_Directed", bound=_DirectedEdge)
+
+# Source node ID type (Gateway node numbers or generated string IDs)
+NodeId = TypeVar("NodeId", bound=Hashable)
+
+
+def haversine_m(
+    lat1: npt.ArrayLike, lon1: npt.ArrayLike, lat2: npt.ArrayLike, lon2: npt.ArrayLike
+) -> npt.NDArray[np.float64]:
+    """Great-circle distances in meters between arrays of positions.
+
+    Args:
+        lat1: First latitudes in degrees
+        lon1: First longitudes in degrees
+        lat2: Second latitudes in degrees
+        lon2: Second longitudes in degrees
+
+    Returns:
+        Distances in meters
+    """
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
+    dlat = lat2_rad - lat1_rad
+    dlon = np.radians(np.asarray(lon2) - np.asarray(lon1))
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon / 2) ** 2
+    result: npt.NDArray[np.float64] = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+    return result
+
+
+class _StringTable:
+    """Interning table for node and edge strings; ID 0 is the empty string."""
+
+    def __init__(self) -> None:
+        self.names: list[str] = [""]
+        self._ids: dict[str, int] = {"": 0}
+
+    def add(self, value: str) -> int:
+        """Get the ID of a string, adding it if new."""
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = len(self.names)
+            self._ids[value] = string_id
+            self.names.append(value)
+        return string_id
+
+
+class GroundGraph(Generic[NodeId]):
+    """Airport ground network stored as arrays.
+
+    Nodes are addressed by row (0..node_count-1); node_ids maps rows back
+    to the source IDs (Gateway node numbers or generated string IDs). Each
+    edge is one taxi segment; segments without EDGE_ONE_WAY can be taxied
+    both ways. String attributes are IDs into names, where 0 is "".
+
+    Attributes:
+        node_ids: Source node ID of each row
+        latitudes: Node latitudes in degrees
+        longitudes: Node longitudes in degrees
+        node_flags: NODE_* flags per node
+        node_name: Name ID per node
+        node_runway: Runway ID (e.g., "09/27") per node, for hold short nodes
+        node_type: Type ID per node (intersection, runway, hold_short, parking)
+        edge_start: Start row per edge
+        edge_end: End row per edge
+        edge_length_m: Length per edge in meters
+        edge_name: Name ID per edge (taxiway or runway name)
+        edge_type: Type ID per edge (taxiway, runway, apron)
+        edge_width: Width code ID per edge
+        edge_flags: EDGE_* flags per edge
+        indptr: CSR row pointers into adj_node and adj_edge
+        adj_node: Reachable neighbor row per direction
+        adj_edge: Edge of each direction
+        names: String table
+
+    Examples:
+        >>> graph = GroundGraph.from_gateway_data(airport_data)
+        >>> graph.neighbors(graph.row(1001))
+        array([2, 7], dtype=int32)
+    """
+
+    def __init__(
+        self,
+        node_ids: Sequence[NodeId],
+        latitudes: npt.ArrayLike,
+        longitudes: npt.ArrayLike,
+        edge_start: npt.ArrayLike,
+        edge_end: npt.ArrayLike,
+        edge_length_m: npt.ArrayLike,
+        names: list[str] | None = None,
+        node_flags: npt.ArrayLike | None = None,
+        node_name: npt.ArrayLike | None = None,
+        node_runway: npt.ArrayLike | None = None,
+        node_type: npt.ArrayLike | None = None,
+        edge_name: npt.ArrayLike | None = None,
+        edge_type: npt.ArrayLike | None = None,
+        edge_width: npt.ArrayLike | None = None,
+        edge_flags: npt.ArrayLike | None = None,
+    ) -> None:
+        """Build the graph from per-node and per-edge arrays.
+
+        Optional arrays default to zeros (no flags, empty strings).
+
+        Args:
+            node_ids: Source node ID of each row
+            latitudes: Node latitudes in degrees
+            longitudes: Node longitudes in degrees
+            edge_start: Start row per edge
+            edge_end: End row per edge
+            edge_length_m: Length per edge in meters
+            names: String table referenced by the ID arrays ([""] if None)
+            node_flags: NODE_* flags per node
+            node_name: Name ID per node
+            node_runway: Runway ID per node
+            node_type: Type ID per node
+            edge_name: Name ID per edge
+            edge_type: Type ID per edge
+            edge_width: Width code ID per edge
+            edge_flags: EDGE_* flags per edge
+        """
+        self.node_ids: list[NodeId] = list(node_ids)
+        self.names = names if names is not None else [""]
+        self._rows: dict[NodeId, int] = {node_id: row for row, node_id in enumerate(self.node_ids)}
+        self._name_ids = {name: i for i, name in enumerate(self.names)}
+
+        nodes = len(self.node_ids)
+        self.latitudes = np.asarray(latitudes, dtype=np.float64)
+        self.longitudes = np.asarray(longitudes, dtype=np.float64)
+        self.node_flags = _array(node_flags, nodes, np.uint8)
+        self.node_name = _array(node_name, nodes, np.int32)
+        self.node_runway = _array(node_runway, nodes, np.int32)
+        self.node_type = _array(node_type, nodes, np.int32)
+
+        self.edge_start = np.asarray(edge_start, dtype=np.int32)
+        self.edge_end = np.asarray(edge_end, dtype=np.int32)
+        edges = len(self.edge_start)
+        self.edge_length_m = np.asarray(edge_length_m, dtype=np.float64)
+        self.edge_name = _array(edge_name, edges, np.int32)
+        self.edge_type = _array(edge_type, edges, np.int32)
+        self.edge_width = _array(edge_width, edges, np.int32)
+        self.edge_flags = _array(edge_flags, edges, np.uint8)
+
+        # Directions: every edge forward, two-way edges also backward
+        two_way = np.flatnonzero((self.edge_flags & EDGE_ONE_WAY) == 0).astype(np.int32)
+        sources = np.concatenate([self.edge_start, self.edge_end[two_way]])
+        targets = np.concatenate([self.edge_end, self.edge_start[two_way]])
+        direction_edges = np.concatenate([np.arange(edges, dtype=np.int32), two_way])
+        order = np.argsort(sources, kind="stable")
+        self.indptr = np.zeros(nodes + 1, dtype=np.int32)
+        np.cumsum(np.bincount(sources, minlength=nodes), out=self.indptr[1:])
+        self.adj_node = targets[order]
+        self.adj_edge = direction_edges[order]
+
+        self._spatial_index: GroundSpatialIndex | None = None
+        self._adjacency_lists: tuple[list[list[int]], list[list[int]]] | None = None
+        self._incident_lists: list[list[int]] | None = None
+
+    @staticmethod
+    def from_gateway_data(data: "GatewayAirportData") -> "GroundGraph[int]":
+        """Build a graph from Gateway airport data.
+
+        Edges whose nodes are missing are skipped; edge order otherwise
+        follows data.taxi_edges. Nodes nearest to parking positions are
+        flagged NODE_PARKING.
+
+        Args:
+            data: Gateway airport data with taxi nodes and edges
+
+        Returns:
+            Built graph
+        """
+        strings = _StringTable()
+        node_ids = list(data.taxi_nodes)
+        rows = {node_id: row for row, node_id in enumerate(node_ids)}
+        taxi_nodes = list(data.taxi_nodes.values())
+        latitudes = np.array([node.latitude for node in taxi_nodes], dtype=np.float64)
+        longitudes = np.array([node.longitude for node in taxi_nodes], dtype=np.float64)
+        node_flags = np.array(
+            [NODE_HOLD_SHORT if node.is_hold_short else 0 for node in taxi_nodes], dtype=np.uint8
+        )
+        node_name = [strings.add(node.name) for node in taxi_nodes]
+        node_runway = [strings.add(node.on_runway) for node in taxi_nodes]
+
+        taxi_edges = [
+            edge for edge in data.taxi_edges if edge.node_begin in rows and edge.node_end in rows
+        ]
+        edge_start = np.array([rows[edge.node_begin] for edge in taxi_edges], dtype=np.int32)
+        edge_end = np.array([rows[edge.node_end] for edge in taxi_edges], dtype=np.int32)
+        edge_flags = np.array(
+            [
+                (EDGE_RUNWAY if edge.is_runway else 0) | (EDGE_ONE_WAY if edge.one_way else 0)
+                for edge in taxi_edges
+            ],
+            dtype=np.uint8,
+        )
+        runway_type = strings.add("runway")
+        taxiway_type = strings.add("taxiway")
+        edge_type = np.where((edge_flags & EDGE_RUNWAY) != 0, runway_type, taxiway_type)
+
+        on_runway = (edge_flags & EDGE_RUNWAY) != 0
+        node_flags[edge_start[on_runway]] |= NODE_RUNWAY
+        node_flags[edge_end[on_runway]] |= NODE_RUNWAY
+        node_type = np.select(
+            [
+                (node_flags & NODE_HOLD_SHORT) != 0,
+                (node_flags & NODE_RUNWAY) != 0,
+            ],
+            [strings.add("hold_short"), runway_type],
+            strings.add("intersection"),
+        )
+
+        graph = GroundGraph(
+            node_ids,
+            latitudes,
+            longitudes,
+            edge_start,
+            edge_end,
+            haversine_m(
+                latitudes[edge_start],
+                longitudes[edge_start],
+                latitudes[edge_end],
+                longitudes[edge_end],
+            ),
+            names=strings.names,
+            node_flags=node_flags,
+            node_name=node_name,
+            node_runway=node_runway,
+            node_type=node_type,
+            edge_name=[strings.add(edge.name) for edge in taxi_edges],
+            edge_type=edge_type,
+            edge_width=[strings.add(edge.width_code) for edge in taxi_edges],
+            edge_flags=edge_flags,
+        )
+
+        index = graph.spatial_index
+        for parking in data.parking_positions:
+            nearest = index.nearest_node(
+                parking.latitude, parking.longitude, PARKING_NODE_MAX_DISTANCE_M
+            )
+            if nearest is not None:
+                graph.node_flags[nearest[0]] |= NODE_PARKING
+        return graph
+
+    @staticmethod
+    def from_taxiway_graph(taxiway_graph: "TaxiwayGraph") -> "GroundGraph[str]":
+        """Build a graph from a navigation TaxiwayGraph.
+
+        A pair of opposite directed edges becomes one two-way edge; an edge
+        without its reverse becomes a one-way edge. Edge order follows the
+        first direction of each pair in the taxiway graph's iteration order.
+
+        Args:
+            taxiway_graph: Taxiway graph with string node IDs
+
+        Returns:
+            Built graph
+        """
+        strings = _StringTable()
+        node_ids = list(taxiway_graph.nodes)
+        rows = {node_id: row for row, node_id in enumerate(node_ids)}
+        nodes = list(taxiway_graph.nodes.values())
+
+        node_flags = []
+        for node in nodes:
+            flags = 0
+            if node.node_type == "runway":
+                flags |= NODE_RUNWAY
+            elif node.node_type == "hold_short":
+                flags |= NODE_HOLD_SHORT
+            elif node.node_type in ("gate", "parking") or node.node_type.startswith("parking_"):
+                flags |= NODE_PARKING
+            node_flags.append(flags)
+
+        segments = pair_directed_edges(
+            edge for edges in taxiway_graph.edges.values() for edge in edges
+        )
+        edge_flags = [
+            (EDGE_ONE_WAY if one_way else 0) | (EDGE_RUNWAY if edge.edge_type == "runway" else 0)
+            for edge, one_way in segments
+        ]
+
+        return GroundGraph(
+            node_ids,
+            [node.position.z for node in nodes],
+            [node.position.x for node in nodes],
+            [rows[edge.from_node] for edge, _ in segments],
+            [rows[edge.to_node] for edge, _ in segments],
+            [edge.distance_m for edge, _ in segments],
+            names=strings.names,
+            node_flags=node_flags,
+            node_name=[strings.add(node.name) for node in nodes],
+            node_type=[strings.add(node.node_type) for node in nodes],
+            edge_name=[strings.add(edge.name) for edge, _ in segments],
+            edge_type=[strings.add(edge.edge_type) for edge, _ in segments],
+            edge_flags=edge_flags,
+        )
+
+    @property
+    def node_count(self) -> int:
+        """Get the number of nodes."""
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Get the number of edges."""
+        return len(self.edge_start)
+
+    @property
+    def nbytes(self) -> int:
+        """Get the memory used by the arrays in bytes."""
+        arrays = [value for value in vars(self).values() if isinstance(value, np.ndarray)]
+        return sum(array.nbytes for array in arrays)
+
+    @property
+    def spatial_index(self) -> GroundSpatialIndex:
+        """Get the spatial index over nodes and edges (built on first use).
+
+        Node and edge indices are graph rows and edge numbers.
+        """
+        if self._spatial_index is None:
+            self._spatial_index = GroundSpatialIndex(
+                self.latitudes, self.longitudes, self.edge_start, self.edge_end
+            )
+        return self._spatial_index
+
+    def row(self, node_id: NodeId) -> int:
+        """Get the row of a source node ID.
+
+        Args:
+            node_id: Source node ID
+
+        Returns:
+            Row number
+
+        Raises:
+            KeyError: If the node is not in the graph
+        """
+        return self._rows[node_id]
+
+    def name_id(self, name: str) -> int:
+        """Get the ID of a string.
+
+        Args:
+            name: String to look up
+
+        Returns:
+            String ID, or -1 if no node or edge uses it
+        """
+        return self._name_ids.get(name, -1)
+
+    def neighbors(self, row: int) -> npt.NDArray[np.int32]:
+        """Get the rows reachable from a node in one edge.
+
+        Args:
+            row: Node row
+
+        Returns:
+            Neighbor rows
+        """
+        return self.adj_node[self.indptr[row] : self.indptr[row + 1]]
+
+    def out_edges(self, row: int) -> npt.NDArray[np.int32]:
+        """Get the edges that can be taxied away from a node.
+
+        Args:
+            row: Node row
+
+        Returns:
+            Edge numbers, aligned with neighbors(row)
+        """
+        return self.adj_edge[self.indptr[row] : self.indptr[row + 1]]
+
+    def incident_edges(self, row: int) -> list[int]:
+        """Get the edges touching a node, whatever their direction.
+
+        Args:
+            row: Node row
+
+        Returns:
+            Edge numbers starting or ending at the node
+        """
+        if self._incident_lists is None:
+            incident: list[list[int]] = [[] for _ in range(self.node_count)]
+            for edge, (start, end) in enumerate(
+                zip(self.edge_start.tolist(), self.edge_end.tolist(), strict=True)
+            ):
+                incident[start].append(edge)
+                if end != start:
+                    incident[end].append(edge)
+            self._incident_lists = incident
+        return self._incident_lists[row]
+
+    def edge_names_at(self, row: int, include_runways: bool = False) -> list[str]:
+        """Get the names of the named edges touching a node.
+
+        Args:
+            row: Node row
+            include_runways: Include runway edges
+
+        Returns:
+            Unique names in edge order
+        """
+        touching = np.flatnonzero((self.edge_start == row) | (self.edge_end == row))
+        if not include_runways:
+            touching = touching[(self.edge_flags[touching] & EDGE_RUNWAY) == 0]
+        names = [self.names[i] for i in self.edge_name[touching].tolist() if i]
+        return list(dict.fromkeys(names))
+
+    def runway_edge_mask(self, runway_ids: Iterable[str] | None = None) -> npt.NDArray[np.bool_]:
+        """Get a mask of runway edges.
+
+        Args:
+            runway_ids: Runway identifiers to match ("27" matches an edge
+                named "09/27"); None matches every runway edge
+
+        Returns:
+            Boolean array over edges
+        """
+        mask: npt.NDArray[np.bool_] = (self.edge_flags & EDGE_RUNWAY) != 0
+        if runway_ids is None:
+            return mask
+        matching = self._matching_name_ids(runway_ids)
+        result: npt.NDArray[np.bool_] = mask & np.isin(self.edge_name, matching)
+        return result
+
+    def hold_short_rows(self, runway_id: str | None = None) -> npt.NDArray[np.int64]:
+        """Get the hold short nodes, optionally for one runway.
+
+        Args:
+            runway_id: Runway identifier ("27" matches "09/27"), or None
+
+        Returns:
+            Node rows
+        """
+        mask = (self.node_flags & NODE_HOLD_SHORT) != 0
+        if runway_id is not None:
+            mask &= np.isin(self.node_runway, self._matching_name_ids([runway_id]))
+        return np.flatnonzero(mask)
+
+    def routing_costs(
+        self, avoid_runways: bool = True, closed_runways: Iterable[str] = ()
+    ) -> npt.NDArray[np.float64]:
+        """Get the routing cost of each edge.
+
+        Args:
+            avoid_runways: Add RUNWAY_PENALTY_M to runway edges
+            closed_runways: Runway identifiers whose edges cannot be used
+
+        Returns:
+            Cost per edge in meters, inf for closed edges
+        """
+        costs = self.edge_length_m.copy()
+        if avoid_runways:
+            costs[(self.edge_flags & EDGE_RUNWAY) != 0] += RUNWAY_PENALTY_M
+        closed = list(closed_runways)
+        if closed:
+            costs[self.runway_edge_mask(closed)] = math.inf
+        return costs
+
+    def adjacency(self, costs: npt.NDArray[np.float64]) -> tuple[AdjacencyLists, AdjacencyLists]:
+        """Build per-node adjacency lists for search code.
+
+        Args:
+            costs: Cost per edge (see routing_costs()); inf edges are left out
+
+        Returns:
+            Tuple of (forward, reverse) lists of (row, cost) pairs; reverse
+            row u lists (v, cost) for every direction v -> u
+        """
+        nodes = self.node_count
+        direction_costs = costs[self.adj_edge]
+        sources = np.repeat(np.arange(nodes, dtype=np.int32), np.diff(self.indptr))
+        usable = np.isfinite(direction_costs)
+        forward: AdjacencyLists = [[] for _ in range(nodes)]
+        reverse: AdjacencyLists = [[] for _ in range(nodes)]
+        for source, target, cost in zip(
+            sources[usable].tolist(),
+            self.adj_node[usable].tolist(),
+            direction_costs[usable].tolist(),
+            strict=True,
+        ):
+            forward[source].append((target, cost))
+            reverse[target].append((source, cost))
+        return forward, reverse
+
+    def shortest_path(
+        self,
+        start: int,
+        goals: Iterable[int],
+        costs: npt.NDArray[np.float64] | None = None,
+    ) -> list[int] | None:
+        """Find the cheapest path from a node to the nearest of some goals.
+
+        Args:
+            start: Start row
+            goals: Goal rows
+            costs: Cost per edge (default: routing_costs())
+
+        Returns:
+            Rows from start to a goal, or None if no goal is reachable
+        """
+        goal_set = set(np.asarray(list(goals), dtype=np.int64).tolist())
+        if not goal_set:
+            return None
+        if costs is None:
+            costs = self.routing_costs()
+        if self._adjacency_lists is None:
+            self._adjacency_lists = (
+                [self.neighbors(row).tolist() for row in range(self.node_count)],
+                [self.out_edges(row).tolist() for row in range(self.node_count)],
+            )
+        neighbors, out_edges = self._adjacency_lists
+        edge_costs = costs.tolist()
+
+        best = {start: 0.0}
+        previous: dict[int, int] = {}
+        heap = [(0.0, start)]
+        while heap:
+            cost, row = heapq.heappop(heap)
+            if row in goal_set:
+                path = [row]
+                while row in previous:
+                    row = previous[row]
+                    path.append(row)
+                path.reverse()
+                return path
+            if cost > best[row]:
+                continue
+            for neighbor, edge in zip(neighbors[row], out_edges[row], strict=True):
+                new_cost = cost + edge_costs[edge]
+                if new_cost < best.get(neighbor, math.inf):
+                    best[neighbor] = new_cost
+                    previous[neighbor] = row
+                    heapq.heappush(heap, (new_cost, neighbor))
+        return None
+
+    def path_names(self, path: Sequence[int]) -> list[str]:
+        """Get the taxiway and runway names along a path.
+
+        Args:
+            path: Node rows
+
+        Returns:
+            Names in order, without consecutive repeats or unnamed edges
+        """
+        names: list[str] = []
+        for row, next_row in zip(path, path[1:], strict=False):
+            edges = self.out_edges(row)[self.neighbors(row) == next_row]
+            if not len(edges):
+                continue
+            name = self.names[int(self.edge_name[edges[0]])]
+            if name and (not names or names[-1] != name):
+                names.append(name)
+        return names
+
+    def _matching_name_ids(self, runway_ids: Iterable[str]) -> list[int]:
+        """Get the IDs of strings naming any of the runways."""
+        wanted = set(runway_ids)
+        return [
+            i
+            for i, name in enumerate(self.names)
+            if name and (name in wanted or any(part in wanted for part in name.split("/")))
+        ]
+
+
+def pair_directed_edges(edges: Iterable[_Directed]) -> list[tuple[_Directed, bool]]:
+    """Merge opposite directed edges into two-way segments.
+
+    Args:
+        edges: Directed edges with from_node and to_node
+
+    Returns:
+        (first direction, one_way) per segment, in order of first direction
+    """
+    segments: list[list] = []
+    pending: dict[tuple[Hashable, Hashable], int] = {}
+    for edge in edges:
+        reverse = pending.pop((edge.to_node, edge.from_node), None)
+        if reverse is not None:
+            segments[reverse][1] = False
+            continue
+        pending[edge.from_node, edge.to_node] = len(segments)
+        segments.append([edge, True])
+    return [(edge, one_way) for edge, one_way in segments]
+
+
+def _array(values: npt.ArrayLike | None, length: int, dtype: type) -> npt.NDArray:
+    """Convert optional per-item values to an array, zeros if None."""
+    if values is None:
+        return np.zeros(length, dtype=dtype)
+    return np.asarray(values, dtype=dtype)
+
+
+_graphs: dict[str, tuple[weakref.ref["GatewayAirportData"], GroundGraph[int]]] = {}
+_graphs_lock = threading.Lock()
+
+
+def get_ground_graph(data: "GatewayAirportData") -> GroundGraph[int]:
+    """Get the shared ground graph of an airport, building it once.
+
+    Graphs are cached per ICAO code for as long as the airport data object
+    they were built from is alive, so every consumer of the same loaded
+    airport shares one graph.
+
+    Args:
+        data: Gateway airport data
+
+    Returns:
+        Shared graph
+
+    Examples:
+        >>> graph = get_ground_graph(loader.get_airport("KPAO"))
+    """
+    with _graphs_lock:
+        cached = _graphs.get(data.icao)
+        if cached is not None and cached[0]() is data:
+            return cached[1]
+
+    graph = GroundGraph.from_gateway_data(data)
+    logger.info(
+        "Built ground graph for %s: %d nodes, %d edges, %d KB",
+        data.icao,
+        graph.node_count,
+        graph.edge_count,
+        graph.nbytes // 1024,
+    )
+    with _graphs_lock:
+        cached = _graphs.get(data.icao)
+        if cached is not None and cached[0]() is data:
+            return cached[1]
+        _graphs[data.icao] = (weakref.ref(data), graph)
+    return graph
+
+
+def clear_ground_graphs() -> None:
+    """Drop all shared ground graphs."""
+    with _graphs_lock:
+        _graphs.clear()
@@ -0,0 +1,436 @@
+"""Spatial index over airport taxi nodes and edge segments.
+
+Answers nearest-node, nearest-edge and within-radius queries for the
+taxiway graphs without scanning every node and edge. Positions are
+projected once into a local metric frame (meters east/north of the
+airport reference point), and nodes and segments are bucketed in a
+uniform grid stored as sorted NumPy arrays.
+
+Typical usage:
+    from airborne.airports.ground_index import GroundSpatialIndex
+
+    index = GroundSpatialIndex(node_lats, node_lons, edge_starts, edge_ends)
+    result = index.nearest_edge(37.461, -122.115)
+    if result:
+        edge, distance_m = result
+"""
+
+import math
+from collections.abc import Callable
+
+import numpy as np
+import numpy.typing as npt
+
+# Meters per degree of latitude (and of longitude at the equator)
+METERS_PER_DEGREE = 111_320.0
+
+
+def _gather(
+    offsets: npt.NDArray[np.int64], starts: npt.NDArray[np.int64], ends: npt.NDArray[np.int64]
+) -> npt.NDArray[np.int64]:
+    """Concatenate the item ranges offsets[start]:offsets[end] of several cell runs."""
+    first = offsets[starts]
+    counts = offsets[ends] - first
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    run_starts = np.repeat(first - np.cumsum(counts) + counts, counts)
+    result: npt.NDArray[np.int64] = run_starts + np.arange(total)
+    return result
+
+
+class _Grid:
+    """Items bucketed by the grid cells they touch (CSR over sorted cell keys)."""
+
+    def __init__(
+        self,
+        cell_x: npt.NDArray[np.int64],
+        cell_y: npt.NDArray[np.int64],
+        items: npt.NDArray[np.int64],
+        rows: int,
+    ) -> None:
+        keys = cell_x * rows + cell_y
+        order = np.lexsort((items, keys))
+        keys = keys[order]
+        self.items = items[order]
+        self.keys, starts = np.unique(keys, return_index=True)
+        self.offsets = np.append(starts, len(keys)).astype(np.int64)
+        self.rows = rows
+
+    def query(self, x0: int, x1: int, y0: int, y1: int) -> npt.NDArray[np.int64]:
+        """Get the sorted, unique items in cells [x0, x1] x [y0, y1]."""
+        columns = np.arange(x0, x1 + 1, dtype=np.int64) * self.rows
+        starts = np.searchsorted(self.keys, columns + y0)
+        ends = np.searchsorted(self.keys, columns + y1, side="right")
+        result: npt.NDArray[np.int64] = np.unique(self.items[_gather(self.offsets, starts, ends)])
+        return result
+
+
+class GroundSpatialIndex:
+    """Grid index over taxi nodes and edge segments in local meters.
+
+    Nodes are stored in the cell containing them; each edge segment is
+    stored in every cell it passes through. Queries only examine the
+    cells around the query point and compute exact point-to-node or
+    point-to-segment distances for those candidates with NumPy.
+
+    Nodes and edges are identified by their position in the arrays the
+    index was built from; graphs map them back to their own IDs.
+
+    Attributes:
+        cell_size_m: Grid cell size in meters
+        node_count: Number of indexed nodes
+        edge_count: Number of indexed edges
+
+    Examples:
+        >>> index = GroundSpatialIndex([37.46, 37.47], [-122.11, -122.12], [0], [1])
+        >>> index.nearest_node(37.461, -122.111)
+        (0, 141.4...)
+    """
+
+    def __init__(
+        self,
+        node_lats: npt.ArrayLike,
+        node_lons: npt.ArrayLike,
+        edge_starts: npt.ArrayLike = (),
+        edge_ends: npt.ArrayLike = (),
+        cell_size_m: float = 50.0,
+    ) -> None:
+        """Build the index.
+
+        Args:
+            node_lats: Node latitudes in degrees
+            node_lons: Node longitudes in degrees
+            edge_starts: Start node index of each edge
+            edge_ends: End node index of each edge
+            cell_size_m: Grid cell size in meters
+        """
+        lats = np.asarray(node_lats, dtype=np.float64)
+        lons = np.asarray(node_lons, dtype=np.float64)
+        starts = np.asarray(edge_starts, dtype=np.int64)
+        ends = np.asarray(edge_ends, dtype=np.int64)
+
+        self.cell_size_m = cell_size_m
+        self.node_count = len(lats)
+        self.edge_count = len(starts)
+
+        self._ref_lat = float(lats.mean()) if self.node_count else 0.0
+        self._ref_lon = float(lons.mean()) if self.node_count else 0.0
+        self._lon_scale = METERS_PER_DEGREE * math.cos(math.radians(self._ref_lat))
+
+        self.node_x, self.node_y = self._project_arrays(lats, lons)
+        self.edge_ax = self.node_x[starts]
+        self.edge_ay = self.node_y[starts]
+        self.edge_dx = self.node_x[ends] - self.edge_ax
+        self.edge_dy = self.node_y[ends] - self.edge_ay
+        self.edge_length_sq = self.edge_dx**2 + self.edge_dy**2
+
+        # Grid origin and size cover every node (edges lie between nodes)
+        self._min_x = float(self.node_x.min()) if self.node_count else 0.0
+        self._min_y = float(self.node_y.min()) if self.node_count else 0.0
+        self._columns = self._cell(float(self.node_x.max()) if self.node_count else 0.0, True) + 1
+        self._rows = self._cell(float(self.node_y.max()) if self.node_count else 0.0, False) + 1
+
+        node_ids = np.arange(self.node_count, dtype=np.int64)
+        self._node_grid = _Grid(
+            self._cells(self.node_x, True), self._cells(self.node_y, False), node_ids, self._rows
+        )
+
+        # Sample each segment every half cell, so every cell it crosses is
+        # within half a cell of an indexed sample
+        steps = np.ceil(np.sqrt(self.edge_length_sq) / (cell_size_m / 2)).astype(np.int64) + 1
+        edge_ids = np.repeat(np.arange(self.edge_count, dtype=np.int64), steps)
+        sample = np.arange(len(edge_ids)) - np.repeat(np.cumsum(steps) - steps, steps)
+        t = sample / np.maximum(np.repeat(steps - 1, steps), 1)
+        self._edge_grid = _Grid(
+            self._cells(self.edge_ax[edge_ids] + t * self.edge_dx[edge_ids], True),
+            self._cells(self.edge_ay[edge_ids] + t * self.edge_dy[edge_ids], False),
+            edge_ids,
+            self._rows,
+        )
+
+        self._extent_m = math.hypot(self._columns * cell_size_m, self._rows * cell_size_m)
+
+    def project(self, latitude: float, longitude: float) -> tuple[float, float]:
+        """Project a position into the index's local frame.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+
+        Returns:
+            (east, north) in meters from the reference point
+        """
+        dlon = (longitude - self._ref_lon + 180.0) % 360.0 - 180.0
+        return dlon * self._lon_scale, (latitude - self._ref_lat) * METERS_PER_DEGREE
+
+    def nearest_node(
+        self, latitude: float, longitude: float, max_distance_m: float = math.inf
+    ) -> tuple[int, float] | None:
+        """Find the nearest node.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            max_distance_m: Maximum distance in meters
+
+        Returns:
+            (node index, distance in meters), or None if no node is within
+            max_distance_m
+        """
+        return self._nearest(latitude, longitude, max_distance_m, True, None)
+
+    def nodes_within(
+        self, latitude: float, longitude: float, radius_m: float
+    ) -> list[tuple[int, float]]:
+        """Find nodes within a radius.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            radius_m: Radius in meters
+
+        Returns:
+            (node index, distance in meters) pairs sorted by distance
+        """
+        return self._within(latitude, longitude, radius_m, True, None)
+
+    def nearest_edge(
+        self,
+        latitude: float,
+        longitude: float,
+        max_distance_m: float = math.inf,
+        mask: npt.NDArray[np.bool_] | None = None,
+    ) -> tuple[int, float] | None:
+        """Find the nearest edge segment.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            max_distance_m: Maximum distance in meters
+            mask: Optional per-edge filter (only True edges are considered)
+
+        Returns:
+            (edge index, distance in meters), or None if no edge is within
+            max_distance_m
+        """
+        return self._nearest(latitude, longitude, max_distance_m, False, mask)
+
+    def edges_within(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_m: float,
+        mask: npt.NDArray[np.bool_] | None = None,
+    ) -> list[tuple[int, float]]:
+        """Find edge segments within a radius.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            radius_m: Radius in meters
+            mask: Optional per-edge filter (only True edges are considered)
+
+        Returns:
+            (edge index, distance in meters) pairs sorted by distance
+        """
+        return self._within(latitude, longitude, radius_m, False, mask)
+
+    def nearest_node_by(
+        self,
+        latitude: float,
+        longitude: float,
+        distance: Callable[[int], float],
+        max_distance_m: float = math.inf,
+        tolerance: float = 0.01,
+    ) -> tuple[int, float] | None:
+        """Find the nearest node under a caller's own distance function.
+
+        For graphs that keep their historical distance approximations: the
+        index narrows the search to nodes whose local distance is within
+        ``tolerance`` of the best candidate, then ``distance`` picks the
+        winner. ``distance`` must never be less than the index's distance
+        divided by (1 + tolerance).
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            distance: Distance in meters to a node index
+            max_distance_m: Maximum distance (exclusive) in meters
+            tolerance: Relative disagreement allowed between the metrics
+
+        Returns:
+            (node index, distance), or None if no node is closer than
+            max_distance_m; ties go to the lowest index
+        """
+        return self._nearest_by(
+            latitude, longitude, distance, max_distance_m, tolerance, True, None
+        )
+
+    def nearest_edge_by(
+        self,
+        latitude: float,
+        longitude: float,
+        distance: Callable[[int], float],
+        max_distance_m: float = math.inf,
+        tolerance: float = 0.01,
+        mask: npt.NDArray[np.bool_] | None = None,
+    ) -> tuple[int, float] | None:
+        """Find the nearest edge under a caller's own distance function.
+
+        See nearest_node_by().
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            distance: Distance in meters to an edge index
+            max_distance_m: Maximum distance (exclusive) in meters
+            tolerance: Relative disagreement allowed between the metrics
+            mask: Optional per-edge filter (only True edges are considered)
+
+        Returns:
+            (edge index, distance), or None if no edge is closer than
+            max_distance_m; ties go to the lowest index
+        """
+        return self._nearest_by(
+            latitude, longitude, distance, max_distance_m, tolerance, False, mask
+        )
+
+    def _nearest_by(
+        self,
+        latitude: float,
+        longitude: float,
+        distance: Callable[[int], float],
+        max_distance_m: float,
+        tolerance: float,
+        nodes: bool,
+        mask: npt.NDArray[np.bool_] | None,
+    ) -> tuple[int, float] | None:
+        """Refine an index nearest query with the caller's distance function."""
+        first = self._nearest(latitude, longitude, math.inf, nodes, mask)
+        if first is None:
+            return None
+
+        # Anything closer than the first hit (or the limit) under the caller's
+        # metric is within this radius under the index metric
+        radius = min(distance(first[0]), max_distance_m) * (1.0 + tolerance) + 1e-6
+        candidates = self._within(latitude, longitude, radius, nodes, mask)
+
+        best: tuple[int, float] | None = None
+        for item in sorted(index for index, _ in candidates):
+            item_distance = distance(item)
+            if item_distance < (best[1] if best else max_distance_m):
+                best = (item, item_distance)
+        return best
+
+    def _nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        max_distance_m: float,
+        nodes: bool,
+        mask: npt.NDArray[np.bool_] | None,
+    ) -> tuple[int, float] | None:
+        """Search growing boxes until the best hit is inside the searched radius."""
+        x, y = self.project(latitude, longitude)
+        grid = self._node_grid if nodes else self._edge_grid
+        distances = self._node_distances if nodes else self._edge_distances
+        if not len(grid.items):
+            return None
+
+        # Beyond this radius the box covers the whole grid
+        outside = max(self._min_x - x, x - self._min_x - self._columns * self.cell_size_m, 0.0)
+        outside = max(outside, self._min_y - y, y - self._min_y - self._rows * self.cell_size_m)
+        limit = outside + self._extent_m
+
+        radius = min(self.cell_size_m, max_distance_m)
+        while True:
+            candidates = self._candidates(grid, x, y, radius, mask)
+            if len(candidates):
+                found = distances(x, y, candidates)
+                best = int(np.argmin(found))
+                # Once the box covers the whole grid the best hit is final
+                if found[best] <= radius or (radius >= limit and found[best] <= max_distance_m):
+                    return int(candidates[best]), float(found[best])
+            if radius >= max_distance_m or radius >= limit:
+                return None
+            radius = min(radius * 2, max_distance_m, limit)
+
+    def _within(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_m: float,
+        nodes: bool,
+        mask: npt.NDArray[np.bool_] | None,
+    ) -> list[tuple[int, float]]:
+        """Get items within a radius, sorted by distance."""
+        x, y = self.project(latitude, longitude)
+        grid = self._node_grid if nodes else self._edge_grid
+        distances = self._node_distances if nodes else self._edge_distances
+        candidates = self._candidates(grid, x, y, radius_m, mask)
+        if not len(candidates):
+            return []
+        found = distances(x, y, candidates)
+        inside = np.flatnonzero(found <= radius_m)
+        order = inside[np.argsort(found[inside], kind="stable")]
+        return list(zip(candidates[order].tolist(), found[order].tolist(), strict=True))
+
+    def _candidates(
+        self, grid: _Grid, x: float, y: float, radius: float, mask: npt.NDArray[np.bool_] | None
+    ) -> npt.NDArray[np.int64]:
+        """Get items stored in the cells that a circle could touch."""
+        # Segments are indexed by samples up to half a cell from the segment
+        margin = radius + (self.cell_size_m / 2 if grid is self._edge_grid else 0.0)
+        x0 = max(self._cell(x - margin, True), 0)
+        x1 = min(self._cell(x + margin, True), self._columns - 1)
+        y0 = max(self._cell(y - margin, False), 0)
+        y1 = min(self._cell(y + margin, False), self._rows - 1)
+        if x0 > x1 or y0 > y1:
+            return np.empty(0, dtype=np.int64)
+        candidates = grid.query(x0, x1, y0, y1)
+        if mask is not None:
+            candidates = candidates[mask[candidates]]
+        return candidates
+
+    def _node_distances(
+        self, x: float, y: float, nodes: npt.NDArray[np.int64]
+    ) -> npt.NDArray[np.float64]:
+        """Distances from a local point to nodes."""
+        result: npt.NDArray[np.float64] = np.hypot(self.node_x[nodes] - x, self.node_y[nodes] - y)
+        return result
+
+    def _edge_distances(
+        self, x: float, y: float, edges: npt.NDArray[np.int64]
+    ) -> npt.NDArray[np.float64]:
+        """Distances from a local point to edge segments."""
+        ax = self.edge_ax[edges]
+        ay = self.edge_ay[edges]
+        dx = self.edge_dx[edges]
+        dy = self.edge_dy[edges]
+        length_sq = self.edge_length_sq[edges]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(length_sq > 1e-12, ((x - ax) * dx + (y - ay) * dy) / length_sq, 0.0)
+        t = np.clip(t, 0.0, 1.0)
+        result: npt.NDArray[np.float64] = np.hypot(ax + t * dx - x, ay + t * dy - y)
+        return result
+
+    def _project_arrays(
+        self, lats: npt.NDArray[np.float64], lons: npt.NDArray[np.float64]
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Project arrays of positions into the local frame."""
+        dlon = (lons - self._ref_lon + 180.0) % 360.0 - 180.0
+        return dlon * self._lon_scale, (lats - self._ref_lat) * METERS_PER_DEGREE
+
+    def _cell(self, value: float, east: bool) -> int:
+        """Get the grid column (east) or row of a local coordinate."""
+        origin = self._min_x if east else self._min_y
+        return math.floor((value - origin) / self.cell_size_m)
+
+    def _cells(self, values: npt.NDArray[np.float64], east: bool) -> npt.NDArray[np.int64]:
+        """Get the grid columns (east) or rows of local coordinates."""
+        origin = self._min_x if east else self._min_y
+        cells: npt.NDArray[np.int64] = np.floor((values - origin) / self.cell_size_m).astype(
+            np.int64
+        )
+        return cells
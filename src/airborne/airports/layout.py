@@ -19,6 +19,7 @@ import math
 from dataclasses import dataclass, field
 
 from airborne.airports.database import AirportDatabase
+from airborne.airports.ground_graph import get_ground_graph
 from airborne.physics.vectors import Vector3
 from airborne.services.atc.gateway_loader import GatewayAirportData
 
@@ -350,10 +351,12 @@ class AirportLayoutLoader:
             )
 
         # Find hold short points from taxi nodes
+        graph = get_ground_graph(data)
         for node in data.taxi_nodes.values():
             if node.is_hold_short and node.on_runway:
                 # Find which taxiway this node is on
-                taxiway_name = self._find_taxiway_for_node(node.id, data)
+                taxiway_names = graph.edge_names_at(graph.row(node.id))
+                taxiway_name = taxiway_names[0] if taxiway_names else ""
 
                 layout.hold_short_points.append(
                     LayoutHoldShort(
@@ -374,22 +377,6 @@ class AirportLayoutLoader:
 
         return layout
 
-    def _find_taxiway_for_node(self, node_id: int, data: GatewayAirportData) -> str:
-        """Find which taxiway a node belongs to.
-
-        Args:
-            node_id: Node ID to search for.
-            data: Gateway airport data.
-
-        Returns:
-            Taxiway name or empty string if not found.
-        """
-        for edge in data.taxi_edges:
-            if edge.node_begin == node_id or edge.node_end == node_id:
-                if edge.name and not edge.is_runway:
-                    return edge.name
-        return ""
-
     def _generate_basic(self, icao: str, db: AirportDatabase) -> AirportLayout:
         """Generate basic airport layout from runway data.
 
@@ -27,6 +27,9 @@ from airborne.physics.vectors import Vector3
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever generated output changes, so cached layouts are regenerated
+GENERATOR_VERSION = 1
+
 
 class ParkingGenerator:
     """Generates parking positions based on airport size and configuration.
@@ -0,0 +1,340 @@
+"""Runway geometry in a local metric frame.
+
+Runway pavement, protected zones and hold lines are projected once, when
+an airport's runways are loaded, into meters east/north of the airport
+reference point and kept as NumPy arrays. One query measures a position
+against every runway at once, so runway incursion warnings, hold short
+checks and position announcements share a single cheap evaluation per
+frame instead of each looping over the runways.
+
+Each runway is a rectangle along its centerline, as wide as the runway.
+The protected zone extends from the pavement to the hold lines, on both
+sides and beyond both ends. With the airport's ground graph, hold line
+distances are measured from the graph's hold short nodes, and the
+aircraft's current edge (or, without one, the runway edges under it)
+tells whether it is on a runway even where the pavement is not modeled.
+
+Typical usage:
+    from airborne.airports.runway_geometry import RunwayGeometry
+
+    geometry = RunwayGeometry.from_runways(airport_db.get_runways("KPAO"))
+    geometry.set_ground_graph(ground_graph)
+    proximity = geometry.query(37.461, -122.115, edge=tracker.current_edge)
+    if proximity.in_protected_zone.any():
+        ...
+"""
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from airborne.airports.ground_graph import EDGE_RUNWAY, NODE_HOLD_SHORT, GroundGraph
+from airborne.airports.ground_index import METERS_PER_DEGREE
+
+if TYPE_CHECKING:
+    from airborne.airports.database import Runway
+    from airborne.airports.layout import LayoutRunway
+
+# Distance from a runway edge of the taxi network that counts as on the runway
+ON_RUNWAY_EDGE_M = 10.0
+
+# Hold lines beyond the runway edge when the ground graph doesn't place them
+# (generated layouts put hold short points this far off the runway edge)
+DEFAULT_HOLD_MARGIN_M = 10.0
+
+FEET_TO_METERS = 0.3048
+
+
+@dataclass
+class RunwayQuery:
+    """A position measured against every runway.
+
+    Arrays have one value per runway, in RunwayGeometry order.
+
+    Attributes:
+        centerline_m: Distance to the runway centerline in meters
+        distance_m: Distance to the runway pavement in meters (0 on it)
+        hold_line_m: Distance to the hold lines in meters (0 past them)
+        threshold_m: Distance to the first end (threshold) in meters
+        on_runway: Whether the position is on the runway
+        in_protected_zone: Whether the position is past the hold lines
+    """
+
+    centerline_m: npt.NDArray[np.float64]
+    distance_m: npt.NDArray[np.float64]
+    hold_line_m: npt.NDArray[np.float64]
+    threshold_m: npt.NDArray[np.float64]
+    on_runway: npt.NDArray[np.bool_]
+    in_protected_zone: npt.NDArray[np.bool_]
+
+    def nearest(self) -> int | None:
+        """Get the runway with the nearest pavement.
+
+        Returns:
+            Runway index, or None if there are no runways
+        """
+        if not len(self.distance_m):
+            return None
+        return int(np.argmin(self.distance_m))
+
+
+class RunwayGeometry:
+    """Runway rectangles and protected zones for vectorized proximity queries.
+
+    Attributes:
+        idents: Identifiers of both ends of each runway ("" if unknown)
+        names: Runway names (e.g., "10R/28L")
+        length_m: Runway lengths in meters
+        width_m: Runway widths in meters
+        hold_margin_m: Distance from the pavement to the hold lines in meters
+        ground_graph: Ground graph used for edge and hold line lookups
+
+    Examples:
+        >>> geometry = RunwayGeometry([("09", "27")], [37.5], [-122.01], [37.5], [-121.99], [30])
+        >>> proximity = geometry.query(37.5003, -122.0)
+        >>> round(float(proximity.distance_m[0]), 1)
+        18.4
+        >>> bool(proximity.in_protected_zone[0])
+        False
+    """
+
+    def __init__(
+        self,
+        idents: Sequence[tuple[str, str]],
+        start_lats: npt.ArrayLike,
+        start_lons: npt.ArrayLike,
+        end_lats: npt.ArrayLike,
+        end_lons: npt.ArrayLike,
+        widths_m: npt.ArrayLike,
+        hold_margin_m: float = DEFAULT_HOLD_MARGIN_M,
+    ) -> None:
+        """Project runways into the local frame.
+
+        Args:
+            idents: Identifiers of both ends of each runway
+            start_lats: Latitude of the first end (threshold) of each runway
+            start_lons: Longitude of the first end of each runway
+            end_lats: Latitude of the other end of each runway
+            end_lons: Longitude of the other end of each runway
+            widths_m: Width of each runway in meters
+            hold_margin_m: Distance from the pavement to the hold lines
+        """
+        self.idents = list(idents)
+        self.names = ["/".join(ident for ident in pair if ident) for pair in self.idents]
+        start_lat = np.asarray(start_lats, dtype=np.float64)
+        start_lon = np.asarray(start_lons, dtype=np.float64)
+        end_lat = np.asarray(end_lats, dtype=np.float64)
+        end_lon = np.asarray(end_lons, dtype=np.float64)
+
+        count = len(self.idents)
+        self._ref_lat = float((start_lat.sum() + end_lat.sum()) / (2 * count)) if count else 0.0
+        self._ref_lon = float((start_lon.sum() + end_lon.sum()) / (2 * count)) if count else 0.0
+        self._lon_scale = METERS_PER_DEGREE * math.cos(math.radians(self._ref_lat))
+
+        self._start_x, self._start_y = self.project_arrays(start_lat, start_lon)
+        end_x, end_y = self.project_arrays(end_lat, end_lon)
+        dx = end_x - self._start_x
+        dy = end_y - self._start_y
+        self.length_m = np.hypot(dx, dy)
+        safe_length = np.where(self.length_m > 0, self.length_m, 1.0)
+        self._dir_x = np.where(self.length_m > 0, dx / safe_length, 0.0)
+        self._dir_y = np.where(self.length_m > 0, dy / safe_length, 1.0)
+        self._half_length = self.length_m / 2
+        self.width_m = np.asarray(widths_m, dtype=np.float64)
+        self._half_width = self.width_m / 2
+        self.hold_margin_m = np.full(count, hold_margin_m)
+        self._default_hold_margin_m = hold_margin_m
+
+        self.ground_graph: GroundGraph | None = None
+        self._edge_runway = np.empty(0, dtype=np.int64)
+        self._runway_edges = np.empty(0, dtype=np.bool_)
+
+    @classmethod
+    def from_runways(cls, runways: Sequence["Runway"]) -> "RunwayGeometry":
+        """Build the geometry from airport database runways.
+
+        Args:
+            runways: Runways with both ends' coordinates and width in feet
+
+        Returns:
+            RunwayGeometry with one rectangle per runway
+        """
+        return cls(
+            [(runway.le_ident, runway.he_ident) for runway in runways],
+            [runway.le_latitude for runway in runways],
+            [runway.le_longitude for runway in runways],
+            [runway.he_latitude for runway in runways],
+            [runway.he_longitude for runway in runways],
+            [runway.width_ft * FEET_TO_METERS for runway in runways],
+        )
+
+    @classmethod
+    def from_layout(cls, runways: Sequence["LayoutRunway"]) -> "RunwayGeometry":
+        """Build the geometry from airport layout runways.
+
+        Layouts list each runway direction separately, so each becomes its
+        own rectangle starting at its threshold.
+
+        Args:
+            runways: Layout runways (positions x=lon, z=lat)
+
+        Returns:
+            RunwayGeometry with one rectangle per runway direction
+        """
+        return cls(
+            [(runway.id, "") for runway in runways],
+            [runway.threshold_pos.z for runway in runways],
+            [runway.threshold_pos.x for runway in runways],
+            [runway.end_pos.z for runway in runways],
+            [runway.end_pos.x for runway in runways],
+            [runway.width_m for runway in runways],
+        )
+
+    def __len__(self) -> int:
+        """Get the number of runways."""
+        return len(self.idents)
+
+    def project_arrays(
+        self, latitudes: npt.ArrayLike, longitudes: npt.ArrayLike
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Project positions into the local frame.
+
+        Args:
+            latitudes: Latitudes in degrees
+            longitudes: Longitudes in degrees
+
+        Returns:
+            (east, north) arrays in meters from the reference point
+        """
+        lats = np.asarray(latitudes, dtype=np.float64)
+        dlon = (np.asarray(longitudes, dtype=np.float64) - self._ref_lon + 180.0) % 360.0 - 180.0
+        return dlon * self._lon_scale, (lats - self._ref_lat) * METERS_PER_DEGREE
+
+    def runway_index(self, runway_id: str) -> int | None:
+        """Find the runway with an end identifier or name.
+
+        Args:
+            runway_id: Runway end ("27") or name ("09/27")
+
+        Returns:
+            Runway index, or None if not found
+        """
+        wanted = set(runway_id.split("/")) - {""}
+        for index, pair in enumerate(self.idents):
+            if wanted & set(pair):
+                return index
+        return None
+
+    def set_ground_graph(self, ground_graph: GroundGraph | None) -> None:
+        """Attach the airport's ground graph.
+
+        Maps runway edges to runways and moves each runway's hold lines to
+        the median distance of its hold short nodes from the pavement.
+
+        Args:
+            ground_graph: Airport ground graph, or None to detach
+        """
+        self.ground_graph = ground_graph
+        self.hold_margin_m[:] = self._default_hold_margin_m
+        if ground_graph is None:
+            self._edge_runway = np.empty(0, dtype=np.int64)
+            self._runway_edges = np.empty(0, dtype=np.bool_)
+            return
+
+        name_runway = np.array(
+            [self._name_runway(name) for name in ground_graph.names], dtype=np.int64
+        )
+        self._runway_edges = (ground_graph.edge_flags & EDGE_RUNWAY) != 0
+        self._edge_runway = np.where(
+            self._runway_edges, name_runway[ground_graph.edge_name], -1
+        ).astype(np.int64)
+
+        rows = np.flatnonzero(ground_graph.node_flags & NODE_HOLD_SHORT)
+        runways = name_runway[ground_graph.node_runway[rows]]
+        rows = rows[runways >= 0]
+        runways = runways[runways >= 0]
+        if not len(rows):
+            return
+        x, y = self.project_arrays(ground_graph.latitudes[rows], ground_graph.longitudes[rows])
+        _, distance = self._measure(x, y, runways)
+        for runway in np.unique(runways).tolist():
+            off_pavement = distance[(runways == runway) & (distance > 0)]
+            if len(off_pavement):
+                self.hold_margin_m[runway] = float(np.median(off_pavement))
+
+    def query(self, latitude: float, longitude: float, edge: int | None = None) -> RunwayQuery:
+        """Measure a position against every runway.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            edge: Number of the ground graph edge the aircraft is on, if
+                known; without it, runway edges near the position are
+                looked up in the graph's spatial index
+
+        Returns:
+            RunwayQuery with one value per runway
+        """
+        x, y = self.project_arrays(latitude, longitude)
+        centerline, distance = self._measure(x, y)
+
+        on_runway = distance <= 0.0
+        for runway in self._runways_under(latitude, longitude, edge):
+            on_runway[runway] = True
+        distance[on_runway] = 0.0
+
+        return RunwayQuery(
+            centerline_m=centerline,
+            distance_m=distance,
+            hold_line_m=np.maximum(distance - self.hold_margin_m, 0.0),
+            threshold_m=np.hypot(x - self._start_x, y - self._start_y),
+            on_runway=on_runway,
+            in_protected_zone=distance <= self.hold_margin_m,
+        )
+
+    def _measure(
+        self,
+        x: npt.NDArray[np.float64],
+        y: npt.NDArray[np.float64],
+        runways: npt.NDArray[np.int64] | slice = slice(None),
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Get (centerline, pavement) distances of local positions to runways."""
+        rx = x - self._start_x[runways]
+        ry = y - self._start_y[runways]
+        dir_x = self._dir_x[runways]
+        dir_y = self._dir_y[runways]
+        half_length = self._half_length[runways]
+        along = np.abs(rx * dir_x + ry * dir_y - half_length)
+        across = np.abs(rx * dir_y - ry * dir_x)
+        beyond_end = np.maximum(along - half_length, 0.0)
+        centerline: npt.NDArray[np.float64] = np.hypot(beyond_end, across)
+        pavement: npt.NDArray[np.float64] = np.hypot(
+            beyond_end, np.maximum(across - self._half_width[runways], 0.0)
+        )
+        return centerline, pavement
+
+    def _runways_under(self, latitude: float, longitude: float, edge: int | None) -> list[int]:
+        """Get the runways whose taxi network edges the aircraft is on."""
+        graph = self.ground_graph
+        if graph is None or not graph.edge_count:
+            return []
+        if edge is not None:
+            runway = int(self._edge_runway[edge])
+            return [runway] if runway >= 0 else []
+        edges = graph.spatial_index.edges_within(
+            latitude, longitude, ON_RUNWAY_EDGE_M, mask=self._runway_edges
+        )
+        runways = {int(self._edge_runway[edge]) for edge, _ in edges}
+        runways.discard(-1)
+        return sorted(runways)
+
+    def _name_runway(self, name: str) -> int:
+        """Get the runway index for a graph name, or -1."""
+        if not name:
+            return -1
+        index = self.runway_index(name)
+        return -1 if index is None else index
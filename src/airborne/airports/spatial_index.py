@@ -3,6 +3,10 @@
 Provides efficient spatial queries using a grid-based index.
 Optimizes O(n) queries to O(1) average case for radius searches.
 
+Each grid cell keeps its coordinates in contiguous NumPy arrays, so radius
+and nearest-neighbor queries compute distances for whole cells at once
+instead of one item at a time.
+
 Typical usage:
     from airborne.airports import SpatialIndex
 
@@ -11,19 +15,89 @@ Typical usage:
         index.insert(airport.position, airport)
 
     nearby = index.query_radius(position, radius_nm=50)
+    nearest = index.query_knn(position, k=5)
 """
 
 import logging
 import math
-from collections import defaultdict
+from collections.abc import Callable
 from typing import Any, TypeVar
 
+import numpy as np
+import numpy.typing as npt
+
 from airborne.physics.vectors import Vector3
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Earth radius in nautical miles
+EARTH_RADIUS_NM = 3440.065
+
+
+def haversine_distances_nm(
+    lat: float, lon: float, lats: npt.NDArray[np.float64], lons: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Great circle distances from one point to many (vectorized).
+
+    Args:
+        lat: Latitude of the reference point (degrees)
+        lon: Longitude of the reference point (degrees)
+        lats: Latitudes of the other points (degrees)
+        lons: Longitudes of the other points (degrees)
+
+    Returns:
+        Distances in nautical miles
+    """
+    lat1 = math.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlon = np.radians(lons - lon)
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    distances: npt.NDArray[np.float64] = (
+        2 * EARTH_RADIUS_NM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+    )
+    return distances
+
+
+class _Cell:
+    """Items of one grid cell with coordinates in contiguous arrays.
+
+    Inserts append to plain lists; the coordinate arrays are rebuilt on the
+    next query after a change, so bulk loading stays cheap.
+    """
+
+    __slots__ = ("items", "_lats", "_lons")
+
+    def __init__(self) -> None:
+        """Initialize empty cell."""
+        self.items: list[tuple[Vector3, Any]] = []
+        self._lats: npt.NDArray[np.float64] | None = None
+        self._lons: npt.NDArray[np.float64] | None = None
+
+    @property
+    def size(self) -> int:
+        """Number of items in the cell."""
+        return len(self.items)
+
+    def append(self, position: Vector3, data: Any) -> None:
+        """Append an item."""
+        self.items.append((position, data))
+        self._lats = self._lons = None
+
+    def remove_at(self, index: int) -> None:
+        """Remove the item at an index."""
+        del self.items[index]
+        self._lats = self._lons = None
+
+    def coordinates(self) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Get the (latitudes, longitudes) arrays of the cell's items."""
+        if self._lats is None or self._lons is None:
+            self._lats = np.fromiter((pos.z for pos, _ in self.items), np.float64, self.size)
+            self._lons = np.fromiter((pos.x for pos, _ in self.items), np.float64, self.size)
+        return self._lats, self._lons
+
 
 class SpatialIndex:
     """Grid-based spatial index for fast geographic queries.
@@ -33,7 +107,9 @@ class SpatialIndex:
 
     Performance:
         - Insert: O(1)
-        - Query radius: O(k) where k = cells overlapping query circle
+        - Query radius: O(k) where k = cells overlapping query circle,
+          with distances computed vectorized per query
+        - Query k-nearest: radius queries doubling until k items are found
         - Memory: O(n) where n = number of items
 
     Examples:
@@ -53,7 +129,7 @@ class SpatialIndex:
                           Recommended: 0.5-2.0 degrees.
         """
         self.cell_size_deg = cell_size_deg
-        self.grid: dict[tuple[int, int], list[tuple[Vector3, Any]]] = defaultdict(list)
+        self.grid: dict[tuple[int, int], _Cell] = {}
         self.item_count = 0
 
     def insert(self, position: Vector3, data: Any) -> None:
@@ -66,10 +142,40 @@ class SpatialIndex:
         Examples:
             >>> index.insert(Vector3(-122.115, 2.1, 37.461), airport)
         """
-        cell = self._get_cell(position)
-        self.grid[cell].append((position, data))
+        cell_key = self._get_cell(position)
+        cell = self.grid.get(cell_key)
+        if cell is None:
+            cell = self.grid[cell_key] = _Cell()
+        cell.append(position, data)
         self.item_count += 1
-        logger.debug("Inserted item at cell %s (total items: %d)", cell, self.item_count)
+        logger.debug("Inserted item at cell %s (total items: %d)", cell_key, self.item_count)
+
+    def remove(self, position: Vector3, data: Any) -> bool:
+        """Remove an item inserted at a position.
+
+        Args:
+            position: Position the item was inserted with
+            data: Item to remove (compared with ==)
+
+        Returns:
+            True if the item was found and removed
+
+        Examples:
+            >>> index.remove(airport.position, airport)
+        """
+        cell_key = self._get_cell(position)
+        cell = self.grid.get(cell_key)
+        if cell is None:
+            return False
+
+        for i, (_, item_data) in enumerate(cell.items):
+            if item_data == data:
+                cell.remove_at(i)
+                self.item_count -= 1
+                if not cell.size:
+                    del self.grid[cell_key]
+                return True
+        return False
 
     def query_radius(self, position: Vector3, radius_nm: float) -> list[tuple[Any, float]]:
         """Query all items within radius of position.
@@ -97,23 +203,58 @@ class SpatialIndex:
             position.z,
         )
 
-        # Check all items in those cells
-        results: list[tuple[Any, float]] = []
-        for cell in cells:
-            if cell not in self.grid:
-                continue
-
-            for item_pos, item_data in self.grid[cell]:
-                distance = self._haversine_distance_nm(position, item_pos)
-                if distance <= radius_nm:
-                    results.append((item_data, distance))
-
-        # Sort by distance
-        results.sort(key=lambda x: x[1])
+        candidates = [self.grid[cell] for cell in cells if cell in self.grid]
+        results = self._nearest_in_cells(position, candidates, radius_nm)
 
         logger.debug("Found %d items within %.1f nm", len(results), radius_nm)
         return results
 
+    def query_knn(
+        self,
+        position: Vector3,
+        k: int,
+        max_radius_nm: float | None = None,
+        predicate: Callable[[Any], bool] | None = None,
+    ) -> list[tuple[Any, float]]:
+        """Query the k items nearest to a position.
+
+        Searches a radius around the position that doubles until it holds k
+        items, so the result is exact while usually touching only a few cells.
+
+        Args:
+            position: Center position (x=longitude, y=elevation, z=latitude)
+            k: Number of items to return
+            max_radius_nm: Optional maximum distance in nautical miles
+            predicate: Optional filter; only items where predicate(data) is
+                      True are returned
+
+        Returns:
+            Up to k (data, distance_nm) tuples, sorted by distance
+
+        Examples:
+            >>> for airport, distance in index.query_knn(position, k=3):
+            ...     print(f"{airport.icao}: {distance:.1f} nm")
+        """
+        if k <= 0 or not self.grid:
+            return []
+
+        limit = math.inf if max_radius_nm is None else max_radius_nm
+        radius_nm = min(self.cell_size_deg * 60.0, limit)
+
+        while True:
+            # Half the earth's circumference reaches every point
+            whole_earth = radius_nm >= math.pi * EARTH_RADIUS_NM
+            if whole_earth:
+                cells = list(self.grid.values())
+            else:
+                keys = self._get_cells_in_radius(position, radius_nm)
+                cells = [self.grid[key] for key in keys if key in self.grid]
+
+            found = self._nearest_in_cells(position, cells, radius_nm, k, predicate)
+            if len(found) >= k or whole_earth or radius_nm >= limit:
+                return found
+            radius_nm = min(radius_nm * 2, limit)
+
     def query_all(self) -> list[tuple[Vector3, Any]]:
         """Query all items in the index.
 
@@ -125,8 +266,8 @@ class SpatialIndex:
             >>> print(f"Total airports: {len(all_items)}")
         """
         results: list[tuple[Vector3, Any]] = []
-        for items in self.grid.values():
-            results.extend(items)
+        for cell in self.grid.values():
+            results.extend(cell.items)
         return results
 
     def clear(self) -> None:
@@ -165,6 +306,56 @@ class SpatialIndex:
         """
         return len(self.grid)
 
+    def _nearest_in_cells(
+        self,
+        position: Vector3,
+        cells: list[_Cell],
+        radius_nm: float,
+        k: int | None = None,
+        predicate: Callable[[Any], bool] | None = None,
+    ) -> list[tuple[Any, float]]:
+        """Compute distances for all items of some cells (vectorized).
+
+        Args:
+            position: Center position
+            cells: Cells to search
+            radius_nm: Maximum distance (inclusive)
+            k: Optional maximum number of results
+            predicate: Optional filter on item data
+
+        Returns:
+            (data, distance_nm) tuples sorted by distance
+        """
+        if not cells:
+            return []
+
+        coordinates = [cell.coordinates() for cell in cells]
+        lats = np.concatenate([cell_lats for cell_lats, _ in coordinates])
+        lons = np.concatenate([cell_lons for _, cell_lons in coordinates])
+        distances = haversine_distances_nm(position.z, position.x, lats, lons)
+
+        hits = np.flatnonzero(distances <= radius_nm)
+        if k is not None and predicate is None and len(hits) > k:
+            hits = hits[np.argpartition(distances[hits], k - 1)[:k]]
+        hits = hits[np.argsort(distances[hits], kind="stable")]
+
+        # Map flat indices back to (cell, item)
+        ends = np.cumsum([cell.size for cell in cells])
+        owners = np.searchsorted(ends, hits, side="right")
+
+        results: list[tuple[Any, float]] = []
+        for flat, owner, distance in zip(
+            hits.tolist(), owners.tolist(), distances[hits].tolist(), strict=True
+        ):
+            start = int(ends[owner - 1]) if owner else 0
+            data = cells[owner].items[flat - start][1]
+            if predicate is not None and not predicate(data):
+                continue
+            results.append((data, distance))
+            if k is not None and len(results) >= k:
+                break
+        return results
+
     def _get_cell(self, position: Vector3) -> tuple[int, int]:
         """Get grid cell for a position.
 
@@ -181,6 +372,8 @@ class SpatialIndex:
     def _get_cells_in_radius(self, position: Vector3, radius_nm: float) -> list[tuple[int, int]]:
         """Get all cells that could contain items within radius.
 
+        Longitude ranges widen with latitude and wrap across the date line.
+
         Args:
             position: Center position
             radius_nm: Radius in nautical miles
@@ -188,26 +381,34 @@ class SpatialIndex:
         Returns:
             List of (cell_x, cell_z) tuples
         """
-        # Convert radius from nautical miles to approximate degrees
-        # At equator: 1 nm ≈ 0.0166667 degrees
-        # Use slightly larger radius to ensure we don't miss edge cases
-        radius_deg = (radius_nm / 60.0) * 1.5
-
-        # Get center cell
-        center_cell = self._get_cell(position)
-
-        # Calculate cell range to check
-        # Add 1 to ensure we check surrounding cells
-        cell_radius = int(math.ceil(radius_deg / self.cell_size_deg)) + 1
-
-        # Generate all cells in range
-        cells: list[tuple[int, int]] = []
-        for dx in range(-cell_radius, cell_radius + 1):
-            for dz in range(-cell_radius, cell_radius + 1):
-                cell = (center_cell[0] + dx, center_cell[1] + dz)
-                cells.append(cell)
-
-        return cells
+        # 1 nm = 1/60 degree of latitude; longitude degrees shrink with latitude
+        radius_deg = radius_nm / 60.0
+        south = max(position.z - radius_deg, -90.0)
+        north = min(position.z + radius_deg, 90.0)
+        cos_lat = math.cos(math.radians(max(abs(south), abs(north))))
+        lon_radius_deg = radius_deg / cos_lat if cos_lat > 1e-9 else 360.0
+
+        west, east = position.x - lon_radius_deg, position.x + lon_radius_deg
+        if lon_radius_deg >= 180.0:
+            lon_ranges = [(-180.0, 180.0)]
+        elif west < -180.0:
+            lon_ranges = [(-180.0, east), (west + 360.0, 180.0)]
+        elif east > 180.0:
+            lon_ranges = [(west, 180.0), (-180.0, east - 360.0)]
+        else:
+            lon_ranges = [(west, east)]
+
+        size = self.cell_size_deg
+        rows = range(int(math.floor(south / size)), int(math.floor(north / size)) + 1)
+        columns: set[int] = set()
+        for start, end in lon_ranges:
+            columns.update(range(int(math.floor(start / size)), int(math.floor(end / size)) + 1))
+
+        # A large query area has more candidate cells than occupied cells
+        if len(rows) * len(columns) > 4 * len(self.grid):
+            return [cell for cell in self.grid if cell[1] in rows and cell[0] in columns]
+
+        return [(cell_x, cell_z) for cell_x in columns for cell_z in rows]
 
     @staticmethod
     def _haversine_distance_nm(pos1: Vector3, pos2: Vector3) -> float:
@@ -18,6 +18,11 @@ import logging
 import math
 from dataclasses import dataclass
 
+import numpy as np
+import numpy.typing as npt
+
+from airborne.airports.ground_graph import GroundGraph, pair_directed_edges
+from airborne.airports.ground_index import GroundSpatialIndex
 from airborne.physics.vectors import Vector3
 
 logger = logging.getLogger(__name__)
@@ -82,6 +87,10 @@ class TaxiwayGraph:
     Provides a directed graph structure for airport ground navigation.
     Supports adding nodes/edges, pathfinding, and distance calculations.
 
+    Nearest-node and nearest-edge queries go through the spatial index of
+    an array-backed GroundGraph, which is built on first use and rebuilt
+    after the graph changes.
+
     Examples:
         >>> graph = TaxiwayGraph()
         >>> graph.add_node("A1", Vector3(-122.0, 2.1, 37.5))
@@ -95,6 +104,8 @@ class TaxiwayGraph:
         """Initialize empty taxiway graph."""
         self.nodes: dict[str, TaxiwayNode] = {}
         self.edges: dict[str, list[TaxiwayEdge]] = {}  # from_node -> list of edges
+        self._ground_graph: GroundGraph[str] | None = None
+        self._index_edges: list[TaxiwayEdge] = []
 
     def add_node(
         self,
@@ -128,6 +139,7 @@ class TaxiwayGraph:
         node = TaxiwayNode(node_id, position, node_type, name)
         self.nodes[node_id] = node
         self.edges[node_id] = []
+        self._ground_graph = None
 
         logger.debug("Added node %s at (%.6f, %.6f)", node_id, position.x, position.z)
         return node
@@ -173,6 +185,7 @@ class TaxiwayGraph:
         # Create edge
         edge = TaxiwayEdge(from_node, to_node, distance_m, edge_type, name)
         self.edges[from_node].append(edge)
+        self._ground_graph = None
 
         logger.debug(
             "Added edge %s -> %s (%.1fm, %s)",
@@ -330,15 +343,20 @@ class TaxiwayGraph:
             >>> if nearest:
             ...     print(f"Nearest node: {nearest}")
         """
-        nearest_id: str | None = None
-        nearest_distance = max_distance_m
+        if not self.nodes:
+            return None
 
-        for node_id, node in self.nodes.items():
-            distance = self._calculate_distance_m(position, node.position)
-            if distance < nearest_distance:
-                nearest_distance = distance
-                nearest_id = node_id
+        node_ids = self.index_node_ids
+        result = self.spatial_index.nearest_node_by(
+            position.z,
+            position.x,
+            lambda i: self._calculate_distance_m(position, self.nodes[node_ids[i]].position),
+            max_distance_m,
+        )
+        if result is None:
+            return None
 
+        nearest_id, nearest_distance = node_ids[result[0]], result[1]
         if nearest_id:
             logger.debug(
                 "Found nearest node %s at %.1fm from (%.6f, %.6f)",
@@ -350,6 +368,107 @@ class TaxiwayGraph:
 
         return nearest_id
 
+    def find_nearest_edge(
+        self,
+        position: Vector3,
+        max_distance_m: float = math.inf,
+        edge_type: str | None = None,
+    ) -> tuple[TaxiwayEdge, float] | None:
+        """Find the edge whose segment passes nearest to a position.
+
+        Args:
+            position: Position to search from
+            max_distance_m: Maximum search distance in meters
+            edge_type: Optional edge type filter (taxiway, runway, apron)
+
+        Returns:
+            Tuple of (edge, distance_m), or None if no edge within distance
+
+        Examples:
+            >>> result = graph.find_nearest_edge(Vector3(-122.0, 2.1, 37.5), 30.0, "taxiway")
+            >>> if result:
+            ...     print(f"On {result[0].name}, {result[1]:.1f}m from centerline")
+        """
+        if not self.nodes:
+            return None
+        mask = self.edge_type_mask(edge_type) if edge_type else None
+        result = self.spatial_index.nearest_edge(position.z, position.x, max_distance_m, mask)
+        if result is None:
+            return None
+        return self._index_edges[result[0]], result[1]
+
+    def find_edges_within(
+        self, position: Vector3, radius_m: float
+    ) -> list[tuple[TaxiwayEdge, float]]:
+        """Find edges whose segments pass within a radius of a position.
+
+        Args:
+            position: Position to search from
+            radius_m: Search radius in meters
+
+        Returns:
+            List of (edge, distance_m) sorted by distance
+
+        Examples:
+            >>> for edge, distance in graph.find_edges_within(position, 50.0):
+            ...     print(edge.name, distance)
+        """
+        if not self.nodes:
+            return []
+        return [
+            (self._index_edges[i], distance)
+            for i, distance in self.spatial_index.edges_within(position.z, position.x, radius_m)
+        ]
+
+    @property
+    def spatial_index(self) -> GroundSpatialIndex:
+        """Get the spatial index over nodes and edges (built on first use).
+
+        Node and edge indices refer to index_node_ids and index_edges.
+        """
+        return self.ground_graph.spatial_index
+
+    @property
+    def ground_graph(self) -> GroundGraph[str]:
+        """Get the graph as a GroundGraph (built on first use).
+
+        Each pair of opposite edges is one GroundGraph edge; edge numbers
+        refer to index_edges.
+        """
+        if self._ground_graph is None:
+            self._index_edges = [
+                edge
+                for edge, _ in pair_directed_edges(
+                    edge for edges in self.edges.values() for edge in edges
+                )
+            ]
+            self._ground_graph = GroundGraph.from_taxiway_graph(self)
+        return self._ground_graph
+
+    @property
+    def index_node_ids(self) -> list[str]:
+        """Get node IDs in spatial index order."""
+        return self.ground_graph.node_ids
+
+    @property
+    def index_edges(self) -> list[TaxiwayEdge]:
+        """Get edges in spatial index order (one per pair of opposite edges)."""
+        _ = self.ground_graph
+        return self._index_edges
+
+    def edge_type_mask(self, edge_type: str) -> npt.NDArray[np.bool_]:
+        """Get a spatial index mask selecting edges of one type.
+
+        Args:
+            edge_type: Edge type (taxiway, runway, apron)
+
+        Returns:
+            Boolean array over index_edges
+        """
+        graph = self.ground_graph
+        mask: npt.NDArray[np.bool_] = graph.edge_type == graph.name_id(edge_type)
+        return mask
+
     def get_node_count(self) -> int:
         """Get total number of nodes in graph.
 
@@ -383,6 +502,7 @@ class TaxiwayGraph:
         """
         self.nodes.clear()
         self.edges.clear()
+        self._ground_graph = None
         logger.info("Cleared taxiway graph")
 
     @staticmethod
@@ -113,6 +113,9 @@ class MessageTopic:
     GEAR_POSITION = "flight.gear.position"
     CONTROL_INPUT = "flight.control_input"
 
+    # Navigation
+    AIRPORT_LOADED = "navigation.airport_loaded"  # Runways and taxiway graph
+
     # Cabin
     DOOR_STATE = "cabin.door.state"
     BOARDING_PROGRESS = "cabin.boarding.progress"
@@ -120,6 +123,7 @@ class MessageTopic:
 
     # Network
     TRAFFIC_UPDATE = "network.traffic.update"
+    TRAFFIC_DELTA = "network.traffic.delta"  # Spawned/updated/removed traffic
     ATC_MESSAGE = "network.atc.message"
 
     # Avionics
@@ -129,6 +133,7 @@ class MessageTopic:
     COLLISION_DETECTED = "physics.collision_detected"
     TERRAIN_ELEVATION = "terrain.elevation"
     TERRAIN_UPDATED = "terrain.updated"
+    TERRAIN_WARNING = "terrain.warning"  # TAWS look-ahead caution/warning
     NEARBY_CITIES = "terrain.nearby_cities"
 
     # UI/Audio
@@ -32,6 +32,7 @@ from airborne.navigation.navdata import (
     NavaidType,
     NavDatabase,
 )
+from airborne.navigation.navdata_store import NavDataStore
 from airborne.navigation.routes import (
     OpenFlightsProvider,
     Route,
@@ -52,6 +53,7 @@ __all__ = [
     "Navaid",
     "NavaidType",
     "NavDatabase",
+    "NavDataStore",
     "OpenFlightsProvider",
     "Route",
     "RouteProvider",
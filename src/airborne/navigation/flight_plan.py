@@ -304,8 +304,14 @@ class FlightPlanManager:
         cruise_alt_ft: float,
         aircraft_type: str,
         callsign: str = "N12345",
+        route: str = "DCT",
     ) -> FlightPlan:
-        """Create a direct route between two airports.
+        """Create a route between two airports.
+
+        Without a route string the plan goes direct. A route string such as
+        ``"SFO V25 OAK"`` is resolved through the navigation database and
+        its waypoints (including every fix along airways) are inserted
+        between departure and arrival.
 
         Args:
             departure: Departure airport
@@ -313,13 +319,22 @@ class FlightPlanManager:
             cruise_alt_ft: Cruise altitude in feet MSL
             aircraft_type: Aircraft type code
             callsign: Aircraft callsign
+            route: ATC route string (default: direct)
 
         Returns:
-            FlightPlan with direct route
+            FlightPlan with the route
+
+        Raises:
+            ValueError: If the route has unknown waypoints or airways
 
         Examples:
             >>> plan = manager.create_direct_route(kpao, ksfo, 3500, "C172")
+            >>> plan = manager.create_direct_route(
+            ...     kjfk, kbuf, 35000, "B738", route="GAYEL J95 BUFFY"
+            ... )
         """
+        enroute = self.nav_db.resolve_route(route, origin=departure.position)
+
         # Create navaids from airports
         dep_navaid = Navaid(
             identifier=departure.icao,
@@ -350,22 +365,24 @@ class FlightPlanManager:
             flyby=False,
         )
 
-        route = [dep_waypoint, arr_waypoint]
+        enroute_waypoints = [
+            EnhancedWaypoint(navaid=navaid, altitude_ft=cruise_alt_ft) for navaid in enroute
+        ]
 
         plan = FlightPlan(
             callsign=callsign,
             aircraft_type=aircraft_type,
             departure=departure,
             arrival=arrival,
-            route=route,
+            route=[dep_waypoint, *enroute_waypoints, arr_waypoint],
             cruise_altitude_ft=cruise_alt_ft,
-            route_string="DCT",
+            route_string=route,
             flight_rules=FlightRules.VFR,
         )
 
         logger.info(
-            f"Created direct route: {departure.icao} -> {arrival.icao} "
-            f"({plan.get_total_distance_nm():.1f} NM)"
+            f"Created route: {departure.icao} {route} {arrival.icao} "
+            f"({len(enroute)} enroute waypoints, {plan.get_total_distance_nm():.1f} NM)"
         )
 
         return plan
@@ -448,4 +465,7 @@ class FlightPlanManager:
             if plan.route[i].navaid.identifier == plan.route[i + 1].navaid.identifier:
                 errors.append(f"Duplicate consecutive waypoint: {plan.route[i].navaid.identifier}")
 
+        # Check the route string resolves (known fixes, connected airways)
+        errors.extend(self.nav_db.check_route(plan.route_string, plan.departure.position))
+
         return errors
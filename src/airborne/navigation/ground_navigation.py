@@ -23,6 +23,7 @@ import logging
 from dataclasses import dataclass
 
 from airborne.airports.layout import AirportLayout
+from airborne.airports.runway_geometry import RunwayGeometry
 from airborne.audio.centerline import CenterlineBeepManager
 from airborne.audio.orientation import OrientationAudioManager
 from airborne.physics.vectors import Vector3
@@ -60,6 +61,7 @@ class GroundNavigationManager:
         orientation_audio: Manages audio announcements.
         centerline_beep: Manages centerline tracking beeps.
         layout: Airport ground layout (runways, taxiways, etc.).
+        runway_geometry: Layout runways precomputed for proximity queries.
         config: Navigation configuration.
         enabled: Whether navigation is currently enabled.
 
@@ -90,6 +92,7 @@ class GroundNavigationManager:
         self.orientation_audio = orientation_audio
         self.centerline_beep = centerline_beep
         self.layout = layout
+        self.runway_geometry = RunwayGeometry.from_layout(layout.runways)
         self.config = config or GroundNavigationConfig()
 
         # State tracking
@@ -250,16 +253,11 @@ class GroundNavigationManager:
         Returns:
             Tuple of (runway_id, distance_m) or None if no runways.
         """
-        nearest: tuple[str, float] | None = None
-        min_distance = float("inf")
-
-        for runway in self.layout.runways:
-            distance = self._calculate_distance(position, runway.threshold_pos)
-            if distance < min_distance:
-                min_distance = distance
-                nearest = (runway.id, distance)
-
-        return nearest
+        if not len(self.runway_geometry):
+            return None
+        distances = self.runway_geometry.query(position.z, position.x).threshold_m
+        index = int(distances.argmin())
+        return (self.runway_geometry.idents[index][0], float(distances[index]))
 
     def _find_nearby_features(
         self, position: Vector3, exclude_id: str
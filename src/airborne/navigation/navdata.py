@@ -6,9 +6,11 @@ navigation aids (VOR, NDB, waypoints, etc.) from various data sources.
 Typical usage:
     db = NavDatabase()
     db.load_from_csv("data/navigation/navaids.csv")
+    db.load_xplane_data("data/navigation")  # Worldwide navaids, fixes, airways
 
     vor = db.find_navaid("SFO")
     nearby = db.find_navaids_near(position, radius_nm=50)
+    route = db.resolve_route("SFO V25 OAK")
 """
 
 import csv
@@ -18,6 +20,10 @@ from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
+import numpy as np
+
+from airborne.airports.spatial_index import SpatialIndex, haversine_distances_nm
+from airborne.navigation.navdata_store import NavDataStore
 from airborne.physics.vectors import Vector3
 
 logger = logging.getLogger(__name__)
@@ -93,8 +99,13 @@ class NavDatabase:
     Manages a collection of navaids with spatial indexing for efficient
     queries by identifier or proximity.
 
+    Navaids added one by one live in ``navaids``. Worldwide datasets loaded
+    with load_xplane_data() live in an array-backed NavDataStore; Navaid
+    objects are only created for store rows that are returned by a query.
+
     Attributes:
         navaids: Dictionary mapping identifier to Navaid
+        store: Worldwide navaid, fix and airway data (None until loaded)
 
     Examples:
         >>> db = NavDatabase()
@@ -106,6 +117,9 @@ class NavDatabase:
     def __init__(self) -> None:
         """Initialize empty navigation database."""
         self.navaids: dict[str, Navaid] = {}
+        self._spatial_index = SpatialIndex(cell_size_deg=1.0)
+        self.store: NavDataStore | None = None
+        self._store_navaids: dict[int, Navaid] = {}
         logger.info("Initialized navigation database")
 
     def add_navaid(self, navaid: Navaid) -> None:
@@ -117,7 +131,12 @@ class NavDatabase:
         Note:
             If a navaid with the same identifier exists, it will be replaced.
         """
+        existing = self.navaids.get(navaid.identifier)
+        if existing is not None:
+            self._spatial_index.remove(existing.position, existing)
+
         self.navaids[navaid.identifier] = navaid
+        self._spatial_index.insert(navaid.position, navaid)
         logger.debug(f"Added navaid: {navaid}")
 
     def find_navaid(self, identifier: str) -> Navaid | None:
@@ -133,7 +152,32 @@ class NavDatabase:
             >>> db = NavDatabase()
             >>> vor = db.find_navaid("SFO")
         """
-        return self.navaids.get(identifier)
+        navaid = self.navaids.get(identifier)
+        if navaid is None and self.store is not None:
+            rows = self.store.find(identifier)
+            if len(rows):
+                navaid = self._store_navaid(int(rows[0]))
+        return navaid
+
+    def find_navaids(self, identifier: str) -> list[Navaid]:
+        """Find all navaids with an identifier.
+
+        Worldwide data reuses identifiers (e.g., fixes with the same name in
+        different regions), so several navaids can match.
+
+        Args:
+            identifier: Navaid identifier (case-sensitive)
+
+        Returns:
+            Matching navaids (added navaids first)
+
+        Examples:
+            >>> candidates = db.find_navaids("ALPHA")
+        """
+        results = [self.navaids[identifier]] if identifier in self.navaids else []
+        if self.store is not None:
+            results.extend(self._store_navaid(row) for row in self.store.find(identifier).tolist())
+        return results
 
     def find_navaids_near(
         self, position: Vector3, radius_nm: float, navaid_type: NavaidType | None = None
@@ -152,23 +196,111 @@ class NavDatabase:
             >>> navaids = db.find_navaids_near(position, radius_nm=50)
             >>> vors = db.find_navaids_near(position, 50, NavaidType.VOR)
         """
-        results = []
+        results = [
+            (navaid, distance)
+            for navaid, distance in self._get_spatial_index().query_radius(position, radius_nm)
+            if not navaid_type or navaid.type == navaid_type
+        ]
 
-        for navaid in self.navaids.values():
-            # Filter by type if specified
-            if navaid_type and navaid.type != navaid_type:
-                continue
+        if self.store is not None:
+            types = [navaid_type.value] if navaid_type else None
+            rows, distances = self.store.query_radius(position.z, position.x, radius_nm, types)
+            results = self._merge_store_results(results, rows, distances)
 
-            # Calculate great circle distance using Haversine formula
-            distance_nm = self._haversine_distance_nm(position, navaid.position)
+        return [navaid for navaid, _ in results]
 
-            if distance_nm <= radius_nm:
-                results.append((distance_nm, navaid))
+    def find_nearest_navaids(
+        self, position: Vector3, count: int, navaid_type: NavaidType | None = None
+    ) -> list[tuple[Navaid, float]]:
+        """Find the navaids nearest to a position.
 
-        # Sort by distance (closest first)
-        results.sort(key=lambda x: x[0])
+        Args:
+            position: Center position to search from (x=lon, y=elev, z=lat)
+            count: Maximum number of navaids to return
+            navaid_type: Optional filter by navaid type
 
-        return [navaid for _, navaid in results]
+        Returns:
+            List of (navaid, distance_nm) tuples, sorted by distance (closest first)
+
+        Examples:
+            >>> nearest_vor, distance = db.find_nearest_navaids(position, 1, NavaidType.VOR)[0]
+        """
+        predicate = (lambda navaid: navaid.type == navaid_type) if navaid_type else None
+        results = self._get_spatial_index().query_knn(position, count, predicate=predicate)
+
+        if self.store is not None:
+            types = [navaid_type.value] if navaid_type else None
+            rows, distances = self.store.query_nearest(position.z, position.x, count, types)
+            results = self._merge_store_results(results, rows, distances)[:count]
+
+        return results
+
+    def _merge_store_results(
+        self,
+        results: list[tuple[Navaid, float]],
+        rows: np.ndarray,
+        distances: np.ndarray,
+    ) -> list[tuple[Navaid, float]]:
+        """Merge sorted store query results into sorted (navaid, distance) results.
+
+        Args:
+            results: Results from added navaids, sorted by distance
+            rows: Store rows, sorted by distance
+            distances: Distances of the store rows
+
+        Returns:
+            Combined results sorted by distance
+        """
+        store_results = [
+            (self._store_navaid(row), distance)
+            for row, distance in zip(rows.tolist(), distances.tolist(), strict=True)
+        ]
+        if not results:
+            return store_results
+        return sorted(results + store_results, key=lambda x: x[1])
+
+    def _store_navaid(self, row: int) -> Navaid:
+        """Get the Navaid of a store row, creating it on first access.
+
+        Args:
+            row: Store row
+
+        Returns:
+            Navaid (the same object for repeated calls)
+        """
+        navaid = self._store_navaids.get(row)
+        if navaid is not None:
+            return navaid
+
+        store = self.store
+        if store is None:
+            raise KeyError(f"No navdata store loaded for row {row}")
+
+        frequency = float(store.frequency[row])
+        navaid = Navaid(
+            identifier=store.ident[row].decode("ascii"),
+            name=store.name(row),
+            type=NavaidType(store.type_name(row)),
+            position=Vector3(
+                float(store.lon[row]), float(store.elevation_m[row]), float(store.lat[row])
+            ),
+            frequency=None if math.isnan(frequency) else frequency,
+            range_nm=float(store.range_nm[row]),
+        )
+        self._store_navaids[row] = navaid
+        return navaid
+
+    def _get_spatial_index(self) -> SpatialIndex:
+        """Get the spatial index, rebuilt if navaids were changed directly.
+
+        Returns:
+            Spatial index over all navaids
+        """
+        if self._spatial_index.get_item_count() != len(self.navaids):
+            self._spatial_index.clear()
+            for navaid in self.navaids.values():
+                self._spatial_index.insert(navaid.position, navaid)
+        return self._spatial_index
 
     def find_navaids_by_type(self, navaid_type: NavaidType) -> list[Navaid]:
         """Find all navaids of a specific type.
@@ -182,7 +314,189 @@ class NavDatabase:
         Examples:
             >>> vors = db.find_navaids_by_type(NavaidType.VOR)
         """
-        return [n for n in self.navaids.values() if n.type == navaid_type]
+        results = [n for n in self.navaids.values() if n.type == navaid_type]
+        if self.store is not None:
+            rows = self.store.type_rows(navaid_type.value)
+            results.extend(self._store_navaid(row) for row in rows.tolist())
+        return results
+
+    def get_airway_fixes(self, airway: str, entry: str, exit_: str) -> list[Navaid]:
+        """Get the fixes along an airway segment.
+
+        Args:
+            airway: Airway name (e.g., "V25", "UN871")
+            entry: Identifier of the fix where the airway is joined
+            exit_: Identifier of the fix where the airway is left
+
+        Returns:
+            Navaids from entry to exit (both included)
+
+        Raises:
+            ValueError: If the airway is unknown or does not connect the fixes
+
+        Examples:
+            >>> fixes = db.get_airway_fixes("V25", "SFO", "OAK")
+        """
+        return self.resolve_route(f"{entry} {airway} {exit_}")
+
+    def resolve_route(self, route: str, origin: Vector3 | None = None) -> list[Navaid]:
+        """Resolve an ATC route string into navaids.
+
+        The route is a sequence of identifiers and airways, e.g.
+        ``"SFO V25 OAK DCT MODET"``. An airway between two fixes expands to
+        every fix along it. When an identifier matches several navaids, the
+        one nearest to the previous waypoint (or origin) is used.
+
+        Args:
+            route: Route string (DCT legs are allowed and ignored)
+            origin: Position the route starts from, used to pick between
+                navaids sharing an identifier
+
+        Returns:
+            Navaids along the route
+
+        Raises:
+            ValueError: If the route has unknown waypoints or airways
+
+        Examples:
+            >>> waypoints = db.resolve_route("SFO V25 OAK", origin=kpao.position)
+        """
+        navaids, errors = self._parse_route(route, origin)
+        if errors:
+            raise ValueError("; ".join(errors))
+        return navaids
+
+    def check_route(self, route: str, origin: Vector3 | None = None) -> list[str]:
+        """Validate an ATC route string.
+
+        Args:
+            route: Route string (e.g., "SFO V25 OAK")
+            origin: Position the route starts from
+
+        Returns:
+            List of error messages (empty if the route resolves)
+
+        Examples:
+            >>> errors = db.check_route("SFO V25 OAK")
+        """
+        return self._parse_route(route, origin)[1]
+
+    def _parse_route(self, route: str, origin: Vector3 | None) -> tuple[list[Navaid], list[str]]:
+        """Resolve a route string, collecting errors instead of raising.
+
+        Args:
+            route: Route string
+            origin: Position the route starts from
+
+        Returns:
+            (navaids, errors)
+        """
+        tokens = [token for token in route.upper().split() if token != "DCT"]
+        store = self.store
+        navaids: list[Navaid] = []
+        rows: list[int | None] = []  # Store row of each navaid (None for added navaids)
+        errors: list[str] = []
+
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            next_token = tokens[i + 1] if i + 1 < len(tokens) else None
+
+            if store is not None and store.airway_id(token) is not None:
+                if not navaids or next_token is None:
+                    errors.append(f"Airway {token} must be between two waypoints")
+                    i += 1
+                    continue
+
+                path = self._airway_path(token, navaids[-1], rows[-1], next_token)
+                if path is None:
+                    errors.append(
+                        f"{next_token} is not reachable from {navaids[-1].identifier} "
+                        f"on airway {token}"
+                    )
+                else:
+                    # The entry may resolve to another navaid with the same identifier
+                    navaids[-1], rows[-1] = self._store_navaid(path[0]), path[0]
+                    navaids.extend(self._store_navaid(row) for row in path[1:])
+                    rows.extend(path[1:])
+                i += 2
+                continue
+
+            previous = navaids[-1].position if navaids else origin
+            navaid, row = self._resolve_waypoint(token, previous, next_token)
+            if navaid is None:
+                errors.append(f"Unknown waypoint or airway: {token}")
+            else:
+                navaids.append(navaid)
+                rows.append(row)
+            i += 1
+
+        return navaids, errors
+
+    def _resolve_waypoint(
+        self, identifier: str, near: Vector3 | None, next_token: str | None
+    ) -> tuple[Navaid | None, int | None]:
+        """Pick the navaid for a route identifier.
+
+        Args:
+            identifier: Waypoint identifier
+            near: Previous route position (prefer the nearest match)
+            next_token: Following route token (prefer fixes on that airway)
+
+        Returns:
+            (navaid, store row); the row is None for added navaids
+        """
+        if identifier in self.navaids:
+            return self.navaids[identifier], None
+
+        store = self.store
+        if store is None:
+            return None, None
+        rows = store.find(identifier)
+        if not len(rows):
+            return None, None
+
+        if next_token is not None and store.airway_id(next_token) is not None:
+            on_airway = [
+                row for row in rows.tolist() if len(store.airway_neighbors(row, next_token))
+            ]
+            if on_airway:
+                rows = np.array(on_airway, dtype=np.int64)
+
+        row = int(rows[0])
+        if near is not None and len(rows) > 1:
+            distances = haversine_distances_nm(near.z, near.x, store.lat[rows], store.lon[rows])
+            row = int(rows[int(np.argmin(distances))])
+        return self._store_navaid(row), row
+
+    def _airway_path(
+        self, airway: str, entry: Navaid, entry_row: int | None, exit_identifier: str
+    ) -> list[int] | None:
+        """Find the store rows along an airway from an entry to an exit fix.
+
+        Args:
+            airway: Airway name
+            entry: Entry navaid
+            entry_row: Store row of the entry, if it came from the store
+            exit_identifier: Identifier of the exit fix
+
+        Returns:
+            Rows from entry to exit, or None if not connected
+        """
+        store = self.store
+        if store is None:
+            return None
+
+        entries = [entry_row] if entry_row is not None else []
+        entries += [row for row in store.find(entry.identifier).tolist() if row != entry_row]
+        exits = store.find(exit_identifier).tolist()
+
+        for start in entries:
+            for end in exits:
+                path = store.airway_path(airway, start, end)
+                if path is not None:
+                    return path
+        return None
 
     def calculate_route_distance(self, waypoints: list[Navaid]) -> float:
         """Calculate total distance along a route.
@@ -279,17 +593,79 @@ class NavDatabase:
         logger.info(f"Loaded {count} navaids from {csv_path}")
         return count
 
+    def load_xplane_data(self, data_dir: str | Path) -> int:
+        """Load worldwide navaids, fixes and airways from X-Plane data files.
+
+        Reads earth_nav.dat, earth_fix.dat and earth_awy.dat (whichever
+        exist) from a directory. The parsed data is cached next to them as
+        navdata.npz and reused until one of the source files changes.
+
+        Args:
+            data_dir: Directory containing the X-Plane navigation files
+
+        Returns:
+            Number of navaids and fixes loaded
+
+        Raises:
+            FileNotFoundError: If the directory has none of the files
+
+        Examples:
+            >>> db = NavDatabase()
+            >>> count = db.load_xplane_data("data/navigation")
+        """
+        directory = Path(data_dir)
+        sources = {
+            name: directory / f"earth_{name}.dat"
+            for name in ("nav", "fix", "awy")
+            if (directory / f"earth_{name}.dat").exists()
+        }
+        if not sources:
+            raise FileNotFoundError(f"No X-Plane navigation data in {data_dir}")
+
+        cache_path = directory / "navdata.npz"
+        newest = max(path.stat().st_mtime for path in sources.values())
+        store = None
+        if cache_path.exists() and cache_path.stat().st_mtime >= newest:
+            try:
+                store = NavDataStore.load(cache_path)
+            except (OSError, KeyError, ValueError) as e:
+                logger.warning("Ignoring invalid navdata cache %s: %s", cache_path, e)
+
+        if store is None:
+            store = NavDataStore.from_xplane(
+                nav_path=sources.get("nav"),
+                fix_path=sources.get("fix"),
+                awy_path=sources.get("awy"),
+            )
+            try:
+                store.save(cache_path)
+            except OSError as e:
+                logger.warning("Could not write navdata cache %s: %s", cache_path, e)
+
+        self.store = store
+        self._store_navaids.clear()
+        logger.info(
+            "Loaded %d navaids/fixes and %d airways from %s",
+            len(store),
+            len(store.airway_names),
+            data_dir,
+        )
+        return len(store)
+
     def count(self) -> int:
         """Return total number of navaids in database.
 
         Returns:
             Number of navaids
         """
-        return len(self.navaids)
+        return len(self.navaids) + (len(self.store) if self.store is not None else 0)
 
     def clear(self) -> None:
         """Remove all navaids from database."""
         self.navaids.clear()
+        self._spatial_index.clear()
+        self.store = None
+        self._store_navaids.clear()
         logger.info("Cleared navigation database")
 
     @staticmethod
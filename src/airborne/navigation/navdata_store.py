@@ -0,0 +1,757 @@
+"""Array-backed store for worldwide navaid, fix and airway data.
+
+Holds hundreds of thousands of navaids and fixes as NumPy columns instead
+of Python objects. Rows are sorted by a bucket key combining the navaid type
+and a lat/lon grid cell, so every type is a contiguous partition and a radius
+query turns into a few ``searchsorted`` slices followed by a vectorized
+haversine. Airways are stored as an adjacency graph in CSR form (per-fix
+edge offsets into flat edge arrays).
+
+Data is read from X-Plane navigation files (``earth_nav.dat``,
+``earth_fix.dat`` and ``earth_awy.dat``, format 1100 and later) and cached
+as an uncompressed ``.npz`` file.
+
+Typical usage:
+    from airborne.navigation.navdata_store import NavDataStore
+
+    store = NavDataStore.from_xplane(
+        nav_path="data/navigation/earth_nav.dat",
+        fix_path="data/navigation/earth_fix.dat",
+        awy_path="data/navigation/earth_awy.dat",
+    )
+    store.save("data/navigation/navdata.npz")
+
+    rows, distances = store.query_radius(37.62, -122.38, 50.0, types=["VOR"])
+    path = store.airway_path("V25", entry_row, exit_row)
+"""
+
+import logging
+import math
+from collections import deque
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from airborne.airports.spatial_index import haversine_distances_nm
+
+logger = logging.getLogger(__name__)
+
+NAVDATA_STORE_VERSION = 1
+
+# X-Plane earth_nav.dat row codes kept in the store (ILS parts and DMEs
+# paired with another navaid are skipped)
+XPLANE_NAV_TYPES = {2: "NDB", 3: "VOR", 13: "DME"}
+
+# X-Plane earth_awy.dat fix type codes
+XPLANE_AIRWAY_FIX_TYPES = {11: "FIX", 2: "NDB", 3: "VOR"}
+
+
+def _encode_strings(values: list[str]) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64]]:
+    """Encode strings as a UTF-8 blob with offsets.
+
+    Args:
+        values: Strings to encode
+
+    Returns:
+        (blob, offsets) where string i is blob[offsets[i]:offsets[i + 1]]
+    """
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(item) for item in encoded])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return blob, offsets
+
+
+def _decode_strings(blob: npt.NDArray[np.uint8], offsets: npt.NDArray[np.int64]) -> list[str]:
+    """Decode a UTF-8 blob with offsets back into strings.
+
+    Args:
+        blob: UTF-8 bytes
+        offsets: String boundaries (length = count + 1)
+
+    Returns:
+        List of decoded strings
+    """
+    data = blob.tobytes()
+    bounds = offsets.tolist()
+    return [data[bounds[i] : bounds[i + 1]].decode("utf-8") for i in range(len(bounds) - 1)]
+
+
+def _read_xplane_lines(path: Path) -> tuple[int, list[list[str]]]:
+    """Read the data lines of an X-Plane navigation file.
+
+    Args:
+        path: File path
+
+    Returns:
+        (format version, split data lines)
+    """
+    with open(path, encoding="utf-8", errors="replace") as f:
+        f.readline()  # "I" or "A" (byte order mark of the format)
+        header = f.readline().split()
+        version = int(header[0]) if header and header[0].isdigit() else 0
+
+        lines = []
+        for line in f:
+            parts = line.split()
+            if not parts:
+                continue
+            if parts[0] == "99":
+                break
+            lines.append(parts)
+    return version, lines
+
+
+class NavDataStore:
+    """Columnar, spatially bucketed store of navaids, fixes and airways.
+
+    Attributes:
+        types: Type names (NavaidType values) indexed by type code
+        ident: Identifiers (fixed-width bytes)
+        region: ICAO region codes (fixed-width bytes, may be empty)
+        lat: Latitudes in degrees
+        lon: Longitudes in degrees
+        airway_names: Airway names indexed by airway id
+
+    Examples:
+        >>> store = NavDataStore.load("navdata.npz")
+        >>> rows = store.find("SFO")
+        >>> rows, distances = store.query_radius(37.6, -122.4, 25.0, types=["FIX"])
+    """
+
+    def __init__(self, columns: dict[str, npt.NDArray[Any]], cell_size_deg: float) -> None:
+        """Create a store from sorted columns.
+
+        Use from_records(), from_xplane() or load() instead of calling this
+        directly.
+
+        Args:
+            columns: Column arrays, already sorted by bucket key
+            cell_size_deg: Grid cell size in degrees
+        """
+        self.cell_size_deg = cell_size_deg
+        self.rows = int(math.ceil(180.0 / cell_size_deg))
+        self.cols = int(math.ceil(360.0 / cell_size_deg))
+
+        self.types = _decode_strings(columns["type_blob"], columns["type_offsets"])
+        self.ident: npt.NDArray[np.bytes_] = columns["ident"]
+        self.region: npt.NDArray[np.bytes_] = columns["region"]
+        self.type_code: npt.NDArray[np.uint8] = columns["type_code"]
+        self.lat: npt.NDArray[np.float64] = columns["lat"]
+        self.lon: npt.NDArray[np.float64] = columns["lon"]
+        self.elevation_m: npt.NDArray[np.float32] = columns["elevation_m"]
+        self.frequency: npt.NDArray[np.float32] = columns["frequency"]
+        self.range_nm: npt.NDArray[np.float32] = columns["range_nm"]
+        self.bucket: npt.NDArray[np.int64] = columns["bucket"]
+        self._name_blob = columns["name_blob"]
+        self._name_offsets = columns["name_offsets"]
+
+        # Identifier lookup
+        self.ident_order: npt.NDArray[np.int64] = columns["ident_order"]
+        self._ident_sorted = self.ident[self.ident_order]
+
+        # Airway graph (CSR): edges of row i are edge_*[edge_offsets[i]:edge_offsets[i + 1]]
+        self.edge_offsets: npt.NDArray[np.int64] = columns["edge_offsets"]
+        self.edge_to: npt.NDArray[np.int32] = columns["edge_to"]
+        self.edge_airway: npt.NDArray[np.int32] = columns["edge_airway"]
+        self.edge_level: npt.NDArray[np.uint8] = columns["edge_level"]
+        self.airway_names = _decode_strings(columns["airway_blob"], columns["airway_offsets"])
+        self._airway_ids = {name: i for i, name in enumerate(self.airway_names)}
+
+        # Partition boundaries: rows of type code t are [type_starts[t], type_starts[t + 1])
+        cells = self.rows * self.cols
+        self.type_starts: npt.NDArray[np.int64] = np.searchsorted(
+            self.bucket, np.arange(len(self.types) + 1, dtype=np.int64) * cells
+        )
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[dict[str, Any]],
+        airways: Iterable[tuple[int, int, str, int]] = (),
+        cell_size_deg: float = 1.0,
+    ) -> "NavDataStore":
+        """Build a store from navaid records and airway segments.
+
+        Args:
+            records: Dicts with keys ident, type (NavaidType value), lat, lon
+                and optionally region, name, elevation_m, frequency, range_nm
+            airways: Directed airway edges (from_record, to_record, airway,
+                level), using indices into records
+            cell_size_deg: Grid cell size in degrees
+
+        Returns:
+            New NavDataStore
+        """
+        rows = list(records)
+        count = len(rows)
+
+        types = sorted({r["type"] for r in rows})
+        type_codes = {name: i for i, name in enumerate(types)}
+
+        lat = np.array([r["lat"] for r in rows], dtype=np.float64)
+        lon = np.array([r["lon"] for r in rows], dtype=np.float64)
+        type_code = np.array([type_codes[r["type"]] for r in rows], dtype=np.uint8)
+        bucket = cls._bucket_keys(lat, lon, type_code, cell_size_deg)
+        order = np.argsort(bucket, kind="stable")
+
+        def column(key: str, default: Any, dtype: Any) -> npt.NDArray[Any]:
+            values = [default if r.get(key) is None else r[key] for r in rows]
+            return np.array(values, dtype=dtype)[order] if count else np.empty(0, dtype)
+
+        ident = np.array([r["ident"].encode("ascii", "replace") for r in rows], dtype=np.bytes_)
+        region = np.array([r.get("region", "").encode("ascii", "replace") for r in rows])
+        ident = ident[order] if count else np.empty(0, dtype="S1")
+        region = region.astype(np.bytes_)[order] if count else np.empty(0, dtype="S1")
+
+        name_blob, name_offsets = _encode_strings([rows[i].get("name", "") for i in order])
+        type_blob, type_offsets = _encode_strings(types)
+
+        # Remap airway endpoints to sorted rows and build the CSR adjacency
+        position = np.empty(count, dtype=np.int64)
+        position[order] = np.arange(count, dtype=np.int64)
+
+        airway_ids: dict[str, int] = {}
+        edges = [
+            (position[a], position[b], airway_ids.setdefault(name, len(airway_ids)), level)
+            for a, b, name, level in airways
+        ]
+        edge_array = np.array(edges, dtype=np.int64).reshape(-1, 4)
+        edge_array = edge_array[np.argsort(edge_array[:, 0], kind="stable")]
+        edge_offsets = np.searchsorted(edge_array[:, 0], np.arange(count + 1), side="left")
+        airway_blob, airway_offsets = _encode_strings(list(airway_ids))
+
+        columns: dict[str, npt.NDArray[Any]] = {
+            "type_blob": type_blob,
+            "type_offsets": type_offsets,
+            "ident": ident,
+            "region": region,
+            "type_code": type_code[order],
+            "lat": lat[order],
+            "lon": lon[order],
+            "elevation_m": column("elevation_m", 0.0, np.float32),
+            "frequency": column("frequency", np.nan, np.float32),
+            "range_nm": column("range_nm", 0.0, np.float32),
+            "bucket": bucket[order],
+            "name_blob": name_blob,
+            "name_offsets": name_offsets,
+            "ident_order": np.argsort(ident, kind="stable").astype(np.int64),
+            "edge_offsets": edge_offsets.astype(np.int64),
+            "edge_to": edge_array[:, 1].astype(np.int32),
+            "edge_airway": edge_array[:, 2].astype(np.int32),
+            "edge_level": edge_array[:, 3].astype(np.uint8),
+            "airway_blob": airway_blob,
+            "airway_offsets": airway_offsets,
+        }
+        return cls(columns, cell_size_deg)
+
+    @classmethod
+    def from_xplane(
+        cls,
+        nav_path: str | Path | None = None,
+        fix_path: str | Path | None = None,
+        awy_path: str | Path | None = None,
+        cell_size_deg: float = 1.0,
+    ) -> "NavDataStore":
+        """Build a store from X-Plane navigation data files.
+
+        Args:
+            nav_path: earth_nav.dat (VOR, NDB and DME stations)
+            fix_path: earth_fix.dat (enroute and terminal fixes)
+            awy_path: earth_awy.dat (airway segments between the above)
+            cell_size_deg: Grid cell size in degrees
+
+        Returns:
+            New NavDataStore
+        """
+        records: list[dict[str, Any]] = []
+        if nav_path:
+            records.extend(cls._parse_xplane_navaids(Path(nav_path)))
+        if fix_path:
+            records.extend(cls._parse_xplane_fixes(Path(fix_path)))
+
+        airways: list[tuple[int, int, str, int]] = []
+        if awy_path:
+            airways = cls._parse_xplane_airways(Path(awy_path), records)
+
+        logger.info(
+            "Parsed %d navaids/fixes and %d airway edges from X-Plane data",
+            len(records),
+            len(airways),
+        )
+        return cls.from_records(records, airways, cell_size_deg=cell_size_deg)
+
+    @staticmethod
+    def _parse_xplane_navaids(path: Path) -> list[dict[str, Any]]:
+        """Parse VOR, NDB and DME stations from earth_nav.dat.
+
+        Args:
+            path: File path
+
+        Returns:
+            Navaid records
+        """
+        version, lines = _read_xplane_lines(path)
+        records = []
+        skipped = 0
+        for parts in lines:
+            try:
+                navaid_type = XPLANE_NAV_TYPES.get(int(parts[0]))
+                if navaid_type is None:
+                    continue
+
+                # 1100+: ... ident airport region name; older formats: ... ident name
+                if version >= 1100:
+                    ident, region, name = parts[7], parts[9], " ".join(parts[10:])
+                else:
+                    ident, region, name = parts[7], "", " ".join(parts[8:])
+
+                frequency = float(parts[4])
+                if navaid_type != "NDB":
+                    frequency /= 100.0  # 11680 -> 116.80 MHz; NDBs are in kHz
+
+                records.append(
+                    {
+                        "ident": ident,
+                        "region": region,
+                        "type": navaid_type,
+                        "name": name,
+                        "lat": float(parts[1]),
+                        "lon": float(parts[2]),
+                        "elevation_m": float(parts[3]) * 0.3048,
+                        "frequency": frequency,
+                        "range_nm": float(parts[5]),
+                    }
+                )
+            except (IndexError, ValueError):
+                skipped += 1
+
+        if skipped:
+            logger.warning("Skipped %d invalid rows in %s", skipped, path)
+        return records
+
+    @staticmethod
+    def _parse_xplane_fixes(path: Path) -> list[dict[str, Any]]:
+        """Parse fixes from earth_fix.dat.
+
+        Args:
+            path: File path
+
+        Returns:
+            Fix records
+        """
+        _, lines = _read_xplane_lines(path)
+        records = []
+        skipped = 0
+        for parts in lines:
+            try:
+                records.append(
+                    {
+                        "ident": parts[2],
+                        "region": parts[4] if len(parts) > 4 else "",
+                        "type": "FIX",
+                        "lat": float(parts[0]),
+                        "lon": float(parts[1]),
+                    }
+                )
+            except (IndexError, ValueError):
+                skipped += 1
+
+        if skipped:
+            logger.warning("Skipped %d invalid rows in %s", skipped, path)
+        return records
+
+    @staticmethod
+    def _parse_xplane_airways(
+        path: Path, records: list[dict[str, Any]]
+    ) -> list[tuple[int, int, str, int]]:
+        """Parse airway segments from earth_awy.dat (format 1100+).
+
+        Each line is ``ident region type ident region type direction level
+        base top names`` where direction is N (both ways), F (forward only)
+        or B (backward only) and names are hyphen-separated airways sharing
+        the segment.
+
+        Args:
+            path: File path
+            records: Navaid/fix records the segments refer to
+
+        Returns:
+            Directed edges (from_record, to_record, airway, level)
+        """
+        version, lines = _read_xplane_lines(path)
+        if version and version < 1100:
+            logger.warning("Unsupported airway file format %d in %s", version, path)
+            return []
+
+        lookup: dict[tuple[str, str, str], int] = {}
+        for i, record in enumerate(records):
+            lookup.setdefault((record["ident"], record["region"], record["type"]), i)
+
+        def resolve(ident: str, region: str, type_code: str) -> int | None:
+            navaid_type = XPLANE_AIRWAY_FIX_TYPES.get(int(type_code), "FIX")
+            row = lookup.get((ident, region, navaid_type))
+            if row is None and navaid_type == "VOR":
+                row = lookup.get((ident, region, "DME"))
+            return row
+
+        edges = []
+        unresolved = 0
+        for parts in lines:
+            try:
+                start = resolve(parts[0], parts[1], parts[2])
+                end = resolve(parts[3], parts[4], parts[5])
+                direction, level = parts[6], int(parts[7])
+                names = parts[10].split("-")
+            except (IndexError, ValueError):
+                unresolved += 1
+                continue
+
+            if start is None or end is None:
+                unresolved += 1
+                continue
+
+            for name in names:
+                if direction in ("N", "F"):
+                    edges.append((start, end, name, level))
+                if direction in ("N", "B"):
+                    edges.append((end, start, name, level))
+
+        if unresolved:
+            logger.warning("Skipped %d airway segments with unknown fixes in %s", unresolved, path)
+        return edges
+
+    def save(self, path: str | Path) -> None:
+        """Save the store as an uncompressed columnar .npz file.
+
+        Args:
+            path: Output file path
+        """
+        type_blob, type_offsets = _encode_strings(self.types)
+        airway_blob, airway_offsets = _encode_strings(self.airway_names)
+        np.savez(
+            path,
+            version=np.array(NAVDATA_STORE_VERSION),
+            cell_size_deg=np.array(self.cell_size_deg),
+            type_blob=type_blob,
+            type_offsets=type_offsets,
+            ident=self.ident,
+            region=self.region,
+            type_code=self.type_code,
+            lat=self.lat,
+            lon=self.lon,
+            elevation_m=self.elevation_m,
+            frequency=self.frequency,
+            range_nm=self.range_nm,
+            bucket=self.bucket,
+            name_blob=self._name_blob,
+            name_offsets=self._name_offsets,
+            ident_order=self.ident_order,
+            edge_offsets=self.edge_offsets,
+            edge_to=self.edge_to,
+            edge_airway=self.edge_airway,
+            edge_level=self.edge_level,
+            airway_blob=airway_blob,
+            airway_offsets=airway_offsets,
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "NavDataStore":
+        """Load a store saved with save().
+
+        Args:
+            path: .npz file path
+
+        Returns:
+            Loaded NavDataStore
+
+        Raises:
+            ValueError: If the file version is not supported
+        """
+        with np.load(path) as data:
+            version = int(data["version"])
+            if version != NAVDATA_STORE_VERSION:
+                raise ValueError(f"Unsupported navdata store version {version} in {path}")
+            columns = {key: data[key] for key in data.files if key != "version"}
+
+        return cls(columns, float(columns.pop("cell_size_deg")))
+
+    def __len__(self) -> int:
+        """Get number of navaids and fixes."""
+        return len(self.lat)
+
+    @staticmethod
+    def _bucket_keys(
+        lat: npt.NDArray[np.float64],
+        lon: npt.NDArray[np.float64],
+        type_code: npt.NDArray[np.uint8],
+        cell_size_deg: float,
+    ) -> npt.NDArray[np.int64]:
+        """Compute (type, row, col) bucket keys.
+
+        Args:
+            lat: Latitudes in degrees
+            lon: Longitudes in degrees
+            type_code: Type codes
+            cell_size_deg: Grid cell size in degrees
+
+        Returns:
+            Sortable int64 bucket keys
+        """
+        rows = int(math.ceil(180.0 / cell_size_deg))
+        cols = int(math.ceil(360.0 / cell_size_deg))
+        row = np.clip(np.floor((lat + 90.0) / cell_size_deg), 0, rows - 1).astype(np.int64)
+        col = np.clip(np.floor((lon + 180.0) / cell_size_deg), 0, cols - 1).astype(np.int64)
+        result: npt.NDArray[np.int64] = (type_code.astype(np.int64) * rows + row) * cols + col
+        return result
+
+    def _type_codes(self, types: Iterable[str] | None) -> list[int]:
+        """Get the type codes of type names (None = all types).
+
+        Args:
+            types: NavaidType values, or None
+
+        Returns:
+            Type codes present in the store
+        """
+        if types is None:
+            return list(range(len(self.types)))
+        codes = {name: i for i, name in enumerate(self.types)}
+        return [codes[name] for name in types if name in codes]
+
+    def _candidate_slices(
+        self, lat: float, lon: float, radius_nm: float, type_codes: list[int]
+    ) -> list[slice]:
+        """Get the row slices of all buckets that may contain matches.
+
+        Args:
+            lat: Center latitude in degrees
+            lon: Center longitude in degrees
+            radius_nm: Search radius in nautical miles
+            type_codes: Type codes to search
+
+        Returns:
+            List of slices into the sorted columns
+        """
+        radius_deg = radius_nm / 60.0
+        row_min = max(int(math.floor((lat - radius_deg + 90.0) / self.cell_size_deg)), 0)
+        row_max = min(
+            int(math.floor((lat + radius_deg + 90.0) / self.cell_size_deg)), self.rows - 1
+        )
+
+        # Longitude half-width grows with latitude; near the poles take all columns
+        max_abs_lat = min(abs(lat) + radius_deg, 90.0)
+        cos_lat = math.cos(math.radians(max_abs_lat))
+        if cos_lat < 1e-6 or radius_deg / cos_lat >= 180.0:
+            col_ranges = [(0, self.cols - 1)]
+        else:
+            half_width = radius_deg / cos_lat
+            col_min = int(math.floor((lon - half_width + 180.0) / self.cell_size_deg))
+            col_max = int(math.floor((lon + half_width + 180.0) / self.cell_size_deg))
+            if col_min < 0:
+                col_ranges = [(0, col_max), (col_min + self.cols, self.cols - 1)]
+            elif col_max >= self.cols:
+                col_ranges = [(col_min, self.cols - 1), (0, col_max - self.cols)]
+            else:
+                col_ranges = [(col_min, col_max)]
+
+        starts = []
+        ends = []
+        for code in type_codes:
+            for row in range(row_min, row_max + 1):
+                base = (code * self.rows + row) * self.cols
+                for col_min, col_max in col_ranges:
+                    starts.append(base + col_min)
+                    ends.append(base + col_max + 1)
+
+        lo = np.searchsorted(self.bucket, starts, side="left")
+        hi = np.searchsorted(self.bucket, ends, side="left")
+        return [slice(a, b) for a, b in zip(lo.tolist(), hi.tolist(), strict=True) if b > a]
+
+    def query_radius(
+        self, lat: float, lon: float, radius_nm: float, types: Iterable[str] | None = None
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]]:
+        """Find navaids and fixes within a radius.
+
+        Args:
+            lat: Center latitude in degrees
+            lon: Center longitude in degrees
+            radius_nm: Search radius in nautical miles
+            types: NavaidType values to include (None = all types)
+
+        Returns:
+            (rows, distances_nm) sorted by distance
+        """
+        slices = self._candidate_slices(lat, lon, radius_nm, self._type_codes(types))
+        if not slices:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        candidates = np.concatenate([np.arange(s.start, s.stop) for s in slices])
+        distances = haversine_distances_nm(lat, lon, self.lat[candidates], self.lon[candidates])
+
+        within = distances <= radius_nm
+        candidates = candidates[within]
+        distances = distances[within]
+        order = np.argsort(distances, kind="stable")
+        return candidates[order], distances[order]
+
+    def query_nearest(
+        self,
+        lat: float,
+        lon: float,
+        count: int,
+        types: Iterable[str] | None = None,
+        max_distance_nm: float = 1000.0,
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]]:
+        """Find the nearest navaids and fixes using expanding search radii.
+
+        Args:
+            lat: Center latitude in degrees
+            lon: Center longitude in degrees
+            count: Maximum number of results
+            types: NavaidType values to include (None = all types)
+            max_distance_nm: Maximum search distance
+
+        Returns:
+            (rows, distances_nm) sorted by distance
+        """
+        type_list = list(types) if types is not None else None
+        radius = min(self.cell_size_deg * 60.0, max_distance_nm)
+
+        while True:
+            rows, distances = self.query_radius(lat, lon, radius, type_list)
+            if len(rows) >= count or radius >= max_distance_nm:
+                return rows[:count], distances[:count]
+            radius = min(radius * 4.0, max_distance_nm)
+
+    def find(self, ident: str) -> npt.NDArray[np.int64]:
+        """Find all rows with an identifier.
+
+        Identifiers are not unique worldwide (e.g., the same fix name in
+        several regions), so several rows can match.
+
+        Args:
+            ident: Identifier (case-sensitive)
+
+        Returns:
+            Matching rows
+        """
+        key = ident.encode("ascii", "replace")
+        lo = np.searchsorted(self._ident_sorted, key, side="left")
+        hi = np.searchsorted(self._ident_sorted, key, side="right")
+        rows: npt.NDArray[np.int64] = self.ident_order[lo:hi]
+        return rows
+
+    def type_rows(self, navaid_type: str) -> npt.NDArray[np.int64]:
+        """Get all rows of a type (a contiguous partition).
+
+        Args:
+            navaid_type: NavaidType value (e.g., "VOR")
+
+        Returns:
+            Rows of that type
+        """
+        codes = self._type_codes([navaid_type])
+        if not codes:
+            return np.empty(0, dtype=np.int64)
+        return np.arange(self.type_starts[codes[0]], self.type_starts[codes[0] + 1])
+
+    def name(self, row: int) -> str:
+        """Get the name of a row (empty for fixes).
+
+        Args:
+            row: Row index
+
+        Returns:
+            Name
+        """
+        start, end = self._name_offsets[row], self._name_offsets[row + 1]
+        return bytes(self._name_blob[start:end]).decode("utf-8")
+
+    def type_name(self, row: int) -> str:
+        """Get the NavaidType value of a row.
+
+        Args:
+            row: Row index
+
+        Returns:
+            Type name (e.g., "VOR")
+        """
+        return self.types[int(self.type_code[row])]
+
+    def airway_id(self, airway: str) -> int | None:
+        """Get the id of an airway name.
+
+        Args:
+            airway: Airway name (e.g., "V25")
+
+        Returns:
+            Airway id, or None if unknown
+        """
+        return self._airway_ids.get(airway)
+
+    def airway_neighbors(self, row: int, airway: str | None = None) -> npt.NDArray[np.int32]:
+        """Get the rows reachable in one airway segment.
+
+        Args:
+            row: Row index
+            airway: Only follow this airway (None = any airway)
+
+        Returns:
+            Neighbor rows
+        """
+        start, end = self.edge_offsets[row], self.edge_offsets[row + 1]
+        neighbors = self.edge_to[start:end]
+        if airway is not None:
+            neighbors = neighbors[self.edge_airway[start:end] == self._airway_ids.get(airway, -1)]
+        return neighbors
+
+    def airways_at(self, row: int) -> list[str]:
+        """Get the airways leaving a row.
+
+        Args:
+            row: Row index
+
+        Returns:
+            Sorted airway names
+        """
+        start, end = self.edge_offsets[row], self.edge_offsets[row + 1]
+        return sorted({self.airway_names[i] for i in self.edge_airway[start:end].tolist()})
+
+    def airway_path(self, airway: str, entry_row: int, exit_row: int) -> list[int] | None:
+        """Get the fixes along an airway between two of its fixes.
+
+        Args:
+            airway: Airway name
+            entry_row: Row where the airway is joined
+            exit_row: Row where the airway is left
+
+        Returns:
+            Rows from entry to exit (both included), or None if the exit
+            cannot be reached along the airway in its allowed direction
+        """
+        airway_id = self._airway_ids.get(airway)
+        if airway_id is None:
+            return None
+
+        previous = {entry_row: entry_row}
+        queue = deque([entry_row])
+        while queue:
+            row = queue.popleft()
+            if row == exit_row:
+                path = [row]
+                while row != entry_row:
+                    row = previous[row]
+                    path.append(row)
+                return path[::-1]
+
+            start, end = self.edge_offsets[row], self.edge_offsets[row + 1]
+            on_airway = self.edge_airway[start:end] == airway_id
+            for neighbor in self.edge_to[start:end][on_airway].tolist():
+                if neighbor not in previous:
+                    previous[neighbor] = row
+                    queue.append(neighbor)
+        return None
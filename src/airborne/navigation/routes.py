@@ -8,13 +8,29 @@ Typical usage:
 
     provider = OpenFlightsProvider()
     routes = provider.find_routes("KJFK", "EGLL")
+    itinerary = provider.find_itinerary("BOD", "SYD", metric="distance")
 """
 
 import csv
+import heapq
 import logging
+import math
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from airborne.airports.airport_index import (
+    AirportIndex,
+    get_airport_index,
+    read_index_file,
+    write_index_file,
+)
+from airborne.airports.spatial_index import EARTH_RADIUS_NM, haversine_distances_nm
 
 logger = logging.getLogger(__name__)
 
@@ -110,46 +126,776 @@ class RouteProvider(ABC):
         pass
 
 
+@dataclass
+class Itinerary:
+    """Multi-leg journey between two airports found in the route graph.
+
+    Attributes:
+        airports: Airport codes from origin to destination
+        legs: Routes flying each leg (one list per leg, filtered by the
+            airlines and equipment the search was restricted to)
+        distance_nm: Great circle length in nautical miles (None when the
+            airport coordinates are unknown)
+
+    Examples:
+        >>> itinerary = provider.find_itinerary("BOD", "SYD")
+        >>> print(" - ".join(itinerary.airports))
+    """
+
+    airports: list[str]
+    legs: list[list[Route]]
+    distance_nm: float | None = None
+
+    @property
+    def leg_count(self) -> int:
+        """Get number of flights in the itinerary.
+
+        Returns:
+            Number of legs
+        """
+        return len(self.legs)
+
+
+def _parse_route_row(row: list[str]) -> Route | None:
+    """Parse one routes.dat row.
+
+    Args:
+        row: CSV fields
+
+    Returns:
+        Route, or None if the row is too short
+    """
+    if len(row) < 9:
+        return None
+
+    # Parse equipment list (space-separated), filter out \N
+    equipment = [e for e in row[8].split() if e != "\\N"] if row[8] and row[8] != "\\N" else []
+
+    return Route(
+        airline_code=row[0] if row[0] != "\\N" else "",
+        airline_id=row[1] if row[1] != "\\N" else "",
+        source_airport=row[2] if row[2] != "\\N" else "",
+        source_airport_id=row[3] if row[3] != "\\N" else "",
+        destination_airport=row[4] if row[4] != "\\N" else "",
+        destination_airport_id=row[5] if row[5] != "\\N" else "",
+        codeshare=(row[6] == "Y"),
+        stops=int(row[7]) if row[7].isdigit() else 0,
+        equipment=equipment,
+    )
+
+
+def _read_routes_file(path: Path) -> list[Route]:
+    """Parse an OpenFlights routes.dat file.
+
+    Args:
+        path: Path to routes.dat
+
+    Returns:
+        Routes in file order
+    """
+    routes = []
+    with open(path, encoding="utf-8") as f:
+        for row in csv.reader(f):
+            route = _parse_route_row(row)
+            if route is not None:
+                routes.append(route)
+    return routes
+
+
+def _code_table(codes: list[str]) -> npt.NDArray[np.bytes_]:
+    """Encode sorted codes as a fixed-width byte array for searchsorted()."""
+    encoded = [code.encode("utf-8") for code in codes]
+    width = max((len(code) for code in encoded), default=1)
+    return np.array(encoded, dtype=f"S{width}")
+
+
+def _set_bits(
+    bitsets: npt.NDArray[np.uint64], rows: npt.NDArray[np.int64], bits: npt.NDArray[np.int64]
+) -> None:
+    """Set one bit per (row, bit) pair in a 2D array of 64-bit words."""
+    values = np.left_shift(np.uint64(1), (bits % 64).astype(np.uint64))
+    np.bitwise_or.at(bitsets, (rows, bits // 64), values)
+
+
+def _format_id(value: int) -> str:
+    """Format an OpenFlights numeric id (-1 means \\N)."""
+    return str(value) if value >= 0 else ""
+
+
+def _parse_id(value: str) -> int:
+    """Parse an OpenFlights numeric id, -1 when missing."""
+    return int(value) if value.isdigit() else -1
+
+
+def _pair_distances_nm(
+    lats1: npt.NDArray[np.float64],
+    lons1: npt.NDArray[np.float64],
+    lats2: npt.NDArray[np.float64],
+    lons2: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Element-wise great circle distances in nautical miles (NaN propagates)."""
+    lat1 = np.radians(lats1)
+    lat2 = np.radians(lats2)
+    dlon = np.radians(lons2 - lons1)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    distances: npt.NDArray[np.float64] = (
+        2 * EARTH_RADIUS_NM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+    )
+    return distances
+
+
+class RouteIndex:
+    """Compiled route table and airport graph for fast lookups and routing.
+
+    Routes are stored as NumPy columns sorted by (source, destination)
+    airport, so the routes of an airport or an airport pair are contiguous
+    rows and Route objects are only created for rows that are returned.
+    Each distinct airport pair is an edge of a CSR graph (node_offsets,
+    edge_destination) carrying bitsets of the airlines and equipment
+    flying it, so itinerary searches filter edges without visiting routes.
+
+    The index is saved next to routes.dat as routes.idx and memory-mapped
+    on later loads; it is rebuilt when routes.dat changes.
+
+    Attributes:
+        airports: Sorted airport codes (graph node table)
+        airlines: Sorted airline codes (airline bit table)
+        equipment: Sorted equipment codes (equipment bit table)
+
+    Examples:
+        >>> index = RouteIndex.from_file("data/navigation/routes.dat")
+        >>> index.destinations_from("BOD")[:3]
+        ['AGP', 'AJA', 'ALG']
+        >>> itinerary = index.find_itinerary("BOD", "NOU", max_legs=3)
+    """
+
+    FORMAT = "openflights-routes"
+    VERSION = 1
+
+    def __init__(
+        self, columns: dict[str, npt.NDArray[Any]], airlines: list[str], equipment: list[str]
+    ) -> None:
+        """Initialize from index columns.
+
+        Use from_routes(), from_file() or load() rather than calling this
+        directly.
+
+        Args:
+            columns: Index columns (see from_routes())
+            airlines: Airline code table
+            equipment: Equipment code table
+        """
+        self._columns = columns
+        self.airports: npt.NDArray[np.bytes_] = columns["airports"]
+        self.airlines = airlines
+        self.equipment = equipment
+
+        # Routes, sorted by (source, destination)
+        self.route_source: npt.NDArray[np.int32] = columns["route_source"]
+        self.route_destination: npt.NDArray[np.int32] = columns["route_destination"]
+        self.route_airline: npt.NDArray[np.int16] = columns["route_airline"]
+        self.route_airline_id: npt.NDArray[np.int32] = columns["route_airline_id"]
+        self.route_source_id: npt.NDArray[np.int32] = columns["route_source_id"]
+        self.route_destination_id: npt.NDArray[np.int32] = columns["route_destination_id"]
+        self.route_codeshare: npt.NDArray[np.bool_] = columns["route_codeshare"]
+        self.route_stops: npt.NDArray[np.int16] = columns["route_stops"]
+        self.route_equipment_offsets: npt.NDArray[np.int32] = columns["route_equipment_offsets"]
+        self.route_equipment: npt.NDArray[np.int16] = columns["route_equipment"]
+        self.source_offsets: npt.NDArray[np.int32] = columns["source_offsets"]
+
+        # Airport graph: edges of node i are node_offsets[i]:node_offsets[i + 1]
+        self.node_offsets: npt.NDArray[np.int32] = columns["node_offsets"]
+        self.edge_destination: npt.NDArray[np.int32] = columns["edge_destination"]
+        self.edge_row_start: npt.NDArray[np.int32] = columns["edge_row_start"]
+        self.edge_row_end: npt.NDArray[np.int32] = columns["edge_row_end"]
+        self.edge_airlines: npt.NDArray[np.uint64] = columns["edge_airlines"]
+        self.edge_equipment: npt.NDArray[np.uint64] = columns["edge_equipment"]
+
+        self._airline_bits = {code: bit for bit, code in enumerate(airlines)}
+        self._equipment_bits = {code: bit for bit, code in enumerate(equipment)}
+        self._adjacency: tuple[list[int], list[int]] | None = None
+        self.node_lat: npt.NDArray[np.float64] | None = None
+        self.node_lon: npt.NDArray[np.float64] | None = None
+        self._edge_distances: npt.NDArray[np.float64] | None = None
+
+    @classmethod
+    def from_routes(cls, routes: Iterable[Route]) -> "RouteIndex":
+        """Build an index from routes.
+
+        Args:
+            routes: Routes (e.g. parsed from routes.dat)
+
+        Returns:
+            New RouteIndex
+        """
+        route_list = list(routes)
+        codes = sorted(
+            ({r.source_airport for r in route_list} | {r.destination_airport for r in route_list})
+            - {""}
+        )
+        node_ids = {code: node for node, code in enumerate(codes)}
+        num_nodes = len(codes)
+
+        # Routes without a source/destination airport sort last (node = num_nodes)
+        source = np.array(
+            [node_ids.get(r.source_airport, num_nodes) for r in route_list], dtype=np.int32
+        )
+        destination = np.array(
+            [node_ids.get(r.destination_airport, num_nodes) for r in route_list], dtype=np.int32
+        )
+        order = np.lexsort((destination, source))
+        route_list = [route_list[i] for i in order]
+        source = source[order]
+        destination = destination[order]
+        num_routes = len(route_list)
+
+        airlines = sorted({r.airline_code for r in route_list})
+        equipment = sorted({e for r in route_list for e in r.equipment})
+        airline_bits = {code: bit for bit, code in enumerate(airlines)}
+        equipment_bits = {code: bit for bit, code in enumerate(equipment)}
+
+        route_airline = np.array([airline_bits[r.airline_code] for r in route_list], dtype=np.int16)
+        equipment_counts = np.array([len(r.equipment) for r in route_list], dtype=np.int64)
+        equipment_offsets = np.zeros(num_routes + 1, dtype=np.int32)
+        np.cumsum(equipment_counts, out=equipment_offsets[1:])
+        route_equipment = np.array(
+            [equipment_bits[e] for r in route_list for e in r.equipment], dtype=np.int16
+        )
+
+        # One edge per distinct (source, destination) pair; its routes are contiguous
+        valid = np.flatnonzero((source < num_nodes) & (destination < num_nodes))
+        keys = source[valid].astype(np.int64) * max(num_nodes, 1) + destination[valid]
+        _, first, counts = np.unique(keys, return_index=True, return_counts=True)
+        edge_row_start = valid[first].astype(np.int32)
+        edge_row_end = (edge_row_start + counts).astype(np.int32)
+        edge_source = source[edge_row_start]
+        num_edges = len(edge_row_start)
+
+        edge_of_row = np.full(num_routes, -1, dtype=np.int64)
+        edge_of_row[valid] = np.repeat(np.arange(num_edges), counts)
+
+        edge_airlines = np.zeros((num_edges, max(1, -(-len(airlines) // 64))), dtype=np.uint64)
+        _set_bits(edge_airlines, edge_of_row[valid], route_airline[valid].astype(np.int64))
+
+        edge_equipment = np.zeros((num_edges, max(1, -(-len(equipment) // 64))), dtype=np.uint64)
+        entry_edges = np.repeat(edge_of_row, equipment_counts)
+        on_edge = entry_edges >= 0
+        _set_bits(edge_equipment, entry_edges[on_edge], route_equipment[on_edge].astype(np.int64))
+
+        columns: dict[str, npt.NDArray[Any]] = {
+            "airports": _code_table(codes),
+            "route_source": source,
+            "route_destination": destination,
+            "route_airline": route_airline,
+            "route_airline_id": np.array(
+                [_parse_id(r.airline_id) for r in route_list], dtype=np.int32
+            ),
+            "route_source_id": np.array(
+                [_parse_id(r.source_airport_id) for r in route_list], dtype=np.int32
+            ),
+            "route_destination_id": np.array(
+                [_parse_id(r.destination_airport_id) for r in route_list], dtype=np.int32
+            ),
+            "route_codeshare": np.array([r.codeshare for r in route_list], dtype=np.bool_),
+            "route_stops": np.array([r.stops for r in route_list], dtype=np.int16),
+            "route_equipment_offsets": equipment_offsets,
+            "route_equipment": route_equipment,
+            "source_offsets": np.searchsorted(source, np.arange(num_nodes + 1)).astype(np.int32),
+            "node_offsets": np.searchsorted(edge_source, np.arange(num_nodes + 1)).astype(np.int32),
+            "edge_destination": destination[edge_row_start],
+            "edge_row_start": edge_row_start,
+            "edge_row_end": edge_row_end,
+            "edge_airlines": edge_airlines,
+            "edge_equipment": edge_equipment,
+        }
+        return cls(columns, airlines, equipment)
+
+    @classmethod
+    def from_file(cls, path: Path | str) -> "RouteIndex":
+        """Load routes.dat, from its compiled index when it is up to date.
+
+        The index file (same name with an .idx suffix) is rebuilt when it
+        is missing, invalid, or was built from a routes file with a
+        different size or modification time.
+
+        Args:
+            path: Path to routes.dat
+
+        Returns:
+            RouteIndex for the file
+
+        Raises:
+            OSError: If routes.dat cannot be read
+        """
+        path = Path(path)
+        index_path = path.with_suffix(".idx")
+        stat = path.stat()
+        source = {"routes_size": stat.st_size, "routes_mtime_ns": stat.st_mtime_ns}
+
+        if index_path.exists():
+            try:
+                metadata, columns = read_index_file(index_path)
+                if all(metadata.get(key) == value for key, value in source.items()):
+                    return cls._from_index_data(metadata, columns, index_path)
+                logger.info("Routes file changed, rebuilding index")
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring invalid route index {index_path}: {e}")
+
+        index = cls.from_routes(_read_routes_file(path))
+        try:
+            index.save(index_path, source)
+        except OSError as e:
+            logger.warning(f"Could not write route index {index_path}: {e}")
+        return index
+
+    def save(self, path: Path | str, source: dict[str, Any] | None = None) -> None:
+        """Write the index to a memory-mappable file.
+
+        Args:
+            path: Output path
+            source: Extra metadata identifying the source file
+        """
+        metadata = {
+            **(source or {}),
+            "format": self.FORMAT,
+            "format_version": self.VERSION,
+            "airlines": self.airlines,
+            "equipment": self.equipment,
+        }
+        write_index_file(Path(path), self._columns, metadata)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "RouteIndex":
+        """Memory-map an index written by save().
+
+        Args:
+            path: Index file path
+
+        Returns:
+            Loaded RouteIndex
+
+        Raises:
+            ValueError: If the file is not a supported route index
+        """
+        metadata, columns = read_index_file(Path(path))
+        return cls._from_index_data(metadata, columns, path)
+
+    @classmethod
+    def _from_index_data(
+        cls, metadata: dict[str, Any], columns: dict[str, npt.NDArray[Any]], path: Path | str
+    ) -> "RouteIndex":
+        """Create an index from read_index_file() output after checking its format."""
+        if metadata.get("format") != cls.FORMAT or metadata.get("format_version") != cls.VERSION:
+            raise ValueError(f"Not a supported route index: {path}")
+        return cls(columns, metadata["airlines"], metadata["equipment"])
+
+    @property
+    def route_count(self) -> int:
+        """Get number of routes."""
+        return len(self.route_source)
+
+    @property
+    def airport_count(self) -> int:
+        """Get number of airports (graph nodes)."""
+        return len(self.airports)
+
+    @property
+    def edge_count(self) -> int:
+        """Get number of distinct airport pairs (graph edges)."""
+        return len(self.edge_destination)
+
+    def find_airport(self, code: str) -> int | None:
+        """Find the graph node of an airport code.
+
+        Args:
+            code: Airport code as it appears in routes.dat
+
+        Returns:
+            Node index, or None if the airport has no routes
+        """
+        key = code.encode("utf-8")
+        if not key or len(key) > self.airports.dtype.itemsize:
+            return None
+        node = int(np.searchsorted(self.airports, key))
+        if node < len(self.airports) and self.airports[node] == key:
+            return node
+        return None
+
+    def airport_code(self, node: int) -> str:
+        """Get the airport code of a graph node.
+
+        Args:
+            node: Node index
+
+        Returns:
+            Airport code
+        """
+        return bytes(self.airports[node]).decode("utf-8")
+
+    def route_at(self, row: int) -> Route:
+        """Create the Route stored at a row.
+
+        Args:
+            row: Route row
+
+        Returns:
+            Route object
+        """
+        source = int(self.route_source[row])
+        destination = int(self.route_destination[row])
+        start = int(self.route_equipment_offsets[row])
+        end = int(self.route_equipment_offsets[row + 1])
+        return Route(
+            airline_code=self.airlines[self.route_airline[row]],
+            airline_id=_format_id(int(self.route_airline_id[row])),
+            source_airport=self.airport_code(source) if source < self.airport_count else "",
+            source_airport_id=_format_id(int(self.route_source_id[row])),
+            destination_airport=(
+                self.airport_code(destination) if destination < self.airport_count else ""
+            ),
+            destination_airport_id=_format_id(int(self.route_destination_id[row])),
+            codeshare=bool(self.route_codeshare[row]),
+            stops=int(self.route_stops[row]),
+            equipment=[self.equipment[i] for i in self.route_equipment[start:end]],
+        )
+
+    def routes_from(self, airport: str) -> list[Route]:
+        """Get all routes departing an airport.
+
+        Args:
+            airport: Source airport code
+
+        Returns:
+            Routes, ordered by destination
+        """
+        node = self.find_airport(airport)
+        if node is None:
+            return []
+        start, end = self.source_offsets[node], self.source_offsets[node + 1]
+        return [self.route_at(row) for row in range(start, end)]
+
+    def routes_between(
+        self, from_airport: str, to_airport: str, direct_only: bool = False
+    ) -> list[Route]:
+        """Get routes between two airports.
+
+        Args:
+            from_airport: Source airport code
+            to_airport: Destination airport code
+            direct_only: Only return routes without stops
+
+        Returns:
+            Routes in routes.dat order
+        """
+        source = self.find_airport(from_airport)
+        destination = self.find_airport(to_airport)
+        if source is None or destination is None:
+            return []
+        edge = self._find_edge(source, destination)
+        if edge is None:
+            return []
+        return [
+            self.route_at(row)
+            for row in range(self.edge_row_start[edge], self.edge_row_end[edge])
+            if not direct_only or self.route_stops[row] == 0
+        ]
+
+    def airports_with_routes(self) -> list[str]:
+        """Get airports with at least one departing route.
+
+        Returns:
+            Sorted airport codes
+        """
+        nodes = np.flatnonzero(np.diff(self.source_offsets) > 0)
+        return [self.airport_code(int(node)) for node in nodes]
+
+    def destinations_from(self, airport: str) -> list[str]:
+        """Get airports served nonstop from an airport.
+
+        Args:
+            airport: Source airport code
+
+        Returns:
+            Sorted destination airport codes
+        """
+        node = self.find_airport(airport)
+        if node is None:
+            return []
+        edges = self.edge_destination[self.node_offsets[node] : self.node_offsets[node + 1]]
+        return [self.airport_code(int(destination)) for destination in edges]
+
+    def _find_edge(self, source: int, destination: int) -> int | None:
+        """Find the edge between two nodes (destinations are sorted per node)."""
+        start, end = int(self.node_offsets[source]), int(self.node_offsets[source + 1])
+        edge = start + int(np.searchsorted(self.edge_destination[start:end], destination))
+        if edge < end and self.edge_destination[edge] == destination:
+            return edge
+        return None
+
+    @property
+    def has_coordinates(self) -> bool:
+        """Check whether airport coordinates were set for distance routing."""
+        return self._edge_distances is not None
+
+    def set_coordinates(self, lookup: Callable[[str], tuple[float, float] | None]) -> int:
+        """Set airport coordinates and precompute edge lengths.
+
+        Args:
+            lookup: Returns (latitude, longitude) in degrees for an airport
+                code, or None if unknown
+
+        Returns:
+            Number of airports with coordinates
+        """
+        lat = np.full(self.airport_count, np.nan)
+        lon = np.full(self.airport_count, np.nan)
+        for node in range(self.airport_count):
+            coordinates = lookup(self.airport_code(node))
+            if coordinates is not None:
+                lat[node], lon[node] = coordinates
+
+        edge_source = np.repeat(np.arange(self.airport_count), np.diff(self.node_offsets))
+        self.node_lat = lat
+        self.node_lon = lon
+        self._edge_distances = _pair_distances_nm(
+            lat[edge_source],
+            lon[edge_source],
+            lat[self.edge_destination],
+            lon[self.edge_destination],
+        )
+        return int(np.count_nonzero(~np.isnan(lat)))
+
+    def find_itinerary(
+        self,
+        origin: str,
+        destination: str,
+        metric: str = "hops",
+        airlines: Iterable[str] | None = None,
+        equipment: Iterable[str] | None = None,
+        max_legs: int | None = None,
+    ) -> Itinerary | None:
+        """Find the shortest multi-leg itinerary between two airports.
+
+        "hops" minimizes the number of flights (Dijkstra with unit
+        weights); "distance" minimizes great circle distance with A* and
+        needs set_coordinates() first. Airports without coordinates are
+        skipped by distance searches.
+
+        Args:
+            origin: Departure airport code
+            destination: Arrival airport code
+            metric: "hops" or "distance"
+            airlines: Only use legs flown by these airline codes
+            equipment: Only use legs flown with these aircraft types
+            max_legs: Maximum number of flights
+
+        Returns:
+            Shortest itinerary, or None if the airports are not connected
+
+        Raises:
+            ValueError: If the metric is unknown, or "distance" is used
+                without coordinates
+        """
+        if metric not in ("hops", "distance"):
+            raise ValueError(f"Unknown routing metric: {metric}")
+
+        start = self.find_airport(origin)
+        goal = self.find_airport(destination)
+        if start is None or goal is None:
+            return None
+
+        airline_set = set(airlines) if airlines is not None else None
+        equipment_set = set(equipment) if equipment is not None else None
+        allowed = np.ones(self.edge_count, dtype=np.bool_)
+        if airline_set is not None:
+            allowed &= self._edges_with_any(self.edge_airlines, self._airline_bits, airline_set)
+        if equipment_set is not None:
+            allowed &= self._edges_with_any(
+                self.edge_equipment, self._equipment_bits, equipment_set
+            )
+
+        weights = None
+        heuristic = None
+        if metric == "distance":
+            if self._edge_distances is None or self.node_lat is None or self.node_lon is None:
+                raise ValueError("Distance routing needs airport coordinates (set_coordinates)")
+            allowed &= ~np.isnan(self._edge_distances)
+            weights = self._edge_distances.tolist()
+            # Great circle distance to the goal never overestimates: admissible
+            heuristic = np.nan_to_num(
+                haversine_distances_nm(
+                    float(self.node_lat[goal]),
+                    float(self.node_lon[goal]),
+                    self.node_lat,
+                    self.node_lon,
+                )
+            ).tolist()
+
+        edges = self._search(start, goal, allowed.tolist(), weights, heuristic, max_legs)
+        if edges is None:
+            return None
+
+        airports = [self.airport_code(start)]
+        airports.extend(self.airport_code(int(self.edge_destination[edge])) for edge in edges)
+        legs = [self._edge_routes(edge, airline_set, equipment_set) for edge in edges]
+
+        distance_nm = None
+        if self._edge_distances is not None:
+            total = float(self._edge_distances[edges].sum())
+            distance_nm = None if math.isnan(total) else total
+        return Itinerary(airports=airports, legs=legs, distance_nm=distance_nm)
+
+    def _edges_with_any(
+        self, bitsets: npt.NDArray[np.uint64], bits: dict[str, int], codes: set[str]
+    ) -> npt.NDArray[np.bool_]:
+        """Get a mask of the edges whose bitset contains any of the codes."""
+        mask = np.zeros(bitsets.shape[1], dtype=np.uint64)
+        for code in codes:
+            bit = bits.get(code)
+            if bit is not None:
+                mask[bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+        result: npt.NDArray[np.bool_] = np.any(bitsets & mask, axis=1)
+        return result
+
+    def _edge_routes(
+        self, edge: int, airlines: set[str] | None, equipment: set[str] | None
+    ) -> list[Route]:
+        """Get the routes of an edge matching the airline/equipment filters."""
+        routes = []
+        for row in range(self.edge_row_start[edge], self.edge_row_end[edge]):
+            route = self.route_at(row)
+            if airlines is not None and route.airline_code not in airlines:
+                continue
+            if equipment is not None and equipment.isdisjoint(route.equipment):
+                continue
+            routes.append(route)
+        return routes
+
+    def _get_adjacency(self) -> tuple[list[int], list[int]]:
+        """Get the CSR graph as Python lists (faster to walk than arrays)."""
+        if self._adjacency is None:
+            self._adjacency = (self.node_offsets.tolist(), self.edge_destination.tolist())
+        return self._adjacency
+
+    def _search(
+        self,
+        start: int,
+        goal: int,
+        allowed: list[bool],
+        weights: list[float] | None,
+        heuristic: list[float] | None,
+        max_legs: int | None,
+    ) -> list[int] | None:
+        """Run Dijkstra/A* over the airport graph.
+
+        With max_legs, search states are (airport, legs flown): a state is
+        only dropped when the airport was already reached more cheaply with
+        no more legs, so a costlier path with fewer legs can still win.
+
+        Args:
+            start: Start node
+            goal: Goal node
+            allowed: Per-edge usability
+            weights: Per-edge cost (None for unit weights)
+            heuristic: Per-node lower bound of the cost to the goal
+            max_legs: Maximum number of edges
+
+        Returns:
+            Edges of the cheapest path, or None if the goal is unreachable
+        """
+        offsets, targets = self._get_adjacency()
+        step = 0 if max_legs is None else 1
+        settled: dict[int, int] = {}  # node -> fewest legs it was settled with
+        parents: dict[tuple[int, int], tuple[int, int, int]] = {}
+        heap: list[tuple[float, float, int, int, int, int, int]] = [
+            (heuristic[start] if heuristic is not None else 0.0, 0.0, 0, start, -1, -1, -1)
+        ]
+
+        while heap:
+            _, cost, legs, node, parent, parent_legs, via = heapq.heappop(heap)
+            if settled.get(node, legs + 1) <= legs:
+                continue
+            settled[node] = legs
+            parents[(node, legs)] = (parent, parent_legs, via)
+
+            if node == goal:
+                path = []
+                state = (node, legs)
+                while parents[state][2] >= 0:
+                    parent, parent_legs, via = parents[state]
+                    path.append(via)
+                    state = (parent, parent_legs)
+                path.reverse()
+                return path
+
+            if max_legs is not None and legs >= max_legs:
+                continue
+
+            next_legs = legs + step
+            for edge in range(offsets[node], offsets[node + 1]):
+                target = targets[edge]
+                if not allowed[edge] or settled.get(target, next_legs + 1) <= next_legs:
+                    continue
+                next_cost = cost + (weights[edge] if weights is not None else 1.0)
+                estimate = next_cost + (heuristic[target] if heuristic is not None else 0.0)
+                heapq.heappush(heap, (estimate, next_cost, next_legs, target, node, legs, edge))
+
+        return None
+
+
 class OpenFlightsProvider(RouteProvider):
     """Route provider using OpenFlights database.
 
     Downloads and caches routes from the OpenFlights project, which contains
     67,663 routes between 3,321 airports on 548 airlines (as of June 2014).
 
+    Routes are served from a RouteIndex compiled from routes.dat on first
+    use (routes.idx next to it), so later launches memory-map the index
+    instead of parsing the CSV. Multi-leg itineraries are found with
+    find_itinerary().
+
     Note:
         Data is historical (last updated June 2014) but useful for realistic
         route generation in flight simulators.
 
     Attributes:
-        routes: List of all routes loaded from database
+        index: Compiled route index (None if routes.dat is missing)
+        routes: List of all routes loaded from database (created on access)
         routes_by_airport: Dictionary mapping airport codes to routes
 
     Examples:
         >>> provider = OpenFlightsProvider()
         >>> routes = provider.find_routes("KSFO", "KLAX")
         >>> print(f"Found {len(routes)} routes")
+        >>> itinerary = provider.find_itinerary("BOD", "SYD", metric="distance")
     """
 
     ROUTES_URL = "https://raw.githubusercontent.com/jpatokal/openflights/master/data/routes.dat"
     DEFAULT_CACHE_DIR = "data/navigation"
 
-    def __init__(self, routes_file: str | None = None) -> None:
+    def __init__(
+        self, routes_file: str | None = None, airport_index: AirportIndex | None = None
+    ) -> None:
         """Initialize OpenFlights route provider.
 
         Args:
             routes_file: Path to routes.dat file (downloads if not exists)
+            airport_index: Airport coordinates for distance routing
+                (defaults to the global airport index, loaded on first use)
         """
-        self.routes: list[Route] = []
-        self.routes_by_airport: dict[str, list[Route]] = {}
+        self.index: RouteIndex | None = None
+        self._airport_index = airport_index
+        self._routes: list[Route] | None = None
+        self._routes_by_airport: dict[str, list[Route]] | None = None
 
         if routes_file is None:
             routes_file = str(Path(self.DEFAULT_CACHE_DIR) / "routes.dat")
 
         self._load_routes(routes_file)
-        logger.info(f"Loaded {len(self.routes)} routes from OpenFlights database")
+        logger.info(f"Loaded {self.get_route_count()} routes from OpenFlights database")
 
     def _load_routes(self, file_path: str) -> None:
-        """Load routes from OpenFlights .dat file.
+        """Load routes from OpenFlights .dat file through its compiled index.
 
         Args:
             file_path: Path to routes.dat file
@@ -161,46 +907,36 @@ class OpenFlightsProvider(RouteProvider):
             return
 
         try:
-            with open(path, encoding="utf-8") as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if len(row) < 9:
-                        continue
-
-                    # Parse equipment list (space-separated), filter out \N
-                    equipment = (
-                        [e for e in row[8].split() if e != "\\N"]
-                        if row[8] and row[8] != "\\N"
-                        else []
-                    )
-
-                    route = Route(
-                        airline_code=row[0] if row[0] != "\\N" else "",
-                        airline_id=row[1] if row[1] != "\\N" else "",
-                        source_airport=row[2] if row[2] != "\\N" else "",
-                        source_airport_id=row[3] if row[3] != "\\N" else "",
-                        destination_airport=row[4] if row[4] != "\\N" else "",
-                        destination_airport_id=row[5] if row[5] != "\\N" else "",
-                        codeshare=(row[6] == "Y"),
-                        stops=int(row[7]) if row[7].isdigit() else 0,
-                        equipment=equipment,
-                    )
-
-                    self.routes.append(route)
-
-                    # Index by source airport for fast lookup
-                    if route.source_airport:
-                        if route.source_airport not in self.routes_by_airport:
-                            self.routes_by_airport[route.source_airport] = []
-                        self.routes_by_airport[route.source_airport].append(route)
-
+            self.index = RouteIndex.from_file(path)
             logger.info(
-                f"Loaded {len(self.routes)} routes covering {len(self.routes_by_airport)} airports"
+                f"Loaded {self.index.route_count} routes covering "
+                f"{len(self.index.airports_with_routes())} airports"
             )
 
         except Exception as e:
             logger.error(f"Error loading routes: {e}")
 
+    @property
+    def routes(self) -> list[Route]:
+        """Get all routes, grouped by source airport."""
+        if self._routes is None:
+            index = self.index
+            self._routes = (
+                [index.route_at(row) for row in range(index.route_count)] if index else []
+            )
+        return self._routes
+
+    @property
+    def routes_by_airport(self) -> dict[str, list[Route]]:
+        """Get routes indexed by source airport code."""
+        if self._routes_by_airport is None:
+            by_airport: dict[str, list[Route]] = {}
+            for route in self.routes:
+                if route.source_airport:
+                    by_airport.setdefault(route.source_airport, []).append(route)
+            self._routes_by_airport = by_airport
+        return self._routes_by_airport
+
     def find_routes(
         self,
         from_airport: str,
@@ -220,17 +956,9 @@ class OpenFlightsProvider(RouteProvider):
         Examples:
             >>> routes = provider.find_routes("KSFO", "KLAX", direct_only=True)
         """
-        if from_airport not in self.routes_by_airport:
+        if self.index is None:
             return []
-
-        matching_routes = []
-        for route in self.routes_by_airport[from_airport]:
-            if route.destination_airport == to_airport:
-                if direct_only and not route.is_direct():
-                    continue
-                matching_routes.append(route)
-
-        return matching_routes
+        return self.index.routes_between(from_airport, to_airport, direct_only)
 
     def get_route_count(self) -> int:
         """Get total number of routes in database.
@@ -238,7 +966,7 @@ class OpenFlightsProvider(RouteProvider):
         Returns:
             Number of routes
         """
-        return len(self.routes)
+        return self.index.route_count if self.index else 0
 
     def get_airports_with_routes(self) -> list[str]:
         """Get list of airports that have routes.
@@ -246,7 +974,7 @@ class OpenFlightsProvider(RouteProvider):
         Returns:
             List of airport codes with outbound routes
         """
-        return list(self.routes_by_airport.keys())
+        return self.index.airports_with_routes() if self.index else []
 
     def get_destinations_from(self, airport: str) -> list[str]:
         """Get all destination airports reachable from given airport.
@@ -257,12 +985,69 @@ class OpenFlightsProvider(RouteProvider):
         Returns:
             List of destination airport codes
         """
-        if airport not in self.routes_by_airport:
-            return []
+        return self.index.destinations_from(airport) if self.index else []
+
+    def find_itinerary(
+        self,
+        origin: str,
+        destination: str,
+        metric: str = "hops",
+        airlines: Iterable[str] | None = None,
+        equipment: Iterable[str] | None = None,
+        max_legs: int | None = None,
+    ) -> Itinerary | None:
+        """Find the shortest multi-leg itinerary between two airports.
 
-        destinations = set()
-        for route in self.routes_by_airport[airport]:
-            if route.destination_airport:
-                destinations.add(route.destination_airport)
+        Airport coordinates for the "distance" metric are looked up once,
+        by IATA code (3 letters) or ICAO code, in the airport index.
+
+        Args:
+            origin: Departure airport code
+            destination: Arrival airport code
+            metric: "hops" (fewest flights) or "distance" (shortest great
+                circle distance)
+            airlines: Only use legs flown by these airline codes
+            equipment: Only use legs flown with these aircraft types
+            max_legs: Maximum number of flights
+
+        Returns:
+            Shortest itinerary, or None if there is none
+
+        Examples:
+            >>> itinerary = provider.find_itinerary("BOD", "SYD", airlines=["AF", "QF"])
+        """
+        if self.index is None:
+            return None
+        if metric == "distance":
+            self.locate_airports()
+        return self.index.find_itinerary(origin, destination, metric, airlines, equipment, max_legs)
+
+    def locate_airports(self) -> int:
+        """Look up route airport coordinates once, for distances and positions.
+
+        Airports are located by IATA code (3 letters) or ICAO code in the
+        airport index; later calls reuse the coordinates.
+
+        Returns:
+            Number of route airports with coordinates
+        """
+        index = self.index
+        if index is None:
+            return 0
+        if not index.has_coordinates:
+            count = index.set_coordinates(self._airport_coordinates)
+            logger.info(f"Located {count} of {index.airport_count} route airports")
+        lat = index.node_lat
+        return int(np.count_nonzero(~np.isnan(lat))) if lat is not None else 0
 
-        return sorted(destinations)
+    def _airport_coordinates(self, code: str) -> tuple[float, float] | None:
+        """Look up an airport's (latitude, longitude) by IATA or ICAO code."""
+        if self._airport_index is None:
+            self._airport_index = get_airport_index()
+        if len(code) == 3:
+            airport = self._airport_index.get_by_iata(code)
+        else:
+            airport = self._airport_index.get(code)
+        if airport is None:
+            return None
+        return airport.latitude, airport.longitude
@@ -17,6 +17,9 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
+
 from airborne.physics.vectors import Vector3
 
 logger = logging.getLogger(__name__)
@@ -85,13 +88,15 @@ class TerrainCollisionDetector:
         ...     print("TERRAIN COLLISION!")
     """
 
-    def __init__(self, elevation_service: Any = None) -> None:
+    def __init__(self, elevation_service: Any = None, msa_grid: Any = None) -> None:
         """Initialize terrain collision detector.
 
         Args:
             elevation_service: ElevationService for terrain elevation queries
+            msa_grid: Optional precomputed MSAGrid for minimum safe altitudes
         """
         self.elevation_service = elevation_service
+        self.msa_grid = msa_grid
         self.collision_buffer_m = 0.0  # Safety buffer (default: ground level)
         self.warning_threshold_ft = 500.0  # Warning at 500ft AGL
         self.caution_threshold_ft = 200.0  # Caution at 200ft AGL
@@ -131,6 +136,21 @@ class TerrainCollisionDetector:
                 logger.warning("Failed to get terrain elevation: %s", e)
                 terrain_elevation = 0.0  # Default to sea level
 
+        return self._build_result(position, altitude_msl, terrain_elevation)
+
+    def _build_result(
+        self, position: Vector3, altitude_msl: float, terrain_elevation: float
+    ) -> CollisionResult:
+        """Classify clearance above terrain into a collision result.
+
+        Args:
+            position: Position where collision was checked
+            altitude_msl: Aircraft altitude in meters (MSL)
+            terrain_elevation: Terrain elevation in meters (MSL)
+
+        Returns:
+            CollisionResult with collision details
+        """
         # Calculate distance to terrain
         distance_to_terrain = altitude_msl - terrain_elevation
         agl_altitude = distance_to_terrain  # AGL = MSL - terrain elevation
@@ -194,28 +214,60 @@ class TerrainCollisionDetector:
             ...     if result.severity != CollisionSeverity.SAFE:
             ...         print(f"Warning at {result.agl_altitude:.0f}m AGL")
         """
-        results = []
+        future_positions = []
+        future_altitudes = []
 
         for i in range(num_samples):
             # Calculate future position
             time_ahead = (lookahead_seconds / num_samples) * i
-            future_position = Vector3(
-                position.x + (velocity.x * time_ahead) / 111320,  # Approximate lon change
-                position.y + (velocity.y * time_ahead),
-                position.z + (velocity.z * time_ahead) / 110540,  # Approximate lat change
+            future_positions.append(
+                Vector3(
+                    position.x + (velocity.x * time_ahead) / 111320,  # Approximate lon change
+                    position.y + (velocity.y * time_ahead),
+                    position.z + (velocity.z * time_ahead) / 110540,  # Approximate lat change
+                )
             )
-            future_altitude = altitude_msl + (velocity.y * time_ahead)
+            future_altitudes.append(altitude_msl + (velocity.y * time_ahead))
+
+        # Resolve terrain for all samples in one batch query
+        terrain = self._get_elevations(future_positions)
+
+        return [
+            self._build_result(future_position, future_altitude, float(elevation))
+            for future_position, future_altitude, elevation in zip(
+                future_positions, future_altitudes, terrain, strict=True
+            )
+        ]
+
+    def _get_elevations(self, positions: list[Vector3]) -> npt.NDArray[np.float64]:
+        """Get terrain elevations for several positions in one batch.
 
-            # Check collision at future position
-            result = self.check_terrain_collision(future_position, future_altitude)
-            results.append(result)
+        Args:
+            positions: Positions (x=lon, z=lat in degrees)
 
-        return results
+        Returns:
+            Terrain elevations in meters (sea level where unavailable)
+        """
+        if not self.elevation_service or not positions:
+            return np.zeros(len(positions), dtype=np.float64)
+
+        try:
+            return np.asarray(
+                self.elevation_service.get_elevation_array(
+                    np.array([p.z for p in positions]), np.array([p.x for p in positions])
+                ),
+                dtype=np.float64,
+            )
+        except Exception as e:
+            logger.warning("Failed to get terrain elevations: %s", e)
+            return np.zeros(len(positions), dtype=np.float64)
 
     def get_minimum_safe_altitude(self, position: Vector3, buffer_ft: float = 1000.0) -> float:
         """Get minimum safe altitude at position.
 
-        Returns terrain elevation plus safety buffer.
+        Returns terrain elevation plus safety buffer. With an MSA grid the
+        highest elevation of the grid cell is used (a constant-time lookup);
+        otherwise the terrain at the position itself is sampled.
 
         Args:
             position: Position to check
@@ -231,6 +283,13 @@ class TerrainCollisionDetector:
             ... )
             >>> print(f"Minimum safe altitude: {min_alt:.0f}m MSL")
         """
+        buffer_m = buffer_ft * 0.3048  # Convert feet to meters
+
+        if self.msa_grid is not None:
+            grid_elevation = self.msa_grid.get_max_elevation_m(position.z, position.x)
+            if grid_elevation is not None:
+                return float(grid_elevation) + buffer_m
+
         terrain_elevation = 0.0
         if self.elevation_service:
             try:
@@ -239,7 +298,6 @@ class TerrainCollisionDetector:
                 logger.warning("Failed to get terrain elevation: %s", e)
                 terrain_elevation = 0.0
 
-        buffer_m = buffer_ft * 0.3048  # Convert feet to meters
         return terrain_elevation + buffer_m
 
     def is_safe_to_descend(
@@ -294,6 +352,17 @@ class TerrainCollisionDetector:
         self.caution_threshold_ft = caution_ft
         self.critical_threshold_ft = critical_ft
 
+    def set_msa_grid(self, msa_grid: Any) -> None:
+        """Set the precomputed MSA grid used for minimum safe altitudes.
+
+        Args:
+            msa_grid: MSAGrid instance, or None to sample terrain directly
+
+        Examples:
+            >>> detector.set_msa_grid(MSAGrid.load("data/terrain/msa_025.grid"))
+        """
+        self.msa_grid = msa_grid
+
     def _calculate_severity(self, agl_altitude: float) -> CollisionSeverity:
         """Calculate collision severity based on AGL altitude.
 
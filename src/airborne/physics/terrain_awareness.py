@@ -0,0 +1,251 @@
+"""Terrain awareness and warning (TAWS) look-ahead.
+
+Projects the aircraft's predicted path over the next minute or two as a fan
+of headings around the current track, queries terrain for the whole fan in
+a single vectorized batch and grades the result into caution/warning alerts
+based on predicted terrain clearance and time to conflict.
+
+Positions use the simulator convention of x=longitude, z=latitude (degrees)
+and y=altitude (meters MSL). Velocities are in m/s with x=east, y=up and
+z=north.
+
+Typical usage:
+    from airborne.physics.terrain_awareness import TerrainAwarenessSystem
+
+    taws = TerrainAwarenessSystem(elevation_service)
+    result = taws.evaluate(position, altitude_msl, velocity)
+    if result.level == TerrainAlertLevel.WARNING:
+        print(f"PULL UP: terrain in {result.time_to_conflict_s:.0f}s")
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from airborne.physics.vectors import Vector3
+
+logger = logging.getLogger(__name__)
+
+# Approximate meters per degree of latitude
+METERS_PER_DEG_LAT = 110574.0
+
+# Meters per degree of longitude at the equator
+METERS_PER_DEG_LON = 111320.0
+
+# Below this groundspeed (m/s) the path is not projected
+MIN_GROUNDSPEED_MPS = 15.0
+
+
+class TerrainAlertLevel(Enum):
+    """Terrain awareness alert levels."""
+
+    NONE = "none"  # No predicted terrain conflict
+    CAUTION = "caution"  # "Caution, terrain"
+    WARNING = "warning"  # "Terrain, pull up"
+
+
+@dataclass
+class TerrainAwarenessResult:
+    """Result of a terrain look-ahead evaluation.
+
+    Attributes:
+        level: Graded alert level
+        time_to_conflict_s: Time until predicted clearance drops below the
+            clearance floor (None if no conflict within the look-ahead)
+        time_to_impact_s: Time until the predicted path meets terrain
+            (None if no impact within the look-ahead)
+        min_clearance_m: Minimum predicted terrain clearance over the fan
+        conflict_heading_deg: True heading of the earliest conflicting
+            ray (None if no conflict)
+        terrain_peak_m: Highest terrain elevation sampled in the fan
+    """
+
+    level: TerrainAlertLevel
+    time_to_conflict_s: float | None
+    time_to_impact_s: float | None
+    min_clearance_m: float
+    conflict_heading_deg: float | None
+    terrain_peak_m: float
+
+
+class TerrainAwarenessSystem:
+    """Vectorized forward-looking terrain awareness.
+
+    The look-ahead corridor is a fan of straight rays at fixed heading
+    offsets around the current track, each sampled at regular time steps.
+    All samples are resolved with one ``get_elevation_array`` call and the
+    clearance and conflict times are computed with NumPy.
+
+    Conflicts on the current track raise caution within ``caution_time_s``
+    and warning within ``warning_time_s``. Conflicts found only on the
+    off-track rays of the fan (terrain the aircraft would meet in a turn)
+    are capped at caution.
+
+    Examples:
+        >>> taws = TerrainAwarenessSystem(elevation_service, lookahead_s=90.0)
+        >>> result = taws.evaluate(
+        ...     Vector3(-122.4194, 500, 37.7749),
+        ...     500.0,
+        ...     Vector3(0, -5, 60),  # Northbound, descending
+        ... )
+        >>> print(result.level, result.time_to_conflict_s)
+    """
+
+    def __init__(
+        self,
+        elevation_service: Any = None,
+        lookahead_s: float = 90.0,
+        caution_time_s: float = 60.0,
+        warning_time_s: float = 30.0,
+        clearance_floor_ft: float = 100.0,
+        fan_half_angle_deg: float = 30.0,
+        fan_headings: int = 7,
+        samples_per_heading: int = 30,
+    ) -> None:
+        """Initialize terrain awareness system.
+
+        Args:
+            elevation_service: ElevationService for batch terrain queries
+            lookahead_s: How far ahead to project the path (seconds)
+            caution_time_s: Time to conflict that triggers a caution
+            warning_time_s: Time to conflict that triggers a warning
+            clearance_floor_ft: Required terrain clearance (feet)
+            fan_half_angle_deg: Half-width of the heading fan (degrees)
+            fan_headings: Number of rays in the fan (odd keeps one on track)
+            samples_per_heading: Number of time steps per ray
+        """
+        self.elevation_service = elevation_service
+        self.lookahead_s = lookahead_s
+        self.caution_time_s = caution_time_s
+        self.warning_time_s = warning_time_s
+        self.clearance_floor_m = clearance_floor_ft * 0.3048
+
+        self._offsets_rad = np.radians(
+            np.linspace(-fan_half_angle_deg, fan_half_angle_deg, max(fan_headings, 1))
+        )
+        self._on_track = np.abs(self._offsets_rad) == np.abs(self._offsets_rad).min()
+        self._times = np.linspace(
+            lookahead_s / samples_per_heading, lookahead_s, samples_per_heading
+        )
+
+        logger.info(
+            "TerrainAwarenessSystem initialized (lookahead=%.0fs, %d rays x %d samples)",
+            lookahead_s,
+            len(self._offsets_rad),
+            samples_per_heading,
+        )
+
+    def project_fan(
+        self, position: Vector3, velocity: Vector3
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Project the heading fan into sample coordinates.
+
+        Args:
+            position: Aircraft position (x=lon, z=lat in degrees)
+            velocity: Aircraft velocity (m/s, x=east, z=north)
+
+        Returns:
+            (latitudes, longitudes) arrays of shape (rays, samples)
+        """
+        groundspeed = math.hypot(velocity.x, velocity.z)
+        track = math.atan2(velocity.x, velocity.z)
+
+        angles = track + self._offsets_rad[:, np.newaxis]
+        distance = groundspeed * self._times[np.newaxis, :]
+
+        meters_per_deg_lon = METERS_PER_DEG_LON * max(math.cos(math.radians(position.z)), 0.01)
+        latitudes = position.z + distance * np.cos(angles) / METERS_PER_DEG_LAT
+        longitudes = position.x + distance * np.sin(angles) / meters_per_deg_lon
+        return latitudes, longitudes
+
+    def evaluate(
+        self, position: Vector3, altitude_msl: float, velocity: Vector3
+    ) -> TerrainAwarenessResult:
+        """Evaluate the predicted path against terrain.
+
+        Args:
+            position: Aircraft position (x=lon, z=lat in degrees)
+            altitude_msl: Aircraft altitude in meters (MSL)
+            velocity: Aircraft velocity (m/s, x=east, y=up, z=north)
+
+        Returns:
+            TerrainAwarenessResult with graded alert level
+        """
+        groundspeed = math.hypot(velocity.x, velocity.z)
+        if self.elevation_service is None or groundspeed < MIN_GROUNDSPEED_MPS:
+            return self._clear_result(altitude_msl)
+
+        latitudes, longitudes = self.project_fan(position, velocity)
+        try:
+            terrain = self.elevation_service.get_elevation_array(latitudes, longitudes)
+        except Exception as e:
+            logger.warning("Terrain look-ahead query failed: %s", e)
+            return self._clear_result(altitude_msl)
+
+        altitudes = altitude_msl + velocity.y * self._times
+        clearance = altitudes[np.newaxis, :] - terrain
+
+        # First conflict/impact time per ray (inf where none)
+        conflict_times = self._first_times(clearance < self.clearance_floor_m)
+        impact_times = self._first_times(clearance <= 0.0)
+
+        track_conflict = float(conflict_times[self._on_track].min())
+        fan_conflict = float(conflict_times.min())
+
+        if track_conflict <= self.warning_time_s:
+            level = TerrainAlertLevel.WARNING
+        elif track_conflict <= self.caution_time_s or fan_conflict <= self.warning_time_s:
+            level = TerrainAlertLevel.CAUTION
+        else:
+            level = TerrainAlertLevel.NONE
+
+        conflict_heading: float | None = None
+        if math.isfinite(fan_conflict):
+            ray = int(np.argmin(conflict_times))
+            track = math.atan2(velocity.x, velocity.z) + self._offsets_rad[ray]
+            conflict_heading = math.degrees(track) % 360.0
+
+        impact = float(impact_times.min())
+        return TerrainAwarenessResult(
+            level=level,
+            time_to_conflict_s=fan_conflict if math.isfinite(fan_conflict) else None,
+            time_to_impact_s=impact if math.isfinite(impact) else None,
+            min_clearance_m=float(clearance.min()),
+            conflict_heading_deg=conflict_heading,
+            terrain_peak_m=float(terrain.max()),
+        )
+
+    def _first_times(self, mask: npt.NDArray[np.bool_]) -> npt.NDArray[np.float64]:
+        """Get the first sample time where a mask is set, per ray.
+
+        Args:
+            mask: Boolean array of shape (rays, samples)
+
+        Returns:
+            Times in seconds, inf for rays where the mask is never set
+        """
+        first = np.argmax(mask, axis=1)
+        return np.where(mask.any(axis=1), self._times[first], np.inf)
+
+    def _clear_result(self, altitude_msl: float) -> TerrainAwarenessResult:
+        """Build a no-alert result (no projection performed).
+
+        Args:
+            altitude_msl: Aircraft altitude in meters (MSL)
+
+        Returns:
+            TerrainAwarenessResult with no alert
+        """
+        return TerrainAwarenessResult(
+            level=TerrainAlertLevel.NONE,
+            time_to_conflict_s=None,
+            time_to_impact_s=None,
+            min_clearance_m=altitude_msl,
+            conflict_heading_deg=None,
+            terrain_peak_m=0.0,
+        )
@@ -2,10 +2,19 @@
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any
+
+import numpy as np
 
 from airborne.core.messaging import Message, MessagePriority, MessageQueue, MessageTopic
 from airborne.core.plugin import IPlugin, PluginContext, PluginMetadata, PluginType
 from airborne.physics.vectors import Vector3
+from airborne.plugins.avionics.tcas_surveillance import (
+    ADVISORY_RA,
+    ADVISORY_TA,
+    TCASSurveillance,
+    sensitivity_level,
+)
 from airborne.plugins.traffic.ai_aircraft import AIAircraft
 
 
@@ -17,6 +26,10 @@ class AlertLevel(Enum):
     RA = "resolution_advisory"  # Resolution Advisory (15-35 seconds)
 
 
+# Alert levels by advisory code from TCASSurveillance.advisories
+_ALERT_LEVELS = (AlertLevel.NONE, AlertLevel.TA, AlertLevel.RA)
+
+
 class RAType(Enum):
     """Resolution Advisory types."""
 
@@ -42,6 +55,8 @@ class TrafficTarget:
         altitude_separation_ft: Vertical separation in feet
         alert_level: Current alert level for this target
         ra_type: Resolution advisory type if RA is active
+        horizontal_miss_nm: Predicted horizontal range at closest approach
+        vertical_miss_ft: Predicted relative altitude at closest approach
     """
 
     callsign: str
@@ -55,6 +70,8 @@ class TrafficTarget:
     altitude_separation_ft: float
     alert_level: AlertLevel = AlertLevel.NONE
     ra_type: RAType | None = None
+    horizontal_miss_nm: float = 0.0
+    vertical_miss_ft: float = 0.0
 
 
 class TCASPlugin(IPlugin):
@@ -66,6 +83,11 @@ class TCASPlugin(IPlugin):
     Alert Logic:
         - TA: 20-48 seconds to collision, aural "Traffic, traffic"
         - RA: 15-35 seconds to collision, aural "Climb, climb" or "Descend, descend"
+
+    Intruders are kept in arrays by TCASSurveillance. Traffic outside the
+    tracking range and altitude window is culled when traffic arrives, and
+    the remaining intruders are evaluated together every update with
+    thresholds from the sensitivity level for the current altitude.
     """
 
     def __init__(self) -> None:
@@ -78,11 +100,17 @@ class TCASPlugin(IPlugin):
 
         # Own aircraft state
         self._own_position = Vector3(0, 0, 0)
+        self._own_velocity = Vector3(0, 0, 0)
         self._own_altitude_ft = 0.0
         self._own_vertical_speed_fpm = 0.0
 
-        # Traffic targets
+        # Traffic targets, with their intruder rows in the surveillance arrays
+        self._surveillance = TCASSurveillance()
+        self._tracked_rows = np.zeros(0, dtype=np.int64)
+        self._tracked_targets: list[TrafficTarget] = []
         self._targets: dict[str, TrafficTarget] = {}
+        self._alerted: list[TrafficTarget] = []
+        self._traffic_age = 0.0
 
         # Alert state
         self._current_alert_level = AlertLevel.NONE
@@ -91,10 +119,6 @@ class TCASPlugin(IPlugin):
         self._time_accumulator = 0.0
 
         # TCAS parameters
-        self._ta_time_threshold_sec = 20.0  # TA at 20-48 seconds
-        self._ra_time_threshold_sec = 15.0  # RA at 15-35 seconds
-        self._horizontal_protection_nm = 0.5  # 0.5 NM horizontal protection
-        self._vertical_protection_ft = 600.0  # 600 ft vertical protection
         self._audio_repeat_interval = 5.0  # Repeat alerts every 5 seconds
 
     def get_metadata(self) -> PluginMetadata:
@@ -118,6 +142,7 @@ class TCASPlugin(IPlugin):
         if self._message_queue:
             self._message_queue.subscribe(MessageTopic.POSITION_UPDATED, self.handle_message)
             self._message_queue.subscribe(MessageTopic.TRAFFIC_UPDATE, self.handle_message)
+            self._message_queue.subscribe(MessageTopic.TRAFFIC_DELTA, self.handle_message)
             self._message_queue.subscribe(MessageTopic.ELECTRICAL_STATE, self.handle_message)
 
     def update(self, dt: float) -> None:
@@ -130,6 +155,7 @@ class TCASPlugin(IPlugin):
             return
 
         self._time_accumulator += dt
+        self._traffic_age += dt
 
         # Analyze threats
         self._analyze_traffic()
@@ -142,6 +168,7 @@ class TCASPlugin(IPlugin):
         if self._message_queue:
             self._message_queue.unsubscribe(MessageTopic.POSITION_UPDATED, self.handle_message)
             self._message_queue.unsubscribe(MessageTopic.TRAFFIC_UPDATE, self.handle_message)
+            self._message_queue.unsubscribe(MessageTopic.TRAFFIC_DELTA, self.handle_message)
             self._message_queue.unsubscribe(MessageTopic.ELECTRICAL_STATE, self.handle_message)
 
     def handle_message(self, message: Message) -> None:
@@ -154,6 +181,8 @@ class TCASPlugin(IPlugin):
             self._handle_position_update(message)
         elif message.topic == MessageTopic.TRAFFIC_UPDATE:
             self._handle_traffic_update(message)
+        elif message.topic == MessageTopic.TRAFFIC_DELTA:
+            self._handle_traffic_delta(message)
         elif message.topic == MessageTopic.ELECTRICAL_STATE:
             self._handle_electrical_state(message)
 
@@ -161,9 +190,10 @@ class TCASPlugin(IPlugin):
         """Handle position update from own aircraft."""
         data = message.data
         if data and "position" in data:
-            self._own_position = data["position"]
-            self._own_altitude_ft = data.get("altitude_ft", 0.0)
-            self._own_vertical_speed_fpm = data.get("vertical_speed_fpm", 0.0)
+            self._own_position = _to_vector(data["position"])
+            self._own_velocity = _to_vector(data.get("velocity"))
+            self._own_altitude_ft = data.get("altitude_ft", data.get("altitude", 0.0))
+            self._own_vertical_speed_fpm = data.get("vertical_speed_fpm", data.get("vspeed", 0.0))
 
     def _handle_traffic_update(self, message: Message) -> None:
         """Handle traffic update from AI traffic plugin."""
@@ -171,14 +201,96 @@ class TCASPlugin(IPlugin):
         if not data or "traffic" not in data:
             return
 
-        # Update tracked targets
-        self._targets.clear()
+        self._surveillance.load_aircraft(
+            aircraft for aircraft in data["traffic"] if isinstance(aircraft, AIAircraft)
+        )
+        self._track_intruders()
 
-        for aircraft_data in data["traffic"]:
-            if isinstance(aircraft_data, AIAircraft):
-                target = self._create_target_from_aircraft(aircraft_data)
-                if target:
-                    self._targets[target.callsign] = target
+    def _handle_traffic_delta(self, message: Message) -> None:
+        """Handle traffic changes by pulling nearby traffic from the traffic state.
+
+        With a plugin registry, only the registered "traffic_state" is in
+        the TCAS frame; deltas from other states (e.g. ground traffic in
+        degrees) are ignored.
+        """
+        data = message.data
+        if not data or "state" not in data:
+            return
+
+        registry = self._context.plugin_registry if self._context else None
+        if registry and not (
+            registry.is_registered("traffic_state")
+            and data["state"] is registry.get("traffic_state")
+        ):
+            return
+
+        surveillance = self._surveillance
+        surveillance.load_entries(
+            data["state"].within(
+                self._own_position,
+                surveillance.range_nm,
+                self._own_altitude_ft,
+                surveillance.altitude_window_ft,
+            )
+        )
+        self._track_intruders()
+
+    def _track_intruders(self) -> None:
+        """Rebuild tracked targets from the intruders that survive the cull."""
+        self._traffic_age = 0.0
+        rows = self._surveillance.cull(self._own_position, self._own_altitude_ft)
+        encounter = self._surveillance.measure(
+            rows,
+            self._own_position,
+            self._own_velocity,
+            self._own_altitude_ft,
+            self._own_vertical_speed_fpm,
+        )
+        surveillance = self._surveillance
+        self._tracked_rows = rows
+        self._alerted = []
+        self._tracked_targets = [
+            TrafficTarget(
+                callsign=surveillance.callsigns[row],
+                position=Vector3(*position),
+                velocity=Vector3(*velocity),
+                altitude_ft=altitude_ft,
+                vertical_speed_fpm=vertical_speed_fpm,
+                closure_rate_kts=closure_kts,
+                distance_nm=distance_nm,
+                time_to_cpa=time_to_cpa,
+                altitude_separation_ft=abs(relative_ft),
+                horizontal_miss_nm=miss_nm,
+                vertical_miss_ft=miss_ft,
+            )
+            for (
+                row,
+                position,
+                velocity,
+                altitude_ft,
+                vertical_speed_fpm,
+                distance_nm,
+                closure_kts,
+                time_to_cpa,
+                relative_ft,
+                miss_nm,
+                miss_ft,
+            ) in zip(
+                rows.tolist(),
+                surveillance.position[rows].tolist(),
+                surveillance.velocity[rows].tolist(),
+                surveillance.altitude_ft[rows].tolist(),
+                surveillance.vertical_speed_fpm[rows].tolist(),
+                encounter.range_nm.tolist(),
+                encounter.closure_rate_kts.tolist(),
+                encounter.time_to_cpa_s.tolist(),
+                encounter.relative_altitude_ft.tolist(),
+                encounter.horizontal_miss_nm.tolist(),
+                encounter.vertical_miss_ft.tolist(),
+                strict=True,
+            )
+        ]
+        self._targets = {target.callsign: target for target in self._tracked_targets}
 
     def _handle_electrical_state(self, message: Message) -> None:
         """Handle electrical state updates."""
@@ -243,47 +355,48 @@ class TCASPlugin(IPlugin):
 
     def _analyze_traffic(self) -> None:
         """Analyze traffic and determine threat levels."""
-        highest_threat = AlertLevel.NONE
-        ra_type = None
-
-        for target in self._targets.values():
-            # Reset alert level
+        for target in self._alerted:
             target.alert_level = AlertLevel.NONE
             target.ra_type = None
+        self._alerted = []
 
-            # Check if within protection zone
-            if target.distance_nm > self._horizontal_protection_nm * 2:
-                continue
-
-            # Check vertical separation
-            if target.altitude_separation_ft > self._vertical_protection_ft * 2:
-                continue
-
-            # Determine alert level based on time to CPA
-            if target.time_to_cpa < self._ra_time_threshold_sec:
-                # Resolution Advisory
-                target.alert_level = AlertLevel.RA
-
-                # Determine RA type based on relative vertical speed
-                vertical_separation = target.altitude_ft - self._own_altitude_ft
-
-                if vertical_separation > 0:
-                    # Target is above - descend
-                    target.ra_type = RAType.DESCEND
-                else:
-                    # Target is below - climb
-                    target.ra_type = RAType.CLIMB
-
-                if target.alert_level.value > highest_threat.value:
-                    highest_threat = target.alert_level
-                    ra_type = target.ra_type
-
-            elif target.time_to_cpa < self._ta_time_threshold_sec:
-                # Traffic Advisory
-                target.alert_level = AlertLevel.TA
+        highest_threat = AlertLevel.NONE
+        ra_type = None
 
-                if target.alert_level.value > highest_threat.value:
-                    highest_threat = target.alert_level
+        if len(self._tracked_rows):
+            # Evaluate all tracked intruders at once with extrapolated positions
+            encounter = self._surveillance.measure(
+                self._tracked_rows,
+                self._own_position,
+                self._own_velocity,
+                self._own_altitude_ft,
+                self._own_vertical_speed_fpm,
+                self._traffic_age,
+            )
+            codes, above = self._surveillance.advisories(
+                encounter, sensitivity_level(self._own_altitude_ft)
+            )
+            alerting = np.flatnonzero(codes)
+
+            # The most urgent RA, by time to CPA, sets the resolution sense
+            urgent_ra = None
+            if (codes == ADVISORY_RA).any():
+                time_to_cpa = np.where(codes == ADVISORY_RA, encounter.time_to_cpa_s, np.inf)
+                urgent_ra = int(np.argmin(time_to_cpa))
+
+            for index in alerting.tolist():
+                target = self._tracked_targets[index]
+                target.alert_level = _ALERT_LEVELS[codes[index]]
+                if codes[index] == ADVISORY_RA:
+                    # Intruder passing above - descend; below - climb
+                    target.ra_type = RAType.DESCEND if above[index] else RAType.CLIMB
+                self._alerted.append(target)
+
+            if urgent_ra is not None:
+                highest_threat = AlertLevel.RA
+                ra_type = RAType.DESCEND if above[urgent_ra] else RAType.CLIMB
+            elif (codes == ADVISORY_TA).any():
+                highest_threat = AlertLevel.TA
 
         # Update system-wide alert state
         self._current_alert_level = highest_threat
@@ -360,3 +473,12 @@ class TCASPlugin(IPlugin):
             enabled: True to enable, False to disable
         """
         self._enabled = enabled
+
+
+def _to_vector(value: Any) -> Vector3:
+    """Convert a Vector3 or an x/y/z mapping from a message into a Vector3."""
+    if isinstance(value, Vector3):
+        return value
+    if isinstance(value, dict):
+        return Vector3(value.get("x", 0.0), value.get("y", 0.0), value.get("z", 0.0))
+    return Vector3(0, 0, 0)
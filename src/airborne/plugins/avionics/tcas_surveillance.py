@@ -0,0 +1,334 @@
+"""Vectorized TCAS surveillance.
+
+Holds intruder state in arrays and evaluates every intruder against ownship
+in one pass: a cheap range/altitude box culls traffic that cannot matter,
+then range, range rate, modified tau, closest point of approach and
+vertical miss distance are computed with NumPy for the rest. Alert
+thresholds come from altitude-dependent sensitivity levels modeled on
+TCAS II.
+
+Positions follow the AI traffic convention: x/z horizontal with
+``UNITS_PER_NM`` units per nautical mile and velocities in units per
+second. Altitudes are in feet and vertical speeds in feet per minute.
+
+Typical usage:
+    surveillance = TCASSurveillance()
+    surveillance.load_aircraft(traffic)
+    rows = surveillance.cull(own_position, own_altitude_ft)
+    encounter = surveillance.measure(rows, own_position, own_velocity, own_altitude_ft, own_vs)
+    alerts, above = surveillance.advisories(encounter, sensitivity_level(own_altitude_ft))
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from airborne.physics.vectors import Vector3
+from airborne.plugins.traffic.ai_aircraft import AIAircraft
+from airborne.plugins.traffic.traffic_state import TrafficEntry
+
+UNITS_PER_NM = 6076.0
+MPS_TO_KNOTS = 1.94384
+
+# Advisory codes returned by TCASSurveillance.advisories
+ADVISORY_NONE = 0
+ADVISORY_TA = 1
+ADVISORY_RA = 2
+
+# Traffic tracked for display and evaluation
+DEFAULT_RANGE_NM = 10.0
+DEFAULT_ALTITUDE_WINDOW_FT = 2700.0
+
+
+@dataclass(frozen=True)
+class SensitivityLevel:
+    """Alert thresholds for one altitude band.
+
+    Attributes:
+        level: TCAS sensitivity level number
+        max_altitude_ft: Upper limit of the band in feet
+        ta_tau_s: Tau threshold for a traffic advisory in seconds
+        ta_dmod_nm: Range inside which a TA is issued regardless of tau
+        ta_zthr_ft: Altitude separation inside which the TA altitude test passes
+        ra_tau_s: Tau threshold for a resolution advisory (None if RAs are inhibited)
+        ra_dmod_nm: Range inside which an RA is issued regardless of tau
+        ra_zthr_ft: Altitude separation inside which the RA altitude test passes
+        alim_ft: Vertical miss distance an RA aims to achieve
+    """
+
+    level: int
+    max_altitude_ft: float
+    ta_tau_s: float
+    ta_dmod_nm: float
+    ta_zthr_ft: float
+    ra_tau_s: float | None
+    ra_dmod_nm: float
+    ra_zthr_ft: float
+    alim_ft: float
+
+
+SENSITIVITY_LEVELS: tuple[SensitivityLevel, ...] = (
+    SensitivityLevel(2, 1000.0, 20.0, 0.30, 850.0, None, 0.0, 0.0, 0.0),
+    SensitivityLevel(3, 2350.0, 25.0, 0.33, 850.0, 15.0, 0.20, 600.0, 300.0),
+    SensitivityLevel(4, 5000.0, 30.0, 0.48, 850.0, 20.0, 0.35, 600.0, 300.0),
+    SensitivityLevel(5, 10000.0, 40.0, 0.75, 850.0, 25.0, 0.55, 600.0, 350.0),
+    SensitivityLevel(6, 20000.0, 45.0, 1.00, 850.0, 30.0, 0.80, 600.0, 400.0),
+    SensitivityLevel(7, 42000.0, 48.0, 1.30, 850.0, 35.0, 1.10, 700.0, 600.0),
+    SensitivityLevel(7, float("inf"), 48.0, 1.30, 1200.0, 35.0, 1.10, 800.0, 700.0),
+)
+
+
+def sensitivity_level(altitude_ft: float) -> SensitivityLevel:
+    """Get the sensitivity level for an ownship altitude.
+
+    Args:
+        altitude_ft: Ownship altitude in feet.
+
+    Returns:
+        The sensitivity level whose band contains the altitude.
+
+    Examples:
+        >>> sensitivity_level(500).level
+        2
+        >>> sensitivity_level(8000).level
+        5
+    """
+    for level in SENSITIVITY_LEVELS:
+        if altitude_ft < level.max_altitude_ft:
+            return level
+    return SENSITIVITY_LEVELS[-1]
+
+
+@dataclass
+class Encounter:
+    """Geometry of a set of intruders relative to ownship.
+
+    All arrays are aligned with ``rows``.
+
+    Attributes:
+        rows: Intruder rows the geometry was measured for
+        range_nm: Horizontal range in nautical miles
+        closure_rate_kts: Horizontal closure rate (positive = closing)
+        time_to_cpa_s: Time to horizontal closest approach (inf if not closing)
+        horizontal_miss_nm: Horizontal range at closest approach
+        relative_altitude_ft: Intruder altitude minus ownship altitude
+        vertical_tau_s: Time to co-altitude (inf if not converging)
+        vertical_miss_ft: Relative altitude at closest approach
+    """
+
+    rows: np.ndarray
+    range_nm: np.ndarray
+    closure_rate_kts: np.ndarray
+    time_to_cpa_s: np.ndarray
+    horizontal_miss_nm: np.ndarray
+    relative_altitude_ft: np.ndarray
+    vertical_tau_s: np.ndarray
+    vertical_miss_ft: np.ndarray
+
+
+class TCASSurveillance:
+    """Intruder arrays with vectorized TCAS threat evaluation.
+
+    Examples:
+        >>> surveillance = TCASSurveillance()
+        >>> surveillance.load(["N1"], [(0, 0, 6076)], [(0, 0, -100)], [5000], [0])
+        >>> rows = surveillance.cull(Vector3(0, 0, 0), 5000)
+        >>> encounter = surveillance.measure(rows, Vector3(0, 0, 0), Vector3(0, 0, 0), 5000, 0)
+        >>> round(float(encounter.time_to_cpa_s[0]), 1)
+        60.8
+    """
+
+    def __init__(
+        self,
+        range_nm: float = DEFAULT_RANGE_NM,
+        altitude_window_ft: float = DEFAULT_ALTITUDE_WINDOW_FT,
+    ) -> None:
+        """Initialize with no intruders.
+
+        Args:
+            range_nm: Horizontal range of tracked traffic
+            altitude_window_ft: Relative altitude window of tracked traffic
+        """
+        self.range_nm = range_nm
+        self.altitude_window_ft = altitude_window_ft
+        self.callsigns: list[str] = []
+        self.position = np.zeros((0, 3))
+        self.velocity = np.zeros((0, 3))
+        self.altitude_ft = np.zeros(0)
+        self.vertical_speed_fpm = np.zeros(0)
+
+    def load(
+        self,
+        callsigns: Sequence[str],
+        position: Iterable[Sequence[float]] | np.ndarray,
+        velocity: Iterable[Sequence[float]] | np.ndarray,
+        altitude_ft: Iterable[float] | np.ndarray,
+        vertical_speed_fpm: Iterable[float] | np.ndarray,
+    ) -> None:
+        """Replace the intruders with new state arrays.
+
+        Args:
+            callsigns: Intruder callsigns
+            position: Positions as (n, 3) x/y/z
+            velocity: Velocities as (n, 3) x/y/z per second
+            altitude_ft: Altitudes in feet
+            vertical_speed_fpm: Vertical speeds in feet per minute
+        """
+        self.callsigns = list(callsigns)
+        self.position = np.asarray(position, dtype=np.float64).reshape(-1, 3)
+        self.velocity = np.asarray(velocity, dtype=np.float64).reshape(-1, 3)
+        self.altitude_ft = np.asarray(altitude_ft, dtype=np.float64)
+        self.vertical_speed_fpm = np.asarray(vertical_speed_fpm, dtype=np.float64)
+
+    def load_aircraft(self, traffic: Iterable[AIAircraft]) -> None:
+        """Replace the intruders with the state of AI aircraft.
+
+        Args:
+            traffic: Aircraft to track
+        """
+        traffic = list(traffic)
+        self.load(
+            [aircraft.callsign for aircraft in traffic],
+            [(a.position.x, a.position.y, a.position.z) for a in traffic],
+            [(a.velocity.x, a.velocity.y, a.velocity.z) for a in traffic],
+            [aircraft.altitude_ft for aircraft in traffic],
+            [aircraft.vertical_speed_fpm for aircraft in traffic],
+        )
+
+    def load_entries(self, traffic: Iterable[TrafficEntry]) -> None:
+        """Replace the intruders with entries from the traffic state.
+
+        Args:
+            traffic: Traffic entries to track
+        """
+        traffic = list(traffic)
+        self.load(
+            [entry.callsign for entry in traffic],
+            [(e.position.x, e.position.y, e.position.z) for e in traffic],
+            [(e.velocity.x, e.velocity.y, e.velocity.z) for e in traffic],
+            [entry.altitude_ft for entry in traffic],
+            [entry.vertical_speed_fpm for entry in traffic],
+        )
+
+    def cull(self, own_position: Vector3, own_altitude_ft: float) -> np.ndarray:
+        """Select intruders inside the tracking range and altitude window.
+
+        A square box test rejects most traffic before the exact range check.
+
+        Args:
+            own_position: Ownship position
+            own_altitude_ft: Ownship altitude in feet
+
+        Returns:
+            Rows of intruders to track.
+        """
+        reach = self.range_nm * UNITS_PER_NM
+        dx = self.position[:, 0] - own_position.x
+        dz = self.position[:, 2] - own_position.z
+        inside = (np.abs(dx) <= reach) & (np.abs(dz) <= reach)
+        inside &= np.abs(self.altitude_ft - own_altitude_ft) <= self.altitude_window_ft
+        rows = np.flatnonzero(inside)
+        return rows[dx[rows] ** 2 + dz[rows] ** 2 <= reach * reach]
+
+    def measure(
+        self,
+        rows: np.ndarray,
+        own_position: Vector3,
+        own_velocity: Vector3,
+        own_altitude_ft: float,
+        own_vertical_speed_fpm: float,
+        age_s: float = 0.0,
+    ) -> Encounter:
+        """Compute encounter geometry for a set of intruders.
+
+        Args:
+            rows: Intruder rows to measure
+            own_position: Ownship position
+            own_velocity: Ownship velocity
+            own_altitude_ft: Ownship altitude in feet
+            own_vertical_speed_fpm: Ownship vertical speed in feet per minute
+            age_s: Time since the intruder state was loaded; positions and
+                altitudes are extrapolated by this much
+
+        Returns:
+            Encounter arrays aligned with ``rows``.
+        """
+        velocity = self.velocity[rows]
+        vertical_speed = self.vertical_speed_fpm[rows]
+        dx = self.position[rows, 0] + velocity[:, 0] * age_s - own_position.x
+        dz = self.position[rows, 2] + velocity[:, 2] * age_s - own_position.z
+        dvx = velocity[:, 0] - own_velocity.x
+        dvz = velocity[:, 2] - own_velocity.z
+
+        # Horizontal range, range rate and closest approach
+        distance = np.hypot(dx, dz)
+        dot = dx * dvx + dz * dvz
+        closing = -dot / np.maximum(distance, 0.1)
+        speed_sq = dvx * dvx + dvz * dvz
+        converging = (closing > 0) & (speed_sq > 0)
+        t_cpa = np.where(converging, -dot / np.where(converging, speed_sq, 1.0), 0.0)
+        miss = np.hypot(dx + dvx * t_cpa, dz + dvz * t_cpa)
+
+        # Vertical separation, time to co-altitude and miss distance at CPA
+        relative_altitude = self.altitude_ft[rows] + vertical_speed * age_s / 60 - own_altitude_ft
+        vertical_rate = (vertical_speed - own_vertical_speed_fpm) / 60
+        closing_vertically = relative_altitude * vertical_rate < 0
+        vertical_tau = np.where(
+            closing_vertically,
+            -relative_altitude / np.where(closing_vertically, vertical_rate, 1.0),
+            np.inf,
+        )
+
+        return Encounter(
+            rows=rows,
+            range_nm=distance / UNITS_PER_NM,
+            closure_rate_kts=closing * MPS_TO_KNOTS,
+            time_to_cpa_s=np.where(converging, t_cpa, np.inf),
+            horizontal_miss_nm=miss / UNITS_PER_NM,
+            relative_altitude_ft=relative_altitude,
+            vertical_tau_s=vertical_tau,
+            vertical_miss_ft=relative_altitude + vertical_rate * t_cpa,
+        )
+
+    @staticmethod
+    def advisories(encounter: Encounter, level: SensitivityLevel) -> tuple[np.ndarray, np.ndarray]:
+        """Grade an encounter into traffic and resolution advisories.
+
+        An intruder needs both the range test (inside DMOD, or modified
+        tau below the threshold) and the altitude test (inside ZTHR, or
+        vertical tau below the threshold). RAs additionally require the
+        predicted horizontal miss inside DMOD and vertical miss inside ALIM;
+        intruders that fail only those checks remain TAs.
+
+        Args:
+            encounter: Geometry from ``measure``
+            level: Sensitivity level for the ownship altitude
+
+        Returns:
+            Tuple of advisory codes (``ADVISORY_*``) and a flag per intruder
+            that is True when it passes above ownship at CPA.
+        """
+        range_nm = encounter.range_nm
+        closure_nm_s = encounter.closure_rate_kts / MPS_TO_KNOTS / UNITS_PER_NM
+        closing = closure_nm_s > 0
+        safe_closure = np.where(closing, closure_nm_s, 1.0)
+        safe_range = np.maximum(range_nm, 1e-9)
+        abs_altitude = np.abs(encounter.relative_altitude_ft)
+
+        def hits(tau_s: float, dmod_nm: float, zthr_ft: float) -> np.ndarray:
+            modified_tau = (range_nm**2 - dmod_nm**2) / (safe_range * safe_closure)
+            in_range = (range_nm <= dmod_nm) | (closing & (modified_tau < tau_s))
+            in_altitude = (abs_altitude <= zthr_ft) | (encounter.vertical_tau_s < tau_s)
+            result: np.ndarray = in_range & in_altitude
+            return result
+
+        codes = np.where(
+            hits(level.ta_tau_s, level.ta_dmod_nm, level.ta_zthr_ft), ADVISORY_TA, ADVISORY_NONE
+        )
+        if level.ra_tau_s is not None:
+            resolve = hits(level.ra_tau_s, level.ra_dmod_nm, level.ra_zthr_ft)
+            resolve &= encounter.horizontal_miss_nm <= level.ra_dmod_nm
+            resolve &= np.abs(encounter.vertical_miss_ft) < level.alim_ft
+            codes = np.where(resolve, ADVISORY_RA, codes)
+        return codes, encounter.vertical_miss_ft > 0
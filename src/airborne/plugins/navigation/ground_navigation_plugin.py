@@ -16,6 +16,7 @@ import logging
 from typing import Any
 
 from airborne.airports.database import AirportDatabase
+from airborne.airports.generated_cache import GeneratedLayoutCache
 from airborne.airports.parking import ParkingDatabase
 from airborne.airports.parking_generator import ParkingGenerator
 from airborne.airports.spatial_index import SpatialIndex
@@ -62,6 +63,7 @@ class GroundNavigationPlugin(IPlugin):
         self.spatial_index: SpatialIndex | None = None
         self.taxiway_gen: TaxiwayGenerator | None = None
         self.parking_gen: ParkingGenerator | None = None
+        self.layout_cache: GeneratedLayoutCache | None = None
         self.ground_physics: GroundPhysics | None = None
         self.proximity_manager: ProximityCueManager | None = None
         self.beeper: ProximityBeeper | None = None
@@ -150,6 +152,9 @@ class GroundNavigationPlugin(IPlugin):
         self.spatial_index = SpatialIndex()
         self.taxiway_gen = TaxiwayGenerator()
         self.parking_gen = ParkingGenerator()
+        self.layout_cache = GeneratedLayoutCache(
+            self.airport_db.gateway_loader.cache_dir, self.taxiway_gen, self.parking_gen
+        )
         self.ground_physics = GroundPhysics()
         self.proximity_manager = ProximityCueManager()
         self.beeper = ProximityBeeper(sample_rate=44100)
@@ -289,8 +294,14 @@ class GroundNavigationPlugin(IPlugin):
 
         logger.info("Airport %s classified as: %s", icao, category.value)
 
-        # Generate taxiway network
-        graph = self.taxiway_gen.generate(airport, runways, category)
+        # Generate taxiway network and parking, or load them from the cache
+        parking_db = None
+        if self.layout_cache:
+            graph, parking_db = self.layout_cache.get(airport, runways, category)
+        else:
+            graph = self.taxiway_gen.generate(airport, runways, category)
+            if self.parking_gen:
+                parking_db = self.parking_gen.generate(airport, runways, category)
 
         logger.info(
             "Generated taxiway network: %d nodes, %d edges",
@@ -298,9 +309,8 @@ class GroundNavigationPlugin(IPlugin):
             graph.get_edge_count(),
         )
 
-        # Generate parking positions for this airport
-        if self.parking_gen:
-            parking_db = self.parking_gen.generate(airport, runways, category)
+        # Add the parking positions of this airport
+        if parking_db is not None:
             self.current_parking_db = parking_db
 
             logger.info(
@@ -365,6 +375,22 @@ class GroundNavigationPlugin(IPlugin):
 
         logger.info("Added %d proximity targets", len(graph.nodes))
 
+        # Share the airport layout with runway and position awareness
+        if self.context:
+            self.context.message_queue.publish(
+                Message(
+                    sender="ground_navigation",
+                    recipients=["*"],
+                    topic=MessageTopic.AIRPORT_LOADED,
+                    data={
+                        "icao": icao,
+                        "runways": runways,
+                        "graph": graph,
+                        "frequencies": self.airport_db.frequencies.get(icao, []),
+                    },
+                )
+            )
+
     def _find_nearest_taxiway_node(self, graph: Any, position: Vector3) -> str | None:
         """Find nearest taxiway node to a position.
 
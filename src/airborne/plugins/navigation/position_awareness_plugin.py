@@ -102,7 +102,7 @@ class PositionAwarenessPlugin(IPlugin):
 
         # Initialize components
         # Note: PositionTracker needs a TaxiwayGraph (will be empty initially,
-        # populated later by ground_navigation plugin)
+        # replaced when ground_navigation publishes AIRPORT_LOADED)
         empty_graph = TaxiwayGraph()
         self.position_tracker = PositionTracker(empty_graph, message_queue)
         self.orientation_audio = OrientationAudioManager(message_queue)
@@ -121,6 +121,9 @@ class PositionAwarenessPlugin(IPlugin):
                 "input.nearby_features_query", self._on_nearby_features_query
             )
             self.context.message_queue.subscribe("input.where_am_i", self._on_where_am_i)
+            self.context.message_queue.subscribe(
+                MessageTopic.AIRPORT_LOADED, self._on_airport_loaded
+            )
 
         # Subscribe components to events
         if self.orientation_audio:
@@ -144,9 +147,19 @@ class PositionAwarenessPlugin(IPlugin):
         if self.position_tracker and self.last_position:
             self.position_tracker.update(self.last_position, self.last_heading, time.time())
 
-        # Update runway incursion detector
+        # Update runway incursion detector, sharing the tracker's edge when
+        # both use the same ground graph
         if self.incursion_detector and self.last_position:
-            self.incursion_detector.update(self.last_position, self.last_heading, time.time())
+            edge = None
+            if (
+                self.position_tracker
+                and self.incursion_detector.ground_graph is not None
+                and self.incursion_detector.ground_graph is self.position_tracker.graph.ground_graph
+            ):
+                edge = self.position_tracker.current_edge
+            self.incursion_detector.update(
+                self.last_position, self.last_heading, time.time(), edge=edge
+            )
 
     def shutdown(self) -> None:
         """Shutdown the plugin."""
@@ -163,6 +176,9 @@ class PositionAwarenessPlugin(IPlugin):
                 "input.nearby_features_query", self._on_nearby_features_query
             )
             self.context.message_queue.unsubscribe("input.where_am_i", self._on_where_am_i)
+            self.context.message_queue.unsubscribe(
+                MessageTopic.AIRPORT_LOADED, self._on_airport_loaded
+            )
 
         # Unsubscribe components
         if self.orientation_audio:
@@ -189,6 +205,8 @@ class PositionAwarenessPlugin(IPlugin):
             self._on_nearby_features_query(message)
         elif message.topic == "input.where_am_i":
             self._on_where_am_i(message)
+        elif message.topic == MessageTopic.AIRPORT_LOADED:
+            self._on_airport_loaded(message)
 
     def _on_position_updated(self, message: Message) -> None:
         """Handle position update message.
@@ -211,6 +229,27 @@ class PositionAwarenessPlugin(IPlugin):
         if "heading" in data:
             self.last_heading = float(data["heading"])
 
+    def _on_airport_loaded(self, message: Message) -> None:
+        """Handle a new airport layout from ground navigation.
+
+        The position tracker and the incursion detector share the taxiway
+        graph's ground graph, so the detector can reuse the tracker's edge.
+
+        Args:
+            message: Airport loaded message with runways and taxiway graph
+        """
+        graph = message.data.get("graph")
+        if graph is not None and self.position_tracker:
+            self.position_tracker.graph = graph
+
+        if self.incursion_detector:
+            self.incursion_detector.set_runways(message.data.get("runways", []))
+            self.incursion_detector.set_ground_graph(
+                graph.ground_graph if graph is not None else None
+            )
+
+        logger.info("Position awareness loaded airport %s", message.data.get("icao"))
+
     def _on_position_query(self, _message: Message) -> None:
         """Handle position query request (P key).
 
@@ -15,12 +15,14 @@ Typical usage:
         print(f"On taxiway {location_id}")
 """
 
+import heapq
 import logging
 import math
 from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 
+from airborne.airports.ground_graph import GroundGraph
 from airborne.airports.taxiway import TaxiwayEdge, TaxiwayGraph, TaxiwayNode
 from airborne.core.messaging import Message, MessagePriority, MessageQueue
 from airborne.physics.vectors import Vector3
@@ -64,6 +66,13 @@ class HoldShortPoint:
 
 logger = logging.getLogger(__name__)
 
+# Movement between two updates that counts as a teleport and drops the edge lock
+TELEPORT_DISTANCE_M = 150.0
+
+# The tracker measures with a flat 111 km per degree, which can read slightly
+# shorter than the spatial index's projected meters; pad index radii to match
+INDEX_RADIUS_PADDING = 1.01
+
 
 class LocationType(Enum):
     """Type of location on the airport surface.
@@ -118,11 +127,18 @@ class PositionTracker:  # pylint: disable=too-many-instance-attributes
     current location (parking, taxiway, runway, apron). Maintains position
     history and publishes location change events for audio feedback.
 
+    Once the aircraft is on a node or edge, the tracker locks onto it and
+    later updates only search that node or edge, its neighbors and a small
+    radius around the aircraft, so the cost of an update does not grow with
+    the airport. The whole airport is searched again after a teleport or
+    when the aircraft leaves the locked part of the network.
+
     Attributes:
         graph: Taxiway graph containing airport surface layout
         message_queue: Queue for publishing location events
         current_location_type: Current location type
         current_location_id: Current location identifier (node ID or name)
+        current_edge: Ground graph edge number the aircraft is on, or None
         position_history: Recent position history (max 100 entries)
         proximity_threshold_m: Distance threshold for node proximity (meters)
 
@@ -155,6 +171,11 @@ class PositionTracker:  # pylint: disable=too-many-instance-attributes
         self.current_location_type = LocationType.UNKNOWN
         self.current_location_id = ""
         self.current_node_id: str | None = None
+        self.current_edge: int | None = None
+
+        # Edge lock: rows of the node, or the edge's end nodes, the aircraft is on
+        self._lock_graph: GroundGraph | None = None
+        self._lock_rows: tuple[int, ...] = ()
 
         # Position history (stores last 100 positions)
         self.position_history: deque[tuple[Vector3, float]] = deque(maxlen=100)
@@ -178,43 +199,63 @@ class PositionTracker:  # pylint: disable=too-many-instance-attributes
             >>> tracker.update(Vector3(-122.0, 10.0, 37.5), 90.0, 12345.67)
         """
         self.last_update_time = timestamp
+        previous = self.position_history[-1][0] if self.position_history else None
 
         # Store in history
         self.position_history.append((position, heading))
 
-        # Find nearest node
+        if not self.graph.nodes:
+            # No nodes in graph - location unknown
+            self._lock_rows = ()
+            self.current_edge = None
+            self._update_location(LocationType.UNKNOWN, "", timestamp)
+            return
+
+        # Locked onto a node or edge: only look around it
+        if (
+            previous is not None
+            and self._calculate_distance(previous, position) <= TELEPORT_DISTANCE_M
+        ):
+            match = self._match_near_lock(position)
+            if match is not None:
+                node_id, edge = match
+                if node_id is not None:
+                    self._set_at_node(node_id, timestamp)
+                elif edge is not None:
+                    self._set_on_edge(edge, timestamp)
+                return
+
+        # Teleported, lost the lock or not locked yet: search the whole airport
         nearest_node_id, nearest_distance = self._find_nearest_node(position)
 
         if nearest_node_id is None:
             # No nodes in graph - location unknown
+            self._lock_rows = ()
+            self.current_edge = None
             self._update_location(LocationType.UNKNOWN, "", timestamp)
             return
 
         # Determine if we're close enough to be "at" this node
         if nearest_distance <= self.proximity_threshold_m:
             # We're at a specific node
-            node = self.graph.nodes[nearest_node_id]
-            location_type, location_id = self._classify_node(node)
-            self._update_location(location_type, location_id, timestamp)
-            self.current_node_id = nearest_node_id
+            self._set_at_node(nearest_node_id, timestamp)
         else:
             # We're between nodes - check if on an edge (taxiway segment)
+            self.current_node_id = None
+            self._lock_rows = ()
+            self.current_edge = None
             edge_result = self._find_nearest_edge(position)
             if edge_result:
                 edge, distance = edge_result
                 if distance <= self.proximity_threshold_m:
                     # On an edge
-                    location_type, location_id = self._classify_edge(edge)
-                    self._update_location(location_type, location_id, timestamp)
-                    self.current_node_id = None
+                    self._set_on_edge(edge, timestamp)
                 else:
                     # Too far from any edge - probably on grass/unknown
                     self._update_location(LocationType.GRASS, "", timestamp)
-                    self.current_node_id = None
             else:
                 # No edges nearby - unknown location
                 self._update_location(LocationType.UNKNOWN, "", timestamp)
-                self.current_node_id = None
 
     def get_current_location(self) -> tuple[LocationType, str]:
         """Get current location type and identifier.
@@ -408,7 +449,9 @@ class PositionTracker:  # pylint: disable=too-many-instance-attributes
         current_pos, _ = self.position_history[-1]
 
         # Find nearest edge (centerline segment)
-        edge_result = self._find_nearest_edge(current_pos)
+        edge_result = self._find_nearest_edge_near_lock(current_pos)
+        if edge_result is None:
+            edge_result = self._find_nearest_edge(current_pos)
         if not edge_result:
             return None
 
@@ -476,17 +519,9 @@ class PositionTracker:  # pylint: disable=too-many-instance-attributes
         junctions: list[ApproachingJunction] = []
         seen_names: set[str] = set()
 
-        # Find nodes ahead of us within look_ahead_m
-        for node_id, node in self.graph.nodes.items():
-            distance = self._calculate_distance(current_pos, node.position)
-            if distance > look_ahead_m:
-                continue
-
-            # Check if node is ahead (within ±90° of heading)
-            bearing = self._calculate_bearing(current_pos, node.position)
-            heading_diff = self._normalize_heading_diff(bearing - heading)
-            if abs(heading_diff) > 90:
-                continue
+        # Walk the nodes ahead of us within look_ahead_m, nearest first
+        for distance, bearing, node_id in self._nodes_ahead(current_pos, heading, look_ahead_m):
+            node = self.graph.nodes[node_id]
 
             # Get connected taxiways/runways at this node (excluding current location)
             edges = self.graph.edges.get(node_id, [])
@@ -591,8 +626,10 @@ class PositionTracker:  # pylint: disable=too-many-instance-attributes
 
         current_pos, heading = self.position_history[-1]
 
-        # Find hold short nodes ahead of us
-        for node_id, node in self.graph.nodes.items():
+        # Find the nearest hold short node ahead of us
+        for distance, bearing, node_id in self._nodes_ahead(current_pos, heading, look_ahead_m):
+            node = self.graph.nodes[node_id]
+
             # Check if this is a hold short node
             if not getattr(node, "is_hold_short", False):
                 continue
@@ -601,12 +638,7 @@ class PositionTracker:  # pylint: disable=too-many-instance-attributes
             if not runway_id:
                 continue
 
-            distance = self._calculate_distance(current_pos, node.position)
-            if distance > look_ahead_m:
-                continue
-
             # Check if node is ahead (within ±60° of heading)
-            bearing = self._calculate_bearing(current_pos, node.position)
             heading_diff = self._normalize_heading_diff(bearing - heading)
             if abs(heading_diff) > 60:
                 continue
@@ -639,16 +671,215 @@ class PositionTracker:  # pylint: disable=too-many-instance-attributes
                 return edge.name
 
         # Also check edges that terminate at this node
-        for from_node, edge_list in self.graph.edges.items():
-            for edge in edge_list:
-                if edge.to_node == node_id and edge.name and edge.edge_type == "taxiway":
-                    return edge.name
+        ground = self.graph.ground_graph
+        index_edges = self.graph.index_edges
+        for edge_number in ground.incident_edges(ground.row(node_id)):
+            edge = index_edges[edge_number]
+            if edge.name and edge.edge_type == "taxiway":
+                return edge.name
 
         return ""
 
+    def _nodes_ahead(
+        self, position: Vector3, heading: float, look_ahead_m: float
+    ) -> list[tuple[float, float, str]]:
+        """Find the nodes ahead of the aircraft.
+
+        When locked onto a node or edge, walks the graph forward from it,
+        following edges through nodes ahead of the aircraft until the walked
+        distance passes look_ahead_m. Otherwise falls back to the nodes
+        around the aircraft in the spatial index.
+
+        Args:
+            position: Aircraft position
+            heading: Aircraft heading in degrees
+            look_ahead_m: How far ahead to look (meters)
+
+        Returns:
+            List of (distance_m, bearing, node_id) for nodes within
+            look_ahead_m and ±90° of heading, nearest first.
+        """
+        nodes = self.graph.nodes
+        ground = self.graph.ground_graph
+        node_ids = self.graph.index_node_ids
+
+        def ahead(node_id: str) -> tuple[float, float] | None:
+            node_position = nodes[node_id].position
+            distance = self._calculate_distance(position, node_position)
+            bearing = self._calculate_bearing(position, node_position)
+            if abs(self._normalize_heading_diff(bearing - heading)) > 90:
+                return None
+            return (distance, bearing)
+
+        if not self._lock_rows or self._lock_graph is not ground:
+            radius = look_ahead_m * INDEX_RADIUS_PADDING
+            found = []
+            for row, _ in ground.spatial_index.nodes_within(position.z, position.x, radius):
+                result = ahead(node_ids[row])
+                if result is not None and result[0] <= look_ahead_m:
+                    found.append((*result, node_ids[row]))
+            found.sort()
+            return found
+
+        starts = ground.edge_start
+        ends = ground.edge_end
+        walked: dict[int, float] = {}
+        heap = [
+            (self._calculate_distance(position, nodes[node_ids[row]].position), row)
+            for row in self._lock_rows
+        ]
+        heapq.heapify(heap)
+        found = []
+        while heap:
+            cost, row = heapq.heappop(heap)
+            if row in walked or cost > look_ahead_m:
+                continue
+            walked[row] = cost
+
+            node_id = node_ids[row]
+            result = ahead(node_id)
+            if result is not None and result[0] <= look_ahead_m:
+                found.append((*result, node_id))
+            elif result is None and cost > self.proximity_threshold_m:
+                continue  # Behind us: don't walk on through it
+
+            node_position = nodes[node_id].position
+            for edge in ground.incident_edges(row):
+                neighbor = int(ends[edge]) if starts[edge] == row else int(starts[edge])
+                if neighbor not in walked:
+                    step = self._calculate_distance(
+                        node_position, nodes[node_ids[neighbor]].position
+                    )
+                    heapq.heappush(heap, (cost + step, neighbor))
+
+        found.sort()
+        return found
+
+    def _set_at_node(self, node_id: str, timestamp: float) -> None:
+        """Record that the aircraft is at a node and lock onto it.
+
+        Args:
+            node_id: Node the aircraft is at
+            timestamp: Current timestamp
+        """
+        node = self.graph.nodes[node_id]
+        location_type, location_id = self._classify_node(node)
+        self._update_location(location_type, location_id, timestamp)
+        self.current_node_id = node_id
+        self.current_edge = None
+
+        ground = self.graph.ground_graph
+        self._lock_graph = ground
+        self._lock_rows = (ground.row(node_id),)
+
+    def _set_on_edge(self, edge: TaxiwayEdge, timestamp: float) -> None:
+        """Record that the aircraft is on an edge and lock onto it.
+
+        Args:
+            edge: Edge the aircraft is on
+            timestamp: Current timestamp
+        """
+        location_type, location_id = self._classify_edge(edge)
+        self._update_location(location_type, location_id, timestamp)
+        self.current_node_id = None
+
+        ground = self.graph.ground_graph
+        self._lock_graph = ground
+        self._lock_rows = (ground.row(edge.from_node), ground.row(edge.to_node))
+        ends = set(self._lock_rows)
+        self.current_edge = next(
+            (
+                number
+                for number in ground.incident_edges(self._lock_rows[0])
+                if {int(ground.edge_start[number]), int(ground.edge_end[number])} == ends
+            ),
+            None,
+        )
+
+    def _lock_candidates(self) -> tuple[set[int], set[int]] | None:
+        """Get the nodes and edges around the locked node or edge.
+
+        Covers the locked node or edge, the edges touching its nodes and the
+        edges of the nodes one step further, so the aircraft can move onto
+        the next segment without losing the lock.
+
+        Returns:
+            Tuple of (node rows, edge numbers), or None if not locked
+        """
+        if not self._lock_rows or self._lock_graph is not self.graph.ground_graph:
+            return None
+
+        ground = self._lock_graph
+        starts = ground.edge_start
+        ends = ground.edge_end
+        rows = set(self._lock_rows)
+        edges: set[int] = set()
+        for _ in range(2):
+            for row in list(rows):
+                for edge in ground.incident_edges(row):
+                    if edge not in edges:
+                        edges.add(edge)
+                        rows.add(int(starts[edge]))
+                        rows.add(int(ends[edge]))
+        return rows, edges
+
+    def _match_near_lock(self, position: Vector3) -> tuple[str | None, TaxiwayEdge | None] | None:
+        """Find the node or edge the aircraft is on near the locked one.
+
+        Checks the nodes and edges around the lock first, then anything
+        else within the proximity threshold through the spatial index, with
+        nodes taking precedence over edges as in a full search.
+
+        Args:
+            position: Current aircraft position
+
+        Returns:
+            (node_id, None) when at a node, (None, edge) when on an edge, or
+            None if not locked or nothing is within the proximity threshold
+        """
+        candidates = self._lock_candidates()
+        if candidates is None:
+            return None
+
+        rows, edge_numbers = candidates
+        ground = self.graph.ground_graph
+        nodes = self.graph.nodes
+        node_ids = self.graph.index_node_ids
+        edges = self.graph.index_edges
+        threshold = self.proximity_threshold_m
+        radius = threshold * INDEX_RADIUS_PADDING
+
+        def node_distance(row: int) -> float:
+            return self._calculate_distance(position, nodes[node_ids[row]].position)
+
+        def edge_distance(edge_number: int) -> float:
+            edge = edges[edge_number]
+            return self._point_to_segment_distance(
+                position, nodes[edge.from_node].position, nodes[edge.to_node].position
+            )
+
+        node = min(((node_distance(row), row) for row in rows), default=None)
+        if node is None or node[0] > threshold:
+            nearby = ground.spatial_index.nodes_within(position.z, position.x, radius)
+            node = min(((node_distance(row), row) for row, _ in nearby), default=None)
+        if node is not None and node[0] <= threshold:
+            return (node_ids[node[1]], None)
+
+        edge = min(((edge_distance(e), e) for e in edge_numbers), default=None)
+        if edge is None or edge[0] > threshold:
+            nearby = ground.spatial_index.edges_within(position.z, position.x, radius)
+            edge = min(((edge_distance(e), e) for e, _ in nearby), default=None)
+        if edge is not None and edge[0] <= threshold:
+            return (None, edges[edge[1]])
+
+        return None
+
     def _find_nearest_node(self, position: Vector3) -> tuple[str | None, float]:
         """Find nearest node to position.
 
+        Uses the graph's spatial index, so only nodes around the position
+        are measured.
+
         Args:
             position: Position to search from
 
@@ -658,22 +889,24 @@ class PositionTracker:  # pylint: disable=too-many-instance-attributes
         if not self.graph.nodes:
             return (None, float("inf"))
 
-        nearest_id = None
-        min_distance = float("inf")
-
-        for node_id, node in self.graph.nodes.items():
-            distance = self._calculate_distance(position, node.position)
-            if distance < min_distance:
-                min_distance = distance
-                nearest_id = node_id
-
-        return (nearest_id, min_distance)
+        node_ids = self.graph.index_node_ids
+        result = self.graph.spatial_index.nearest_node_by(
+            position.z,
+            position.x,
+            lambda i: self._calculate_distance(position, self.graph.nodes[node_ids[i]].position),
+        )
+        if result is None:
+            return (None, float("inf"))
+        return (node_ids[result[0]], result[1])
 
     def _find_nearest_edge(
         self, position: Vector3, edge_type: str | None = None
     ) -> tuple[TaxiwayEdge, float] | None:
         """Find nearest edge to position.
 
+        Uses the graph's spatial index, so only edges around the position
+        are measured.
+
         Args:
             position: Position to search from
             edge_type: Optional edge type filter (e.g., "taxiway", "runway")
@@ -684,34 +917,52 @@ class PositionTracker:  # pylint: disable=too-many-instance-attributes
         if not self.graph.edges:
             return None
 
-        nearest_edge = None
-        min_distance = float("inf")
+        edges = self.graph.index_edges
+        nodes = self.graph.nodes
 
-        for edges in self.graph.edges.values():
-            for edge in edges:
-                # Filter by edge type if specified
-                if edge_type and edge.edge_type != edge_type:
-                    continue
+        def distance(i: int) -> float:
+            edge = edges[i]
+            return self._point_to_segment_distance(
+                position, nodes[edge.from_node].position, nodes[edge.to_node].position
+            )
 
-                # Get nodes for this edge
-                from_node = self.graph.nodes.get(edge.from_node)
-                to_node = self.graph.nodes.get(edge.to_node)
+        result = self.graph.spatial_index.nearest_edge_by(
+            position.z,
+            position.x,
+            distance,
+            mask=self.graph.edge_type_mask(edge_type) if edge_type else None,
+        )
+        if result is None:
+            return None
+        return (edges[result[0]], result[1])
 
-                if not from_node or not to_node:
-                    continue
+    def _find_nearest_edge_near_lock(self, position: Vector3) -> tuple[TaxiwayEdge, float] | None:
+        """Find the nearest edge around the locked node or edge.
 
-                # Calculate distance from position to line segment
-                distance = self._point_to_segment_distance(
-                    position, from_node.position, to_node.position
-                )
+        Args:
+            position: Position to search from
 
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_edge = edge
+        Returns:
+            Tuple of (edge, distance_meters), or None if not locked
+        """
+        candidates = self._lock_candidates()
+        if candidates is None or not candidates[1]:
+            return None
 
-        if nearest_edge:
-            return (nearest_edge, min_distance)
-        return None
+        nodes = self.graph.nodes
+        edges = self.graph.index_edges
+        nearest = min(
+            (
+                self._point_to_segment_distance(
+                    position,
+                    nodes[edges[e].from_node].position,
+                    nodes[edges[e].to_node].position,
+                ),
+                e,
+            )
+            for e in candidates[1]
+        )
+        return (edges[nearest[1]], nearest[0])
 
     def _classify_node(self, node: TaxiwayNode) -> tuple[LocationType, str]:
         """Classify a node to determine location type.
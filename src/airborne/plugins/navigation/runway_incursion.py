@@ -2,7 +2,8 @@
 
 This module provides runway incursion detection to prevent unauthorized
 runway entries. Issues graduated warnings (caution, warning, alert) based
-on proximity to runway and clearance state.
+on proximity to runway and clearance state. Proximity to every runway is
+measured in one vectorized RunwayGeometry query per update.
 
 Typical usage:
     from airborne.plugins.navigation.runway_incursion import RunwayIncursionDetector
@@ -17,12 +18,20 @@ import time
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 from airborne.airports.database import Runway
+from airborne.airports.ground_graph import GroundGraph
+from airborne.airports.runway_geometry import RunwayGeometry
 from airborne.core.messaging import Message, MessagePriority, MessageQueue, MessageTopic
 from airborne.physics.vectors import Vector3
 
 logger = logging.getLogger(__name__)
 
+# Distances from the runway pavement for graduated warnings
+CAUTION_DISTANCE_M = 50.0
+WARNING_DISTANCE_M = 20.0
+
 
 class IncursionLevel(Enum):
     """Runway incursion warning levels.
@@ -31,7 +40,8 @@ class IncursionLevel(Enum):
         NONE: No warning, aircraft not near runway or has clearance
         CAUTION: Aircraft within 50m of runway without clearance
         WARNING: Aircraft within 20m of runway without clearance
-        ALERT: Aircraft crossed hold-short line without clearance
+        ALERT: Aircraft crossed hold-short line (or is on the runway)
+            without clearance
 
     Examples:
         >>> level = IncursionLevel.WARNING
@@ -51,7 +61,7 @@ class RunwayProximity:
 
     Attributes:
         runway: Runway object
-        distance_m: Current distance to runway centerline in meters
+        distance_m: Current distance to runway pavement in meters
         last_warning_level: Last warning level issued
         last_warning_time: Timestamp of last warning
 
@@ -70,11 +80,14 @@ class RunwayIncursionDetector:
 
     Monitors aircraft position relative to runways and issues graduated
     warnings when approaching without clearance. Integrates with ATC
-    clearance system to suppress warnings when cleared.
+    clearance system to suppress warnings when cleared. With the airport's
+    GroundGraph, an aircraft on a runway edge of the taxi network raises an
+    alert for that runway.
 
     Attributes:
         message_queue: Queue for publishing warning messages
         runways: List of runways at current airport
+        geometry: Precomputed runway geometry for proximity queries
         cleared_runways: Set of runway IDs aircraft is cleared for
         proximity_data: Dict of runway proximity data
         warning_cooldown: Minimum seconds between duplicate warnings
@@ -90,6 +103,7 @@ class RunwayIncursionDetector:
         message_queue: MessageQueue | None = None,
         runways: list[Runway] | None = None,
         warning_cooldown: float = 3.0,
+        ground_graph: GroundGraph | None = None,
     ) -> None:
         """Initialize runway incursion detector.
 
@@ -97,10 +111,15 @@ class RunwayIncursionDetector:
             message_queue: Message queue for publishing warnings
             runways: List of runways to monitor
             warning_cooldown: Minimum seconds between duplicate warnings
+            ground_graph: Airport ground graph for on-runway checks
         """
         self.message_queue = message_queue
         self.runways = runways or []
         self.warning_cooldown = warning_cooldown
+        self.ground_graph = ground_graph
+        self.geometry = RunwayGeometry.from_runways(self.runways)
+        self.geometry.set_ground_graph(ground_graph)
+        self._runway_keys = [f"{r.le_ident}/{r.he_ident}" for r in self.runways]
 
         # Clearance tracking
         self.cleared_runways: set[str] = set()
@@ -144,14 +163,20 @@ class RunwayIncursionDetector:
         logger.info("Unsubscribed from ATC clearance events")
 
     def update(  # pylint: disable=unused-argument
-        self, position: Vector3, heading: float, timestamp: float = 0.0
+        self,
+        position: Vector3,
+        heading: float,
+        timestamp: float = 0.0,
+        edge: int | None = None,
     ) -> None:
         """Update incursion detection with current aircraft state.
 
         Args:
-            position: Current aircraft position (lat, alt, lon)
+            position: Current aircraft position (lon, alt, lat)
             heading: Current magnetic heading in degrees (reserved for future use)
             timestamp: Current simulation time (default: time.time())
+            edge: Ground graph edge the aircraft is on, if known (saves
+                looking up the runway edges around the aircraft)
 
         Examples:
             >>> detector.update(Vector3(-122.0, 10.0, 37.5), 270.0, time.time())
@@ -159,27 +184,50 @@ class RunwayIncursionDetector:
         if timestamp == 0.0:
             timestamp = time.time()
 
-        # Check proximity to each runway
-        for runway in self.runways:
-            # Calculate distance to runway centerline
-            distance = self._calculate_runway_distance(position, runway)
-
-            # Get or create proximity data
-            runway_key = f"{runway.le_ident}/{runway.he_ident}"
-            if runway_key not in self.proximity_data:
-                self.proximity_data[runway_key] = RunwayProximity(
-                    runway=runway,
-                    distance_m=distance,
-                )
-            else:
-                self.proximity_data[runway_key].distance_m = distance
+        proximity = self.geometry.query(position.z, position.x, edge)
+        distances = proximity.distance_m.tolist()
 
-            # Determine warning level
-            warning_level = self._determine_warning_level(runway_key, distance)
+        for runway, runway_key, distance in zip(
+            self.runways, self._runway_keys, distances, strict=True
+        ):
+            prox = self.proximity_data.get(runway_key)
+            if prox is None:
+                self.proximity_data[runway_key] = RunwayProximity(runway, distance)
+            else:
+                prox.distance_m = distance
 
-            # Issue warning if needed
+        # Only runways within caution distance or past their hold lines can warn
+        near = np.flatnonzero(
+            proximity.in_protected_zone | (proximity.distance_m <= CAUTION_DISTANCE_M)
+        )
+        for index in near.tolist():
+            runway_key = self._runway_keys[index]
+            warning_level = self._determine_warning_level(
+                runway_key, distances[index], bool(proximity.in_protected_zone[index])
+            )
             if warning_level != IncursionLevel.NONE:
-                self._issue_warning(runway_key, warning_level, distance, timestamp)
+                self._issue_warning(runway_key, warning_level, distances[index], timestamp)
+
+    def set_runways(self, runways: list[Runway]) -> None:
+        """Set the runways to monitor (e.g., when an airport loads).
+
+        Args:
+            runways: Runways at the current airport
+        """
+        self.runways = list(runways)
+        self.geometry = RunwayGeometry.from_runways(self.runways)
+        self.geometry.set_ground_graph(self.ground_graph)
+        self._runway_keys = [f"{r.le_ident}/{r.he_ident}" for r in self.runways]
+        self.proximity_data.clear()
+
+    def set_ground_graph(self, ground_graph: GroundGraph | None) -> None:
+        """Set the airport ground graph used for on-runway checks.
+
+        Args:
+            ground_graph: Airport ground graph, or None
+        """
+        self.ground_graph = ground_graph
+        self.geometry.set_ground_graph(ground_graph)
 
     def grant_clearance(self, runway_id: str) -> None:
         """Grant clearance for a specific runway.
@@ -230,98 +278,30 @@ class RunwayIncursionDetector:
         """Find nearest runway to position.
 
         Args:
-            position: Aircraft position (lat, alt, lon)
+            position: Aircraft position (lon, alt, lat)
 
         Returns:
-            Tuple of (nearest runway, distance in meters), or (None, inf)
+            Tuple of (nearest runway, distance to its pavement in meters),
+            or (None, inf)
 
         Examples:
             >>> runway, distance = detector.get_nearest_runway(position)
         """
-        nearest_runway = None
-        min_distance = float("inf")
-
-        for runway in self.runways:
-            distance = self._calculate_runway_distance(position, runway)
-            if distance < min_distance:
-                min_distance = distance
-                nearest_runway = runway
-
-        return nearest_runway, min_distance
-
-    def _calculate_runway_distance(self, position: Vector3, runway: Runway) -> float:
-        """Calculate perpendicular distance from position to runway centerline.
-
-        Args:
-            position: Aircraft position (lat, alt, lon)
-            runway: Runway object
-
-        Returns:
-            Distance to runway centerline in meters
-        """
-        # Extract position coordinates
-        lat = position.x
-        lon = position.z
-
-        # Runway endpoints
-        le_lat, le_lon = runway.le_latitude, runway.le_longitude
-        he_lat, he_lon = runway.he_latitude, runway.he_longitude
-
-        # Calculate distance to runway line segment
-        return self._point_to_segment_distance(lat, lon, le_lat, le_lon, he_lat, he_lon)
-
-    def _point_to_segment_distance(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
-        self, px: float, py: float, x1: float, y1: float, x2: float, y2: float
-    ) -> float:
-        """Calculate distance from point to line segment.
-
-        Uses projection to find closest point on segment, then calculates
-        distance. Converts lat/lon differences to approximate meters.
-
-        Args:
-            px, py: Point coordinates (lat, lon)
-            x1, y1: Segment start (lat, lon)
-            x2, y2: Segment end (lat, lon)
-
-        Returns:
-            Distance in meters
-        """
-        # Vector from start to end of segment
-        dx = x2 - x1
-        dy = y2 - y1
-
-        # Segment length squared
-        segment_length_sq = dx * dx + dy * dy
-
-        if segment_length_sq == 0:
-            # Segment is a point
-            diff_x = px - x1
-            diff_y = py - y1
-            return float((diff_x * diff_x + diff_y * diff_y) ** 0.5) * 111000.0
-
-        # Project point onto segment line
-        # t = ((px - x1) * dx + (py - y1) * dy) / segment_length_sq
-        t = ((px - x1) * dx + (py - y1) * dy) / segment_length_sq
-        t = max(0.0, min(1.0, t))  # Clamp to [0, 1]
-
-        # Find closest point on segment
-        closest_x = x1 + t * dx
-        closest_y = y1 + t * dy
-
-        # Calculate distance to closest point
-        diff_x = px - closest_x
-        diff_y = py - closest_y
-
-        # Convert to meters (approximate)
-        distance_degrees = (diff_x * diff_x + diff_y * diff_y) ** 0.5
-        return float(distance_degrees * 111000.0)
-
-    def _determine_warning_level(self, runway_key: str, distance_m: float) -> IncursionLevel:
+        proximity = self.geometry.query(position.z, position.x)
+        index = proximity.nearest()
+        if index is None:
+            return None, float("inf")
+        return self.runways[index], float(proximity.distance_m[index])
+
+    def _determine_warning_level(
+        self, runway_key: str, distance_m: float, past_hold_line: bool = False
+    ) -> IncursionLevel:
         """Determine warning level based on distance and clearance.
 
         Args:
             runway_key: Runway identifier key
-            distance_m: Distance to runway in meters
+            distance_m: Distance to runway pavement in meters
+            past_hold_line: Whether the aircraft is past the runway's hold lines
 
         Returns:
             Warning level
@@ -336,11 +316,11 @@ class RunwayIncursionDetector:
             return IncursionLevel.NONE
 
         # Graduated warnings based on proximity
-        if distance_m <= 0.0:
+        if past_hold_line or distance_m <= 0.0:
             return IncursionLevel.ALERT  # Crossed hold-short line
-        if distance_m <= 20.0:
+        if distance_m <= WARNING_DISTANCE_M:
             return IncursionLevel.WARNING  # Within 20m
-        if distance_m <= 50.0:
+        if distance_m <= CAUTION_DISTANCE_M:
             return IncursionLevel.CAUTION  # Within 50m
 
         return IncursionLevel.NONE
@@ -10,6 +10,9 @@ Message Types:
 - config: Client configuration (e.g., telemetry rate)
 - status: Server status messages
 
+Binary frames starting with b"ABTR" carry batched traffic reports instead
+of JSON (see traffic_ingest).
+
 ATC V2 Message Types (for future remote ASR/NLU):
 - atc_transcribe_request: Audio data for remote ASR transcription
 - atc_transcribe_response: Transcription result from remote ASR
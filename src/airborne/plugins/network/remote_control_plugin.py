@@ -9,6 +9,8 @@ Features:
 - Multiple simultaneous client connections
 - Complete control input support (axes + discrete actions)
 - JSON message protocol
+- External traffic injection from binary report batches, dead-reckoned
+  into the shared traffic state
 """
 
 import asyncio
@@ -21,7 +23,9 @@ from airborne.core.messaging import Message, MessagePriority, MessageTopic
 from airborne.core.plugin import IPlugin, PluginContext, PluginMetadata, PluginType
 from airborne.plugins.network.protocol import ActionCommand, ControlInput
 from airborne.plugins.network.telemetry_collector import TelemetryCollector
+from airborne.plugins.network.traffic_ingest import DeadReckoningTracks, TrafficIngest
 from airborne.plugins.network.websocket_server import RemoteControlServer
+from airborne.plugins.traffic.traffic_state import TrafficStateService
 
 logger = get_logger(__name__)
 
@@ -39,6 +43,10 @@ class RemoteControlPlugin(IPlugin):
         self.context: PluginContext | None = None
         self.server: RemoteControlServer | None = None
         self.telemetry_collector: TelemetryCollector | None = None
+        self.traffic_ingest: TrafficIngest | None = None
+
+        # Used when no AI traffic plugin shares a traffic state
+        self._traffic_state = TrafficStateService()
 
         # Async event loop running in background thread
         self._loop: asyncio.AbstractEventLoop | None = None
@@ -84,6 +92,12 @@ class RemoteControlPlugin(IPlugin):
         """
         self.context = context
 
+        # Share this plugin's traffic state unless an AI traffic plugin
+        # already does (one initialized later replaces it)
+        registry = context.plugin_registry
+        if registry and not registry.is_registered("traffic_state"):
+            registry.register("traffic_state", self._traffic_state)
+
         # Get configuration
         config = context.config.get("remote_control", {})
         host = config.get("host", "0.0.0.0")
@@ -92,12 +106,25 @@ class RemoteControlPlugin(IPlugin):
         # Create telemetry collector
         self.telemetry_collector = TelemetryCollector()
 
+        # Create external traffic ingest
+        ingest_config = config.get("traffic_ingest", {})
+        if ingest_config.get("enabled", True):
+            self.traffic_ingest = TrafficIngest(
+                DeadReckoningTracks(
+                    interpolation_delay_s=ingest_config.get("interpolation_delay_s", 0.1),
+                    max_extrapolation_s=ingest_config.get("max_extrapolation_s", 2.0),
+                    timeout_s=ingest_config.get("timeout_s", 5.0),
+                ),
+                publish_interval_s=ingest_config.get("publish_interval_s", 0.1),
+            )
+
         # Create WebSocket server
         self.server = RemoteControlServer(
             host=host,
             port=port,
             on_control_input=self._handle_control_input,
             on_action=self._handle_action,
+            on_traffic_batch=self.traffic_ingest.submit if self.traffic_ingest else None,
         )
 
         # Set aircraft name from config
@@ -334,6 +361,22 @@ class RemoteControlPlugin(IPlugin):
         # Apply remote control inputs if any
         self._apply_remote_controls()
 
+        # Move injected traffic into the traffic state; a state shared by the
+        # AI traffic plugin is published by that plugin at its broadcast rate
+        if self.traffic_ingest:
+            state = self._get_traffic_state()
+            self.traffic_ingest.update(dt, state)
+            if state is self._traffic_state:
+                state.publish(self.context.message_queue, "remote_control")
+
+    def _get_traffic_state(self) -> TrafficStateService:
+        """Get the shared traffic state, or this plugin's own if there is none."""
+        registry = self.context.plugin_registry if self.context else None
+        if registry and registry.is_registered("traffic_state"):
+            state: TrafficStateService = registry.get("traffic_state")
+            return state
+        return self._traffic_state
+
     def _apply_remote_controls(self) -> None:
         """Apply accumulated remote control inputs to the input system."""
         if not self.context:
@@ -399,6 +442,17 @@ class RemoteControlPlugin(IPlugin):
             if self._thread.is_alive():
                 logger.warning("Async thread did not stop cleanly")
 
+        if self.traffic_ingest:
+            self.traffic_ingest.clear(self._get_traffic_state())
+
+        registry = self.context.plugin_registry if self.context else None
+        if (
+            registry
+            and registry.is_registered("traffic_state")
+            and registry.get("traffic_state") is self._traffic_state
+        ):
+            registry.unregister("traffic_state")
+
         # Unsubscribe from messages
         if self.context:
             mq = self.context.message_queue
@@ -0,0 +1,577 @@
+"""External traffic ingest with dead-reckoning interpolation.
+
+External processes (a replay of recorded tracks, another simulator) feed
+traffic over the remote control WebSocket as binary frames. Each frame is
+a batch of timestamped position reports in fixed-size little-endian
+records, decoded with one ``np.frombuffer`` call:
+
+    header    20 bytes  magic b"ABTR", version (u8), pad, report count (u16),
+                        identity count (u16), pad, batch time (f64, seconds)
+    reports   36 bytes  track id (u32), time offset from the batch time (f32),
+                        x, z (f32, AI traffic frame units), altitude (f32, ft),
+                        vx, vz (f32, units/s), vertical speed (f32, ft/min),
+                        flags (u8, bit 0 = on ground), pad
+    identities 16 bytes track id (u32), callsign (8 bytes ASCII),
+                        aircraft type (4 bytes ASCII)
+
+An identity should accompany the first report of a track; tracks without
+one are named ``TRK<id>`` until it arrives.
+
+Tracks are held as arrays and displayed a short interpolation delay behind
+the newest reports: between two reports positions are interpolated, past
+the newest one they are extrapolated from its velocity (for a limited
+time), and the jump when a late report corrects an extrapolation is
+blended out over a short time. 10 Hz reports so give smooth per-frame
+positions for the AI traffic and TCAS pipeline.
+
+Typical usage:
+    ingest = TrafficIngest()
+    server = RemoteControlServer(on_traffic_batch=ingest.submit)
+    ingest.update(dt, traffic_state)  # every frame, main thread
+"""
+
+import struct
+import threading
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from airborne.physics.vectors import Vector3
+from airborne.plugins.traffic.traffic_state import UNITS_PER_NM, TrafficEntry, TrafficStateService
+
+TRAFFIC_MAGIC = b"ABTR"
+TRAFFIC_VERSION = 1
+
+_HEADER = struct.Struct("<4sBxHHxxd")
+
+REPORT_DTYPE = np.dtype(
+    [
+        ("track_id", "<u4"),
+        ("time", "<f4"),
+        ("x", "<f4"),
+        ("z", "<f4"),
+        ("altitude_ft", "<f4"),
+        ("vx", "<f4"),
+        ("vz", "<f4"),
+        ("vertical_speed_fpm", "<f4"),
+        ("flags", "u1"),
+        ("_pad", "V3"),
+    ]
+)
+
+IDENTITY_DTYPE = np.dtype([("track_id", "<u4"), ("callsign", "S8"), ("aircraft_type", "S4")])
+
+FLAG_ON_GROUND = 0x01
+
+# Per-track arrays, moved together on removal and growth
+_TRACK_ARRAYS = (
+    "_track_id",
+    "_time",
+    "_position",
+    "_velocity",
+    "_previous_time",
+    "_previous_position",
+    "_error",
+    "_error_time",
+    "_received",
+    "_on_ground",
+)
+
+
+@dataclass
+class TrafficBatch:
+    """Decoded batch of traffic reports.
+
+    Attributes:
+        timestamp: Sender time of the batch in seconds
+        reports: Position reports (REPORT_DTYPE records)
+        identities: Track identities (IDENTITY_DTYPE records)
+    """
+
+    timestamp: float
+    reports: np.ndarray
+    identities: np.ndarray
+
+
+def encode_traffic_batch(
+    timestamp: float, reports: np.ndarray, identities: np.ndarray | None = None
+) -> bytes:
+    """Encode a batch of traffic reports as a binary frame.
+
+    Args:
+        timestamp: Sender time of the batch in seconds
+        reports: Position reports (converted to REPORT_DTYPE)
+        identities: Track identities (converted to IDENTITY_DTYPE)
+
+    Returns:
+        Binary frame.
+
+    Examples:
+        >>> reports = np.zeros(2, dtype=REPORT_DTYPE)
+        >>> len(encode_traffic_batch(10.0, reports))
+        92
+    """
+    reports = np.asarray(reports, dtype=REPORT_DTYPE)
+    identities = np.asarray(
+        identities if identities is not None else np.zeros(0, IDENTITY_DTYPE),
+        dtype=IDENTITY_DTYPE,
+    )
+    header = _HEADER.pack(TRAFFIC_MAGIC, TRAFFIC_VERSION, len(reports), len(identities), timestamp)
+    return header + reports.tobytes() + identities.tobytes()
+
+
+def decode_traffic_batch(data: bytes) -> TrafficBatch:
+    """Decode a binary traffic frame without copying the records.
+
+    Args:
+        data: Binary frame
+
+    Returns:
+        Decoded batch (record arrays are read-only views of data).
+
+    Raises:
+        ValueError: If the frame is not a valid traffic batch.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Traffic batch too short")
+    magic, version, report_count, identity_count, timestamp = _HEADER.unpack_from(data)
+    if magic != TRAFFIC_MAGIC:
+        raise ValueError("Not a traffic batch")
+    if version != TRAFFIC_VERSION:
+        raise ValueError(f"Unsupported traffic batch version: {version}")
+
+    identity_offset = _HEADER.size + report_count * REPORT_DTYPE.itemsize
+    if len(data) != identity_offset + identity_count * IDENTITY_DTYPE.itemsize:
+        raise ValueError("Traffic batch size does not match its record counts")
+    return TrafficBatch(
+        timestamp=timestamp,
+        reports=np.frombuffer(data, REPORT_DTYPE, report_count, _HEADER.size),
+        identities=np.frombuffer(data, IDENTITY_DTYPE, identity_count, identity_offset),
+    )
+
+
+class DeadReckoningTracks:
+    """Track store that interpolates and extrapolates position reports.
+
+    Each track keeps its two newest reports. Positions are evaluated at
+    ``time - interpolation_delay_s``: between the two reports they are
+    interpolated, after the newest one they are extrapolated from its
+    velocity for at most ``max_extrapolation_s``. When a report arrives,
+    the difference between the position shown before and after it is
+    kept as an error that decays linearly over ``blend_s``.
+
+    Positions are (x, altitude in feet, z), velocities per second.
+
+    Attributes:
+        interpolation_delay_s: How far behind the newest reports to display
+        max_extrapolation_s: Longest extrapolation past the newest report
+        blend_s: Time over which corrections are blended out
+        timeout_s: Time without reports after which a track is dropped
+
+    Examples:
+        >>> tracks = DeadReckoningTracks(interpolation_delay_s=0.0)
+        >>> reports = np.zeros(1, dtype=REPORT_DTYPE)
+        >>> reports["vz"] = 100.0
+        >>> _ = tracks.ingest(reports, 0.0, now=0.0)
+        >>> float(tracks.positions(1.0)[0][0, 2])
+        100.0
+    """
+
+    def __init__(
+        self,
+        interpolation_delay_s: float = 0.1,
+        max_extrapolation_s: float = 2.0,
+        blend_s: float = 0.5,
+        timeout_s: float = 5.0,
+        capacity: int = 16,
+    ) -> None:
+        """Initialize an empty store.
+
+        Args:
+            interpolation_delay_s: How far behind the newest reports to display
+            max_extrapolation_s: Longest extrapolation past the newest report
+            blend_s: Time over which corrections are blended out
+            timeout_s: Time without reports after which a track is dropped
+            capacity: Initial number of track slots
+        """
+        self.interpolation_delay_s = interpolation_delay_s
+        self.max_extrapolation_s = max_extrapolation_s
+        self.blend_s = blend_s
+        self.timeout_s = timeout_s
+
+        self._count = 0
+        self._slots: dict[int, int] = {}
+        self._clock_offset: float | None = None
+
+        capacity = max(capacity, 1)
+        self._track_id = np.zeros(capacity, dtype=np.int64)
+        self._time = np.zeros(capacity)
+        self._position = np.zeros((capacity, 3))
+        self._velocity = np.zeros((capacity, 3))
+        self._previous_time = np.zeros(capacity)
+        self._previous_position = np.zeros((capacity, 3))
+        self._error = np.zeros((capacity, 3))
+        self._error_time = np.zeros(capacity)
+        self._received = np.zeros(capacity)
+        self._on_ground = np.zeros(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        """Get the number of tracks."""
+        return self._count
+
+    def __contains__(self, track_id: object) -> bool:
+        """Check whether a track is present."""
+        return track_id in self._slots
+
+    @property
+    def track_ids(self) -> npt.NDArray[np.int64]:
+        """Get track ids in slot order."""
+        return self._track_id[: self._count]
+
+    def ingest(self, reports: np.ndarray, timestamp: float, now: float) -> int:
+        """Apply position reports received at a local time.
+
+        Sender times are mapped to local time with the smallest observed
+        offset between them, so network jitter delays rather than
+        advances reports. Reports older than a track's newest report are
+        ignored; of several reports for a track only the newest is kept.
+
+        Args:
+            reports: Position reports (REPORT_DTYPE records)
+            timestamp: Sender time the report time offsets are relative to
+            now: Local time the reports were received
+
+        Returns:
+            Number of tracks updated.
+        """
+        if len(reports) == 0:
+            return 0
+        sender_time = timestamp + reports["time"].astype(np.float64)
+        offset = now - float(sender_time.max())
+        if self._clock_offset is None or offset < self._clock_offset:
+            self._clock_offset = offset
+        elif offset > self._clock_offset + self.timeout_s:
+            # The sender clock jumped back (e.g. a restarted replay)
+            self._clock_offset = offset
+        report_time = sender_time + self._clock_offset
+
+        # Newest report of each track
+        order = np.lexsort((report_time, reports["track_id"]))
+        ids = reports["track_id"][order].astype(np.int64)
+        last = np.append(ids[1:] != ids[:-1], True)
+        rows = order[last]
+        ids = ids[last]
+        report_time = report_time[rows]
+
+        slots = np.fromiter(
+            (self._slot(track_id) for track_id in ids.tolist()), dtype=np.int64, count=len(ids)
+        )
+        fresh = report_time > self._time[slots]
+        new = self._received[slots] < 0
+        keep = fresh | new
+        slots, rows, report_time, new = slots[keep], rows[keep], report_time[keep], new[keep]
+        if len(slots) == 0:
+            return 0
+
+        shown_before = np.zeros((len(slots), 3))
+        shown_before[~new] = self._evaluate(slots[~new], now)
+
+        records = reports[rows]
+        position = np.column_stack((records["x"], records["altitude_ft"], records["z"])).astype(
+            np.float64
+        )
+        velocity = np.column_stack(
+            (records["vx"], records["vertical_speed_fpm"] / 60.0, records["vz"])
+        ).astype(np.float64)
+
+        # New tracks start with both reports equal
+        self._previous_time[slots] = np.where(new, report_time, self._time[slots])
+        self._previous_position[slots] = np.where(new[:, None], position, self._position[slots])
+        self._time[slots] = report_time
+        self._position[slots] = position
+        self._velocity[slots] = velocity
+        self._on_ground[slots] = (records["flags"] & FLAG_ON_GROUND) != 0
+        self._received[slots] = now
+
+        self._error[slots] = 0.0
+        shown_after = self._evaluate(slots, now)
+        self._error[slots] = np.where(new[:, None], 0.0, shown_before - shown_after)
+        self._error_time[slots] = now
+        return len(slots)
+
+    def positions(self, now: float) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Get the displayed position and velocity of every track.
+
+        Args:
+            now: Local time
+
+        Returns:
+            Positions and velocities, in slot order.
+        """
+        slots = np.arange(self._count)
+        return self._evaluate(slots, now), self._velocity[: self._count]
+
+    def on_ground(self) -> npt.NDArray[np.bool_]:
+        """Get the on-ground flag of every track, in slot order."""
+        return self._on_ground[: self._count]
+
+    def remove_stale(self, now: float) -> list[int]:
+        """Drop tracks without reports for longer than the timeout.
+
+        Args:
+            now: Local time
+
+        Returns:
+            Ids of the dropped tracks.
+        """
+        stale = np.flatnonzero(now - self._received[: self._count] > self.timeout_s)
+        track_ids: list[int] = self._track_id[stale].tolist()
+        for track_id in track_ids:
+            self.remove(track_id)
+        return track_ids
+
+    def remove(self, track_id: int) -> bool:
+        """Remove a track; the last slot is moved into the freed one.
+
+        Args:
+            track_id: Track id
+
+        Returns:
+            True if the track was removed, False if it was not present.
+        """
+        slot = self._slots.pop(track_id, None)
+        if slot is None:
+            return False
+        last = self._count - 1
+        if slot != last:
+            for array in self._arrays():
+                array[slot] = array[last]
+            self._slots[int(self._track_id[slot])] = slot
+        self._count = last
+        return True
+
+    def clear(self) -> None:
+        """Remove all tracks."""
+        self._slots.clear()
+        self._count = 0
+        self._clock_offset = None
+
+    def _slot(self, track_id: int) -> int:
+        """Get the slot of a track, allocating one (marked new) if needed."""
+        slot = self._slots.get(track_id)
+        if slot is None:
+            slot = self._count
+            if slot == len(self._time):
+                self._grow()
+            self._count += 1
+            self._slots[track_id] = slot
+            self._track_id[slot] = track_id
+            self._time[slot] = -np.inf
+            self._received[slot] = -1.0
+            self._error[slot] = 0.0
+        return slot
+
+    def _evaluate(self, slots: npt.NDArray[np.int64], now: float) -> npt.NDArray[np.float64]:
+        """Evaluate displayed positions of slots at a local time."""
+        display_time = now - self.interpolation_delay_s
+        time = self._time[slots]
+        previous_time = self._previous_time[slots]
+        position = self._position[slots]
+
+        # Interpolate between the two reports, or extrapolate past the newest
+        span = time - previous_time
+        fraction = np.clip((display_time - previous_time) / np.where(span > 0, span, 1.0), 0.0, 1.0)
+        interpolated = (
+            self._previous_position[slots]
+            + (position - self._previous_position[slots]) * fraction[:, None]
+        )
+        ahead = np.clip(display_time - time, 0.0, self.max_extrapolation_s)
+        shown = np.where(
+            (display_time < time)[:, None],
+            interpolated,
+            position + self._velocity[slots] * ahead[:, None],
+        )
+
+        remaining = 1.0 - (now - self._error_time[slots]) / self.blend_s
+        shown += self._error[slots] * np.clip(remaining, 0.0, 1.0)[:, None]
+        return shown
+
+    def _arrays(self) -> list[np.ndarray]:
+        """Get every per-track array."""
+        return [getattr(self, name) for name in _TRACK_ARRAYS]
+
+    def _grow(self) -> None:
+        """Double the per-track arrays."""
+        size = 2 * len(self._time)
+        for name in _TRACK_ARRAYS:
+            array = getattr(self, name)
+            grown = np.zeros((size, *array.shape[1:]), dtype=array.dtype)
+            grown[: len(array)] = array
+            setattr(self, name, grown)
+
+
+class TrafficIngest:
+    """Feeds externally reported traffic into the shared traffic state.
+
+    Batches are submitted from the network thread and applied on the main
+    thread in update(), which writes every track's dead-reckoned position
+    into a TrafficStateService at the traffic broadcast rate. Entries carry
+    velocities, so state consumers such as TCAS extrapolate them between
+    writes; per-frame consumers read smooth positions directly with
+    positions().
+
+    Attributes:
+        tracks: Dead-reckoning track store
+        units_per_nm: Position units per nautical mile
+        publish_interval_s: Seconds between writes into the traffic state
+
+    Examples:
+        >>> ingest = TrafficIngest()
+        >>> frame = encode_traffic_batch(0.0, np.zeros(1, dtype=REPORT_DTYPE))
+        >>> ingest.submit(decode_traffic_batch(frame))
+        >>> state = TrafficStateService()
+        >>> ingest.update(1 / 60, state)
+        >>> [entry.callsign for entry in state.within(Vector3(0, 0, 0), 1.0)]
+        ['TRK0']
+    """
+
+    def __init__(
+        self,
+        tracks: DeadReckoningTracks | None = None,
+        units_per_nm: float = UNITS_PER_NM,
+        publish_interval_s: float = 0.1,
+    ) -> None:
+        """Initialize with no tracks.
+
+        Args:
+            tracks: Track store (defaults to DeadReckoningTracks())
+            units_per_nm: Position units per nautical mile
+            publish_interval_s: Seconds between writes into the traffic state
+                (0 writes every update)
+        """
+        self.tracks = tracks if tracks is not None else DeadReckoningTracks()
+        self.units_per_nm = units_per_nm
+        self.publish_interval_s = publish_interval_s
+        self._time_s = 0.0
+        self._publish_time_s: float | None = None
+        self._inbox: deque[TrafficBatch] = deque()
+        self._inbox_lock = threading.Lock()
+        self._identities: dict[int, tuple[str, str]] = {}
+        self._published: dict[int, str] = {}
+
+    def submit(self, batch: TrafficBatch) -> None:
+        """Queue a decoded batch (thread-safe).
+
+        Args:
+            batch: Decoded traffic batch
+        """
+        with self._inbox_lock:
+            self._inbox.append(batch)
+
+    def update(self, dt: float, state: TrafficStateService) -> None:
+        """Apply queued batches and write track positions into the state.
+
+        Positions are written when publish_interval_s has passed since the
+        previous write; tracks that time out leave the state immediately.
+
+        Args:
+            dt: Time since the previous update in seconds
+            state: Traffic state to write into
+        """
+        self._time_s += dt
+        now = self._time_s
+        with self._inbox_lock:
+            batches = list(self._inbox)
+            self._inbox.clear()
+        for batch in batches:
+            self._learn_identities(batch.identities)
+            self.tracks.ingest(batch.reports, batch.timestamp, now)
+
+        for track_id in self.tracks.remove_stale(now):
+            callsign = self._published.pop(track_id, None)
+            if callsign is not None:
+                state.remove(callsign)
+
+        if (
+            self._publish_time_s is None
+            or now - self._publish_time_s >= self.publish_interval_s - 1e-9
+        ):
+            self._publish_time_s = now
+            state.put_many(self._entries(now, state))
+
+    def positions(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get smooth positions of every track at the current update time.
+
+        Returns:
+            Tuple of (track ids, (n, 3) positions with y as altitude in feet)
+        """
+        position, _ = self.tracks.positions(self._time_s)
+        return self.tracks.track_ids, position
+
+    def clear(self, state: TrafficStateService | None = None) -> None:
+        """Drop all tracks.
+
+        Args:
+            state: Traffic state to remove the published tracks from
+        """
+        with self._inbox_lock:
+            self._inbox.clear()
+        self.tracks.clear()
+        if state is not None:
+            for callsign in self._published.values():
+                state.remove(callsign)
+        self._published.clear()
+
+    @property
+    def track_count(self) -> int:
+        """Get the number of tracks."""
+        return len(self.tracks)
+
+    def _learn_identities(self, identities: Iterable[np.void]) -> None:
+        """Record callsigns and aircraft types of tracks."""
+        for identity in identities:
+            self._identities[int(identity["track_id"])] = (
+                bytes(identity["callsign"]).decode("ascii", "replace"),
+                bytes(identity["aircraft_type"]).decode("ascii", "replace"),
+            )
+
+    def _entries(self, now: float, state: TrafficStateService) -> list[TrafficEntry]:
+        """Create traffic entries for every track at a local time."""
+        tracks = self.tracks
+        position, velocity = tracks.positions(now)
+        heading = np.degrees(np.arctan2(velocity[:, 0], velocity[:, 2])) % 360.0
+        speed_kts = np.hypot(velocity[:, 0], velocity[:, 2]) / self.units_per_nm * 3600.0
+
+        entries = []
+        for track_id, (x, altitude, z), (vx, vy, vz), hdg, kts, ground in zip(
+            tracks.track_ids.tolist(),
+            position.tolist(),
+            velocity.tolist(),
+            heading.tolist(),
+            speed_kts.tolist(),
+            tracks.on_ground().tolist(),
+            strict=True,
+        ):
+            callsign, aircraft_type = self._identities.get(track_id, (f"TRK{track_id}", ""))
+            previous = self._published.get(track_id)
+            if previous != callsign:
+                if previous is not None:
+                    state.remove(previous)
+                self._published[track_id] = callsign
+            entries.append(
+                TrafficEntry(
+                    callsign=callsign,
+                    aircraft_type=aircraft_type,
+                    position=Vector3(x, altitude, z),
+                    velocity=Vector3(vx, vy, vz),
+                    altitude_ft=altitude,
+                    vertical_speed_fpm=vy * 60.0,
+                    heading=hdg,
+                    speed_kts=kts,
+                    on_ground=ground,
+                )
+            )
+        return entries
@@ -2,7 +2,8 @@
 
 This module provides an async WebSocket server that handles multiple client
 connections, broadcasts telemetry at configurable rates, and receives
-control inputs from connected clients.
+control inputs from connected clients. Binary frames starting with the
+traffic magic carry batched traffic reports (see traffic_ingest).
 """
 
 import asyncio
@@ -25,6 +26,11 @@ from airborne.plugins.network.protocol import (
     ServerStatus,
     TelemetryData,
 )
+from airborne.plugins.network.traffic_ingest import (
+    TRAFFIC_MAGIC,
+    TrafficBatch,
+    decode_traffic_batch,
+)
 
 logger = get_logger(__name__)
 
@@ -66,6 +72,7 @@ class RemoteControlServer:
         port: int = 51128,
         on_control_input: Callable[[ControlInput], None] | None = None,
         on_action: Callable[[ActionCommand], None] | None = None,
+        on_traffic_batch: Callable[[TrafficBatch], None] | None = None,
     ) -> None:
         """Initialize the WebSocket server.
 
@@ -74,11 +81,13 @@ class RemoteControlServer:
             port: Port number to listen on.
             on_control_input: Callback for control input messages.
             on_action: Callback for action command messages.
+            on_traffic_batch: Callback for binary traffic report batches.
         """
         self.host = host
         self.port = port
         self.on_control_input = on_control_input
         self.on_action = on_action
+        self.on_traffic_batch = on_traffic_batch
 
         # Connected clients
         self._clients: dict[str, ClientSession] = {}
@@ -200,6 +209,9 @@ class RemoteControlServer:
             raw_message: Raw message string.
         """
         if isinstance(raw_message, bytes):
+            if raw_message.startswith(TRAFFIC_MAGIC):
+                await self._handle_traffic(session, raw_message)
+                return
             raw_message = raw_message.decode("utf-8")
 
         try:
@@ -219,6 +231,24 @@ class RemoteControlServer:
         else:
             logger.debug(f"Ignoring message type {msg_type} from {session.client_id}")
 
+    async def _handle_traffic(self, session: ClientSession, raw_message: bytes) -> None:
+        """Handle a binary traffic report batch.
+
+        Args:
+            session: Client session.
+            raw_message: Binary traffic batch.
+        """
+        try:
+            batch = decode_traffic_batch(raw_message)
+        except ValueError as e:
+            logger.warning(f"Invalid traffic batch from {session.client_id}: {e}")
+            error_msg = ProtocolMessage.encode_error(str(e), "invalid_traffic_batch")
+            await session.websocket.send(error_msg)
+            return
+
+        if self.on_traffic_batch:
+            self.on_traffic_batch(batch)
+
     def _handle_control(self, session: ClientSession, data: dict[str, Any]) -> None:
         """Handle control input message.
 
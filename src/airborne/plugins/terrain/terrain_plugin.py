@@ -7,24 +7,30 @@ The plugin integrates:
 - ElevationService: Terrain elevation queries with caching
 - OSMProvider: Geographic features (cities, mountains, oceans, etc.)
 - TerrainCollisionDetector: CFIT prevention and terrain awareness
+- TerrainAwarenessSystem: Forward-looking terrain caution/warning (TAWS)
+- TerrainPrefetcher: Background loading of terrain ahead of the aircraft
 
 Typical usage:
     The terrain plugin is loaded automatically and provides terrain services
     to other plugins via the component registry.
 """
 
+import math
 from typing import Any
 
 from airborne.core.logging_system import get_logger
 from airborne.core.messaging import Message, MessagePriority, MessageTopic
 from airborne.core.plugin import IPlugin, PluginContext, PluginMetadata, PluginType
 from airborne.physics.collision import TerrainCollisionDetector
+from airborne.physics.terrain_awareness import TerrainAlertLevel, TerrainAwarenessSystem
 from airborne.physics.vectors import Vector3
 from airborne.terrain import (
     ElevationService,
+    MSAGrid,
     OSMProvider,
     SimpleFlatEarthProvider,
     SRTMProvider,
+    TerrainPrefetcher,
 )
 
 logger = get_logger(__name__)
@@ -51,10 +57,19 @@ class TerrainPlugin(IPlugin):
         self.elevation_service: ElevationService | None = None
         self.osm_provider: OSMProvider | None = None
         self.collision_detector: TerrainCollisionDetector | None = None
+        self.terrain_awareness: TerrainAwarenessSystem | None = None
+        self.prefetcher: TerrainPrefetcher | None = None
 
         # Current aircraft position (updated via messages)
         self._current_position: Vector3 | None = None
         self._current_altitude: float = 0.0
+        self._current_velocity: Vector3 | None = None
+        self._on_ground = False
+
+        # Terrain awareness evaluation rate
+        self._taws_interval = 1.0
+        self._taws_timer = 0.0
+        self._taws_level = TerrainAlertLevel.NONE
 
     def get_metadata(self) -> PluginMetadata:
         """Return plugin metadata.
@@ -95,7 +110,11 @@ class TerrainPlugin(IPlugin):
         for provider_name in providers:
             if provider_name == "srtm":
                 use_fallback = terrain_config.get("srtm_fallback", True)
-                srtm_provider = SRTMProvider(use_fallback=use_fallback)
+                srtm_provider = SRTMProvider(
+                    cache_dir=terrain_config.get("srtm_tile_dir"),
+                    use_fallback=use_fallback,
+                    max_tile_memory_mb=terrain_config.get("srtm_tile_memory_mb", 256.0),
+                )
                 self.elevation_service.add_provider(srtm_provider)
                 logger.info("Added SRTM elevation provider (fallback=%s)", use_fallback)
             elif provider_name == "simple_flat_earth":
@@ -103,8 +122,24 @@ class TerrainPlugin(IPlugin):
                 self.elevation_service.add_provider(flat_earth_provider)
                 logger.info("Added SimpleFlatEarth elevation provider")
 
-        # Create OSM provider
+        # Prefetch terrain ahead of the aircraft on a background thread
+        prefetch_config = terrain_config.get("prefetch", {})
+        if prefetch_config.get("enabled", True):
+            self.prefetcher = TerrainPrefetcher(
+                self.elevation_service,
+                horizon_s=prefetch_config.get("horizon_s", 300.0),
+                corridor_half_width_m=prefetch_config.get("corridor_half_width_m", 2000.0),
+                memory_budget_mb=prefetch_config.get("memory_budget_mb", 8.0),
+            )
+            self.prefetcher.start()
+
+        # Create OSM provider (plus any offline feature datasets)
         self.osm_provider = OSMProvider()
+        for feature_file in terrain_config.get("osm_feature_files", []):
+            try:
+                self.osm_provider.load_features(feature_file)
+            except (OSError, ValueError) as e:
+                logger.warning("Failed to load OSM features from %s: %s", feature_file, e)
         logger.info(
             "Initialized OSM provider with %d features", self.osm_provider.get_feature_count()
         )
@@ -112,6 +147,14 @@ class TerrainPlugin(IPlugin):
         # Create collision detector with elevation service
         self.collision_detector = TerrainCollisionDetector(self.elevation_service)
 
+        # Precomputed MSA grid (built offline with scripts/build_msa_grid.py)
+        msa_grid_file = terrain_config.get("msa_grid_file")
+        if msa_grid_file:
+            try:
+                self.collision_detector.set_msa_grid(MSAGrid.load(msa_grid_file))
+            except (OSError, ValueError) as e:
+                logger.warning("Failed to load MSA grid %s: %s", msa_grid_file, e)
+
         # Configure collision detector thresholds if specified
         if "collision_thresholds" in terrain_config:
             thresholds = terrain_config["collision_thresholds"]
@@ -122,6 +165,21 @@ class TerrainPlugin(IPlugin):
             )
             logger.info("Configured collision thresholds: %s", thresholds)
 
+        # Create forward-looking terrain awareness
+        taws_config = terrain_config.get("terrain_awareness", {})
+        if taws_config.get("enabled", True):
+            self.terrain_awareness = TerrainAwarenessSystem(
+                self.elevation_service,
+                lookahead_s=taws_config.get("lookahead_s", 90.0),
+                caution_time_s=taws_config.get("caution_time_s", 60.0),
+                warning_time_s=taws_config.get("warning_time_s", 30.0),
+                clearance_floor_ft=taws_config.get("clearance_floor_ft", 100.0),
+                fan_half_angle_deg=taws_config.get("fan_half_angle_deg", 30.0),
+                fan_headings=taws_config.get("fan_headings", 7),
+                samples_per_heading=taws_config.get("samples_per_heading", 30),
+            )
+            self._taws_interval = 1.0 / max(taws_config.get("rate_hz", 1.0), 0.01)
+
         # Register components in registry
         if context.plugin_registry:
             context.plugin_registry.register("elevation_service", self.elevation_service)
@@ -153,6 +211,24 @@ class TerrainPlugin(IPlugin):
         if not self.context or not self._current_position or not self.elevation_service:
             return
 
+        # Feed the prefetcher and pick up blocks it has finished loading
+        if self.prefetcher:
+            velocity = self._current_velocity
+            if velocity is not None:
+                self.prefetcher.update(
+                    self._current_position.z,
+                    self._current_position.x,
+                    math.degrees(math.atan2(velocity.x, velocity.z)) % 360.0,
+                    math.hypot(velocity.x, velocity.z),
+                )
+            self.prefetcher.drain()
+
+        # Forward-looking terrain awareness at its own (lower) rate
+        self._taws_timer += dt
+        if self.terrain_awareness and self._taws_timer >= self._taws_interval:
+            self._taws_timer = 0.0
+            self._update_terrain_awareness()
+
         # Get terrain elevation at current position
         try:
             elevation = self.elevation_service.get_elevation_at_position(self._current_position)
@@ -178,8 +254,59 @@ class TerrainPlugin(IPlugin):
         except Exception as e:
             logger.warning("Failed to get terrain elevation: %s", e)
 
+    def _update_terrain_awareness(self) -> None:
+        """Evaluate the TAWS look-ahead and publish graded alerts.
+
+        Alerts are republished at the evaluation rate while active, and a
+        single NONE message is published when an alert clears.
+        """
+        if (
+            not self.context
+            or not self.terrain_awareness
+            or not self._current_position
+            or not self._current_velocity
+        ):
+            return
+
+        if self._on_ground:
+            level = TerrainAlertLevel.NONE
+            result = None
+        else:
+            result = self.terrain_awareness.evaluate(
+                self._current_position, self._current_altitude, self._current_velocity
+            )
+            level = result.level
+
+        if level == TerrainAlertLevel.NONE and self._taws_level == TerrainAlertLevel.NONE:
+            return
+        self._taws_level = level
+
+        self.context.message_queue.publish(
+            Message(
+                sender="terrain_plugin",
+                recipients=["*"],
+                topic=MessageTopic.TERRAIN_WARNING,
+                data={
+                    "level": level.value,
+                    "time_to_conflict_s": result.time_to_conflict_s if result else None,
+                    "time_to_impact_s": result.time_to_impact_s if result else None,
+                    "min_clearance_m": result.min_clearance_m if result else None,
+                    "conflict_heading_deg": result.conflict_heading_deg if result else None,
+                },
+                priority=(
+                    MessagePriority.CRITICAL
+                    if level == TerrainAlertLevel.WARNING
+                    else MessagePriority.HIGH
+                ),
+            )
+        )
+
     def shutdown(self) -> None:
         """Shutdown the terrain plugin."""
+        if self.prefetcher:
+            self.prefetcher.stop()
+            self.prefetcher = None
+
         if self.context:
             # Unsubscribe from messages
             self.context.message_queue.unsubscribe(
@@ -209,6 +336,12 @@ class TerrainPlugin(IPlugin):
                     float(pos.get("x", 0.0)), float(pos.get("y", 0.0)), float(pos.get("z", 0.0))
                 )
                 self._current_altitude = float(pos.get("y", 0.0))
+            if "velocity" in data:
+                vel = data["velocity"]
+                self._current_velocity = Vector3(
+                    float(vel.get("x", 0.0)), float(vel.get("y", 0.0)), float(vel.get("z", 0.0))
+                )
+            self._on_ground = bool(data.get("on_ground", False))
 
     def on_config_changed(self, config: dict[str, Any]) -> None:
         """Handle configuration changes.
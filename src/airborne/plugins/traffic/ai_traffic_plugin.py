@@ -1,17 +1,45 @@
 """AI Traffic management plugin."""
 
-from airborne.core.messaging import Message, MessagePriority, MessageQueue, MessageTopic
+import logging
+from datetime import UTC, datetime
+from typing import Any
+
+from airborne.airports.database import FrequencyType
+from airborne.core.messaging import Message, MessageQueue, MessageTopic
 from airborne.core.plugin import IPlugin, PluginContext, PluginMetadata, PluginType
+from airborne.navigation.routes import OpenFlightsProvider
 from airborne.physics.vectors import Vector3
 from airborne.plugins.traffic.ai_aircraft import AIAircraft
+from airborne.plugins.traffic.ground_traffic import GroundTrafficManager
+from airborne.plugins.traffic.regional_traffic import (
+    SECONDS_PER_DAY,
+    FlightSchedule,
+    RegionalTraffic,
+)
+from airborne.plugins.traffic.traffic_arrays import TrafficArrays
 from airborne.plugins.traffic.traffic_patterns import TrafficGenerator
+from airborne.plugins.traffic.traffic_state import TrafficStateService
+
+logger = logging.getLogger(__name__)
 
 
 class AITrafficPlugin(IPlugin):
     """Manages AI traffic in the simulation.
 
-    Spawns, updates, and removes AI aircraft. Broadcasts traffic
-    information to other plugins (e.g., TCAS).
+    Spawns, updates, and removes AI aircraft. Traffic is shared through a
+    TrafficStateService, registered as "traffic_state"; changes are
+    broadcast to other plugins (e.g., TCAS) as TRAFFIC_DELTA messages.
+
+    Aircraft state lives in a TrafficArrays store that steps all aircraft
+    together, with distant traffic updated less often than nearby traffic.
+
+    With regional traffic enabled, scheduled airline flights from the
+    route network are added around the player instead of random local
+    traffic (see RegionalTraffic).
+
+    With ground traffic enabled, AI aircraft also taxi at the current
+    airport on the ground graph of the taxiway graph published by ground
+    navigation (see GroundTrafficManager).
     """
 
     def __init__(self) -> None:
@@ -20,7 +48,8 @@ class AITrafficPlugin(IPlugin):
         self._message_queue: MessageQueue | None = None
 
         self._traffic_generator = TrafficGenerator()
-        self._aircraft: dict[str, AIAircraft] = {}
+        self._traffic = TrafficArrays()
+        self._state = TrafficStateService()
 
         # Player aircraft position (to manage traffic spawning)
         self._player_position = Vector3(0, 0, 0)
@@ -37,6 +66,13 @@ class AITrafficPlugin(IPlugin):
         self._spawn_interval = 30.0  # Spawn new traffic every 30 seconds
         self._traffic_enabled = True
 
+        # Schedule-driven regional traffic (None when disabled)
+        self._regional: RegionalTraffic | None = None
+        self._regional_time_s = 0.0
+
+        # Taxiing AI traffic at the current airport (None when disabled)
+        self._ground_traffic: GroundTrafficManager | None = None
+
     def get_metadata(self) -> PluginMetadata:
         """Get plugin metadata."""
         return PluginMetadata(
@@ -54,6 +90,13 @@ class AITrafficPlugin(IPlugin):
         self._context = context
         self._message_queue = context.message_queue
 
+        # This plugin's state replaces a fallback (e.g. remote control's)
+        registry = context.plugin_registry
+        if registry:
+            if registry.is_registered("traffic_state"):
+                registry.unregister("traffic_state")
+            registry.register("traffic_state", self._state)
+
         # Subscribe to position updates
         if self._message_queue:
             self._message_queue.subscribe(MessageTopic.POSITION_UPDATED, self.handle_message)
@@ -65,6 +108,14 @@ class AITrafficPlugin(IPlugin):
             self._spawn_distance_nm = traffic_config.get("spawn_distance_nm", 15.0)
             self._despawn_distance_nm = traffic_config.get("despawn_distance_nm", 20.0)
             self._traffic_enabled = traffic_config.get("enabled", True)
+            regional_config = traffic_config.get("regional", {})
+            if regional_config.get("enabled", False):
+                self._load_regional_traffic(regional_config)
+            ground_config = traffic_config.get("ground", {})
+            if ground_config.get("enabled", False) and self._message_queue:
+                self._ground_traffic = GroundTrafficManager(self._message_queue)
+                self._ground_traffic.max_traffic = ground_config.get("max_count", 5)
+                self._message_queue.subscribe(MessageTopic.AIRPORT_LOADED, self.handle_message)
 
     def update(self, dt: float) -> None:
         """Update AI traffic.
@@ -75,21 +126,25 @@ class AITrafficPlugin(IPlugin):
         if not self._traffic_enabled:
             return
 
-        # Update all AI aircraft
-        for aircraft in list(self._aircraft.values()):
-            aircraft.update(dt)
+        # Update all AI aircraft, then remove those that are too far away
+        self._traffic.update(dt, self._player_position)
+        for callsign in self._traffic.remove_beyond(
+            self._player_position, self._despawn_distance_nm
+        ):
+            self._state.remove(callsign)
 
-            # Remove aircraft that are too far away
-            distance_nm = aircraft.get_distance_to(self._player_position)
-            if distance_nm > self._despawn_distance_nm:
-                del self._aircraft[aircraft.callsign]
+        if self._regional is not None:
+            self._regional_time_s = (self._regional_time_s + dt) % SECONDS_PER_DAY
 
         # Spawn new traffic periodically
         self._time_since_last_spawn += dt
-        if self._time_since_last_spawn >= self._spawn_interval:
+        if self._regional is None and self._time_since_last_spawn >= self._spawn_interval:
             self._time_since_last_spawn = 0.0
             self._spawn_traffic()
 
+        if self._ground_traffic is not None and self._ground_traffic.ground_graph is not None:
+            self._ground_traffic.update(dt)
+
         # Broadcast traffic updates
         self._time_since_broadcast += dt
         if self._time_since_broadcast >= self._update_interval:
@@ -100,8 +155,19 @@ class AITrafficPlugin(IPlugin):
         """Shutdown plugin."""
         if self._message_queue:
             self._message_queue.unsubscribe(MessageTopic.POSITION_UPDATED, self.handle_message)
+            self._message_queue.unsubscribe(MessageTopic.AIRPORT_LOADED, self.handle_message)
+
+        if self._ground_traffic is not None:
+            self._ground_traffic.clear_all_traffic()
+        self.clear_all_aircraft()
 
-        self._aircraft.clear()
+        registry = self._context.plugin_registry if self._context else None
+        if (
+            registry
+            and registry.is_registered("traffic_state")
+            and registry.get("traffic_state") is self._state
+        ):
+            registry.unregister("traffic_state")
 
     def handle_message(self, message: Message) -> None:
         """Handle incoming messages.
@@ -111,6 +177,8 @@ class AITrafficPlugin(IPlugin):
         """
         if message.topic == MessageTopic.POSITION_UPDATED:
             self._handle_position_update(message)
+        elif message.topic == MessageTopic.AIRPORT_LOADED:
+            self._handle_airport_loaded(message)
 
     def _handle_position_update(self, message: Message) -> None:
         """Handle player position update."""
@@ -118,10 +186,29 @@ class AITrafficPlugin(IPlugin):
         if data and "position" in data:
             self._player_position = data["position"]
 
+    def _handle_airport_loaded(self, message: Message) -> None:
+        """Move ground traffic to a new airport, sharing its ground graph.
+
+        Ground traffic is tuned to the airport's first ground frequency.
+        """
+        if self._ground_traffic is None:
+            return
+        graph = message.data.get("graph")
+        self._ground_traffic.clear_all_traffic()
+        self._ground_traffic.set_ground_graph(graph.ground_graph if graph is not None else None)
+        self._ground_traffic.ground_frequency_mhz = next(
+            (
+                frequency.frequency_mhz
+                for frequency in message.data.get("frequencies", [])
+                if frequency.freq_type == FrequencyType.GND
+            ),
+            None,
+        )
+
     def _spawn_traffic(self) -> None:
         """Spawn new AI traffic near player."""
         # Don't spawn if already at max
-        if len(self._aircraft) >= self._max_traffic_count:
+        if len(self._traffic) >= self._max_traffic_count:
             return
 
         # Spawn random traffic near player
@@ -139,7 +226,7 @@ class AITrafficPlugin(IPlugin):
                 runway_heading=runway_heading,
                 airport_elevation_ft=0.0,
             )
-            self._aircraft[aircraft.callsign] = aircraft
+            self._traffic.add(aircraft)
 
         elif traffic_type == "arrival":
             aircraft = self._traffic_generator.generate_arrival(
@@ -148,7 +235,7 @@ class AITrafficPlugin(IPlugin):
                 airport_elevation_ft=0.0,
                 entry_distance_nm=self._spawn_distance_nm,
             )
-            self._aircraft[aircraft.callsign] = aircraft
+            self._traffic.add(aircraft)
 
         else:  # pattern
             pattern_aircraft = self._traffic_generator.generate_pattern_traffic(
@@ -159,26 +246,82 @@ class AITrafficPlugin(IPlugin):
             )
             if pattern_aircraft:
                 aircraft = pattern_aircraft[0]
-                self._aircraft[aircraft.callsign] = aircraft
+                self._traffic.add(aircraft)
 
     def _broadcast_traffic(self) -> None:
-        """Broadcast traffic updates to other plugins."""
-        if not self._message_queue:
+        """Broadcast traffic changes since the last broadcast to other plugins."""
+        self._traffic.sync()
+        self._state.put_many(self._traffic.changed_entries())
+        if self._regional is not None:
+            self._update_regional_traffic(self._regional)
+        if self._message_queue:
+            self._state.publish(self._message_queue, "ai_traffic")
+
+    def _update_regional_traffic(self, regional: RegionalTraffic) -> None:
+        """Move scheduled flights around the player into the traffic state."""
+        latitude, longitude = regional.to_geographic(self._player_position)
+        entries, retired = regional.update(
+            self._regional_time_s,
+            latitude,
+            longitude,
+            max_active=max(0, self._max_traffic_count - len(self._traffic)),
+        )
+        for callsign in retired:
+            self._state.remove(callsign)
+        self._state.put_many(entries)
+
+    def _load_regional_traffic(self, config: dict[str, Any]) -> None:
+        """Build the regional traffic schedule from configuration.
+
+        Args:
+            config: Regional traffic settings: origin ([latitude, longitude]
+                of the local frame origin), routes_file, bubble_nm,
+                flights_per_route, seed and start_time_s (UTC seconds after
+                midnight, defaults to the current time)
+        """
+        origin = config.get("origin")
+        if not origin:
+            logger.warning("Regional traffic needs an origin [latitude, longitude]")
             return
 
-        # Create list of all traffic
-        traffic_list = list(self._aircraft.values())
-
-        # Publish traffic update
-        self._message_queue.publish(
-            Message(
-                sender="ai_traffic",
-                recipients=["*"],
-                topic=MessageTopic.TRAFFIC_UPDATE,
-                data={"traffic": traffic_list, "count": len(traffic_list)},
-                priority=MessagePriority.NORMAL,
-            )
+        provider = OpenFlightsProvider(config.get("routes_file"))
+        if provider.index is None or provider.locate_airports() == 0:
+            logger.warning("Regional traffic disabled: no located routes")
+            return
+
+        schedule = FlightSchedule.from_route_index(
+            provider.index,
+            flights_per_route=config.get("flights_per_route", 1),
+            seed=config.get("seed", 0),
         )
+        now = datetime.now(UTC)
+        start_time_s = config.get(
+            "start_time_s", now.hour * 3600.0 + now.minute * 60.0 + now.second
+        )
+        self.set_regional_traffic(
+            RegionalTraffic(
+                schedule,
+                float(origin[0]),
+                float(origin[1]),
+                bubble_nm=config.get("bubble_nm", 40.0),
+            ),
+            start_time_s,
+        )
+        logger.info(f"Regional traffic: {len(schedule)} scheduled flights")
+
+    def set_regional_traffic(self, regional: RegionalTraffic | None, time_s: float = 0.0) -> None:
+        """Replace random local traffic with scheduled regional traffic.
+
+        Args:
+            regional: Regional traffic engine, or None to go back to random
+                local traffic
+            time_s: Current UTC time in seconds after midnight
+        """
+        if self._regional is not None:
+            for callsign in self._regional.clear():
+                self._state.remove(callsign)
+        self._regional = regional
+        self._regional_time_s = time_s % SECONDS_PER_DAY
 
     def add_aircraft(self, aircraft: AIAircraft) -> None:
         """Manually add an AI aircraft.
@@ -186,7 +329,7 @@ class AITrafficPlugin(IPlugin):
         Args:
             aircraft: Aircraft to add
         """
-        self._aircraft[aircraft.callsign] = aircraft
+        self._traffic.add(aircraft)
 
     def remove_aircraft(self, callsign: str) -> None:
         """Remove an AI aircraft.
@@ -194,8 +337,8 @@ class AITrafficPlugin(IPlugin):
         Args:
             callsign: Callsign of aircraft to remove
         """
-        if callsign in self._aircraft:
-            del self._aircraft[callsign]
+        self._traffic.remove(callsign)
+        self._state.remove(callsign)
 
     def get_aircraft(self, callsign: str) -> AIAircraft | None:
         """Get an AI aircraft by callsign.
@@ -206,7 +349,7 @@ class AITrafficPlugin(IPlugin):
         Returns:
             AIAircraft or None if not found
         """
-        return self._aircraft.get(callsign)
+        return self._traffic.get(callsign)
 
     def get_all_aircraft(self) -> dict[str, AIAircraft]:
         """Get all AI aircraft.
@@ -214,7 +357,7 @@ class AITrafficPlugin(IPlugin):
         Returns:
             Dictionary of all aircraft by callsign
         """
-        return self._aircraft.copy()
+        return {aircraft.callsign: aircraft for aircraft in self._traffic.aircraft()}
 
     def get_aircraft_count(self) -> int:
         """Get current number of AI aircraft.
@@ -222,11 +365,14 @@ class AITrafficPlugin(IPlugin):
         Returns:
             Number of active AI aircraft
         """
-        return len(self._aircraft)
+        return len(self._traffic)
 
     def clear_all_aircraft(self) -> None:
         """Remove all AI aircraft."""
-        self._aircraft.clear()
+        self._traffic.clear()
+        if self._regional is not None:
+            self._regional.clear()
+        self._state.clear()
 
     def set_traffic_enabled(self, enabled: bool) -> None:
         """Enable or disable AI traffic.
@@ -237,3 +383,13 @@ class AITrafficPlugin(IPlugin):
         self._traffic_enabled = enabled
         if not enabled:
             self.clear_all_aircraft()
+
+    @property
+    def regional_traffic(self) -> RegionalTraffic | None:
+        """Get the regional traffic engine, if enabled."""
+        return self._regional
+
+    @property
+    def traffic_state(self) -> TrafficStateService:
+        """Get the shared traffic state service."""
+        return self._state
@@ -0,0 +1,423 @@
+"""Predictive conflict detection for taxiing ground traffic.
+
+Each taxiing aircraft's route is projected a short time ahead as
+time-stamped visits to the nodes and edges of the airport's ground graph.
+The visits are bucketed by the node or edge they touch, so only aircraft
+that will share part of the network within the horizon are compared, and
+separation is checked where they actually meet rather than by taxiway name.
+
+Typical usage:
+    route = TaxiRoute.from_path(graph, graph.shortest_path(start, hold_rows))
+    detector = GroundConflictDetector(graph)
+    for conflict in detector.detect([("AI_N001CD", route, 120.0, 6.2), ...]):
+        print(f"{conflict.yielding} gives way to {conflict.priority}")
+"""
+
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from airborne.airports.ground_graph import GroundGraph
+
+# How far ahead routes are projected
+DEFAULT_HORIZON_S = 30.0
+
+# Minimum distance between two taxiing aircraft
+DEFAULT_SEPARATION_M = 60.0
+
+# Mover: (aircraft ID, route, distance taxied along it in meters, speed in m/s)
+Mover = tuple[str, "TaxiRoute", float, float]
+
+
+@dataclass
+class TaxiRoute:
+    """A taxi route along a ground graph.
+
+    Attributes:
+        rows: Node rows in route order.
+        edges: Edge taken from each row to the next (len(rows) - 1 entries).
+        directions: 1 where an edge is taken from its start, -1 from its end.
+        offsets_m: Distance from the route start at each row.
+        names: Taxiway and runway names along the route.
+        name_index: Index into names of each edge (0 before the first name).
+        length_m: Route length in meters.
+
+    Examples:
+        >>> route = TaxiRoute.from_path(graph, [0, 4, 5])
+        >>> route.length_m
+        412.0
+    """
+
+    rows: npt.NDArray[np.int32]
+    edges: npt.NDArray[np.int32]
+    directions: npt.NDArray[np.int8]
+    offsets_m: npt.NDArray[np.float64]
+    names: list[str]
+    name_index: list[int]
+    length_m: float
+
+    @classmethod
+    def from_path(cls, graph: GroundGraph, path: Sequence[int]) -> "TaxiRoute":
+        """Build a route from node rows returned by a graph search.
+
+        Args:
+            graph: Ground graph the path was found on.
+            path: Node rows from start to destination.
+
+        Returns:
+            The route.
+
+        Raises:
+            ValueError: If two consecutive rows are not joined by an edge.
+        """
+        rows = [int(row) for row in path]
+        edges: list[int] = []
+        directions: list[int] = []
+        offsets = [0.0]
+        names: list[str] = []
+        name_index: list[int] = []
+        for row, next_row in zip(rows, rows[1:], strict=False):
+            candidates = graph.out_edges(row)[graph.neighbors(row) == next_row]
+            if not len(candidates):
+                raise ValueError(f"No edge from row {row} to row {next_row}")
+            edge = int(candidates[0])
+            edges.append(edge)
+            directions.append(1 if graph.edge_start[edge] == row else -1)
+            offsets.append(offsets[-1] + float(graph.edge_length_m[edge]))
+
+            name = graph.names[int(graph.edge_name[edge])]
+            if name and (not names or names[-1] != name):
+                names.append(name)
+            name_index.append(max(len(names) - 1, 0))
+        return cls(
+            np.array(rows, dtype=np.int32),
+            np.array(edges, dtype=np.int32),
+            np.array(directions, dtype=np.int8),
+            np.array(offsets, dtype=np.float64),
+            names,
+            name_index,
+            offsets[-1],
+        )
+
+    def leg_at(self, distance_m: float) -> int:
+        """Get the leg (index into edges) containing a point of the route.
+
+        Args:
+            distance_m: Distance along the route.
+
+        Returns:
+            Leg index, clamped to the first and last legs.
+        """
+        leg = int(np.searchsorted(self.offsets_m, distance_m, side="right")) - 1
+        return min(max(leg, 0), max(len(self.edges) - 1, 0))
+
+    def position(self, graph: GroundGraph, distance_m: float) -> tuple[float, float, float]:
+        """Get the position and heading at a point of the route.
+
+        Args:
+            graph: Ground graph the route was built on.
+            distance_m: Distance along the route.
+
+        Returns:
+            Tuple of (latitude, longitude, heading in degrees).
+        """
+        start = self.rows[0]
+        if not len(self.edges):
+            return (float(graph.latitudes[start]), float(graph.longitudes[start]), 0.0)
+
+        leg = self.leg_at(distance_m)
+        a, b = self.rows[leg], self.rows[leg + 1]
+        leg_start = float(self.offsets_m[leg])
+        leg_length = float(self.offsets_m[leg + 1]) - leg_start
+        fraction = 0.0 if leg_length <= 0 else (distance_m - leg_start) / leg_length
+        fraction = min(max(fraction, 0.0), 1.0)
+
+        lat_a, lon_a = float(graph.latitudes[a]), float(graph.longitudes[a])
+        lat_b, lon_b = float(graph.latitudes[b]), float(graph.longitudes[b])
+        north = lat_b - lat_a
+        east = (lon_b - lon_a) * math.cos(math.radians(lat_a))
+        heading = (math.degrees(math.atan2(east, north)) + 360.0) % 360.0
+        return (
+            lat_a + (lat_b - lat_a) * fraction,
+            lon_a + (lon_b - lon_a) * fraction,
+            heading,
+        )
+
+
+@dataclass(frozen=True)
+class GroundConflict:
+    """A predicted loss of separation between two taxiing aircraft.
+
+    Attributes:
+        priority: Aircraft reaching the conflict point first.
+        yielding: Aircraft that should hold and give way.
+        node: Node row where the aircraft meet, or -1 on an edge.
+        edge: Edge where the aircraft meet, or -1 at a node.
+        time_s: Seconds from now until separation is lost.
+    """
+
+    priority: str
+    yielding: str
+    node: int
+    edge: int
+    time_s: float
+
+
+class GroundConflictDetector:
+    """Finds ground conflicts from projected taxi routes.
+
+    Aircraft conflict at a node when one passes it less than the
+    separation distance before or after the other, and on an edge when they
+    meet head-on or one closes within the separation distance of the other.
+    Aircraft on different parts of the same long taxiway do not conflict.
+
+    Attributes:
+        graph: Ground graph the routes are built on.
+        horizon_s: How far ahead routes are projected.
+        separation_m: Minimum distance between aircraft.
+
+    Examples:
+        >>> detector = GroundConflictDetector(graph)
+        >>> conflicts = detector.detect(movers)
+    """
+
+    def __init__(
+        self,
+        graph: GroundGraph,
+        horizon_s: float = DEFAULT_HORIZON_S,
+        separation_m: float = DEFAULT_SEPARATION_M,
+    ) -> None:
+        """Initialize the detector.
+
+        Args:
+            graph: Ground graph the routes are built on.
+            horizon_s: How far ahead routes are projected.
+            separation_m: Minimum distance between aircraft.
+        """
+        self.graph = graph
+        self.horizon_s = horizon_s
+        self.separation_m = separation_m
+        # Flattened legs of the last set of routes, reused while it is unchanged
+        self._routes: list[TaxiRoute] = []
+        self._legs: dict[str, npt.NDArray] = {}
+
+    def detect(self, movers: Iterable[Mover]) -> list[GroundConflict]:
+        """Find conflicts between moving aircraft.
+
+        Args:
+            movers: (aircraft ID, route, distance taxied along the route in
+                meters, speed in m/s) per aircraft. Aircraft that are stopped
+                but about to move should be given their intended speed.
+
+        Returns:
+            At most one conflict per pair of aircraft (the earliest), sorted
+            by time.
+        """
+        separation = self.separation_m
+        horizon = self.horizon_s
+
+        active = [mover for mover in movers if mover[3] > 0 and mover[2] < mover[1].length_m]
+        if len(active) < 2:
+            return []
+        ids, routes, distances, speeds = (list(column) for column in zip(*active, strict=True))
+
+        legs = self._flatten(routes)
+        mover = legs["mover"]
+        distance = np.array(distances)[mover]
+        speed = np.array(speeds)[mover]
+        enter = (legs["start"] - distance) / speed
+        exit_ = (legs["end"] - distance) / speed
+
+        # Edges touched within the horizon; the enter time is negative for
+        # the edge an aircraft is already on
+        touched = np.flatnonzero((exit_ > 0) & (enter < horizon))
+        edge_visits = _buckets(
+            legs["edge"][touched],
+            mover[touched],
+            enter[touched],
+            exit_[touched],
+            legs["along"][touched],
+            legs["direction"][touched],
+        )
+
+        # Nodes reached within the horizon (the end of each leg, and the
+        # route start), or passed less than the separation distance ago
+        first_legs = legs["first"]
+        node_time = np.concatenate([exit_, enter[first_legs]])
+        node_speed = np.concatenate([speed, speed[first_legs]])
+        reached = np.flatnonzero((node_time <= horizon) & (node_time * node_speed > -separation))
+        node_visits = _buckets(
+            legs["node"][reached], legs["node_mover"][reached], node_time[reached]
+        )
+
+        # (lower mover, higher mover) -> (time, priority, yielding, node, edge)
+        found: dict[tuple[int, int], tuple[float, int, int, int, int]] = {}
+
+        def record(first: int, second: int, node: int, edge: int, time_s: float) -> None:
+            # first reaches the conflict point first and keeps priority
+            key = (first, second) if first < second else (second, first)
+            current = found.get(key)
+            if current is None or time_s < current[0]:
+                found[key] = (time_s, first, second, node, edge)
+
+        for node, visits in node_visits:
+            for i, (a, time_a) in enumerate(visits):
+                for b, time_b in visits[i + 1 :]:
+                    if a == b or max(time_a, time_b) < 0:
+                        continue
+                    if abs(time_a - time_b) * min(speeds[a], speeds[b]) >= separation:
+                        continue
+                    if (time_a, ids[b]) <= (time_b, ids[a]):
+                        record(a, b, node, -1, max(min(time_a, time_b), 0.0))
+                    else:
+                        record(b, a, node, -1, max(min(time_a, time_b), 0.0))
+
+        for edge, visits in edge_visits:
+            for i, visit_a in enumerate(visits):
+                for visit_b in visits[i + 1 :]:
+                    conflict = self._edge_conflict(visit_a, visit_b, ids, speeds)
+                    if conflict is not None:
+                        first, second, time_s = conflict
+                        record(first, second, -1, edge, time_s)
+
+        return [
+            GroundConflict(ids[first], ids[second], node, edge, time_s)
+            for time_s, first, second, node, edge in sorted(found.values())
+        ]
+
+    def _flatten(self, routes: list[TaxiRoute]) -> dict[str, npt.NDArray]:
+        """Flatten the legs of all routes into arrays.
+
+        Taxiing aircraft keep their routes from one detection to the next,
+        so the arrays are cached while the same route objects are passed in
+        the same order.
+
+        Args:
+            routes: Route of each mover.
+
+        Returns:
+            Per leg: mover, start, end (route offsets), edge, direction and
+            along (edge position where the leg starts). Per node visit (leg
+            ends, then route starts): node and node_mover. first: index of
+            each route's first leg.
+        """
+        if len(routes) == len(self._routes) and all(
+            route is cached for route, cached in zip(routes, self._routes, strict=True)
+        ):
+            return self._legs
+
+        counts = np.array([len(route.edges) for route in routes])
+        route_index = np.arange(len(routes))
+        mover = np.repeat(route_index, counts)
+        offsets = np.concatenate([route.offsets_m for route in routes])
+        rows = np.concatenate([route.rows for route in routes])
+        is_first = np.zeros(len(offsets), dtype=bool)
+        is_first[np.cumsum(counts + 1) - counts - 1] = True
+        is_last = np.roll(is_first, -1)
+        edges = np.concatenate([route.edges for route in routes])
+        directions = np.concatenate([route.directions for route in routes])
+
+        self._routes = list(routes)
+        self._legs = {
+            "mover": mover,
+            "start": offsets[~is_last],
+            "end": offsets[~is_first],
+            "edge": edges,
+            "direction": directions,
+            "along": np.where(directions > 0, 0.0, self.graph.edge_length_m[edges]),
+            "node": np.concatenate([rows[~is_first], rows[is_first]]),
+            "node_mover": np.concatenate([mover, route_index]),
+            "first": np.cumsum(counts) - counts,
+        }
+        return self._legs
+
+    def _edge_conflict(
+        self,
+        visit_a: tuple[int, float, float, float, int],
+        visit_b: tuple[int, float, float, float, int],
+        ids: list[str],
+        speeds: list[float],
+    ) -> tuple[int, int, float] | None:
+        """Check two aircraft sharing an edge.
+
+        Ties go to the aircraft with the higher ID, so the lower ID gives way.
+
+        Args:
+            visit_a: (mover, enter time, exit time, position at enter, direction).
+            visit_b: Same for the other aircraft.
+            ids: Aircraft ID of each mover.
+            speeds: Speed of each mover.
+
+        Returns:
+            Tuple of (priority mover, yielding mover, time) or None.
+        """
+        a, enter_a, exit_a, along_a, direction_a = visit_a
+        b, enter_b, exit_b, along_b, direction_b = visit_b
+        start = max(enter_a, enter_b, 0.0)
+        end = min(exit_a, exit_b, self.horizon_s)
+        if a == b or start > end:
+            return None
+
+        if direction_a != direction_b:
+            # Head-on: whoever entered the edge later gives way
+            if (enter_a, ids[b]) <= (enter_b, ids[a]):
+                return (a, b, start)
+            return (b, a, start)
+
+        # Same direction: gap(t) = offset + rate * t along the edge
+        rate_a = direction_a * speeds[a]
+        rate_b = direction_b * speeds[b]
+        offset = (along_a - rate_a * enter_a) - (along_b - rate_b * enter_b)
+        rate = rate_a - rate_b
+        gap_start = offset + rate * start
+        gap_end = offset + rate * end
+        separation = self.separation_m
+        if abs(gap_start) < separation:
+            time_s = start
+        elif gap_start * gap_end > 0 and abs(gap_end) >= separation:
+            return None
+        else:
+            # Closing: separation is lost when the gap shrinks to the minimum
+            target = separation if gap_start > 0 else -separation
+            time_s = (target - offset) / rate
+
+        # The aircraft ahead in the direction of travel keeps priority
+        if gap_start * direction_a > 0 or (
+            gap_start == 0 and (enter_a, ids[b]) <= (enter_b, ids[a])
+        ):
+            return (a, b, time_s)
+        return (b, a, time_s)
+
+
+def _buckets(keys: npt.NDArray, *columns: npt.NDArray) -> list[tuple[int, list[tuple]]]:
+    """Group visits by the node or edge they touch.
+
+    Args:
+        keys: Node or edge of each visit.
+        columns: Per-visit values to return.
+
+    Returns:
+        (key, visits) for every key touched by two or more visits, each
+        visit being a tuple of its column values.
+    """
+    if len(keys) < 2:
+        return []
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    first = np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]]))
+    sizes = np.diff(np.append(first, len(keys)))
+    shared = sizes >= 2
+    if not shared.any():
+        return []
+
+    selected = order[np.repeat(shared, sizes)]
+    visits = list(zip(*(column[selected].tolist() for column in columns), strict=True))
+    buckets = []
+    position = 0
+    for key, size in zip(keys[first[shared]].tolist(), sizes[shared].tolist(), strict=True):
+        buckets.append((key, visits[position : position + size]))
+        position += size
+    return buckets
@@ -1,10 +1,12 @@
 """Ground traffic management for AI aircraft taxi operations.
 
 This module manages AI aircraft taxiing on the ground, including conflict
-detection, hold-short instructions, and realistic taxi behavior.
+detection, hold-short instructions, and realistic taxi behavior. Aircraft
+with a route on the airport's ground graph taxi along it, and conflicts
+between them are predicted by a GroundConflictDetector.
 
 Typical usage:
-    manager = GroundTrafficManager(message_queue)
+    manager = GroundTrafficManager(message_queue, ground_graph)
     manager.spawn_traffic(count=3)
     manager.update(dt)
 """
@@ -12,14 +14,29 @@ Typical usage:
 import logging
 import random
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
+
+from airborne.airports.ground_graph import NODE_PARKING, GroundGraph
 from airborne.core.i18n import t
 from airborne.core.messaging import Message, MessagePriority, MessageQueue, MessageTopic
+from airborne.physics.vectors import Vector3
+from airborne.plugins.traffic.ground_conflicts import (
+    GroundConflictDetector,
+    Mover,
+    TaxiRoute,
+)
+from airborne.plugins.traffic.traffic_state import TrafficEntry, TrafficStateService
 
 logger = logging.getLogger(__name__)
 
+KNOTS_TO_MPS = 0.514444
+
+# Ground positions are (longitude, 0, latitude) in degrees
+DEGREES_PER_NM = 1.0 / 60.0
+
 
 class GroundTrafficState(Enum):
     """States for AI ground traffic aircraft.
@@ -57,6 +74,9 @@ class GroundTrafficAircraft:
         current_route_index: Current position in taxi route.
         hold_short_node: Node where aircraft should hold short.
         spawn_time: Time when aircraft spawned.
+        route: Route on the airport ground graph, if one was planned.
+        route_distance_m: Distance taxied along route.
+        holding_for: Aircraft this one is giving way to.
     """
 
     aircraft_id: str
@@ -72,31 +92,56 @@ class GroundTrafficAircraft:
     current_route_index: int = 0
     hold_short_node: str | None = None
     spawn_time: float = 0.0
+    route: TaxiRoute | None = field(default=None, repr=False)
+    route_distance_m: float = 0.0
+    holding_for: str | None = None
 
 
 class GroundTrafficManager:
     """Manages AI aircraft taxiing on the ground.
 
     Spawns AI aircraft, manages their taxi routes, detects conflicts,
-    and issues hold-short clearances to prevent collisions.
+    and issues hold-short clearances to prevent collisions. With the
+    airport's shared GroundGraph, aircraft spawn at parking nodes and taxi
+    the shortest route to a hold short node, and conflicts are predicted
+    from their projected routes instead of compared by taxiway name.
+
+    Aircraft state is recorded in ``traffic_state`` and only the changes
+    are published, as TRAFFIC_DELTA, once per spawn batch and update.
     """
 
-    def __init__(self, message_queue: MessageQueue) -> None:
+    def __init__(
+        self, message_queue: MessageQueue, ground_graph: GroundGraph | None = None
+    ) -> None:
         """Initialize ground traffic manager.
 
         Args:
-            message_queue: Message queue for publishing traffic updates.
+            message_queue: Message queue for publishing traffic changes.
+            ground_graph: Airport ground graph to plan taxi routes on.
         """
         self.message_queue = message_queue
+        self.ground_graph = ground_graph
+        self.conflict_detector = GroundConflictDetector(ground_graph) if ground_graph else None
         self.traffic: dict[str, GroundTrafficAircraft] = {}
+        self.traffic_state = TrafficStateService(units_per_nm=DEGREES_PER_NM)
         self.next_aircraft_id = 1
         self.taxi_speed_kts = 12.0  # Normal taxi speed
         self.spawn_interval = 120.0  # Spawn every 2 minutes
         self.last_spawn_time = 0.0
         self.max_traffic = 5  # Maximum concurrent ground traffic
+        self.ground_frequency_mhz: float | None = None  # Frequency the aircraft are on
 
         logger.info("Ground traffic manager initialized")
 
+    def set_ground_graph(self, ground_graph: GroundGraph | None) -> None:
+        """Set the airport ground graph used for new taxi routes.
+
+        Args:
+            ground_graph: Airport ground graph, or None for generic routes.
+        """
+        self.ground_graph = ground_graph
+        self.conflict_detector = GroundConflictDetector(ground_graph) if ground_graph else None
+
     def spawn_traffic(self, count: int = 1, parking_positions: list[str] | None = None) -> None:
         """Spawn AI ground traffic aircraft.
 
@@ -122,8 +167,20 @@ class GroundTrafficManager:
             parking = random.choice(parking_positions)
             runway = random.choice(["31", "13", "27", "09"])
 
-            # Create simple taxi route (in real implementation, would query airport database)
-            taxi_route = ["Alpha", "Bravo"]  # Simplified route
+            # Simplified route unless the airport's ground graph has one
+            taxi_route = ["Alpha", "Bravo"]
+            position = (0.0, 0.0, 0.0)
+            hold_short_node = None
+            route = None
+            planned = self._plan_taxi_route(runway)
+            if planned and self.ground_graph is not None:
+                route, runway = planned
+                graph = self.ground_graph
+                start = route.rows[0]
+                parking = str(graph.node_ids[start])
+                position = (float(graph.longitudes[start]), 0.0, float(graph.latitudes[start]))
+                taxi_route = route.names or ["Alpha"]
+                hold_short_node = str(graph.node_ids[route.rows[-1]])
 
             # Random aircraft type
             aircraft_type = random.choice(["C172", "C182", "PA28", "SR22"])
@@ -133,14 +190,16 @@ class GroundTrafficManager:
                 aircraft_id=aircraft_id,
                 callsign=aircraft_id,
                 aircraft_type=aircraft_type,
-                position=(0.0, 0.0, 0.0),  # Will be updated from parking position
+                position=position,
                 heading=0.0,
                 speed=0.0,
                 state=GroundTrafficState.PARKED,
                 parking_id=parking,
                 destination_runway=runway,
                 taxi_route=taxi_route,
+                hold_short_node=hold_short_node,
                 spawn_time=time.time(),
+                route=route,
             )
 
             self.traffic[aircraft_id] = traffic_aircraft
@@ -153,8 +212,43 @@ class GroundTrafficManager:
                 runway,
             )
 
-            # Publish traffic spawn event
-            self._publish_traffic_update(traffic_aircraft)
+            self._record_traffic_state(traffic_aircraft)
+
+        # Publish the spawned aircraft
+        self.traffic_state.publish(self.message_queue, "ground_traffic_manager")
+
+    def _plan_taxi_route(self, runway: str) -> tuple[TaxiRoute, str] | None:
+        """Plan a departure taxi from a random parking node.
+
+        Args:
+            runway: Preferred departure runway; another runway's hold short
+                nodes are used if it has none.
+
+        Returns:
+            Tuple of (route from parking to a hold short node, runway), or
+            None without a usable ground graph.
+        """
+        graph = self.ground_graph
+        if graph is None:
+            return None
+
+        parking_rows = np.flatnonzero(graph.node_flags & NODE_PARKING)
+        hold_rows = graph.hold_short_rows(runway)
+        if not len(hold_rows):
+            hold_rows = graph.hold_short_rows()
+        if not len(parking_rows) or not len(hold_rows):
+            return None
+
+        start = int(random.choice(parking_rows.tolist()))
+        path = graph.shortest_path(start, hold_rows)
+        if path is None:
+            return None
+
+        hold = path[-1]
+        hold_runway = graph.names[int(graph.node_runway[hold])]
+        if runway not in hold_runway.split("/"):
+            runway = hold_runway.split("/")[0] or runway
+        return TaxiRoute.from_path(graph, path), runway
 
     def update(self, dt: float) -> None:
         """Update all ground traffic aircraft.
@@ -178,6 +272,11 @@ class GroundTrafficManager:
         # Detect conflicts
         self._detect_conflicts()
 
+        # Publish what changed
+        for aircraft in self.traffic.values():
+            self._record_traffic_state(aircraft)
+        self.traffic_state.publish(self.message_queue, "ground_traffic_manager")
+
     def _update_aircraft(self, aircraft: GroundTrafficAircraft, dt: float) -> None:
         """Update individual aircraft state.
 
@@ -259,8 +358,11 @@ class GroundTrafficManager:
             aircraft: Aircraft to move.
             dt: Time delta (seconds).
         """
-        # Simple movement simulation
-        # In real implementation, would follow actual taxiway paths
+        if aircraft.route is not None and self.ground_graph is not None:
+            self._move_along_route(aircraft, aircraft.route, self.ground_graph, dt)
+            return
+
+        # Simple movement simulation for aircraft without a ground graph route
 
         # Check if holding
         if aircraft.hold_short_node:
@@ -288,13 +390,84 @@ class GroundTrafficManager:
             # Simplified: advance every 30 seconds
             aircraft.current_route_index += 1
 
+    def _move_along_route(
+        self, aircraft: GroundTrafficAircraft, route: TaxiRoute, graph: GroundGraph, dt: float
+    ) -> None:
+        """Move an aircraft along its ground graph route.
+
+        Args:
+            aircraft: Aircraft to move.
+            route: Aircraft's route.
+            graph: Ground graph the route was planned on.
+            dt: Time delta (seconds).
+        """
+        distance = aircraft.route_distance_m + aircraft.speed * KNOTS_TO_MPS * dt
+        aircraft.route_distance_m = min(distance, route.length_m)
+        latitude, longitude, heading = route.position(graph, aircraft.route_distance_m)
+        aircraft.position = (longitude, 0.0, latitude)
+        aircraft.heading = heading
+        if route.name_index:
+            aircraft.current_route_index = route.name_index[route.leg_at(aircraft.route_distance_m)]
+
+        if aircraft.route_distance_m >= route.length_m:
+            # Reached the hold short node
+            aircraft.speed = 0.0
+            aircraft.state = GroundTrafficState.AT_RUNWAY
+            logger.info(
+                "%s holding short runway %s", aircraft.aircraft_id, aircraft.destination_runway
+            )
+
     def _detect_conflicts(self) -> None:
-        """Detect potential conflicts between aircraft."""
+        """Detect potential conflicts between aircraft.
+
+        Aircraft with ground graph routes are checked by the conflict
+        detector, which makes the later aircraft give way and lets it go
+        again once its projected route is clear. Aircraft without routes are
+        compared by their current taxiway name.
+        """
+        movers: list[Mover] = []
+        unrouted: list[GroundTrafficAircraft] = []
+        for aircraft in self.traffic.values():
+            if aircraft.route is None or self.conflict_detector is None:
+                unrouted.append(aircraft)
+            elif aircraft.state == GroundTrafficState.TAXIING:
+                speed = aircraft.speed * KNOTS_TO_MPS
+                movers.append(
+                    (aircraft.aircraft_id, aircraft.route, aircraft.route_distance_m, speed)
+                )
+            elif aircraft.state == GroundTrafficState.HOLDING and aircraft.holding_for:
+                # Project where it would go if released now
+                speed = self.taxi_speed_kts * KNOTS_TO_MPS
+                movers.append(
+                    (aircraft.aircraft_id, aircraft.route, aircraft.route_distance_m, speed)
+                )
+
+        if movers and self.conflict_detector is not None:
+            yielding: set[str] = set()
+            for conflict in self.conflict_detector.detect(movers):
+                yielding.add(conflict.yielding)
+                holding_aircraft = self.traffic[conflict.yielding]
+                if holding_aircraft.state == GroundTrafficState.TAXIING:
+                    self._resolve_conflict(
+                        holding_aircraft, self.traffic[conflict.priority], holding_aircraft
+                    )
+
+            for aircraft_id, _, _, _ in movers:
+                aircraft = self.traffic[aircraft_id]
+                if aircraft.holding_for and aircraft_id not in yielding:
+                    self._resume_taxi(aircraft)
+
+        self._detect_taxiway_conflicts(unrouted)
+
+    def _detect_taxiway_conflicts(self, aircraft_list: list[GroundTrafficAircraft]) -> None:
+        """Detect conflicts between aircraft on the same taxiway.
+
+        Args:
+            aircraft_list: Aircraft without ground graph routes.
+        """
         # Simple conflict detection: check if two aircraft are on same taxiway
         # and approaching each other within conflict threshold
 
-        aircraft_list = list(self.traffic.values())
-
         for i, aircraft1 in enumerate(aircraft_list):
             if aircraft1.state != GroundTrafficState.TAXIING:
                 continue
@@ -315,23 +488,35 @@ class GroundTrafficManager:
                         self._resolve_conflict(aircraft1, aircraft2)
 
     def _resolve_conflict(
-        self, aircraft1: GroundTrafficAircraft, aircraft2: GroundTrafficAircraft
+        self,
+        aircraft1: GroundTrafficAircraft,
+        aircraft2: GroundTrafficAircraft,
+        holding_aircraft: GroundTrafficAircraft | None = None,
     ) -> None:
         """Resolve conflict between two aircraft.
 
         Args:
             aircraft1: First aircraft.
             aircraft2: Second aircraft.
+            holding_aircraft: Aircraft that gives way (default: lower ID).
         """
         # Simple priority: aircraft with lower ID holds
-        if aircraft1.aircraft_id < aircraft2.aircraft_id:
-            holding_aircraft = aircraft1
+        if holding_aircraft is None:
+            if aircraft1.aircraft_id < aircraft2.aircraft_id:
+                holding_aircraft = aircraft1
+            else:
+                holding_aircraft = aircraft2
+        other_aircraft = aircraft1 if holding_aircraft is aircraft2 else aircraft2
+
+        # Issue hold short instruction (routed aircraft keep their runway hold node)
+        if holding_aircraft.route is not None:
+            already_holding = holding_aircraft.holding_for is not None
         else:
-            holding_aircraft = aircraft2
-
-        # Issue hold short instruction
-        if not holding_aircraft.hold_short_node:
-            holding_aircraft.hold_short_node = "conflict_hold"
+            already_holding = bool(holding_aircraft.hold_short_node)
+        if not already_holding:
+            if holding_aircraft.route is None:
+                holding_aircraft.hold_short_node = "conflict_hold"
+            holding_aircraft.holding_for = other_aircraft.aircraft_id
             holding_aircraft.state = GroundTrafficState.HOLDING
             holding_aircraft.speed = 0.0
 
@@ -353,41 +538,47 @@ class GroundTrafficManager:
             logger.info(
                 "Conflict detected: %s instructed to hold for %s",
                 holding_aircraft.aircraft_id,
-                aircraft1.aircraft_id if holding_aircraft == aircraft2 else aircraft2.aircraft_id,
+                other_aircraft.aircraft_id,
             )
 
+    def _resume_taxi(self, aircraft: GroundTrafficAircraft) -> None:
+        """Let an aircraft that gave way continue taxiing.
+
+        Args:
+            aircraft: Holding aircraft whose route is clear again.
+        """
+        logger.info("%s continuing taxi, clear of %s", aircraft.aircraft_id, aircraft.holding_for)
+        aircraft.holding_for = None
+        aircraft.state = GroundTrafficState.TAXIING
+        aircraft.speed = self.taxi_speed_kts
+
     def _remove_aircraft(self, aircraft_id: str) -> None:
         """Remove aircraft from ground traffic.
 
         Args:
             aircraft_id: Aircraft to remove.
         """
-        if aircraft_id in self.traffic:
-            del self.traffic[aircraft_id]
+        aircraft = self.traffic.pop(aircraft_id, None)
+        if aircraft is not None:
+            self.traffic_state.remove(aircraft.callsign)
             logger.info("Removed ground traffic: %s", aircraft_id)
 
-    def _publish_traffic_update(self, aircraft: GroundTrafficAircraft) -> None:
-        """Publish traffic update message.
+    def _record_traffic_state(self, aircraft: GroundTrafficAircraft) -> None:
+        """Record an aircraft's current state in the traffic state.
 
         Args:
-            aircraft: Aircraft to publish update for.
+            aircraft: Aircraft to record.
         """
-        self.message_queue.publish(
-            Message(
-                sender="ground_traffic_manager",
-                recipients=["*"],
-                topic=MessageTopic.TRAFFIC_UPDATE,
-                data={
-                    "aircraft_id": aircraft.aircraft_id,
-                    "callsign": aircraft.callsign,
-                    "aircraft_type": aircraft.aircraft_type,
-                    "position": aircraft.position,
-                    "heading": aircraft.heading,
-                    "speed": aircraft.speed,
-                    "state": aircraft.state.value,
-                    "on_ground": True,
-                },
-                priority=MessagePriority.LOW,
+        longitude, _, latitude = aircraft.position
+        self.traffic_state.put(
+            TrafficEntry(
+                callsign=aircraft.callsign,
+                aircraft_type=aircraft.aircraft_type,
+                position=Vector3(longitude, 0.0, latitude),
+                heading=aircraft.heading,
+                speed_kts=aircraft.speed,
+                on_ground=True,
+                frequency_mhz=self.ground_frequency_mhz,
             )
         )
 
@@ -413,4 +604,6 @@ class GroundTrafficManager:
     def clear_all_traffic(self) -> None:
         """Remove all ground traffic aircraft."""
         self.traffic.clear()
+        self.traffic_state.clear()
+        self.traffic_state.publish(self.message_queue, "ground_traffic_manager")
         logger.info("Cleared all ground traffic")
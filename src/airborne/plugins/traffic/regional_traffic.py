@@ -0,0 +1,569 @@
+"""Schedule-driven regional traffic from the OpenFlights route network.
+
+A FlightSchedule turns the nonstop routes of a RouteIndex into a day of
+scheduled flights, each flying the great circle between its airports at a
+cruise speed that grows with the route length, with a 3:1 climb and
+descent profile. Flight state at any time of day is computed from the
+schedule alone, for many flights at once.
+
+RegionalTraffic keeps only the flights inside a bubble around ownship
+active. Candidate flights near the bubble are found by a full schedule
+scan at a low rate (often enough that no flight can cross the candidate
+margin between scans), so the per-update cost follows the number of
+flights near ownship rather than the size of the schedule.
+
+Active flights are reported as TrafficEntry objects in a local frame
+centred on a reference point (x east, z north, y altitude in feet, with
+``units_per_nm`` units per nautical mile, as for AI traffic).
+
+Typical usage:
+    provider = OpenFlightsProvider()
+    provider.locate_airports()
+    schedule = FlightSchedule.from_route_index(provider.index)
+    regional = RegionalTraffic(schedule, 37.62, -122.38, bubble_nm=40.0)
+    entries, retired = regional.update(time_of_day_s, own_lat, own_lon)
+"""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from airborne.airports.spatial_index import EARTH_RADIUS_NM, haversine_distances_nm
+from airborne.navigation.routes import RouteIndex
+from airborne.physics.vectors import Vector3
+from airborne.plugins.traffic.traffic_state import UNITS_PER_NM, TrafficEntry
+
+SECONDS_PER_DAY = 86400.0
+CLIMB_FT_PER_NM = 1000.0 / 3.0
+CRUISE_ALTITUDE_FT = 35000.0
+MIN_SPEED_KTS = 250.0
+MAX_SPEED_KTS = 480.0
+SPEED_KTS_PER_NM = 0.25
+MIN_ROUTE_NM = 20.0
+DEFAULT_AIRCRAFT_TYPE = "B738"
+
+
+@dataclass
+class FlightPositions:
+    """State of a set of scheduled flights at one time.
+
+    Attributes:
+        rows: Schedule rows of the flights
+        latitude: Latitudes in degrees
+        longitude: Longitudes in degrees
+        altitude_ft: Altitudes in feet above airport level
+        heading: Great circle track in degrees
+        speed_kts: Ground speed in knots
+        vertical_speed_fpm: Vertical speed in feet per minute
+        on_ground: Whether the flight is waiting to depart
+    """
+
+    rows: npt.NDArray[np.int64]
+    latitude: npt.NDArray[np.float64]
+    longitude: npt.NDArray[np.float64]
+    altitude_ft: npt.NDArray[np.float64]
+    heading: npt.NDArray[np.float64]
+    speed_kts: npt.NDArray[np.float64]
+    vertical_speed_fpm: npt.NDArray[np.float64]
+    on_ground: npt.NDArray[np.bool_]
+
+
+def _unit_vectors(
+    lat: npt.NDArray[np.float64], lon: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Convert latitudes and longitudes in degrees to Earth-centred unit vectors."""
+    phi = np.radians(lat)
+    lam = np.radians(lon)
+    return np.column_stack((np.cos(phi) * np.cos(lam), np.cos(phi) * np.sin(lam), np.sin(phi)))
+
+
+def _route_distances_nm(
+    lat1: npt.NDArray[np.float64],
+    lon1: npt.NDArray[np.float64],
+    lat2: npt.NDArray[np.float64],
+    lon2: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Element-wise great circle distances in nautical miles."""
+    start = _unit_vectors(lat1, lon1)
+    end = _unit_vectors(lat2, lon2)
+    angle = np.arctan2(
+        np.linalg.norm(np.cross(start, end), axis=1), np.einsum("ij,ij->i", start, end)
+    )
+    distances: npt.NDArray[np.float64] = angle * EARTH_RADIUS_NM
+    return distances
+
+
+class FlightSchedule:
+    """A day of scheduled flights over the route network, held as arrays.
+
+    Every nonstop, non-codeshare route between two located airports is
+    flown ``flights_per_route`` times a day, at departure times spread
+    evenly over the day from a seeded random offset, so a schedule is
+    reproducible. Callsigns combine the airline code with a flight number
+    unique within the airline.
+
+    Examples:
+        >>> schedule = FlightSchedule.from_route_index(provider.index, seed=7)
+        >>> positions = schedule.positions(12 * 3600.0)
+        >>> schedule.callsign(int(positions.rows[0]))
+        'AA101'
+    """
+
+    def __init__(
+        self,
+        origin: npt.NDArray[np.float64],
+        destination: npt.NDArray[np.float64],
+        departure_s: npt.NDArray[np.float64],
+        callsigns: list[str],
+        aircraft_types: list[str],
+    ) -> None:
+        """Initialize from flight arrays.
+
+        Use from_route_index() rather than calling this directly.
+
+        Args:
+            origin: (latitude, longitude) of each departure airport in degrees
+            destination: (latitude, longitude) of each arrival airport in degrees
+            departure_s: Departure time of each flight in seconds after midnight
+            callsigns: Callsign of each flight
+            aircraft_types: Aircraft type of each flight
+        """
+        self._start = _unit_vectors(origin[:, 0], origin[:, 1])
+        self._end = _unit_vectors(destination[:, 0], destination[:, 1])
+        self._angle = np.arctan2(
+            np.linalg.norm(np.cross(self._start, self._end), axis=1),
+            np.einsum("ij,ij->i", self._start, self._end),
+        )
+        self.distance_nm = self._angle * EARTH_RADIUS_NM
+        self.speed_kts = np.clip(
+            MIN_SPEED_KTS + SPEED_KTS_PER_NM * self.distance_nm, MIN_SPEED_KTS, MAX_SPEED_KTS
+        )
+        self.departure_s = departure_s % SECONDS_PER_DAY
+        self.duration_s = self.distance_nm / self.speed_kts * 3600.0
+        self._callsigns = callsigns
+        self._aircraft_types = aircraft_types
+
+    @classmethod
+    def from_route_index(
+        cls,
+        index: RouteIndex,
+        flights_per_route: int = 1,
+        seed: int = 0,
+        min_distance_nm: float = MIN_ROUTE_NM,
+    ) -> "FlightSchedule":
+        """Build a schedule from the routes of an index with airport coordinates.
+
+        Args:
+            index: Route index (see RouteIndex.set_coordinates() or
+                OpenFlightsProvider.locate_airports())
+            flights_per_route: Daily flights on each route
+            seed: Seed for departure times
+            min_distance_nm: Shortest route to schedule
+
+        Returns:
+            New FlightSchedule
+
+        Raises:
+            ValueError: If the index has no airport coordinates
+        """
+        if index.node_lat is None or index.node_lon is None:
+            raise ValueError("Route index has no airport coordinates")
+        lat = np.append(index.node_lat, np.nan)
+        lon = np.append(index.node_lon, np.nan)
+
+        # Routes without an airport point at the NaN sentinel past the last node
+        source = np.minimum(index.route_source, index.airport_count)
+        destination = np.minimum(index.route_destination, index.airport_count)
+        rows = np.flatnonzero(
+            (index.route_stops == 0)
+            & ~index.route_codeshare
+            & (source != destination)
+            & ~np.isnan(lat[source])
+            & ~np.isnan(lat[destination])
+        )
+        distance = _route_distances_nm(
+            lat[source[rows]], lon[source[rows]], lat[destination[rows]], lon[destination[rows]]
+        )
+        rows = rows[distance >= min_distance_nm]
+
+        rng = np.random.default_rng(seed)
+        spacing = SECONDS_PER_DAY / flights_per_route
+        offsets = rng.uniform(0.0, spacing, len(rows))
+        rows = np.repeat(rows, flights_per_route)
+        departure_s = np.repeat(offsets, flights_per_route) + spacing * np.tile(
+            np.arange(flights_per_route), len(offsets)
+        )
+
+        # Flight numbers count up from 101 within each callsign designator, in
+        # departure order; routes without an airline share the "XX" designator
+        designators, designator_of_airline = np.unique(
+            np.array([code or "XX" for code in index.airlines], dtype=str), return_inverse=True
+        )
+        designator = designator_of_airline[index.route_airline[rows]]
+        order = np.lexsort((departure_s, designator))
+        first = np.searchsorted(designator[order], designator[order])
+        numbers = np.empty(len(rows), dtype=np.int64)
+        numbers[order] = np.arange(len(rows)) - first + 101
+
+        # The first equipment listed for the route, if any
+        equipment_start = index.route_equipment_offsets[rows]
+        has_equipment = index.route_equipment_offsets[rows + 1] > equipment_start
+        equipment = np.full(len(rows), -1, dtype=np.int64)
+        equipment[has_equipment] = index.route_equipment[equipment_start[has_equipment]]
+
+        return cls(
+            origin=np.column_stack((lat[source[rows]], lon[source[rows]])),
+            destination=np.column_stack((lat[destination[rows]], lon[destination[rows]])),
+            departure_s=departure_s,
+            callsigns=[
+                f"{designators[code]}{number}"
+                for code, number in zip(designator.tolist(), numbers.tolist(), strict=True)
+            ],
+            aircraft_types=[
+                index.equipment[code] if code >= 0 else DEFAULT_AIRCRAFT_TYPE
+                for code in equipment.tolist()
+            ],
+        )
+
+    def __len__(self) -> int:
+        """Get the number of scheduled flights."""
+        return len(self.departure_s)
+
+    @property
+    def max_speed_kts(self) -> float:
+        """Get the fastest ground speed in the schedule."""
+        return float(self.speed_kts.max()) if len(self) else MIN_SPEED_KTS
+
+    def callsign(self, row: int) -> str:
+        """Get the callsign of a flight.
+
+        Args:
+            row: Schedule row
+
+        Returns:
+            Callsign, e.g. "BA117"
+        """
+        return self._callsigns[row]
+
+    def aircraft_type(self, row: int) -> str:
+        """Get the aircraft type of a flight.
+
+        Args:
+            row: Schedule row
+
+        Returns:
+            Aircraft type code from the route equipment
+        """
+        return self._aircraft_types[row]
+
+    def positions(
+        self,
+        time_s: float,
+        rows: npt.NDArray[np.int64] | None = None,
+        lookahead_s: float = 0.0,
+    ) -> FlightPositions:
+        """Get the state of flights that are airborne at a time of day.
+
+        Args:
+            time_s: Time in seconds after midnight (wraps around the day)
+            rows: Schedule rows to consider (all flights when None)
+            lookahead_s: Also include flights departing within this time,
+                waiting at their departure airport
+
+        Returns:
+            State of the airborne (and soon departing) flights among rows
+        """
+        if rows is None:
+            rows = np.arange(len(self))
+        elapsed = (time_s - self.departure_s[rows]) % SECONDS_PER_DAY
+        duration = self.duration_s[rows]
+        airborne = elapsed < duration
+        pending = ~airborne & (elapsed >= SECONDS_PER_DAY - lookahead_s)
+        keep = airborne | pending
+        rows, elapsed, duration = rows[keep], elapsed[keep], duration[keep]
+        airborne = airborne[keep]
+
+        # Spherical interpolation along the great circle
+        fraction = np.where(airborne, elapsed / duration, 0.0)
+        angle = self._angle[rows]
+        start = self._start[rows]
+        end = self._end[rows]
+        sin_angle = np.sin(angle)
+        point = (
+            start * (np.sin((1.0 - fraction) * angle) / sin_angle)[:, None]
+            + end * (np.sin(fraction * angle) / sin_angle)[:, None]
+        )
+        direction = (
+            -start * np.cos((1.0 - fraction) * angle)[:, None]
+            + end * np.cos(fraction * angle)[:, None]
+        )
+        phi = np.arcsin(np.clip(point[:, 2], -1.0, 1.0))
+        lam = np.arctan2(point[:, 1], point[:, 0])
+        east = -direction[:, 0] * np.sin(lam) + direction[:, 1] * np.cos(lam)
+        north = (
+            -direction[:, 0] * np.sin(phi) * np.cos(lam)
+            - direction[:, 1] * np.sin(phi) * np.sin(lam)
+            + direction[:, 2] * np.cos(phi)
+        )
+
+        # 3:1 climb to cruise and descent to the destination
+        distance = self.distance_nm[rows]
+        flown = fraction * distance
+        climb_ceiling = flown * CLIMB_FT_PER_NM
+        descent_ceiling = (distance - flown) * CLIMB_FT_PER_NM
+        altitude = np.minimum(np.minimum(climb_ceiling, descent_ceiling), CRUISE_ALTITUDE_FT)
+        speed = np.where(airborne, self.speed_kts[rows], 0.0)
+        rate = speed / 60.0 * CLIMB_FT_PER_NM
+        vertical_speed = np.where(
+            altitude >= CRUISE_ALTITUDE_FT,
+            0.0,
+            np.where(climb_ceiling <= descent_ceiling, rate, -rate),
+        )
+
+        return FlightPositions(
+            rows=rows,
+            latitude=np.degrees(phi),
+            longitude=np.degrees(lam),
+            altitude_ft=altitude,
+            heading=np.degrees(np.arctan2(east, north)) % 360.0,
+            speed_kts=speed,
+            vertical_speed_fpm=vertical_speed,
+            on_ground=~airborne,
+        )
+
+
+class RegionalTraffic:
+    """Activates scheduled flights in a bubble around ownship.
+
+    Flights are activated when they come within ``bubble_nm`` of ownship
+    and retired once they are more than ``bubble_nm + retire_margin_nm``
+    away or have landed. The schedule is scanned for candidates within
+    ``bubble_nm + margin_nm`` whenever ownship has moved half the margin
+    or the fastest flight could have flown it; between scans only the
+    candidates and active flights are evaluated.
+
+    Attributes:
+        schedule: Flight schedule
+        bubble_nm: Activation radius in nautical miles
+        margin_nm: Candidate margin beyond the bubble in nautical miles
+        retire_margin_nm: Hysteresis beyond the bubble before retiring
+        units_per_nm: Local frame units per nautical mile
+
+    Examples:
+        >>> regional = RegionalTraffic(schedule, 51.47, -0.45, bubble_nm=30.0)
+        >>> entries, retired = regional.update(8 * 3600.0, 51.47, -0.45)
+        >>> len(entries) == regional.active_count
+        True
+    """
+
+    def __init__(
+        self,
+        schedule: FlightSchedule,
+        origin_lat: float,
+        origin_lon: float,
+        bubble_nm: float = 40.0,
+        margin_nm: float = 20.0,
+        retire_margin_nm: float = 2.0,
+        units_per_nm: float = UNITS_PER_NM,
+    ) -> None:
+        """Initialize with no active flights.
+
+        Args:
+            schedule: Flight schedule
+            origin_lat: Latitude of the local frame origin in degrees
+            origin_lon: Longitude of the local frame origin in degrees
+            bubble_nm: Activation radius in nautical miles
+            margin_nm: Candidate margin beyond the bubble in nautical miles
+            retire_margin_nm: Hysteresis beyond the bubble before retiring
+            units_per_nm: Local frame units per nautical mile
+        """
+        self.schedule = schedule
+        self.bubble_nm = bubble_nm
+        self.margin_nm = margin_nm
+        self.retire_margin_nm = retire_margin_nm
+        self.units_per_nm = units_per_nm
+        self._origin_lat = origin_lat
+        self._origin_lon = origin_lon
+        self._east_scale = math.cos(math.radians(origin_lat)) * 60.0 * units_per_nm
+        self._north_scale = 60.0 * units_per_nm
+
+        self._candidates: npt.NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+        self._scan_time_s: float | None = None
+        self._scan_position = (0.0, 0.0)
+        self._active: dict[int, str] = {}
+
+    @property
+    def active_count(self) -> int:
+        """Get the number of active flights."""
+        return len(self._active)
+
+    @property
+    def candidate_count(self) -> int:
+        """Get the number of flights found near the bubble by the last scan."""
+        return len(self._candidates)
+
+    @property
+    def active_callsigns(self) -> list[str]:
+        """Get callsigns of the active flights."""
+        return list(self._active.values())
+
+    @property
+    def scan_interval_s(self) -> float:
+        """Get the longest time between schedule scans."""
+        return self.margin_nm / 2.0 / self.schedule.max_speed_kts * 3600.0
+
+    def update(
+        self, time_s: float, latitude: float, longitude: float, max_active: int | None = None
+    ) -> tuple[list[TrafficEntry], list[str]]:
+        """Activate, move and retire flights for ownship at a time of day.
+
+        Args:
+            time_s: Time in seconds after midnight
+            latitude: Ownship latitude in degrees
+            longitude: Ownship longitude in degrees
+            max_active: Most flights to have active; the nearest flights
+                are activated first and active flights are never dropped
+                to make room (unlimited when None)
+
+        Returns:
+            Entries for every active flight, and callsigns of flights
+            retired by this update.
+        """
+        if self._scan_due(time_s, latitude, longitude):
+            self._scan(time_s, latitude, longitude)
+
+        active_rows = np.fromiter(self._active, dtype=np.int64, count=len(self._active))
+        positions = self.schedule.positions(time_s, np.union1d(self._candidates, active_rows))
+        distance = haversine_distances_nm(
+            latitude, longitude, positions.latitude, positions.longitude
+        )
+        was_active = np.isin(positions.rows, active_rows)
+        keep = np.where(
+            was_active,
+            distance <= self.bubble_nm + self.retire_margin_nm,
+            distance <= self.bubble_nm,
+        )
+        if max_active is not None:
+            entering = np.flatnonzero(keep & ~was_active)
+            room = max(0, max_active - int(np.count_nonzero(keep & was_active)))
+            keep[entering[np.argsort(distance[entering], kind="stable")[room:]]] = False
+
+        kept = set(positions.rows[keep].tolist())
+        retired = [callsign for row, callsign in self._active.items() if row not in kept]
+        self._active = {
+            row: self._active.get(row) or self.schedule.callsign(row)
+            for row in positions.rows[keep].tolist()
+        }
+        return self._entries(positions, np.flatnonzero(keep)), retired
+
+    def clear(self) -> list[str]:
+        """Retire all active flights.
+
+        Returns:
+            Callsigns of the retired flights.
+        """
+        retired = self.active_callsigns
+        self._active = {}
+        self._candidates = np.zeros(0, dtype=np.int64)
+        self._scan_time_s = None
+        return retired
+
+    def to_local(self, latitude: float, longitude: float, altitude_ft: float = 0.0) -> Vector3:
+        """Convert a geographic position to the local frame.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            altitude_ft: Altitude in feet
+
+        Returns:
+            Local frame position
+        """
+        dlon = (longitude - self._origin_lon + 180.0) % 360.0 - 180.0
+        return Vector3(
+            dlon * self._east_scale,
+            altitude_ft,
+            (latitude - self._origin_lat) * self._north_scale,
+        )
+
+    def to_geographic(self, position: Vector3) -> tuple[float, float]:
+        """Convert a local frame position to latitude and longitude.
+
+        Args:
+            position: Local frame position
+
+        Returns:
+            (latitude, longitude) in degrees
+        """
+        longitude = (self._origin_lon + position.x / self._east_scale + 180.0) % 360.0 - 180.0
+        return self._origin_lat + position.z / self._north_scale, longitude
+
+    def _scan_due(self, time_s: float, latitude: float, longitude: float) -> bool:
+        """Check whether candidates may have gone stale."""
+        if self._scan_time_s is None:
+            return True
+        if (time_s - self._scan_time_s) % SECONDS_PER_DAY >= self.scan_interval_s:
+            return True
+        moved = haversine_distances_nm(
+            latitude,
+            longitude,
+            np.array([self._scan_position[0]]),
+            np.array([self._scan_position[1]]),
+        )
+        return bool(moved[0] >= self.margin_nm / 2.0)
+
+    def _scan(self, time_s: float, latitude: float, longitude: float) -> None:
+        """Find flights that could enter the bubble before the next scan."""
+        positions = self.schedule.positions(time_s, lookahead_s=self.scan_interval_s)
+        distance = haversine_distances_nm(
+            latitude, longitude, positions.latitude, positions.longitude
+        )
+        self._candidates = positions.rows[distance <= self.bubble_nm + self.margin_nm]
+        self._scan_time_s = time_s
+        self._scan_position = (latitude, longitude)
+
+    def _entries(
+        self, positions: FlightPositions, index: npt.NDArray[np.int64]
+    ) -> list[TrafficEntry]:
+        """Create local frame traffic entries for selected flights."""
+        latitude = positions.latitude[index]
+        dlon = (positions.longitude[index] - self._origin_lon + 180.0) % 360.0 - 180.0
+        x = dlon * self._east_scale
+        z = (latitude - self._origin_lat) * self._north_scale
+        heading = positions.heading[index]
+        speed = positions.speed_kts[index] * self.units_per_nm / 3600.0
+        heading_rad = np.radians(heading)
+        vx = speed * np.sin(heading_rad)
+        vz = speed * np.cos(heading_rad)
+        altitude = positions.altitude_ft[index]
+        vertical_speed = positions.vertical_speed_fpm[index]
+
+        schedule = self.schedule
+        return [
+            TrafficEntry(
+                callsign=self._active[row],
+                aircraft_type=schedule.aircraft_type(row),
+                position=Vector3(px, alt, pz),
+                velocity=Vector3(pvx, vs / 60.0, pvz),
+                altitude_ft=alt,
+                vertical_speed_fpm=vs,
+                heading=hdg,
+                speed_kts=kts,
+                on_ground=ground,
+            )
+            for row, px, pz, pvx, pvz, alt, vs, hdg, kts, ground in zip(
+                positions.rows[index].tolist(),
+                x.tolist(),
+                z.tolist(),
+                vx.tolist(),
+                vz.tolist(),
+                altitude.tolist(),
+                vertical_speed.tolist(),
+                heading.tolist(),
+                positions.speed_kts[index].tolist(),
+                positions.on_ground[index].tolist(),
+                strict=True,
+            )
+        ]
@@ -0,0 +1,444 @@
+"""Structure-of-arrays store for AI traffic.
+
+Keeps the kinematic state of every AI aircraft in NumPy arrays and steps
+them together with the same waypoint-following rules as
+``AIAircraft.update``. Aircraft are updated at a rate that depends on their
+distance from ownship: traffic close by is stepped every frame, distant
+traffic every few frames with the accumulated time.
+
+The ``AIAircraft`` objects added to the store remain the public view of
+each aircraft. They are refreshed from the arrays by ``sync`` rather than
+on every step, so callers read them through ``get`` or ``aircraft``.
+
+Typical usage:
+    traffic = TrafficArrays()
+    traffic.add(aircraft)
+    traffic.update(dt, ownship_position)
+    traffic.remove_beyond(ownship_position, 20.0)
+"""
+
+import numpy as np
+
+from airborne.physics.vectors import Vector3
+from airborne.plugins.traffic.ai_aircraft import AIAircraft
+from airborne.plugins.traffic.traffic_state import TrafficEntry
+
+UNITS_PER_NM = 6076.0
+KNOTS_TO_MPS = 0.514444
+FPM_TO_MPS = 0.00508
+WAYPOINT_CAPTURE_NM = 0.5
+ALTITUDE_TOLERANCE_FT = 100.0
+
+# (maximum distance from ownship in NM, update every N frames)
+DEFAULT_LOD_TIERS: tuple[tuple[float, int], ...] = (
+    (5.0, 1),
+    (10.0, 4),
+    (float("inf"), 16),
+)
+
+# Columns of the packed waypoint array
+_WP_X, _WP_Z, _WP_ALTITUDE, _WP_SPEED = range(4)
+
+# Per-aircraft arrays, moved together on removal and growth
+_ARRAY_NAMES = (
+    "_position",
+    "_velocity",
+    "_heading",
+    "_altitude_ft",
+    "_vertical_speed_fpm",
+    "_airspeed_kts",
+    "_turn_rate",
+    "_climb_rate",
+    "_descent_rate",
+    "_acceleration",
+    "_on_ground",
+    "_waypoint_index",
+    "_waypoint_count",
+    "_waypoints",
+    "_elapsed",
+    "_dirty",
+    "_changed",
+)
+
+
+class TrafficArrays:
+    """AI traffic state held as arrays with level-of-detail stepping.
+
+    Attributes:
+        lod_tiers: Distance tiers as (max distance NM, frame divisor) pairs,
+            ordered by distance.
+
+    Examples:
+        >>> traffic = TrafficArrays()
+        >>> traffic.add(AIAircraft("N123", "C172", Vector3(0, 0, 0), airspeed_kts=100))
+        >>> traffic.update(1.0, Vector3(0, 0, 0))
+        >>> traffic.get("N123").position.z > 0
+        True
+    """
+
+    def __init__(
+        self,
+        capacity: int = 16,
+        lod_tiers: tuple[tuple[float, int], ...] = DEFAULT_LOD_TIERS,
+    ) -> None:
+        """Initialize an empty store.
+
+        Args:
+            capacity: Initial number of aircraft slots.
+            lod_tiers: Distance tiers as (max distance NM, frame divisor).
+        """
+        self.lod_tiers = lod_tiers
+        self._tier_limits = np.array([limit for limit, _ in lod_tiers[:-1]])
+        self._tier_divisors = np.array([divisor for _, divisor in lod_tiers], dtype=np.int64)
+
+        self._count = 0
+        self._frame = 0
+        self._slots: dict[str, int] = {}
+        self._views: list[AIAircraft] = []
+
+        capacity = max(capacity, 1)
+        self._position = np.zeros((capacity, 3))
+        self._velocity = np.zeros((capacity, 3))
+        self._heading = np.zeros(capacity)
+        self._altitude_ft = np.zeros(capacity)
+        self._vertical_speed_fpm = np.zeros(capacity)
+        self._airspeed_kts = np.zeros(capacity)
+        self._turn_rate = np.zeros(capacity)
+        self._climb_rate = np.zeros(capacity)
+        self._descent_rate = np.zeros(capacity)
+        self._acceleration = np.zeros(capacity)
+        self._on_ground = np.zeros(capacity, dtype=bool)
+        self._waypoint_index = np.zeros(capacity, dtype=np.int64)
+        self._waypoint_count = np.zeros(capacity, dtype=np.int64)
+        self._waypoints = np.zeros((capacity, 1, 4))
+        self._elapsed = np.zeros(capacity)
+        self._dirty = np.zeros(capacity, dtype=bool)
+        self._changed = np.zeros(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        """Get the number of aircraft in the store."""
+        return self._count
+
+    def __contains__(self, callsign: object) -> bool:
+        """Check whether an aircraft with the callsign is in the store."""
+        return callsign in self._slots
+
+    @property
+    def callsigns(self) -> list[str]:
+        """Get callsigns in slot order."""
+        return [aircraft.callsign for aircraft in self._views]
+
+    def add(self, aircraft: AIAircraft) -> None:
+        """Add an aircraft, or reload it if its callsign is already present.
+
+        The aircraft's current state and flight plan are copied into the
+        arrays; later changes to the object are picked up by adding it again.
+
+        Args:
+            aircraft: Aircraft to add.
+        """
+        slot = self._slots.get(aircraft.callsign)
+        if slot is None:
+            slot = self._count
+            if slot == len(self._heading):
+                self._resize(rows=2 * slot)
+            self._count += 1
+            self._slots[aircraft.callsign] = slot
+            self._views.append(aircraft)
+        else:
+            self._views[slot] = aircraft
+
+        waypoints = aircraft.flight_plan.waypoints if aircraft.flight_plan else []
+        if len(waypoints) > self._waypoints.shape[1]:
+            self._resize(waypoints=len(waypoints))
+
+        position = aircraft.position
+        velocity = aircraft.velocity
+        self._position[slot] = (position.x, position.y, position.z)
+        self._velocity[slot] = (velocity.x, velocity.y, velocity.z)
+        self._heading[slot] = aircraft.heading
+        self._altitude_ft[slot] = aircraft.altitude_ft
+        self._vertical_speed_fpm[slot] = aircraft.vertical_speed_fpm
+        self._airspeed_kts[slot] = aircraft.airspeed_kts
+        self._turn_rate[slot] = aircraft.turn_rate_deg_sec
+        self._climb_rate[slot] = aircraft.climb_rate_fpm
+        self._descent_rate[slot] = aircraft.descent_rate_fpm
+        self._acceleration[slot] = aircraft.acceleration_kts_sec
+        self._on_ground[slot] = aircraft.on_ground
+        self._waypoint_index[slot] = (
+            aircraft.flight_plan.current_waypoint_index if aircraft.flight_plan else 0
+        )
+        self._waypoint_count[slot] = len(waypoints)
+        for column, waypoint in enumerate(waypoints):
+            self._waypoints[slot, column] = (
+                waypoint.position.x,
+                waypoint.position.z,
+                waypoint.altitude_ft,
+                waypoint.speed_kts,
+            )
+        self._elapsed[slot] = 0.0
+        self._dirty[slot] = False
+        self._changed[slot] = True
+
+    def remove(self, callsign: str) -> bool:
+        """Remove an aircraft.
+
+        The last slot is moved into the freed one, so slot order is not stable.
+
+        Args:
+            callsign: Callsign of the aircraft to remove.
+
+        Returns:
+            True if the aircraft was removed, False if it was not present.
+        """
+        slot = self._slots.pop(callsign, None)
+        if slot is None:
+            return False
+
+        self._sync_slot(slot)
+        last = self._count - 1
+        if slot != last:
+            for array in self._arrays():
+                array[slot] = array[last]
+            moved = self._views[last]
+            self._views[slot] = moved
+            self._slots[moved.callsign] = slot
+        self._views.pop()
+        self._count = last
+        return True
+
+    def clear(self) -> None:
+        """Remove all aircraft."""
+        self._slots.clear()
+        self._views.clear()
+        self._count = 0
+
+    def update(self, dt: float, ownship: Vector3) -> None:
+        """Advance the traffic by one frame.
+
+        Every aircraft accumulates ``dt``; aircraft whose tier is due this
+        frame are stepped with their accumulated time.
+
+        Args:
+            dt: Frame time in seconds.
+            ownship: Ownship position used to pick each aircraft's tier.
+        """
+        count = self._count
+        self._frame += 1
+        if count == 0 or dt <= 0.0:
+            return
+
+        elapsed = self._elapsed[:count]
+        elapsed += dt
+
+        tiers = np.searchsorted(self._tier_limits, self.distances_nm(ownship))
+        divisors = self._tier_divisors[tiers]
+        due = (np.arange(self._frame, self._frame + count) % divisors == 0) & ~self._on_ground[
+            :count
+        ]
+        rows = np.flatnonzero(due)
+        if len(rows) == 0:
+            return
+
+        step = elapsed[rows]
+        elapsed[rows] = 0.0
+        self._follow_waypoints(rows, step)
+        self._move(rows, step)
+        self._dirty[rows] = True
+        self._changed[rows] = True
+
+    def distances_nm(self, position: Vector3) -> np.ndarray:
+        """Get the distance from a position to every aircraft.
+
+        Args:
+            position: Reference position.
+
+        Returns:
+            Distances in nautical miles, in slot order.
+        """
+        offsets = self._position[: self._count] - (position.x, position.y, position.z)
+        distances: np.ndarray = np.sqrt(np.einsum("ij,ij->i", offsets, offsets))
+        return distances / UNITS_PER_NM
+
+    def remove_beyond(self, position: Vector3, distance_nm: float) -> list[str]:
+        """Remove aircraft farther than a distance from a position.
+
+        Args:
+            position: Reference position.
+            distance_nm: Maximum distance to keep, in nautical miles.
+
+        Returns:
+            Callsigns of the removed aircraft.
+        """
+        rows = np.flatnonzero(self.distances_nm(position) > distance_nm)
+        callsigns = [self._views[row].callsign for row in rows.tolist()]
+        for callsign in callsigns:
+            self.remove(callsign)
+        return callsigns
+
+    def get(self, callsign: str) -> AIAircraft | None:
+        """Get the up-to-date view of one aircraft.
+
+        Args:
+            callsign: Aircraft callsign.
+
+        Returns:
+            AIAircraft or None if not found.
+        """
+        slot = self._slots.get(callsign)
+        if slot is None:
+            return None
+        self._sync_slot(slot)
+        return self._views[slot]
+
+    def aircraft(self) -> list[AIAircraft]:
+        """Get up-to-date views of all aircraft.
+
+        Returns:
+            Aircraft in slot order.
+        """
+        self.sync()
+        return list(self._views)
+
+    def changed_entries(self) -> list[TrafficEntry]:
+        """Take the state of aircraft added or stepped since the last call.
+
+        Returns:
+            Traffic entries for the changed aircraft, in slot order.
+        """
+        rows = np.flatnonzero(self._changed[: self._count])
+        self._changed[rows] = False
+        return [
+            TrafficEntry(
+                callsign=aircraft.callsign,
+                aircraft_type=aircraft.aircraft_type,
+                position=Vector3(*position),
+                velocity=Vector3(*velocity),
+                altitude_ft=altitude,
+                vertical_speed_fpm=vertical_speed,
+                heading=heading,
+                speed_kts=speed,
+                on_ground=aircraft.on_ground,
+            )
+            for aircraft, position, velocity, altitude, vertical_speed, heading, speed in zip(
+                [self._views[row] for row in rows.tolist()],
+                self._position[rows].tolist(),
+                self._velocity[rows].tolist(),
+                self._altitude_ft[rows].tolist(),
+                self._vertical_speed_fpm[rows].tolist(),
+                self._heading[rows].tolist(),
+                self._airspeed_kts[rows].tolist(),
+                strict=True,
+            )
+        ]
+
+    def sync(self) -> None:
+        """Copy array state back into the views of aircraft stepped since the last sync."""
+        for slot in np.flatnonzero(self._dirty[: self._count]).tolist():
+            self._sync_slot(slot)
+
+    def _sync_slot(self, slot: int) -> None:
+        """Copy array state into one aircraft view."""
+        if not self._dirty[slot]:
+            return
+        self._dirty[slot] = False
+        aircraft = self._views[slot]
+        x, y, z = self._position[slot].tolist()
+        vx, vy, vz = self._velocity[slot].tolist()
+        aircraft.position = Vector3(x, y, z)
+        aircraft.velocity = Vector3(vx, vy, vz)
+        aircraft.heading = float(self._heading[slot])
+        aircraft.altitude_ft = float(self._altitude_ft[slot])
+        aircraft.vertical_speed_fpm = float(self._vertical_speed_fpm[slot])
+        aircraft.airspeed_kts = float(self._airspeed_kts[slot])
+        if aircraft.flight_plan:
+            aircraft.flight_plan.current_waypoint_index = int(self._waypoint_index[slot])
+
+    def _follow_waypoints(self, rows: np.ndarray, dt: np.ndarray) -> None:
+        """Steer, climb and accelerate towards the current waypoints."""
+        index = self._waypoint_index[rows]
+        following = (index >= 0) & (index < self._waypoint_count[rows])
+        if not following.all():
+            rows, dt, index = rows[following], dt[following], index[following]
+            if len(rows) == 0:
+                return
+
+        target = self._waypoints[rows, index]
+        dx = target[:, _WP_X] - self._position[rows, 0]
+        dz = target[:, _WP_Z] - self._position[rows, 2]
+        distance_nm = np.hypot(dx, dz) / UNITS_PER_NM
+
+        # Turn towards the waypoint at the turn rate
+        desired = np.degrees(np.arctan2(dx, dz)) % 360
+        heading = self._heading[rows]
+        heading_error = (desired - heading + 180) % 360 - 180
+        max_turn = self._turn_rate[rows] * dt
+        self._heading[rows] = (
+            np.where(
+                np.abs(heading_error) < max_turn,
+                desired,
+                heading + np.where(heading_error > 0, max_turn, -max_turn),
+            )
+            % 360
+        )
+
+        # Climb or descend to the waypoint altitude, level off within tolerance
+        altitude_error = target[:, _WP_ALTITUDE] - self._altitude_ft[rows]
+        rate = altitude_error / (dt / 60)
+        self._vertical_speed_fpm[rows] = np.where(
+            np.abs(altitude_error) > ALTITUDE_TOLERANCE_FT,
+            np.where(
+                altitude_error > 0,
+                np.minimum(self._climb_rate[rows], rate),
+                np.maximum(-self._descent_rate[rows], rate),
+            ),
+            0.0,
+        )
+
+        # Accelerate to the waypoint speed
+        target_speed = target[:, _WP_SPEED]
+        airspeed = self._airspeed_kts[rows]
+        speed_error = target_speed - airspeed
+        max_accel = self._acceleration[rows] * dt
+        self._airspeed_kts[rows] = np.where(
+            np.abs(speed_error) < max_accel,
+            target_speed,
+            airspeed + np.where(speed_error > 0, max_accel, -max_accel),
+        )
+
+        # Advance past captured waypoints, holding the last one
+        advance = (distance_nm < WAYPOINT_CAPTURE_NM) & (index < self._waypoint_count[rows] - 1)
+        self._waypoint_index[rows[advance]] += 1
+
+    def _move(self, rows: np.ndarray, dt: np.ndarray) -> None:
+        """Integrate position and altitude from heading, speed and vertical speed."""
+        speed_mps = self._airspeed_kts[rows] * KNOTS_TO_MPS
+        heading_rad = np.radians(self._heading[rows])
+        vertical_speed = self._vertical_speed_fpm[rows]
+
+        velocity = np.empty((len(rows), 3))
+        velocity[:, 0] = speed_mps * np.sin(heading_rad)
+        velocity[:, 1] = vertical_speed * FPM_TO_MPS
+        velocity[:, 2] = speed_mps * np.cos(heading_rad)
+        self._velocity[rows] = velocity
+        self._position[rows] += velocity * dt[:, None]
+        self._altitude_ft[rows] += vertical_speed * (dt / 60)
+
+    def _arrays(self) -> list[np.ndarray]:
+        """Get every per-aircraft array."""
+        return [getattr(self, name) for name in _ARRAY_NAMES]
+
+    def _resize(self, rows: int | None = None, waypoints: int | None = None) -> None:
+        """Grow the arrays to more slots or longer flight plans."""
+        if waypoints is not None:
+            grown = np.zeros((len(self._waypoints), waypoints, 4))
+            grown[:, : self._waypoints.shape[1]] = self._waypoints
+            self._waypoints = grown
+        if rows is None:
+            return
+
+        for name in _ARRAY_NAMES:
+            array = getattr(self, name)
+            grown = np.zeros((rows, *array.shape[1:]), dtype=array.dtype)
+            grown[: len(array)] = array
+            setattr(self, name, grown)
@@ -0,0 +1,370 @@
+"""Versioned traffic state with delta publication.
+
+The traffic state service is the shared record of where every traffic
+aircraft is. Producers put entries as aircraft spawn, move and leave; each
+change stamps the entry with a new version and is queued in a pending
+delta. Publishing sends only the queued spawned/updated/removed entries on
+``TRAFFIC_DELTA``, so fan-out cost follows the number of changes rather
+than the fleet size. Consumers that need more than the delta pull a
+snapshot or a filtered view (within a range, on a frequency) from the
+service.
+
+Positions are kept in the producer's frame; ``units_per_nm`` converts
+range queries into that frame.
+
+Typical usage:
+    state = TrafficStateService()
+    state.put(TrafficEntry("N123", "C172", Vector3(0, 0, 0), altitude_ft=3000))
+    state.publish(message_queue, "ai_traffic")
+    nearby = state.within(own_position, 10.0)
+"""
+
+import dataclasses
+import operator
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from airborne.core.messaging import Message, MessagePriority, MessageQueue, MessageTopic
+from airborne.physics.vectors import Vector3
+
+UNITS_PER_NM = 6076.0
+
+
+@dataclass(frozen=True)
+class TrafficEntry:
+    """State of one traffic aircraft.
+
+    Attributes:
+        callsign: Aircraft callsign
+        aircraft_type: Type of aircraft (e.g., "C172")
+        position: Position in the producer's frame
+        velocity: Velocity in the producer's frame per second
+        altitude_ft: Altitude in feet
+        vertical_speed_fpm: Vertical speed in feet per minute
+        heading: Heading in degrees
+        speed_kts: Speed in knots
+        on_ground: Whether the aircraft is on the ground
+        frequency_mhz: Frequency the aircraft is tuned to, if known
+        version: Service version at which this state was recorded
+    """
+
+    callsign: str
+    aircraft_type: str
+    position: Vector3
+    velocity: Vector3 = field(default_factory=lambda: Vector3(0, 0, 0))
+    altitude_ft: float = 0.0
+    vertical_speed_fpm: float = 0.0
+    heading: float = 0.0
+    speed_kts: float = 0.0
+    on_ground: bool = False
+    frequency_mhz: float | None = None
+    version: int = 0
+
+
+# Entry fields other than the version (the last field), for cheap change
+# detection and re-stamping
+_EntryState = tuple[str, str, Vector3, Vector3, float, float, float, float, bool, float | None]
+_entry_state: Callable[[TrafficEntry], _EntryState] = operator.attrgetter(
+    *(f.name for f in dataclasses.fields(TrafficEntry) if f.name != "version")
+)
+
+
+@dataclass
+class TrafficDelta:
+    """Changes to the traffic state since the previous publication.
+
+    Attributes:
+        version: Service version after these changes
+        spawned: Entries for aircraft that appeared
+        updated: Latest entries for aircraft that changed
+        removed: Callsigns of aircraft that left
+    """
+
+    version: int
+    spawned: list[TrafficEntry] = field(default_factory=list)
+    updated: list[TrafficEntry] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class TrafficStateSnapshot:
+    """Consistent copy of the traffic state.
+
+    Attributes:
+        version: Service version of the snapshot
+        aircraft: Entries by callsign
+    """
+
+    version: int
+    aircraft: dict[str, TrafficEntry]
+
+
+class TrafficStateService:
+    """Shared, versioned traffic state.
+
+    Entries are immutable; each change replaces the entry and bumps the
+    service version. Positions and altitudes are mirrored into arrays by
+    slot so range views are vectorized.
+
+    Examples:
+        >>> state = TrafficStateService()
+        >>> _ = state.put(TrafficEntry("N1", "C172", Vector3(0, 0, 6076)))
+        >>> _ = state.put(TrafficEntry("N2", "C172", Vector3(0, 0, 60760)))
+        >>> [entry.callsign for entry in state.within(Vector3(0, 0, 0), 5.0)]
+        ['N1']
+        >>> delta = state.flush()
+        >>> len(delta.spawned), delta.version
+        (2, 2)
+    """
+
+    def __init__(self, units_per_nm: float = UNITS_PER_NM) -> None:
+        """Initialize an empty state.
+
+        Args:
+            units_per_nm: Position units per nautical mile
+        """
+        self.units_per_nm = units_per_nm
+        self._version = 0
+        self._entries: dict[str, TrafficEntry] = {}
+        self._by_frequency: dict[float, set[str]] = {}
+
+        # Slot arrays mirroring entry positions and altitudes
+        self._slots: dict[str, int] = {}
+        self._slot_callsigns: list[str] = []
+        self._position = np.zeros((16, 3))
+        self._altitude_ft = np.zeros(16)
+
+        # Pending delta, by callsign
+        self._spawned: dict[str, TrafficEntry] = {}
+        self._updated: dict[str, TrafficEntry] = {}
+        self._removed: set[str] = set()
+
+    def __len__(self) -> int:
+        """Get the number of aircraft in the state."""
+        return len(self._entries)
+
+    def __contains__(self, callsign: object) -> bool:
+        """Check whether an aircraft is in the state."""
+        return callsign in self._entries
+
+    @property
+    def version(self) -> int:
+        """Get the current state version."""
+        return self._version
+
+    def get(self, callsign: str) -> TrafficEntry | None:
+        """Get the entry for one aircraft.
+
+        Args:
+            callsign: Aircraft callsign
+
+        Returns:
+            TrafficEntry or None if not found.
+        """
+        return self._entries.get(callsign)
+
+    def put(self, entry: TrafficEntry) -> TrafficEntry | None:
+        """Add or replace an aircraft's state.
+
+        Args:
+            entry: New state; its version is assigned by the service
+
+        Returns:
+            The stored entry, or None if nothing changed.
+        """
+        previous = self._entries.get(entry.callsign)
+        if previous is not None and _entry_state(entry) == _entry_state(previous):
+            return None
+
+        self._version += 1
+        entry = TrafficEntry(*_entry_state(entry), self._version)
+        callsign = entry.callsign
+        self._entries[callsign] = entry
+
+        slot = self._slots.get(callsign)
+        if slot is None:
+            slot = len(self._slot_callsigns)
+            if slot == len(self._altitude_ft):
+                self._grow()
+            self._slots[callsign] = slot
+            self._slot_callsigns.append(callsign)
+        position = entry.position
+        self._position[slot] = (position.x, position.y, position.z)
+        self._altitude_ft[slot] = entry.altitude_ft
+
+        if previous is None or previous.frequency_mhz != entry.frequency_mhz:
+            if previous is not None:
+                self._unindex_frequency(previous)
+            if entry.frequency_mhz is not None:
+                self._by_frequency.setdefault(round(entry.frequency_mhz, 3), set()).add(callsign)
+
+        if callsign in self._spawned or previous is None:
+            self._spawned[callsign] = entry
+            self._removed.discard(callsign)
+        else:
+            self._updated[callsign] = entry
+        return entry
+
+    def put_many(self, entries: Iterable[TrafficEntry]) -> int:
+        """Add or replace several aircraft.
+
+        Args:
+            entries: New states
+
+        Returns:
+            Number of entries that changed.
+        """
+        return sum(self.put(entry) is not None for entry in entries)
+
+    def remove(self, callsign: str) -> bool:
+        """Remove an aircraft.
+
+        Args:
+            callsign: Aircraft callsign
+
+        Returns:
+            True if the aircraft was removed, False if it was not present.
+        """
+        entry = self._entries.pop(callsign, None)
+        if entry is None:
+            return False
+
+        self._version += 1
+        self._unindex_frequency(entry)
+
+        # Move the last slot into the freed one
+        slot = self._slots.pop(callsign)
+        last = len(self._slot_callsigns) - 1
+        if slot != last:
+            moved = self._slot_callsigns[last]
+            self._slot_callsigns[slot] = moved
+            self._slots[moved] = slot
+            self._position[slot] = self._position[last]
+            self._altitude_ft[slot] = self._altitude_ft[last]
+        self._slot_callsigns.pop()
+
+        self._updated.pop(callsign, None)
+        if self._spawned.pop(callsign, None) is None:
+            self._removed.add(callsign)
+        return True
+
+    def clear(self) -> None:
+        """Remove all aircraft."""
+        for callsign in list(self._entries):
+            self.remove(callsign)
+
+    def flush(self) -> TrafficDelta | None:
+        """Take the changes queued since the last flush.
+
+        Returns:
+            The pending delta, or None if nothing changed.
+        """
+        if not (self._spawned or self._updated or self._removed):
+            return None
+        delta = TrafficDelta(
+            version=self._version,
+            spawned=list(self._spawned.values()),
+            updated=list(self._updated.values()),
+            removed=sorted(self._removed),
+        )
+        self._spawned = {}
+        self._updated = {}
+        self._removed = set()
+        return delta
+
+    def publish(self, message_queue: MessageQueue, sender: str) -> TrafficDelta | None:
+        """Flush pending changes and publish them on ``TRAFFIC_DELTA``.
+
+        Args:
+            message_queue: Queue to publish on
+            sender: Sender name for the message
+
+        Returns:
+            The published delta, or None if nothing changed.
+        """
+        delta = self.flush()
+        if delta is not None:
+            message_queue.publish(
+                Message(
+                    sender=sender,
+                    recipients=["*"],
+                    topic=MessageTopic.TRAFFIC_DELTA,
+                    data={"delta": delta, "state": self},
+                    priority=MessagePriority.NORMAL,
+                )
+            )
+        return delta
+
+    def snapshot(self) -> TrafficStateSnapshot:
+        """Get a consistent copy of all entries.
+
+        Returns:
+            Snapshot with the current version.
+        """
+        return TrafficStateSnapshot(self._version, dict(self._entries))
+
+    def within(
+        self,
+        position: Vector3,
+        radius_nm: float,
+        altitude_ft: float | None = None,
+        altitude_window_ft: float | None = None,
+    ) -> list[TrafficEntry]:
+        """Get aircraft within a horizontal range, optionally in an altitude band.
+
+        Args:
+            position: Reference position
+            radius_nm: Horizontal range in nautical miles
+            altitude_ft: Reference altitude for the altitude band
+            altitude_window_ft: Half-height of the altitude band
+
+        Returns:
+            Matching entries.
+        """
+        count = len(self._slot_callsigns)
+        reach = radius_nm * self.units_per_nm
+        dx = self._position[:count, 0] - position.x
+        dz = self._position[:count, 2] - position.z
+        inside = dx * dx + dz * dz <= reach * reach
+        if altitude_ft is not None and altitude_window_ft is not None:
+            inside &= np.abs(self._altitude_ft[:count] - altitude_ft) <= altitude_window_ft
+        return self._entries_at(np.flatnonzero(inside).tolist())
+
+    def on_frequency(self, frequency_mhz: float) -> list[TrafficEntry]:
+        """Get aircraft tuned to a frequency.
+
+        Args:
+            frequency_mhz: Frequency in MHz
+
+        Returns:
+            Matching entries.
+        """
+        callsigns = self._by_frequency.get(round(frequency_mhz, 3), set())
+        return [self._entries[callsign] for callsign in sorted(callsigns)]
+
+    def _entries_at(self, slots: Sequence[int]) -> list[TrafficEntry]:
+        """Get entries for slot numbers."""
+        return [self._entries[self._slot_callsigns[slot]] for slot in slots]
+
+    def _unindex_frequency(self, entry: TrafficEntry) -> None:
+        """Drop an entry from the frequency index."""
+        if entry.frequency_mhz is None:
+            return
+        frequency = round(entry.frequency_mhz, 3)
+        callsigns = self._by_frequency.get(frequency)
+        if callsigns is not None:
+            callsigns.discard(entry.callsign)
+            if not callsigns:
+                del self._by_frequency[frequency]
+
+    def _grow(self) -> None:
+        """Double the slot arrays."""
+        size = 2 * len(self._altitude_ft)
+        position = np.zeros((size, 3))
+        position[: len(self._position)] = self._position
+        altitude = np.zeros(size)
+        altitude[: len(self._altitude_ft)] = self._altitude_ft
+        self._position = position
+        self._altitude_ft = altitude
@@ -157,6 +157,7 @@ class ATCHandler:
         # Build taxiway graph if data available
         if self._gateway_data:
             self._taxiway_graph = TaxiwayGraph.from_gateway_data(self._gateway_data)
+            self._taxiway_graph.precompute_route_trees()
 
         # Load frequencies
         self._frequencies = self._load_frequencies()
@@ -347,6 +348,17 @@ class ATCHandler:
 
         return ["Alpha"]
 
+    def set_closed_runways(self, runway_ids: list[str]) -> None:
+        """Close runways to taxi routing.
+
+        Taxi routes are rebuilt around the closed runways in the background.
+
+        Args:
+            runway_ids: Closed runway identifiers; an empty list reopens all.
+        """
+        if self._taxiway_graph:
+            self._taxiway_graph.set_closed_runways(runway_ids)
+
     def handle_request(self, request: ATCRequest) -> ATCResponse:
         """Handle an ATC request.
 
@@ -767,6 +779,7 @@ class ATCHandler:
         # Rebuild taxiway graph
         if self._gateway_data:
             self._taxiway_graph = TaxiwayGraph.from_gateway_data(self._gateway_data)
+            self._taxiway_graph.precompute_route_trees()
         else:
             self._taxiway_graph = None
 
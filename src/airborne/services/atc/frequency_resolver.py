@@ -292,12 +292,13 @@ class FrequencyResolver:
         if not self._gateway_loader:
             return None
 
-        data = self._gateway_loader.get_airport(icao)
-        if not data or not data.frequencies:
+        # Only the frequency section of the cache is read
+        frequencies = self._gateway_loader.get_frequencies(icao)
+        if not frequencies:
             return None
 
         result = []
-        for freq in data.frequencies:
+        for freq in frequencies:
             freq_type = self._map_gateway_freq_type(freq.type)
             if freq_type:
                 result.append((freq_type, freq.frequency_mhz, freq.name))
@@ -0,0 +1,403 @@
+"""Binary cache format for X-Plane Gateway airport data.
+
+Each airport is stored in one file made of independently readable
+sections, so callers that only need runways or frequencies do not decode
+the taxi network.
+
+Layout (little-endian):
+    header:   magic "AGWC", format version (u16), section count (u16)
+    table:    per section: name (12 bytes), offset (u32), length (u32)
+    sections: record count (u32), string table length (u32), fixed-size
+              records, then the section's strings joined by NUL bytes
+
+String fields are stored as indices into the section's string table, so
+repeated taxiway names and frequency types are stored once.
+
+The container itself (encode_section(), decode_section(),
+write_cache_sections() and read_cache_payloads()) is shared with the
+cache of procedurally generated layouts (see airborne.airports.generated_cache).
+
+Typical usage:
+    write_gateway_cache(path, airport_data)
+    runways = read_gateway_section(path, "runways")
+    airport_data = read_gateway_cache(path)
+"""
+
+import os
+import struct
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from airborne.services.atc.gateway_loader import (
+    GatewayAirportData,
+    GatewayFrequency,
+    GatewayRunway,
+    ParkingPosition,
+    TaxiEdge,
+    TaxiNode,
+)
+
+CACHE_MAGIC = b"AGWC"
+CACHE_VERSION = 1
+
+_HEADER = struct.Struct("<4sHH")
+_TABLE_ENTRY = struct.Struct("<12sII")
+_SECTION_HEADER = struct.Struct("<II")
+
+# Fixed part of each record; "I" fields marked as strings index the string table
+_AIRPORT = struct.Struct("<IIdddi?")
+_RUNWAY = struct.Struct("<IIdddddddi")
+_FREQUENCY = struct.Struct("<IdI")
+_TAXI_NODE = struct.Struct("<qddI?I")
+_TAXI_EDGE = struct.Struct("<qqI??I")
+_PARKING = struct.Struct("<IdddII")
+
+SECTIONS = ("airport", "runways", "frequencies", "taxi_nodes", "taxi_edges", "parking")
+
+
+class StringTable:
+    """Deduplicating string table for one section."""
+
+    def __init__(self) -> None:
+        self._index: dict[str, int] = {}
+
+    def add(self, value: str) -> int:
+        """Get the index of a string, adding it if new."""
+        index = self._index.get(value)
+        if index is None:
+            index = len(self._index)
+            self._index[value] = index
+        return index
+
+    def encode(self) -> bytes:
+        """Encode the strings in index order."""
+        return "\0".join(self._index).encode("utf-8")
+
+
+def encode_section(
+    record: struct.Struct, items: list[Any], pack: Callable[[Any, StringTable], tuple[Any, ...]]
+) -> bytes:
+    """Encode items as fixed-size records followed by their string table."""
+    strings = StringTable()
+    records = b"".join(record.pack(*pack(item, strings)) for item in items)
+    encoded_strings = strings.encode()
+    return _SECTION_HEADER.pack(len(items), len(encoded_strings)) + records + encoded_strings
+
+
+def decode_section(
+    record: struct.Struct, payload: bytes
+) -> tuple[list[tuple[Any, ...]], list[str]]:
+    """Decode a section into raw record tuples and its string table."""
+    count, strings_length = _SECTION_HEADER.unpack_from(payload)
+    records_end = _SECTION_HEADER.size + count * record.size
+    if records_end + strings_length != len(payload):
+        raise ValueError("Corrupt gateway cache section")
+    rows = list(record.iter_unpack(payload[_SECTION_HEADER.size : records_end]))
+    strings = payload[records_end:].decode("utf-8").split("\0")
+    return rows, strings
+
+
+def _encode_sections(data: GatewayAirportData) -> dict[str, bytes]:
+    """Encode every section of an airport."""
+    return {
+        "airport": encode_section(
+            _AIRPORT,
+            [data],
+            lambda d, s: (
+                s.add(d.icao),
+                s.add(d.name),
+                d.latitude,
+                d.longitude,
+                d.elevation_ft,
+                d.transition_altitude,
+                d.has_atc,
+            ),
+        ),
+        "runways": encode_section(
+            _RUNWAY,
+            data.runways,
+            lambda r, s: (
+                s.add(r.id1),
+                s.add(r.id2),
+                r.width_m,
+                r.lat1,
+                r.lon1,
+                r.lat2,
+                r.lon2,
+                r.heading1,
+                r.heading2,
+                r.surface,
+            ),
+        ),
+        "frequencies": encode_section(
+            _FREQUENCY,
+            data.frequencies,
+            lambda f, s: (s.add(f.type), f.frequency_mhz, s.add(f.name)),
+        ),
+        "taxi_nodes": encode_section(
+            _TAXI_NODE,
+            list(data.taxi_nodes.values()),
+            lambda n, s: (
+                n.id,
+                n.latitude,
+                n.longitude,
+                s.add(n.name),
+                n.is_hold_short,
+                s.add(n.on_runway),
+            ),
+        ),
+        "taxi_edges": encode_section(
+            _TAXI_EDGE,
+            data.taxi_edges,
+            lambda e, s: (
+                e.node_begin,
+                e.node_end,
+                s.add(e.name),
+                e.is_runway,
+                e.one_way,
+                s.add(e.width_code),
+            ),
+        ),
+        "parking": encode_section(
+            _PARKING,
+            data.parking_positions,
+            lambda p, s: (
+                s.add(p.id),
+                p.latitude,
+                p.longitude,
+                p.heading,
+                s.add(p.type),
+                s.add("|".join(p.aircraft_types)),
+            ),
+        ),
+    }
+
+
+def _decode_airport(payload: bytes) -> GatewayAirportData:
+    rows, s = decode_section(_AIRPORT, payload)
+    icao, name, latitude, longitude, elevation_ft, transition_altitude, has_atc = rows[0]
+    return GatewayAirportData(
+        icao=s[icao],
+        name=s[name],
+        latitude=latitude,
+        longitude=longitude,
+        elevation_ft=elevation_ft,
+        transition_altitude=transition_altitude,
+        has_atc=has_atc,
+    )
+
+
+def _decode_runways(payload: bytes) -> list[GatewayRunway]:
+    rows, s = decode_section(_RUNWAY, payload)
+    return [
+        GatewayRunway(
+            id1=s[id1],
+            id2=s[id2],
+            width_m=width_m,
+            lat1=lat1,
+            lon1=lon1,
+            lat2=lat2,
+            lon2=lon2,
+            heading1=heading1,
+            heading2=heading2,
+            surface=surface,
+        )
+        for id1, id2, width_m, lat1, lon1, lat2, lon2, heading1, heading2, surface in rows
+    ]
+
+
+def _decode_frequencies(payload: bytes) -> list[GatewayFrequency]:
+    rows, s = decode_section(_FREQUENCY, payload)
+    return [
+        GatewayFrequency(type=s[freq_type], frequency_mhz=mhz, name=s[name])
+        for freq_type, mhz, name in rows
+    ]
+
+
+def _decode_taxi_nodes(payload: bytes) -> dict[int, TaxiNode]:
+    rows, s = decode_section(_TAXI_NODE, payload)
+    return {
+        node_id: TaxiNode(
+            id=node_id,
+            latitude=latitude,
+            longitude=longitude,
+            name=s[name],
+            is_hold_short=is_hold_short,
+            on_runway=s[on_runway],
+        )
+        for node_id, latitude, longitude, name, is_hold_short, on_runway in rows
+    }
+
+
+def _decode_taxi_edges(payload: bytes) -> list[TaxiEdge]:
+    rows, s = decode_section(_TAXI_EDGE, payload)
+    return [
+        TaxiEdge(
+            node_begin=node_begin,
+            node_end=node_end,
+            name=s[name],
+            is_runway=is_runway,
+            one_way=one_way,
+            width_code=s[width_code],
+        )
+        for node_begin, node_end, name, is_runway, one_way, width_code in rows
+    ]
+
+
+def _decode_parking(payload: bytes) -> list[ParkingPosition]:
+    rows, s = decode_section(_PARKING, payload)
+    return [
+        ParkingPosition(
+            id=s[position_id],
+            latitude=latitude,
+            longitude=longitude,
+            heading=heading,
+            type=s[parking_type],
+            aircraft_types=s[aircraft_types].split("|") if s[aircraft_types] else [],
+        )
+        for position_id, latitude, longitude, heading, parking_type, aircraft_types in rows
+    ]
+
+
+_DECODERS: dict[str, Callable[[bytes], Any]] = {
+    "airport": _decode_airport,
+    "runways": _decode_runways,
+    "frequencies": _decode_frequencies,
+    "taxi_nodes": _decode_taxi_nodes,
+    "taxi_edges": _decode_taxi_edges,
+    "parking": _decode_parking,
+}
+
+
+def write_cache_sections(path: Path, sections: dict[str, bytes]) -> None:
+    """Write encoded sections to a binary cache file.
+
+    The file is written to a temporary name and moved into place, so
+    readers never see a partial file.
+
+    Args:
+        path: Output path.
+        sections: Encoded section payloads by name (at most 12 ASCII bytes).
+    """
+    offset = _HEADER.size + _TABLE_ENTRY.size * len(sections)
+    table = []
+    for name, payload in sections.items():
+        table.append(_TABLE_ENTRY.pack(name.encode("ascii"), offset, len(payload)))
+        offset += len(payload)
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, len(sections)))
+        f.write(b"".join(table))
+        for payload in sections.values():
+            f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def read_cache_payloads(path: Path, names: list[str] | tuple[str, ...]) -> dict[str, bytes]:
+    """Read selected encoded sections of a binary cache file.
+
+    Only the requested sections are read from disk.
+
+    Args:
+        path: Cache file path.
+        names: Section names.
+
+    Returns:
+        Encoded section payloads by name.
+
+    Raises:
+        ValueError: If the file is not a supported cache file or a section
+            is missing.
+    """
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise ValueError(f"Truncated gateway cache: {path}")
+        magic, version, count = _HEADER.unpack(header)
+        if magic != CACHE_MAGIC or version != CACHE_VERSION:
+            raise ValueError(f"Not a supported gateway cache: {path}")
+
+        table = f.read(_TABLE_ENTRY.size * count)
+        entries = {}
+        for raw_name, offset, length in _TABLE_ENTRY.iter_unpack(table):
+            entries[raw_name.rstrip(b"\0").decode("ascii")] = (offset, length)
+
+        result = {}
+        for name in names:
+            if name not in entries:
+                raise ValueError(f"Unknown gateway cache section: {name}")
+            offset, length = entries[name]
+            f.seek(offset)
+            payload = f.read(length)
+            if len(payload) != length:
+                raise ValueError(f"Truncated gateway cache: {path}")
+            result[name] = payload
+    return result
+
+
+def write_gateway_cache(path: Path, data: GatewayAirportData) -> None:
+    """Write airport data to a binary cache file.
+
+    Args:
+        path: Output path.
+        data: Airport data to save.
+    """
+    write_cache_sections(path, _encode_sections(data))
+
+
+def read_gateway_sections(path: Path, names: list[str] | tuple[str, ...]) -> dict[str, Any]:
+    """Read selected sections of a binary cache file.
+
+    Only the requested sections are read from disk and decoded.
+
+    Args:
+        path: Cache file path.
+        names: Section names (see SECTIONS).
+
+    Returns:
+        Decoded sections by name: "airport" is a GatewayAirportData without
+        collections, "taxi_nodes" a dict by node ID, the others lists.
+
+    Raises:
+        ValueError: If the file is not a supported cache file or a section
+            is unknown.
+    """
+    unknown = [name for name in names if name not in _DECODERS]
+    if unknown:
+        raise ValueError(f"Unknown gateway cache section: {unknown[0]}")
+    payloads = read_cache_payloads(path, names)
+    return {name: _DECODERS[name](payload) for name, payload in payloads.items()}
+
+
+def read_gateway_section(path: Path, name: str) -> Any:
+    """Read one section of a binary cache file.
+
+    Args:
+        path: Cache file path.
+        name: Section name (see SECTIONS).
+
+    Returns:
+        Decoded section (see read_gateway_sections()).
+    """
+    return read_gateway_sections(path, (name,))[name]
+
+
+def read_gateway_cache(path: Path) -> GatewayAirportData:
+    """Read complete airport data from a binary cache file.
+
+    Args:
+        path: Cache file path.
+
+    Returns:
+        Airport data.
+    """
+    sections = read_gateway_sections(path, SECTIONS)
+    data: GatewayAirportData = sections["airport"]
+    data.runways = sections["runways"]
+    data.frequencies = sections["frequencies"]
+    data.taxi_nodes = sections["taxi_nodes"]
+    data.taxi_edges = sections["taxi_edges"]
+    data.parking_positions = sections["parking"]
+    return data
@@ -3,7 +3,10 @@
 Fetches detailed airport data from the X-Plane Scenery Gateway API,
 including taxiway networks, parking positions, and frequencies.
 
-The data is cached locally to avoid repeated API calls.
+The data is cached locally to avoid repeated API calls, in a compact
+binary format (see gateway_cache) whose runway, frequency, taxi network
+and parking sections can be read separately. JSON caches written by
+earlier versions are still read and converted on first use.
 
 Typical usage:
     from airborne.services.atc.gateway_loader import GatewayAirportLoader
@@ -17,6 +20,8 @@ Typical usage:
 import contextlib
 import json
 import logging
+import math
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -196,13 +201,21 @@ class GatewayAirportLoader:
     Fetches detailed airport scenery data including taxiway networks,
     parking positions, and frequencies. Data is cached locally.
 
+    get_runways(), get_frequencies() and get_parking_positions() read only
+    their section of the binary cache when the airport is not loaded yet.
+    prewarm_region() converts JSON caches around a position to the binary
+    format on a background thread.
+
     Examples:
         >>> loader = GatewayAirportLoader()
         >>> data = loader.get_airport("KPAO")
         >>> if data:
         ...     print(f"Nodes: {len(data.taxi_nodes)}, Edges: {len(data.taxi_edges)}")
+        >>> freqs = loader.get_frequencies("KSFO")
     """
 
+    CACHE_SUFFIX = ".gwc"
+
     def __init__(self, cache_dir: str | Path | None = None) -> None:
         """Initialize the Gateway loader.
 
@@ -217,6 +230,7 @@ class GatewayAirportLoader:
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._memory_cache: dict[str, GatewayAirportData] = {}
+        self._section_cache: dict[tuple[str, str], Any] = {}
 
     def get_airport(self, icao: str) -> GatewayAirportData | None:
         """Get airport data, fetching from Gateway if not cached.
@@ -238,15 +252,10 @@ class GatewayAirportLoader:
             return self._memory_cache[icao]
 
         # Check disk cache
-        cache_file = self.cache_dir / f"{icao}.json"
-        if cache_file.exists():
-            try:
-                data = self._load_from_cache(cache_file)
-                if data:
-                    self._memory_cache[icao] = data
-                    return data
-            except Exception as e:
-                logger.warning("Failed to load cached data for %s: %s", icao, e)
+        data = self._load_cached(icao)
+        if data:
+            self._memory_cache[icao] = data
+            return data
 
         # Fetch from Gateway
         if not XPLANE_AIRPORTS_AVAILABLE:
@@ -257,13 +266,139 @@ class GatewayAirportLoader:
             data = self._fetch_from_gateway(icao)
             if data:
                 self._memory_cache[icao] = data
-                self._save_to_cache(cache_file, data)
+                self._save_to_cache(self._binary_cache_file(icao), data)
                 return data
         except Exception as e:
             logger.error("Failed to fetch %s from Gateway: %s", icao, e)
 
         return None
 
+    def get_runways(self, icao: str) -> list[GatewayRunway]:
+        """Get an airport's runways without loading the rest of its data.
+
+        Args:
+            icao: Airport ICAO code.
+
+        Returns:
+            Runways (empty if the airport is not available).
+        """
+        runways: list[GatewayRunway] = self._get_section(icao, "runways", "runways")
+        return runways
+
+    def get_frequencies(self, icao: str) -> list[GatewayFrequency]:
+        """Get an airport's frequencies without loading the rest of its data.
+
+        Args:
+            icao: Airport ICAO code.
+
+        Returns:
+            Frequencies (empty if the airport is not available).
+
+        Examples:
+            >>> for freq in loader.get_frequencies("KPAO"):
+            ...     print(freq.type, freq.frequency_mhz)
+        """
+        frequencies: list[GatewayFrequency] = self._get_section(icao, "frequencies", "frequencies")
+        return frequencies
+
+    def get_parking_positions(self, icao: str) -> list[ParkingPosition]:
+        """Get an airport's parking positions without loading the rest of its data.
+
+        Args:
+            icao: Airport ICAO code.
+
+        Returns:
+            Parking positions (empty if the airport is not available).
+        """
+        parking: list[ParkingPosition] = self._get_section(icao, "parking", "parking_positions")
+        return parking
+
+    def _get_section(self, icao: str, section: str, attribute: str) -> Any:
+        """Get one part of an airport's data, reading only its cache section.
+
+        Args:
+            icao: Airport ICAO code.
+            section: Binary cache section name.
+            attribute: Matching GatewayAirportData attribute.
+
+        Returns:
+            Section data, or an empty list if the airport is not available.
+        """
+        icao = icao.upper()
+
+        if icao in self._memory_cache:
+            return getattr(self._memory_cache[icao], attribute)
+
+        key = (icao, section)
+        if key in self._section_cache:
+            return self._section_cache[key]
+
+        binary_file = self._binary_cache_file(icao)
+        if self._is_binary_current(icao):
+            from airborne.services.atc.gateway_cache import read_gateway_section
+
+            try:
+                value = read_gateway_section(binary_file, section)
+                self._section_cache[key] = value
+                return value
+            except (OSError, ValueError) as e:
+                logger.warning("Failed to read %s section for %s: %s", section, icao, e)
+
+        data = self.get_airport(icao)
+        return getattr(data, attribute) if data else []
+
+    def _binary_cache_file(self, icao: str) -> Path:
+        """Get the binary cache file path of an airport."""
+        return self.cache_dir / f"{icao}{self.CACHE_SUFFIX}"
+
+    def _json_cache_file(self, icao: str) -> Path:
+        """Get the legacy JSON cache file path of an airport."""
+        return self.cache_dir / f"{icao}.json"
+
+    def _is_binary_current(self, icao: str) -> bool:
+        """Check whether the binary cache exists and is not older than the JSON cache."""
+        try:
+            binary_mtime = self._binary_cache_file(icao).stat().st_mtime_ns
+        except OSError:
+            return False
+        try:
+            return binary_mtime >= self._json_cache_file(icao).stat().st_mtime_ns
+        except OSError:
+            return True
+
+    def _load_cached(self, icao: str) -> GatewayAirportData | None:
+        """Load an airport from the disk cache.
+
+        Reads the binary cache when it is current, otherwise the JSON cache,
+        which is then converted to the binary format.
+
+        Args:
+            icao: Airport ICAO code (upper case).
+
+        Returns:
+            Airport data, or None if not cached or unreadable.
+        """
+        from airborne.services.atc.gateway_cache import read_gateway_cache
+
+        binary_file = self._binary_cache_file(icao)
+        if self._is_binary_current(icao):
+            try:
+                return read_gateway_cache(binary_file)
+            except Exception as e:
+                logger.warning("Failed to load cached data for %s: %s", icao, e)
+
+        json_file = self._json_cache_file(icao)
+        if not json_file.exists():
+            return None
+        try:
+            data = self._load_from_cache(json_file)
+        except Exception as e:
+            logger.warning("Failed to load cached data for %s: %s", icao, e)
+            return None
+        if data:
+            self._save_to_cache(binary_file, data)
+        return data
+
     def _fetch_from_gateway(self, icao: str) -> GatewayAirportData | None:
         """Fetch airport data from X-Plane Gateway API.
 
@@ -441,8 +576,6 @@ class GatewayAirportLoader:
             )
 
             # Calculate headings from coordinates
-            import math
-
             dlat = runway.lat2 - runway.lat1
             dlon = runway.lon2 - runway.lon1
             heading = math.degrees(math.atan2(dlon, dlat))
@@ -484,83 +617,21 @@ class GatewayAirportLoader:
             pass
 
     def _save_to_cache(self, cache_file: Path, data: GatewayAirportData) -> None:
-        """Save airport data to cache file.
+        """Save airport data to a binary cache file.
 
         Args:
             cache_file: Path to cache file.
             data: Airport data to save.
         """
-        cache_dict = {
-            "icao": data.icao,
-            "name": data.name,
-            "latitude": data.latitude,
-            "longitude": data.longitude,
-            "elevation_ft": data.elevation_ft,
-            "transition_altitude": data.transition_altitude,
-            "has_atc": data.has_atc,
-            "taxi_nodes": [
-                {
-                    "id": n.id,
-                    "latitude": n.latitude,
-                    "longitude": n.longitude,
-                    "name": n.name,
-                    "is_hold_short": n.is_hold_short,
-                    "on_runway": n.on_runway,
-                }
-                for n in data.taxi_nodes.values()
-            ],
-            "taxi_edges": [
-                {
-                    "node_begin": e.node_begin,
-                    "node_end": e.node_end,
-                    "name": e.name,
-                    "is_runway": e.is_runway,
-                    "one_way": e.one_way,
-                    "width_code": e.width_code,
-                }
-                for e in data.taxi_edges
-            ],
-            "parking_positions": [
-                {
-                    "id": p.id,
-                    "latitude": p.latitude,
-                    "longitude": p.longitude,
-                    "heading": p.heading,
-                    "type": p.type,
-                    "aircraft_types": p.aircraft_types,
-                }
-                for p in data.parking_positions
-            ],
-            "frequencies": [
-                {
-                    "type": f.type,
-                    "frequency_mhz": f.frequency_mhz,
-                    "name": f.name,
-                }
-                for f in data.frequencies
-            ],
-            "runways": [
-                {
-                    "id1": r.id1,
-                    "id2": r.id2,
-                    "width_m": r.width_m,
-                    "lat1": r.lat1,
-                    "lon1": r.lon1,
-                    "lat2": r.lat2,
-                    "lon2": r.lon2,
-                    "heading1": r.heading1,
-                    "heading2": r.heading2,
-                    "surface": r.surface,
-                }
-                for r in data.runways
-            ],
-        }
-
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(cache_dict, f, indent=2)
+        from airborne.services.atc.gateway_cache import write_gateway_cache
+
+        try:
+            write_gateway_cache(cache_file, data)
+        except OSError as e:
+            logger.warning("Failed to write cache for %s: %s", data.icao, e)
 
     def _load_from_cache(self, cache_file: Path) -> GatewayAirportData | None:
-        """Load airport data from cache file.
+        """Load airport data from a legacy JSON cache file.
 
         Args:
             cache_file: Path to cache file.
@@ -657,13 +728,18 @@ class GatewayAirportLoader:
         if icao:
             icao = icao.upper()
             self._memory_cache.pop(icao, None)
-            cache_file = self.cache_dir / f"{icao}.json"
-            if cache_file.exists():
-                cache_file.unlink()
+            self._section_cache = {
+                key: value for key, value in self._section_cache.items() if key[0] != icao
+            }
+            for cache_file in (self._json_cache_file(icao), self._binary_cache_file(icao)):
+                if cache_file.exists():
+                    cache_file.unlink()
         else:
             self._memory_cache.clear()
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
+            self._section_cache.clear()
+            for pattern in ("*.json", f"*{self.CACHE_SUFFIX}"):
+                for cache_file in self.cache_dir.glob(pattern):
+                    cache_file.unlink()
 
     def prefetch_airports(self, icao_list: list[str]) -> int:
         """Prefetch multiple airports in batch.
@@ -683,3 +759,94 @@ class GatewayAirportLoader:
             if self.get_airport(icao):
                 success_count += 1
         return success_count
+
+    def prewarm_region(
+        self, latitude: float, longitude: float, radius_nm: float
+    ) -> threading.Thread:
+        """Convert cached airports around a position to the binary format.
+
+        Runs on a background thread, which only writes cache files; airports
+        already loaded in memory are not touched. Airport positions come
+        from the airport index, or when the airport is not indexed from its
+        JSON cache.
+
+        Args:
+            latitude: Center latitude in degrees.
+            longitude: Center longitude in degrees.
+            radius_nm: Radius in nautical miles.
+
+        Returns:
+            The started worker thread (join() it to wait for completion).
+
+        Examples:
+            >>> loader.prewarm_region(37.46, -122.12, 100.0)
+        """
+        thread = threading.Thread(
+            target=self._prewarm_worker,
+            args=(latitude, longitude, radius_nm),
+            name="gateway-prewarm",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _prewarm_worker(self, latitude: float, longitude: float, radius_nm: float) -> int:
+        """Background thread: convert JSON caches within the radius.
+
+        Args:
+            latitude: Center latitude in degrees.
+            longitude: Center longitude in degrees.
+            radius_nm: Radius in nautical miles.
+
+        Returns:
+            Number of airports converted.
+        """
+        converted = 0
+        for json_file in sorted(self.cache_dir.glob("*.json")):
+            icao = json_file.stem.upper()
+            if self._is_binary_current(icao):
+                continue
+
+            try:
+                position = self._indexed_position(icao)
+                data = None
+                if position is None:
+                    data = self._load_from_cache(json_file)
+                    if data is None:
+                        continue
+                    position = (data.latitude, data.longitude)
+
+                if _distance_nm(latitude, longitude, *position) > radius_nm:
+                    continue
+
+                if data is None:
+                    data = self._load_from_cache(json_file)
+                if data:
+                    self._save_to_cache(self._binary_cache_file(icao), data)
+                    converted += 1
+            except Exception as e:
+                logger.warning("Failed to prewarm %s: %s", icao, e)
+
+        logger.info("Prewarmed %d cached airports within %.0f nm", converted, radius_nm)
+        return converted
+
+    @staticmethod
+    def _indexed_position(icao: str) -> tuple[float, float] | None:
+        """Look up an airport position in the airport index."""
+        from airborne.airports.airport_index import get_airport_index
+
+        airport = get_airport_index().get(icao)
+        if airport is None:
+            return None
+        return airport.latitude, airport.longitude
+
+
+def _distance_nm(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great circle distance between two points in nautical miles."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * 3440.065 * math.asin(math.sqrt(min(a, 1.0)))
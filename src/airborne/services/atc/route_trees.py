@@ -0,0 +1,155 @@
+"""Shortest-path trees for precomputed taxi routes.
+
+A tree holds the shortest paths between a set of root nodes (a runway hold
+point, or the nodes of an apron) and every other node of a taxi network,
+so a route to or from the roots is read by following pointers instead of
+running a search.
+
+Typical usage:
+    tree = ShortestPathTree.build(node_ids, reverse_adjacency, [hold_row], True)
+    path = tree.path(start_node_id)  # start ... hold point
+"""
+
+import heapq
+import math
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+# Per node: (neighbor row, cost) pairs
+Adjacency = Sequence[Sequence[tuple[int, float]]]
+
+
+class ShortestPathTree:
+    """Shortest paths between root nodes and every node of a graph.
+
+    A tree built toward its roots stores each node's next hop toward the
+    nearest root; a tree built from its roots stores each node's
+    predecessor on the path from the nearest root.
+
+    Attributes:
+        roots: Root node IDs.
+        toward_roots: True if paths lead to the roots, False if they start there.
+
+    Examples:
+        >>> adjacency = [[(1, 10.0)], [(0, 10.0), (2, 5.0)], [(1, 5.0)]]
+        >>> tree = ShortestPathTree.build([7, 8, 9], adjacency, [2], True)
+        >>> tree.path(7), tree.cost(7)
+        ([7, 8, 9], 15.0)
+    """
+
+    def __init__(
+        self,
+        node_ids: Sequence[int],
+        rows: dict[int, int],
+        roots: list[int],
+        toward_roots: bool,
+        links: npt.NDArray[np.int32],
+        costs: npt.NDArray[np.float64],
+    ) -> None:
+        """Initialize from built arrays (see build()).
+
+        Args:
+            node_ids: Node ID of each row.
+            rows: Row of each node ID.
+            roots: Root node IDs.
+            toward_roots: Direction of the stored paths.
+            links: Next hop (toward) or predecessor (from) row, -1 at roots.
+            costs: Path cost of each row, inf if unreachable.
+        """
+        self.roots = roots
+        self.toward_roots = toward_roots
+        self._node_ids = node_ids
+        self._rows = rows
+        self._links = links
+        self._costs = costs
+
+    @classmethod
+    def build(
+        cls,
+        node_ids: Sequence[int],
+        adjacency: Adjacency,
+        root_rows: Sequence[int],
+        toward_roots: bool,
+        rows: dict[int, int] | None = None,
+    ) -> "ShortestPathTree":
+        """Run Dijkstra's algorithm outward from the roots.
+
+        Args:
+            node_ids: Node ID of each row.
+            adjacency: Edges to relax outward from the roots, by row. For a
+                tree toward the roots this is the reversed graph: row u lists
+                (v, cost) for every edge v -> u.
+            root_rows: Rows of the root nodes.
+            toward_roots: Whether paths lead to the roots.
+            rows: Row of each node ID (built from node_ids if None).
+
+        Returns:
+            The built tree.
+        """
+        count = len(node_ids)
+        costs = [math.inf] * count
+        links = [-1] * count
+        heap: list[tuple[float, int]] = []
+        for row in root_rows:
+            costs[row] = 0.0
+            heap.append((0.0, row))
+        heapq.heapify(heap)
+
+        while heap:
+            cost, row = heapq.heappop(heap)
+            if cost > costs[row]:
+                continue
+            for neighbor, edge_cost in adjacency[row]:
+                new_cost = cost + edge_cost
+                if new_cost < costs[neighbor]:
+                    costs[neighbor] = new_cost
+                    links[neighbor] = row
+                    heapq.heappush(heap, (new_cost, neighbor))
+
+        if rows is None:
+            rows = {node_id: row for row, node_id in enumerate(node_ids)}
+        return cls(
+            node_ids,
+            rows,
+            [node_ids[row] for row in root_rows],
+            toward_roots,
+            np.array(links, dtype=np.int32),
+            np.array(costs, dtype=np.float64),
+        )
+
+    def cost(self, node_id: int) -> float:
+        """Get the path cost between a node and the nearest root.
+
+        Args:
+            node_id: Node ID.
+
+        Returns:
+            Path cost, or inf if the node is unknown or unreachable.
+        """
+        row = self._rows.get(node_id)
+        return math.inf if row is None else float(self._costs[row])
+
+    def path(self, node_id: int) -> list[int] | None:
+        """Get the shortest path between a node and the nearest root.
+
+        Args:
+            node_id: Node ID.
+
+        Returns:
+            Node IDs from the node to a root (toward_roots) or from a root
+            to the node, or None if unreachable.
+        """
+        row = self._rows.get(node_id)
+        if row is None or self._costs[row] == math.inf:
+            return None
+
+        links = self._links
+        rows = [row]
+        while links[row] >= 0:
+            row = int(links[row])
+            rows.append(row)
+        if not self.toward_roots:
+            rows.reverse()
+        return [self._node_ids[r] for r in rows]
@@ -1,7 +1,8 @@
 """Taxiway graph and A* pathfinding for taxi routing.
 
 Builds a graph from X-Plane Gateway taxi network data and provides
-A* pathfinding to generate realistic taxi routes.
+A* pathfinding to generate realistic taxi routes. Routes to and from
+runway entry points and aprons can be precomputed as shortest-path trees.
 
 Typical usage:
     from airborne.services.atc.taxiway_graph import TaxiwayGraph
@@ -14,14 +15,33 @@ Typical usage:
 import heapq
 import logging
 import math
+import threading
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from airborne.airports.ground_graph import (
+    EDGE_ONE_WAY,
+    EDGE_RUNWAY,
+    NODE_HOLD_SHORT,
+    NODE_PARKING,
+    NODE_RUNWAY,
+    RUNWAY_PENALTY_M,
+    AdjacencyLists,
+    GroundGraph,
+    get_ground_graph,
+)
+from airborne.airports.ground_index import GroundSpatialIndex
+from airborne.services.atc.route_trees import ShortestPathTree
+
 if TYPE_CHECKING:
     from airborne.services.atc.gateway_loader import GatewayAirportData
 
 logger = logging.getLogger(__name__)
 
+# Parking nodes closer than this belong to the same apron
+APRON_CLUSTER_RADIUS_M = 300.0
+
 
 @dataclass
 class GraphNode:
@@ -109,7 +129,21 @@ class TaxiwayGraph:
     """Graph representation of airport taxiway network.
 
     Supports A* pathfinding to find optimal routes between
-    any two points on the taxiway network.
+    any two points on the taxiway network. Nearest-node and
+    nearest-edge queries use a spatial index built with the graph.
+
+    Shortest-path trees toward and from every runway entry node, and
+    toward every apron, can be built in the background with
+    precompute_route_trees(); find_route() then answers routes to or
+    from runways by following the trees. Closing runways rebuilds them.
+
+    Graphs built from Gateway data are views over the airport's shared
+    GroundGraph (see ground_graph), which also provides the spatial index.
+
+    Attributes:
+        nodes: Nodes by ID.
+        edges: Edges in Gateway order (one per taxi segment).
+        ground_graph: Shared array graph this graph was built from, if any.
 
     Examples:
         >>> graph = TaxiwayGraph.from_gateway_data(airport_data)
@@ -121,8 +155,17 @@ class TaxiwayGraph:
         """Initialize empty taxiway graph."""
         self.nodes: dict[int, GraphNode] = {}
         self.edges: list[GraphEdge] = []
+        self.ground_graph: GroundGraph[int] | None = None
         self._runway_nodes: set[int] = set()
         self._hold_short_nodes: dict[int, str] = {}  # node_id -> runway
+        self._spatial_index: GroundSpatialIndex | None = None
+        self._index_node_ids: list[int] = []
+        self._index_edge_count = 0
+        self._parking_nodes: set[int] = set()
+        self._closed_runways: set[str] = set()
+        self._route_trees: dict[tuple[str, int], ShortestPathTree] = {}
+        self._route_tree_lock = threading.Lock()
+        self._route_tree_generation = 0
 
     @classmethod
     def from_gateway_data(cls, data: "GatewayAirportData") -> "TaxiwayGraph":
@@ -138,69 +181,75 @@ class TaxiwayGraph:
             >>> graph = TaxiwayGraph.from_gateway_data(kpao_data)
             >>> print(f"Graph has {len(graph.nodes)} nodes")
         """
+        ground = get_ground_graph(data)
         graph = cls()
+        graph.ground_graph = ground
+        names = ground.names
+        node_ids = ground.node_ids
 
         # Add nodes
-        for node_id, taxi_node in data.taxi_nodes.items():
-            graph_node = GraphNode(
+        for node_id, latitude, longitude, name, flags, runway in zip(
+            node_ids,
+            ground.latitudes.tolist(),
+            ground.longitudes.tolist(),
+            ground.node_name.tolist(),
+            ground.node_flags.tolist(),
+            ground.node_runway.tolist(),
+            strict=True,
+        ):
+            graph.nodes[node_id] = GraphNode(
                 id=node_id,
-                latitude=taxi_node.latitude,
-                longitude=taxi_node.longitude,
-                name=taxi_node.name,
-                is_hold_short=taxi_node.is_hold_short,
-                on_runway=taxi_node.on_runway,
+                latitude=latitude,
+                longitude=longitude,
+                name=names[name],
+                is_hold_short=bool(flags & NODE_HOLD_SHORT),
+                on_runway=names[runway],
             )
-            graph.nodes[node_id] = graph_node
-
-            if taxi_node.is_hold_short:
-                graph._hold_short_nodes[node_id] = taxi_node.on_runway
+            if flags & NODE_HOLD_SHORT:
+                graph._hold_short_nodes[node_id] = names[runway]
+            if flags & NODE_RUNWAY:
+                graph._runway_nodes.add(node_id)
+            if flags & NODE_PARKING:
+                graph._parking_nodes.add(node_id)
 
         # Add edges (bidirectional unless one_way)
-        for taxi_edge in data.taxi_edges:
-            if taxi_edge.node_begin not in graph.nodes:
-                continue
-            if taxi_edge.node_end not in graph.nodes:
-                continue
-
-            # Calculate distance
-            node1 = graph.nodes[taxi_edge.node_begin]
-            node2 = graph.nodes[taxi_edge.node_end]
-            distance = graph._haversine_distance(
-                node1.latitude, node1.longitude, node2.latitude, node2.longitude
-            )
-
-            # Create edge
+        for start, end, distance, name, width, flags in zip(
+            ground.edge_start.tolist(),
+            ground.edge_end.tolist(),
+            ground.edge_length_m.tolist(),
+            ground.edge_name.tolist(),
+            ground.edge_width.tolist(),
+            ground.edge_flags.tolist(),
+            strict=True,
+        ):
             edge = GraphEdge(
-                from_node=taxi_edge.node_begin,
-                to_node=taxi_edge.node_end,
-                name=taxi_edge.name,
+                from_node=node_ids[start],
+                to_node=node_ids[end],
+                name=names[name],
                 distance=distance,
-                is_runway=taxi_edge.is_runway,
-                one_way=taxi_edge.one_way,
-                width_code=taxi_edge.width_code,
+                is_runway=bool(flags & EDGE_RUNWAY),
+                one_way=bool(flags & EDGE_ONE_WAY),
+                width_code=names[width],
             )
             graph.edges.append(edge)
-
-            # Add to neighbor lists
-            node1.neighbors[taxi_edge.node_end] = edge
+            graph.nodes[edge.from_node].neighbors[edge.to_node] = edge
 
             # Add reverse direction if not one-way
-            if not taxi_edge.one_way:
-                reverse_edge = GraphEdge(
-                    from_node=taxi_edge.node_end,
-                    to_node=taxi_edge.node_begin,
-                    name=taxi_edge.name,
+            if not edge.one_way:
+                graph.nodes[edge.to_node].neighbors[edge.from_node] = GraphEdge(
+                    from_node=edge.to_node,
+                    to_node=edge.from_node,
+                    name=edge.name,
                     distance=distance,
-                    is_runway=taxi_edge.is_runway,
+                    is_runway=edge.is_runway,
                     one_way=False,
-                    width_code=taxi_edge.width_code,
+                    width_code=edge.width_code,
                 )
-                node2.neighbors[taxi_edge.node_begin] = reverse_edge
 
-            # Track runway nodes
-            if taxi_edge.is_runway:
-                graph._runway_nodes.add(taxi_edge.node_begin)
-                graph._runway_nodes.add(taxi_edge.node_end)
+        # Share the ground graph's spatial index
+        graph._spatial_index = ground.spatial_index
+        graph._index_node_ids = node_ids
+        graph._index_edge_count = len(graph.edges)
 
         logger.info(
             "Built taxiway graph: %d nodes, %d edges",
@@ -235,6 +284,19 @@ class TaxiwayGraph:
             logger.warning("Invalid start or end node")
             return None
 
+        # Precomputed trees only hold runway-avoiding routes
+        if avoid_runways:
+            trees = self._route_trees
+            tree = trees.get(("to", end_node)) or trees.get(("from", start_node))
+            if tree is not None:
+                path = tree.path(start_node if tree.toward_roots else end_node)
+                if path is None:
+                    logger.warning("No path found from %d to %d", start_node, end_node)
+                    return None
+                return self._path_to_route(path)
+
+        closed_runways = frozenset(self._closed_runways)
+
         # A* algorithm
         # Priority queue: (f_score, counter, node_id)
         counter = 0
@@ -254,12 +316,9 @@ class TaxiwayGraph:
             current_node = self.nodes[current]
 
             for neighbor_id, edge in current_node.neighbors.items():
-                # Calculate cost
-                cost = edge.distance
-
-                # Penalize runway crossings if avoiding
-                if avoid_runways and edge.is_runway:
-                    cost += 1000  # Heavy penalty for runway crossing
+                cost = self._edge_cost(edge, avoid_runways, closed_runways)
+                if cost is None:
+                    continue
 
                 tentative_g = g_score[current] + cost
 
@@ -274,6 +333,152 @@ class TaxiwayGraph:
         logger.warning("No path found from %d to %d", start_node, end_node)
         return None
 
+    def find_route_to_apron(self, start_node: int) -> TaxiRoute | None:
+        """Find the shortest runway-avoiding route to the nearest apron.
+
+        Uses the precomputed apron trees when available, otherwise
+        searches from every apron at once.
+
+        Args:
+            start_node: Starting node ID (e.g., a runway exit).
+
+        Returns:
+            TaxiRoute ending at a parking node, or None if no apron is
+            reachable.
+
+        Examples:
+            >>> route = graph.find_route_to_apron(exit_node)
+        """
+        trees = [tree for key, tree in self._route_trees.items() if key[0] == "apron"]
+        if not trees:
+            clusters = self.apron_clusters()
+            if not clusters:
+                return None
+            node_ids, _, reverse = self._route_adjacency(frozenset(self._closed_runways))
+            rows = {node_id: row for row, node_id in enumerate(node_ids)}
+            roots = [rows[node_id] for cluster in clusters for node_id in cluster]
+            trees = [ShortestPathTree.build(node_ids, reverse, roots, True, rows)]
+
+        best = min(trees, key=lambda tree: tree.cost(start_node))
+        path = best.path(start_node)
+        return self._path_to_route(path) if path is not None else None
+
+    def precompute_route_trees(self, background: bool = True) -> threading.Thread | None:
+        """Build shortest-path trees for runway entry nodes and aprons.
+
+        Builds a tree toward and a tree from every runway entry node, and
+        a tree toward every apron, using runway-avoiding costs and the
+        current runway closures. Trees from an earlier build are dropped
+        immediately; until the new ones are ready find_route() searches.
+
+        Args:
+            background: Build on a worker thread instead of blocking.
+
+        Returns:
+            The started worker thread (join() it to wait), or None when
+            built in the foreground.
+
+        Examples:
+            >>> graph.precompute_route_trees()
+        """
+        with self._route_tree_lock:
+            self._route_tree_generation += 1
+            generation = self._route_tree_generation
+            self._route_trees = {}
+        closed_runways = frozenset(self._closed_runways)
+
+        if not background:
+            self._route_tree_worker(generation, closed_runways)
+            return None
+
+        thread = threading.Thread(
+            target=self._route_tree_worker,
+            args=(generation, closed_runways),
+            name="taxi-route-trees",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    @property
+    def route_trees_ready(self) -> bool:
+        """Whether precomputed route trees are available."""
+        return bool(self._route_trees)
+
+    @property
+    def closed_runways(self) -> frozenset[str]:
+        """Get the closed runway identifiers."""
+        return frozenset(self._closed_runways)
+
+    def set_closed_runways(
+        self, runway_ids: Iterable[str], background: bool = True
+    ) -> threading.Thread | None:
+        """Close runways to taxi traffic.
+
+        Edges of closed runways are never used by routes. Precomputed
+        route trees are rebuilt if they had been requested.
+
+        Args:
+            runway_ids: Closed runway identifiers (e.g., "31" or "13/31");
+                an empty iterable reopens all runways.
+            background: Rebuild route trees on a worker thread.
+
+        Returns:
+            The rebuild worker thread, or None if nothing is rebuilt in the
+            background.
+
+        Examples:
+            >>> graph.set_closed_runways(["13/31"])
+        """
+        closed = set(runway_ids)
+        if closed == self._closed_runways:
+            return None
+
+        self._closed_runways = closed
+        logger.info("Closed runways: %s", ", ".join(sorted(closed)) or "none")
+        if self._route_tree_generation:
+            return self.precompute_route_trees(background)
+        return None
+
+    def runway_access_nodes(self) -> list[int]:
+        """Get the nodes where taxi routes enter runways.
+
+        Returns:
+            Sorted IDs of hold short nodes and of runway nodes joined to a
+            taxiway.
+        """
+        access = set(self._hold_short_nodes)
+        for node_id in self._runway_nodes:
+            if any(not edge.is_runway for edge in self.nodes[node_id].neighbors.values()):
+                access.add(node_id)
+        return sorted(access)
+
+    def apron_clusters(self) -> list[list[int]]:
+        """Group the nodes nearest to parking positions into aprons.
+
+        Returns:
+            Sorted node ID lists, one per apron.
+        """
+        index = self.spatial_index
+        remaining = set(self._parking_nodes)
+        clusters = []
+        while remaining:
+            seed = min(remaining)
+            remaining.discard(seed)
+            cluster = [seed]
+            pending = [seed]
+            while pending:
+                node = self.nodes[pending.pop()]
+                nearby = index.nodes_within(node.latitude, node.longitude, APRON_CLUSTER_RADIUS_M)
+                for row, _ in nearby:
+                    node_id = self._index_node_ids[row]
+                    if node_id in remaining:
+                        remaining.discard(node_id)
+                        cluster.append(node_id)
+                        pending.append(node_id)
+            clusters.append(sorted(cluster))
+        return clusters
+
     def find_nearest_node(self, latitude: float, longitude: float) -> int | None:
         """Find the nearest graph node to a position.
 
@@ -290,16 +495,84 @@ class TaxiwayGraph:
         if not self.nodes:
             return None
 
-        nearest_id = None
-        nearest_dist = float("inf")
+        index = self.spatial_index
+        node_ids = self._index_node_ids
+
+        def distance(i: int) -> float:
+            node = self.nodes[node_ids[i]]
+            return self._haversine_distance(latitude, longitude, node.latitude, node.longitude)
+
+        result = index.nearest_node_by(latitude, longitude, distance)
+        return node_ids[result[0]] if result else None
+
+    def find_nearest_edge(
+        self, latitude: float, longitude: float, max_distance_m: float = math.inf
+    ) -> tuple[GraphEdge, float] | None:
+        """Find the edge whose segment passes nearest to a position.
+
+        Args:
+            latitude: Target latitude.
+            longitude: Target longitude.
+            max_distance_m: Maximum distance in meters.
+
+        Returns:
+            Tuple of (edge, distance in meters), or None if no edge is
+            within max_distance_m.
 
-        for node_id, node in self.nodes.items():
-            dist = self._haversine_distance(latitude, longitude, node.latitude, node.longitude)
-            if dist < nearest_dist:
-                nearest_dist = dist
-                nearest_id = node_id
+        Examples:
+            >>> result = graph.find_nearest_edge(37.461, -122.115, 30.0)
+            >>> if result:
+            ...     print(f"Taxiway {result[0].name}")
+        """
+        if not self.edges:
+            return None
+        result = self.spatial_index.nearest_edge(latitude, longitude, max_distance_m)
+        if result is None:
+            return None
+        return self.edges[result[0]], result[1]
 
-        return nearest_id
+    def find_edges_within(
+        self, latitude: float, longitude: float, radius_m: float
+    ) -> list[tuple[GraphEdge, float]]:
+        """Find edges whose segments pass within a radius of a position.
+
+        Args:
+            latitude: Target latitude.
+            longitude: Target longitude.
+            radius_m: Search radius in meters.
+
+        Returns:
+            List of (edge, distance in meters) sorted by distance.
+        """
+        if not self.edges:
+            return []
+        return [
+            (self.edges[i], distance)
+            for i, distance in self.spatial_index.edges_within(latitude, longitude, radius_m)
+        ]
+
+    @property
+    def spatial_index(self) -> GroundSpatialIndex:
+        """Get the spatial index over nodes and edges.
+
+        Built with the graph and rebuilt if nodes or edges were added
+        since. Edge indices refer to the edges list.
+        """
+        if (
+            self._spatial_index is None
+            or len(self._index_node_ids) != len(self.nodes)
+            or self._index_edge_count != len(self.edges)
+        ):
+            self._index_node_ids = list(self.nodes)
+            self._index_edge_count = len(self.edges)
+            rows = {node_id: row for row, node_id in enumerate(self._index_node_ids)}
+            self._spatial_index = GroundSpatialIndex(
+                [self.nodes[node_id].latitude for node_id in self._index_node_ids],
+                [self.nodes[node_id].longitude for node_id in self._index_node_ids],
+                [rows[edge.from_node] for edge in self.edges],
+                [rows[edge.to_node] for edge in self.edges],
+            )
+        return self._spatial_index
 
     def find_runway_hold_node(self, runway_id: str) -> int | None:
         """Find the hold short node for a runway.
@@ -394,6 +667,96 @@ class TaxiwayGraph:
 
         return names
 
+    def _route_tree_worker(self, generation: int, closed_runways: frozenset[str]) -> bool:
+        """Build route trees and publish them unless a newer build started.
+
+        Args:
+            generation: Build generation when the build was requested.
+            closed_runways: Runway closures to build with.
+
+        Returns:
+            True if the trees were published.
+        """
+        node_ids, forward, reverse = self._route_adjacency(closed_runways)
+        rows = {node_id: row for row, node_id in enumerate(node_ids)}
+
+        trees: dict[tuple[str, int], ShortestPathTree] = {}
+        for node_id in self.runway_access_nodes():
+            root = [rows[node_id]]
+            trees["to", node_id] = ShortestPathTree.build(node_ids, reverse, root, True, rows)
+            trees["from", node_id] = ShortestPathTree.build(node_ids, forward, root, False, rows)
+        for i, cluster in enumerate(self.apron_clusters()):
+            roots = [rows[node_id] for node_id in cluster]
+            trees["apron", i] = ShortestPathTree.build(node_ids, reverse, roots, True, rows)
+
+        with self._route_tree_lock:
+            if generation != self._route_tree_generation:
+                return False
+            self._route_trees = trees
+
+        logger.info("Built %d taxi route trees", len(trees))
+        return True
+
+    def _route_adjacency(
+        self, closed_runways: frozenset[str]
+    ) -> tuple[list[int], AdjacencyLists, AdjacencyLists]:
+        """Build row adjacency lists with runway-avoiding costs.
+
+        Args:
+            closed_runways: Closed runway identifiers.
+
+        Returns:
+            Tuple of (node ID per row, forward adjacency, reverse adjacency).
+        """
+        forward: AdjacencyLists
+        reverse: AdjacencyLists
+        ground = self.ground_graph
+        if (
+            ground is not None
+            and ground.node_count == len(self.nodes)
+            and ground.edge_count == len(self.edges)
+        ):
+            costs = ground.routing_costs(True, closed_runways)
+            forward, reverse = ground.adjacency(costs)
+            return ground.node_ids, forward, reverse
+
+        node_ids = list(self.nodes)
+        rows = {node_id: row for row, node_id in enumerate(node_ids)}
+        forward = [[] for _ in node_ids]
+        reverse = [[] for _ in node_ids]
+        for row, node_id in enumerate(node_ids):
+            for neighbor_id, edge in self.nodes[node_id].neighbors.items():
+                cost = self._edge_cost(edge, True, closed_runways)
+                if cost is None:
+                    continue
+                forward[row].append((rows[neighbor_id], cost))
+                reverse[rows[neighbor_id]].append((row, cost))
+        return node_ids, forward, reverse
+
+    @staticmethod
+    def _edge_cost(
+        edge: GraphEdge, avoid_runways: bool, closed_runways: frozenset[str]
+    ) -> float | None:
+        """Get the routing cost of an edge.
+
+        Args:
+            edge: Edge to traverse.
+            avoid_runways: Whether runway edges are penalized.
+            closed_runways: Closed runway identifiers.
+
+        Returns:
+            Cost in meters, or None if the edge is on a closed runway.
+        """
+        if not edge.is_runway:
+            return edge.distance
+        if closed_runways and (
+            edge.name in closed_runways
+            or any(runway in closed_runways for runway in edge.name.split("/"))
+        ):
+            return None
+        # Heavy penalty for runway crossing
+        return edge.distance + RUNWAY_PENALTY_M if avoid_runways else edge.distance
+
     def _heuristic(self, node_a: int, node_b: int) -> float:
         """Calculate heuristic distance between nodes (straight line).
 
@@ -4,11 +4,20 @@ from airborne.terrain.elevation_service import (
     ElevationCache,
     ElevationQuery,
     ElevationService,
+    ElevationTileCache,
     IElevationProvider,
 )
-from airborne.terrain.osm_provider import FeatureType, GeoFeature, OSMProvider
+from airborne.terrain.msa_grid import MSAGrid
+from airborne.terrain.osm_provider import (
+    FeatureType,
+    GeoFeature,
+    GeoFeatureStore,
+    OSMProvider,
+)
+from airborne.terrain.prefetch import TerrainPrefetcher
 from airborne.terrain.srtm_provider import (
     ConstantElevationProvider,
+    HGTTile,
     SimpleFlatEarthProvider,
     SRTMProvider,
 )
@@ -18,10 +27,15 @@ __all__ = [
     "ElevationCache",
     "ElevationQuery",
     "ElevationService",
+    "ElevationTileCache",
     "FeatureType",
     "GeoFeature",
+    "GeoFeatureStore",
+    "HGTTile",
     "IElevationProvider",
+    "MSAGrid",
     "OSMProvider",
     "SimpleFlatEarthProvider",
     "SRTMProvider",
+    "TerrainPrefetcher",
 ]
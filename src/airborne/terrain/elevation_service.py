@@ -12,10 +12,15 @@ Typical usage:
 """
 
 import logging
+import math
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
+
 from airborne.physics.vectors import Vector3
 
 logger = logging.getLogger(__name__)
@@ -52,8 +57,20 @@ class IElevationProvider(ABC):
         ...         return "my_provider"
         ...     def get_elevation(self, lat: float, lon: float) -> float:
         ...         return 100.0  # meters
+
+    Attributes:
+        supports_block_sampling: True if the provider is cheap to sample on a
+            regular grid (gridded datasets, analytic models). ElevationService
+            caches such providers per block and interpolates inside blocks;
+            other providers are cached per point.
+        sample_spacing_deg: Spacing of the provider's source grid in
+            degrees, or None if it has no native grid. ElevationService
+            samples its blocks at the finest spacing of its providers.
     """
 
+    supports_block_sampling: bool = False
+    sample_spacing_deg: float | None = None
+
     @abstractmethod
     def get_name(self) -> str:
         """Get provider name.
@@ -113,6 +130,43 @@ class IElevationProvider(ABC):
 
         return results
 
+    def get_elevation_array(
+        self, latitudes: npt.ArrayLike, longitudes: npt.ArrayLike
+    ) -> npt.NDArray[np.float64]:
+        """Get elevations for coordinate arrays (vectorized batch query).
+
+        Default implementation calls get_elevation() for each coordinate.
+        Providers backed by gridded data should override this to sample
+        the whole batch with NumPy.
+
+        Args:
+            latitudes: Latitudes in degrees
+            longitudes: Longitudes in degrees (same shape as latitudes)
+
+        Returns:
+            Elevations in meters, same shape as the inputs. Failed queries
+            are NaN, so the elevation service can resolve them from the
+            next provider.
+
+        Examples:
+            >>> lats = np.array([37.7749, 34.0522])
+            >>> lons = np.array([-122.4194, -118.2437])
+            >>> elevations = provider.get_elevation_array(lats, lons)
+        """
+        lats = np.asarray(latitudes, dtype=np.float64)
+        lons = np.asarray(longitudes, dtype=np.float64)
+        result = np.full(lats.shape, np.nan, dtype=np.float64)
+
+        for index in np.ndindex(lats.shape):
+            try:
+                result[index] = self.get_elevation(float(lats[index]), float(lons[index]))
+            except Exception as e:
+                logger.warning(
+                    "Failed to get elevation for (%f, %f): %s", lats[index], lons[index], e
+                )
+
+        return result
+
     def is_available(self) -> bool:
         """Check if provider is available and functional.
 
@@ -126,11 +180,19 @@ class IElevationProvider(ABC):
         return True
 
 
+# Approximate payload size of a point cache entry (lat, lon, elevation as float64)
+_POINT_ENTRY_BYTES = 24
+
+
 class ElevationCache:
     """Cache for elevation queries.
 
     Simple in-memory cache using lat/lon as key. Uses LRU eviction
-    when cache exceeds max size.
+    when cache exceeds max size. Backed by an OrderedDict so lookups,
+    insertions and evictions are all O(1).
+
+    Used for providers that can only answer point queries (e.g., remote
+    APIs). Gridded providers are cached per block by ElevationTileCache.
 
     Examples:
         >>> cache = ElevationCache(max_size=1000)
@@ -148,8 +210,10 @@ class ElevationCache:
         """
         self.max_size = max_size
         self.precision = precision
-        self.cache: dict[tuple[float, float], float] = {}
-        self.access_order: list[tuple[float, float]] = []
+        self.cache: OrderedDict[tuple[float, float], float] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def _make_key(self, latitude: float, longitude: float) -> tuple[float, float]:
         """Create cache key from coordinates.
@@ -175,15 +239,15 @@ class ElevationCache:
         """
         key = self._make_key(latitude, longitude)
 
-        if key in self.cache:
-            # Move to end of access order (LRU)
-            if key in self.access_order:
-                self.access_order.remove(key)
-            self.access_order.append(key)
-
-            return self.cache[key]
+        elevation = self.cache.get(key)
+        if elevation is None:
+            self.misses += 1
+            return None
 
-        return None
+        # Mark as most recently used (LRU)
+        self.cache.move_to_end(key)
+        self.hits += 1
+        return elevation
 
     def set(self, latitude: float, longitude: float, elevation: float) -> None:
         """Cache elevation.
@@ -195,23 +259,18 @@ class ElevationCache:
         """
         key = self._make_key(latitude, longitude)
 
-        # Evict oldest entry if cache is full
-        if len(self.cache) >= self.max_size and key not in self.cache:
-            if self.access_order:
-                oldest_key = self.access_order.pop(0)
-                del self.cache[oldest_key]
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.max_size and self.cache:
+            # Evict least recently used entry
+            self.cache.popitem(last=False)
+            self.evictions += 1
 
         self.cache[key] = elevation
 
-        # Update access order
-        if key in self.access_order:
-            self.access_order.remove(key)
-        self.access_order.append(key)
-
     def clear(self) -> None:
         """Clear all cached elevations."""
         self.cache.clear()
-        self.access_order.clear()
 
     def get_size(self) -> int:
         """Get current cache size.
@@ -221,12 +280,200 @@ class ElevationCache:
         """
         return len(self.cache)
 
+    def get_bytes(self) -> int:
+        """Get approximate size of cached data.
+
+        Returns:
+            Approximate payload size in bytes
+        """
+        return len(self.cache) * _POINT_ENTRY_BYTES
+
+
+class ElevationTileCache:
+    """Block-based elevation cache with interpolation.
+
+    Divides the world into small square blocks and caches a regular grid
+    of elevation samples for each block. The grid is fetched from the
+    provider in one batch query; any point inside a cached block is then
+    answered by bilinear interpolation, so neighboring queries (e.g., an
+    aircraft moving a few meters per frame) all hit the same block.
+
+    The default block is 30 arc-seconds with 10 intervals per side, which
+    matches SRTM3's 3 arc-second sample spacing; set_sample_spacing()
+    refines the grid for finer data (30 intervals for SRTM1).
+
+    Examples:
+        >>> cache = ElevationTileCache(max_blocks=1000)
+        >>> key = cache.block_key(37.7749, -122.4194)
+        >>> lats, lons = cache.block_grid(key)
+        >>> cache.put(key, provider.get_elevation_array(lats, lons))
+        >>> elevation = cache.get(37.7749, -122.4194)
+    """
+
+    def __init__(
+        self,
+        max_blocks: int = 10000,
+        block_size_deg: float = 1.0 / 120.0,
+        block_samples: int = 10,
+    ) -> None:
+        """Initialize block cache.
+
+        Args:
+            max_blocks: Maximum number of cached blocks
+            block_size_deg: Block edge length in degrees
+            block_samples: Grid intervals per block edge
+        """
+        self.max_blocks = max_blocks
+        self.block_size_deg = block_size_deg
+        self.block_samples = block_samples
+        self.blocks: OrderedDict[tuple[int, int], npt.NDArray[np.float32]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Sample offsets within a block (row 0 = southern edge)
+        self._offsets = np.linspace(0.0, block_size_deg, block_samples + 1)
+
+    def set_sample_spacing(self, spacing_deg: float) -> None:
+        """Size the block grid to a source sample spacing.
+
+        Clears the cache if the number of grid intervals changes.
+
+        Args:
+            spacing_deg: Sample spacing of the elevation data in degrees
+        """
+        block_samples = max(1, round(self.block_size_deg / spacing_deg))
+        if block_samples == self.block_samples:
+            return
+
+        self.block_samples = block_samples
+        self._offsets = np.linspace(0.0, self.block_size_deg, block_samples + 1)
+        self.blocks.clear()
+        logger.info("Elevation block grid set to %d intervals per block", block_samples)
+
+    def block_key(self, latitude: float, longitude: float) -> tuple[int, int]:
+        """Get the key of the block containing a coordinate.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+
+        Returns:
+            (row, column) block index
+        """
+        return (
+            math.floor(latitude / self.block_size_deg),
+            math.floor(longitude / self.block_size_deg),
+        )
+
+    def block_grid(
+        self, key: tuple[int, int]
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Get the sample coordinates of a block.
+
+        Args:
+            key: Block index from block_key()
+
+        Returns:
+            (latitudes, longitudes) 2D arrays of shape (samples+1, samples+1)
+        """
+        south = key[0] * self.block_size_deg
+        west = key[1] * self.block_size_deg
+        lats, lons = np.meshgrid(south + self._offsets, west + self._offsets, indexing="ij")
+        return lats, lons
+
+    def get(self, latitude: float, longitude: float) -> float | None:
+        """Get interpolated elevation from a cached block.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+
+        Returns:
+            Elevation in meters, or None if the block is not cached
+        """
+        key = self.block_key(latitude, longitude)
+        if key not in self.blocks:
+            self.misses += 1
+            return None
+
+        self.blocks.move_to_end(key)
+        self.hits += 1
+        return self.interpolate(key, latitude, longitude)
+
+    def interpolate(self, key: tuple[int, int], latitude: float, longitude: float) -> float:
+        """Bilinearly interpolate inside a cached block.
+
+        Does not update LRU order or statistics.
+
+        Args:
+            key: Block index (must be cached)
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+
+        Returns:
+            Elevation in meters
+        """
+        grid = self.blocks[key]
+        scale = self.block_samples / self.block_size_deg
+        row = min(max((latitude - key[0] * self.block_size_deg) * scale, 0.0), self.block_samples)
+        col = min(max((longitude - key[1] * self.block_size_deg) * scale, 0.0), self.block_samples)
+        r0 = min(int(row), self.block_samples - 1)
+        c0 = min(int(col), self.block_samples - 1)
+        fr = row - r0
+        fc = col - c0
+
+        return float(
+            grid[r0, c0] * (1 - fr) * (1 - fc)
+            + grid[r0, c0 + 1] * (1 - fr) * fc
+            + grid[r0 + 1, c0] * fr * (1 - fc)
+            + grid[r0 + 1, c0 + 1] * fr * fc
+        )
+
+    def put(self, key: tuple[int, int], grid: npt.ArrayLike) -> None:
+        """Cache the sample grid of a block.
+
+        Args:
+            key: Block index from block_key()
+            grid: Elevation samples from block_grid() coordinates
+        """
+        if key in self.blocks:
+            self.blocks.move_to_end(key)
+        elif len(self.blocks) >= self.max_blocks and self.blocks:
+            # Evict least recently used block
+            self.blocks.popitem(last=False)
+            self.evictions += 1
+
+        self.blocks[key] = np.asarray(grid, dtype=np.float32)
+
+    def clear(self) -> None:
+        """Clear all cached blocks."""
+        self.blocks.clear()
+
+    def get_size(self) -> int:
+        """Get current cache size.
+
+        Returns:
+            Number of cached blocks
+        """
+        return len(self.blocks)
+
+    def get_bytes(self) -> int:
+        """Get size of cached sample grids.
+
+        Returns:
+            Total size in bytes
+        """
+        return len(self.blocks) * (self.block_samples + 1) ** 2 * 4
+
 
 class ElevationService:
     """Elevation service with provider management and caching.
 
     Manages multiple elevation providers and provides a unified interface
-    for querying elevation data. Includes caching for performance.
+    for querying elevation data. Results from gridded providers are cached
+    per block (ElevationTileCache) so nearby queries are answered by
+    interpolation; point-only providers use the point cache (ElevationCache).
 
     Examples:
         >>> from airborne.terrain.elevation_service import ElevationService
@@ -240,10 +487,13 @@ class ElevationService:
         """Initialize elevation service.
 
         Args:
-            cache_size: Maximum number of cached elevation queries
+            cache_size: Maximum number of cached point queries (and blocks)
         """
         self.providers: list[IElevationProvider] = []
         self.cache = ElevationCache(max_size=cache_size)
+        self.tile_cache = ElevationTileCache(max_blocks=cache_size)
+        self.cache_hits = 0
+        self.cache_misses = 0
         logger.info("ElevationService initialized (cache_size=%d)", cache_size)
 
     def add_provider(self, provider: IElevationProvider) -> None:
@@ -257,6 +507,7 @@ class ElevationService:
             >>> service.add_provider(OpenElevationProvider())
         """
         self.providers.append(provider)
+        self._update_block_grid()
         logger.info("Added elevation provider: %s", provider.get_name())
 
     def remove_provider(self, provider_name: str) -> None:
@@ -266,8 +517,19 @@ class ElevationService:
             provider_name: Name of provider to remove
         """
         self.providers = [p for p in self.providers if p.get_name() != provider_name]
+        self._update_block_grid()
         logger.info("Removed elevation provider: %s", provider_name)
 
+    def _update_block_grid(self) -> None:
+        """Sample blocks at the finest spacing of the gridded providers."""
+        spacings = [
+            p.sample_spacing_deg
+            for p in self.providers
+            if p.supports_block_sampling and p.sample_spacing_deg
+        ]
+        if spacings:
+            self.tile_cache.set_sample_spacing(min(spacings))
+
     def get_elevation(self, latitude: float, longitude: float) -> float:
         """Get elevation at a specific coordinate.
 
@@ -289,9 +551,8 @@ class ElevationService:
             >>> print(f"San Francisco elevation: {elevation:.1f}m")
         """
         # Check cache first
-        cached_elevation = self.cache.get(latitude, longitude)
+        cached_elevation = self._get_cached(latitude, longitude)
         if cached_elevation is not None:
-            logger.debug("Cache hit for (%f, %f): %.1fm", latitude, longitude, cached_elevation)
             return cached_elevation
 
         # No providers available
@@ -304,8 +565,11 @@ class ElevationService:
                 continue
 
             try:
-                elevation = provider.get_elevation(latitude, longitude)
-                self.cache.set(latitude, longitude, elevation)
+                if provider.supports_block_sampling:
+                    elevation = self._load_block(provider, latitude, longitude)
+                else:
+                    elevation = provider.get_elevation(latitude, longitude)
+                    self.cache.set(latitude, longitude, elevation)
                 logger.debug(
                     "Provider %s: (%f, %f) = %.1fm",
                     provider.get_name(),
@@ -327,6 +591,127 @@ class ElevationService:
         # All providers failed
         raise RuntimeError(f"All elevation providers failed for ({latitude}, {longitude})")
 
+    def _get_cached(self, latitude: float, longitude: float) -> float | None:
+        """Look up a coordinate in the block cache, then the point cache.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+
+        Returns:
+            Cached elevation in meters, or None on a miss
+        """
+        elevation = self.tile_cache.get(latitude, longitude)
+        if elevation is None and self.cache.get_size():
+            elevation = self.cache.get(latitude, longitude)
+
+        if elevation is None:
+            self.cache_misses += 1
+        else:
+            self.cache_hits += 1
+        return elevation
+
+    def _load_block(self, provider: IElevationProvider, latitude: float, longitude: float) -> float:
+        """Fetch the block containing a coordinate in one batch query.
+
+        Samples the provider has no data for are resolved from the
+        providers after it (see _resolve_array()).
+
+        Args:
+            provider: Provider supporting block sampling
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+
+        Returns:
+            Interpolated elevation in meters
+
+        Raises:
+            RuntimeError: If some samples of the block are unresolved
+        """
+        key = self.tile_cache.block_key(latitude, longitude)
+        lats, lons = self.tile_cache.block_grid(key)
+        grid = self._resolve_array(self.providers[self.providers.index(provider) :], lats, lons)
+        if np.isnan(grid).any():
+            raise RuntimeError(f"No elevation data for block {key}")
+        self.tile_cache.put(key, grid)
+        return self.tile_cache.interpolate(key, latitude, longitude)
+
+    def _resolve_array(
+        self,
+        providers: list[IElevationProvider],
+        latitudes: npt.NDArray[np.float64],
+        longitudes: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        """Resolve coordinate arrays from providers in order.
+
+        Each provider is only queried for the points still unresolved (NaN)
+        after the providers before it.
+
+        Args:
+            providers: Providers to query, in order
+            latitudes: Latitudes in degrees
+            longitudes: Longitudes in degrees (same shape as latitudes)
+
+        Returns:
+            Elevations in meters, same shape as the inputs (NaN where no
+            provider has data)
+        """
+        result = np.full(latitudes.shape, np.nan, dtype=np.float64)
+        for provider in providers:
+            missing = np.isnan(result)
+            if not missing.any():
+                break
+            if not provider.is_available():
+                continue
+
+            try:
+                result[missing] = provider.get_elevation_array(
+                    latitudes[missing], longitudes[missing]
+                )
+            except Exception as e:
+                logger.warning("Provider %s batch query failed: %s", provider.get_name(), e)
+        return result
+
+    def fetch_blocks(
+        self, keys: list[tuple[int, int]]
+    ) -> dict[tuple[int, int], npt.NDArray[np.float64]]:
+        """Fetch sample grids for several blocks without caching them.
+
+        All blocks are resolved in one batch query against the first
+        available provider that supports block sampling, with samples it
+        has no data for resolved from the providers after it. Does not modify
+        the caches, so it is safe to call from a background thread;
+        insert the results with ``tile_cache.put()`` on the owning thread.
+
+        Args:
+            keys: Block indices from ``tile_cache.block_key()``
+
+        Returns:
+            Dictionary mapping block index to its sample grid (empty if no
+            provider supports block sampling); blocks with unresolved
+            samples are left out
+        """
+        index = next(
+            (
+                i
+                for i, p in enumerate(self.providers)
+                if p.supports_block_sampling and p.is_available()
+            ),
+            None,
+        )
+        if index is None or not keys:
+            return {}
+
+        grids = [self.tile_cache.block_grid(key) for key in keys]
+        elevations = self._resolve_array(
+            self.providers[index:],
+            np.stack([lats for lats, _ in grids]),
+            np.stack([lons for _, lons in grids]),
+        )
+        return {
+            key: elevations[i] for i, key in enumerate(keys) if not np.isnan(elevations[i]).any()
+        }
+
     def get_elevations(self, coordinates: list[tuple[float, float]]) -> list[ElevationQuery]:
         """Get elevations for multiple coordinates.
 
@@ -347,7 +732,7 @@ class ElevationService:
         for lat, lon in coordinates:
             try:
                 # Check cache
-                cached_elevation = self.cache.get(lat, lon)
+                cached_elevation = self._get_cached(lat, lon)
                 if cached_elevation is not None:
                     results.append(
                         ElevationQuery(
@@ -385,6 +770,44 @@ class ElevationService:
 
         return results
 
+    def get_elevation_array(
+        self, latitudes: npt.ArrayLike, longitudes: npt.ArrayLike
+    ) -> npt.NDArray[np.float64]:
+        """Get elevations for coordinate arrays in a single batch.
+
+        Queries the first available provider with the whole batch so that
+        gridded providers (e.g., SRTMProvider) can sample it vectorized;
+        points it has no data for are resolved from the next providers.
+
+        Args:
+            latitudes: Latitudes in degrees
+            longitudes: Longitudes in degrees (same shape as latitudes)
+
+        Returns:
+            Elevations in meters, same shape as the inputs
+
+        Raises:
+            ValueError: If no providers available
+            RuntimeError: If no provider has data for some points
+
+        Examples:
+            >>> lats = np.linspace(37.0, 38.0, 100)
+            >>> lons = np.full(100, -122.0)
+            >>> elevations = service.get_elevation_array(lats, lons)
+        """
+        if not self.providers:
+            raise ValueError("No elevation providers available")
+
+        result = self._resolve_array(
+            self.providers,
+            np.asarray(latitudes, dtype=np.float64),
+            np.asarray(longitudes, dtype=np.float64),
+        )
+        unresolved = int(np.isnan(result).sum())
+        if unresolved:
+            raise RuntimeError(f"All elevation providers failed for {unresolved} batch points")
+        return result
+
     def get_elevation_at_position(self, position: Vector3) -> float:
         """Get elevation at a Vector3 position.
 
@@ -410,21 +833,32 @@ class ElevationService:
             >>> service.clear_cache()
         """
         self.cache.clear()
+        self.tile_cache.clear()
         logger.info("Elevation cache cleared")
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics.
 
         Returns:
-            Dictionary with cache statistics
+            Dictionary with cache statistics (entries, hits, misses,
+            hit rate, evictions and cached bytes)
 
         Examples:
             >>> stats = service.get_cache_stats()
             >>> print(f"Cache size: {stats['size']}/{stats['max_size']}")
+            >>> print(f"Hit rate: {stats['hit_rate']:.1%}")
         """
+        lookups = self.cache_hits + self.cache_misses
         return {
-            "size": self.cache.get_size(),
+            "size": self.cache.get_size() + self.tile_cache.get_size(),
             "max_size": self.cache.max_size,
+            "points": self.cache.get_size(),
+            "blocks": self.tile_cache.get_size(),
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0,
+            "evictions": self.cache.evictions + self.tile_cache.evictions,
+            "bytes": self.cache.get_bytes() + self.tile_cache.get_bytes(),
             "providers": len(self.providers),
             "provider_names": [p.get_name() for p in self.providers],
         }
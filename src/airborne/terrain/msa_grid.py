@@ -0,0 +1,399 @@
+"""Precomputed minimum safe altitude (MSA/MORA) grid.
+
+Reduces an elevation dataset to a regular grid of per-cell maximum
+elevations (e.g., 1°x1° or 0.25°x0.25°), optionally raised by an obstacle
+margin. Once built, minimum safe altitude and MORA (minimum off-route
+altitude) lookups are a single array index instead of terrain queries.
+
+Grids are built offline (see scripts/build_msa_grid.py) and stored as a
+small header followed by raw float32 cells, so they can be opened with
+np.memmap and shared cheaply between ATC vectoring, the flight instructor
+and terrain warnings.
+
+Typical usage:
+    from airborne.terrain.msa_grid import MSAGrid
+
+    grid = MSAGrid.build(elevation_service, cell_size_deg=0.25)
+    grid.save("data/terrain/msa_025.grid")
+
+    grid = MSAGrid.load("data/terrain/msa_025.grid")
+    mora_ft = grid.get_mora_ft(37.7749, -122.4194)
+"""
+
+import logging
+import math
+import struct
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+logger = logging.getLogger(__name__)
+
+# File header: magic, version, cell size, lat/lon origin, rows, cols, obstacle margin
+GRID_MAGIC = b"AMSA"
+GRID_VERSION = 1
+GRID_HEADER = struct.Struct("<4sIdddIIf")
+GRID_HEADER_SIZE = 64
+
+# Cell value for cells without elevation data
+GRID_VOID = np.float32(np.nan)
+
+FEET_PER_METER = 3.28084
+
+
+class MSAGrid:
+    """Grid of per-cell maximum elevations for MSA/MORA lookups.
+
+    Cell (row, col) covers latitudes ``lat_min + row * cell_size_deg`` to
+    ``lat_min + (row + 1) * cell_size_deg`` (row 0 is the southern edge) and
+    the corresponding longitudes from ``lon_min``. Each cell holds the
+    highest elevation found in it in meters MSL, including the obstacle
+    margin applied at build time.
+
+    Examples:
+        >>> grid = MSAGrid.load("data/terrain/msa_1deg.grid")
+        >>> grid.get_max_elevation_m(36.5, -118.3)
+        4421.0
+        >>> grid.get_mora_ft(36.5, -118.3)
+        16600
+    """
+
+    def __init__(
+        self,
+        cells: npt.NDArray[np.float32],
+        cell_size_deg: float,
+        lat_min: float = -90.0,
+        lon_min: float = -180.0,
+        obstacle_margin_m: float = 0.0,
+    ) -> None:
+        """Create a grid from cell values.
+
+        Args:
+            cells: Maximum elevation per cell in meters, shape (rows, cols)
+            cell_size_deg: Cell size in degrees
+            lat_min: Latitude of the southern edge of row 0
+            lon_min: Longitude of the western edge of column 0
+            obstacle_margin_m: Obstacle margin included in the cell values
+        """
+        self.cells = cells
+        self.cell_size_deg = cell_size_deg
+        self.lat_min = lat_min
+        self.lon_min = lon_min
+        self.rows: int = cells.shape[0]
+        self.cols: int = cells.shape[1]
+        self.obstacle_margin_m = obstacle_margin_m
+
+    @property
+    def lat_max(self) -> float:
+        """Latitude of the northern edge of the grid."""
+        return self.lat_min + self.rows * self.cell_size_deg
+
+    @property
+    def lon_max(self) -> float:
+        """Longitude of the eastern edge of the grid."""
+        return self.lon_min + self.cols * self.cell_size_deg
+
+    @classmethod
+    def build(
+        cls,
+        elevation_source: Any,
+        cell_size_deg: float = 1.0,
+        samples_per_cell: int = 8,
+        bounds: tuple[float, float, float, float] = (-90.0, 90.0, -180.0, 180.0),
+        obstacle_margin_m: float = 0.0,
+    ) -> "MSAGrid":
+        """Build a grid by sampling an elevation source.
+
+        Each cell is sampled on a regular (samples_per_cell + 1)^2 lattice
+        including its edges, one band of cells per batch query. The result
+        is only as good as the sampling: use a sample spacing close to the
+        dataset resolution for exact maxima.
+
+        The source must return NaN where it has no data (e.g. SRTMProvider
+        without fallback) rather than a modelled elevation. A cell with any
+        such sample is void, since its maximum would be understated.
+
+        Args:
+            elevation_source: IElevationProvider or ElevationService
+                (anything with get_elevation_array)
+            cell_size_deg: Cell size in degrees
+            samples_per_cell: Samples per cell edge
+            bounds: (lat_min, lat_max, lon_min, lon_max) in degrees
+            obstacle_margin_m: Margin added to every cell for obstacles
+
+        Returns:
+            New MSAGrid
+        """
+        lat_min, lat_max, lon_min, lon_max = bounds
+        rows = int(math.ceil((lat_max - lat_min) / cell_size_deg - 1e-9))
+        cols = int(math.ceil((lon_max - lon_min) / cell_size_deg - 1e-9))
+        step = cell_size_deg / samples_per_cell
+
+        cells = np.empty((rows, cols), dtype=np.float32)
+        lons = np.clip(lon_min + np.arange(cols * samples_per_cell + 1) * step, -180.0, 180.0)
+
+        for row in range(rows):
+            band_lats = lat_min + (row + np.arange(samples_per_cell + 1) / samples_per_cell) * (
+                cell_size_deg
+            )
+            lat_grid, lon_grid = np.meshgrid(np.clip(band_lats, -90.0, 90.0), lons, indexing="ij")
+            elevations = np.asarray(
+                elevation_source.get_elevation_array(lat_grid, lon_grid), dtype=np.float64
+            )
+
+            # Column c covers samples c*s .. c*s + s (shared edges); NaN
+            # samples propagate through max, so cells without full data are void
+            body = elevations[:, :-1].reshape(samples_per_cell + 1, cols, samples_per_cell)
+            edge = elevations[:, samples_per_cell::samples_per_cell]
+            cells[row] = np.maximum(body.max(axis=(0, 2)), edge.max(axis=0))
+
+        cells += np.float32(obstacle_margin_m)
+        logger.info(
+            "Built %dx%d MSA grid (%.3f deg cells, %d samples per cell, %d void cells)",
+            rows,
+            cols,
+            cell_size_deg,
+            (samples_per_cell + 1) ** 2,
+            int(np.isnan(cells).sum()),
+        )
+        return cls(cells, cell_size_deg, lat_min, lon_min, obstacle_margin_m)
+
+    def coarsen(self, factor: int) -> "MSAGrid":
+        """Derive a coarser grid by taking the maximum over blocks of cells.
+
+        For example, a 1° grid from a 0.25° grid with factor=4. Partial
+        blocks at the edges use the cells they have; a block containing a
+        void cell is void, like cells with missing samples in build().
+
+        Args:
+            factor: Number of cells per coarse cell edge
+
+        Returns:
+            New MSAGrid with cell_size_deg * factor cells
+        """
+        rows = -(-self.rows // factor)
+        cols = -(-self.cols // factor)
+        # Padding is -inf so it never wins the maximum; voids (NaN) propagate
+        padded = np.full((rows * factor, cols * factor), -np.inf, dtype=np.float32)
+        padded[: self.rows, : self.cols] = self.cells
+
+        coarse = padded.reshape(rows, factor, cols, factor).max(axis=(1, 3))
+        coarse[np.isneginf(coarse)] = GRID_VOID
+        return MSAGrid(
+            coarse,
+            self.cell_size_deg * factor,
+            self.lat_min,
+            self.lon_min,
+            self.obstacle_margin_m,
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Save the grid in the memory-mappable grid format.
+
+        Args:
+            path: Output file path
+        """
+        header = GRID_HEADER.pack(
+            GRID_MAGIC,
+            GRID_VERSION,
+            self.cell_size_deg,
+            self.lat_min,
+            self.lon_min,
+            self.rows,
+            self.cols,
+            self.obstacle_margin_m,
+        )
+        with open(path, "wb") as f:
+            f.write(header.ljust(GRID_HEADER_SIZE, b"\0"))
+            f.write(np.ascontiguousarray(self.cells, dtype="<f4").tobytes())
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> "MSAGrid":
+        """Load a grid saved with save().
+
+        Args:
+            path: Grid file path
+            mmap: Memory-map the cells instead of reading them into memory
+
+        Returns:
+            Loaded MSAGrid
+
+        Raises:
+            ValueError: If the file is not a valid grid file
+        """
+        with open(path, "rb") as f:
+            header = f.read(GRID_HEADER_SIZE)
+
+        if len(header) < GRID_HEADER.size:
+            raise ValueError(f"Truncated MSA grid file: {path}")
+
+        magic, version, cell_size, lat_min, lon_min, rows, cols, margin = GRID_HEADER.unpack(
+            header[: GRID_HEADER.size]
+        )
+        if magic != GRID_MAGIC or version != GRID_VERSION:
+            raise ValueError(f"Not a supported MSA grid file: {path}")
+
+        expected = GRID_HEADER_SIZE + rows * cols * 4
+        if Path(path).stat().st_size != expected:
+            raise ValueError(f"MSA grid file has wrong size: {path}")
+
+        cells: npt.NDArray[np.float32]
+        if mmap:
+            cells = np.memmap(
+                path, dtype="<f4", mode="r", offset=GRID_HEADER_SIZE, shape=(rows, cols)
+            )
+        else:
+            cells = np.fromfile(path, dtype="<f4", offset=GRID_HEADER_SIZE).reshape(rows, cols)
+
+        logger.info("Loaded %dx%d MSA grid from %s", rows, cols, path)
+        return cls(cells, cell_size, lat_min, lon_min, margin)
+
+    def cell_index(self, latitude: float, longitude: float) -> tuple[int, int] | None:
+        """Get the cell containing a position.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+
+        Returns:
+            (row, col), or None if the position is outside the grid
+        """
+        longitude = (longitude + 180.0) % 360.0 - 180.0
+        row = math.floor((latitude - self.lat_min) / self.cell_size_deg)
+        col = math.floor((longitude - self.lon_min) / self.cell_size_deg)
+
+        # The northern/eastern edges belong to the last cell
+        if row == self.rows and latitude <= self.lat_max + 1e-9:
+            row -= 1
+        if col == self.cols and longitude <= self.lon_max + 1e-9:
+            col -= 1
+
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row, col
+        return None
+
+    def get_max_elevation_m(self, latitude: float, longitude: float) -> float | None:
+        """Get the highest elevation in the cell containing a position.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+
+        Returns:
+            Cell maximum elevation in meters MSL (obstacle margin included),
+            or None if the position is outside the grid or has no data
+        """
+        index = self.cell_index(latitude, longitude)
+        if index is None:
+            return None
+
+        value = float(self.cells[index])
+        return None if math.isnan(value) else value
+
+    def get_max_elevation_array(
+        self, latitudes: npt.ArrayLike, longitudes: npt.ArrayLike
+    ) -> npt.NDArray[np.float64]:
+        """Get cell maximum elevations for many positions.
+
+        Args:
+            latitudes: Latitudes in degrees
+            longitudes: Longitudes in degrees
+
+        Returns:
+            Cell maxima in meters, NaN outside the grid or without data
+        """
+        lats = np.asarray(latitudes, dtype=np.float64)
+        lons = (np.asarray(longitudes, dtype=np.float64) + 180.0) % 360.0 - 180.0
+
+        rows = np.floor((lats - self.lat_min) / self.cell_size_deg).astype(np.int64)
+        cols = np.floor((lons - self.lon_min) / self.cell_size_deg).astype(np.int64)
+        rows = np.where((rows == self.rows) & (lats <= self.lat_max + 1e-9), rows - 1, rows)
+        cols = np.where((cols == self.cols) & (lons <= self.lon_max + 1e-9), cols - 1, cols)
+
+        inside = (rows >= 0) & (rows < self.rows) & (cols >= 0) & (cols < self.cols)
+        result = np.full(lats.shape, np.nan, dtype=np.float64)
+        result[inside] = self.cells[rows[inside], cols[inside]]
+        return result
+
+    def get_max_elevation_near(
+        self, latitude: float, longitude: float, radius_nm: float
+    ) -> float | None:
+        """Get the highest cell maximum within a radius of a position.
+
+        Covers every cell overlapping the bounding box of the circle, which
+        is conservative (suitable for vectoring altitudes).
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            radius_nm: Radius in nautical miles
+
+        Returns:
+            Highest elevation in meters, or None if no cell has data
+        """
+        radius_lat = radius_nm / 60.0
+        radius_lon = radius_lat / max(math.cos(math.radians(min(abs(latitude), 89.0))), 0.01)
+
+        row_min = max(math.floor((latitude - radius_lat - self.lat_min) / self.cell_size_deg), 0)
+        row_max = min(
+            math.floor((latitude + radius_lat - self.lat_min) / self.cell_size_deg), self.rows - 1
+        )
+        col_min = math.floor((longitude - radius_lon - self.lon_min) / self.cell_size_deg)
+        col_max = math.floor((longitude + radius_lon - self.lon_min) / self.cell_size_deg)
+        if row_min > row_max:
+            return None
+
+        cols = np.arange(col_min, col_max + 1)
+        if self.cols * self.cell_size_deg >= 360.0 - 1e-9:
+            cols = np.unique(cols % self.cols)  # Wrap across the antimeridian
+        else:
+            cols = cols[(cols >= 0) & (cols < self.cols)]
+        if not len(cols):
+            return None
+
+        window = self.cells[row_min : row_max + 1][:, cols]
+        if np.isnan(window).all():
+            return None
+        return float(np.nanmax(window))
+
+    def get_msa_m(
+        self, latitude: float, longitude: float, buffer_ft: float = 1000.0
+    ) -> float | None:
+        """Get minimum safe altitude for the cell containing a position.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            buffer_ft: Clearance above the cell maximum (feet)
+
+        Returns:
+            Minimum safe altitude in meters MSL, or None without grid data
+        """
+        max_elevation = self.get_max_elevation_m(latitude, longitude)
+        if max_elevation is None:
+            return None
+        return max_elevation + buffer_ft / FEET_PER_METER
+
+    def get_mora_ft(self, latitude: float, longitude: float) -> int | None:
+        """Get grid minimum off-route altitude (MORA) for a position.
+
+        Uses the Jeppesen convention: 1000 ft above the highest elevation
+        when it is 5000 ft or lower, 2000 ft above otherwise, rounded up to
+        the next 100 ft.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+
+        Returns:
+            MORA in feet MSL, or None without grid data
+        """
+        max_elevation = self.get_max_elevation_m(latitude, longitude)
+        if max_elevation is None:
+            return None
+
+        max_ft = max(max_elevation, 0.0) * FEET_PER_METER
+        clearance_ft = 1000.0 if max_ft <= 5000.0 else 2000.0
+        return int(math.ceil((max_ft + clearance_ft) / 100.0 - 1e-9) * 100)
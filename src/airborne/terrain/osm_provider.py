@@ -3,23 +3,44 @@
 Provides cities, landmarks, regions, countries, oceans, and other geographic
 features for navigation callouts and spatial awareness.
 
+Besides a small built-in dataset, large local datasets (hundreds of thousands
+of populated places, peaks and water bodies) can be loaded from a compact
+columnar ``.npz`` file built from CSV. Features are stored as NumPy columns
+sorted by (type, grid cell), so radius and nearest queries only touch the
+buckets of the requested types and compute distances vectorized.
+
 Typical usage:
     from airborne.terrain.osm_provider import OSMProvider
 
     provider = OSMProvider()
+    provider.load_features("data/terrain/places.csv")
     cities = provider.get_cities_near(position, radius_nm=50)
     for city in cities:
         print(f"{city.name}: {city.population:,} people")
 """
 
+import csv
 import logging
+import math
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
 
 from airborne.physics.vectors import Vector3
 
 logger = logging.getLogger(__name__)
 
+# Earth radius in nautical miles
+EARTH_RADIUS_NM = 3440.065
+
+# Columnar feature file format version
+FEATURE_STORE_VERSION = 1
+
 
 class FeatureType(Enum):
     """Geographic feature types."""
@@ -75,27 +96,658 @@ class GeoFeature:
     metadata: dict[str, str] | None = None
 
 
+# Stable integer code for each feature type (used in columnar files)
+FEATURE_TYPE_CODES: dict[FeatureType, int] = {ft: i for i, ft in enumerate(FeatureType)}
+FEATURE_TYPES_BY_CODE: list[FeatureType] = list(FeatureType)
+
+
+def _encode_strings(values: list[str]) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64]]:
+    """Encode strings as a UTF-8 blob with offsets.
+
+    Args:
+        values: Strings to encode
+
+    Returns:
+        (blob, offsets) where string i is blob[offsets[i]:offsets[i + 1]]
+    """
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(item) for item in encoded])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return blob, offsets
+
+
+def _decode_strings(blob: npt.NDArray[np.uint8], offsets: npt.NDArray[np.int64]) -> list[str]:
+    """Decode a UTF-8 blob with offsets back into strings.
+
+    Args:
+        blob: UTF-8 bytes
+        offsets: String boundaries (length = count + 1)
+
+    Returns:
+        List of decoded strings
+    """
+    data = blob.tobytes()
+    bounds = offsets.tolist()
+    return [data[bounds[i] : bounds[i + 1]].decode("utf-8") for i in range(len(bounds) - 1)]
+
+
+def haversine_nm(
+    lat: float, lon: float, lats: npt.NDArray[np.float64], lons: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Great circle distance from one point to many (vectorized).
+
+    Args:
+        lat: Latitude of the reference point (degrees)
+        lon: Longitude of the reference point (degrees)
+        lats: Latitudes of the other points (degrees)
+        lons: Longitudes of the other points (degrees)
+
+    Returns:
+        Distances in nautical miles
+    """
+    lat1 = math.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlon = np.radians(lons - lon)
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    result: npt.NDArray[np.float64] = 2 * EARTH_RADIUS_NM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+    return result
+
+
+class GeoFeatureStore:
+    """Columnar, spatially bucketed store of geographic features.
+
+    Features are kept as NumPy columns sorted by a bucket key combining the
+    feature type and a lat/lon grid cell. A radius query for a set of types
+    turns into one ``searchsorted`` slice per (type, grid row), followed by a
+    vectorized haversine over the candidates. GeoFeature objects are only
+    created for results.
+
+    Stores are built from GeoFeature objects or a CSV file and saved to /
+    loaded from an uncompressed ``.npz`` file.
+
+    CSV columns: ``name, type, latitude, longitude`` and optionally
+    ``id, population, elevation_m, area_km2, country, region``. ``type`` is
+    a FeatureType value (e.g., "city", "mountain", "lake").
+
+    Examples:
+        >>> store = GeoFeatureStore.from_csv("places.csv")
+        >>> store.save("places.npz")
+        >>> store = GeoFeatureStore.load("places.npz")
+        >>> indices, distances = store.query_radius(37.77, -122.42, 50.0)
+    """
+
+    def __init__(self, columns: dict[str, npt.NDArray[Any]], cell_size_deg: float) -> None:
+        """Create a store from sorted columns.
+
+        Use from_features(), from_csv() or load() instead of calling this
+        directly.
+
+        Args:
+            columns: Column arrays, already sorted by bucket key
+            cell_size_deg: Grid cell size in degrees
+        """
+        self.cell_size_deg = cell_size_deg
+        self.rows = int(math.ceil(180.0 / cell_size_deg))
+        self.cols = int(math.ceil(360.0 / cell_size_deg))
+
+        self.lat: npt.NDArray[np.float64] = columns["lat"]
+        self.lon: npt.NDArray[np.float64] = columns["lon"]
+        self.type_code: npt.NDArray[np.uint8] = columns["type_code"]
+        self.population: npt.NDArray[np.int64] = columns["population"]
+        self.elevation_m: npt.NDArray[np.float32] = columns["elevation_m"]
+        self.area_km2: npt.NDArray[np.float32] = columns["area_km2"]
+        self.country_idx: npt.NDArray[np.int32] = columns["country_idx"]
+        self.region_idx: npt.NDArray[np.int32] = columns["region_idx"]
+        self.bucket: npt.NDArray[np.int64] = columns["bucket"]
+
+        self._name_blob = columns["name_blob"]
+        self._name_offsets = columns["name_offsets"]
+        self._id_blob = columns["id_blob"]
+        self._id_offsets = columns["id_offsets"]
+        self.countries = _decode_strings(columns["country_blob"], columns["country_offsets"])
+        self.regions = _decode_strings(columns["region_blob"], columns["region_offsets"])
+
+        # Original row of each sorted row (set when built from records)
+        self._order: npt.NDArray[np.int64] = np.arange(len(self.lat), dtype=np.int64)
+
+        # Lazily decoded names and materialized features
+        self._names: list[str] | None = None
+        self._feature_cache: dict[int, GeoFeature] = {}
+
+        # Original objects when built from GeoFeatures (keeps identity)
+        self.objects: list[GeoFeature] | None = None
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[dict[str, Any]], cell_size_deg: float = 0.5
+    ) -> "GeoFeatureStore":
+        """Build a store from feature records.
+
+        Args:
+            records: Dicts with keys feature_id, name, feature_type
+                (FeatureType), lat, lon and optionally population,
+                elevation_m, area_km2, country, region
+            cell_size_deg: Grid cell size in degrees
+
+        Returns:
+            New GeoFeatureStore
+        """
+        rows = list(records)
+        count = len(rows)
+
+        lat = np.array([r["lat"] for r in rows], dtype=np.float64)
+        lon = np.array([r["lon"] for r in rows], dtype=np.float64)
+        type_code = np.array([FEATURE_TYPE_CODES[r["feature_type"]] for r in rows], dtype=np.uint8)
+
+        countries: dict[str, int] = {}
+        regions: dict[str, int] = {}
+        country_idx = np.array(
+            [countries.setdefault(r.get("country", ""), len(countries)) for r in rows],
+            dtype=np.int32,
+        )
+        region_idx = np.array(
+            [regions.setdefault(r.get("region", ""), len(regions)) for r in rows],
+            dtype=np.int32,
+        )
+
+        columns: dict[str, npt.NDArray[Any]] = {
+            "lat": lat,
+            "lon": lon,
+            "type_code": type_code,
+            "population": np.array([r.get("population", 0) for r in rows], dtype=np.int64),
+            "elevation_m": np.array([r.get("elevation_m", 0.0) for r in rows], dtype=np.float32),
+            "area_km2": np.array([r.get("area_km2", 0.0) for r in rows], dtype=np.float32),
+            "country_idx": country_idx,
+            "region_idx": region_idx,
+        }
+        names = [r["name"] for r in rows]
+        ids = [r["feature_id"] for r in rows]
+
+        # Sort everything by (type, cell) so each bucket is a contiguous slice
+        bucket = cls._bucket_keys(lat, lon, type_code, cell_size_deg)
+        order = np.argsort(bucket, kind="stable")
+        columns = {key: value[order] for key, value in columns.items()}
+        columns["bucket"] = bucket[order]
+
+        order_list = order.tolist()
+        columns["name_blob"], columns["name_offsets"] = _encode_strings(
+            [names[i] for i in order_list]
+        )
+        columns["id_blob"], columns["id_offsets"] = _encode_strings([ids[i] for i in order_list])
+        columns["country_blob"], columns["country_offsets"] = _encode_strings(list(countries))
+        columns["region_blob"], columns["region_offsets"] = _encode_strings(list(regions))
+
+        store = cls(columns, cell_size_deg)
+        store._order = order
+        logger.debug("Built feature store with %d features", count)
+        return store
+
+    @classmethod
+    def from_features(
+        cls, features: Iterable[GeoFeature], cell_size_deg: float = 0.5
+    ) -> "GeoFeatureStore":
+        """Build a store from GeoFeature objects.
+
+        Results returned by the store are the original objects.
+
+        Args:
+            features: Features to index
+            cell_size_deg: Grid cell size in degrees
+
+        Returns:
+            New GeoFeatureStore
+        """
+        objects = list(features)
+        store = cls.from_records(
+            (
+                {
+                    "feature_id": f.feature_id,
+                    "name": f.name,
+                    "feature_type": f.feature_type,
+                    "lat": f.position.z,
+                    "lon": f.position.x,
+                    "population": f.population,
+                    "elevation_m": f.elevation_m,
+                    "area_km2": f.area_km2,
+                    "country": f.country,
+                    "region": f.region,
+                }
+                for f in objects
+            ),
+            cell_size_deg=cell_size_deg,
+        )
+        store.objects = [objects[i] for i in store._order.tolist()]
+        return store
+
+    @classmethod
+    def from_csv(cls, path: str | Path, cell_size_deg: float = 0.5) -> "GeoFeatureStore":
+        """Build a store from a CSV file.
+
+        Rows with an unknown type or invalid coordinates are skipped.
+
+        Args:
+            path: CSV file path
+            cell_size_deg: Grid cell size in degrees
+
+        Returns:
+            New GeoFeatureStore
+        """
+        path = Path(path)
+        type_values = {ft.value: ft for ft in FeatureType}
+        records = []
+        skipped = 0
+
+        with open(path, encoding="utf-8", newline="") as f:
+            for row_number, row in enumerate(csv.DictReader(f)):
+                feature_type = type_values.get(row.get("type", "").strip().lower())
+                try:
+                    lat = float(row["latitude"])
+                    lon = float(row["longitude"])
+                except (KeyError, TypeError, ValueError):
+                    feature_type = None
+
+                if feature_type is None:
+                    skipped += 1
+                    continue
+
+                records.append(
+                    {
+                        "feature_id": row.get("id") or f"{path.stem}_{row_number}",
+                        "name": row.get("name", ""),
+                        "feature_type": feature_type,
+                        "lat": lat,
+                        "lon": lon,
+                        "population": int(float(row.get("population") or 0)),
+                        "elevation_m": float(row.get("elevation_m") or 0.0),
+                        "area_km2": float(row.get("area_km2") or 0.0),
+                        "country": row.get("country", ""),
+                        "region": row.get("region", ""),
+                    }
+                )
+
+        if skipped:
+            logger.warning("Skipped %d invalid rows in %s", skipped, path)
+        return cls.from_records(records, cell_size_deg=cell_size_deg)
+
+    def save(self, path: str | Path) -> None:
+        """Save the store as an uncompressed columnar .npz file.
+
+        Args:
+            path: Output file path
+        """
+        country_blob, country_offsets = _encode_strings(self.countries)
+        region_blob, region_offsets = _encode_strings(self.regions)
+        np.savez(
+            path,
+            version=np.array(FEATURE_STORE_VERSION),
+            cell_size_deg=np.array(self.cell_size_deg),
+            lat=self.lat,
+            lon=self.lon,
+            type_code=self.type_code,
+            population=self.population,
+            elevation_m=self.elevation_m,
+            area_km2=self.area_km2,
+            country_idx=self.country_idx,
+            region_idx=self.region_idx,
+            bucket=self.bucket,
+            name_blob=self._name_blob,
+            name_offsets=self._name_offsets,
+            id_blob=self._id_blob,
+            id_offsets=self._id_offsets,
+            country_blob=country_blob,
+            country_offsets=country_offsets,
+            region_blob=region_blob,
+            region_offsets=region_offsets,
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "GeoFeatureStore":
+        """Load a store saved with save().
+
+        Args:
+            path: .npz file path
+
+        Returns:
+            Loaded GeoFeatureStore
+
+        Raises:
+            ValueError: If the file version is not supported
+        """
+        with np.load(path) as data:
+            version = int(data["version"])
+            if version != FEATURE_STORE_VERSION:
+                raise ValueError(f"Unsupported feature store version {version} in {path}")
+            columns = {key: data[key] for key in data.files if key != "version"}
+
+        return cls(columns, float(columns.pop("cell_size_deg")))
+
+    def __len__(self) -> int:
+        """Get number of features."""
+        return len(self.lat)
+
+    @staticmethod
+    def _bucket_keys(
+        lat: npt.NDArray[np.float64],
+        lon: npt.NDArray[np.float64],
+        type_code: npt.NDArray[np.uint8],
+        cell_size_deg: float,
+    ) -> npt.NDArray[np.int64]:
+        """Compute (type, row, col) bucket keys.
+
+        Args:
+            lat: Latitudes in degrees
+            lon: Longitudes in degrees
+            type_code: Feature type codes
+            cell_size_deg: Grid cell size in degrees
+
+        Returns:
+            Sortable int64 bucket keys
+        """
+        rows = int(math.ceil(180.0 / cell_size_deg))
+        cols = int(math.ceil(360.0 / cell_size_deg))
+        row = np.clip(np.floor((lat + 90.0) / cell_size_deg), 0, rows - 1).astype(np.int64)
+        col = np.clip(np.floor((lon + 180.0) / cell_size_deg), 0, cols - 1).astype(np.int64)
+        result: npt.NDArray[np.int64] = (type_code.astype(np.int64) * rows + row) * cols + col
+        return result
+
+    def _candidate_slices(
+        self, lat: float, lon: float, radius_nm: float, type_codes: list[int]
+    ) -> list[slice]:
+        """Get the column slices of all buckets that may contain matches.
+
+        Args:
+            lat: Center latitude in degrees
+            lon: Center longitude in degrees
+            radius_nm: Search radius in nautical miles
+            type_codes: Feature type codes to search
+
+        Returns:
+            List of slices into the sorted columns
+        """
+        radius_deg = radius_nm / 60.0
+        row_min = max(int(math.floor((lat - radius_deg + 90.0) / self.cell_size_deg)), 0)
+        row_max = min(
+            int(math.floor((lat + radius_deg + 90.0) / self.cell_size_deg)), self.rows - 1
+        )
+
+        # Longitude half-width grows with latitude; near the poles take all columns
+        max_abs_lat = min(abs(lat) + radius_deg, 90.0)
+        cos_lat = math.cos(math.radians(max_abs_lat))
+        if cos_lat < 1e-6 or radius_deg / cos_lat >= 180.0:
+            col_ranges = [(0, self.cols - 1)]
+        else:
+            half_width = radius_deg / cos_lat
+            col_min = int(math.floor((lon - half_width + 180.0) / self.cell_size_deg))
+            col_max = int(math.floor((lon + half_width + 180.0) / self.cell_size_deg))
+            if col_min < 0:
+                col_ranges = [(0, col_max), (col_min + self.cols, self.cols - 1)]
+            elif col_max >= self.cols:
+                col_ranges = [(col_min, self.cols - 1), (0, col_max - self.cols)]
+            else:
+                col_ranges = [(col_min, col_max)]
+
+        starts = []
+        ends = []
+        for code in type_codes:
+            for row in range(row_min, row_max + 1):
+                base = (code * self.rows + row) * self.cols
+                for col_min, col_max in col_ranges:
+                    starts.append(base + col_min)
+                    ends.append(base + col_max + 1)
+
+        lo = np.searchsorted(self.bucket, starts, side="left")
+        hi = np.searchsorted(self.bucket, ends, side="left")
+        return [slice(a, b) for a, b in zip(lo.tolist(), hi.tolist(), strict=True) if b > a]
+
+    def query_radius(
+        self,
+        lat: float,
+        lon: float,
+        radius_nm: float,
+        feature_types: Iterable[FeatureType] | None = None,
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]]:
+        """Find features within a radius.
+
+        Args:
+            lat: Center latitude in degrees
+            lon: Center longitude in degrees
+            radius_nm: Search radius in nautical miles
+            feature_types: Types to include (None = all types)
+
+        Returns:
+            (indices, distances_nm) sorted by distance
+        """
+        codes = (
+            [FEATURE_TYPE_CODES[ft] for ft in feature_types]
+            if feature_types
+            else list(range(len(FEATURE_TYPES_BY_CODE)))
+        )
+        slices = self._candidate_slices(lat, lon, radius_nm, codes)
+        if not slices:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        candidates = np.concatenate([np.arange(s.start, s.stop) for s in slices])
+        distances = haversine_nm(lat, lon, self.lat[candidates], self.lon[candidates])
+
+        within = distances <= radius_nm
+        candidates = candidates[within]
+        distances = distances[within]
+        order = np.argsort(distances, kind="stable")
+        return candidates[order], distances[order]
+
+    def query_nearest(
+        self,
+        lat: float,
+        lon: float,
+        feature_types: Iterable[FeatureType] | None = None,
+        max_distance_nm: float = 1000.0,
+    ) -> tuple[int | None, float]:
+        """Find the nearest feature using expanding search radii.
+
+        Args:
+            lat: Center latitude in degrees
+            lon: Center longitude in degrees
+            feature_types: Types to include (None = all types)
+            max_distance_nm: Maximum search distance
+
+        Returns:
+            (index, distance_nm), or (None, inf) if nothing is in range
+        """
+        types = list(feature_types) if feature_types else None
+        radius = min(self.cell_size_deg * 60.0, max_distance_nm)
+
+        while True:
+            indices, distances = self.query_radius(lat, lon, radius, types)
+            if len(indices):
+                return int(indices[0]), float(distances[0])
+            if radius >= max_distance_nm:
+                return None, float("inf")
+            radius = min(radius * 4.0, max_distance_nm)
+
+    def name(self, index: int) -> str:
+        """Get the name of a feature.
+
+        Args:
+            index: Feature index
+
+        Returns:
+            Feature name
+        """
+        if self._names is not None:
+            return self._names[index]
+        start, end = self._name_offsets[index], self._name_offsets[index + 1]
+        return self._name_blob[start:end].tobytes().decode("utf-8")
+
+    def names(self) -> list[str]:
+        """Get all feature names (decoded once, then cached).
+
+        Returns:
+            Names in store order
+        """
+        if self._names is None:
+            self._names = _decode_strings(self._name_blob, self._name_offsets)
+        return self._names
+
+    def feature(self, index: int) -> GeoFeature:
+        """Get (or lazily create) the GeoFeature at an index.
+
+        Args:
+            index: Feature index
+
+        Returns:
+            GeoFeature for that row
+        """
+        if self.objects is not None:
+            return self.objects[index]
+
+        feature = self._feature_cache.get(index)
+        if feature is None:
+            start, end = self._id_offsets[index], self._id_offsets[index + 1]
+            feature = GeoFeature(
+                feature_id=self._id_blob[start:end].tobytes().decode("utf-8"),
+                name=self.name(index),
+                feature_type=FEATURE_TYPES_BY_CODE[int(self.type_code[index])],
+                position=Vector3(
+                    float(self.lon[index]), float(self.elevation_m[index]), float(self.lat[index])
+                ),
+                population=int(self.population[index]),
+                elevation_m=float(self.elevation_m[index]),
+                area_km2=float(self.area_km2[index]),
+                country=self.countries[int(self.country_idx[index])],
+                region=self.regions[int(self.region_idx[index])],
+            )
+            self._feature_cache[index] = feature
+        return feature
+
+    def indices_of_type(self, feature_type: FeatureType) -> npt.NDArray[np.int64]:
+        """Get the indices of all features of one type.
+
+        Args:
+            feature_type: Feature type
+
+        Returns:
+            Contiguous index range for that type partition
+        """
+        code = FEATURE_TYPE_CODES[feature_type]
+        span = self.rows * self.cols
+        lo, hi = np.searchsorted(self.bucket, [code * span, (code + 1) * span])
+        return np.arange(lo, hi, dtype=np.int64)
+
+    def indices_in_country(self, country: str) -> npt.NDArray[np.int64]:
+        """Get the indices of all features in a country (case-insensitive).
+
+        Args:
+            country: Country name
+
+        Returns:
+            Matching indices
+        """
+        wanted = [i for i, name in enumerate(self.countries) if name.lower() == country.lower()]
+        return np.flatnonzero(np.isin(self.country_idx, wanted)).astype(np.int64)
+
+
 class OSMProvider:
     """OpenStreetMap geographic features provider.
 
     Provides access to cities, landmarks, regions, countries, oceans,
     and other geographic features for navigation and callouts.
 
-    This is a simplified implementation with built-in data.
-    For production use, integrate with Overpass API or offline OSM data.
+    A small set of built-in features is always available. Larger offline
+    datasets (e.g., extracted from OSM/GeoNames) are added with
+    load_features(), from CSV or from a prebuilt columnar .npz file. All
+    spatial queries go through GeoFeatureStore buckets instead of scanning
+    every feature.
 
     Examples:
         >>> provider = OSMProvider()
+        >>> provider.load_features("data/terrain/places.csv")
         >>> cities = provider.get_cities_near(Vector3(-122.4194, 0, 37.7749), radius_nm=50)
         >>> for city in cities:
         ...     print(f"{city.name}: {city.population:,} people")
     """
 
-    def __init__(self) -> None:
-        """Initialize OSM provider with built-in features."""
+    def __init__(self, feature_files: list[str | Path] | None = None) -> None:
+        """Initialize OSM provider with built-in features.
+
+        Args:
+            feature_files: Optional feature datasets (.csv or .npz) to load
+        """
         self.features: dict[str, GeoFeature] = {}
+        self.stores: list[GeoFeatureStore] = []
+        self._builtin_store: GeoFeatureStore | None = None
         self._load_builtin_features()
-        logger.info("OSMProvider initialized with %d features", len(self.features))
+
+        for path in feature_files or []:
+            self.load_features(path)
+
+        logger.info("OSMProvider initialized with %d features", self.get_feature_count())
+
+    def load_features(self, path: str | Path) -> int:
+        """Load a feature dataset.
+
+        A CSV file is converted once to a columnar .npz file next to it;
+        later loads read the .npz directly unless the CSV is newer.
+
+        Args:
+            path: Dataset path (.csv or .npz)
+
+        Returns:
+            Number of features loaded
+
+        Raises:
+            FileNotFoundError: If the dataset does not exist
+
+        Examples:
+            >>> provider.load_features("data/terrain/places.csv")
+            250000
+        """
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Feature dataset not found: {path}")
+
+        if path.suffix.lower() == ".npz":
+            store = GeoFeatureStore.load(path)
+        else:
+            store = self._load_csv_cached(path)
+
+        self.stores.append(store)
+        logger.info("Loaded %d features from %s", len(store), path)
+        return len(store)
+
+    def _load_csv_cached(self, path: Path) -> GeoFeatureStore:
+        """Load a CSV dataset through its .npz cache.
+
+        Args:
+            path: CSV file path
+
+        Returns:
+            Feature store (from the cache if it is up to date)
+        """
+        cache_path = path.with_suffix(".npz")
+        if cache_path.exists() and cache_path.stat().st_mtime >= path.stat().st_mtime:
+            try:
+                return GeoFeatureStore.load(cache_path)
+            except (OSError, KeyError, ValueError) as e:
+                logger.warning("Ignoring invalid feature cache %s: %s", cache_path, e)
+
+        store = GeoFeatureStore.from_csv(path)
+        try:
+            store.save(cache_path)
+        except OSError as e:
+            logger.warning("Could not write feature cache %s: %s", cache_path, e)
+        return store
+
+    def _get_stores(self) -> list[GeoFeatureStore]:
+        """Get all feature stores, rebuilding the built-in store if needed.
+
+        Returns:
+            Built-in store followed by loaded stores
+        """
+        if self._builtin_store is None:
+            self._builtin_store = GeoFeatureStore.from_features(self.features.values())
+        return [self._builtin_store, *self.stores]
 
     def _load_builtin_features(self) -> None:
         """Load built-in geographic features.
@@ -389,6 +1041,7 @@ class OSMProvider:
             metadata=metadata,
         )
         self.features[feature_id] = feature
+        self._builtin_store = None
 
     def get_features_near(
         self,
@@ -413,20 +1066,18 @@ class OSMProvider:
             ...     feature_types=[FeatureType.CITY, FeatureType.LANDMARK]
             ... )
         """
-        nearby_features = []
-
-        for feature in self.features.values():
-            # Filter by type
-            if feature_types and feature.feature_type not in feature_types:
-                continue
-
-            # Calculate distance
-            distance_nm = self._calculate_distance_nm(position, feature.position)
-
-            if distance_nm <= radius_nm:
-                nearby_features.append((distance_nm, feature))
-
-        # Sort by distance
+        nearby_features: list[tuple[float, GeoFeature]] = []
+
+        for store in self._get_stores():
+            indices, distances = store.query_radius(
+                position.z, position.x, radius_nm, feature_types
+            )
+            nearby_features.extend(
+                (distance, store.feature(index))
+                for index, distance in zip(indices.tolist(), distances.tolist(), strict=True)
+            )
+
+        # Sort by distance (each store's results are already sorted runs)
         nearby_features.sort(key=lambda x: x[0])
 
         return [feature for _, feature in nearby_features]
@@ -560,6 +1211,11 @@ class OSMProvider:
                 if feature.name == name:
                     return feature
 
+        for store in self.stores:
+            for index, feature_name in enumerate(store.names()):
+                if (name_lower in feature_name.lower()) if fuzzy else (feature_name == name):
+                    return store.feature(index)
+
         return None
 
     def get_closest_feature(
@@ -587,17 +1243,13 @@ class OSMProvider:
         closest_feature = None
         closest_distance = float("inf")
 
-        for feature in self.features.values():
-            # Filter by type
-            if feature_types and feature.feature_type not in feature_types:
-                continue
-
-            # Calculate distance
-            distance_nm = self._calculate_distance_nm(position, feature.position)
-
-            if distance_nm < closest_distance and distance_nm <= max_distance_nm:
+        for store in self._get_stores():
+            index, distance_nm = store.query_nearest(
+                position.z, position.x, feature_types, max_distance_nm
+            )
+            if index is not None and distance_nm < closest_distance:
                 closest_distance = distance_nm
-                closest_feature = feature
+                closest_feature = store.feature(index)
 
         return closest_feature, closest_distance
 
@@ -640,7 +1292,7 @@ class OSMProvider:
             >>> count = provider.get_feature_count()
             >>> print(f"Loaded {count} features")
         """
-        return len(self.features)
+        return len(self.features) + sum(len(store) for store in self.stores)
 
     def get_features_by_country(self, country: str) -> list[GeoFeature]:
         """Get all features in a country.
@@ -654,7 +1306,10 @@ class OSMProvider:
         Examples:
             >>> features = provider.get_features_by_country("United States")
         """
-        return [f for f in self.features.values() if f.country.lower() == country.lower()]
+        features = [f for f in self.features.values() if f.country.lower() == country.lower()]
+        for store in self.stores:
+            features.extend(store.feature(i) for i in store.indices_in_country(country).tolist())
+        return features
 
     def get_features_by_type(self, feature_type: FeatureType) -> list[GeoFeature]:
         """Get all features of a specific type.
@@ -669,4 +1324,7 @@ class OSMProvider:
             >>> cities = provider.get_features_by_type(FeatureType.CITY)
             >>> oceans = provider.get_features_by_type(FeatureType.OCEAN)
         """
-        return [f for f in self.features.values() if f.feature_type == feature_type]
+        features = [f for f in self.features.values() if f.feature_type == feature_type]
+        for store in self.stores:
+            features.extend(store.feature(i) for i in store.indices_of_type(feature_type).tolist())
+        return features
@@ -0,0 +1,296 @@
+"""Predictive terrain block prefetching.
+
+Loads the elevation blocks the aircraft is about to fly over on a
+background thread, so the game thread's elevation queries are answered
+from ElevationService's block cache instead of hitting the provider (and
+the disk, for SRTM tiles) when the aircraft crosses into a new cell.
+
+The game thread feeds the current position, track and groundspeed to
+update() and calls drain() once per frame to move finished blocks into
+the cache. The worker thread never touches the cache itself.
+
+Typical usage:
+    from airborne.terrain.prefetch import TerrainPrefetcher
+
+    prefetcher = TerrainPrefetcher(elevation_service, horizon_s=300.0)
+    prefetcher.start()
+
+    # Every frame
+    prefetcher.update(latitude, longitude, track_deg, groundspeed_mps)
+    prefetcher.drain()
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from airborne.terrain.elevation_service import ElevationService
+
+logger = logging.getLogger(__name__)
+
+# Approximate meters per degree of latitude
+METERS_PER_DEG_LAT = 110574.0
+
+# Meters per degree of longitude at the equator
+METERS_PER_DEG_LON = 111320.0
+
+
+class TerrainPrefetcher:
+    """Background prefetcher for elevation blocks along the predicted path.
+
+    The predicted path is a straight line along the current track out to
+    ``horizon_s`` seconds at the current groundspeed, widened by a lateral
+    corridor. Blocks on it are requested nearest-first; a new plan replaces
+    the previous one whenever the aircraft enters a new block or turns, so
+    stale requests are dropped instead of queued.
+
+    The number of prefetched blocks is bounded by ``memory_budget_mb``.
+
+    Examples:
+        >>> prefetcher = TerrainPrefetcher(service, horizon_s=180.0)
+        >>> prefetcher.start()
+        >>> prefetcher.update(45.0, 5.0, track_deg=90.0, groundspeed_mps=60.0)
+        >>> prefetcher.drain()
+        >>> print(prefetcher.get_stats()["hit_rate"])
+    """
+
+    def __init__(
+        self,
+        elevation_service: ElevationService,
+        horizon_s: float = 300.0,
+        corridor_half_width_m: float = 2000.0,
+        memory_budget_mb: float = 8.0,
+        batch_size: int = 16,
+        replan_track_change_deg: float = 15.0,
+    ) -> None:
+        """Initialize terrain prefetcher.
+
+        Args:
+            elevation_service: Service whose block cache is filled
+            horizon_s: How far ahead to prefetch (seconds of flight)
+            corridor_half_width_m: Lateral half-width of the prefetch corridor
+            memory_budget_mb: Memory budget for prefetched blocks (megabytes)
+            batch_size: Blocks fetched per provider batch query
+            replan_track_change_deg: Track change that triggers a new plan
+        """
+        self.elevation_service = elevation_service
+        self.horizon_s = horizon_s
+        self.corridor_half_width_m = corridor_half_width_m
+        self.batch_size = batch_size
+        self.replan_track_change_deg = replan_track_change_deg
+
+        tile_cache = elevation_service.tile_cache
+        block_bytes = (tile_cache.block_samples + 1) ** 2 * 4
+        self.max_blocks = max(1, int(memory_budget_mb * 1024 * 1024 / block_bytes))
+
+        # Pending requests (replaced by each plan) and finished blocks
+        self._plan: deque[tuple[int, int]] = deque()
+        self._ready: deque[tuple[tuple[int, int], npt.NDArray[np.float64]]] = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._busy = False
+        self._running = False
+        self._thread: threading.Thread | None = None
+
+        # Blocks delivered by the prefetcher, bounded by the memory budget
+        self._prefetched: OrderedDict[tuple[int, int], None] = OrderedDict()
+
+        self._current_block: tuple[int, int] | None = None
+        self._planned_track: float | None = None
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.blocks_fetched = 0
+
+    def start(self) -> None:
+        """Start the background worker thread."""
+        if self._running:
+            return
+
+        self._running = True
+        self._thread = threading.Thread(target=self._worker_loop, daemon=True)
+        self._thread.start()
+        logger.info("Terrain prefetcher started (max_blocks=%d)", self.max_blocks)
+
+    def stop(self) -> None:
+        """Stop the background worker thread."""
+        self._running = False
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        logger.info("Terrain prefetcher stopped")
+
+    def update(
+        self, latitude: float, longitude: float, track_deg: float, groundspeed_mps: float
+    ) -> None:
+        """Update the predicted path (game thread).
+
+        Cheap unless the aircraft has entered a new block or turned, in
+        which case a new prefetch plan is computed.
+
+        Args:
+            latitude: Aircraft latitude in degrees
+            longitude: Aircraft longitude in degrees
+            track_deg: Ground track in degrees true
+            groundspeed_mps: Groundspeed in m/s
+        """
+        tile_cache = self.elevation_service.tile_cache
+        block = tile_cache.block_key(latitude, longitude)
+
+        entered_block = block != self._current_block
+        if entered_block:
+            if self._current_block is not None:
+                # Crossing into a new block: was it ready before we got here?
+                if block in self._prefetched or block in tile_cache.blocks:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            self._current_block = block
+
+        turned = self._planned_track is None or (
+            abs((track_deg - self._planned_track + 180.0) % 360.0 - 180.0)
+            > self.replan_track_change_deg
+        )
+        if entered_block or turned:
+            self._planned_track = track_deg
+            self._replan(latitude, longitude, track_deg, groundspeed_mps)
+
+    def _replan(
+        self, latitude: float, longitude: float, track_deg: float, groundspeed_mps: float
+    ) -> None:
+        """Compute the blocks along the predicted corridor and queue them.
+
+        Args:
+            latitude: Aircraft latitude in degrees
+            longitude: Aircraft longitude in degrees
+            track_deg: Ground track in degrees true
+            groundspeed_mps: Groundspeed in m/s
+        """
+        tile_cache = self.elevation_service.tile_cache
+        block_m = tile_cache.block_size_deg * METERS_PER_DEG_LAT
+
+        # Sample the corridor at half-block spacing so no block is skipped
+        distance = max(groundspeed_mps, 0.0) * self.horizon_s
+        along = np.arange(0.0, distance + block_m, block_m / 2)
+        across = np.arange(
+            -self.corridor_half_width_m, self.corridor_half_width_m + block_m / 2, block_m / 2
+        )
+
+        track = math.radians(track_deg)
+        north = along[:, np.newaxis] * math.cos(track) - across[np.newaxis, :] * math.sin(track)
+        east = along[:, np.newaxis] * math.sin(track) + across[np.newaxis, :] * math.cos(track)
+
+        meters_per_deg_lon = METERS_PER_DEG_LON * max(math.cos(math.radians(latitude)), 0.01)
+        rows = np.floor((latitude + north / METERS_PER_DEG_LAT) / tile_cache.block_size_deg)
+        cols = np.floor((longitude + east / meters_per_deg_lon) / tile_cache.block_size_deg)
+
+        # Unique blocks, nearest first (samples are ordered by along-track distance)
+        plan: list[tuple[int, int]] = []
+        seen: set[tuple[int, int]] = set()
+        for row, col in zip(rows.ravel().tolist(), cols.ravel().tolist(), strict=True):
+            key = (int(row), int(col))
+            if key in seen:
+                continue
+            seen.add(key)
+            if key not in tile_cache.blocks:
+                plan.append(key)
+            if len(seen) >= self.max_blocks:
+                break
+
+        with self._lock:
+            self._plan = deque(plan)
+        if plan:
+            self._wakeup.set()
+
+    def drain(self) -> int:
+        """Move finished blocks into the elevation cache (game thread).
+
+        Returns:
+            Number of blocks inserted
+        """
+        tile_cache = self.elevation_service.tile_cache
+        inserted = 0
+
+        while self._ready:
+            key, grid = self._ready.popleft()
+            self._prefetched[key] = None
+            self._prefetched.move_to_end(key)
+            if len(self._prefetched) > self.max_blocks:
+                self._prefetched.popitem(last=False)
+
+            if key not in tile_cache.blocks:
+                tile_cache.put(key, grid)
+                inserted += 1
+
+        return inserted
+
+    def wait_idle(self, timeout: float = 5.0) -> bool:
+        """Wait until all queued requests have been fetched.
+
+        Args:
+            timeout: Maximum time to wait (seconds)
+
+        Returns:
+            True if the worker is idle, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                if not self._plan and not self._busy:
+                    return True
+            time.sleep(0.005)
+        return False
+
+    def _worker_loop(self) -> None:
+        """Background thread: fetch queued blocks in batches."""
+        while self._running:
+            self._wakeup.wait(timeout=0.5)
+
+            while self._running:
+                with self._lock:
+                    batch = [
+                        self._plan.popleft() for _ in range(min(self.batch_size, len(self._plan)))
+                    ]
+                    self._busy = bool(batch)
+                    if not batch:
+                        self._wakeup.clear()
+                        break
+
+                try:
+                    grids = self.elevation_service.fetch_blocks(batch)
+                    self._ready.extend(grids.items())
+                    self.blocks_fetched += len(grids)
+                except Exception as e:
+                    logger.warning("Terrain prefetch failed: %s", e)
+                finally:
+                    with self._lock:
+                        self._busy = False
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get prefetch statistics.
+
+        Returns:
+            Dictionary with hits/misses when crossing into new blocks,
+            hit rate, blocks fetched, pending requests and memory use
+        """
+        crossings = self.hits + self.misses
+        block_bytes = (self.elevation_service.tile_cache.block_samples + 1) ** 2 * 4
+        with self._lock:
+            pending = len(self._plan)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / crossings if crossings else 0.0,
+            "blocks_fetched": self.blocks_fetched,
+            "pending": pending,
+            "prefetched_bytes": len(self._prefetched) * block_bytes,
+            "max_blocks": self.max_blocks,
+        }
@@ -1,25 +1,157 @@
 """SRTM elevation provider for terrain queries.
 
 Provides elevation data from SRTM (Shuttle Radar Topography Mission) dataset.
-Supports local tile caching and simple flat-earth fallback for testing.
+Reads local ``.hgt`` tiles (SRTM1 or SRTM3) through ``numpy.memmap`` so tile
+data is paged in by the OS on demand instead of being copied into Python
+objects. Falls back to a simple flat-earth model where no tile is available.
 
 Typical usage:
     from airborne.terrain.srtm_provider import SRTMProvider
 
-    provider = SRTMProvider(cache_dir="data/terrain/cache")
+    provider = SRTMProvider(cache_dir="data/terrain/srtm")
     elevation = provider.get_elevation(37.7749, -122.4194)
     print(f"Elevation: {elevation:.1f}m")
 """
 
 import logging
 import math
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
+import numpy as np
+import numpy.typing as npt
+
 from airborne.terrain.elevation_service import IElevationProvider
 
 logger = logging.getLogger(__name__)
 
 
+# Samples per side for the two HGT resolutions (1 and 3 arc-seconds)
+SRTM1_SAMPLES = 3601
+SRTM3_SAMPLES = 1201
+
+# HGT void marker (no data)
+HGT_VOID = -32768
+
+# Coordinates this close to a whole degree lie on a tile border
+TILE_BORDER_TOLERANCE_DEG = 1e-9
+
+
+def _on_tile_border(degrees: npt.NDArray[np.float64]) -> npt.NDArray[np.bool_]:
+    """Check which coordinates lie on a whole-degree tile border."""
+    return np.abs(degrees - np.round(degrees)) < TILE_BORDER_TOLERANCE_DEG
+
+
+def hgt_tile_name(lat_index: int, lon_index: int) -> str:
+    """Get the HGT file name for a 1x1 degree tile.
+
+    Args:
+        lat_index: Latitude of the tile's south-west corner (integer degrees)
+        lon_index: Longitude of the tile's south-west corner (integer degrees)
+
+    Returns:
+        Tile file name (e.g., "N37W123.hgt")
+
+    Examples:
+        >>> hgt_tile_name(37, -123)
+        'N37W123.hgt'
+    """
+    ns = "N" if lat_index >= 0 else "S"
+    ew = "E" if lon_index >= 0 else "W"
+    return f"{ns}{abs(lat_index):02d}{ew}{abs(lon_index):03d}.hgt"
+
+
+class HGTTile:
+    """Memory-mapped SRTM HGT tile.
+
+    An HGT file is a square grid of big-endian signed 16-bit elevations
+    (meters) covering one degree of latitude and longitude. Row 0 is the
+    northern edge and column 0 the western edge; adjacent tiles share their
+    border rows/columns.
+
+    The grid is accessed through ``numpy.memmap``, so opening a tile is cheap
+    and only the pages touched by queries are read from disk.
+
+    Examples:
+        >>> tile = HGTTile(Path("N37W123.hgt"), 37, -123)
+        >>> tile.sample(np.array([37.5]), np.array([-122.5]))
+        array([12.3])
+    """
+
+    def __init__(self, path: Path, lat_index: int, lon_index: int) -> None:
+        """Open an HGT tile.
+
+        Args:
+            path: Path to the .hgt file
+            lat_index: Latitude of the tile's south-west corner
+            lon_index: Longitude of the tile's south-west corner
+
+        Raises:
+            ValueError: If the file size does not match SRTM1 or SRTM3
+        """
+        size = path.stat().st_size
+        samples = int(math.isqrt(size // 2))
+        if samples not in (SRTM1_SAMPLES, SRTM3_SAMPLES) or samples * samples * 2 != size:
+            raise ValueError(f"Invalid HGT tile size for {path.name}: {size} bytes")
+
+        self.path = path
+        self.lat_index = lat_index
+        self.lon_index = lon_index
+        self.samples = samples
+        self.data: np.memmap = np.memmap(path, dtype=">i2", mode="r", shape=(samples, samples))
+
+    @property
+    def nbytes(self) -> int:
+        """Get size of the tile grid in bytes."""
+        return self.samples * self.samples * 2
+
+    def sample(
+        self, latitudes: npt.NDArray[np.float64], longitudes: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        """Bilinearly interpolate elevations inside this tile.
+
+        Void samples are ignored by the interpolation; a point whose four
+        surrounding samples are all void returns 0.0 (sea level).
+
+        Args:
+            latitudes: Latitudes in degrees (must lie within this tile)
+            longitudes: Longitudes in degrees (must lie within this tile)
+
+        Returns:
+            Elevations in meters, same shape as the inputs
+        """
+        last = self.samples - 1
+        rows = np.clip((self.lat_index + 1 - latitudes) * last, 0.0, float(last))
+        cols = np.clip((longitudes - self.lon_index) * last, 0.0, float(last))
+
+        r0 = np.minimum(rows.astype(np.intp), last - 1)
+        c0 = np.minimum(cols.astype(np.intp), last - 1)
+        fr = rows - r0
+        fc = cols - c0
+
+        # Fancy indexing reads only the touched samples from the memmap
+        corners = np.stack(
+            (
+                self.data[r0, c0],
+                self.data[r0, c0 + 1],
+                self.data[r0 + 1, c0],
+                self.data[r0 + 1, c0 + 1],
+            )
+        ).astype(np.float64)
+        weights = np.stack(((1 - fr) * (1 - fc), (1 - fr) * fc, fr * (1 - fc), fr * fc))
+
+        valid = corners != HGT_VOID
+        weights = np.where(valid, weights, 0.0)
+        total = weights.sum(axis=0)
+        weighted = (np.where(valid, corners, 0.0) * weights).sum(axis=0)
+        result: npt.NDArray[np.float64] = np.divide(
+            weighted, total, out=np.zeros_like(weighted), where=total > 0
+        )
+        return result
+
+
 class SimpleFlatEarthProvider(IElevationProvider):
     """Simple flat-earth elevation provider for testing/fallback.
 
@@ -39,6 +171,8 @@ class SimpleFlatEarthProvider(IElevationProvider):
         >>> print(f"Approximate elevation: {elevation:.1f}m")
     """
 
+    supports_block_sampling = True
+
     def __init__(self) -> None:
         """Initialize simple flat-earth provider."""
         logger.info("SimpleFlatEarthProvider initialized")
@@ -89,46 +223,73 @@ class SimpleFlatEarthProvider(IElevationProvider):
 
         return float(elevation)
 
+    def get_elevation_array(
+        self, latitudes: npt.ArrayLike, longitudes: npt.ArrayLike
+    ) -> npt.NDArray[np.float64]:
+        """Get approximate elevations for coordinate arrays (vectorized).
+
+        Args:
+            latitudes: Latitudes in degrees
+            longitudes: Longitudes in degrees (same shape as latitudes)
+
+        Returns:
+            Approximate elevations in meters, same shape as the inputs
+        """
+        lat = np.clip(np.asarray(latitudes, dtype=np.float64), -90, 90)
+        lon = np.clip(np.asarray(longitudes, dtype=np.float64), -180, 180)
+
+        elevation = np.abs(lat) / 90.0 * 200 + np.sin(lon * math.pi / 30) * 100
+        result: npt.NDArray[np.float64] = np.maximum(0.0, elevation)
+        return result
+
     def is_available(self) -> bool:
         """Check if provider is available."""
         return True
 
 
 class SRTMProvider(IElevationProvider):
-    """SRTM elevation provider with local tile caching.
+    """SRTM elevation provider backed by local HGT tiles.
 
-    Provides elevation data from SRTM dataset. Falls back to
-    SimpleFlatEarthProvider if SRTM data is unavailable.
+    Reads ``.hgt`` tiles from ``cache_dir`` (named like ``N37W123.hgt``)
+    through memory maps and interpolates bilinearly between samples. Open
+    tiles are kept in an LRU bounded by a memory budget. Falls back to
+    SimpleFlatEarthProvider where no tile is available.
 
     SRTM Coverage:
     - Global coverage between 60°N and 56°S
     - 30m resolution (SRTM1) or 90m resolution (SRTM3)
     - Void-filled dataset available
 
-    Note: This implementation uses a fallback provider by default.
-    For production use with actual SRTM data, integrate with
-    libraries like `elevation` or `srtm.py`.
-
     Examples:
-        >>> provider = SRTMProvider(cache_dir="data/terrain/cache")
+        >>> provider = SRTMProvider(cache_dir="data/terrain/srtm")
         >>> elevation = provider.get_elevation(37.7749, -122.4194)
         >>> print(f"Elevation: {elevation:.1f}m")
     """
 
+    supports_block_sampling = True
+
     def __init__(
         self,
         cache_dir: str | Path | None = None,
         use_fallback: bool = True,
+        max_tile_memory_mb: float = 256.0,
     ) -> None:
         """Initialize SRTM provider.
 
         Args:
-            cache_dir: Directory for caching SRTM tiles
+            cache_dir: Directory containing SRTM .hgt tiles
             use_fallback: Use SimpleFlatEarthProvider as fallback
+            max_tile_memory_mb: Memory budget for open tiles (megabytes)
         """
         self.cache_dir = Path(cache_dir) if cache_dir else None
         self.use_fallback = use_fallback
         self.fallback_provider = SimpleFlatEarthProvider() if use_fallback else None
+        self.max_tile_bytes = int(max_tile_memory_mb * 1024 * 1024)
+
+        # LRU of open tiles keyed by (lat_index, lon_index); None marks a missing tile
+        self._tiles: OrderedDict[tuple[int, int], HGTTile | None] = OrderedDict()
+        self._tile_bytes = 0
+        self._lock = threading.Lock()
 
         if self.cache_dir:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -136,6 +297,24 @@ class SRTMProvider(IElevationProvider):
         else:
             logger.info("SRTMProvider initialized (no cache, fallback=%s)", use_fallback)
 
+        self.sample_spacing_deg = self._detect_sample_spacing()
+
+    def _detect_sample_spacing(self) -> float:
+        """Get the sample spacing of the finest tiles in the cache directory.
+
+        Tiles are recognized by file size, without opening them.
+
+        Returns:
+            1 arc-second if any SRTM1 tile is present, else 3 arc-seconds
+        """
+        if self.cache_dir:
+            srtm1_bytes = SRTM1_SAMPLES * SRTM1_SAMPLES * 2
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(".hgt") and entry.stat().st_size == srtm1_bytes:
+                        return 1.0 / (SRTM1_SAMPLES - 1)
+        return 1.0 / (SRTM3_SAMPLES - 1)
+
     def get_name(self) -> str:
         """Get provider name."""
         return "srtm"
@@ -204,9 +383,6 @@ class SRTMProvider(IElevationProvider):
     def _get_srtm_elevation(self, latitude: float, longitude: float) -> float:
         """Get elevation from SRTM tiles.
 
-        This is a placeholder implementation. For production use,
-        integrate with SRTM data libraries.
-
         Args:
             latitude: Latitude in degrees
             longitude: Longitude in degrees
@@ -215,20 +391,125 @@ class SRTMProvider(IElevationProvider):
             Elevation in meters
 
         Raises:
-            RuntimeError: If SRTM data not available
+            RuntimeError: If no tile covers the coordinates and no fallback
         """
-        # TODO: Integrate with actual SRTM library
-        # Options:
-        # 1. Use `elevation` Python library
-        # 2. Use `srtm.py` library
-        # 3. Query Open-Elevation API
-        # 4. Use pre-downloaded SRTM tiles
-
-        # For now, use fallback
+        tile = self.get_tile(math.floor(latitude), math.floor(longitude))
+        if tile is not None:
+            return float(tile.sample(np.array([latitude]), np.array([longitude]))[0])
+
+        # Border samples may be in the tile to the south/west
+        elevation = float(self._sample_points(np.array([latitude]), np.array([longitude]))[0])
+        if not math.isnan(elevation):
+            return elevation
+
+        # No tile on disk (ocean or not downloaded)
         if self.fallback_provider:
             return self.fallback_provider.get_elevation(latitude, longitude)
 
-        raise RuntimeError("SRTM data integration not yet implemented")
+        raise RuntimeError(
+            f"No SRTM tile {hgt_tile_name(math.floor(latitude), math.floor(longitude))}"
+        )
+
+    def get_tile(self, lat_index: int, lon_index: int) -> HGTTile | None:
+        """Get an open tile, mapping it from disk if needed.
+
+        Thread-safe; missing tiles are remembered so the file system is
+        only probed once per tile.
+
+        Args:
+            lat_index: Latitude of the tile's south-west corner
+            lon_index: Longitude of the tile's south-west corner
+
+        Returns:
+            HGTTile, or None if no tile file exists for this cell
+        """
+        key = (lat_index, lon_index)
+
+        with self._lock:
+            if key in self._tiles:
+                self._tiles.move_to_end(key)
+                return self._tiles[key]
+
+        tile = self._open_tile(lat_index, lon_index)
+
+        with self._lock:
+            if key in self._tiles:
+                # Opened concurrently by another thread
+                self._tiles.move_to_end(key)
+                return self._tiles[key]
+
+            self._tiles[key] = tile
+            if tile is not None:
+                self._tile_bytes += tile.nbytes
+                self._evict_tiles()
+
+        return tile
+
+    def has_tile(self, lat_index: int, lon_index: int) -> bool:
+        """Check whether a tile is currently open.
+
+        Args:
+            lat_index: Latitude of the tile's south-west corner
+            lon_index: Longitude of the tile's south-west corner
+
+        Returns:
+            True if the tile is mapped (or known to be missing)
+        """
+        with self._lock:
+            return (lat_index, lon_index) in self._tiles
+
+    def _open_tile(self, lat_index: int, lon_index: int) -> HGTTile | None:
+        """Memory-map a tile file.
+
+        Args:
+            lat_index: Latitude of the tile's south-west corner
+            lon_index: Longitude of the tile's south-west corner
+
+        Returns:
+            HGTTile, or None if the file does not exist or is invalid
+        """
+        if not self.cache_dir:
+            return None
+
+        name = hgt_tile_name(lat_index, lon_index)
+        path = self.cache_dir / name
+        if not path.exists():
+            path = self.cache_dir / name.lower()
+            if not path.exists():
+                return None
+
+        try:
+            tile = HGTTile(path, lat_index, lon_index)
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to open SRTM tile %s: %s", path, e)
+            return None
+
+        logger.debug("Mapped SRTM tile %s (%d samples)", path.name, tile.samples)
+        return tile
+
+    def _evict_tiles(self) -> None:
+        """Unmap least recently used tiles until within the memory budget.
+
+        Must be called with the lock held.
+        """
+        while self._tile_bytes > self.max_tile_bytes and len(self._tiles) > 1:
+            _, tile = self._tiles.popitem(last=False)
+            if tile is not None:
+                self._tile_bytes -= tile.nbytes
+                logger.debug("Unmapped SRTM tile %s", tile.path.name)
+
+    def get_tile_stats(self) -> dict[str, int]:
+        """Get tile LRU statistics.
+
+        Returns:
+            Dictionary with open tile count and mapped bytes
+        """
+        with self._lock:
+            return {
+                "open_tiles": sum(1 for tile in self._tiles.values() if tile is not None),
+                "tile_bytes": self._tile_bytes,
+                "max_tile_bytes": self.max_tile_bytes,
+            }
 
     def get_elevations(
         self, coordinates: list[tuple[float, float]]
@@ -245,9 +526,131 @@ class SRTMProvider(IElevationProvider):
             >>> coords = [(37.7749, -122.4194), (34.0522, -118.2437)]
             >>> results = provider.get_elevations(coords)
         """
-        # Batch queries could be optimized by loading SRTM tiles once
-        # For now, use default implementation
-        return super().get_elevations(coordinates)
+        if not coordinates:
+            return []
+
+        lats = np.array([lat for lat, _ in coordinates], dtype=np.float64)
+        lons = np.array([lon for _, lon in coordinates], dtype=np.float64)
+        elevations = self.get_elevation_array(lats, lons)
+        return [
+            (lat, lon, float(elevation))
+            for (lat, lon), elevation in zip(coordinates, elevations, strict=True)
+        ]
+
+    def get_elevation_array(
+        self, latitudes: npt.ArrayLike, longitudes: npt.ArrayLike
+    ) -> npt.NDArray[np.float64]:
+        """Get elevations for coordinate arrays (vectorized).
+
+        Points are grouped by tile and each tile is sampled once for all
+        of its points. Points without tile data use the fallback provider,
+        or are NaN when there is no fallback (see ElevationService, which
+        resolves them from the next provider).
+
+        Args:
+            latitudes: Latitudes in degrees
+            longitudes: Longitudes in degrees (same shape as latitudes)
+
+        Returns:
+            Elevations in meters, same shape as the inputs (NaN where
+            unresolved)
+        """
+        lats = np.asarray(latitudes, dtype=np.float64)
+        lons = np.asarray(longitudes, dtype=np.float64)
+        shape = lats.shape
+        lats = lats.ravel()
+        lons = lons.ravel()
+
+        result = self._sample_points(lats, lons)
+
+        if self.fallback_provider:
+            missing = np.flatnonzero(np.isnan(result))
+            if len(missing):
+                result[missing] = self.fallback_provider.get_elevation_array(
+                    lats[missing], lons[missing]
+                )
+
+        return result.reshape(shape)
+
+    def _sample_points(
+        self, lats: npt.NDArray[np.float64], lons: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        """Sample 1-D coordinate arrays from the tiles.
+
+        Args:
+            lats: Latitudes in degrees
+            lons: Longitudes in degrees
+
+        Returns:
+            Elevations in meters, NaN where no tile covers a point
+        """
+        result = np.full(lats.shape, np.nan, dtype=np.float64)
+
+        covered_positions = np.flatnonzero((lats >= -56.0) & (lats <= 60.0))
+        self._sample_tiles(
+            result,
+            covered_positions,
+            np.floor(lats[covered_positions]),
+            np.floor(lons[covered_positions]),
+            lats,
+            lons,
+        )
+
+        # Points on a northern/eastern tile border (up to rounding) are also
+        # in the tile to the south/west, since tiles share border samples
+        for shift_lat, shift_lon in ((True, False), (False, True), (True, True)):
+            unresolved = covered_positions[np.isnan(result[covered_positions])]
+            lat_border = _on_tile_border(lats[unresolved])
+            lon_border = _on_tile_border(lons[unresolved])
+            edge = (lat_border | (not shift_lat)) & (lon_border | (not shift_lon))
+            lat_indices = np.floor(lats[unresolved])
+            lon_indices = np.floor(lons[unresolved])
+            if shift_lat:
+                lat_indices = np.round(lats[unresolved]) - 1
+            if shift_lon:
+                lon_indices = np.round(lons[unresolved]) - 1
+            self._sample_tiles(
+                result, unresolved[edge], lat_indices[edge], lon_indices[edge], lats, lons
+            )
+
+        return result
+
+    def _sample_tiles(
+        self,
+        result: npt.NDArray[np.float64],
+        positions: npt.NDArray[np.intp],
+        lat_indices: npt.NDArray[np.float64],
+        lon_indices: npt.NDArray[np.float64],
+        lats: npt.NDArray[np.float64],
+        lons: npt.NDArray[np.float64],
+    ) -> None:
+        """Sample points from their tiles, one tile at a time.
+
+        Args:
+            result: Output elevations, updated where a tile exists
+            positions: Indices of the points to sample
+            lat_indices: Tile latitude index of each point
+            lon_indices: Tile longitude index of each point
+            lats: Latitudes of all points
+            lons: Longitudes of all points
+        """
+        if not len(positions):
+            return
+
+        keys = np.stack((lat_indices, lon_indices), axis=1).astype(np.int64)
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+
+        # Sort points by tile once; each tile's points are then one slice
+        inverse = inverse.ravel()
+        order = np.argsort(inverse, kind="stable")
+        starts = np.searchsorted(inverse[order], np.arange(len(unique_keys) + 1))
+
+        for group, (lat_index, lon_index) in enumerate(unique_keys):
+            tile = self.get_tile(int(lat_index), int(lon_index))
+            if tile is None:
+                continue
+            tile_positions = positions[order[starts[group] : starts[group + 1]]]
+            result[tile_positions] = tile.sample(lats[tile_positions], lons[tile_positions])
 
     def is_available(self) -> bool:
         """Check if provider is available.
@@ -270,6 +673,8 @@ class ConstantElevationProvider(IElevationProvider):
         >>> assert elevation == 100.0
     """
 
+    supports_block_sampling = True
+
     def __init__(self, elevation: float = 0.0) -> None:
         """Initialize constant elevation provider.
 
@@ -295,6 +700,20 @@ class ConstantElevationProvider(IElevationProvider):
         """
         return self.elevation
 
+    def get_elevation_array(
+        self, latitudes: npt.ArrayLike, longitudes: npt.ArrayLike
+    ) -> npt.NDArray[np.float64]:
+        """Get constant elevation for coordinate arrays.
+
+        Args:
+            latitudes: Latitudes in degrees (only the shape is used)
+            longitudes: Longitudes in degrees (ignored)
+
+        Returns:
+            Array filled with the constant elevation
+        """
+        return np.full(np.shape(latitudes), self.elevation, dtype=np.float64)
+
     def is_available(self) -> bool:
         """Check if provider is available."""
         return True
@@ -5,7 +5,7 @@ avoiding pyttsx3 threading issues on macOS by running in its own main thread.
 
 Components:
     - service.py: Main service entry point (run as subprocess)
-    - protocol.py: JSON IPC protocol definitions
+    - protocol.py: JSON IPC protocol definitions and binary audio frames
     - cache.py: Disk cache management with settings-based directories
     - client.py: Client for Airborne to communicate with service
 
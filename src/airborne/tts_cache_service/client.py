@@ -12,6 +12,9 @@ Typical usage:
     # Request TTS
     audio_bytes = await client.generate("altitude 3500")
 
+    # Or get a view of the received frame, without copying the audio
+    audio_view = await client.generate_view("altitude 3500")
+
     # Change settings
     await client.invalidate(rate=200, voice_name="Alex")
 
@@ -35,10 +38,13 @@ except ImportError:
     websockets = None  # type: ignore
 
 from airborne.tts_cache_service.protocol import (
+    PROTOCOL_VERSION,
     ContextRequest,
     ContextResponse,
     GenerateRequest,
     GenerateResponse,
+    HelloRequest,
+    HelloResponse,
     InvalidateRequest,
     InvalidateResponse,
     ListEnginesRequest,
@@ -51,6 +57,7 @@ from airborne.tts_cache_service.protocol import (
     QueueResponse,
     StatsRequest,
     StatsResponse,
+    decode_audio_frame,
     parse_response,
 )
 
@@ -70,6 +77,7 @@ class TTSServiceClient:
         host: WebSocket server host.
         port: WebSocket server port.
         connected: True if currently connected to service.
+        protocol: Protocol version negotiated with the service.
     """
 
     # Backoff settings
@@ -91,6 +99,8 @@ class TTSServiceClient:
         port: int = 51127,
         config_path: Path | None = None,
         auto_start: bool = True,
+        spawn_service: bool = True,
+        max_protocol: int = PROTOCOL_VERSION,
     ) -> None:
         """Initialize client.
 
@@ -99,6 +109,9 @@ class TTSServiceClient:
             port: WebSocket server port.
             config_path: Path to service config file.
             auto_start: If True, start service automatically on first request.
+            spawn_service: If False, connect to an already running service
+                instead of starting a subprocess.
+            max_protocol: Newest protocol version to negotiate.
         """
         if websockets is None:
             raise ImportError("websockets package required. Install with: uv add websockets")
@@ -107,6 +120,9 @@ class TTSServiceClient:
         self.port = port
         self.config_path = config_path
         self.auto_start = auto_start
+        self.spawn_service = spawn_service
+        self.max_protocol = max_protocol
+        self.protocol = 1
 
         self._process: subprocess.Popen | None = None
         self._websocket: Any = None
@@ -151,7 +167,7 @@ class TTSServiceClient:
         self._shutdown_event.clear()
 
         # Start subprocess
-        if not await self._start_subprocess():
+        if self.spawn_service and not await self._start_subprocess():
             return False
 
         # Connect to WebSocket
@@ -256,13 +272,15 @@ class TTSServiceClient:
 
         try:
             logger.info("Connecting to %s", self.ws_url)
-            self._websocket = await asyncio.wait_for(
+            websocket = await asyncio.wait_for(
                 connect(self.ws_url),
                 timeout=self.CONNECT_TIMEOUT_S,
             )
+            self.protocol = await self._negotiate(websocket)
+            self._websocket = websocket
             self._connected = True
             self._current_backoff = self.MIN_BACKOFF_S
-            logger.info("Connected to TTS service")
+            logger.info("Connected to TTS service (protocol %d)", self.protocol)
             return True
 
         except TimeoutError:
@@ -272,6 +290,26 @@ class TTSServiceClient:
             logger.error("Connection failed: %s", e)
             return False
 
+    async def _negotiate(self, websocket: Any) -> int:
+        """Agree on the protocol version before the receive loop uses the connection.
+
+        Args:
+            websocket: Newly opened connection.
+
+        Returns:
+            Protocol version to use (1 if the service does not support hello).
+        """
+        if self.max_protocol < 2:
+            return 1
+
+        request = HelloRequest(id=str(uuid.uuid4()), protocol=self.max_protocol)
+        await websocket.send(json.dumps(request.to_dict()))
+        message = await asyncio.wait_for(websocket.recv(), timeout=self.CONNECT_TIMEOUT_S)
+        response = parse_response(json.loads(message))
+        if isinstance(response, HelloResponse) and response.ok:
+            return response.protocol
+        return 1
+
     async def _disconnect(self) -> None:
         """Disconnect from WebSocket server."""
         self._connected = False
@@ -296,7 +334,7 @@ class TTSServiceClient:
         )
 
         # Restart subprocess if needed
-        if self._process is None or self._process.poll() is not None:
+        if self.spawn_service and (self._process is None or self._process.poll() is not None):
             if not await self._start_subprocess():
                 return False
 
@@ -311,11 +349,17 @@ class TTSServiceClient:
 
             try:
                 message = await self._websocket.recv()
-                data = json.loads(message)
-                req_id = data.get("id", "")
+                result: Any
+                if isinstance(message, bytes):
+                    # Protocol version 2 audio frame: (response, memoryview of the WAV)
+                    result = decode_audio_frame(message)
+                    req_id = result[0].id
+                else:
+                    result = json.loads(message)
+                    req_id = result.get("id", "")
 
                 if req_id in self._pending:
-                    self._pending[req_id].set_result(data)
+                    self._pending[req_id].set_result(result)
 
             except websockets.exceptions.ConnectionClosed:
                 logger.warning("Connection closed")
@@ -360,7 +404,7 @@ class TTSServiceClient:
                 await self._reconnect()
 
     async def _send_request(self, request_dict: dict[str, Any]) -> dict[str, Any] | None:
-        """Send request and wait for response.
+        """Send request and wait for a JSON response.
 
         Args:
             request_dict: Request dictionary.
@@ -368,6 +412,19 @@ class TTSServiceClient:
         Returns:
             Response dictionary or None if failed.
         """
+        response: dict[str, Any] | None = await self._exchange(request_dict)
+        return response
+
+    async def _exchange(self, request_dict: dict[str, Any]) -> Any:
+        """Send request and wait for its response message.
+
+        Args:
+            request_dict: Request dictionary.
+
+        Returns:
+            Response dictionary, (GenerateResponse, memoryview) for binary
+            audio frames, or None if failed.
+        """
         # Auto-start if needed
         if self.auto_start and not self._running:
             await self.start()
@@ -424,6 +481,39 @@ class TTSServiceClient:
         Returns:
             WAV audio bytes or None if failed.
         """
+        audio = await self.generate_view(text, voice, rate, voice_name, language, priority)
+        if audio is None:
+            return None
+        # A view of a whole bytes object (protocol version 1) needs no copy
+        if isinstance(audio.obj, bytes) and audio.nbytes == len(audio.obj):
+            return audio.obj
+        return audio.tobytes()
+
+    async def generate_view(
+        self,
+        text: str,
+        voice: str = "cockpit",
+        rate: int = 180,
+        voice_name: str | None = None,
+        language: str | None = None,
+        priority: int = 0,
+    ) -> memoryview | None:
+        """Generate TTS audio, as a view of the received message.
+
+        With protocol version 2 the view points into the binary frame, so
+        the WAV bytes are not copied after they arrive.
+
+        Args:
+            text: Text to synthesize.
+            voice: Logical voice name (e.g., "cockpit", "tower").
+            rate: Speech rate in words per minute.
+            voice_name: Platform-specific voice name (e.g., "Samantha").
+            language: Language code for voice selection (e.g., "fr", "en").
+            priority: Generation priority.
+
+        Returns:
+            View of the WAV audio bytes or None if failed.
+        """
         request = GenerateRequest(
             id=str(uuid.uuid4()),
             text=text,
@@ -434,11 +524,15 @@ class TTSServiceClient:
             priority=priority,
         )
 
-        response_data = await self._send_request(request.to_dict())
-        if not response_data:
+        result = await self._exchange(request.to_dict())
+        if not result:
             return None
 
-        response = parse_response(response_data)
+        audio: memoryview | None = None
+        if isinstance(result, tuple):
+            response, audio = result
+        else:
+            response = parse_response(result)
         if not isinstance(response, GenerateResponse):
             logger.error("Unexpected response type")
             return None
@@ -447,9 +541,12 @@ class TTSServiceClient:
             logger.error("Generate failed: %s", response.error)
             return None
 
-        # Decode base64 audio data
+        if audio is not None:
+            return audio
+
+        # Decode base64 audio data (protocol version 1)
         try:
-            return base64.b64decode(response.data)
+            return memoryview(base64.b64decode(response.data))
         except Exception as e:
             logger.error("Failed to decode audio data: %s", e)
             return None
@@ -4,21 +4,42 @@ This module defines the request/response message types for communication
 between Airborne and the TTS Cache Service subprocess via WebSocket.
 
 Protocol:
-    - All messages are JSON
-    - Binary data (WAV bytes) is base64 encoded in the response
+    - Requests and non-audio responses are JSON text frames
     - Request format: {"cmd": "...", "id": "...", ...}
     - Response format: {"id": "...", "ok": true/false, ...}
+    - Version 1: WAV bytes of generate responses are base64 encoded in "data"
+    - Version 2: generate responses are binary frames holding a small header
+      and the raw WAV bytes (see encode_audio_frame())
+
+The version is negotiated at connect: the client sends a "hello" request
+with the newest version it supports, and the service answers with the
+version it will use on this connection. Services that do not know "hello"
+answer with an error, and the client stays on version 1.
+
+Audio frame layout (little-endian):
+    magic "ATTS", JSON header length (u32), JSON header (the generate
+    response without audio), WAV bytes
 
 WebSocket endpoint: ws://127.0.0.1:51127 (configurable)
 
 Example exchange:
+    >>> {"cmd": "hello", "id": "h1", "protocol": 2}
+    <<< {"id": "h1", "ok": true, "protocol": 2}
     >>> {"cmd": "generate", "id": "abc123", "text": "altitude 3500"}
-    <<< {"id": "abc123", "ok": true, "size": 69902, "cached": false, "data": "<base64>"}
+    <<< b"ATTS" + header length + {"id": "abc123", "ok": true, "size": 69902, ...} + WAV
 """
 
+import json
+import struct
 from dataclasses import dataclass, field
 from typing import Any
 
+# Newest protocol version (see module docstring)
+PROTOCOL_VERSION = 2
+
+AUDIO_FRAME_MAGIC = b"ATTS"
+_AUDIO_FRAME_HEADER = struct.Struct("<4sI")
+
 
 @dataclass
 class Request:
@@ -209,6 +230,21 @@ class ListVoicesRequest(Request):
         return d
 
 
+@dataclass
+class HelloRequest(Request):
+    """Request to negotiate the protocol version at connect.
+
+    Attributes:
+        protocol: Newest protocol version supported by the client.
+    """
+
+    protocol: int = PROTOCOL_VERSION
+    cmd: str = field(default="hello", init=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"cmd": self.cmd, "id": self.id, "protocol": self.protocol}
+
+
 @dataclass
 class Response:
     """Base response message."""
@@ -233,7 +269,7 @@ class GenerateResponse(Response):
         size: Size of WAV data in bytes (0 if failed).
         cached: True if served from cache, False if generated.
         duration_ms: Generation time in milliseconds.
-        data: Base64-encoded WAV audio data.
+        data: Base64-encoded WAV audio data (protocol version 1 only).
     """
 
     size: int = 0
@@ -254,6 +290,22 @@ class GenerateResponse(Response):
         return d
 
 
+@dataclass
+class HelloResponse(Response):
+    """Response to hello request.
+
+    Attributes:
+        protocol: Protocol version used on this connection.
+    """
+
+    protocol: int = 1
+
+    def to_dict(self) -> dict[str, Any]:
+        d = super().to_dict()
+        d["protocol"] = self.protocol
+        return d
+
+
 @dataclass
 class InvalidateResponse(Response):
     """Response to invalidate request.
@@ -487,6 +539,8 @@ def parse_request(data: dict[str, Any]) -> Request | None:
             language=data.get("language"),
             priority=data.get("priority", 0),
         )
+    elif cmd == "hello":
+        return HelloRequest(id=req_id, protocol=data.get("protocol", 1))
     elif cmd == "invalidate":
         return InvalidateRequest(
             id=req_id,
@@ -546,6 +600,13 @@ def parse_response(data: dict[str, Any]) -> Response:
             duration_ms=data.get("duration_ms", 0.0),
             data=data.get("data", ""),
         )
+    elif "protocol" in data:
+        return HelloResponse(
+            id=data.get("id", ""),
+            ok=data.get("ok", False),
+            error=data.get("error"),
+            protocol=data.get("protocol", 1),
+        )
     elif "cleared_queue" in data:
         return InvalidateResponse(
             id=data.get("id", ""),
@@ -631,3 +692,53 @@ def parse_response(data: dict[str, Any]) -> Response:
             ok=data.get("ok", False),
             error=data.get("error"),
         )
+
+
+def encode_audio_frame(response: GenerateResponse, audio: bytes) -> bytes:
+    """Encode a generate response and its audio as a binary frame.
+
+    Args:
+        response: Generate response (its base64 data field is not sent).
+        audio: WAV audio bytes (empty if generation failed).
+
+    Returns:
+        Binary WebSocket frame payload (see module docstring).
+    """
+    header = response.to_dict()
+    header.pop("data", None)
+    encoded = json.dumps(header).encode("utf-8")
+    return b"".join((_AUDIO_FRAME_HEADER.pack(AUDIO_FRAME_MAGIC, len(encoded)), encoded, audio))
+
+
+def decode_audio_frame(frame: bytes) -> tuple[GenerateResponse, memoryview]:
+    """Decode a binary frame into a generate response and its audio.
+
+    The audio is a view into the frame, so the WAV bytes are not copied.
+
+    Args:
+        frame: Binary WebSocket frame payload.
+
+    Returns:
+        Generate response and a memoryview of the WAV bytes.
+
+    Raises:
+        ValueError: If the frame is not an audio frame.
+    """
+    view = memoryview(frame)
+    if len(view) < _AUDIO_FRAME_HEADER.size:
+        raise ValueError("Truncated audio frame")
+    magic, header_length = _AUDIO_FRAME_HEADER.unpack_from(view)
+    audio_start = _AUDIO_FRAME_HEADER.size + header_length
+    if magic != AUDIO_FRAME_MAGIC or audio_start > len(view):
+        raise ValueError("Not an audio frame")
+
+    header = json.loads(bytes(view[_AUDIO_FRAME_HEADER.size : audio_start]))
+    response = GenerateResponse(
+        id=header.get("id", ""),
+        ok=header.get("ok", False),
+        error=header.get("error"),
+        size=header.get("size", 0),
+        cached=header.get("cached", False),
+        duration_ms=header.get("duration_ms", 0.0),
+    )
+    return response, view[audio_start:]
@@ -33,11 +33,14 @@ except ImportError:
 
 from airborne.tts_cache_service.cache import TTSDiskCache, VoiceSettings
 from airborne.tts_cache_service.protocol import (
+    PROTOCOL_VERSION,
     ContextRequest,
     ContextResponse,
     EngineInfo,
     GenerateRequest,
     GenerateResponse,
+    HelloRequest,
+    HelloResponse,
     InvalidateRequest,
     InvalidateResponse,
     ListEnginesRequest,
@@ -53,6 +56,7 @@ from airborne.tts_cache_service.protocol import (
     StatsRequest,
     StatsResponse,
     VoiceInfo,
+    encode_audio_frame,
     parse_request,
 )
 
@@ -325,6 +329,8 @@ class TTSCacheService:
         try:
             if isinstance(request, GenerateRequest):
                 return await self._handle_generate(request)
+            elif isinstance(request, HelloRequest):
+                return await self._handle_hello(request)
             elif isinstance(request, InvalidateRequest):
                 return await self._handle_invalidate(request)
             elif isinstance(request, QueueRequest):
@@ -357,7 +363,34 @@ class TTSCacheService:
             ).to_dict()
 
     async def _handle_generate(self, request: GenerateRequest) -> dict[str, Any]:
-        """Handle generate request with voice-specific caching."""
+        """Handle generate request with base64 audio (protocol version 1)."""
+        response, audio_bytes = await self._generate(request)
+        if audio_bytes:
+            response.data = base64.b64encode(audio_bytes).decode("ascii")
+        return response.to_dict()
+
+    async def handle_generate_frame(self, request: GenerateRequest) -> bytes:
+        """Handle generate request with a binary audio frame (protocol version 2).
+
+        Args:
+            request: Generate request.
+
+        Returns:
+            Binary frame with the response header and the raw WAV bytes.
+        """
+        try:
+            response, audio_bytes = await self._generate(request)
+        except Exception as e:
+            logger.exception("Error handling request: %s", e)
+            response, audio_bytes = GenerateResponse(id=request.id, ok=False, error=str(e)), None
+        return encode_audio_frame(response, audio_bytes or b"")
+
+    async def _generate(self, request: GenerateRequest) -> tuple[GenerateResponse, bytes | None]:
+        """Get audio from the voice-specific cache, or generate it.
+
+        Returns:
+            Response without audio data, and the WAV bytes if successful.
+        """
         start_time = time.time()
 
         # If voice_name not provided, look up user's saved settings
@@ -393,8 +426,7 @@ class TTSCacheService:
                 size=len(audio_bytes),
                 cached=True,
                 duration_ms=duration_ms,
-                data=base64.b64encode(audio_bytes).decode("ascii"),
-            ).to_dict()
+            ), audio_bytes
 
         # Cache miss - queue for generation in main thread
         # Put request in generation queue and wait for result
@@ -418,7 +450,7 @@ class TTSCacheService:
                 ok=False,
                 error="Generation timeout",
                 duration_ms=(time.time() - start_time) * 1000,
-            ).to_dict()
+            ), None
 
         duration_ms = (time.time() - start_time) * 1000
 
@@ -429,15 +461,22 @@ class TTSCacheService:
                 size=len(audio_bytes),
                 cached=False,
                 duration_ms=duration_ms,
-                data=base64.b64encode(audio_bytes).decode("ascii"),
-            ).to_dict()
+            ), audio_bytes
         else:
             return GenerateResponse(
                 id=request.id,
                 ok=False,
                 error="Generation failed",
                 duration_ms=duration_ms,
-            ).to_dict()
+            ), None
+
+    async def _handle_hello(self, request: HelloRequest) -> dict[str, Any]:
+        """Handle hello request - pick the protocol version for the connection."""
+        return HelloResponse(
+            id=request.id,
+            ok=True,
+            protocol=max(1, min(request.protocol, PROTOCOL_VERSION)),
+        ).to_dict()
 
     async def _handle_invalidate(self, request: InvalidateRequest) -> dict[str, Any]:
         """Handle invalidate request - clear queue (voice switching not needed with multi-voice)."""
@@ -841,15 +880,28 @@ class TTSCacheService:
         ).to_dict()
 
     async def websocket_handler(self, websocket: Any) -> None:
-        """Handle WebSocket connection."""
+        """Handle WebSocket connection.
+
+        Connections start on protocol version 1 and switch to the version
+        agreed by a hello request.
+        """
         client_addr = websocket.remote_address
         logger.info("Client connected: %s", client_addr)
+        protocol = 1
 
         try:
             async for message in websocket:
                 try:
                     request_data = json.loads(message)
+                    if protocol >= 2 and request_data.get("cmd") == "generate":
+                        request = parse_request(request_data)
+                        if isinstance(request, GenerateRequest):
+                            await websocket.send(await self.handle_generate_frame(request))
+                            continue
+
                     response = await self.handle_request(request_data)
+                    if request_data.get("cmd") == "hello" and response["ok"]:
+                        protocol = response["protocol"]
                     await websocket.send(json.dumps(response))
 
                 except json.JSONDecodeError as e:
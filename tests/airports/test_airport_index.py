@@ -0,0 +1,277 @@
+"""Tests for the airport search index."""
+
+import csv
+import os
+import random
+import string
+from pathlib import Path
+
+import pytest
+
+from airborne.airports.airport_index import AirportIndex, AirportInfo
+
+FIELDS = [
+    "ident",
+    "type",
+    "name",
+    "latitude_deg",
+    "longitude_deg",
+    "elevation_ft",
+    "iso_country",
+    "municipality",
+    "icao_code",
+    "iata_code",
+]
+
+AIRPORTS = [
+    ["LFPG", "large_airport", "Charles de Gaulle", "49.0097", "2.5479", "392", "FR", "Paris", "LFPG", "CDG"],
+    ["LFPO", "large_airport", "Orly", "48.7233", "2.3794", "291", "FR", "Paris", "LFPO", "ORY"],
+    ["LFPB", "medium_airport", "Le Bourget", "48.9694", "2.4414", "218", "FR", "Paris", "LFPB", "LBG"],
+    ["LFPN", "small_airport", "Toussus-le-Noble", "48.7519", "2.1061", "538", "FR", "Toussus", "LFPN", ""],
+    ["LFXX", "heliport", "Paris Heliport", "48.8333", "2.2736", "110", "FR", "Paris", "", ""],
+    ["KSFO", "large_airport", "San Francisco Intl", "37.6190", "-122.3750", "13", "US", "San Francisco", "KSFO", "SFO"],
+    ["00A", "heliport", "Total Rf Heliport", "40.0708", "-74.9336", "11", "US", "Bensalem", "", ""],
+    ["KOAK", "large_airport", "Oakland Intl", "37.7213", "-122.2208", "9", "US", "Oakland", "KOAK", "OAK"],
+]  # fmt: skip
+
+
+def write_airports_csv(path: Path, rows: list[list[str]]) -> None:
+    """Write an OurAirports-style CSV."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        writer.writerows(rows)
+
+
+@pytest.fixture
+def csv_path(tmp_path: Path) -> Path:
+    """Create a small airports.csv."""
+    path = tmp_path / "airports.csv"
+    write_airports_csv(path, AIRPORTS)
+    return path
+
+
+@pytest.fixture
+def index(csv_path: Path) -> AirportIndex:
+    """Create and load an airport index."""
+    index = AirportIndex(data_dir=csv_path.parent)
+    assert index.load()
+    return index
+
+
+class TestAirportIndexLoading:
+    """Test loading and the compiled index file."""
+
+    def test_load_builds_index_file(self, index: AirportIndex, csv_path: Path) -> None:
+        """Test first load writes the compiled index."""
+        assert index.is_loaded
+        assert index.airport_count == 7  # 00A has no ICAO code
+        assert csv_path.with_suffix(".idx").exists()
+
+    def test_second_load_uses_index(self, index: AirportIndex, csv_path: Path) -> None:
+        """Test a later load reads the index, not the CSV."""
+        reloaded = AirportIndex(data_dir=csv_path.parent)
+        # Make the CSV unreadable as CSV; an up-to-date index must not touch it
+        stat = csv_path.stat()
+        csv_path.write_bytes(b"\x00" * stat.st_size)
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert reloaded.load()
+        assert reloaded.airport_count == 7
+        assert reloaded.get("LFPG") == index.get("LFPG")
+
+    def test_index_rebuilt_when_csv_changes(self, index: AirportIndex, csv_path: Path) -> None:
+        """Test a modified CSV triggers a rebuild."""
+        write_airports_csv(
+            csv_path,
+            [*AIRPORTS, ["EGLL", "large_airport", "Heathrow", "51.47", "-0.46", "83", "GB", "London", "EGLL", "LHR"]],
+        )  # fmt: skip
+        stat = csv_path.stat()
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        reloaded = AirportIndex(data_dir=csv_path.parent)
+        assert reloaded.load()
+
+        assert reloaded.airport_count == 8
+        heathrow = reloaded.get_by_iata("LHR")
+        assert heathrow is not None
+        assert heathrow.icao == "EGLL"
+
+    def test_missing_csv(self, tmp_path: Path) -> None:
+        """Test loading without a CSV fails cleanly."""
+        index = AirportIndex(data_dir=tmp_path)
+
+        assert index.load() is False
+        assert index.get("LFPG") is None
+        assert index.search("LFP") == []
+
+
+class TestAirportIndexLookups:
+    """Test lookups running off the compiled index."""
+
+    def test_get(self, index: AirportIndex) -> None:
+        """Test ICAO lookup."""
+        airport = index.get("lfpg")
+
+        assert isinstance(airport, AirportInfo)
+        assert airport.icao == "LFPG"
+        assert airport.iata == "CDG"
+        assert airport.name == "Charles de Gaulle"
+        assert airport.city == "Paris"
+        assert airport.country == "FR"
+        assert airport.latitude == pytest.approx(49.0097)
+        assert airport.elevation_ft == pytest.approx(392.0)
+        assert airport.airport_type == "large_airport"
+        assert index.get("ZZZZ") is None
+        assert index.get("TOOLONGCODE") is None
+
+    def test_ident_fallback(self, index: AirportIndex) -> None:
+        """Test 4-character idents are used when there is no ICAO code."""
+        airport = index.get("LFXX")
+
+        assert airport is not None
+        assert airport.airport_type == "heliport"
+
+    def test_airports_created_lazily(self, index: AirportIndex) -> None:
+        """Test AirportInfo objects are created on access and reused."""
+        assert index._cache == {}
+
+        first = index.get("KSFO")
+        assert index.get("KSFO") is first
+        assert len(index._cache) == 1
+
+    def test_get_by_iata(self, index: AirportIndex) -> None:
+        """Test IATA lookup."""
+        airport = index.get_by_iata("ory")
+
+        assert airport is not None
+        assert airport.icao == "LFPO"
+        assert index.get_by_iata("XXX") is None
+
+    def test_get_airports_in_country(self, index: AirportIndex) -> None:
+        """Test country listing order and type filter."""
+        airports = index.get_airports_in_country("fr")
+
+        assert [a.icao for a in airports] == ["LFPG", "LFPO", "LFPB", "LFPN"]
+
+        heliports = index.get_airports_in_country("FR", airport_types=["heliport"])
+        assert [a.icao for a in heliports] == ["LFXX"]
+        assert index.get_airports_in_country("DE") == []
+
+    def test_get_all_icao_codes(self, index: AirportIndex) -> None:
+        """Test ICAO codes are sorted."""
+        codes = index.get_all_icao_codes()
+
+        assert codes == sorted(codes)
+        assert "KOAK" in codes
+
+    def test_search(self, index: AirportIndex) -> None:
+        """Test search still scores and filters airports."""
+        assert index.search("LFPG")[0].icao == "LFPG"
+        assert index.search("SFO")[0].icao == "KSFO"
+        assert {a.icao for a in index.search("Paris")} == {"LFPG", "LFPO", "LFPB"}
+
+
+def brute_force_search(
+    index: AirportIndex, query: str, limit: int = 10, airport_types: list[str] | None = None
+) -> list[str]:
+    """Rank every airport with _match_score (the reference behavior)."""
+    types = airport_types or ["large_airport", "medium_airport", "small_airport"]
+    results = []
+    for icao in index.get_all_icao_codes():
+        airport = index.get(icao)
+        assert airport is not None
+        if airport.airport_type not in types:
+            continue
+        score = index._match_score(airport, query.upper(), query.lower())
+        if score > 0:
+            results.append((score, airport))
+    results.sort(key=lambda x: (-x[0], index.TYPE_PRIORITY.get(x[1].airport_type, 10)))
+    return [airport.icao for _, airport in results[:limit]]
+
+
+class TestAirportSearchIndex:
+    """Test type-ahead search against the reference scoring."""
+
+    WORDS = ["Paris", "Saint", "Santa", "Field", "Regional", "Lake", "Zürich", "São", "Bay"]
+
+    @pytest.fixture
+    def large_index(self, tmp_path: Path) -> AirportIndex:
+        """Create an index with a few thousand random airports."""
+        rng = random.Random(7)
+        types = ["large_airport", "medium_airport", "small_airport", "heliport", "closed"]
+        rows = []
+        for _ in range(3000):
+            icao = "".join(rng.choices(string.ascii_uppercase, k=4))
+            iata = (
+                "".join(rng.choices(string.ascii_uppercase[:6], k=3)) if rng.random() < 0.3 else ""
+            )
+            city = (
+                " ".join(rng.choices(self.WORDS, k=rng.randint(1, 2))) if rng.random() < 0.9 else ""
+            )
+            name = f"{city} {' '.join(rng.choices(self.WORDS, k=2))}"
+            country = rng.choice(["FR", "US", "BR", "CH"])
+            rows.append([icao, rng.choice(types), name, "0", "0", "0", country, city, icao, iata])
+
+        path = tmp_path / "airports.csv"
+        write_airports_csv(path, rows)
+        index = AirportIndex(data_dir=tmp_path)
+        assert index.load()
+        return index
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "s",
+            "sa",
+            "San",
+            "saint f",
+            "zür",
+            "SÃO",
+            "FR",
+            "ch",
+            "abc",
+            "ab",
+            "lake b",
+            "x",
+            "QQQQQ",
+        ],
+    )
+    def test_matches_reference_scoring(self, large_index: AirportIndex, query: str) -> None:
+        """Test indexed search returns exactly the brute-force ranking."""
+        results = [a.icao for a in large_index.search(query, limit=25)]
+
+        assert results == brute_force_search(large_index, query, limit=25)
+
+    def test_refinement_matches_fresh_search(
+        self, large_index: AirportIndex, tmp_path: Path
+    ) -> None:
+        """Test typing character by character gives the same results as a fresh index."""
+        fresh = AirportIndex(data_dir=tmp_path)
+        assert fresh.load()
+
+        query = ""
+        for char in "regional f":
+            query += char
+            typed = [a.icao for a in large_index.search(query)]
+            assert typed == [a.icao for a in fresh.search(query)]
+            fresh._contains_cache.clear()  # Always start from scratch
+
+    def test_backspace_after_refinement(self, large_index: AirportIndex) -> None:
+        """Test shortening the query does not reuse the narrower result set."""
+        large_index.search("santa")
+        large_index.search("santa b")
+
+        assert [a.icao for a in large_index.search("sant")] == brute_force_search(
+            large_index, "sant"
+        )
+
+    def test_airport_types_and_limit(self, large_index: AirportIndex) -> None:
+        """Test type filter and limit are applied."""
+        results = large_index.search("a", limit=5, airport_types=["heliport"])
+
+        assert len(results) == 5
+        assert all(a.airport_type == "heliport" for a in results)
+        assert [a.icao for a in results] == brute_force_search(
+            large_index, "a", limit=5, airport_types=["heliport"]
+        )
@@ -5,6 +5,7 @@ from unittest.mock import patch
 import pytest
 
 from airborne.airports.database import (
+    Airport,
     AirportDatabase,
     AirportType,
     FrequencyType,
@@ -348,6 +349,49 @@ class TestDeprecatedCSVLoading:
             db.load_from_csv("/some/path")
 
 
+class TestNearbyAirports:
+    """Test spatial queries over loaded airports."""
+
+    @pytest.fixture
+    def db(self) -> AirportDatabase:
+        """Create database with airports added directly."""
+        db = AirportDatabase()
+        for icao, lon, lat in [
+            ("KPAO", -122.115, 37.461),
+            ("KSFO", -122.375, 37.619),
+            ("KSJC", -121.929, 37.363),
+            ("LFPG", 2.548, 49.010),
+        ]:
+            db.airports[icao] = Airport(icao, icao, Vector3(lon, 0, lat), AirportType.SMALL_AIRPORT)
+        return db
+
+    def test_get_airports_near(self, db: AirportDatabase) -> None:
+        """Test radius query sorted by distance."""
+        nearby = db.get_airports_near(Vector3(-122.115, 0, 37.461), 20)
+
+        assert [airport.icao for airport, _ in nearby] == ["KPAO", "KSJC", "KSFO"]
+        assert 14 < nearby[2][1] < 16
+
+    def test_get_nearest_airports(self, db: AirportDatabase) -> None:
+        """Test nearest airports query."""
+        nearest = db.get_nearest_airports(Vector3(2.0, 0, 48.0), 2)
+
+        assert [airport.icao for airport, _ in nearest] == ["LFPG", "KSFO"]
+        within_100nm = db.get_nearest_airports(Vector3(2.0, 0, 48.0), 2, max_radius_nm=100)
+        assert [airport.icao for airport, _ in within_100nm] == ["LFPG"]
+
+    def test_index_follows_loaded_airports(self, db: AirportDatabase) -> None:
+        """Test airports loaded after a query are found by the next query."""
+        db.get_airports_near(Vector3(0, 0, 0), 1)
+        gateway_data = GatewayAirportData("LFPO", "Orly", 48.723, 2.379, 291.0, 5000)
+
+        with patch.object(db.gateway_loader, "get_airport", return_value=gateway_data):
+            db.load_airport("LFPO")
+
+        nearby = db.get_airports_near(Vector3(2.379, 0, 48.723), 1)
+        assert [airport.icao for airport, _ in nearby] == ["LFPO"]
+
+
 class TestHaversineDistance:
     """Test haversine distance calculation."""
 
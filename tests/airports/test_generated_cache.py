@@ -0,0 +1,175 @@
+"""Tests for the cache of procedurally generated layouts."""
+
+import dataclasses
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from airborne.airports.classifier import AirportCategory
+from airborne.airports.database import Airport, AirportType, Runway, SurfaceType
+from airborne.airports.generated_cache import (
+    GeneratedLayoutCache,
+    layout_key,
+    pregenerate_layouts,
+    read_generated_layout,
+    write_generated_layout,
+)
+from airborne.airports.parking import ParkingDatabase
+from airborne.airports.parking_generator import ParkingGenerator
+from airborne.airports.taxiway import TaxiwayGraph
+from airborne.airports.taxiway_generator import TaxiwayGenerator
+from airborne.physics.vectors import Vector3
+from airborne.services.atc.gateway_cache import write_gateway_cache
+from airborne.services.atc.gateway_loader import GatewayAirportData, GatewayRunway
+
+
+@pytest.fixture
+def airport() -> Airport:
+    """Create a test airport."""
+    return Airport(
+        icao="KSEA",
+        name="Seattle-Tacoma International",
+        position=Vector3(-122.309, 128.0, 47.449),
+        airport_type=AirportType.LARGE_AIRPORT,
+    )
+
+
+@pytest.fixture
+def runways() -> list[Runway]:
+    """Create two parallel runways."""
+    return [
+        Runway("KSEA", f"16{le}/34{he}", 9426, 150, SurfaceType.ASPH, True, False,
+               f"16{le}", 47.449, lon, 128.0, 160.0, f"34{he}", 47.460, lon - 0.006, 128.0, 340.0)
+        for le, he, lon in (("L", "R", -122.309), ("R", "L", -122.305))
+    ]  # fmt: skip
+
+
+def generate(
+    airport: Airport, runways: list[Runway], category: AirportCategory
+) -> tuple[TaxiwayGraph, ParkingDatabase]:
+    """Run both generators."""
+    return (
+        TaxiwayGenerator().generate(airport, runways, category),
+        ParkingGenerator().generate(airport, runways, category),
+    )
+
+
+class TestGeneratedLayoutFormat:
+    """Test writing and reading generated layouts."""
+
+    @pytest.mark.parametrize("category", list(AirportCategory))
+    def test_round_trip(
+        self,
+        tmp_path: Path,
+        airport: Airport,
+        runways: list[Runway],
+        category: AirportCategory,
+    ) -> None:
+        """Test every generated node, edge and parking position survives the cache."""
+        graph, parking_db = generate(airport, runways, category)
+        path = tmp_path / "KSEA.gen.gwc"
+
+        write_generated_layout(path, "key", graph, parking_db)
+        loaded = read_generated_layout(path, "key", "KSEA")
+
+        assert loaded is not None
+        loaded_graph, loaded_parking = loaded
+        assert loaded_graph.nodes == graph.nodes
+        assert loaded_graph.edges == graph.edges
+        assert loaded_parking.airport_icao == "KSEA"
+        assert loaded_parking.positions == parking_db.positions
+        assert loaded_graph.find_path(*list(graph.nodes)[:2]) == graph.find_path(
+            *list(graph.nodes)[:2]
+        )
+
+    def test_other_key(self, tmp_path: Path, airport: Airport, runways: list[Runway]) -> None:
+        """Test a layout written for another key is not returned."""
+        path = tmp_path / "KSEA.gen.gwc"
+        write_generated_layout(path, "old", *generate(airport, runways, AirportCategory.SMALL))
+
+        assert read_generated_layout(path, "new", "KSEA") is None
+
+    def test_layout_key(self, airport: Airport, runways: list[Runway]) -> None:
+        """Test the key changes with the runways, the category and the generator version."""
+        key = layout_key(airport, runways, AirportCategory.LARGE)
+        moved = [dataclasses.replace(runways[0], he_latitude=47.461), runways[1]]
+
+        assert key == layout_key(airport, list(runways), AirportCategory.LARGE)
+        assert key != layout_key(airport, moved, AirportCategory.LARGE)
+        assert key != layout_key(airport, runways[::-1], AirportCategory.LARGE)
+        assert key != layout_key(airport, runways, AirportCategory.MEDIUM)
+        with patch("airborne.airports.taxiway_generator.GENERATOR_VERSION", 2):
+            assert key != layout_key(airport, runways, AirportCategory.LARGE)
+
+
+class TestGeneratedLayoutCache:
+    """Test loading layouts from the cache or generating them."""
+
+    def test_generated_once(self, tmp_path: Path, airport: Airport, runways: list[Runway]) -> None:
+        """Test the second request reads the cached layout."""
+        cache = GeneratedLayoutCache(tmp_path)
+        with patch.object(cache.taxiway_gen, "generate", wraps=cache.taxiway_gen.generate) as gen:
+            graph, parking_db = cache.get(airport, runways, AirportCategory.LARGE)
+            cached_graph, cached_parking = cache.get(airport, runways, AirportCategory.LARGE)
+
+        assert gen.call_count == 1
+        assert cache.cache_file("KSEA").exists()
+        assert cached_graph.nodes == graph.nodes
+        assert cached_parking.positions == parking_db.positions
+
+    def test_regenerated_on_change(
+        self, tmp_path: Path, airport: Airport, runways: list[Runway]
+    ) -> None:
+        """Test changed runways or an unreadable file regenerate the layout."""
+        cache = GeneratedLayoutCache(tmp_path)
+        cache.get(airport, runways, AirportCategory.LARGE)
+
+        with patch.object(cache.taxiway_gen, "generate", wraps=cache.taxiway_gen.generate) as gen:
+            graph, _ = cache.get(airport, runways[:1], AirportCategory.LARGE)
+            cache.cache_file("KSEA").write_bytes(b"garbage")
+            cache.get(airport, runways[:1], AirportCategory.LARGE)
+            cache.get(airport, runways[:1], AirportCategory.LARGE)
+
+        assert gen.call_count == 2
+        assert graph.nodes == generate(airport, runways[:1], AirportCategory.LARGE)[0].nodes
+
+
+class TestPregenerateLayouts:
+    """Test the batch job filling the cache."""
+
+    def test_pregenerate(self, tmp_path: Path) -> None:
+        """Test layouts are cached for airports with runways."""
+        for icao in ("LFAA", "LFAB"):
+            write_gateway_cache(
+                tmp_path / f"{icao}.gwc",
+                GatewayAirportData(
+                    icao=icao,
+                    name=icao,
+                    latitude=45.0,
+                    longitude=5.0,
+                    elevation_ft=800.0,
+                    transition_altitude=5000,
+                    runways=[GatewayRunway("09", "27", 30.0, 45.0, 4.99, 45.0, 5.01, 90.0, 270.0)],
+                ),
+            )
+        write_gateway_cache(
+            tmp_path / "LFAC.gwc",
+            GatewayAirportData(
+                icao="LFAC",
+                name="No runways",
+                latitude=45.0,
+                longitude=5.0,
+                elevation_ft=800.0,
+                transition_altitude=5000,
+            ),
+        )
+
+        done = pregenerate_layouts(["LFAA", "LFAB", "LFAC"], tmp_path, workers=2)
+
+        assert done == 2
+        assert sorted(p.name for p in tmp_path.glob("*.gen.gwc")) == [
+            "LFAA.gen.gwc",
+            "LFAB.gen.gwc",
+        ]
+        assert pregenerate_layouts([], tmp_path) == 0
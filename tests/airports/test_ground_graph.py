@@ -0,0 +1,148 @@
+"""Tests for the array-backed airport ground graph."""
+
+import numpy as np
+import pytest
+
+from airborne.airports.ground_graph import (
+    EDGE_ONE_WAY,
+    NODE_HOLD_SHORT,
+    NODE_PARKING,
+    NODE_RUNWAY,
+    GroundGraph,
+    clear_ground_graphs,
+    get_ground_graph,
+)
+from airborne.airports.taxiway import TaxiwayGraph
+from airborne.physics.vectors import Vector3
+from airborne.services.atc.gateway_loader import (
+    GatewayAirportData,
+    ParkingPosition,
+    TaxiEdge,
+    TaxiNode,
+)
+from airborne.services.atc.taxiway_graph import TaxiwayGraph as ATCTaxiwayGraph
+
+
+def make_airport() -> GatewayAirportData:
+    """Create a small airport.
+
+    Runway 09/27 runs 1-2-3. Taxiway A runs 4-5-6 below it with
+    connectors B (1-4) and C (3-6); hold short nodes 7 and 8 sit on the
+    connectors. Edge 5-6 is one way, and the ramp by node 5 has a gate.
+    """
+    nodes = {
+        1: TaxiNode(1, 37.002, -122.010),
+        2: TaxiNode(2, 37.002, -122.000),
+        3: TaxiNode(3, 37.002, -121.990),
+        4: TaxiNode(4, 37.000, -122.010),
+        5: TaxiNode(5, 37.000, -122.000),
+        6: TaxiNode(6, 37.000, -121.990),
+        7: TaxiNode(7, 37.0015, -122.010, is_hold_short=True, on_runway="09/27"),
+        8: TaxiNode(8, 37.0015, -121.990, is_hold_short=True, on_runway="09/27"),
+    }
+    edges = [
+        TaxiEdge(1, 2, "09/27", is_runway=True),
+        TaxiEdge(2, 3, "09/27", is_runway=True),
+        TaxiEdge(4, 5, "A"),
+        TaxiEdge(5, 6, "A", one_way=True),
+        TaxiEdge(4, 7, "B"),
+        TaxiEdge(7, 1, "B"),
+        TaxiEdge(6, 8, "C"),
+        TaxiEdge(8, 3, "C"),
+        TaxiEdge(8, 99, "X"),
+    ]
+    parking = [ParkingPosition("Gate 1", 36.9995, -122.000, 0.0)]
+    return GatewayAirportData(
+        "TEST",
+        "Test",
+        37.0,
+        -122.0,
+        0.0,
+        18000,
+        taxi_nodes=nodes,
+        taxi_edges=edges,
+        parking_positions=parking,
+    )
+
+
+@pytest.fixture
+def graph() -> GroundGraph:
+    """Build the test airport's graph."""
+    return GroundGraph.from_gateway_data(make_airport())
+
+
+class TestGroundGraph:
+    """Test GroundGraph construction and queries."""
+
+    def test_arrays(self, graph: GroundGraph) -> None:
+        """Test node and edge arrays."""
+        assert graph.node_ids == [1, 2, 3, 4, 5, 6, 7, 8]
+        assert graph.edge_count == 8
+        assert graph.edge_length_m[0] == pytest.approx(888.6, abs=1.0)
+        assert graph.names[graph.edge_name[2]] == "A"
+        assert graph.edge_flags[3] & EDGE_ONE_WAY
+        assert graph.node_flags[0] & NODE_RUNWAY
+        assert graph.node_flags[6] & NODE_HOLD_SHORT
+        assert np.flatnonzero(graph.node_flags & NODE_PARKING).tolist() == [4]
+        assert graph.nbytes > 0
+
+    def test_adjacency(self, graph: GroundGraph) -> None:
+        """Test CSR neighbors respect one-way edges."""
+        row = graph.row
+
+        assert sorted(graph.neighbors(row(5)).tolist()) == [row(4), row(6)]
+        assert sorted(graph.neighbors(row(6)).tolist()) == [row(8)]
+        assert graph.edge_names_at(row(7)) == ["B"]
+        assert graph.edge_names_at(row(1), include_runways=True) == ["09/27", "B"]
+
+    def test_runway_queries(self, graph: GroundGraph) -> None:
+        """Test runway masks, hold short nodes and closures."""
+        assert graph.runway_edge_mask().tolist()[:3] == [True, True, False]
+        assert graph.runway_edge_mask(["27"]).sum() == 2
+        assert graph.runway_edge_mask(["18"]).sum() == 0
+        assert graph.hold_short_rows("09").tolist() == [6, 7]
+
+        costs = graph.routing_costs(closed_runways=["09/27"])
+        assert np.isinf(costs[:2]).all()
+        assert costs[2] == graph.edge_length_m[2]
+
+    def test_shortest_path(self, graph: GroundGraph) -> None:
+        """Test routing avoids runways and closed edges."""
+        row = graph.row
+
+        path = graph.shortest_path(row(5), [row(8)])
+        assert [graph.node_ids[r] for r in path] == [5, 6, 8]
+        assert graph.path_names(path) == ["A", "C"]
+
+        # Against the one-way edge, only the runway connects 8 back to 5
+        path = graph.shortest_path(row(8), [row(5)])
+        assert [graph.node_ids[r] for r in path] == [8, 3, 2, 1, 7, 4, 5]
+        closed = graph.routing_costs(closed_runways=["27"])
+        assert graph.shortest_path(row(8), [row(5)], closed) is None
+
+    def test_shared_per_airport(self) -> None:
+        """Test one graph is shared per loaded airport."""
+        clear_ground_graphs()
+        data = make_airport()
+
+        shared = get_ground_graph(data)
+        assert get_ground_graph(data) is shared
+        assert ATCTaxiwayGraph.from_gateway_data(data).ground_graph is shared
+        assert get_ground_graph(make_airport()) is not shared
+
+    def test_from_taxiway_graph(self) -> None:
+        """Test opposite directed edges become one two-way edge."""
+        taxiway_graph = TaxiwayGraph()
+        taxiway_graph.add_node("A1", Vector3(-122.0, 0, 37.0))
+        taxiway_graph.add_node("A2", Vector3(-121.99, 0, 37.0), node_type="runway")
+        taxiway_graph.add_node("G1", Vector3(-122.0, 0, 36.99), node_type="parking_gate")
+        taxiway_graph.add_edge("A1", "A2", "taxiway", name="A", bidirectional=True)
+        taxiway_graph.add_edge("G1", "A1", "apron")
+
+        graph = taxiway_graph.ground_graph
+
+        assert graph.edge_count == 2
+        assert graph.edge_flags.tolist() == [0, EDGE_ONE_WAY]
+        assert graph.node_flags.tolist() == [0, NODE_RUNWAY, NODE_PARKING]
+        assert graph.edge_type[1] == graph.name_id("apron")
+        assert [edge.name for edge in taxiway_graph.index_edges] == ["A", ""]
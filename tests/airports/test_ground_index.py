@@ -0,0 +1,177 @@
+"""Tests for the ground spatial index."""
+
+import math
+
+import numpy as np
+import pytest
+
+from airborne.airports.ground_index import GroundSpatialIndex
+from airborne.airports.taxiway import TaxiwayGraph
+from airborne.physics.vectors import Vector3
+from airborne.services.atc.taxiway_graph import GraphEdge, GraphNode
+from airborne.services.atc.taxiway_graph import TaxiwayGraph as ATCTaxiwayGraph
+
+REF_LAT = 49.0
+REF_LON = 2.55
+
+
+def segment_distance(x: float, y: float, ax: float, ay: float, bx: float, by: float) -> float:
+    """Distance from a point to a segment."""
+    dx, dy = bx - ax, by - ay
+    length_sq = dx * dx + dy * dy
+    t = 0.0 if length_sq == 0 else max(0.0, min(1.0, ((x - ax) * dx + (y - ay) * dy) / length_sq))
+    return math.hypot(x - (ax + t * dx), y - (ay + t * dy))
+
+
+@pytest.fixture
+def network() -> tuple[GroundSpatialIndex, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Random taxi network about 3 km across."""
+    rng = np.random.default_rng(7)
+    lats = REF_LAT + rng.uniform(-0.015, 0.015, 400)
+    lons = REF_LON + rng.uniform(-0.02, 0.02, 400)
+    starts = rng.integers(0, 400, 300)
+    ends = np.minimum(starts + rng.integers(1, 5, 300), 399)
+    return GroundSpatialIndex(lats, lons, starts, ends), lats, lons, starts, ends
+
+
+class TestGroundSpatialIndex:
+    """Test GroundSpatialIndex queries against brute force."""
+
+    def test_empty(self) -> None:
+        """Test queries on an empty index."""
+        index = GroundSpatialIndex([], [])
+
+        assert index.nearest_node(REF_LAT, REF_LON) is None
+        assert index.nearest_edge(REF_LAT, REF_LON) is None
+        assert index.nodes_within(REF_LAT, REF_LON, 100.0) == []
+        assert index.edges_within(REF_LAT, REF_LON, 100.0) == []
+
+    def test_nearest_node(self, network) -> None:
+        """Test nearest nodes match a linear scan."""
+        index, lats, lons, _, _ = network
+        xs, ys = zip(*(index.project(a, o) for a, o in zip(lats, lons, strict=True)), strict=True)
+        rng = np.random.default_rng(1)
+
+        for lat, lon in zip(
+            REF_LAT + rng.uniform(-0.03, 0.03, 100),
+            REF_LON + rng.uniform(-0.04, 0.04, 100),
+            strict=True,
+        ):
+            x, y = index.project(lat, lon)
+            distances = [math.hypot(x - ax, y - ay) for ax, ay in zip(xs, ys, strict=True)]
+            result = index.nearest_node(lat, lon)
+            assert result is not None
+            assert result[1] == pytest.approx(min(distances))
+
+    def test_nearest_edge(self, network) -> None:
+        """Test nearest edges match a linear scan."""
+        index, lats, lons, starts, ends = network
+        points = [index.project(a, o) for a, o in zip(lats, lons, strict=True)]
+        rng = np.random.default_rng(2)
+
+        for lat, lon in zip(
+            REF_LAT + rng.uniform(-0.02, 0.02, 100),
+            REF_LON + rng.uniform(-0.03, 0.03, 100),
+            strict=True,
+        ):
+            x, y = index.project(lat, lon)
+            distances = [
+                segment_distance(x, y, *points[a], *points[b])
+                for a, b in zip(starts, ends, strict=True)
+            ]
+            result = index.nearest_edge(lat, lon)
+            assert result is not None
+            assert result[1] == pytest.approx(min(distances))
+
+    def test_edges_within(self, network) -> None:
+        """Test radius queries and masks."""
+        index, lats, lons, starts, ends = network
+        points = [index.project(a, o) for a, o in zip(lats, lons, strict=True)]
+        mask = np.arange(len(starts)) % 2 == 0
+        x, y = index.project(REF_LAT, REF_LON)
+        distances = [
+            segment_distance(x, y, *points[a], *points[b])
+            for a, b in zip(starts, ends, strict=True)
+        ]
+
+        found = index.edges_within(REF_LAT, REF_LON, 150.0)
+        masked = index.edges_within(REF_LAT, REF_LON, 150.0, mask=mask)
+
+        assert {i for i, _ in found} == {i for i, d in enumerate(distances) if d <= 150.0}
+        assert {i for i, _ in masked} == {i for i, _ in found if mask[i]}
+        assert [d for _, d in found] == sorted(d for _, d in found)
+
+    def test_max_distance(self, network) -> None:
+        """Test nothing is returned beyond max_distance_m."""
+        index = network[0]
+
+        assert index.nearest_node(REF_LAT + 1.0, REF_LON, 500.0) is None
+        assert index.nearest_edge(REF_LAT + 1.0, REF_LON, 500.0) is None
+        assert index.nearest_node(REF_LAT + 1.0, REF_LON) is not None
+        assert index.nearest_edge(REF_LAT + 1.0, REF_LON) is not None
+
+    def test_nearest_by_ties_to_lowest_index(self) -> None:
+        """Test caller metrics decide the winner, ties going to the lowest index."""
+        index = GroundSpatialIndex([REF_LAT, REF_LAT, REF_LAT + 0.001], [REF_LON] * 3)
+
+        assert index.nearest_node_by(REF_LAT, REF_LON, lambda i: 5.0) == (0, 5.0)
+        assert index.nearest_node_by(REF_LAT, REF_LON, lambda i: 5.0 - i) == (1, 4.0)
+        assert index.nearest_node_by(REF_LAT, REF_LON, lambda i: 5.0, 5.0) is None
+
+
+class TestTaxiwayGraphIndex:
+    """Test TaxiwayGraph queries backed by the index."""
+
+    @pytest.fixture
+    def graph(self) -> TaxiwayGraph:
+        """Create an L-shaped taxiway."""
+        graph = TaxiwayGraph()
+        graph.add_node("A1", Vector3(REF_LON, 0, REF_LAT))
+        graph.add_node("A2", Vector3(REF_LON + 0.01, 0, REF_LAT))
+        graph.add_node("B1", Vector3(REF_LON + 0.01, 0, REF_LAT + 0.01))
+        graph.add_edge("A1", "A2", "taxiway", name="A")
+        graph.add_edge("A2", "B1", "runway", name="B")
+        return graph
+
+    def test_find_nearest_edge(self, graph: TaxiwayGraph) -> None:
+        """Test nearest edge lookup with type filter."""
+        position = Vector3(REF_LON + 0.005, 0, REF_LAT + 0.0001)
+
+        edge, distance = graph.find_nearest_edge(position)
+        assert edge.name == "A"
+        assert distance == pytest.approx(11.1, abs=0.2)
+
+        edge, _ = graph.find_nearest_edge(position, edge_type="runway")
+        assert edge.name == "B"
+        assert graph.find_nearest_edge(position, max_distance_m=5.0) is None
+
+    def test_index_rebuilt_after_changes(self, graph: TaxiwayGraph) -> None:
+        """Test added nodes are found."""
+        position = Vector3(REF_LON - 0.002, 0, REF_LAT + 0.002)
+        assert graph.find_nearest_node(position, max_distance_m=500.0) == "A1"
+
+        graph.add_node("C1", position)
+
+        assert graph.find_nearest_node(position) == "C1"
+
+
+class TestATCTaxiwayGraphIndex:
+    """Test the ATC taxiway graph queries backed by the index."""
+
+    def test_nearest_node_and_edge(self) -> None:
+        """Test nearest lookups and rebuild after adding nodes."""
+        graph = ATCTaxiwayGraph()
+        graph.nodes = {
+            10: GraphNode(10, REF_LAT, REF_LON),
+            20: GraphNode(20, REF_LAT, REF_LON + 0.01),
+        }
+        graph.edges = [GraphEdge(10, 20, "A", 730.0)]
+
+        assert graph.find_nearest_node(REF_LAT + 0.001, REF_LON + 0.008) == 20
+        edge, distance = graph.find_nearest_edge(REF_LAT + 0.001, REF_LON + 0.005)
+        assert edge.name == "A"
+        assert distance == pytest.approx(111.3, abs=0.5)
+        assert graph.find_edges_within(REF_LAT + 0.001, REF_LON + 0.005, 100.0) == []
+
+        graph.nodes[30] = GraphNode(30, REF_LAT + 0.001, REF_LON + 0.008)
+        assert graph.find_nearest_node(REF_LAT + 0.001, REF_LON + 0.008) == 30
@@ -0,0 +1,170 @@
+"""Tests for precomputed runway geometry."""
+
+import pytest
+
+from airborne.airports.database import Runway, SurfaceType
+from airborne.airports.ground_graph import EDGE_RUNWAY, NODE_HOLD_SHORT, GroundGraph, haversine_m
+from airborne.airports.layout import LayoutRunway
+from airborne.airports.runway_geometry import DEFAULT_HOLD_MARGIN_M, RunwayGeometry
+from airborne.physics.vectors import Vector3
+
+# East-west runway 09/27, 30 m wide, about 1760 m long
+WEST = (37.5, -122.01)
+EAST = (37.5, -121.99)
+METERS_PER_DEGREE_LAT = 111_320.0
+
+
+def north_of(distance_m: float, lon: float = -122.0) -> tuple[float, float]:
+    """Get the position a distance north of the runway centerline."""
+    return (37.5 + distance_m / METERS_PER_DEGREE_LAT, lon)
+
+
+@pytest.fixture
+def geometry() -> RunwayGeometry:
+    """Create geometry for runway 09/27."""
+    return RunwayGeometry([("09", "27")], [WEST[0]], [WEST[1]], [EAST[0]], [EAST[1]], [30.0])
+
+
+@pytest.fixture
+def ground_graph() -> GroundGraph:
+    """Create a ground graph with the runway, a hold short node 50 m north and taxiway A."""
+    hold = north_of(50.0)
+    taxiway = north_of(150.0)
+    return GroundGraph(
+        ["R09", "R27", "H", "T"],
+        [WEST[0], EAST[0], hold[0], taxiway[0]],
+        [WEST[1], EAST[1], hold[1], taxiway[1]],
+        [0, 2],
+        [1, 3],
+        [1760.0, 100.0],
+        names=["", "09/27", "A"],
+        node_flags=[0, 0, NODE_HOLD_SHORT, 0],
+        node_runway=[0, 0, 1, 0],
+        edge_name=[1, 2],
+        edge_flags=[EDGE_RUNWAY, 0],
+    )
+
+
+class TestRunwayGeometry:
+    """Test building runway geometry and proximity queries."""
+
+    def test_from_runways(self) -> None:
+        """Test database runways are projected with their width in meters."""
+        runway = Runway(
+            airport_icao="TEST",
+            runway_id="09/27",
+            length_ft=5800,
+            width_ft=100,
+            surface=SurfaceType.ASPH,
+            lighted=True,
+            closed=False,
+            le_ident="09",
+            le_latitude=WEST[0],
+            le_longitude=WEST[1],
+            le_elevation_ft=10,
+            le_heading_deg=90,
+            he_ident="27",
+            he_latitude=EAST[0],
+            he_longitude=EAST[1],
+            he_elevation_ft=10,
+            he_heading_deg=270,
+        )
+
+        geometry = RunwayGeometry.from_runways([runway])
+
+        assert geometry.names == ["09/27"]
+        assert geometry.width_m[0] == pytest.approx(30.48)
+        assert geometry.length_m[0] == pytest.approx(haversine_m(*WEST, *EAST), rel=0.01)
+
+    def test_distances_beside_and_beyond(self, geometry: RunwayGeometry) -> None:
+        """Test distances to the centerline and the pavement."""
+        beside = geometry.query(*north_of(40.0))
+        beyond = geometry.query(37.5, -122.01 - 100.0 / 88_300.0)
+
+        assert beside.centerline_m[0] == pytest.approx(40.0)
+        assert beside.distance_m[0] == pytest.approx(25.0)
+        assert beside.hold_line_m[0] == pytest.approx(25.0 - DEFAULT_HOLD_MARGIN_M)
+        assert beyond.centerline_m[0] == pytest.approx(100.0, rel=0.01)
+        assert beyond.distance_m[0] == pytest.approx(beyond.centerline_m[0])
+        assert not beside.on_runway[0]
+        assert not beside.in_protected_zone[0]
+
+    def test_on_runway_and_protected_zone(self, geometry: RunwayGeometry) -> None:
+        """Test positions on the pavement and between it and the hold lines."""
+        on_pavement = geometry.query(*north_of(10.0))
+        past_hold_line = geometry.query(*north_of(20.0))
+
+        assert on_pavement.on_runway[0]
+        assert on_pavement.distance_m[0] == 0.0
+        assert on_pavement.centerline_m[0] == pytest.approx(10.0)
+        assert not past_hold_line.on_runway[0]
+        assert past_hold_line.in_protected_zone[0]
+        assert past_hold_line.hold_line_m[0] == 0.0
+
+    def test_from_layout(self) -> None:
+        """Test layout runway directions measure distance from their own threshold."""
+        geometry = RunwayGeometry.from_layout(
+            [
+                LayoutRunway(
+                    "09", Vector3(WEST[1], 0, WEST[0]), Vector3(EAST[1], 0, EAST[0]), 30, 90
+                ),
+                LayoutRunway(
+                    "27", Vector3(EAST[1], 0, EAST[0]), Vector3(WEST[1], 0, WEST[0]), 30, 270
+                ),
+            ]
+        )
+
+        proximity = geometry.query(37.5, -122.009)
+
+        assert geometry.names == ["09", "27"]
+        assert proximity.threshold_m[0] < proximity.threshold_m[1]
+        assert geometry.runway_index("09/27") == 0
+        assert geometry.runway_index("27") == 1
+        assert geometry.runway_index("18") is None
+
+    def test_nearest(self) -> None:
+        """Test the runway with the nearest pavement is found."""
+        geometry = RunwayGeometry(
+            [("09", "27"), ("18", "36")],
+            [37.5, 37.49],
+            [-122.01, -122.03],
+            [37.5, 37.51],
+            [-121.99, -122.03],
+            [30.0, 20.0],
+        )
+
+        assert geometry.query(*north_of(100.0)).nearest() == 0
+        assert geometry.query(37.5, -122.029).nearest() == 1
+        assert RunwayGeometry([], [], [], [], [], []).query(37.5, -122.0).nearest() is None
+
+    def test_hold_lines_from_ground_graph(
+        self, geometry: RunwayGeometry, ground_graph: GroundGraph
+    ) -> None:
+        """Test hold lines move to the graph's hold short nodes."""
+        geometry.set_ground_graph(ground_graph)
+
+        assert geometry.hold_margin_m[0] == pytest.approx(35.0)
+        assert geometry.query(*north_of(45.0)).in_protected_zone[0]
+        assert not geometry.query(*north_of(55.0)).in_protected_zone[0]
+
+        geometry.set_ground_graph(None)
+        assert geometry.query(*north_of(45.0)).hold_line_m[0] == pytest.approx(
+            45.0 - 15.0 - DEFAULT_HOLD_MARGIN_M
+        )
+
+    def test_current_edge(self, geometry: RunwayGeometry, ground_graph: GroundGraph) -> None:
+        """Test the current edge decides whether the aircraft is on a runway edge."""
+        geometry.set_ground_graph(ground_graph)
+        off_pavement = north_of(20.0)
+
+        assert geometry.query(*off_pavement, edge=0).on_runway[0]
+        assert not geometry.query(*off_pavement, edge=1).on_runway[0]
+
+    def test_runway_edges_near_position(self, ground_graph: GroundGraph) -> None:
+        """Test runway edges are looked up around the position without an edge."""
+        narrow = RunwayGeometry([("09", "27")], [WEST[0]], [WEST[1]], [EAST[0]], [EAST[1]], [10.0])
+        narrow.set_ground_graph(ground_graph)
+
+        assert narrow.query(*north_of(8.0)).on_runway[0]
+        assert narrow.query(*north_of(8.0)).distance_m[0] == 0.0
+        assert not narrow.query(*north_of(12.0)).on_runway[0]
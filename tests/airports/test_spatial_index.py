@@ -1,8 +1,9 @@
 """Tests for Spatial Index."""
 
+import numpy as np
 import pytest
 
-from airborne.airports.spatial_index import SpatialIndex
+from airborne.airports.spatial_index import SpatialIndex, haversine_distances_nm
 from airborne.physics.vectors import Vector3
 
 
@@ -202,6 +203,26 @@ class TestSpatialIndexEdgeCases:
         assert "WEST" in data
         # Note: May or may not find EAST depending on cell boundaries
 
+    def test_query_radius_across_date_line(self, index: SpatialIndex) -> None:
+        """Test cells on both sides of the date line are searched."""
+        index.insert(Vector3(179.9, 0, 10), "WEST")
+        index.insert(Vector3(-179.9, 0, 10), "EAST")
+
+        nearby = index.query_radius(Vector3(179.95, 0, 10), radius_nm=20)
+        nearest = index.query_knn(Vector3(-179.95, 0, 10), k=2)
+
+        assert {item[0] for item in nearby} == {"WEST", "EAST"}
+        assert {item[0] for item in nearest} == {"WEST", "EAST"}
+
+    def test_query_radius_near_pole(self, index: SpatialIndex) -> None:
+        """Test longitude cells widen near the poles."""
+        index.insert(Vector3(0, 0, 89.5), "A")
+        index.insert(Vector3(180, 0, 89.5), "B")  # 60 nm away, over the pole
+
+        nearby = index.query_radius(Vector3(0, 0, 89.5), radius_nm=61)
+
+        assert [item[0] for item in nearby] == ["A", "B"]
+
     def test_multiple_items_same_position(self, index: SpatialIndex) -> None:
         """Test inserting multiple items at same position."""
         pos = Vector3(-122.0, 0, 37.5)
@@ -225,6 +246,125 @@ class TestSpatialIndexEdgeCases:
         assert coarse_index.get_cell_count() == 1
 
 
+class TestSpatialIndexNearest:
+    """Test k-nearest queries and removal."""
+
+    @pytest.fixture
+    def populated_index(self) -> SpatialIndex:
+        """Create index with a line of items 1 degree apart."""
+        index = SpatialIndex(cell_size_deg=1.0)
+        for i in range(20):
+            index.insert(Vector3(i * 1.0, 0, 0), f"P{i}")
+        return index
+
+    def test_query_knn(self, populated_index: SpatialIndex) -> None:
+        """Test the k nearest items are returned in order."""
+        nearest = populated_index.query_knn(Vector3(10.2, 0, 0), k=3)
+
+        assert [item[0] for item in nearest] == ["P10", "P11", "P9"]
+        assert nearest[0][1] == pytest.approx(12.0, abs=0.1)
+
+    def test_query_knn_far_from_items(self, populated_index: SpatialIndex) -> None:
+        """Test rings keep growing until items are found."""
+        nearest = populated_index.query_knn(Vector3(-60.0, 0, 0), k=1)
+
+        assert nearest[0][0] == "P0"
+
+    def test_query_knn_max_radius(self, populated_index: SpatialIndex) -> None:
+        """Test max radius limits results."""
+        nearest = populated_index.query_knn(Vector3(10.0, 0, 0), k=5, max_radius_nm=70)
+
+        assert nearest[0][0] == "P10"
+        assert {item[0] for item in nearest[1:]} == {"P9", "P11"}
+
+    def test_query_knn_predicate(self, populated_index: SpatialIndex) -> None:
+        """Test predicate filters candidates."""
+        nearest = populated_index.query_knn(
+            Vector3(10.0, 0, 0), k=2, predicate=lambda data: data.endswith("5")
+        )
+
+        assert [item[0] for item in nearest] == ["P5", "P15"]
+
+    def test_query_knn_more_than_available(self, populated_index: SpatialIndex) -> None:
+        """Test asking for more items than indexed returns all of them."""
+        assert len(populated_index.query_knn(Vector3(0, 0, 0), k=50)) == 20
+        assert SpatialIndex().query_knn(Vector3(0, 0, 0), k=5) == []
+
+    def test_remove(self, populated_index: SpatialIndex) -> None:
+        """Test removing an item."""
+        assert populated_index.remove(Vector3(10.0, 0, 0), "P10")
+        assert not populated_index.remove(Vector3(10.0, 0, 0), "P10")
+
+        assert populated_index.get_item_count() == 19
+        assert populated_index.query_knn(Vector3(10.0, 0, 0), k=1)[0][0] in ("P9", "P11")
+        assert populated_index.query_radius(Vector3(10.0, 0, 0), radius_nm=1) == []
+
+
+POINT_COUNT = 100_000
+
+
+@pytest.fixture(scope="module")
+def points() -> tuple[SpatialIndex, np.ndarray, np.ndarray]:
+    """Create an index with points spread uniformly over the sphere."""
+    rng = np.random.default_rng(42)
+    lats = np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, POINT_COUNT)))
+    lons = rng.uniform(-180.0, 180.0, POINT_COUNT)
+
+    index = SpatialIndex(cell_size_deg=1.0)
+    for i, (lat, lon) in enumerate(zip(lats.tolist(), lons.tolist(), strict=True)):
+        index.insert(Vector3(lon, 0, lat), i)
+    return index, lats, lons
+
+
+class TestSpatialIndexBruteForce:
+    """Compare queries over 100k random points with a brute-force scan."""
+
+    QUERIES = [
+        (48.0, 2.0),
+        (0.0, 0.0),
+        (-33.9, 151.2),
+        (10.0, 179.95),
+        (-10.0, -179.95),
+        (89.9, 45.0),
+        (-89.95, 0.0),
+    ]
+
+    @pytest.mark.parametrize(("lat", "lon"), QUERIES)
+    @pytest.mark.parametrize("radius_nm", [5.0, 60.0, 500.0])
+    def test_query_radius(
+        self,
+        points: tuple[SpatialIndex, np.ndarray, np.ndarray],
+        lat: float,
+        lon: float,
+        radius_nm: float,
+    ) -> None:
+        """Test radius queries return exactly the points within radius."""
+        index, lats, lons = points
+        distances = haversine_distances_nm(lat, lon, lats, lons)
+
+        results = index.query_radius(Vector3(lon, 0, lat), radius_nm)
+
+        assert {data for data, _ in results} == set(np.flatnonzero(distances <= radius_nm))
+        assert [d for _, d in results] == sorted(d for _, d in results)
+
+    @pytest.mark.parametrize(("lat", "lon"), QUERIES)
+    @pytest.mark.parametrize("k", [1, 10, 100])
+    def test_query_knn(
+        self,
+        points: tuple[SpatialIndex, np.ndarray, np.ndarray],
+        lat: float,
+        lon: float,
+        k: int,
+    ) -> None:
+        """Test k-nearest queries return the k smallest distances."""
+        index, lats, lons = points
+        distances = haversine_distances_nm(lat, lon, lats, lons)
+
+        results = index.query_knn(Vector3(lon, 0, lat), k)
+
+        assert [d for _, d in results] == pytest.approx(np.sort(distances)[:k].tolist())
+
+
 class TestRealWorldDistances:
     """Test with real-world airport distances."""
 
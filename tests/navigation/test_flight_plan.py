@@ -14,6 +14,7 @@ from airborne.navigation.flight_plan import (
     SpeedConstraint,
 )
 from airborne.navigation.navdata import Navaid, NavaidType, NavDatabase
+from airborne.navigation.navdata_store import NavDataStore
 from airborne.physics.vectors import Vector3
 
 
@@ -604,3 +605,51 @@ class TestFlightPlanManager:
 
         assert len(errors) > 0
         assert any("duplicate" in err.lower() for err in errors)
+
+    @pytest.fixture
+    def airway_nav_db(self):
+        """Create navigation database with a 5000-fix airway heading north from KPAO."""
+        records = [
+            {"ident": f"F{i:04d}", "type": "FIX", "lat": 37.5 + i * 0.01, "lon": -122.1}
+            for i in range(5000)
+        ]
+        airways = [(i, i + 1, "J1", 2) for i in range(4999)]
+        airways += [(i + 1, i, "J1", 2) for i in range(4999)]
+
+        nav_db = NavDatabase()
+        nav_db.store = NavDataStore.from_records(records, airways)
+        return nav_db
+
+    def test_create_route_with_airway(self, airway_nav_db, sample_airports):
+        """Test route strings expand airways into waypoints."""
+        manager = FlightPlanManager(airway_nav_db)
+        kpao, ksfo = sample_airports
+
+        plan = manager.create_direct_route(kpao, ksfo, 35000, "B738", route="F0000 J1 F4999")
+
+        assert plan.route_string == "F0000 J1 F4999"
+        assert len(plan.route) == 5002
+        assert plan.route[1].navaid.identifier == "F0000"
+        assert plan.route[-2].navaid.identifier == "F4999"
+        assert plan.route[1].altitude_ft == 35000
+        assert manager.validate_route(plan) == []
+
+    def test_create_route_unknown_waypoint(self, airway_nav_db, sample_airports):
+        """Test unresolvable route strings are rejected."""
+        manager = FlightPlanManager(airway_nav_db)
+        kpao, ksfo = sample_airports
+
+        with pytest.raises(ValueError, match="NOWHERE"):
+            manager.create_direct_route(kpao, ksfo, 35000, "B738", route="F0000 J1 NOWHERE")
+
+    def test_validate_route_airway_errors(self, airway_nav_db, sample_airports):
+        """Test validation reports route string errors."""
+        manager = FlightPlanManager(airway_nav_db)
+        kpao, ksfo = sample_airports
+
+        plan = manager.create_direct_route(kpao, ksfo, 35000, "B738")
+        plan.route_string = "F0010 J2 F0020"
+
+        errors = manager.validate_route(plan)
+
+        assert errors == ["Unknown waypoint or airway: J2"]
@@ -286,6 +286,31 @@ class TestNavDatabase:
         assert len(vors) == 1
         assert vors[0].identifier == "SFO"
 
+    def test_find_nearest_navaids(self):
+        """Test finding the nearest navaids with optional type filter."""
+        db = NavDatabase()
+        db.add_navaid(
+            Navaid("SFO", "San Francisco VOR", NavaidType.VOR, Vector3(-122.379, 13, 37.621))
+        )
+        db.add_navaid(Navaid("OAK", "Oakland VOR", NavaidType.VOR, Vector3(-122.224, 0, 37.726)))
+        db.add_navaid(Navaid("MODET", "MODET", NavaidType.WAYPOINT, Vector3(-122.4, 0, 37.6)))
+
+        nearest = db.find_nearest_navaids(Vector3(-122.4, 0, 37.6), 2)
+        nearest_vor = db.find_nearest_navaids(Vector3(-122.4, 0, 37.6), 1, NavaidType.VOR)
+
+        assert [navaid.identifier for navaid, _ in nearest] == ["MODET", "SFO"]
+        assert nearest[0][1] == pytest.approx(0.0)
+        assert [navaid.identifier for navaid, _ in nearest_vor] == ["SFO"]
+
+    def test_find_navaids_near_after_replace(self):
+        """Test replacing a navaid moves it in the spatial index."""
+        db = NavDatabase()
+        db.add_navaid(Navaid("SFO", "Old", NavaidType.VOR, Vector3(-122.379, 13, 37.621)))
+        db.add_navaid(Navaid("SFO", "New", NavaidType.VOR, Vector3(2.0, 0, 48.0)))
+
+        assert db.find_navaids_near(Vector3(-122.379, 13, 37.621), radius_nm=10) == []
+        assert [n.name for n in db.find_navaids_near(Vector3(2.0, 0, 48.0), 10)] == ["New"]
+
     def test_find_navaids_by_type(self):
         """Test finding all navaids of a specific type."""
         db = NavDatabase()
@@ -0,0 +1,263 @@
+"""Tests for the array-backed worldwide navigation data store."""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from airborne.airports.spatial_index import haversine_distances_nm
+from airborne.navigation.navdata import NavaidType, NavDatabase
+from airborne.navigation.navdata_store import NavDataStore
+from airborne.physics.vectors import Vector3
+
+EARTH_NAV = """I
+1150 Version - data cycle 2301, build 20230101, metadata NavXP1150.
+
+ 3  37.619472222 -122.373888889     13 11580  130   17.000 SFO  ENRT K2 SAN FRANCISCO VOR/DME
+ 3  37.725916667 -122.223583333      9 11680  130   17.000 OAK  ENRT K2 OAKLAND VORTAC
+ 2  37.740000000 -122.210000000      0   362   25    0.000 OA   ENRT K2 OAKLAND NDB
+ 4  37.611000000 -122.357000000     13 10990   18  297.000 ISFO KSFO K2 28L ILS-cat-III
+12  37.619472222 -122.373888889     13 11580  130    0.000 SFO  ENRT K2 SAN FRANCISCO VOR/DME
+13  37.500000000 -122.000000000    100 11300   40    0.000 XYZ  ENRT K2 TEST DME
+ 3  48.725000000    2.383333333    292 11130  130    0.000 SFO  ENRT LF SAFO VOR
+99
+"""
+
+EARTH_FIX = """I
+1101 Version - data cycle 2301, build 20230101, metadata FixXP1101.
+
+ 37.650000000 -122.330000000  ALPHA ENRT K2 2105430
+ 37.690000000 -122.290000000  BRAVO ENRT K2 2105430
+ 48.000000000    2.000000000  ALPHA ENRT LF 2105430
+ 37.800000000 -122.100000000  DELTA ENRT K2 2105430
+bad line
+99
+"""
+
+# SFO -ALPHA-BRAVO- OAK on V25 (both ways); OAK -> DELTA on one-way Q1
+EARTH_AWY = """I
+1100 Version - data cycle 2301, build 20230101, metadata AwyXP1100.
+
+SFO   K2  3 ALPHA K2 11 N 1   0 180 V25
+ALPHA K2 11 BRAVO K2 11 N 1   0 180 V25-V27
+BRAVO K2 11 OAK   K2  3 N 1   0 180 V25
+OAK   K2  3 DELTA K2 11 F 2 180 450 Q1
+NOPE  K2 11 DELTA K2 11 N 1   0 180 V99
+99
+"""
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    """Write small X-Plane navigation files."""
+    (tmp_path / "earth_nav.dat").write_text(EARTH_NAV)
+    (tmp_path / "earth_fix.dat").write_text(EARTH_FIX)
+    (tmp_path / "earth_awy.dat").write_text(EARTH_AWY)
+    return tmp_path
+
+
+@pytest.fixture
+def store(data_dir: Path) -> NavDataStore:
+    """Build a store from the small X-Plane files."""
+    return NavDataStore.from_xplane(
+        nav_path=data_dir / "earth_nav.dat",
+        fix_path=data_dir / "earth_fix.dat",
+        awy_path=data_dir / "earth_awy.dat",
+    )
+
+
+def row_of(store: NavDataStore, ident: str, region: str) -> int:
+    """Get the row of an identifier in a region."""
+    rows = [row for row in store.find(ident).tolist() if store.region[row] == region.encode()]
+    assert len(rows) == 1
+    return int(rows[0])
+
+
+class TestNavDataStore:
+    """Test parsing, partitions and queries."""
+
+    def test_parse_xplane(self, store: NavDataStore) -> None:
+        """Test stations and fixes are parsed; ILS parts and paired DMEs are skipped."""
+        assert len(store) == 9
+        assert store.types == ["DME", "FIX", "NDB", "VOR"]
+
+        oak = row_of(store, "OAK", "K2")
+        assert store.type_name(oak) == "VOR"
+        assert store.name(oak) == "OAKLAND VORTAC"
+        assert store.frequency[oak] == pytest.approx(116.8)
+        assert store.elevation_m[oak] == pytest.approx(9 * 0.3048)
+        assert store.frequency[row_of(store, "OA", "K2")] == pytest.approx(362.0)
+
+    def test_type_partitions(self, store: NavDataStore) -> None:
+        """Test each type is a contiguous block of rows."""
+        fixes = store.type_rows("FIX")
+
+        assert len(fixes) == 4
+        assert all(store.type_name(row) == "FIX" for row in fixes.tolist())
+        assert len(store.type_rows("VOR")) == 3
+        assert len(store.type_rows("WAYPOINT")) == 0
+
+    def test_find_duplicates(self, store: NavDataStore) -> None:
+        """Test identifiers shared between regions return every row."""
+        assert len(store.find("SFO")) == 2
+        assert len(store.find("ALPHA")) == 2
+        assert len(store.find("ZZZZZZZZ")) == 0
+
+    def test_query_radius(self, store: NavDataStore) -> None:
+        """Test radius query with and without type filter."""
+        rows, distances = store.query_radius(37.62, -122.37, 7.0)
+
+        assert [store.ident[row].decode() for row in rows.tolist()] == ["SFO", "ALPHA", "BRAVO"]
+        assert list(distances) == sorted(distances)
+
+        vors, _ = store.query_radius(37.62, -122.37, 20.0, types=["VOR"])
+        assert [store.ident[row].decode() for row in vors.tolist()] == ["SFO", "OAK"]
+
+    def test_query_nearest(self, store: NavDataStore) -> None:
+        """Test nearest query expands until enough rows are found."""
+        rows, _ = store.query_nearest(48.5, 2.2, 2)
+
+        assert [store.ident[row].decode() for row in rows.tolist()] == ["SFO", "ALPHA"]
+
+    def test_airway_graph(self, store: NavDataStore) -> None:
+        """Test airway adjacency, direction and shared segments."""
+        sfo, alpha = row_of(store, "SFO", "K2"), row_of(store, "ALPHA", "K2")
+        bravo, oak = row_of(store, "BRAVO", "K2"), row_of(store, "OAK", "K2")
+        delta = row_of(store, "DELTA", "K2")
+
+        assert store.airway_path("V25", sfo, oak) == [sfo, alpha, bravo, oak]
+        assert store.airway_path("V25", oak, sfo) == [oak, bravo, alpha, sfo]
+        assert store.airway_path("Q1", oak, delta) == [oak, delta]
+        assert store.airway_path("Q1", delta, oak) is None  # One-way
+        assert store.airway_path("V27", sfo, oak) is None
+        assert store.airways_at(alpha) == ["V25", "V27"]
+        assert store.airway_id("V99") is None  # Segment with an unknown fix
+
+    def test_save_and_load(self, store: NavDataStore, tmp_path: Path) -> None:
+        """Test the .npz round trip keeps columns and airways."""
+        path = tmp_path / "navdata.npz"
+        store.save(path)
+
+        loaded = NavDataStore.load(path)
+
+        assert len(loaded) == len(store)
+        assert np.array_equal(loaded.ident, store.ident)
+        assert loaded.airway_names == store.airway_names
+        sfo, oak = row_of(loaded, "SFO", "K2"), row_of(loaded, "OAK", "K2")
+        assert loaded.airway_path("V25", sfo, oak) == store.airway_path("V25", sfo, oak)
+
+    def test_large_store_matches_brute_force(self) -> None:
+        """Test radius queries over 50k random fixes against a full scan."""
+        rng = np.random.default_rng(3)
+        lats = np.degrees(np.arcsin(rng.uniform(-1, 1, 50_000)))
+        lons = rng.uniform(-180, 180, 50_000)
+        types = rng.choice(["FIX", "VOR", "NDB"], 50_000)
+        store = NavDataStore.from_records(
+            {"ident": f"F{i}", "type": str(t), "lat": lat, "lon": lon}
+            for i, (lat, lon, t) in enumerate(zip(lats, lons, types, strict=True))
+        )
+
+        for lat, lon in [(45.0, 7.0), (0.0, 179.9), (-89.0, 0.0)]:
+            rows, _ = store.query_radius(lat, lon, 300.0, types=["VOR"])
+            distances = haversine_distances_nm(lat, lon, lats, lons)
+            expected = np.flatnonzero((distances <= 300.0) & (types == "VOR"))
+            found = {int(store.ident[row][1:]) for row in rows.tolist()}
+            assert found == set(expected.tolist())
+
+
+class TestNavDatabaseWorldwideData:
+    """Test NavDatabase on top of the store."""
+
+    @pytest.fixture
+    def db(self, data_dir: Path) -> NavDatabase:
+        """Create a database with the X-Plane data loaded."""
+        db = NavDatabase()
+        assert db.load_xplane_data(data_dir) == 9
+        return db
+
+    def test_load_writes_cache(self, db: NavDatabase, data_dir: Path) -> None:
+        """Test the parsed data is cached and reused."""
+        cache = data_dir / "navdata.npz"
+        assert cache.exists()
+
+        # An up-to-date cache is used even if the sources become unreadable
+        for name in ("earth_nav.dat", "earth_fix.dat", "earth_awy.dat"):
+            path = data_dir / name
+            stat = path.stat()
+            path.write_text("I\n1100\n")
+            os.utime(path, (stat.st_atime, cache.stat().st_mtime - 10))
+
+        reloaded = NavDatabase()
+        assert reloaded.load_xplane_data(data_dir) == 9
+
+    def test_load_missing_directory(self, tmp_path: Path) -> None:
+        """Test loading from a directory without data."""
+        with pytest.raises(FileNotFoundError):
+            NavDatabase().load_xplane_data(tmp_path)
+
+    def test_lookups(self, db: NavDatabase) -> None:
+        """Test identifier, type and proximity lookups include the store."""
+        sfo = db.find_navaid("SFO")
+
+        assert sfo is not None
+        assert sfo.type == NavaidType.VOR
+        assert db.find_navaid("SFO") is sfo  # Materialized once
+        assert len(db.find_navaids("ALPHA")) == 2
+        assert len(db.find_navaids_by_type(NavaidType.FIX)) == 4
+        assert db.count() == 9
+
+        nearby = db.find_navaids_near(Vector3(-122.37, 0, 37.62), 10, NavaidType.FIX)
+        assert [n.identifier for n in nearby] == ["ALPHA", "BRAVO"]
+
+        nearest = db.find_nearest_navaids(Vector3(-122.37, 0, 37.62), 1, NavaidType.NDB)
+        assert nearest[0][0].identifier == "OA"
+
+    def test_added_navaids_take_precedence(self, db: NavDatabase) -> None:
+        """Test navaids added directly are merged with store results."""
+        from airborne.navigation.navdata import Navaid
+
+        db.add_navaid(Navaid("HOME", "Home", NavaidType.WAYPOINT, Vector3(-122.36, 0, 37.62)))
+
+        nearby = db.find_navaids_near(Vector3(-122.37, 0, 37.62), 2)
+
+        assert [n.identifier for n in nearby] == ["SFO", "HOME"]
+        assert db.count() == 10
+
+    def test_resolve_route(self, db: NavDatabase) -> None:
+        """Test airway expansion and nearest-duplicate resolution."""
+        route = db.resolve_route("SFO V25 OAK DCT DELTA", origin=Vector3(-122.1, 0, 37.4))
+
+        assert [n.identifier for n in route] == ["SFO", "ALPHA", "BRAVO", "OAK", "DELTA"]
+        assert route[0].position.z == pytest.approx(37.619, abs=0.01)  # Not the French SFO
+
+        # ALPHA near Paris is nearer, but only the Californian one is on V25
+        route = db.resolve_route("ALPHA V25 OAK", origin=Vector3(2.0, 0, 48.0))
+        assert route[0].position.z == pytest.approx(37.65)
+
+    def test_check_route(self, db: NavDatabase) -> None:
+        """Test route errors are reported."""
+        assert db.check_route("SFO V25 OAK") == []
+        assert db.check_route("DCT") == []
+        assert db.check_route("SFO V25 NOWHERE") == [
+            "NOWHERE is not reachable from SFO on airway V25"
+        ]
+        assert db.check_route("DELTA Q1 OAK") == ["OAK is not reachable from DELTA on airway Q1"]
+        assert db.check_route("V25 OAK") == ["Airway V25 must be between two waypoints"]
+        assert db.check_route("SFO XXXXX") == ["Unknown waypoint or airway: XXXXX"]
+
+        with pytest.raises(ValueError, match="XXXXX"):
+            db.resolve_route("SFO XXXXX")
+
+    def test_get_airway_fixes(self, db: NavDatabase) -> None:
+        """Test getting the fixes along an airway."""
+        fixes = db.get_airway_fixes("V27", "ALPHA", "BRAVO")
+
+        assert [n.identifier for n in fixes] == ["ALPHA", "BRAVO"]
+
+    def test_clear(self, db: NavDatabase) -> None:
+        """Test clear drops the store."""
+        db.clear()
+
+        assert db.count() == 0
+        assert db.find_navaid("SFO") is None
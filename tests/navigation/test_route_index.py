@@ -0,0 +1,333 @@
+"""Tests for the compiled route index and itinerary search."""
+
+import csv
+import heapq
+import os
+import random
+from pathlib import Path
+
+import pytest
+
+from airborne.airports.airport_index import AirportIndex
+from airborne.navigation.routes import (
+    Itinerary,
+    OpenFlightsProvider,
+    RouteIndex,
+    _pair_distances_nm,
+    _read_routes_file,
+)
+
+ROUTES = """AF,137,BOD,1264,CDG,1382,,0,320 321
+AF,137,CDG,1382,JFK,3797,,0,77W
+DL,2009,CDG,1382,JFK,3797,Y,0,333
+AF,137,BOD,1264,ORY,1386,,0,319
+AF,137,ORY,1386,JFK,3797,,1,332
+BA,1355,BOD,1264,LHR,507,,0,320
+BA,1355,LHR,507,JFK,3797,,0,388 744
+AA,24,JFK,3797,LAX,3484,,0,738
+\\N,\\N,LAX,3484,\\N,\\N,,0,\\N
+"""
+
+COORDINATES = {
+    "BOD": (44.83, -0.72),
+    "CDG": (49.01, 2.55),
+    "ORY": (48.72, 2.38),
+    "LHR": (51.47, -0.46),
+    "JFK": (40.64, -73.78),
+    "LAX": (33.94, -118.41),
+}
+
+
+@pytest.fixture
+def routes_path(tmp_path: Path) -> Path:
+    """Write a small routes.dat."""
+    path = tmp_path / "routes.dat"
+    path.write_text(ROUTES)
+    return path
+
+
+@pytest.fixture
+def index(routes_path: Path) -> RouteIndex:
+    """Build a route index with coordinates."""
+    index = RouteIndex.from_file(routes_path)
+    index.set_coordinates(COORDINATES.get)
+    return index
+
+
+class TestRouteIndexFile:
+    """Test building and reusing the compiled index file."""
+
+    def test_index_file_written(self, routes_path: Path) -> None:
+        """Test the first load compiles routes.idx."""
+        index = RouteIndex.from_file(routes_path)
+
+        assert routes_path.with_suffix(".idx").exists()
+        assert index.route_count == 9
+        assert index.airport_count == 6
+        assert index.edge_count == 7
+
+    def test_second_load_uses_index(self, routes_path: Path) -> None:
+        """Test an up-to-date index is used without reading routes.dat."""
+        RouteIndex.from_file(routes_path)
+        stat = routes_path.stat()
+        routes_path.write_bytes(b"\x00" * stat.st_size)
+        os.utime(routes_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        index = RouteIndex.from_file(routes_path)
+
+        assert index.route_count == 9
+        assert index.destinations_from("BOD") == ["CDG", "LHR", "ORY"]
+
+    def test_index_rebuilt_when_routes_change(self, routes_path: Path) -> None:
+        """Test a modified routes.dat triggers a rebuild."""
+        RouteIndex.from_file(routes_path)
+        routes_path.write_text(ROUTES + "AA,24,LAX,3484,JFK,3797,,0,321\n")
+        stat = routes_path.stat()
+        os.utime(routes_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        index = RouteIndex.from_file(routes_path)
+
+        assert index.route_count == 10
+        assert index.destinations_from("LAX") == ["JFK"]
+
+    def test_invalid_index_rebuilt(self, routes_path: Path) -> None:
+        """Test a corrupt index file is ignored."""
+        routes_path.with_suffix(".idx").write_bytes(b"garbage")
+
+        assert RouteIndex.from_file(routes_path).route_count == 9
+
+    def test_save_and_load(self, index: RouteIndex, tmp_path: Path) -> None:
+        """Test an explicitly saved index loads back."""
+        path = tmp_path / "copy.idx"
+        index.save(path)
+
+        loaded = RouteIndex.load(path)
+
+        assert loaded.airlines == index.airlines
+        assert loaded.routes_between("BOD", "CDG") == index.routes_between("BOD", "CDG")
+
+
+class TestRouteIndexLookups:
+    """Test route lookups against the parsed file."""
+
+    def test_routes_match_parsed_file(self, tmp_path: Path) -> None:
+        """Test every airport pair returns the routes.dat rows in file order."""
+        rng = random.Random(3)
+        codes = [f"A{i:02d}" for i in range(40)]
+        lines = []
+        for _ in range(2000):
+            equipment = " ".join(rng.sample(["320", "738", "77W", "E90", "AT7"], rng.randint(0, 3)))
+            lines.append(
+                f"{rng.choice(['AF', 'BA', 'LH', 'QF'])},{rng.randint(1, 999)},"
+                f"{rng.choice(codes)},{rng.randint(1, 999)},{rng.choice(codes)},"
+                f"{rng.randint(1, 999)},{rng.choice(['', 'Y'])},{rng.choice([0, 0, 1])},"
+                f"{equipment or chr(92) + 'N'}"
+            )
+        path = tmp_path / "routes.dat"
+        path.write_text("\n".join(lines) + "\n")
+
+        parsed = _read_routes_file(path)
+        index = RouteIndex.from_file(path)
+
+        assert index.route_count == len(parsed)
+        for source in codes:
+            for destination in codes:
+                expected = [
+                    r
+                    for r in parsed
+                    if r.source_airport == source and r.destination_airport == destination
+                ]
+                assert index.routes_between(source, destination) == expected
+
+    def test_routes_between(self, index: RouteIndex) -> None:
+        """Test routes of one airport pair and the direct filter."""
+        routes = index.routes_between("CDG", "JFK")
+
+        assert [r.airline_code for r in routes] == ["AF", "DL"]
+        assert routes[1].codeshare is True
+        assert routes[0].equipment == ["77W"]
+        assert index.routes_between("ORY", "JFK", direct_only=True) == []
+        assert index.routes_between("JFK", "BOD") == []
+        assert index.routes_between("XXX", "BOD") == []
+
+    def test_null_fields(self, index: RouteIndex) -> None:
+        """Test \\N fields come back as empty values."""
+        routes = index.routes_from("LAX")
+
+        assert len(routes) == 1
+        assert routes[0].airline_code == ""
+        assert routes[0].airline_id == ""
+        assert routes[0].destination_airport == ""
+        assert routes[0].equipment == []
+
+    def test_airports_and_destinations(self, index: RouteIndex) -> None:
+        """Test airport listings."""
+        assert index.airports_with_routes() == ["BOD", "CDG", "JFK", "LAX", "LHR", "ORY"]
+        assert index.destinations_from("JFK") == ["LAX"]
+        assert index.destinations_from("LAX") == []
+        assert index.destinations_from("") == []
+
+
+class TestItinerarySearch:
+    """Test multi-leg itinerary search."""
+
+    def test_fewest_hops(self, index: RouteIndex) -> None:
+        """Test the hop count is minimized."""
+        itinerary = index.find_itinerary("BOD", "LAX")
+
+        assert isinstance(itinerary, Itinerary)
+        assert itinerary.leg_count == 3
+        assert itinerary.airports[0] == "BOD"
+        assert itinerary.airports[-1] == "LAX"
+
+    def test_shortest_distance(self, index: RouteIndex) -> None:
+        """Test distance routing picks the shortest connection."""
+        itinerary = index.find_itinerary("BOD", "JFK", metric="distance")
+
+        assert itinerary is not None
+        assert itinerary.airports == ["BOD", "LHR", "JFK"]
+        assert itinerary.distance_nm == pytest.approx(
+            sum(
+                _pair_distances_nm(*COORDINATES[a], *COORDINATES[b])
+                for a, b in [("BOD", "LHR"), ("LHR", "JFK")]
+            )
+        )
+
+    def test_airline_filter(self, index: RouteIndex) -> None:
+        """Test only legs flown by the given airlines are used."""
+        itinerary = index.find_itinerary("BOD", "JFK", metric="distance", airlines=["AF"])
+
+        assert itinerary is not None
+        assert itinerary.airports[1] in ("CDG", "ORY")
+        assert all(r.airline_code == "AF" for leg in itinerary.legs for r in leg)
+        assert index.find_itinerary("BOD", "JFK", airlines=["QF"]) is None
+
+    def test_equipment_filter(self, index: RouteIndex) -> None:
+        """Test only legs flown with the given aircraft are used."""
+        itinerary = index.find_itinerary("LHR", "JFK", equipment=["388"])
+
+        assert itinerary is not None
+        assert [r.equipment for r in itinerary.legs[0]] == [["388", "744"]]
+        assert index.find_itinerary("BOD", "JFK", equipment=["388"]) is None
+
+    def test_max_legs(self, index: RouteIndex) -> None:
+        """Test the leg limit."""
+        assert index.find_itinerary("BOD", "LAX", max_legs=2) is None
+        assert index.find_itinerary("BOD", "JFK", max_legs=2) is not None
+
+    def test_same_airport_and_unknown(self, index: RouteIndex) -> None:
+        """Test trivial and impossible searches."""
+        itinerary = index.find_itinerary("BOD", "BOD")
+
+        assert itinerary is not None
+        assert itinerary.airports == ["BOD"]
+        assert itinerary.legs == []
+        assert index.find_itinerary("BOD", "ZZZ") is None
+        assert index.find_itinerary("LAX", "BOD") is None
+
+    def test_invalid_metric(self, index: RouteIndex) -> None:
+        """Test errors for bad metrics and missing coordinates."""
+        with pytest.raises(ValueError):
+            index.find_itinerary("BOD", "JFK", metric="time")
+
+        bare = RouteIndex.from_routes(index.routes_from("BOD"))
+        with pytest.raises(ValueError):
+            bare.find_itinerary("BOD", "CDG", metric="distance")
+
+
+def reference_distance(
+    edges: dict[str, dict[str, float]], origin: str, destination: str, max_legs: int | None
+) -> float | None:
+    """Shortest distance by exhaustive search over (airport, legs) states."""
+    # Without a leg limit the leg count does not matter, so track airports only
+    step = 0 if max_legs is None else 1
+    best: dict[tuple[str, int], float] = {(origin, 0): 0.0}
+    heap = [(0.0, 0, origin)]
+    while heap:
+        cost, legs, airport = heapq.heappop(heap)
+        if airport == destination:
+            return cost
+        if cost > best[(airport, legs)] or (max_legs is not None and legs >= max_legs):
+            continue
+        for target, distance in edges.get(airport, {}).items():
+            state = (target, legs + step)
+            if cost + distance < best.get(state, float("inf")):
+                best[state] = cost + distance
+                heapq.heappush(heap, (cost + distance, legs + step, target))
+    return None
+
+
+class TestItineraryAgainstReference:
+    """Test A* results on a random network against exhaustive search."""
+
+    @pytest.mark.parametrize("max_legs", [None, 2, 3])
+    def test_random_network(self, tmp_path: Path, max_legs: int | None) -> None:
+        """Test shortest distances match for many airport pairs."""
+        rng = random.Random(11)
+        coordinates = {
+            f"P{i:02d}": (rng.uniform(-60, 60), rng.uniform(-180, 180)) for i in range(60)
+        }
+        codes = list(coordinates)
+        lines = {f"XX,1,{a},1,{b},2,,0,320" for a, b in (rng.sample(codes, 2) for _ in range(400))}
+        path = tmp_path / "routes.dat"
+        path.write_text("\n".join(sorted(lines)) + "\n")
+
+        index = RouteIndex.from_file(path)
+        index.set_coordinates(coordinates.get)
+
+        edges: dict[str, dict[str, float]] = {}
+        for line in lines:
+            a, b = line.split(",")[2], line.split(",")[4]
+            edges.setdefault(a, {})[b] = float(_pair_distances_nm(*coordinates[a], *coordinates[b]))
+
+        for origin, destination in (rng.sample(codes, 2) for _ in range(100)):
+            itinerary = index.find_itinerary(origin, destination, "distance", max_legs=max_legs)
+            expected = reference_distance(edges, origin, destination, max_legs)
+            if expected is None:
+                assert itinerary is None
+            else:
+                assert itinerary is not None
+                assert itinerary.distance_nm == pytest.approx(expected)
+                assert max_legs is None or itinerary.leg_count <= max_legs
+
+
+class TestProviderItinerary:
+    """Test itinerary search through OpenFlightsProvider."""
+
+    def test_find_itinerary_with_airport_index(self, routes_path: Path) -> None:
+        """Test coordinates are taken from the airport index by IATA code."""
+        csv_path = routes_path.parent / "airports.csv"
+        with open(csv_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["ident", "type", "name", "latitude_deg", "longitude_deg", "elevation_ft",
+                 "iso_country", "municipality", "icao_code", "iata_code"]
+            )  # fmt: skip
+            for i, (iata, (lat, lon)) in enumerate(COORDINATES.items()):
+                writer.writerow([f"X{i:03d}", "large_airport", iata, lat, lon, 0, "XX", "", f"X{i:03d}", iata])  # fmt: skip
+        airport_index = AirportIndex(data_dir=routes_path.parent)
+        assert airport_index.load()
+
+        provider = OpenFlightsProvider(routes_file=str(routes_path), airport_index=airport_index)
+        itinerary = provider.find_itinerary("BOD", "JFK", metric="distance")
+
+        assert itinerary is not None
+        assert itinerary.airports == ["BOD", "LHR", "JFK"]
+        assert itinerary.distance_nm is not None
+        assert provider.locate_airports() == 6
+
+    def test_routes_created_lazily(self, routes_path: Path) -> None:
+        """Test the route list is only materialized when accessed."""
+        provider = OpenFlightsProvider(routes_file=str(routes_path))
+
+        assert provider._routes is None
+        assert len(provider.routes) == 9
+        assert len(provider.routes_by_airport["BOD"]) == 3
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test a provider without data finds nothing."""
+        provider = OpenFlightsProvider(routes_file=str(tmp_path / "missing.dat"))
+
+        assert provider.index is None
+        assert provider.find_itinerary("BOD", "JFK") is None
+        assert provider.routes == []
@@ -1,5 +1,6 @@
 """Tests for Terrain Collision Detection."""
 
+import numpy as np
 import pytest
 
 from airborne.physics.collision import (
@@ -11,6 +12,7 @@ from airborne.physics.collision import (
 )
 from airborne.physics.vectors import Vector3
 from airborne.terrain.elevation_service import ElevationService
+from airborne.terrain.msa_grid import MSAGrid
 from airborne.terrain.srtm_provider import ConstantElevationProvider, SimpleFlatEarthProvider
 
 
@@ -220,6 +222,22 @@ class TestTerrainCollisionDetector:
         expected = 500.0 + buffer_m  # ~804.8m
         assert min_safe_alt == pytest.approx(expected, abs=1.0)
 
+    def test_minimum_safe_altitude_from_msa_grid(self) -> None:
+        """Test minimum safe altitude uses the grid cell maximum."""
+        service = ElevationService()
+        service.add_provider(ConstantElevationProvider(elevation=500.0))
+        cells = np.full((1, 1), 1200.0, dtype=np.float32)
+        grid = MSAGrid(cells, cell_size_deg=1.0, lat_min=37.0, lon_min=-123.0)
+        detector = TerrainCollisionDetector(service, msa_grid=grid)
+
+        min_safe_alt = detector.get_minimum_safe_altitude(Vector3(-122.4194, 0, 37.7749))
+        assert min_safe_alt == pytest.approx(1200.0 + 304.8, abs=0.1)
+        assert detector.is_safe_to_descend(Vector3(-122.4194, 0, 37.7749), 2000.0, 1000.0) is False
+
+        # Outside the grid falls back to sampled terrain
+        outside = detector.get_minimum_safe_altitude(Vector3(-100.0, 0, 37.5))
+        assert outside == pytest.approx(500.0 + 304.8, abs=0.1)
+
     def test_is_safe_to_descend_safe(self) -> None:
         """Test safe descent check."""
         service = ElevationService()
@@ -0,0 +1,135 @@
+"""Tests for terrain awareness (TAWS) look-ahead."""
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from airborne.physics.terrain_awareness import (
+    TerrainAlertLevel,
+    TerrainAwarenessSystem,
+)
+from airborne.physics.vectors import Vector3
+from airborne.terrain.elevation_service import ElevationService, IElevationProvider
+from airborne.terrain.srtm_provider import ConstantElevationProvider
+
+
+class RidgeProvider(IElevationProvider):
+    """Flat terrain with an east-west ridge north of a given latitude."""
+
+    supports_block_sampling = True
+
+    def __init__(self, ridge_lat: float, ridge_m: float = 1000.0) -> None:
+        """Initialize ridge provider."""
+        self.ridge_lat = ridge_lat
+        self.ridge_m = ridge_m
+        self.batch_calls = 0
+
+    def get_name(self) -> str:
+        """Get provider name."""
+        return "ridge"
+
+    def get_elevation(self, latitude: float, longitude: float) -> float:
+        """Get ridge elevation."""
+        return self.ridge_m if latitude >= self.ridge_lat else 0.0
+
+    def get_elevation_array(self, latitudes, longitudes) -> npt.NDArray[np.float64]:  # type: ignore[no-untyped-def]
+        """Get ridge elevations for a batch."""
+        self.batch_calls += 1
+        return np.where(np.asarray(latitudes) >= self.ridge_lat, self.ridge_m, 0.0)
+
+
+def make_service(provider: IElevationProvider) -> ElevationService:
+    """Create elevation service with a single provider."""
+    service = ElevationService()
+    service.add_provider(provider)
+    return service
+
+
+class TestTerrainAwarenessSystem:
+    """Test TAWS look-ahead evaluation."""
+
+    START = Vector3(8.0, 500.0, 45.0)
+
+    def test_no_alert_over_flat_terrain(self) -> None:
+        """Test level flight well above flat terrain."""
+        taws = TerrainAwarenessSystem(make_service(ConstantElevationProvider(100.0)))
+
+        result = taws.evaluate(self.START, 500.0, Vector3(0, 0, 60))
+
+        assert result.level == TerrainAlertLevel.NONE
+        assert result.time_to_conflict_s is None
+        assert result.min_clearance_m == pytest.approx(400.0)
+
+    def test_warning_for_ridge_ahead(self) -> None:
+        """Test warning when the current track meets terrain soon."""
+        # Ridge ~1.1 km north; at 60 m/s that is ~18 s away
+        provider = RidgeProvider(ridge_lat=45.01)
+        taws = TerrainAwarenessSystem(make_service(provider))
+
+        result = taws.evaluate(self.START, 500.0, Vector3(0, 0, 60))
+
+        assert result.level == TerrainAlertLevel.WARNING
+        assert result.time_to_conflict_s is not None
+        assert result.time_to_conflict_s <= 30.0
+        assert result.time_to_impact_s is not None
+        assert result.terrain_peak_m == pytest.approx(1000.0)
+        assert provider.batch_calls == 1  # Whole fan in one query
+
+    def test_caution_for_distant_ridge(self) -> None:
+        """Test caution when the conflict is between warning and caution time."""
+        # Ridge ~2.8 km north; at 60 m/s that is ~46 s away
+        taws = TerrainAwarenessSystem(make_service(RidgeProvider(ridge_lat=45.025)))
+
+        result = taws.evaluate(self.START, 500.0, Vector3(0, 0, 60))
+
+        assert result.level == TerrainAlertLevel.CAUTION
+        assert 30.0 < result.time_to_conflict_s <= 60.0
+
+    def test_ridge_behind_is_ignored(self) -> None:
+        """Test terrain behind the aircraft does not alert."""
+        taws = TerrainAwarenessSystem(make_service(RidgeProvider(ridge_lat=45.01)))
+
+        result = taws.evaluate(self.START, 500.0, Vector3(0, 0, -60))
+
+        assert result.level == TerrainAlertLevel.NONE
+
+    def test_off_track_conflict_capped_at_caution(self) -> None:
+        """Test terrain only inside the turn fan raises at most a caution."""
+        # Flying east along the ridge's southern edge: only rays angled north hit it
+        taws = TerrainAwarenessSystem(make_service(RidgeProvider(ridge_lat=45.003)))
+
+        result = taws.evaluate(self.START, 500.0, Vector3(60, 0, 0))
+
+        assert result.level == TerrainAlertLevel.CAUTION
+        assert result.conflict_heading_deg is not None
+        assert result.conflict_heading_deg < 90.0  # Conflict on the northern side
+
+    def test_descent_into_terrain(self) -> None:
+        """Test descending flight path predicts an impact."""
+        taws = TerrainAwarenessSystem(make_service(ConstantElevationProvider(0.0)))
+
+        result = taws.evaluate(self.START, 300.0, Vector3(0, -15, 60))
+
+        assert result.level == TerrainAlertLevel.WARNING
+        assert result.time_to_impact_s == pytest.approx(21.0, abs=3.0)
+
+    def test_slow_or_stationary_aircraft_not_projected(self) -> None:
+        """Test that taxiing aircraft do not trigger the look-ahead."""
+        provider = RidgeProvider(ridge_lat=45.0001)
+        taws = TerrainAwarenessSystem(make_service(provider))
+
+        result = taws.evaluate(self.START, 10.0, Vector3(0, 0, 5))
+
+        assert result.level == TerrainAlertLevel.NONE
+        assert provider.batch_calls == 0
+
+    def test_fan_shape(self) -> None:
+        """Test fan projection shape and geometry."""
+        taws = TerrainAwarenessSystem(fan_headings=5, samples_per_heading=12, lookahead_s=60.0)
+
+        lats, lons = taws.project_fan(self.START, Vector3(0, 0, 100))
+
+        assert lats.shape == (5, 12)
+        # Center ray heads due north: longitude unchanged, 6 km at the last sample
+        assert np.allclose(lons[2], self.START.x)
+        assert (lats[2, -1] - self.START.z) * 110574.0 == pytest.approx(6000.0, rel=1e-3)
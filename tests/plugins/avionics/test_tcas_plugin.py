@@ -7,8 +7,12 @@ from airborne.core.messaging import Message, MessageQueue, MessageTopic
 from airborne.core.plugin import PluginContext
 from airborne.core.registry import ComponentRegistry
 from airborne.physics.vectors import Vector3
-from airborne.plugins.avionics.tcas_plugin import TCASPlugin
+from airborne.plugins.avionics.tcas_plugin import AlertLevel, RAType, TCASPlugin
+from airborne.plugins.avionics.tcas_surveillance import sensitivity_level
 from airborne.plugins.traffic.ai_aircraft import AIAircraft
+from airborne.plugins.traffic.ai_traffic_plugin import AITrafficPlugin
+from airborne.plugins.traffic.ground_traffic import DEGREES_PER_NM
+from airborne.plugins.traffic.traffic_state import TrafficEntry, TrafficStateService
 
 
 @pytest.fixture
@@ -206,3 +210,131 @@ def test_tcas_get_targets(tcas_plugin):
     targets = tcas_plugin.get_targets()
     assert isinstance(targets, dict)
     assert len(targets) == 0  # Initially empty
+
+
+def test_tcas_sensitivity_levels():
+    """Test sensitivity levels follow ownship altitude."""
+    assert sensitivity_level(500).level == 2
+    assert sensitivity_level(500).ra_tau_s is None
+    assert sensitivity_level(3000).level == 4
+    assert sensitivity_level(15000).level == 6
+    assert sensitivity_level(45000).ta_zthr_ft == 1200.0
+
+
+def closing_traffic(callsign, altitude_ft, distance_nm=0.8, speed=200.0):
+    """Create traffic north of the origin heading straight for it."""
+    return AIAircraft(
+        callsign=callsign,
+        aircraft_type="B738",
+        position=Vector3(0, 0, distance_nm * 6076),
+        velocity=Vector3(0, 0, -speed),
+        heading=180,
+        altitude_ft=altitude_ft,
+        airspeed_kts=300,
+    )
+
+
+def send_traffic(plugin, traffic):
+    """Deliver a traffic update to the plugin."""
+    plugin.handle_message(
+        Message(
+            sender="ai_traffic",
+            recipients=["*"],
+            topic=MessageTopic.TRAFFIC_UPDATE,
+            data={"traffic": traffic},
+        )
+    )
+
+
+def test_tcas_resolution_advisory(tcas_plugin):
+    """Test head-on traffic just above raises a descend RA."""
+    tcas_plugin._powered = True
+    tcas_plugin._own_altitude_ft = 8000
+    send_traffic(tcas_plugin, [closing_traffic("ABOVE", 8200)])
+
+    tcas_plugin.update(0.1)
+
+    target = tcas_plugin.get_targets()["ABOVE"]
+    assert target.alert_level == AlertLevel.RA
+    assert target.ra_type == RAType.DESCEND
+    assert tcas_plugin.get_current_alert_level() == AlertLevel.RA
+    assert tcas_plugin._active_ra == RAType.DESCEND
+
+
+def test_tcas_traffic_advisory_only_at_low_altitude(tcas_plugin):
+    """Test RAs are inhibited in the lowest sensitivity level."""
+    tcas_plugin._powered = True
+    tcas_plugin._own_altitude_ft = 800
+    send_traffic(tcas_plugin, [closing_traffic("LOW", 700, distance_nm=0.6)])
+
+    tcas_plugin.update(0.1)
+
+    assert tcas_plugin.get_targets()["LOW"].alert_level == AlertLevel.TA
+    assert tcas_plugin.get_current_alert_level() == AlertLevel.TA
+
+
+def test_tcas_culls_traffic_outside_altitude_window(tcas_plugin):
+    """Test traffic far above or diverging raises no alert."""
+    tcas_plugin._powered = True
+    tcas_plugin._own_altitude_ft = 8000
+    diverging = closing_traffic("AWAY", 8000, speed=-200.0)
+    send_traffic(tcas_plugin, [closing_traffic("HIGH", 12000), diverging])
+
+    tcas_plugin.update(0.1)
+
+    assert list(tcas_plugin.get_targets()) == ["AWAY"]
+    assert tcas_plugin.get_current_alert_level() == AlertLevel.NONE
+
+
+def test_tcas_pulls_traffic_state(tcas_plugin):
+    """Test TCAS evaluates nearby traffic pulled from the traffic state on a delta."""
+    traffic = AITrafficPlugin()
+    traffic.initialize(tcas_plugin._context)
+    traffic.add_aircraft(closing_traffic("SNAP", 8000))
+    traffic._update_interval = 0.0
+    tcas_plugin._powered = True
+    tcas_plugin._own_altitude_ft = 8000
+
+    traffic.update(0.1)
+    tcas_plugin._message_queue.process()
+    tcas_plugin.update(0.1)
+
+    assert tcas_plugin.get_targets()["SNAP"].alert_level == AlertLevel.RA
+
+
+def test_tcas_ignores_other_traffic_states(tcas_plugin):
+    """Test deltas from an unregistered state (e.g. ground traffic) keep the intruders."""
+    traffic = AITrafficPlugin()
+    traffic.initialize(tcas_plugin._context)
+    traffic.add_aircraft(closing_traffic("SNAP", 8000))
+    traffic._update_interval = 0.0
+    tcas_plugin._own_altitude_ft = 8000
+    traffic.update(0.1)
+    tcas_plugin._message_queue.process()
+
+    ground = TrafficStateService(units_per_nm=DEGREES_PER_NM)
+    ground.put(TrafficEntry("GND1", "C172", Vector3(0, 0, 0), on_ground=True))
+    ground.publish(tcas_plugin._message_queue, "ground_traffic")
+    tcas_plugin._message_queue.process()
+
+    assert list(tcas_plugin.get_targets()) == ["SNAP"]
+
+
+def test_tcas_without_registry_accepts_deltas():
+    """Test TCAS used on its own loads traffic from any delta."""
+    tcas = TCASPlugin()
+    tcas._powered = True
+    tcas._own_altitude_ft = 8000
+    state = TrafficStateService()
+    state.put(TrafficEntry("SNAP", "B738", Vector3(0, 0, 0.8 * 6076), altitude_ft=8000))
+
+    tcas.handle_message(
+        Message(
+            sender="ai_traffic",
+            recipients=["*"],
+            topic=MessageTopic.TRAFFIC_DELTA,
+            data={"delta": state.flush(), "state": state},
+        )
+    )
+
+    assert list(tcas.get_targets()) == ["SNAP"]
@@ -531,3 +531,40 @@ class TestParkingIntegration:
         if plugin.current_parking_db:
             for parking in plugin.current_parking_db.get_all_parking():
                 assert parking.position_id in plugin.proximity_manager.targets
+
+    def test_airport_loaded_published(self) -> None:
+        """Test switching airports publishes the runways and taxiway graph."""
+        from unittest.mock import Mock
+
+        from airborne.airports.database import Airport, AirportType, Runway, SurfaceType
+        from airborne.core.messaging import Message, MessageQueue, MessageTopic
+        from airborne.core.plugin import PluginContext
+
+        message_queue = MessageQueue()
+        plugin = GroundNavigationPlugin()
+        plugin.initialize(
+            PluginContext(
+                event_bus=Mock(), message_queue=message_queue, config={}, plugin_registry=Mock()
+            )
+        )
+        airport = Airport(
+            icao="KTEST5",
+            name="Test Airport",
+            position=Vector3(-122.0, 10.0, 37.5),
+            airport_type=AirportType.SMALL_AIRPORT,
+        )
+        runway = Runway("KTEST5", "18/36", 3000, 75, SurfaceType.ASPH, True, False,
+                        "18", 37.5, -122.0, 10.0, 180.0, "36", 37.51, -122.0, 10.0, 360.0)  # fmt: skip
+        assert plugin.airport_db is not None
+        plugin.airport_db.airports["KTEST5"] = airport
+        plugin.airport_db.runways["KTEST5"] = [runway]
+        loaded: list[Message] = []
+        message_queue.subscribe(MessageTopic.AIRPORT_LOADED, loaded.append)
+
+        plugin._switch_airport("KTEST5")
+        message_queue.process()
+
+        assert len(loaded) == 1
+        assert loaded[0].data["icao"] == "KTEST5"
+        assert loaded[0].data["runways"] == [runway]
+        assert loaded[0].data["graph"].get_node_count() > 0
@@ -2,6 +2,8 @@
 
 import pytest
 
+from airborne.airports.database import Runway, SurfaceType
+from airborne.airports.taxiway import TaxiwayGraph
 from airborne.core.messaging import Message, MessageQueue, MessageTopic
 from airborne.core.plugin import PluginContext, PluginType
 from airborne.physics.vectors import Vector3
@@ -392,6 +394,46 @@ class TestPositionAwarenessPlugin:
         assert plugin.orientation_audio.message_queue is not None
         assert plugin.incursion_detector.message_queue is not None
 
+    def test_airport_loaded_feeds_incursion_detector(
+        self,
+        plugin: PositionAwarenessPlugin,
+        plugin_context: PluginContext,
+        message_queue: MessageQueue,
+    ) -> None:
+        """Test a loaded airport gives the detector runways and the tracker's ground graph."""
+        plugin.initialize(plugin_context)
+        runway = Runway("KSFO", "28L/10R", 11870, 200, SurfaceType.ASPH, True, False,
+                        "10R", 37.61, -122.38, 10, 105, "28L", 37.62, -122.36, 10, 285)  # fmt: skip
+        graph = TaxiwayGraph()
+        graph.add_node("A1", Vector3(-122.370, 10.0, 37.6140), "taxiway", "A")
+        graph.add_node("A2", Vector3(-122.370, 10.0, 37.6130), "taxiway", "A")
+        graph.add_edge("A1", "A2", "taxiway", "A", bidirectional=True)
+        spoken: list[Message] = []
+        message_queue.subscribe(MessageTopic.TTS_SPEAK, spoken.append)
+
+        message_queue.publish(
+            Message(
+                sender="ground_navigation",
+                recipients=["*"],
+                topic=MessageTopic.AIRPORT_LOADED,
+                data={"icao": "KSFO", "runways": [runway], "graph": graph},
+            )
+        )
+        message_queue.process()
+
+        detector = plugin.incursion_detector
+        assert detector is not None
+        assert detector.runways == [runway]
+        assert detector.ground_graph is graph.ground_graph
+        assert plugin.position_tracker is not None
+        assert plugin.position_tracker.graph is graph
+
+        plugin.last_position = Vector3(-122.370, 10.0, 37.6148)
+        plugin.update(0.016)
+        message_queue.process()
+
+        assert any(message.sender == "runway_incursion" for message in spoken)
+
     def test_metadata_dependencies(self, plugin: PositionAwarenessPlugin) -> None:
         """Test that metadata declares correct dependencies."""
         metadata = plugin.get_metadata()
@@ -1,5 +1,7 @@
 """Unit tests for position tracker."""
 
+from unittest.mock import patch
+
 import pytest
 
 from airborne.airports.taxiway import TaxiwayGraph
@@ -186,6 +188,22 @@ class TestPositionTracker:
         assert location_type == LocationType.TAXIWAY
         assert location_id == "A"
 
+    def test_current_edge(self, tracker: PositionTracker) -> None:
+        """Test the ground graph edge under the aircraft is tracked."""
+        mid_x = (-122.002 + -122.003) / 2
+        tracker.update(Vector3(mid_x, 10.0, 37.5), 90.0, 100.0)
+
+        edge = tracker.current_edge
+        assert edge is not None
+        ground = tracker.graph.ground_graph
+        assert {
+            ground.node_ids[ground.edge_start[edge]],
+            ground.node_ids[ground.edge_end[edge]],
+        } == {"A1", "A2"}
+
+        tracker.update(Vector3(-122.002, 10.0, 37.5), 90.0, 101.0)
+        assert tracker.current_edge is None
+
     def test_detect_grass_when_far_from_nodes(self, tracker: PositionTracker) -> None:
         """Test detection of grass when far from any node or edge."""
         # Position far from any node (>10m away)
@@ -758,3 +776,71 @@ class TestHoldShortDetection:
         assert hold_short is not None
         assert hold_short.runway_id == "27L"
         assert hold_short.taxiway_name == "B"
+
+
+class TestEdgeLock:
+    """Test incremental tracking along the locked edge."""
+
+    STEP_DEG = 0.0002  # About 22 m of longitude
+
+    @pytest.fixture
+    def long_graph(self) -> TaxiwayGraph:
+        """Create a long straight taxiway A ending at a hold short for 31."""
+        graph = TaxiwayGraph()
+        for i in range(200):
+            graph.add_node(f"A{i}", Vector3(-122.0 + i * self.STEP_DEG, 10.0, 37.5))
+        for i in range(199):
+            graph.add_edge(f"A{i}", f"A{i + 1}", "taxiway", name="A", bidirectional=True)
+
+        graph.add_node("HS1", Vector3(-122.0 + 5.5 * self.STEP_DEG, 10.0, 37.5002))
+        graph.nodes["HS1"].is_hold_short = True
+        graph.nodes["HS1"].on_runway = "31"
+        graph.add_node("HS2", Vector3(-122.0 + 3 * self.STEP_DEG, 10.0, 37.5003))
+        graph.nodes["HS2"].is_hold_short = True
+        graph.nodes["HS2"].on_runway = "13"
+        graph.add_edge("A3", "HS2", "taxiway", name="B", bidirectional=True)
+        return graph
+
+    def test_updates_stay_local(self, long_graph: TaxiwayGraph) -> None:
+        """Test taxiing along the network searches the whole airport only once."""
+        tracker = PositionTracker(long_graph, None)
+
+        with patch.object(
+            tracker, "_find_nearest_node", wraps=tracker._find_nearest_node
+        ) as global_search:
+            for i in range(100):
+                lon = -122.0 + i * self.STEP_DEG / 4 + self.STEP_DEG / 8
+                tracker.update(Vector3(lon, 10.0, 37.50005), 90.0, float(i))
+                assert tracker.get_current_location() == (LocationType.TAXIWAY, "A")
+
+        assert global_search.call_count == 1
+
+    def test_teleport_and_lost_lock_search_again(self, long_graph: TaxiwayGraph) -> None:
+        """Test a teleport or leaving the network falls back to a full search."""
+        tracker = PositionTracker(long_graph, None)
+        tracker.update(Vector3(-122.0, 10.0, 37.5), 90.0, 0.0)
+
+        with patch.object(
+            tracker, "_find_nearest_node", wraps=tracker._find_nearest_node
+        ) as global_search:
+            tracker.update(Vector3(-122.0 + 150 * self.STEP_DEG, 10.0, 37.5), 90.0, 1.0)
+            assert tracker.current_node_id == "A150"
+            assert global_search.call_count == 1
+
+            tracker.update(Vector3(-122.0 + 150 * self.STEP_DEG, 10.0, 37.5004), 90.0, 2.0)
+            assert tracker.get_current_location() == (LocationType.GRASS, "")
+            assert global_search.call_count == 2
+
+    def test_hold_short_found_along_graph(self, long_graph: TaxiwayGraph) -> None:
+        """Test look-ahead only reports hold short points reachable on the graph."""
+        tracker = PositionTracker(long_graph, None)
+        tracker.update(Vector3(-122.0, 10.0, 37.5), 90.0, 0.0)
+
+        # HS1 lies straight ahead but is not connected; HS2 is reached via B
+        hold_short = tracker.get_approaching_hold_short(200.0)
+        assert hold_short is not None
+        assert hold_short.runway_id == "13"
+        assert hold_short.taxiway_name == "B"
+
+        junctions = tracker.get_approaching_junctions(200.0)
+        assert [j.name for j in junctions] == ["B"]
@@ -5,7 +5,8 @@ import time
 import pytest
 
 from airborne.airports.database import Runway, SurfaceType
-from airborne.core.messaging import Message, MessageQueue
+from airborne.airports.ground_graph import EDGE_RUNWAY, GroundGraph
+from airborne.core.messaging import Message, MessageQueue, MessageTopic
 from airborne.physics.vectors import Vector3
 from airborne.plugins.navigation.runway_incursion import (
     IncursionLevel,
@@ -140,7 +141,7 @@ class TestRunwayIncursionDetector:
     def test_get_nearest_runway_close(self, detector: RunwayIncursionDetector) -> None:
         """Test getting nearest runway when close."""
         # Position near runway
-        position = Vector3(37.615, 10.0, -122.37)
+        position = Vector3(-122.37, 10.0, 37.615)
 
         runway, distance = detector.get_nearest_runway(position)
 
@@ -151,7 +152,7 @@ class TestRunwayIncursionDetector:
     def test_get_nearest_runway_far(self, detector: RunwayIncursionDetector) -> None:
         """Test getting nearest runway when far."""
         # Position far from runway
-        position = Vector3(40.0, 10.0, -120.0)
+        position = Vector3(-120.0, 10.0, 40.0)
 
         runway, distance = detector.get_nearest_runway(position)
 
@@ -163,7 +164,7 @@ class TestRunwayIncursionDetector:
     ) -> None:
         """Test update when far from runway without clearance."""
         # Position 1km from runway
-        position = Vector3(37.63, 10.0, -122.37)
+        position = Vector3(-122.37, 10.0, 37.63)
 
         detector.update(position, 270.0, time.time())
 
@@ -175,7 +176,7 @@ class TestRunwayIncursionDetector:
     ) -> None:
         """Test caution warning at 50m without clearance."""
         # Position ~40m from runway (within 50m threshold)
-        position = Vector3(37.6145, 10.0, -122.370)
+        position = Vector3(-122.370, 10.0, 37.6145)
 
         detector.update(position, 270.0, time.time())
 
@@ -188,7 +189,7 @@ class TestRunwayIncursionDetector:
     ) -> None:
         """Test warning at 20m without clearance."""
         # Position ~15m from runway (within 20m threshold)
-        position = Vector3(37.6148, 10.0, -122.370)
+        position = Vector3(-122.370, 10.0, 37.6148)
 
         detector.update(position, 270.0, time.time())
 
@@ -203,7 +204,7 @@ class TestRunwayIncursionDetector:
         detector.grant_clearance("28L")
 
         # Position close to runway
-        position = Vector3(37.6148, 10.0, -122.370)
+        position = Vector3(-122.370, 10.0, 37.6148)
 
         detector.update(position, 270.0, time.time())
 
@@ -214,7 +215,7 @@ class TestRunwayIncursionDetector:
         self, detector: RunwayIncursionDetector, message_queue: MessageQueue
     ) -> None:
         """Test that warnings respect cooldown period."""
-        position = Vector3(37.6145, 10.0, -122.370)
+        position = Vector3(-122.370, 10.0, 37.6145)
 
         # First warning
         detector.update(position, 270.0, time.time())
@@ -236,13 +237,13 @@ class TestRunwayIncursionDetector:
     ) -> None:
         """Test escalating warning levels as aircraft approaches."""
         # Start at 40m (caution)
-        position1 = Vector3(37.6145, 10.0, -122.370)
+        position1 = Vector3(-122.370, 10.0, 37.6145)
         detector.update(position1, 270.0, time.time())
         assert message_queue.process() == 1  # Caution
 
         # Move to 15m (warning)
         time.sleep(2.1)  # Wait for cooldown
-        position2 = Vector3(37.6148, 10.0, -122.370)
+        position2 = Vector3(-122.370, 10.0, 37.6148)
         detector.update(position2, 270.0, time.time())
         assert message_queue.process() == 1  # Warning
 
@@ -287,36 +288,43 @@ class TestRunwayIncursionDetector:
 
         detector.unsubscribe_from_events()
 
-    def test_point_to_segment_distance_perpendicular(
-        self, detector: RunwayIncursionDetector
+    def test_distance_from_pavement(self, detector: RunwayIncursionDetector) -> None:
+        """Test proximity is measured from the runway edge, not its centerline."""
+        position = Vector3(-122.370, 10.0, 37.6145)
+
+        detector.update(position, 270.0, 100.0)
+
+        centerline = detector.geometry.query(position.z, position.x).centerline_m[0]
+        distance = detector.proximity_data["10R/28L"].distance_m
+        assert 40.0 < centerline < 50.0
+        assert distance == pytest.approx(centerline - 200 * 0.3048 / 2)
+
+    def test_alert_past_hold_line(
+        self, detector: RunwayIncursionDetector, message_queue: MessageQueue
     ) -> None:
-        """Test distance calculation perpendicular to segment."""
-        # Point perpendicular to midpoint of segment
-        distance = detector._point_to_segment_distance(
-            1.0,
-            1.0,  # Point
-            0.0,
-            0.0,  # Segment start
-            2.0,
-            0.0,  # Segment end
-        )
+        """Test an aircraft between the hold line and the runway edge gets an alert."""
+        received: list[Message] = []
+        message_queue.subscribe(MessageTopic.TTS_SPEAK, received.append)
+        position = Vector3(-122.370, 10.0, 37.6146)
+        assert 0.0 < detector.geometry.query(position.z, position.x).distance_m[0] < 10.0
 
-        # Should be ~111km (1 degree)
-        assert 110000 < distance < 112000
-
-    def test_point_to_segment_distance_at_endpoint(self, detector: RunwayIncursionDetector) -> None:
-        """Test distance calculation at segment endpoint."""
-        distance = detector._point_to_segment_distance(
-            0.0,
-            0.0,  # Point at start
-            0.0,
-            0.0,  # Segment start
-            1.0,
-            0.0,  # Segment end
-        )
+        detector.update(position, 270.0, 100.0)
+        message_queue.process()
+
+        prox = detector.proximity_data["10R/28L"]
+        assert prox.last_warning_level == IncursionLevel.ALERT
+        assert received[0].data["interrupt"] is True
 
-        # Should be 0
-        assert distance == 0.0
+    def test_set_runways(self, detector: RunwayIncursionDetector, sample_runway: Runway) -> None:
+        """Test replacing the runways rebuilds the geometry."""
+        detector.update(Vector3(-122.37, 10.0, 37.615), 270.0, 100.0)
+
+        detector.set_runways([])
+        assert len(detector.geometry) == 0
+        assert detector.get_nearest_runway(Vector3(-122.37, 10.0, 37.615)) == (None, float("inf"))
+
+        detector.set_runways([sample_runway])
+        assert detector.get_nearest_runway(Vector3(-122.37, 10.0, 37.615)) == (sample_runway, 0.0)
 
     def test_warning_messages(self, detector: RunwayIncursionDetector) -> None:
         """Test warning message generation."""
@@ -384,7 +392,7 @@ class TestRunwayIncursionDetector:
 
         # Should not crash
         detector.subscribe_to_events()
-        detector.update(Vector3(37.615, 10.0, -122.37), 270.0, time.time())
+        detector.update(Vector3(-122.37, 10.0, 37.615), 270.0, time.time())
         detector.grant_clearance("28L")
         detector.revoke_clearance("28L")
         detector.unsubscribe_from_events()
@@ -397,9 +405,32 @@ class TestRunwayIncursionDetector:
         detector.grant_clearance("10R")
 
         # Position close to 28L end
-        position = Vector3(37.6145, 10.0, -122.370)
+        position = Vector3(-122.370, 10.0, 37.6145)
 
         detector.update(position, 270.0, time.time())
 
         # No warning should be issued (cleared for runway, either end)
         assert message_queue.process() == 0
+
+    def test_alert_on_runway_edge_of_ground_graph(
+        self, detector: RunwayIncursionDetector, sample_runway: Runway
+    ) -> None:
+        """Test standing on a runway edge of the ground graph raises an alert."""
+        detector.set_ground_graph(
+            GroundGraph(
+                ["R1", "R2"],
+                [sample_runway.le_latitude, sample_runway.he_latitude],
+                [sample_runway.le_longitude, sample_runway.he_longitude],
+                [0],
+                [1],
+                [2000.0],
+                names=["", "10R/28L"],
+                edge_name=[1],
+                edge_flags=[EDGE_RUNWAY],
+            )
+        )
+
+        detector.update(Vector3(-122.37, 10.0, 37.615), 270.0, 100.0)
+
+        assert detector.proximity_data["10R/28L"].distance_m == 0.0
+        assert detector.proximity_data["10R/28L"].last_warning_level == IncursionLevel.ALERT
@@ -0,0 +1,274 @@
+"""Tests for external traffic ingest."""
+
+import asyncio
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from airborne.core.event_bus import EventBus
+from airborne.core.messaging import MessageQueue, MessageTopic
+from airborne.core.plugin import PluginContext
+from airborne.core.registry import ComponentRegistry
+from airborne.physics.vectors import Vector3
+from airborne.plugins.network.remote_control_plugin import RemoteControlPlugin
+from airborne.plugins.network.traffic_ingest import (
+    FLAG_ON_GROUND,
+    IDENTITY_DTYPE,
+    REPORT_DTYPE,
+    DeadReckoningTracks,
+    TrafficIngest,
+    decode_traffic_batch,
+    encode_traffic_batch,
+)
+from airborne.plugins.network.websocket_server import ClientSession, RemoteControlServer
+from airborne.plugins.traffic.ai_traffic_plugin import AITrafficPlugin
+from airborne.plugins.traffic.traffic_state import TrafficStateService
+
+
+def reports(*tracks: tuple[int, float, float, float]) -> np.ndarray:
+    """Create reports of (track id, time offset, z, vz), northbound at 3000 ft."""
+    records = np.zeros(len(tracks), dtype=REPORT_DTYPE)
+    for record, (track_id, time, z, vz) in zip(records, tracks, strict=True):
+        record["track_id"] = track_id
+        record["time"] = time
+        record["z"] = z
+        record["vz"] = vz
+        record["altitude_ft"] = 3000.0
+    return records
+
+
+def identities(*tracks: tuple[int, str, str]) -> np.ndarray:
+    """Create identities of (track id, callsign, aircraft type)."""
+    return np.array(
+        [(track_id, callsign.encode(), kind.encode()) for track_id, callsign, kind in tracks],
+        dtype=IDENTITY_DTYPE,
+    )
+
+
+class TestBatchFormat:
+    """Test the binary batch format."""
+
+    def test_round_trip(self) -> None:
+        """Test reports and identities survive encoding."""
+        frame = encode_traffic_batch(
+            12.5, reports((7, 0.1, 100.0, 50.0)), identities((7, "N123AB", "C172"))
+        )
+
+        batch = decode_traffic_batch(frame)
+
+        assert len(frame) == 20 + 36 + 16
+        assert batch.timestamp == 12.5
+        assert batch.reports["track_id"].tolist() == [7]
+        assert batch.reports["vz"].tolist() == [50.0]
+        assert batch.identities["callsign"].tolist() == [b"N123AB"]
+
+    @pytest.mark.parametrize(
+        "frame",
+        [
+            b"ABTR",
+            b"XXXX" + encode_traffic_batch(0.0, reports((1, 0.0, 0.0, 0.0)))[4:],
+            encode_traffic_batch(0.0, reports((1, 0.0, 0.0, 0.0)))[:-1],
+        ],
+    )
+    def test_invalid_frames(self, frame: bytes) -> None:
+        """Test short, foreign and truncated frames are rejected."""
+        with pytest.raises(ValueError):
+            decode_traffic_batch(frame)
+
+
+class TestDeadReckoningTracks:
+    """Test interpolation, extrapolation and blending."""
+
+    def test_interpolates_between_reports(self) -> None:
+        """Test positions are interpolated one delay behind the newest report."""
+        tracks = DeadReckoningTracks(interpolation_delay_s=0.1)
+        tracks.ingest(reports((1, 0.0, 0.0, 100.0)), 0.0, now=1.0)
+        tracks.ingest(reports((1, 0.0, 10.0, 100.0)), 0.1, now=1.1)
+
+        position, _ = tracks.positions(1.15)
+
+        assert position[0, 2] == pytest.approx(5.0)
+        assert position[0, 1] == 3000.0
+
+    def test_extrapolates_with_limit(self) -> None:
+        """Test positions are dead-reckoned past the newest report, up to a limit."""
+        tracks = DeadReckoningTracks(interpolation_delay_s=0.0, max_extrapolation_s=2.0)
+        tracks.ingest(reports((1, 0.0, 0.0, 100.0)), 0.0, now=0.0)
+
+        assert tracks.positions(0.5)[0][0, 2] == pytest.approx(50.0)
+        assert tracks.positions(10.0)[0][0, 2] == pytest.approx(200.0)
+
+    def test_correction_is_blended(self) -> None:
+        """Test a report that disagrees with the extrapolation does not jump."""
+        tracks = DeadReckoningTracks(interpolation_delay_s=0.0, blend_s=0.5)
+        tracks.ingest(reports((1, 0.0, 0.0, 100.0)), 0.0, now=0.0)
+        shown = tracks.positions(1.0)[0][0, 2]
+
+        tracks.ingest(reports((1, 0.0, 80.0, 100.0)), 1.0, now=1.0)
+
+        assert tracks.positions(1.0)[0][0, 2] == pytest.approx(shown)
+        assert tracks.positions(1.25)[0][0, 2] == pytest.approx(105.0 + 0.5 * 20.0)
+        assert tracks.positions(1.5)[0][0, 2] == pytest.approx(130.0)
+
+    def test_newest_report_wins(self) -> None:
+        """Test batched and out-of-order reports keep the newest per track."""
+        tracks = DeadReckoningTracks(interpolation_delay_s=0.0)
+        tracks.ingest(
+            reports((1, 0.2, 20.0, 0.0), (1, 0.1, 10.0, 0.0), (2, 0.0, 5.0, 0.0)), 0.0, now=0.2
+        )
+        assert tracks.ingest(reports((1, 0.0, 99.0, 0.0)), 0.1, now=0.3) == 0
+
+        position, _ = tracks.positions(0.3)
+
+        assert sorted(tracks.track_ids.tolist()) == [1, 2]
+        assert position[tracks.track_ids.tolist().index(1), 2] == pytest.approx(20.0)
+
+    def test_remove_stale(self) -> None:
+        """Test tracks without reports time out and others keep their state."""
+        tracks = DeadReckoningTracks(interpolation_delay_s=0.0, timeout_s=5.0)
+        tracks.ingest(reports((1, 0.0, 1.0, 0.0), (2, 0.0, 2.0, 0.0)), 0.0, now=0.0)
+        tracks.ingest(reports((2, 0.0, 2.0, 0.0)), 4.0, now=4.0)
+
+        assert tracks.remove_stale(6.0) == [1]
+        assert tracks.track_ids.tolist() == [2]
+        assert tracks.positions(6.0)[0][0, 2] == pytest.approx(2.0)
+
+    def test_grows(self) -> None:
+        """Test the store grows past its initial capacity."""
+        tracks = DeadReckoningTracks(capacity=2)
+
+        tracks.ingest(reports(*((i, 0.0, float(i), 0.0) for i in range(5))), 0.0, now=0.0)
+
+        assert len(tracks) == 5
+        assert sorted(tracks.positions(0.0)[0][:, 2].tolist()) == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+class TestTrafficIngest:
+    """Test feeding tracks into the traffic state."""
+
+    def test_update_writes_state(self) -> None:
+        """Test submitted batches appear in the traffic state under their callsign."""
+        ingest = TrafficIngest(DeadReckoningTracks(interpolation_delay_s=0.0))
+        state = TrafficStateService()
+        records = reports((3, 0.0, 0.0, 6076.0 / 36.0))
+        records["flags"] = FLAG_ON_GROUND
+        ingest.submit(decode_traffic_batch(encode_traffic_batch(0.0, records)))
+        ingest.update(0.1, state)
+        assert "TRK3" in state
+
+        ingest.submit(
+            decode_traffic_batch(
+                encode_traffic_batch(
+                    0.1, reports((3, 0.0, 0.0, 0.0)), identities((3, "EXT1", "A320"))
+                )
+            )
+        )
+        ingest.update(0.1, state)
+
+        entry = state.get("EXT1")
+        assert "TRK3" not in state
+        assert entry is not None
+        assert entry.aircraft_type == "A320"
+        assert entry.altitude_ft == 3000.0
+        assert state.within(Vector3(0, 0, 0), 1.0) == [entry]
+
+    def test_stale_tracks_leave_state(self) -> None:
+        """Test timed-out tracks are removed from the traffic state."""
+        ingest = TrafficIngest(DeadReckoningTracks(timeout_s=1.0))
+        state = TrafficStateService()
+        ingest.submit(decode_traffic_batch(encode_traffic_batch(0.0, reports((1, 0.0, 0.0, 0.0)))))
+        ingest.update(0.1, state)
+
+        ingest.update(2.0, state)
+
+        assert ingest.track_count == 0
+        assert len(state) == 0
+
+    def test_publishes_at_interval(self) -> None:
+        """Test the state is written at the publish interval while positions move every frame."""
+        ingest = TrafficIngest(DeadReckoningTracks(interpolation_delay_s=0.0))
+        state = TrafficStateService()
+        ingest.submit(
+            decode_traffic_batch(encode_traffic_batch(0.0, reports((1, 0.0, 0.0, 100.0))))
+        )
+        ingest.update(0.0, state)
+        version = state.version
+
+        ingest.update(0.05, state)
+        track_ids, position = ingest.positions()
+        assert state.version == version
+        assert track_ids.tolist() == [1]
+        assert position[0, 2] == pytest.approx(5.0)
+
+        ingest.update(0.05, state)
+        entry = state.get("TRK1")
+        assert state.version > version
+        assert entry is not None
+        assert entry.position.z == pytest.approx(10.0)
+
+    def test_server_routes_binary_frames(self) -> None:
+        """Test the WebSocket server hands traffic frames to the ingest."""
+        ingest = TrafficIngest()
+        server = RemoteControlServer(on_traffic_batch=ingest.submit)
+        session = ClientSession(websocket=None, client_id="client_1")  # type: ignore[arg-type]
+        frame = encode_traffic_batch(0.0, reports((1, 0.0, 0.0, 0.0)))
+
+        asyncio.run(server._handle_message(session, frame))
+        ingest.update(0.1, TrafficStateService())
+
+        assert ingest.track_count == 1
+
+    def test_remote_control_shares_fallback_state(self) -> None:
+        """Test the plugin's own state is shared until an AI traffic plugin replaces it."""
+        registry = ComponentRegistry()
+        context = PluginContext(
+            event_bus=EventBus(), message_queue=MessageQueue(), config={}, plugin_registry=registry
+        )
+        remote = RemoteControlPlugin()
+        with patch.object(remote, "_start_async_loop"):
+            remote.initialize(context)
+        assert registry.get("traffic_state") is remote._get_traffic_state()
+
+        traffic = AITrafficPlugin()
+        traffic.initialize(context)
+        assert registry.get("traffic_state") is traffic.traffic_state
+        assert remote._get_traffic_state() is traffic.traffic_state
+
+        remote.shutdown()
+        assert registry.get("traffic_state") is traffic.traffic_state
+        traffic.shutdown()
+        assert not registry.is_registered("traffic_state")
+
+    def test_remote_control_publishes_only_its_own_state(self) -> None:
+        """Test a state shared by the AI traffic plugin is left for it to publish."""
+        registry = ComponentRegistry()
+        queue = MessageQueue()
+        senders: list[str] = []
+        queue.subscribe(MessageTopic.TRAFFIC_DELTA, lambda message: senders.append(message.sender))
+        context = PluginContext(
+            event_bus=EventBus(), message_queue=queue, config={}, plugin_registry=registry
+        )
+        remote = RemoteControlPlugin()
+        with patch.object(remote, "_start_async_loop"):
+            remote.initialize(context)
+        assert remote.traffic_ingest is not None
+        remote.traffic_ingest.submit(
+            decode_traffic_batch(encode_traffic_batch(0.0, reports((1, 0.0, 0.0, 0.0))))
+        )
+        remote.update(0.1)
+        queue.process()
+        assert senders == ["remote_control"]
+
+        traffic = AITrafficPlugin()
+        traffic.initialize(context)
+        remote.traffic_ingest.submit(
+            decode_traffic_batch(encode_traffic_batch(0.1, reports((2, 0.1, 0.0, 0.0))))
+        )
+        remote.update(0.1)
+        queue.process()
+        assert senders == ["remote_control"]
+        assert len(traffic.traffic_state) == 2
+
+        remote.shutdown()
+        traffic.shutdown()
@@ -182,6 +182,32 @@ class TestTerrainPluginPositionUpdates:
         # Should publish terrain update
         assert plugin.context.message_queue.publish.called
 
+    def test_update_publishes_terrain_warning(self, plugin: TerrainPlugin) -> None:
+        """Test that a descending flight path triggers a TAWS warning."""
+        plugin.handle_message(
+            Message(
+                sender="physics",
+                recipients=["*"],
+                topic=MessageTopic.POSITION_UPDATED,
+                data={
+                    "position": {"x": 0.0, "y": 100.0, "z": 0.0},
+                    "velocity": {"x": 0.0, "y": -10.0, "z": 60.0},
+                    "on_ground": False,
+                },
+            )
+        )
+
+        plugin.update(1.0)
+
+        topics = [call[0][0].topic for call in plugin.context.message_queue.publish.call_args_list]
+        assert MessageTopic.TERRAIN_WARNING in topics
+        warning = next(
+            call[0][0]
+            for call in plugin.context.message_queue.publish.call_args_list
+            if call[0][0].topic == MessageTopic.TERRAIN_WARNING
+        )
+        assert warning.data["level"] == "warning"
+
 
 class TestTerrainPluginElevationQueries:
     """Test terrain plugin elevation queries."""
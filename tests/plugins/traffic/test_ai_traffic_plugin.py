@@ -1,7 +1,10 @@
 """Tests for AI traffic plugin."""
 
+import numpy as np
 import pytest
 
+from airborne.airports.database import Frequency, FrequencyType
+from airborne.airports.taxiway import TaxiwayGraph
 from airborne.core.event_bus import EventBus
 from airborne.core.messaging import Message, MessageQueue, MessageTopic
 from airborne.core.plugin import PluginContext
@@ -9,6 +12,7 @@ from airborne.core.registry import ComponentRegistry
 from airborne.physics.vectors import Vector3
 from airborne.plugins.traffic.ai_aircraft import AIAircraft
 from airborne.plugins.traffic.ai_traffic_plugin import AITrafficPlugin
+from airborne.plugins.traffic.regional_traffic import FlightSchedule, RegionalTraffic
 
 
 @pytest.fixture
@@ -146,17 +150,28 @@ def test_traffic_plugin_broadcasts_updates(traffic_plugin):
     def capture_message(msg):
         messages.append(msg)
 
-    traffic_plugin._message_queue.subscribe(MessageTopic.TRAFFIC_UPDATE, capture_message)
+    traffic_plugin._message_queue.subscribe(MessageTopic.TRAFFIC_DELTA, capture_message)
 
     # Update (should trigger broadcast)
     traffic_plugin.update(0.1)
     traffic_plugin._message_queue.process()
 
-    # Should have broadcast message
+    # Should have broadcast the new aircraft
     assert len(messages) > 0
-    assert messages[0].topic == MessageTopic.TRAFFIC_UPDATE
-    assert "traffic" in messages[0].data
-    assert len(messages[0].data["traffic"]) == 1
+    assert messages[0].topic == MessageTopic.TRAFFIC_DELTA
+    delta = messages[0].data["delta"]
+    assert [entry.callsign for entry in delta.spawned] == ["TEST123"]
+    assert delta.updated == []
+
+    # Later broadcasts carry updates, then the removal
+    traffic_plugin.update(0.1)
+    traffic_plugin.remove_aircraft("TEST123")
+    traffic_plugin.update(0.1)
+    traffic_plugin._message_queue.process()
+
+    assert [entry.callsign for entry in messages[1].data["delta"].updated] == ["TEST123"]
+    assert messages[2].data["delta"].removed == ["TEST123"]
+    assert len(traffic_plugin.traffic_state) == 0
 
 
 def test_traffic_plugin_updates_player_position(traffic_plugin):
@@ -244,3 +259,101 @@ def test_traffic_plugin_enable_disable(traffic_plugin):
     traffic_plugin.set_traffic_enabled(False)
 
     assert traffic_plugin.get_aircraft_count() == 0
+
+
+def test_traffic_plugin_regional_traffic(traffic_plugin):
+    """Test scheduled flights near the player are put into the traffic state."""
+    heathrow, paris = (51.47, -0.46), (49.01, 2.55)
+    schedule = FlightSchedule(
+        origin=np.array([heathrow, paris]),
+        destination=np.array([paris, heathrow]),
+        departure_s=np.array([3600.0, 3600.0]),
+        callsigns=["BA101", "AF101"],
+        aircraft_types=["A320", "A319"],
+    )
+    traffic_plugin.set_regional_traffic(RegionalTraffic(schedule, *heathrow), 3900.0)
+
+    traffic_plugin.update(0.1)
+
+    state = traffic_plugin.traffic_state
+    assert "BA101" in state
+    assert "AF101" not in state
+    assert traffic_plugin.get_aircraft_count() == 0
+
+    traffic_plugin.set_regional_traffic(None)
+    assert "BA101" not in state
+
+
+def test_traffic_plugin_regional_traffic_max_count(traffic_plugin):
+    """Test scheduled flights fill only the room left under the traffic limit."""
+    heathrow, paris = (51.47, -0.46), (49.01, 2.55)
+    schedule = FlightSchedule(
+        origin=np.array([heathrow, heathrow]),
+        destination=np.array([paris, paris]),
+        departure_s=np.array([3600.0, 3500.0]),
+        callsigns=["BA101", "BA102"],
+        aircraft_types=["A320", "A320"],
+    )
+    traffic_plugin._max_traffic_count = 1
+    traffic_plugin.set_regional_traffic(RegionalTraffic(schedule, *heathrow), 3660.0)
+
+    traffic_plugin.update(0.1)
+
+    state = traffic_plugin.traffic_state
+    assert "BA101" in state
+    assert "BA102" not in state
+
+
+def test_traffic_plugin_ground_traffic_shares_ground_graph():
+    """Test ground traffic taxis on the loaded airport's ground graph and ground frequency."""
+    message_queue = MessageQueue()
+    plugin = AITrafficPlugin()
+    plugin.initialize(
+        PluginContext(
+            event_bus=EventBus(),
+            message_queue=message_queue,
+            config={"traffic": {"ground": {"enabled": True, "max_count": 2}}},
+            plugin_registry=ComponentRegistry(),
+        )
+    )
+    graph = TaxiwayGraph()
+    graph.add_node("A1", Vector3(-122.0, 0.0, 37.0), "taxiway", "A")
+    graph.add_node("A2", Vector3(-122.0, 0.0, 37.001), "taxiway", "A")
+    graph.add_edge("A1", "A2", "taxiway", "A", bidirectional=True)
+
+    message_queue.publish(
+        Message(
+            sender="ground_navigation",
+            recipients=["*"],
+            topic=MessageTopic.AIRPORT_LOADED,
+            data={
+                "icao": "KTEST",
+                "runways": [],
+                "graph": graph,
+                "frequencies": [
+                    Frequency("KTEST", FrequencyType.TWR, "TWR", 118.3),
+                    Frequency("KTEST", FrequencyType.GND, "GND", 121.7),
+                ],
+            },
+        )
+    )
+    message_queue.process()
+    plugin.update(0.1)
+
+    ground_traffic = plugin._ground_traffic
+    assert ground_traffic is not None
+    assert ground_traffic.ground_graph is graph.ground_graph
+    assert ground_traffic.max_traffic == 2
+    assert ground_traffic.get_traffic_count() == 1
+    assert len(ground_traffic.traffic_state.on_frequency(121.7)) == 1
+
+
+def test_traffic_plugin_reinitialize(traffic_plugin):
+    """Test shutdown unregisters the traffic state so the plugin can initialize again."""
+    context = traffic_plugin._context
+    traffic_plugin.shutdown()
+    assert not context.plugin_registry.is_registered("traffic_state")
+
+    traffic_plugin.initialize(context)
+
+    assert context.plugin_registry.get("traffic_state") is traffic_plugin.traffic_state
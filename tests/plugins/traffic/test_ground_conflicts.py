@@ -0,0 +1,162 @@
+"""Tests for predictive ground conflict detection."""
+
+import pytest
+
+from airborne.airports.ground_graph import GroundGraph
+from airborne.core.messaging import MessageQueue
+from airborne.plugins.traffic.ground_conflicts import GroundConflictDetector, TaxiRoute
+from airborne.plugins.traffic.ground_traffic import GroundTrafficManager, GroundTrafficState
+
+DEG_PER_M = 1.0 / 111_195.0
+
+
+@pytest.fixture
+def graph() -> GroundGraph:
+    """Create a crossing of taxiways A and B plus a long taxiway L.
+
+    A runs W-C-E and B runs N-C-S, each arm 200 m. L runs L0-L1-L2-L3
+    with 500 m legs, well away from the crossing.
+    """
+    d = 200 * DEG_PER_M
+    leg = 500 * DEG_PER_M
+    node_ids = ["W", "C", "E", "N", "S", "L0", "L1", "L2", "L3"]
+    latitudes = [0.0, 0.0, 0.0, d, -d, 0.1, 0.1, 0.1, 0.1]
+    longitudes = [-d, 0.0, d, 0.0, 0.0, 0.0, leg, 2 * leg, 3 * leg]
+    edges = [(0, 1, 200.0, 1), (1, 2, 200.0, 1), (3, 1, 200.0, 2), (1, 4, 200.0, 2)]
+    edges += [(5, 6, 500.0, 3), (6, 7, 500.0, 3), (7, 8, 500.0, 3)]
+    return GroundGraph(
+        node_ids,
+        latitudes,
+        longitudes,
+        [e[0] for e in edges],
+        [e[1] for e in edges],
+        [e[2] for e in edges],
+        names=["", "A", "B", "L"],
+        edge_name=[e[3] for e in edges],
+    )
+
+
+def route(graph: GroundGraph, *node_ids: str) -> TaxiRoute:
+    """Build a route through named nodes."""
+    return TaxiRoute.from_path(graph, [graph.row(node_id) for node_id in node_ids])
+
+
+class TestTaxiRoute:
+    """Test route construction and interpolation."""
+
+    def test_from_path(self, graph: GroundGraph) -> None:
+        """Test offsets, names and positions along a route."""
+        taxi_route = route(graph, "W", "C", "S")
+
+        assert taxi_route.offsets_m.tolist() == [0.0, 200.0, 400.0]
+        assert taxi_route.names == ["A", "B"]
+        assert taxi_route.name_index == [0, 1]
+        assert taxi_route.leg_at(250.0) == 1
+
+        latitude, longitude, heading = taxi_route.position(graph, 100.0)
+        assert latitude == pytest.approx(0.0)
+        assert longitude == pytest.approx(-100 * DEG_PER_M)
+        assert heading == pytest.approx(90.0)
+        assert taxi_route.position(graph, 300.0)[2] == pytest.approx(180.0)
+
+    def test_unconnected_path(self, graph: GroundGraph) -> None:
+        """Test a path with a missing edge is rejected."""
+        with pytest.raises(ValueError):
+            route(graph, "W", "E")
+
+
+class TestGroundConflictDetector:
+    """Test conflict prediction."""
+
+    def test_crossing_conflict(self, graph: GroundGraph) -> None:
+        """Test aircraft reaching an intersection close together."""
+        detector = GroundConflictDetector(graph)
+        movers = [
+            ("AI_1", route(graph, "W", "C", "E"), 0.0, 10.0),
+            ("AI_2", route(graph, "N", "C", "S"), 0.0, 8.0),
+        ]
+
+        (conflict,) = detector.detect(movers)
+
+        assert conflict.priority == "AI_1"
+        assert conflict.yielding == "AI_2"
+        assert conflict.node == graph.row("C")
+        assert conflict.time_s == pytest.approx(20.0)
+
+    def test_crossing_separated_in_time(self, graph: GroundGraph) -> None:
+        """Test no conflict when one aircraft reaches the crossing much later."""
+        detector = GroundConflictDetector(graph)
+        movers = [
+            ("AI_1", route(graph, "W", "C", "E"), 100.0, 10.0),
+            ("AI_2", route(graph, "N", "C", "S"), 0.0, 5.0),
+        ]
+
+        assert detector.detect(movers) == []
+
+    def test_same_taxiway_far_apart(self, graph: GroundGraph) -> None:
+        """Test aircraft far apart on one long taxiway do not conflict."""
+        detector = GroundConflictDetector(graph)
+        movers = [
+            ("AI_1", route(graph, "L0", "L1", "L2", "L3"), 0.0, 8.0),
+            ("AI_2", route(graph, "L0", "L1", "L2", "L3"), 900.0, 8.0),
+        ]
+
+        assert detector.detect(movers) == []
+
+    def test_following_too_close(self, graph: GroundGraph) -> None:
+        """Test a faster aircraft closing on the one ahead gives way."""
+        detector = GroundConflictDetector(graph)
+        movers = [
+            ("AI_1", route(graph, "L0", "L1", "L2", "L3"), 0.0, 10.0),
+            ("AI_2", route(graph, "L0", "L1", "L2", "L3"), 150.0, 5.0),
+        ]
+
+        (conflict,) = detector.detect(movers)
+
+        assert conflict.priority == "AI_2"
+        assert conflict.yielding == "AI_1"
+        assert conflict.edge == 4
+        assert conflict.time_s == pytest.approx(18.0)
+
+    def test_head_on(self, graph: GroundGraph) -> None:
+        """Test aircraft meeting head-on on an edge."""
+        detector = GroundConflictDetector(graph)
+        movers = [
+            ("AI_1", route(graph, "L0", "L1", "L2"), 100.0, 8.0),
+            ("AI_2", route(graph, "L1", "L0"), 0.0, 8.0),
+        ]
+
+        (conflict,) = detector.detect(movers)
+
+        assert conflict.edge == 4
+        assert conflict.yielding == "AI_2"
+
+
+class TestManagerConflicts:
+    """Test GroundTrafficManager with predicted conflicts."""
+
+    def test_gives_way_then_resumes(self, graph: GroundGraph) -> None:
+        """Test the later aircraft holds at the crossing and continues after."""
+        manager = GroundTrafficManager(MessageQueue(), graph)
+        manager.spawn_traffic(count=2)
+        first, second = manager.traffic.values()
+        first.route = route(graph, "W", "C", "E")
+        second.route = route(graph, "N", "C", "S")
+        for aircraft in (first, second):
+            aircraft.state = GroundTrafficState.TAXIING
+            aircraft.speed = 16.0
+        second.route_distance_m = 20.0
+
+        manager._detect_conflicts()
+        assert first.state == GroundTrafficState.HOLDING
+        assert first.holding_for == second.aircraft_id
+        assert second.state == GroundTrafficState.TAXIING
+
+        for _ in range(60):
+            manager._move_aircraft(second, 1.0)
+            manager._detect_conflicts()
+        assert first.state == GroundTrafficState.TAXIING
+        assert first.holding_for is None
+        assert second.state == GroundTrafficState.AT_RUNWAY
+        assert second.current_route_index == 0
+        assert second.position[2] == pytest.approx(-200 * DEG_PER_M)
@@ -4,6 +4,7 @@ import time
 
 import pytest
 
+from airborne.airports.ground_graph import NODE_HOLD_SHORT, NODE_PARKING, GroundGraph
 from airborne.core.messaging import MessageQueue, MessageTopic
 from airborne.plugins.traffic.ground_traffic import (
     GroundTrafficAircraft,
@@ -67,7 +68,7 @@ def test_spawn_single_aircraft(traffic_manager, message_queue):
     def capture_handler(msg):
         captured_messages.append(msg)
 
-    message_queue.subscribe(MessageTopic.TRAFFIC_UPDATE, capture_handler)
+    message_queue.subscribe(MessageTopic.TRAFFIC_DELTA, capture_handler)
 
     # Spawn aircraft
     traffic_manager.spawn_traffic(count=1)
@@ -78,11 +79,12 @@ def test_spawn_single_aircraft(traffic_manager, message_queue):
     # Process messages
     message_queue.process()
 
-    # Should have published traffic update
+    # Should have published the spawn
     assert len(captured_messages) > 0
     traffic_msg = captured_messages[-1]
-    assert "aircraft_id" in traffic_msg.data
-    assert traffic_msg.data["on_ground"] is True
+    (entry,) = traffic_msg.data["delta"].spawned
+    assert entry.callsign in traffic_manager.traffic
+    assert entry.on_ground is True
 
 
 def test_spawn_multiple_aircraft(traffic_manager):
@@ -371,7 +373,7 @@ def test_traffic_publishes_updates(traffic_manager, message_queue):
     def capture_handler(msg):
         captured_messages.append(msg)
 
-    message_queue.subscribe(MessageTopic.TRAFFIC_UPDATE, capture_handler)
+    message_queue.subscribe(MessageTopic.TRAFFIC_DELTA, capture_handler)
 
     # Spawn and update
     traffic_manager.spawn_traffic(count=1)
@@ -381,8 +383,21 @@ def test_traffic_publishes_updates(traffic_manager, message_queue):
     assert len(captured_messages) > 0
 
     traffic_msg = captured_messages[-1]
-    assert traffic_msg.topic == MessageTopic.TRAFFIC_UPDATE
-    assert "aircraft_id" in traffic_msg.data
+    assert traffic_msg.topic == MessageTopic.TRAFFIC_DELTA
+    assert len(traffic_msg.data["delta"].spawned) == 1
+
+    # Only changes are published after that
+    traffic_manager.spawn_interval = float("inf")
+    (aircraft,) = traffic_manager.traffic.values()
+    traffic_manager.update(0.1)
+    message_queue.process()
+    assert len(captured_messages) == 1
+
+    aircraft.heading = 90.0
+    traffic_manager.update(0.1)
+    message_queue.process()
+    (entry,) = captured_messages[-1].data["delta"].updated
+    assert entry.heading == 90.0
 
 
 def test_conflict_resolution_priority(traffic_manager):
@@ -410,3 +425,38 @@ def test_conflict_resolution_priority(traffic_manager):
     # Aircraft with lower ID should hold
     assert aircraft1.state == GroundTrafficState.HOLDING
     assert aircraft2.state == GroundTrafficState.TAXIING
+
+
+def test_spawn_plans_route_on_ground_graph(traffic_manager):
+    """Test spawned traffic taxis from a parking node to a hold short node."""
+    graph = GroundGraph(
+        ["G1", "T1", "H1", "R1"],
+        [37.0, 37.001, 37.002, 37.003],
+        [-122.0, -122.0, -122.0, -122.0],
+        [0, 1, 2],
+        [1, 2, 3],
+        [111.0, 111.0, 111.0],
+        names=["", "A", "B", "31"],
+        node_flags=[NODE_PARKING, 0, NODE_HOLD_SHORT, 0],
+        node_runway=[0, 0, 3, 0],
+        edge_name=[1, 2, 3],
+    )
+    traffic_manager.set_ground_graph(graph)
+
+    traffic_manager.spawn_traffic(count=1)
+
+    aircraft = next(iter(traffic_manager.traffic.values()))
+    assert aircraft.parking_id == "G1"
+    assert aircraft.position == (-122.0, 0.0, 37.0)
+    assert aircraft.taxi_route == ["A", "B"]
+    assert aircraft.hold_short_node == "H1"
+    assert aircraft.destination_runway == "31"
+
+
+def test_traffic_state_on_ground_frequency(traffic_manager):
+    """Test ground traffic is recorded on the ground frequency."""
+    traffic_manager.ground_frequency_mhz = 121.7
+
+    traffic_manager.spawn_traffic(count=2)
+
+    assert len(traffic_manager.traffic_state.on_frequency(121.7)) == 2
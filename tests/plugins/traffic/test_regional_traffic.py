@@ -0,0 +1,240 @@
+"""Tests for schedule-driven regional traffic."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from airborne.navigation.routes import RouteIndex
+from airborne.plugins.traffic.regional_traffic import (
+    CRUISE_ALTITUDE_FT,
+    FlightSchedule,
+    RegionalTraffic,
+)
+
+ROUTES = """BA,1355,LHR,507,JFK,3797,,0,388 744
+BA,1355,LHR,507,CDG,1382,,0,320
+AF,137,CDG,1382,LHR,507,,0,319
+AF,137,LHR,507,LCY,508,,0,E70
+DL,2009,LHR,507,JFK,3797,Y,0,333
+AF,137,CDG,1382,JFK,3797,,1,332
+AF,137,CDG,1382,XXX,9999,,0,320
+"""
+
+COORDINATES = {
+    "LHR": (51.47, -0.46),
+    "LCY": (51.50, 0.05),
+    "CDG": (49.01, 2.55),
+    "JFK": (40.64, -73.78),
+}
+
+LHR = COORDINATES["LHR"]
+CDG = COORDINATES["CDG"]
+JFK = COORDINATES["JFK"]
+
+
+def schedule_of(*flights: tuple[tuple[float, float], tuple[float, float], float]) -> FlightSchedule:
+    """Create a schedule from (origin, destination, departure time) flights."""
+    return FlightSchedule(
+        origin=np.array([origin for origin, _, _ in flights]),
+        destination=np.array([destination for _, destination, _ in flights]),
+        departure_s=np.array([departure for _, _, departure in flights]),
+        callsigns=[f"TST{i + 1}" for i in range(len(flights))],
+        aircraft_types=["B738"] * len(flights),
+    )
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> RouteIndex:
+    """Build a route index with coordinates."""
+    path = tmp_path / "routes.dat"
+    path.write_text(ROUTES)
+    index = RouteIndex.from_file(path)
+    index.set_coordinates(COORDINATES.get)
+    return index
+
+
+class TestFlightSchedule:
+    """Test building schedules and flight positions."""
+
+    def test_from_route_index(self, index: RouteIndex) -> None:
+        """Test only nonstop, located, own-metal routes of useful length are flown."""
+        schedule = FlightSchedule.from_route_index(index, flights_per_route=2, seed=3)
+
+        callsigns = [schedule.callsign(row) for row in range(len(schedule))]
+        assert len(schedule) == 6
+        assert sorted(callsigns) == ["AF101", "AF102", "BA101", "BA102", "BA103", "BA104"]
+        assert schedule.distance_nm.min() > 100
+        assert {schedule.aircraft_type(row) for row in range(len(schedule))} == {
+            "388",
+            "319",
+            "320",
+        }
+
+    def test_callsigns_are_unique(self, tmp_path: Path) -> None:
+        """Test flights without an airline do not reuse the callsigns of airline XX."""
+        path = tmp_path / "routes.dat"
+        path.write_text("XX,1,LHR,507,JFK,3797,,0,320\n\\N,\\N,LHR,507,CDG,1382,,0,320\n")
+        index = RouteIndex.from_file(path)
+        index.set_coordinates(COORDINATES.get)
+
+        schedule = FlightSchedule.from_route_index(index, flights_per_route=2)
+
+        callsigns = [schedule.callsign(row) for row in range(len(schedule))]
+        assert sorted(callsigns) == ["XX101", "XX102", "XX103", "XX104"]
+
+    def test_schedule_is_reproducible(self, index: RouteIndex) -> None:
+        """Test the same seed gives the same departures."""
+        first = FlightSchedule.from_route_index(index, seed=5)
+        second = FlightSchedule.from_route_index(index, seed=5)
+
+        np.testing.assert_array_equal(first.departure_s, second.departure_s)
+
+    def test_index_without_coordinates(self, tmp_path: Path) -> None:
+        """Test a schedule needs airport coordinates."""
+        path = tmp_path / "routes.dat"
+        path.write_text(ROUTES)
+
+        with pytest.raises(ValueError):
+            FlightSchedule.from_route_index(RouteIndex.from_file(path))
+
+    def test_positions_along_route(self) -> None:
+        """Test flights are at cruise mid-route, heading along the great circle."""
+        schedule = schedule_of((LHR, JFK, 3600.0), (LHR, JFK, 7200.0))
+        midway = 3600.0 + schedule.duration_s[0] / 2
+
+        positions = schedule.positions(midway)
+
+        assert positions.rows.tolist() == [0, 1]
+        assert positions.altitude_ft[0] == CRUISE_ALTITUDE_FT
+        assert positions.vertical_speed_fpm[0] == 0.0
+        assert 50.0 < positions.latitude[0] < 55.0
+        assert -45.0 < positions.longitude[0] < -30.0
+        assert 240.0 < positions.heading[0] < 300.0
+
+    def test_climb_and_descent(self) -> None:
+        """Test flights climb after departure and descend before arrival."""
+        schedule = schedule_of((LHR, CDG, 0.0))
+        duration = schedule.duration_s[0]
+
+        climbing = schedule.positions(60.0)
+        descending = schedule.positions(duration - 60.0)
+
+        assert climbing.vertical_speed_fpm[0] > 0
+        assert descending.vertical_speed_fpm[0] < 0
+        assert climbing.altitude_ft[0] == pytest.approx(descending.altitude_ft[0])
+        assert 120.0 < climbing.heading[0] < 170.0
+
+    def test_pending_and_landed_flights(self) -> None:
+        """Test flights outside their airborne window are excluded or waiting."""
+        schedule = schedule_of((LHR, CDG, 3600.0))
+
+        assert len(schedule.positions(3000.0).rows) == 0
+        assert len(schedule.positions(3600.0 + schedule.duration_s[0] + 1.0).rows) == 0
+
+        pending = schedule.positions(3000.0, lookahead_s=900.0)
+        assert pending.on_ground.tolist() == [True]
+        assert pending.latitude[0] == pytest.approx(LHR[0])
+        assert pending.speed_kts[0] == 0.0
+
+    def test_flight_across_midnight(self) -> None:
+        """Test a late departure is still airborne after midnight."""
+        schedule = schedule_of((LHR, JFK, 23 * 3600.0))
+
+        assert schedule.positions(3600.0).rows.tolist() == [0]
+
+
+class TestRegionalTraffic:
+    """Test activating and retiring flights around ownship."""
+
+    @pytest.fixture
+    def schedule(self) -> FlightSchedule:
+        """Create departures from Heathrow an hour apart."""
+        return schedule_of((LHR, JFK, 0.0), (LHR, CDG, 3600.0), (CDG, LHR, 3600.0))
+
+    def test_activates_within_bubble(self, schedule: FlightSchedule) -> None:
+        """Test only flights inside the bubble are reported."""
+        regional = RegionalTraffic(schedule, *LHR, bubble_nm=30.0)
+
+        entries, retired = regional.update(3600.0 + 300.0, *LHR)
+
+        assert [entry.callsign for entry in entries] == ["TST2"]
+        assert retired == []
+        assert regional.active_callsigns == ["TST2"]
+
+        entry = entries[0]
+        assert entry.altitude_ft > 0
+        assert entry.vertical_speed_fpm > 0
+        assert entry.position.y == entry.altitude_ft
+        assert 0 < entry.position.x < 30.0 * regional.units_per_nm
+        assert entry.position.z < 0
+
+    def test_retires_outside_bubble(self, schedule: FlightSchedule) -> None:
+        """Test flights retire when ownship leaves and when they land."""
+        regional = RegionalTraffic(schedule, *LHR, bubble_nm=30.0)
+        regional.update(3600.0 + 300.0, *LHR)
+
+        _, retired = regional.update(3600.0 + 310.0, *JFK)
+        assert retired == ["TST2"]
+        assert regional.active_count == 0
+
+        regional.update(3600.0 + 300.0, *CDG)
+        assert regional.active_callsigns == ["TST3"]
+        arrival = 3600.0 + schedule.duration_s[1] + 60.0
+        entries, retired = regional.update(arrival, *CDG)
+        assert retired == ["TST3"]
+        assert entries == []
+
+    def test_hysteresis(self, schedule: FlightSchedule) -> None:
+        """Test an active flight is kept just beyond the bubble."""
+        regional = RegionalTraffic(schedule, *LHR, bubble_nm=10.0, retire_margin_nm=5.0)
+        regional.update(3600.0 + 60.0, *LHR)
+        assert regional.active_callsigns == ["TST2"]
+
+        time_at_12_nm = 3600.0 + 12.0 / schedule.speed_kts[1] * 3600.0
+        entries, retired = regional.update(time_at_12_nm, *LHR)
+
+        assert [entry.callsign for entry in entries] == ["TST2"]
+        assert retired == []
+
+    def test_scans_schedule_at_low_rate(self, schedule: FlightSchedule) -> None:
+        """Test the schedule is rescanned only when time or ownship moved enough."""
+        regional = RegionalTraffic(schedule, *LHR, bubble_nm=30.0, margin_nm=20.0)
+        regional.update(3600.0, *LHR)
+        scan_time = regional._scan_time_s
+
+        regional.update(3600.0 + regional.scan_interval_s / 2, *LHR)
+        assert regional._scan_time_s == scan_time
+
+        regional.update(3600.0 + regional.scan_interval_s, *LHR)
+        assert regional._scan_time_s != scan_time
+
+    def test_local_frame(self, schedule: FlightSchedule) -> None:
+        """Test conversion between geographic and local frame positions."""
+        regional = RegionalTraffic(schedule, *LHR)
+
+        position = regional.to_local(LHR[0] + 0.5, LHR[1] - 0.5, 3000.0)
+
+        assert position.z == pytest.approx(30.0 * regional.units_per_nm)
+        assert position.x < 0
+        assert regional.to_geographic(position) == pytest.approx((LHR[0] + 0.5, LHR[1] - 0.5))
+
+    def test_clear(self, schedule: FlightSchedule) -> None:
+        """Test clearing retires all active flights."""
+        regional = RegionalTraffic(schedule, *LHR, bubble_nm=30.0)
+        regional.update(3600.0 + 300.0, *LHR)
+
+        assert regional.clear() == ["TST2"]
+        assert regional.active_count == 0
+
+    def test_max_active(self) -> None:
+        """Test the nearest flights are activated first and active flights are kept."""
+        schedule = schedule_of((LHR, CDG, 3600.0), (LHR, JFK, 3600.0), (LHR, CDG, 3300.0))
+        regional = RegionalTraffic(schedule, *LHR, bubble_nm=40.0)
+
+        entries, _ = regional.update(3600.0 + 60.0, *LHR, max_active=2)
+        assert sorted(entry.callsign for entry in entries) == ["TST1", "TST2"]
+
+        entries, retired = regional.update(3600.0 + 120.0, *LHR, max_active=1)
+        assert sorted(entry.callsign for entry in entries) == ["TST1", "TST2"]
+        assert retired == []
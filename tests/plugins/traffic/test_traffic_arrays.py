@@ -0,0 +1,149 @@
+"""Tests for the structure-of-arrays AI traffic store."""
+
+import copy
+
+import pytest
+
+from airborne.physics.vectors import Vector3
+from airborne.plugins.traffic.ai_aircraft import AIAircraft, FlightPlan, Waypoint
+from airborne.plugins.traffic.traffic_arrays import TrafficArrays
+
+NM = 6076.0
+
+
+def make_aircraft(callsign: str, x: float = 0.0, z: float = 0.0, waypoints: int = 3) -> AIAircraft:
+    """Create an aircraft with a zig-zag flight plan ahead of it."""
+    plan = FlightPlan(
+        waypoints=[
+            Waypoint(
+                Vector3(x + (i % 2) * 2 * NM, 0, z + (i + 1) * 2 * NM),
+                altitude_ft=3000 + 1000 * i,
+                speed_kts=110 + 10 * i,
+            )
+            for i in range(waypoints)
+        ]
+    )
+    return AIAircraft(
+        callsign=callsign,
+        aircraft_type="C172",
+        position=Vector3(x, 1000, z),
+        heading=45.0,
+        altitude_ft=2500,
+        airspeed_kts=100,
+        flight_plan=plan,
+    )
+
+
+class TestKinematics:
+    """Test the vectorized step against AIAircraft.update."""
+
+    def test_matches_object_update(self) -> None:
+        """Test near traffic follows the same path as the per-object update."""
+        reference = [make_aircraft(f"AI{i}", x=i * 500.0, waypoints=2 + i) for i in range(4)]
+        traffic = TrafficArrays(capacity=1)
+        for aircraft in copy.deepcopy(reference):
+            traffic.add(aircraft)
+
+        for _ in range(300):
+            traffic.update(1.0, Vector3(0, 0, 0))
+            for aircraft in reference:
+                aircraft.update(1.0)
+
+        for expected in reference:
+            actual = traffic.get(expected.callsign)
+            assert actual is not None
+            assert actual.position.x == pytest.approx(expected.position.x)
+            assert actual.position.z == pytest.approx(expected.position.z)
+            assert actual.heading == pytest.approx(expected.heading)
+            assert actual.altitude_ft == pytest.approx(expected.altitude_ft)
+            assert actual.airspeed_kts == pytest.approx(expected.airspeed_kts)
+            assert actual.velocity.y == pytest.approx(expected.velocity.y)
+            assert (
+                actual.flight_plan.current_waypoint_index
+                == expected.flight_plan.current_waypoint_index
+            )
+
+    def test_on_ground_not_moved(self) -> None:
+        """Test aircraft on the ground are left alone."""
+        aircraft = make_aircraft("GND")
+        aircraft.on_ground = True
+        traffic = TrafficArrays()
+        traffic.add(aircraft)
+
+        traffic.update(1.0, Vector3(0, 0, 0))
+
+        assert traffic.get("GND").position == Vector3(0, 1000, 0)
+
+    def test_without_flight_plan(self) -> None:
+        """Test aircraft without a flight plan fly straight ahead."""
+        traffic = TrafficArrays()
+        traffic.add(AIAircraft("N1", "C172", Vector3(0, 0, 0), heading=90.0, airspeed_kts=100))
+
+        traffic.update(2.0, Vector3(0, 0, 0))
+
+        aircraft = traffic.get("N1")
+        assert aircraft.position.x == pytest.approx(2 * 100 * 0.514444)
+        assert aircraft.position.z == pytest.approx(0.0)
+
+
+class TestLevelOfDetail:
+    """Test distance-based update rates."""
+
+    def test_far_traffic_decimated(self) -> None:
+        """Test far traffic steps less often but covers the same time."""
+        traffic = TrafficArrays(lod_tiers=((5.0, 1), (float("inf"), 4)))
+        traffic.add(AIAircraft("NEAR", "C172", Vector3(0, 0, 0), airspeed_kts=100))
+        traffic.add(AIAircraft("FAR", "C172", Vector3(0, 0, 8 * NM), airspeed_kts=100))
+
+        moves = 0
+        last_z = 8 * NM
+        for _ in range(7):
+            traffic.update(0.5, Vector3(0, 0, 0))
+            z = traffic.get("FAR").position.z
+            moves += z != last_z
+            last_z = z
+
+        assert moves == 2
+        assert traffic.get("NEAR").position.z == pytest.approx(3.5 * 100 * 0.514444)
+        assert last_z == pytest.approx(8 * NM + 3.5 * 100 * 0.514444)
+
+
+class TestStore:
+    """Test adding, removing and syncing aircraft."""
+
+    def test_remove_moves_last_slot(self) -> None:
+        """Test removal keeps the remaining aircraft intact."""
+        traffic = TrafficArrays(capacity=1)
+        for i in range(3):
+            traffic.add(make_aircraft(f"AI{i}", x=i * 1000.0, waypoints=i + 1))
+
+        assert traffic.remove("AI0")
+        assert not traffic.remove("AI0")
+        assert len(traffic) == 2
+        assert "AI0" not in traffic
+        assert sorted(traffic.callsigns) == ["AI1", "AI2"]
+
+        traffic.update(1.0, Vector3(0, 0, 0))
+        assert traffic.get("AI2").position.x > 2000.0
+        assert traffic.get("AI1").flight_plan.current_waypoint_index == 0
+
+    def test_remove_beyond(self) -> None:
+        """Test aircraft beyond a distance are removed."""
+        traffic = TrafficArrays()
+        traffic.add(make_aircraft("NEAR"))
+        traffic.add(make_aircraft("FAR", z=30 * NM))
+
+        assert traffic.remove_beyond(Vector3(0, 1000, 0), 20.0) == ["FAR"]
+        assert traffic.callsigns == ["NEAR"]
+
+    def test_views_synced_on_read(self) -> None:
+        """Test the added object is refreshed when read back."""
+        aircraft = make_aircraft("AI1")
+        traffic = TrafficArrays()
+        traffic.add(aircraft)
+
+        traffic.update(1.0, Vector3(0, 0, 0))
+        assert aircraft.position.z == 0.0
+
+        assert traffic.aircraft() == [aircraft]
+        assert aircraft.position.z > 0.0
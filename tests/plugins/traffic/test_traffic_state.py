@@ -0,0 +1,132 @@
+"""Tests for the versioned traffic state service."""
+
+import dataclasses
+
+import pytest
+
+from airborne.core.messaging import MessageQueue, MessageTopic
+from airborne.physics.vectors import Vector3
+from airborne.plugins.traffic.traffic_state import TrafficEntry, TrafficStateService
+
+NM = 6076.0
+
+
+def entry(callsign: str, z_nm: float = 0.0, **changes: object) -> TrafficEntry:
+    """Create an entry north of the origin."""
+    return dataclasses.replace(
+        TrafficEntry(callsign, "C172", Vector3(0, 0, z_nm * NM), altitude_ft=3000), **changes
+    )
+
+
+@pytest.fixture
+def state() -> TrafficStateService:
+    """Create a state with two published aircraft."""
+    service = TrafficStateService()
+    service.put(entry("N1", 1.0))
+    service.put(entry("N2", 8.0, frequency_mhz=121.9))
+    service.flush()
+    return service
+
+
+class TestVersions:
+    """Test per-aircraft versions."""
+
+    def test_put_stamps_version(self, state: TrafficStateService) -> None:
+        """Test each change gets the next service version."""
+        assert state.get("N1").version == 1
+        assert state.get("N2").version == 2
+
+        updated = state.put(entry("N1", 1.5))
+
+        assert updated is not None
+        assert updated.version == 3
+        assert state.version == 3
+
+    def test_unchanged_put_ignored(self, state: TrafficStateService) -> None:
+        """Test putting the same state again is not a change."""
+        assert state.put(entry("N1", 1.0)) is None
+        assert state.version == 2
+        assert state.flush() is None
+
+
+class TestDeltas:
+    """Test pending delta coalescing and publication."""
+
+    def test_updates_and_removals(self, state: TrafficStateService) -> None:
+        """Test only the latest update and removals are queued."""
+        state.put(entry("N1", 1.5))
+        state.put(entry("N1", 2.0))
+        state.remove("N2")
+
+        delta = state.flush()
+
+        assert [e.position.z for e in delta.updated] == [2.0 * NM]
+        assert delta.spawned == []
+        assert delta.removed == ["N2"]
+        assert delta.version == state.version
+
+    def test_spawn_then_remove_cancels(self, state: TrafficStateService) -> None:
+        """Test an aircraft that comes and goes between flushes is not published."""
+        state.put(entry("N3"))
+        state.put(entry("N3", 0.5))
+        assert [e.callsign for e in state.flush().spawned] == ["N3"]
+
+        state.put(entry("N4"))
+        state.remove("N4")
+        assert state.flush() is None
+
+    def test_publish(self, state: TrafficStateService) -> None:
+        """Test publishing sends one delta message with the changes."""
+        queue = MessageQueue()
+        messages = []
+        queue.subscribe(MessageTopic.TRAFFIC_DELTA, messages.append)
+
+        state.put(entry("N3"))
+        state.publish(queue, "test")
+        state.publish(queue, "test")
+        queue.process()
+
+        (message,) = messages
+        assert message.data["state"] is state
+        assert [e.callsign for e in message.data["delta"].spawned] == ["N3"]
+
+
+class TestViews:
+    """Test snapshots and filtered views."""
+
+    def test_snapshot_is_consistent(self, state: TrafficStateService) -> None:
+        """Test a snapshot does not change with later updates."""
+        snapshot = state.snapshot()
+        state.put(entry("N1", 5.0))
+        state.remove("N2")
+
+        assert snapshot.version == 2
+        assert sorted(snapshot.aircraft) == ["N1", "N2"]
+        assert snapshot.aircraft["N1"].position.z == 1.0 * NM
+
+    def test_within(self, state: TrafficStateService) -> None:
+        """Test range and altitude band filtering."""
+        state.put(entry("N3", 2.0, altitude_ft=9000))
+
+        nearby = state.within(Vector3(0, 0, 0), 5.0)
+        banded = state.within(Vector3(0, 0, 0), 5.0, altitude_ft=3000, altitude_window_ft=1000)
+
+        assert sorted(e.callsign for e in nearby) == ["N1", "N3"]
+        assert [e.callsign for e in banded] == ["N1"]
+
+    def test_within_after_remove(self, state: TrafficStateService) -> None:
+        """Test removed aircraft leave the range view and others keep their place."""
+        state.remove("N1")
+
+        assert [e.callsign for e in state.within(Vector3(0, 0, 8 * NM), 1.0)] == ["N2"]
+        assert state.within(Vector3(0, 0, 0), 2.0) == []
+
+    def test_on_frequency(self, state: TrafficStateService) -> None:
+        """Test frequency view follows frequency changes."""
+        assert [e.callsign for e in state.on_frequency(121.9)] == ["N2"]
+
+        state.put(entry("N2", 8.0, frequency_mhz=118.3))
+        state.put(entry("N1", 1.0, frequency_mhz=118.3))
+
+        assert state.on_frequency(121.9) == []
+        assert [e.callsign for e in state.on_frequency(118.3)] == ["N1", "N2"]
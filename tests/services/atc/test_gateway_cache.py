@@ -0,0 +1,267 @@
+"""Tests for the binary Gateway airport cache."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from airborne.services.atc.gateway_cache import (
+    SECTIONS,
+    read_gateway_cache,
+    read_gateway_section,
+    read_gateway_sections,
+    write_gateway_cache,
+)
+from airborne.services.atc.gateway_loader import (
+    GatewayAirportData,
+    GatewayAirportLoader,
+    GatewayFrequency,
+    GatewayRunway,
+    ParkingPosition,
+    TaxiEdge,
+    TaxiNode,
+)
+
+
+def make_airport(
+    icao: str = "LFBD", latitude: float = 44.83, longitude: float = -0.72
+) -> GatewayAirportData:
+    """Create airport data using every field."""
+    return GatewayAirportData(
+        icao=icao,
+        name="Bordeaux Mérignac",
+        latitude=latitude,
+        longitude=longitude,
+        elevation_ft=162.0,
+        transition_altitude=5000,
+        has_atc=True,
+        taxi_nodes={
+            1: TaxiNode(id=1, latitude=44.831, longitude=-0.711),
+            2: TaxiNode(
+                id=2,
+                latitude=44.832,
+                longitude=-0.712,
+                name="H1",
+                is_hold_short=True,
+                on_runway="23",
+            ),
+            70000: TaxiNode(id=70000, latitude=44.833, longitude=-0.713),
+        },
+        taxi_edges=[
+            TaxiEdge(node_begin=1, node_end=2, name="A"),
+            TaxiEdge(
+                node_begin=2, node_end=70000, name="A", is_runway=True, one_way=True, width_code="C"
+            ),
+        ],
+        parking_positions=[
+            ParkingPosition(
+                id="Gate 5",
+                latitude=44.834,
+                longitude=-0.714,
+                heading=231.5,
+                type="gate",
+                aircraft_types=["jets", "turboprops"],
+            ),
+            ParkingPosition(id="T1", latitude=44.835, longitude=-0.715, heading=0.0),
+        ],
+        frequencies=[
+            GatewayFrequency(type="TOWER", frequency_mhz=118.3, name="Bordeaux Tower"),
+            GatewayFrequency(type="ATIS", frequency_mhz=126.125, name=""),
+        ],
+        runways=[
+            GatewayRunway(
+                id1="05",
+                id2="23",
+                width_m=45.0,
+                lat1=44.82,
+                lon1=-0.73,
+                lat2=44.84,
+                lon2=-0.70,
+                heading1=45.1,
+                heading2=225.1,
+                surface=1,
+            ),
+        ],
+    )
+
+
+def write_json_cache(path: Path, data: GatewayAirportData) -> None:
+    """Write a legacy JSON cache file."""
+    cache_dict = {
+        "icao": data.icao,
+        "name": data.name,
+        "latitude": data.latitude,
+        "longitude": data.longitude,
+        "elevation_ft": data.elevation_ft,
+        "transition_altitude": data.transition_altitude,
+        "has_atc": data.has_atc,
+        "taxi_nodes": [vars(n) for n in data.taxi_nodes.values()],
+        "taxi_edges": [vars(e) for e in data.taxi_edges],
+        "parking_positions": [vars(p) for p in data.parking_positions],
+        "frequencies": [vars(f) for f in data.frequencies],
+        "runways": [vars(r) for r in data.runways],
+    }
+    path.write_text(json.dumps(cache_dict, indent=2), encoding="utf-8")
+
+
+class TestGatewayCacheFormat:
+    """Test writing and reading cache files."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test every field survives a round trip."""
+        data = make_airport()
+        path = tmp_path / "LFBD.gwc"
+        write_gateway_cache(path, data)
+
+        assert read_gateway_cache(path) == data
+
+    def test_empty_airport(self, tmp_path: Path) -> None:
+        """Test an airport without collections."""
+        data = GatewayAirportData("XXXX", "", 0.0, 0.0, 0.0, 18000)
+        path = tmp_path / "XXXX.gwc"
+        write_gateway_cache(path, data)
+
+        assert read_gateway_cache(path) == data
+
+    def test_read_sections(self, tmp_path: Path) -> None:
+        """Test single sections are decoded on their own."""
+        data = make_airport()
+        path = tmp_path / "LFBD.gwc"
+        write_gateway_cache(path, data)
+
+        assert read_gateway_section(path, "frequencies") == data.frequencies
+        assert read_gateway_section(path, "taxi_nodes") == data.taxi_nodes
+        sections = read_gateway_sections(path, ("runways", "parking"))
+        assert sections == {"runways": data.runways, "parking": data.parking_positions}
+        assert set(read_gateway_sections(path, SECTIONS)) == set(SECTIONS)
+
+    def test_invalid_files(self, tmp_path: Path) -> None:
+        """Test bad files and section names raise ValueError."""
+        path = tmp_path / "LFBD.gwc"
+        write_gateway_cache(path, make_airport())
+
+        with pytest.raises(ValueError):
+            read_gateway_section(path, "weather")
+
+        path.write_bytes(path.read_bytes()[:-10])
+        with pytest.raises(ValueError):
+            read_gateway_section(path, "parking")
+
+        path.write_bytes(b"AGW")
+        with pytest.raises(ValueError):
+            read_gateway_cache(path)
+
+        path.write_bytes(b"{}" * 20)
+        with pytest.raises(ValueError):
+            read_gateway_cache(path)
+
+
+class TestLoaderBinaryCache:
+    """Test GatewayAirportLoader with the binary cache."""
+
+    def test_json_converted_on_load(self, tmp_path: Path) -> None:
+        """Test a legacy JSON cache is converted on first load."""
+        data = make_airport()
+        write_json_cache(tmp_path / "LFBD.json", data)
+
+        loaded = GatewayAirportLoader(tmp_path).get_airport("lfbd")
+
+        assert loaded == data
+        assert read_gateway_cache(tmp_path / "LFBD.gwc") == data
+
+    def test_binary_preferred(self, tmp_path: Path) -> None:
+        """Test the JSON cache is not parsed when the binary cache is current."""
+        data = make_airport()
+        write_json_cache(tmp_path / "LFBD.json", data)
+        GatewayAirportLoader(tmp_path).get_airport("LFBD")
+
+        loader = GatewayAirportLoader(tmp_path)
+        with patch.object(loader, "_load_from_cache") as load_json:
+            assert loader.get_airport("LFBD") == data
+        load_json.assert_not_called()
+
+    def test_newer_json_reconverted(self, tmp_path: Path) -> None:
+        """Test a JSON cache newer than the binary cache wins."""
+        json_path = tmp_path / "LFBD.json"
+        write_json_cache(json_path, make_airport())
+        GatewayAirportLoader(tmp_path).get_airport("LFBD")
+
+        updated = make_airport()
+        updated.name = "Bordeaux"
+        write_json_cache(json_path, updated)
+        stat = (tmp_path / "LFBD.gwc").stat()
+        os.utime(json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert GatewayAirportLoader(tmp_path).get_airport("LFBD") == updated
+
+    def test_section_getters(self, tmp_path: Path) -> None:
+        """Test section getters read only their section."""
+        data = make_airport()
+        write_gateway_cache(tmp_path / "LFBD.gwc", data)
+        loader = GatewayAirportLoader(tmp_path)
+
+        with patch.object(loader, "get_airport") as get_airport:
+            assert loader.get_frequencies("LFBD") == data.frequencies
+            assert loader.get_runways("lfbd") == data.runways
+            assert loader.get_parking_positions("LFBD") == data.parking_positions
+        get_airport.assert_not_called()
+
+    def test_section_getters_fallback(self, tmp_path: Path) -> None:
+        """Test section getters without a binary cache."""
+        data = make_airport()
+        write_json_cache(tmp_path / "LFBD.json", data)
+        loader = GatewayAirportLoader(tmp_path)
+
+        assert loader.get_frequencies("LFBD") == data.frequencies
+        assert loader.get_runways("ZZZZ") == []
+
+    def test_clear_cache(self, tmp_path: Path) -> None:
+        """Test both cache formats are cleared."""
+        write_json_cache(tmp_path / "LFBD.json", make_airport())
+        loader = GatewayAirportLoader(tmp_path)
+        loader.get_frequencies("LFBD")
+
+        loader.clear_cache("LFBD")
+
+        assert list(tmp_path.iterdir()) == []
+        assert loader.get_frequencies("LFBD") == []
+
+
+class TestPrewarmRegion:
+    """Test background conversion of cached airports."""
+
+    def test_prewarm_converts_within_radius(self, tmp_path: Path) -> None:
+        """Test only airports within the radius are converted."""
+        write_json_cache(tmp_path / "LFBD.json", make_airport("LFBD", 44.83, -0.72))
+        write_json_cache(tmp_path / "LFBE.json", make_airport("LFBE", 44.83, 0.52))
+        write_json_cache(tmp_path / "KSFO.json", make_airport("KSFO", 37.62, -122.37))
+        loader = GatewayAirportLoader(tmp_path)
+
+        with patch.object(GatewayAirportLoader, "_indexed_position", return_value=None):
+            loader.prewarm_region(44.8, -0.5, 100.0).join(timeout=10.0)
+
+        assert sorted(p.name for p in tmp_path.glob("*.gwc")) == ["LFBD.gwc", "LFBE.gwc"]
+        assert read_gateway_cache(tmp_path / "LFBE.gwc").icao == "LFBE"
+
+    def test_prewarm_uses_airport_index(self, tmp_path: Path) -> None:
+        """Test indexed positions skip parsing airports outside the radius."""
+        write_json_cache(tmp_path / "KSFO.json", make_airport("KSFO", 37.62, -122.37))
+        loader = GatewayAirportLoader(tmp_path)
+
+        with (
+            patch.object(GatewayAirportLoader, "_indexed_position", return_value=(37.62, -122.37)),
+            patch.object(loader, "_load_from_cache") as load_json,
+        ):
+            assert loader._prewarm_worker(44.8, -0.5, 100.0) == 0
+        load_json.assert_not_called()
+
+    def test_prewarm_skips_current(self, tmp_path: Path) -> None:
+        """Test airports with a current binary cache are left alone."""
+        write_json_cache(tmp_path / "LFBD.json", make_airport())
+        loader = GatewayAirportLoader(tmp_path)
+        loader.get_airport("LFBD")
+
+        with patch.object(GatewayAirportLoader, "_indexed_position", return_value=None):
+            assert loader._prewarm_worker(44.8, -0.5, 100.0) == 0
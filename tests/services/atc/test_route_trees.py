@@ -0,0 +1,186 @@
+"""Tests for precomputed taxi route trees."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from airborne.services.atc.gateway_loader import (
+    GatewayAirportData,
+    ParkingPosition,
+    TaxiEdge,
+    TaxiNode,
+)
+from airborne.services.atc.route_trees import ShortestPathTree
+from airborne.services.atc.taxiway_graph import TaxiwayGraph
+
+SPACING_DEG = 0.001
+
+
+def make_airport(size: int = 8, seed: int = 3) -> GatewayAirportData:
+    """Create a grid taxi network with a runway along the top row.
+
+    Node (row, column) has ID row * 100 + column. Row 0 is runway 09/27,
+    row 1 holds short of it, and parking positions sit by the bottom row.
+    """
+    rng = random.Random(seed)
+    nodes = {}
+    for row in range(size):
+        for column in range(size):
+            node_id = row * 100 + column
+            nodes[node_id] = TaxiNode(
+                id=node_id,
+                latitude=37.0 - row * SPACING_DEG,
+                longitude=-122.0 + column * SPACING_DEG + rng.uniform(-1e-4, 1e-4),
+                is_hold_short=row == 1 and column % 3 == 0,
+                on_runway="09/27" if row == 1 and column % 3 == 0 else "",
+            )
+
+    edges = []
+    for row in range(size):
+        for column in range(size):
+            node_id = row * 100 + column
+            if column + 1 < size and (row == 0 or rng.random() < 0.8):
+                edges.append(
+                    TaxiEdge(
+                        node_begin=node_id,
+                        node_end=node_id + 1,
+                        name="09/27" if row == 0 else f"T{row}",
+                        is_runway=row == 0,
+                        one_way=row == 4,
+                    )
+                )
+            if row + 1 < size and (row == 0 or column % 2 == 0 or rng.random() < 0.5):
+                edges.append(
+                    TaxiEdge(node_begin=node_id, node_end=node_id + 100, name=f"C{column}")
+                )
+
+    bottom = 37.0 - (size - 1) * SPACING_DEG
+    parking = [
+        ParkingPosition(
+            id=f"G{column}",
+            latitude=bottom - 0.0003,
+            longitude=-122.0 + column * SPACING_DEG,
+            heading=0.0,
+        )
+        for column in (0, 1, size - 1)
+    ]
+    return GatewayAirportData(
+        "TEST",
+        "Test",
+        37.0,
+        -122.0,
+        0.0,
+        18000,
+        taxi_nodes=nodes,
+        taxi_edges=edges,
+        parking_positions=parking,
+    )
+
+
+def route_cost(graph: TaxiwayGraph, path: list[int]) -> float:
+    """Runway-avoiding cost of a node path."""
+    cost = 0.0
+    for a, b in zip(path, path[1:], strict=False):
+        edge = graph.nodes[a].neighbors[b]
+        cost += edge.distance + (1000.0 if edge.is_runway else 0.0)
+    return cost
+
+
+class TestShortestPathTree:
+    """Test tree building and walking."""
+
+    def test_paths_both_directions(self) -> None:
+        """Test paths toward and from roots."""
+        node_ids = [10, 20, 30, 40]
+        forward = [[(1, 1.0)], [(2, 1.0)], [(1, 1.0)], []]
+        reverse = [[], [(0, 1.0), (2, 1.0)], [(1, 1.0)], []]
+
+        toward = ShortestPathTree.build(node_ids, reverse, [2], True)
+        start = ShortestPathTree.build(node_ids, forward, [0], False)
+
+        assert toward.path(10) == [10, 20, 30]
+        assert toward.cost(10) == 2.0
+        assert toward.path(40) is None
+        assert toward.path(99) is None
+        assert start.path(30) == [10, 20, 30]
+        assert start.path(10) == [10]
+
+
+class TestPrecomputedRoutes:
+    """Test TaxiwayGraph routing with precomputed trees."""
+
+    @pytest.fixture
+    def graph(self) -> TaxiwayGraph:
+        """Create a graph from the grid airport."""
+        return TaxiwayGraph.from_gateway_data(make_airport())
+
+    def test_routes_match_search(self, graph: TaxiwayGraph) -> None:
+        """Test tree routes cost the same as A* routes."""
+        access = graph.runway_access_nodes()
+        pairs = [(start, end) for start in sorted(graph.nodes) for end in access]
+        searched = {pair: graph.find_route(*pair) for pair in pairs}
+
+        graph.precompute_route_trees(background=False)
+        assert graph.route_trees_ready
+
+        with patch("airborne.services.atc.taxiway_graph.heapq.heappop") as heappop:
+            for (start, end), expected in searched.items():
+                to_runway = graph.find_route(start, end)
+                from_runway = graph.find_route(end, start)
+                if expected is None:
+                    assert to_runway is None
+                    continue
+                assert to_runway.node_path[0] == start
+                assert to_runway.node_path[-1] == end
+                assert route_cost(graph, to_runway.node_path) == pytest.approx(
+                    route_cost(graph, expected.node_path)
+                )
+                if from_runway is not None:
+                    assert from_runway.node_path[0] == end
+                    assert from_runway.node_path[-1] == start
+        heappop.assert_not_called()
+
+    def test_runway_access_and_aprons(self, graph: TaxiwayGraph) -> None:
+        """Test runway entry nodes and apron grouping."""
+        access = graph.runway_access_nodes()
+
+        assert {100, 103, 106} <= set(access)
+        assert all(node_id < 200 for node_id in access)
+        assert graph.apron_clusters() == [[700, 701], [707]]
+
+    def test_route_to_apron(self, graph: TaxiwayGraph) -> None:
+        """Test routes to the nearest apron with and without trees."""
+        searched = graph.find_route_to_apron(100)
+        graph.precompute_route_trees(background=False)
+        precomputed = graph.find_route_to_apron(100)
+
+        assert searched is not None and precomputed is not None
+        assert searched.node_path[-1] in (700, 701, 707)
+        assert route_cost(graph, precomputed.node_path) == pytest.approx(
+            route_cost(graph, searched.node_path)
+        )
+
+    def test_closed_runway_rebuilds_trees(self, graph: TaxiwayGraph) -> None:
+        """Test closing a runway keeps routes off it and rebuilds trees."""
+        graph.precompute_route_trees(background=False)
+        assert graph.find_route(0, 6, avoid_runways=False).has_runway_crossing
+
+        thread = graph.set_closed_runways(["27"])
+        assert thread is not None
+        thread.join(timeout=10.0)
+
+        assert graph.closed_runways == {"27"}
+        assert graph.route_trees_ready
+        assert not graph.find_route(0, 6, avoid_runways=False).has_runway_crossing
+        assert not graph.find_route(0, 6).has_runway_crossing
+        assert graph.set_closed_runways(["27"]) is None
+
+    def test_stale_build_discarded(self, graph: TaxiwayGraph) -> None:
+        """Test a build superseded by a newer request is not published."""
+        graph.precompute_route_trees(background=False)
+        stale_generation = graph._route_tree_generation
+        graph.precompute_route_trees(background=False)
+
+        assert not graph._route_tree_worker(stale_generation, frozenset())
+        assert graph.route_trees_ready
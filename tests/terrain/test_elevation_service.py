@@ -1,5 +1,6 @@
 """Tests for Elevation Service."""
 
+import numpy as np
 import pytest
 
 from airborne.physics.vectors import Vector3
@@ -7,6 +8,7 @@ from airborne.terrain.elevation_service import (
     ElevationCache,
     ElevationQuery,
     ElevationService,
+    ElevationTileCache,
     IElevationProvider,
 )
 
@@ -40,6 +42,22 @@ class MockElevationProvider(IElevationProvider):
         return not self.should_fail
 
 
+class MockGridProvider(MockElevationProvider):
+    """Mock gridded provider that supports vectorized block sampling."""
+
+    supports_block_sampling = True
+
+    def __init__(self, elevation: float = 100.0) -> None:
+        """Initialize mock gridded provider."""
+        super().__init__(name="grid", elevation=elevation)
+        self.batch_count = 0
+
+    def get_elevation_array(self, latitudes, longitudes):  # type: ignore[no-untyped-def]
+        """Get planar elevation field for a batch."""
+        self.batch_count += 1
+        return self.elevation + np.asarray(latitudes) * 10.0 + np.asarray(longitudes)
+
+
 class TestElevationCache:
     """Test elevation cache."""
 
@@ -121,6 +139,62 @@ class TestElevationCache:
         cache.set(34.0522, -118.2437, 20.0)
         assert cache.get_size() == 2
 
+    def test_cache_counters(self) -> None:
+        """Test hit, miss and eviction counters."""
+        cache = ElevationCache(max_size=1)
+
+        cache.get(1.0, 1.0)
+        cache.set(1.0, 1.0, 10.0)
+        cache.get(1.0, 1.0)
+        cache.set(2.0, 2.0, 20.0)
+
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.evictions == 1
+        assert cache.get_bytes() > 0
+
+
+class TestElevationTileCache:
+    """Test block-based elevation cache."""
+
+    def test_block_grid_covers_block(self) -> None:
+        """Test block grid coordinates span the block."""
+        cache = ElevationTileCache(block_size_deg=0.01, block_samples=4)
+        key = cache.block_key(45.123, 5.678)
+
+        lats, lons = cache.block_grid(key)
+
+        assert lats.shape == (5, 5)
+        assert lats.min() <= 45.123 <= lats.max()
+        assert lons.min() <= 5.678 <= lons.max()
+
+    def test_interpolation_inside_block(self) -> None:
+        """Test planar fields are reproduced exactly inside a block."""
+        cache = ElevationTileCache(block_size_deg=0.01, block_samples=4)
+        key = cache.block_key(45.123, 5.678)
+        lats, lons = cache.block_grid(key)
+        cache.put(key, lats * 10.0 + lons)
+
+        assert cache.get(45.1234, 5.6789) == pytest.approx(451.234 + 5.6789, abs=1e-3)
+        assert cache.get(10.0, 10.0) is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_lru_eviction(self) -> None:
+        """Test O(1) LRU eviction of blocks."""
+        cache = ElevationTileCache(max_blocks=2, block_size_deg=1.0, block_samples=1)
+        grid = np.zeros((2, 2))
+
+        cache.put((1, 1), grid)
+        cache.put((2, 2), grid)
+        cache.get(1.5, 1.5)  # Touch first block
+        cache.put((3, 3), grid)
+
+        assert cache.get(1.5, 1.5) is not None
+        assert cache.get(2.5, 2.5) is None
+        assert cache.evictions == 1
+        assert cache.get_bytes() == 2 * 4 * 4
+
 
 class TestElevationService:
     """Test elevation service."""
@@ -256,6 +330,34 @@ class TestElevationService:
         assert stats["providers"] == 1
         assert "mock" in stats["provider_names"]
 
+    def test_block_caching_for_gridded_provider(self, service: ElevationService) -> None:
+        """Test that gridded providers are fetched once per block."""
+        provider = MockGridProvider()
+        service.add_provider(provider)
+
+        first = service.get_elevation(45.1001, 5.2001)
+        second = service.get_elevation(45.1002, 5.2002)  # Same block
+
+        assert provider.batch_count == 1
+        assert first == pytest.approx(100.0 + 451.001 + 5.2001, abs=1e-2)
+        assert second == pytest.approx(100.0 + 451.002 + 5.2002, abs=1e-2)
+
+    def test_cache_hit_statistics(self, service: ElevationService) -> None:
+        """Test hit/miss/bytes reporting."""
+        service.add_provider(MockGridProvider())
+
+        for i in range(10):
+            service.get_elevation(45.1 + i * 1e-5, 5.2)
+
+        stats = service.get_cache_stats()
+
+        assert stats["blocks"] == 1
+        assert stats["misses"] == 1
+        assert stats["hits"] == 9
+        assert stats["hit_rate"] == pytest.approx(0.9)
+        assert stats["bytes"] > 0
+        assert stats["evictions"] == 0
+
 
 class TestMockProvider:
     """Test mock provider behavior."""
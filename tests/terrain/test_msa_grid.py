@@ -0,0 +1,164 @@
+"""Tests for the precomputed MSA/MORA grid."""
+
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from airborne.terrain.elevation_service import IElevationProvider
+from airborne.terrain.msa_grid import MSAGrid
+from airborne.terrain.srtm_provider import ConstantElevationProvider
+
+
+class PeakProvider(IElevationProvider):
+    """Flat terrain with a single narrow peak."""
+
+    def __init__(self, peak_lat: float, peak_lon: float, peak_m: float = 3000.0) -> None:
+        """Initialize peak provider."""
+        self.peak_lat = peak_lat
+        self.peak_lon = peak_lon
+        self.peak_m = peak_m
+
+    def get_name(self) -> str:
+        """Get provider name."""
+        return "peak"
+
+    def get_elevation(self, latitude: float, longitude: float) -> float:
+        """Get elevation for a single point."""
+        return float(self.get_elevation_array(np.array(latitude), np.array(longitude)))
+
+    def get_elevation_array(self, latitudes, longitudes) -> npt.NDArray[np.float64]:  # type: ignore[no-untyped-def]
+        """Get elevations for a batch."""
+        near = (np.abs(np.asarray(latitudes) - self.peak_lat) < 0.01) & (
+            np.abs(np.asarray(longitudes) - self.peak_lon) < 0.01
+        )
+        return np.where(near, self.peak_m, 100.0)
+
+
+@pytest.fixture
+def grid() -> MSAGrid:
+    """Build a small grid around a peak at 45.5N 6.5E."""
+    return MSAGrid.build(
+        PeakProvider(45.5, 6.5),
+        cell_size_deg=0.25,
+        samples_per_cell=10,
+        bounds=(45.0, 46.0, 6.0, 7.0),
+    )
+
+
+class TestMSAGrid:
+    """Test MSA grid building and lookups."""
+
+    def test_build_shape(self, grid: MSAGrid) -> None:
+        """Test grid dimensions match bounds and cell size."""
+        assert (grid.rows, grid.cols) == (4, 4)
+        assert grid.lat_max == pytest.approx(46.0)
+        assert grid.lon_max == pytest.approx(7.0)
+
+    def test_cell_maximum_includes_peak(self, grid: MSAGrid) -> None:
+        """Test the peak raises the cells around it, not the others."""
+        # The peak sits on the corner shared by four cells
+        assert grid.get_max_elevation_m(45.4, 6.4) == pytest.approx(3000.0)
+        assert grid.get_max_elevation_m(45.6, 6.6) == pytest.approx(3000.0)
+        assert grid.get_max_elevation_m(45.1, 6.1) == pytest.approx(100.0)
+
+    def test_outside_grid(self, grid: MSAGrid) -> None:
+        """Test lookups outside the covered area."""
+        assert grid.get_max_elevation_m(44.9, 6.5) is None
+        assert grid.get_msa_m(45.5, 8.0) is None
+        assert grid.get_mora_ft(50.0, 6.5) is None
+
+    def test_grid_edges(self, grid: MSAGrid) -> None:
+        """Test the northern/eastern edges belong to the last cell."""
+        assert grid.cell_index(46.0, 7.0) == (3, 3)
+        assert grid.cell_index(45.0, 6.0) == (0, 0)
+
+    def test_msa_and_mora(self, grid: MSAGrid) -> None:
+        """Test MSA buffer and MORA rounding."""
+        assert grid.get_msa_m(45.1, 6.1, buffer_ft=1000.0) == pytest.approx(100.0 + 304.8, abs=0.1)
+
+        # 100 m = 328 ft -> +1000 ft -> 1400 ft
+        assert grid.get_mora_ft(45.1, 6.1) == 1400
+        # 3000 m = 9843 ft -> +2000 ft -> 11900 ft
+        assert grid.get_mora_ft(45.4, 6.4) == 11900
+
+    def test_vectorized_lookup(self, grid: MSAGrid) -> None:
+        """Test array lookups match scalar lookups."""
+        lats = np.array([45.1, 45.4, 47.0])
+        lons = np.array([6.1, 6.4, 6.5])
+
+        result = grid.get_max_elevation_array(lats, lons)
+
+        assert result[0] == pytest.approx(100.0)
+        assert result[1] == pytest.approx(3000.0)
+        assert np.isnan(result[2])
+
+    def test_max_elevation_near(self, grid: MSAGrid) -> None:
+        """Test area maximum for vectoring altitudes."""
+        assert grid.get_max_elevation_near(45.1, 6.1, radius_nm=5.0) == pytest.approx(100.0)
+        assert grid.get_max_elevation_near(45.1, 6.1, radius_nm=30.0) == pytest.approx(3000.0)
+
+    def test_obstacle_margin(self) -> None:
+        """Test obstacle margin is added to every cell."""
+        grid = MSAGrid.build(
+            ConstantElevationProvider(200.0),
+            cell_size_deg=1.0,
+            samples_per_cell=2,
+            bounds=(0.0, 2.0, 0.0, 2.0),
+            obstacle_margin_m=60.0,
+        )
+
+        assert grid.get_max_elevation_m(1.5, 1.5) == pytest.approx(260.0)
+
+    def test_coarsen(self, grid: MSAGrid) -> None:
+        """Test deriving a 1 degree grid from a 0.25 degree grid."""
+        coarse = grid.coarsen(4)
+
+        assert (coarse.rows, coarse.cols) == (1, 1)
+        assert coarse.cell_size_deg == pytest.approx(1.0)
+        assert coarse.get_max_elevation_m(45.1, 6.1) == pytest.approx(3000.0)
+
+    def test_missing_data_is_void(self) -> None:
+        """Test cells with unresolved samples are void, not understated."""
+
+        class WestOnlyProvider(PeakProvider):
+            """Peak terrain with no data east of 6.6E."""
+
+            def get_elevation_array(self, latitudes, longitudes) -> npt.NDArray[np.float64]:  # type: ignore[no-untyped-def]
+                """Get elevations, NaN where there is no data."""
+                elevations = super().get_elevation_array(latitudes, longitudes)
+                return np.where(np.asarray(longitudes) > 6.6, np.nan, elevations)
+
+        grid = MSAGrid.build(
+            WestOnlyProvider(45.5, 6.5),
+            cell_size_deg=0.25,
+            samples_per_cell=10,
+            bounds=(45.0, 46.0, 6.0, 7.0),
+        )
+
+        assert grid.get_max_elevation_m(45.1, 6.1) == pytest.approx(100.0)
+        assert grid.get_max_elevation_m(45.1, 6.6) is None
+        assert grid.get_mora_ft(45.1, 6.9) is None
+        assert grid.coarsen(2).get_max_elevation_m(45.1, 6.1) == pytest.approx(3000.0)
+        assert grid.coarsen(2).get_max_elevation_m(45.1, 6.9) is None
+
+    def test_save_and_memory_map(self, grid: MSAGrid, tmp_path: Path) -> None:
+        """Test saving and memory-mapping a grid."""
+        path = tmp_path / "msa.grid"
+        grid.save(path)
+
+        loaded = MSAGrid.load(path)
+
+        assert isinstance(loaded.cells, np.memmap)
+        assert (loaded.rows, loaded.cols) == (grid.rows, grid.cols)
+        assert loaded.lat_min == grid.lat_min
+        assert np.array_equal(loaded.cells, grid.cells)
+
+    def test_load_invalid_file(self, tmp_path: Path) -> None:
+        """Test loading a file that is not a grid."""
+        path = tmp_path / "bad.grid"
+        path.write_bytes(b"not a grid" * 10)
+
+        with pytest.raises(ValueError):
+            MSAGrid.load(path)
@@ -1,9 +1,20 @@
 """Tests for OpenStreetMap Provider."""
 
+import csv
+import os
+from pathlib import Path
+
+import numpy as np
 import pytest
 
 from airborne.physics.vectors import Vector3
-from airborne.terrain.osm_provider import FeatureType, GeoFeature, OSMProvider
+from airborne.terrain.osm_provider import (
+    FeatureType,
+    GeoFeature,
+    GeoFeatureStore,
+    OSMProvider,
+    haversine_nm,
+)
 
 
 class TestGeoFeature:
@@ -361,3 +372,198 @@ class TestRealWorldScenarios:
         if closest_ocean:
             callout = f"Over {closest_ocean.name}"
             assert "Pacific Ocean" in callout
+
+
+def write_places_csv(path: Path, count: int, seed: int = 42) -> list[dict[str, str]]:
+    """Write a synthetic places CSV and return its rows."""
+    rng = np.random.default_rng(seed)
+    types = ["city", "town", "village", "mountain", "lake", "landmark"]
+    rows = []
+    for i in range(count):
+        rows.append(
+            {
+                "id": f"place_{i}",
+                "name": f"Place {i}",
+                "type": types[i % len(types)],
+                "latitude": f"{rng.uniform(-85.0, 85.0):.6f}",
+                "longitude": f"{rng.uniform(-180.0, 180.0):.6f}",
+                "population": str(int(rng.integers(0, 1_000_000))),
+                "elevation_m": f"{rng.uniform(0.0, 4000.0):.1f}",
+                "country": "Testland" if i % 2 else "Otherland",
+                "region": "",
+            }
+        )
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return rows
+
+
+def brute_force_near(
+    rows: list[dict[str, str]], lat: float, lon: float, radius_nm: float, types: set[str]
+) -> set[str]:
+    """Get IDs of rows within radius by scanning every row."""
+    lats = np.array([float(r["latitude"]) for r in rows])
+    lons = np.array([float(r["longitude"]) for r in rows])
+    distances = haversine_nm(lat, lon, lats, lons)
+    return {
+        r["id"]
+        for r, d in zip(rows, distances, strict=True)
+        if d <= radius_nm and r["type"] in types
+    }
+
+
+class TestGeoFeatureStore:
+    """Test columnar feature store."""
+
+    @pytest.fixture
+    def rows_and_store(self, tmp_path: Path) -> tuple[list[dict[str, str]], GeoFeatureStore]:
+        """Create a synthetic dataset and its store."""
+        path = tmp_path / "places.csv"
+        rows = write_places_csv(path, 20000)
+        return rows, GeoFeatureStore.from_csv(path)
+
+    def test_from_csv(self, rows_and_store: tuple[list[dict[str, str]], GeoFeatureStore]) -> None:
+        """Test building a store from CSV."""
+        rows, store = rows_and_store
+
+        assert len(store) == len(rows)
+        assert len(store.indices_of_type(FeatureType.MOUNTAIN)) == sum(
+            1 for r in rows if r["type"] == "mountain"
+        )
+
+    @pytest.mark.parametrize(
+        ("lat", "lon", "radius_nm"),
+        [(45.0, 5.0, 300.0), (0.0, 179.5, 400.0), (84.0, 0.0, 200.0), (-30.0, -60.0, 50.0)],
+    )
+    def test_query_radius_matches_brute_force(
+        self,
+        rows_and_store: tuple[list[dict[str, str]], GeoFeatureStore],
+        lat: float,
+        lon: float,
+        radius_nm: float,
+    ) -> None:
+        """Test bucketed queries return exactly the brute-force result."""
+        rows, store = rows_and_store
+        types = {"city", "mountain"}
+
+        indices, distances = store.query_radius(
+            lat, lon, radius_nm, [FeatureType.CITY, FeatureType.MOUNTAIN]
+        )
+
+        found = {store.feature(i).feature_id for i in indices.tolist()}
+        assert found == brute_force_near(rows, lat, lon, radius_nm, types)
+        assert np.all(np.diff(distances) >= 0)
+
+    def test_query_nearest(
+        self, rows_and_store: tuple[list[dict[str, str]], GeoFeatureStore]
+    ) -> None:
+        """Test nearest query matches a full scan."""
+        rows, store = rows_and_store
+        lakes = [r for r in rows if r["type"] == "lake"]
+        lats = np.array([float(r["latitude"]) for r in lakes])
+        lons = np.array([float(r["longitude"]) for r in lakes])
+        expected = lakes[int(np.argmin(haversine_nm(12.0, 34.0, lats, lons)))]["id"]
+
+        index, distance = store.query_nearest(12.0, 34.0, [FeatureType.LAKE])
+
+        assert index is not None
+        assert store.feature(index).feature_id == expected
+        assert distance < 1000.0
+
+    def test_query_nearest_out_of_range(self) -> None:
+        """Test nearest query with nothing in range."""
+        store = GeoFeatureStore.from_features(
+            [GeoFeature("a", "A", FeatureType.LAKE, Vector3(10.0, 0, 10.0))]
+        )
+
+        index, distance = store.query_nearest(-40.0, -100.0, max_distance_nm=100.0)
+
+        assert index is None
+        assert distance == float("inf")
+
+    def test_save_load_roundtrip(
+        self, rows_and_store: tuple[list[dict[str, str]], GeoFeatureStore], tmp_path: Path
+    ) -> None:
+        """Test saving and loading a store preserves features."""
+        _, store = rows_and_store
+        path = tmp_path / "places.npz"
+
+        store.save(path)
+        loaded = GeoFeatureStore.load(path)
+
+        assert len(loaded) == len(store)
+        for index in (0, 123, len(store) - 1):
+            assert loaded.feature(index) == store.feature(index)
+
+    def test_from_features_keeps_objects(self) -> None:
+        """Test stores built from objects return the same objects."""
+        feature = GeoFeature("a", "A", FeatureType.CITY, Vector3(1.0, 0, 2.0), population=10)
+        store = GeoFeatureStore.from_features([feature])
+
+        indices, _ = store.query_radius(2.0, 1.0, 1.0)
+
+        assert store.feature(int(indices[0])) is feature
+
+
+class TestOSMProviderDatasets:
+    """Test loading external feature datasets."""
+
+    def test_load_csv_creates_cache(self, tmp_path: Path) -> None:
+        """Test loading a CSV writes and reuses the .npz cache."""
+        path = tmp_path / "places.csv"
+        write_places_csv(path, 500)
+        provider = OSMProvider()
+        builtin_count = provider.get_feature_count()
+
+        assert provider.load_features(path) == 500
+        assert (tmp_path / "places.npz").exists()
+        assert provider.get_feature_count() == builtin_count + 500
+
+        # Second provider loads from the cache
+        cached = OSMProvider(feature_files=[path])
+        assert cached.get_feature_count() == builtin_count + 500
+
+    def test_cache_rebuilt_when_csv_changes(self, tmp_path: Path) -> None:
+        """Test a newer CSV invalidates the cache."""
+        path = tmp_path / "places.csv"
+        write_places_csv(path, 100)
+        OSMProvider(feature_files=[path])
+
+        write_places_csv(path, 200, seed=7)
+        cache = tmp_path / "places.npz"
+        os.utime(cache, (cache.stat().st_atime, path.stat().st_mtime - 10))
+
+        provider = OSMProvider()
+        assert provider.load_features(path) == 200
+
+    def test_load_missing_file(self, tmp_path: Path) -> None:
+        """Test loading a missing dataset raises."""
+        provider = OSMProvider()
+
+        with pytest.raises(FileNotFoundError):
+            provider.load_features(tmp_path / "missing.csv")
+
+    def test_queries_include_loaded_features(self, tmp_path: Path) -> None:
+        """Test spatial and lookup queries cover loaded datasets."""
+        path = tmp_path / "places.csv"
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write("name,type,latitude,longitude,population,country\n")
+            f.write("Smallville,town,37.80,-122.30,45000,United States\n")
+            f.write("Bogus,unknown,0,0,0,\n")
+        provider = OSMProvider(feature_files=[path])
+        position = Vector3(-122.4194, 0, 37.7749)
+
+        cities = provider.get_cities_near(position, radius_nm=20)
+        names = [c.name for c in cities]
+
+        assert "Smallville" in names
+        assert "San Francisco" in names
+        assert provider.get_feature_by_name("smallville") is not None
+        assert any(f.name == "Smallville" for f in provider.get_features_by_type(FeatureType.TOWN))
+        smallville = provider.get_feature_by_name("Smallville", fuzzy=False)
+        assert smallville is not None
+        assert smallville.population == 45000
+        assert smallville in provider.get_features_by_country("united states")
@@ -0,0 +1,146 @@
+"""Tests for predictive terrain prefetching."""
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from airborne.terrain.elevation_service import ElevationService, IElevationProvider
+from airborne.terrain.prefetch import TerrainPrefetcher
+
+
+class CountingGridProvider(IElevationProvider):
+    """Gridded provider that counts single and batch queries."""
+
+    supports_block_sampling = True
+
+    def __init__(self) -> None:
+        """Initialize counting provider."""
+        self.point_calls = 0
+        self.batch_calls = 0
+
+    def get_name(self) -> str:
+        """Get provider name."""
+        return "counting"
+
+    def get_elevation(self, latitude: float, longitude: float) -> float:
+        """Get elevation for a single point."""
+        self.point_calls += 1
+        return latitude * 10.0
+
+    def get_elevation_array(self, latitudes, longitudes) -> npt.NDArray[np.float64]:  # type: ignore[no-untyped-def]
+        """Get elevations for a batch."""
+        self.batch_calls += 1
+        return np.asarray(latitudes, dtype=np.float64) * 10.0
+
+
+@pytest.fixture
+def provider() -> CountingGridProvider:
+    """Create counting provider."""
+    return CountingGridProvider()
+
+
+@pytest.fixture
+def service(provider: CountingGridProvider) -> ElevationService:
+    """Create elevation service with the counting provider."""
+    service = ElevationService()
+    service.add_provider(provider)
+    return service
+
+
+@pytest.fixture
+def prefetcher(service: ElevationService):  # type: ignore[no-untyped-def]
+    """Create and start a prefetcher."""
+    prefetcher = TerrainPrefetcher(service, horizon_s=60.0, corridor_half_width_m=500.0)
+    prefetcher.start()
+    yield prefetcher
+    prefetcher.stop()
+
+
+class TestTerrainPrefetcher:
+    """Test terrain prefetcher."""
+
+    def test_fetch_blocks_single_batch(
+        self, service: ElevationService, provider: CountingGridProvider
+    ) -> None:
+        """Test that several blocks are fetched in one provider query."""
+        keys = [(5400, 600), (5401, 600), (5402, 600)]
+
+        grids = service.fetch_blocks(keys)
+
+        assert set(grids) == set(keys)
+        assert provider.batch_calls == 1
+        assert service.tile_cache.get_size() == 0  # Not inserted
+
+    def test_prefetch_blocks_ahead(
+        self, prefetcher: TerrainPrefetcher, service: ElevationService
+    ) -> None:
+        """Test blocks along the track are cached after drain."""
+        prefetcher.update(45.0, 5.0, track_deg=0.0, groundspeed_mps=60.0)
+        assert prefetcher.wait_idle()
+
+        inserted = prefetcher.drain()
+
+        assert inserted > 0
+        # 60 s at 60 m/s = 3.6 km north, well inside the prefetched corridor
+        assert service.tile_cache.block_key(45.03, 5.0) in service.tile_cache.blocks
+        # Terrain behind the aircraft is not prefetched
+        assert service.tile_cache.block_key(44.97, 5.0) not in service.tile_cache.blocks
+
+    def test_hot_path_hits_prefetched_blocks(
+        self,
+        prefetcher: TerrainPrefetcher,
+        service: ElevationService,
+        provider: CountingGridProvider,
+    ) -> None:
+        """Test that queries ahead do not reach the provider after prefetch."""
+        prefetcher.update(45.0, 5.0, track_deg=90.0, groundspeed_mps=60.0)
+        assert prefetcher.wait_idle()
+        prefetcher.drain()
+        batch_calls = provider.batch_calls
+
+        for lon in np.linspace(5.0, 5.04, 20):
+            service.get_elevation(45.0, float(lon))
+
+        assert provider.batch_calls == batch_calls
+        assert provider.point_calls == 0
+
+    def test_crossing_statistics(self, prefetcher: TerrainPrefetcher) -> None:
+        """Test prefetch hit rate when crossing into new blocks."""
+        prefetcher.update(45.0, 5.0, track_deg=0.0, groundspeed_mps=60.0)
+        assert prefetcher.wait_idle()
+        prefetcher.drain()
+
+        # Fly north through the prefetched corridor
+        for lat in np.linspace(45.0, 45.03, 10):
+            prefetcher.update(float(lat), 5.0, track_deg=0.0, groundspeed_mps=60.0)
+
+        stats = prefetcher.get_stats()
+        assert stats["hits"] > 0
+        assert stats["misses"] == 0
+        assert stats["hit_rate"] == 1.0
+        assert stats["blocks_fetched"] > 0
+
+    def test_memory_budget_limits_plan(self, service: ElevationService) -> None:
+        """Test that the plan is truncated to the memory budget."""
+        block_bytes = (service.tile_cache.block_samples + 1) ** 2 * 4
+        prefetcher = TerrainPrefetcher(
+            service, horizon_s=600.0, memory_budget_mb=10 * block_bytes / 1024 / 1024
+        )
+        prefetcher.start()
+        try:
+            prefetcher.update(45.0, 5.0, track_deg=0.0, groundspeed_mps=250.0)
+            assert prefetcher.wait_idle()
+            assert prefetcher.drain() <= 10
+        finally:
+            prefetcher.stop()
+
+    def test_turn_replaces_plan(self, prefetcher: TerrainPrefetcher) -> None:
+        """Test that a large track change triggers a new plan."""
+        prefetcher.update(45.0, 5.0, track_deg=0.0, groundspeed_mps=60.0)
+        assert prefetcher.wait_idle()
+        prefetcher.drain()
+
+        prefetcher.update(45.0, 5.0, track_deg=180.0, groundspeed_mps=60.0)
+        assert prefetcher.wait_idle()
+
+        assert prefetcher.drain() > 0  # Blocks to the south
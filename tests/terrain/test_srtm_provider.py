@@ -1,14 +1,34 @@
 """Tests for SRTM Elevation Provider."""
 
+from pathlib import Path
+
+import numpy as np
 import pytest
 
 from airborne.terrain.srtm_provider import (
+    HGT_VOID,
+    SRTM1_SAMPLES,
+    SRTM3_SAMPLES,
     ConstantElevationProvider,
+    HGTTile,
     SimpleFlatEarthProvider,
     SRTMProvider,
+    hgt_tile_name,
 )
 
 
+def write_hgt_tile(directory: Path, lat_index: int, lon_index: int, grid: np.ndarray) -> Path:
+    """Write a synthetic HGT tile (big-endian int16)."""
+    path = directory / hgt_tile_name(lat_index, lon_index)
+    grid.astype(">i2").tofile(path)
+    return path
+
+
+def ramp_grid(samples: int = SRTM3_SAMPLES) -> np.ndarray:
+    """Create a grid whose elevation equals its column index."""
+    return np.tile(np.arange(samples, dtype=np.int16), (samples, 1))
+
+
 class TestSimpleFlatEarthProvider:
     """Test simple flat-earth elevation provider."""
 
@@ -174,6 +194,209 @@ class TestSRTMProvider:
         assert provider._is_in_coverage(90.0, 0.0) is False
 
 
+class TestHGTTiles:
+    """Test memory-mapped HGT tile reading."""
+
+    def test_tile_name(self) -> None:
+        """Test HGT tile naming for all hemispheres."""
+        assert hgt_tile_name(37, -123) == "N37W123.hgt"
+        assert hgt_tile_name(-34, 151) == "S34E151.hgt"
+        assert hgt_tile_name(0, 0) == "N00E000.hgt"
+
+    def test_invalid_tile_size(self, tmp_path: Path) -> None:
+        """Test that files with the wrong size are rejected."""
+        path = tmp_path / "N10E010.hgt"
+        path.write_bytes(b"\x00" * 100)
+
+        with pytest.raises(ValueError, match="Invalid HGT tile size"):
+            HGTTile(path, 10, 10)
+
+    def test_bilinear_interpolation(self, tmp_path: Path) -> None:
+        """Test bilinear interpolation between samples."""
+        path = write_hgt_tile(tmp_path, 45, 5, ramp_grid())
+        tile = HGTTile(path, 45, 5)
+
+        # Halfway between columns 600 and 601
+        lon = 5 + 600.5 / (SRTM3_SAMPLES - 1)
+        result = tile.sample(np.array([45.5]), np.array([lon]))
+
+        assert result[0] == pytest.approx(600.5)
+
+    def test_tile_orientation(self, tmp_path: Path) -> None:
+        """Test that row 0 is the northern edge of the tile."""
+        grid = np.zeros((SRTM3_SAMPLES, SRTM3_SAMPLES), dtype=np.int16)
+        grid[0, :] = 1000  # North edge
+        path = write_hgt_tile(tmp_path, 45, 5, grid)
+        tile = HGTTile(path, 45, 5)
+
+        elevations = tile.sample(np.array([46.0, 45.0]), np.array([5.5, 5.5]))
+
+        assert elevations[0] == pytest.approx(1000.0)
+        assert elevations[1] == pytest.approx(0.0)
+
+    def test_void_samples_ignored(self, tmp_path: Path) -> None:
+        """Test that void samples do not pull interpolation down."""
+        grid = np.full((SRTM3_SAMPLES, SRTM3_SAMPLES), 500, dtype=np.int16)
+        grid[600, 600] = HGT_VOID
+        path = write_hgt_tile(tmp_path, 45, 5, grid)
+        tile = HGTTile(path, 45, 5)
+
+        step = 1.0 / (SRTM3_SAMPLES - 1)
+        lat = 46 - 600.5 * step
+        lon = 5 + 600.5 * step
+        result = tile.sample(np.array([lat]), np.array([lon]))
+
+        assert result[0] == pytest.approx(500.0)
+
+
+class TestSRTMProviderTiles:
+    """Test SRTM provider with local tiles."""
+
+    @pytest.fixture
+    def tile_dir(self, tmp_path: Path) -> Path:
+        """Create a directory with two adjacent synthetic tiles."""
+        write_hgt_tile(tmp_path, 45, 5, ramp_grid())
+        write_hgt_tile(tmp_path, 45, 6, np.full((SRTM3_SAMPLES, SRTM3_SAMPLES), 250, np.int16))
+        return tmp_path
+
+    def test_get_elevation_from_tile(self, tile_dir: Path) -> None:
+        """Test single point query reads from the tile."""
+        provider = SRTMProvider(cache_dir=tile_dir, use_fallback=False)
+
+        assert provider.get_elevation(45.5, 6.5) == pytest.approx(250.0)
+        assert provider.get_elevation(45.5, 5.5) == pytest.approx(600.0)
+
+    def test_missing_tile_uses_fallback(self, tile_dir: Path) -> None:
+        """Test that missing tiles fall back to the flat-earth model."""
+        provider = SRTMProvider(cache_dir=tile_dir, use_fallback=True)
+        fallback = SimpleFlatEarthProvider()
+
+        assert provider.get_elevation(10.5, 10.5) == fallback.get_elevation(10.5, 10.5)
+
+    def test_missing_tile_without_fallback_fails(self, tile_dir: Path) -> None:
+        """Test that missing tiles raise without fallback."""
+        provider = SRTMProvider(cache_dir=tile_dir, use_fallback=False)
+
+        with pytest.raises(RuntimeError):
+            provider.get_elevation(10.5, 10.5)
+
+    def test_vectorized_batch_across_tiles(self, tile_dir: Path) -> None:
+        """Test vectorized batch query spanning several tiles."""
+        provider = SRTMProvider(cache_dir=tile_dir, use_fallback=False)
+
+        lats = np.array([45.5, 45.5, 45.25, 10.0])
+        lons = np.array([5.5, 6.5, 6.75, 10.0])
+        elevations = provider.get_elevation_array(lats, lons)
+
+        assert elevations.shape == (4,)
+        assert elevations[0] == pytest.approx(600.0)
+        assert elevations[1] == pytest.approx(250.0)
+        assert elevations[2] == pytest.approx(250.0)
+        assert np.isnan(elevations[3])  # No tile, no fallback
+
+    def test_tile_border_uses_existing_tile(self, tile_dir: Path) -> None:
+        """Test points on a northern/eastern border read the tile that has them."""
+        provider = SRTMProvider(cache_dir=tile_dir, use_fallback=False)
+
+        elevations = provider.get_elevation_array(
+            np.array([46.0, 45.5, 45.0, 46.0, 46.0]),
+            np.array([6.5, 7.0, 7.0, 7.0, 7.0 + 1e-12]),
+        )
+
+        assert elevations == pytest.approx([250.0] * 5)
+        assert provider.get_elevation(46.0, 6.5) == pytest.approx(250.0)
+        assert provider.get_elevation(45.5, 7.0) == pytest.approx(250.0)
+
+    def test_batch_matches_single_queries(self, tile_dir: Path) -> None:
+        """Test that batch and single queries agree."""
+        provider = SRTMProvider(cache_dir=tile_dir, use_fallback=True)
+        coords = [(45.1, 5.2), (45.9, 5.8), (45.3, 6.3)]
+
+        batch = provider.get_elevations(coords)
+
+        for (lat, lon), (_, _, elevation) in zip(coords, batch, strict=True):
+            assert elevation == pytest.approx(provider.get_elevation(lat, lon))
+
+    def test_tile_lru_respects_memory_budget(self, tile_dir: Path) -> None:
+        """Test that the tile LRU unmaps tiles over budget."""
+        tile_bytes = SRTM3_SAMPLES * SRTM3_SAMPLES * 2
+        provider = SRTMProvider(
+            cache_dir=tile_dir, use_fallback=False, max_tile_memory_mb=tile_bytes / 1024 / 1024
+        )
+
+        provider.get_elevation(45.5, 5.5)
+        provider.get_elevation(45.5, 6.5)
+
+        stats = provider.get_tile_stats()
+        assert stats["open_tiles"] == 1
+        assert stats["tile_bytes"] == tile_bytes
+        assert not provider.has_tile(45, 5)
+        assert provider.has_tile(45, 6)
+
+    def test_service_batch_query(self, tile_dir: Path) -> None:
+        """Test vectorized batch queries through the elevation service."""
+        from airborne.terrain.elevation_service import ElevationService
+
+        service = ElevationService()
+        service.add_provider(SRTMProvider(cache_dir=tile_dir, use_fallback=False))
+
+        elevations = service.get_elevation_array(np.full(10, 45.5), np.linspace(6.1, 6.9, 10))
+
+        assert np.allclose(elevations, 250.0)
+
+    def test_service_resolves_missing_tiles_from_next_provider(self, tile_dir: Path) -> None:
+        """Test points without tile data come from the next provider, not sea level."""
+        from airborne.terrain.elevation_service import ElevationService
+
+        service = ElevationService()
+        service.add_provider(SRTMProvider(cache_dir=tile_dir, use_fallback=False))
+        service.add_provider(ConstantElevationProvider(elevation=42.0))
+
+        elevations = service.get_elevation_array(np.array([45.5, 10.5]), np.array([6.5, 10.5]))
+
+        assert elevations[0] == pytest.approx(250.0)
+        assert elevations[1] == pytest.approx(42.0)
+        assert service.get_elevation(10.5, 10.5) == pytest.approx(42.0)
+
+    def test_service_fails_without_data(self, tile_dir: Path) -> None:
+        """Test unresolved batch points raise like single queries."""
+        from airborne.terrain.elevation_service import ElevationService
+
+        service = ElevationService()
+        service.add_provider(SRTMProvider(cache_dir=tile_dir, use_fallback=False))
+
+        with pytest.raises(RuntimeError):
+            service.get_elevation_array(np.array([45.5, 10.5]), np.array([6.5, 10.5]))
+        with pytest.raises(RuntimeError):
+            service.get_elevation(10.5, 10.5)
+
+    def test_service_blocks_keep_srtm1_resolution(self, tmp_path: Path) -> None:
+        """Test cached blocks are sampled at 1 arc-second for SRTM1 tiles."""
+        from airborne.terrain.elevation_service import ElevationService
+
+        grid = np.zeros((SRTM1_SAMPLES, SRTM1_SAMPLES), dtype=np.int16)
+        grid[1801, 1] = 1000
+        write_hgt_tile(tmp_path, 45, 5, grid)
+        provider = SRTMProvider(cache_dir=tmp_path, use_fallback=False)
+        service = ElevationService()
+        service.add_provider(provider)
+
+        assert provider.sample_spacing_deg == pytest.approx(1.0 / 3600.0)
+        assert service.tile_cache.block_samples == 30
+        assert service.get_elevation(46.0 - 1801 / 3600, 5.0 + 1 / 3600) == pytest.approx(
+            1000.0, abs=0.5
+        )
+
+    def test_service_blocks_match_srtm3_resolution(self, tile_dir: Path) -> None:
+        """Test SRTM3 tiles keep the default block grid."""
+        from airborne.terrain.elevation_service import ElevationService
+
+        service = ElevationService()
+        service.add_provider(SRTMProvider(cache_dir=tile_dir, use_fallback=False))
+
+        assert service.tile_cache.block_samples == 10
+
+
 class TestProviderIntegration:
     """Test integration with elevation service."""
 
@@ -0,0 +1 @@
+"""Tests for the TTS cache service."""
@@ -0,0 +1,106 @@
+"""Tests for the TTS cache service protocol and its binary audio frames."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from websockets.server import serve
+
+from airborne.tts_cache_service.client import TTSServiceClient
+from airborne.tts_cache_service.protocol import (
+    PROTOCOL_VERSION,
+    GenerateResponse,
+    HelloRequest,
+    HelloResponse,
+    decode_audio_frame,
+    encode_audio_frame,
+    parse_request,
+    parse_response,
+)
+from airborne.tts_cache_service.service import TTSCacheService
+
+WAV = b"RIFF" + bytes(range(256)) * 40
+
+
+class TestAudioFrames:
+    """Test encoding and decoding binary audio frames."""
+
+    def test_round_trip(self) -> None:
+        """Test the header survives and the audio is a view into the frame."""
+        response = GenerateResponse(id="a1", ok=True, size=len(WAV), cached=True, duration_ms=0.5)
+        frame = encode_audio_frame(response, WAV)
+
+        decoded, audio = decode_audio_frame(frame)
+
+        assert decoded == response
+        assert audio == WAV
+        assert audio.obj is frame
+        assert len(frame) < len(WAV) + 200
+
+    def test_failed_generation(self) -> None:
+        """Test an error response carries no audio."""
+        frame = encode_audio_frame(GenerateResponse(id="a2", ok=False, error="Timeout"), b"")
+
+        decoded, audio = decode_audio_frame(frame)
+
+        assert not decoded.ok
+        assert decoded.error == "Timeout"
+        assert len(audio) == 0
+
+    def test_invalid_frames(self) -> None:
+        """Test frames without the audio header are rejected."""
+        with pytest.raises(ValueError):
+            decode_audio_frame(b"AT")
+        with pytest.raises(ValueError):
+            decode_audio_frame(b"RIFF" + bytes(100))
+        with pytest.raises(ValueError):
+            decode_audio_frame(b"ATTS\xff\x00\x00\x00{}")
+
+    def test_hello(self) -> None:
+        """Test hello requests and responses are parsed."""
+        request = parse_request(HelloRequest(id="h1").to_dict())
+        response = parse_response(HelloResponse(id="h1", ok=True, protocol=2).to_dict())
+
+        assert request == HelloRequest(id="h1", protocol=PROTOCOL_VERSION)
+        assert response == HelloResponse(id="h1", ok=True, protocol=2)
+
+
+class TestProtocolNegotiation:
+    """Test the client and service agree on a protocol and exchange audio."""
+
+    async def _generate(
+        self, tmp_path: Path, max_protocol: int
+    ) -> tuple[int, memoryview | None, bytes | None]:
+        """Serve one cached phrase and request it with the client."""
+        service = TTSCacheService({"cache": {"base_dir": str(tmp_path)}})
+        service._get_cache("cockpit", 180, "Test", None).put("altitude", WAV)
+
+        async with serve(service.websocket_handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            client = TTSServiceClient(port=port, spawn_service=False, max_protocol=max_protocol)
+            await client.start()
+            try:
+                view = await client.generate_view("altitude", voice_name="Test")
+                audio = await client.generate("altitude", voice_name="Test")
+                return client.protocol, view, audio
+            finally:
+                await client.stop()
+
+    def test_binary_frames(self, tmp_path: Path) -> None:
+        """Test protocol version 2 hands out a view of the received frame."""
+        protocol, view, audio = asyncio.run(self._generate(tmp_path, PROTOCOL_VERSION))
+
+        assert protocol == 2
+        assert view is not None
+        assert view == WAV
+        assert isinstance(view.obj, bytes)
+        assert len(view.obj) > len(WAV)
+        assert audio == WAV
+
+    def test_base64_fallback(self, tmp_path: Path) -> None:
+        """Test clients limited to version 1 still get base64 JSON responses."""
+        protocol, view, audio = asyncio.run(self._generate(tmp_path, 1))
+
+        assert protocol == 1
+        assert view == WAV
+        assert audio == WAV